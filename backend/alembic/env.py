@@ -19,6 +19,14 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.common.config import settings
 from app.domains.auth.models import User  # 모든 모델 import
+from app.common.outbox import OutboxEvent
+from app.domains.documents.models import Document, StatisticsLease, TenantStatistics
+from app.domains.validation.models import ValidationRule, ValidationRuleSet
+from app.domains.pipeline.models import ReprocessJob
+from app.domains.rag.models import Favorite, SearchHistory, TrendBucket
+from app.domains.exports.models import ExportJob
+from app.domains.monitoring.models import Alert
+from app.domains.billing.models import TenantPlan, TenantUsage, UsageWindow
 
 # Alembic Config 객체
 config = context.config
@@ -61,6 +61,189 @@ class Settings(BaseSettings):
     MLFLOW_TRACKING_URI: Optional[str] = Field(default=None, description="MLflow 추적 URI")
     MODEL_REGISTRY_URI: Optional[str] = Field(default=None, description="모델 레지스트리 URI")
     
+    # 임베딩 서비스 설정
+    EMBEDDING_BACKEND: str = Field(default="onnx", description="임베딩 백엔드 (onnx | hashing, onnx는 EMBEDDING_ONNX_DIR 필요 — 없으면 시작 시 실패)")
+    EMBEDDING_ONNX_DIR: Optional[str] = Field(default=None, description="ONNX 모델 디렉터리 (model.onnx, tokenizer.json)")
+    EMBEDDING_MODEL_VERSION: str = Field(default="1", description="임베딩 모델 버전")
+    EMBEDDING_DIM: int = Field(default=384, description="임베딩 차원")
+    EMBEDDING_MAX_SEQ_LENGTH: int = Field(default=256, description="임베딩 최대 시퀀스 길이")
+    EMBEDDING_MAX_BATCH_SIZE: int = Field(default=32, description="마이크로배치 최대 크기")
+    EMBEDDING_MAX_WAIT_MS: float = Field(default=5.0, description="마이크로배치 최대 대기 시간(ms)")
+    EMBEDDING_INTRA_OP_THREADS: int = Field(default=0, description="ONNX intra-op 스레드 수 (0=자동)")
+    EMBEDDING_INTER_OP_THREADS: int = Field(default=1, description="ONNX inter-op 스레드 수 (0=자동)")
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True, description="임베딩 캐시 사용 여부")
+    EMBEDDING_CACHE_DIR: Optional[str] = Field(default=None, description="임베딩 디스크 캐시 디렉터리 (없으면 메모리만 사용)")
+    EMBEDDING_CACHE_HOT_ENTRIES: int = Field(default=50000, description="임베딩 캐시 LRU 핫 계층 항목 수")
+    
+    # 벡터 색인 설정
+    VECTOR_INDEX_BACKEND: str = Field(default="local", description="벡터 색인 백엔드 (local | pgvector)")
+    VECTOR_INDEX_DIR: str = Field(default="./data/vector-index", description="로컬 벡터 색인 디렉터리")
+    VECTOR_INDEX_NPROBE: int = Field(default=8, description="세그먼트별 탐색 IVF 리스트 수")
+    VECTOR_INDEX_MEMTABLE_ROWS: int = Field(default=20000, description="세그먼트 플러시 기준 버퍼 행 수")
+    VECTOR_INDEX_MAX_SEGMENTS: int = Field(default=8, description="컬렉션당 최대 세그먼트 수 (초과 시 병합)")
+    VECTOR_INDEX_MERGE_INTERVAL_SECONDS: float = Field(default=30.0, description="플러시/병합 주기(초)")
+    VECTOR_INDEX_QUANTIZATION: str = Field(default="none", description="세그먼트 양자화 방식 (none | int8 | pq)")
+    VECTOR_INDEX_PQ_SUBVECTORS: int = Field(default=48, description="PQ 부분 공간 수 (차원의 약수)")
+    VECTOR_INDEX_RESCORE_FACTOR: int = Field(default=4, description="양자화 검색 시 재채점 후보 배수 (k의 배수)")
+    
+    # 키워드 색인/하이브리드 검색 설정
+    KEYWORD_INDEX_DIR: str = Field(default="./data/keyword-index", description="키워드 색인 스냅샷 디렉터리")
+    KEYWORD_INDEX_SNAPSHOT_INTERVAL_SECONDS: float = Field(default=60.0, description="키워드 색인 압축/스냅샷 주기(초)")
+    BM25_K1: float = Field(default=1.2, description="BM25 k1 (빈도 포화)")
+    BM25_B: float = Field(default=0.75, description="BM25 b (길이 정규화)")
+    HYBRID_CANDIDATES: int = Field(default=50, description="검색기별 융합 후보 수")
+    HYBRID_RRF_K: int = Field(default=60, description="RRF 상수")
+    RAG_TOP_K: int = Field(default=5, description="RAG 질의 기본 반환 청크 수")
+    SEARCH_ACL_ENABLED: bool = Field(default=True, description="index.meta 권한 사전 필터 적용 여부")
+    SEARCH_ACL_DIR: str = Field(default="./data/search-acl", description="권한 색인 스냅샷 디렉터리")
+    SEARCH_ACL_SNAPSHOT_INTERVAL_SECONDS: float = Field(default=60.0, description="권한 색인 스냅샷 주기(초)")
+    RAG_ANSWER_CACHE_ENABLED: bool = Field(default=True, description="RAG 답변 캐시 사용 여부")
+    RAG_ANSWER_CACHE_SIMILARITY: float = Field(default=0.95, description="답변 캐시 의미 일치 최소 코사인 유사도")
+    RAG_ANSWER_CACHE_MAX_ENTRIES: int = Field(default=2000, description="테넌트당 답변 캐시 최대 항목 수")
+    RAG_ANSWER_CACHE_TTL_SECONDS: float = Field(default=3600.0, description="답변 캐시 항목 유효 시간(초)")
+    
+    # 재순위화 설정
+    RERANK_BACKEND: str = Field(default="onnx", description="재순위화 백엔드 (onnx | lexical | none, onnx는 RERANK_ONNX_DIR 필요 — 없으면 시작 시 실패)")
+    RERANK_MODEL: str = Field(default="cross-encoder/ms-marco-MiniLM-L-6-v2", description="재순위화 크로스 인코더 모델")
+    RERANK_MODEL_VERSION: str = Field(default="1", description="재순위화 모델 버전 (점수 캐시 키)")
+    RERANK_ONNX_DIR: Optional[str] = Field(default=None, description="재순위화 ONNX 모델 디렉터리 (model.onnx, tokenizer.json)")
+    RERANK_MAX_SEQ_LENGTH: int = Field(default=320, description="재순위화 (질의 + 본문) 최대 시퀀스 길이")
+    RERANK_INTRA_OP_THREADS: int = Field(default=0, description="재순위화 ONNX intra-op 스레드 수 (0=자동)")
+    RERANK_BATCH_SIZE: int = Field(default=16, description="재순위화 추론 배치 크기")
+    RERANK_BUDGET_MS: float = Field(default=150.0, description="요청당 재순위화 시간 예산(ms), 초과 시 1차 순서 사용")
+    RERANK_MAX_CANDIDATES: int = Field(default=50, description="재순위화 최대 후보 수")
+    RERANK_MIN_CANDIDATES: int = Field(default=10, description="부하가 높아도 재순위화할 최소 후보 수")
+    RERANK_CACHE_ENTRIES: int = Field(default=50000, description="재순위화 점수 캐시 항목 수")
+    
+    # 답변 생성(LLM) 설정
+    LLM_BACKEND: str = Field(default="openai", description="답변 생성 LLM 백엔드 (openai | fake | none, openai는 OPENAI_API_KEY 필요 — 없으면 시작 시 실패)")
+    LLM_MODEL: str = Field(default="gpt-4o-mini", description="답변 생성 모델")
+    LLM_BASE_URL: str = Field(default="https://api.openai.com/v1", description="OpenAI 호환 API 기본 URL")
+    LLM_MAX_TOKENS: int = Field(default=512, description="답변 최대 토큰 수")
+    LLM_TEMPERATURE: float = Field(default=0.0, description="답변 샘플링 온도")
+    LLM_TIMEOUT_SECONDS: float = Field(default=30.0, description="LLM 연결/토큰 간 대기 시간 제한(초)")
+    LLM_CONTEXT_CHARS: int = Field(default=1200, description="프롬프트에 넣을 근거 청크당 최대 글자 수")
+    LLM_FAKE_FIRST_TOKEN_MS: float = Field(default=300.0, description="가짜 LLM 첫 토큰 지연(ms)")
+    LLM_FAKE_TOKEN_MS: float = Field(default=20.0, description="가짜 LLM 토큰 간 지연(ms)")
+    
+    # 근거 검증 설정
+    CITATION_SHINGLE_SIZE: int = Field(default=3, description="근거 검증 문자 n-gram 싱글 길이")
+    CITATION_SHINGLE_ENTRIES: int = Field(default=200000, description="미리 계산해 둘 청크 싱글 집합 수 (LRU)")
+    CITATION_SUPPORT_THRESHOLD: float = Field(default=0.6, description="뒷받침으로 판정할 최소 싱글 포함률")
+    CITATION_PARTIAL_THRESHOLD: float = Field(default=0.3, description="부분 뒷받침으로 판정할 최소 싱글 포함률")
+    CITATION_DEEP_BACKEND: str = Field(default="onnx", description="정밀 근거 검증 함의 백엔드 (onnx | lexical | none, onnx는 CITATION_NLI_ONNX_DIR 필요 — 없으면 시작 시 실패)")
+    CITATION_NLI_MODEL: str = Field(default="cross-encoder/nli-deberta-v3-xsmall", description="함의(NLI) 모델")
+    CITATION_NLI_MODEL_VERSION: str = Field(default="1", description="함의 모델 버전 (점수 캐시 키)")
+    CITATION_NLI_ONNX_DIR: Optional[str] = Field(default=None, description="함의 ONNX 모델 디렉터리 (model.onnx, tokenizer.json)")
+    CITATION_NLI_ENTAILMENT_INDEX: int = Field(default=1, description="함의 모델 출력 중 entailment 레이블 위치")
+    CITATION_NLI_MAX_SEQ_LENGTH: int = Field(default=384, description="함의 (청크 + 주장) 최대 시퀀스 길이")
+    CITATION_DEEP_BATCH_SIZE: int = Field(default=16, description="정밀 검증 추론 배치 크기")
+    CITATION_DEEP_QUEUE_SIZE: int = Field(default=1000, description="정밀 검증 대기 작업 최대 수 (초과 시 건너뜀)")
+    CITATION_DEEP_THRESHOLD: float = Field(default=0.5, description="함의로 판정할 최소 확률")
+    CITATION_DEEP_RESULT_ENTRIES: int = Field(default=10000, description="보관할 정밀 검증 결과 수")
+    CITATION_DEEP_CACHE_ENTRIES: int = Field(default=50000, description="정밀 검증 (주장, 청크) 점수 캐시 항목 수")
+    
+    # 중복 문서 탐지 설정
+    DEDUP_INDEX_DIR: str = Field(default="./data/dedup-index", description="유사 중복 색인 디렉터리")
+    DEDUP_SHINGLE_SIZE: int = Field(default=5, description="MinHash 문자 n-gram 싱글 길이")
+    DEDUP_NUM_PERM: int = Field(default=128, description="MinHash 서명 길이 (순열 수)")
+    DEDUP_BANDS: int = Field(default=16, description="LSH 밴드 수 (서명 길이의 약수, 밴드당 행 = 서명 길이 / 밴드 수)")
+    DEDUP_THRESHOLD: float = Field(default=0.9, description="중복으로 판정할 최소 Jaccard 유사도 추정치")
+    DEDUP_MEMTABLE_DOCS: int = Field(default=10000, description="세그먼트 플러시 기준 버퍼 문서 수")
+    DEDUP_MAX_SEGMENTS: int = Field(default=8, description="테넌트당 최대 세그먼트 수 (초과 시 병합)")
+    DEDUP_MAX_CANDIDATES: int = Field(default=256, description="조회당 서명으로 검증할 최대 후보 수")
+    DEDUP_MERGE_INTERVAL_SECONDS: float = Field(default=30.0, description="플러시/병합 주기(초)")
+    
+    # 검증 규칙 시험 실행(dry-run) 설정
+    DRYRUN_SAMPLE_DOCS: int = Field(default=2000, description="테넌트별로 보관할 최근 파싱 문서 수")
+    DRYRUN_WORKERS: int = Field(default=0, description="시험 실행 프로세스 수 (0이면 CPU 수)")
+    DRYRUN_CHUNK_DOCS: int = Field(default=100, description="프로세스 작업 하나에 넣을 문서 수")
+    
+    # 파이프라인 작업 스케줄러 설정 (테넌트 간 가중 공정 큐)
+    PIPELINE_WORKERS: int = Field(default=8, description="동시에 실행할 파이프라인 작업 수")
+    PIPELINE_TENANT_CONCURRENCY: int = Field(default=4, description="테넌트별 동시 실행 작업 상한")
+    PIPELINE_WEIGHT_INTERACTIVE: float = Field(default=16.0, description="업로드(interactive) 클래스 가중치")
+    PIPELINE_WEIGHT_REVIEW: float = Field(default=4.0, description="검토 수정(review) 클래스 가중치")
+    PIPELINE_WEIGHT_BULK: float = Field(default=1.0, description="대량 재처리(bulk) 클래스 가중치")
+    REPROCESS_BATCH_DOCS: int = Field(default=500, description="대량 재처리 작업의 배치당 문서 수")
+    REPROCESS_JOB_PARALLELISM: int = Field(default=2, description="재처리 작업 하나가 동시에 큐에 올리는 배치 수")
+    
+    # 아웃박스 릴레이 설정
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = Field(default=1.0, description="미발행 아웃박스 이벤트 확인 주기(초)")
+    OUTBOX_RELAY_BATCH: int = Field(default=500, description="한 번에 발행할 아웃박스 이벤트 수")
+    OUTBOX_RETENTION_SECONDS: float = Field(default=604800.0, description="발행된 아웃박스 이벤트 보관 기간(초)")
+    OUTBOX_SWEEP_INTERVAL_SECONDS: float = Field(default=3600.0, description="보관 기간이 지난 아웃박스 이벤트 삭제 주기(초)")
+    
+    # 문서 검토 설정
+    REVIEW_BATCH_MAX_IDS: int = Field(default=5000, description="일괄 승인/반려 요청당 최대 문서 수")
+
+    # 문서 목록 설정 (커서 페이지네이션)
+    DOCUMENT_LIST_PAGE_SIZE: int = Field(default=50, description="문서 목록 기본 페이지 크기")
+    DOCUMENT_LIST_MAX_PAGE_SIZE: int = Field(default=200, description="문서 목록 최대 페이지 크기")
+
+    # 대시보드 통계 설정 (테넌트별 증분 집계)
+    STATS_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, description="누적된 통계 증분을 테이블에 쓰는 주기(초)")
+    STATS_RECONCILE_INTERVAL_SECONDS: float = Field(default=3600.0, description="문서 테이블 기준으로 통계를 다시 맞추는 주기(초)")
+    STATS_RECONCILE_BATCH_TENANTS: int = Field(default=100, description="재집계 트랜잭션 하나에서 통계 행을 잠그고 집계할 테넌트 수")
+    
+    # 문서 미리보기 설정 (썸네일/페이지 미리보기)
+    DOCUMENT_STORAGE_DIR: str = Field(default="./data/originals", description="원본 문서 저장소 디렉터리 (업로드 이벤트의 file_path 기준)")
+    PREVIEW_CACHE_DIR: str = Field(default="./data/previews", description="렌더링한 미리보기를 저장하는 콘텐츠 주소 캐시 디렉터리")
+    PREVIEW_MEMORY_CACHE_MB: int = Field(default=64, description="자주 쓰는 미리보기를 메모리에 유지할 크기(MB)")
+    PREVIEW_CACHE_MAX_MB: int = Field(default=2048, description="미리보기 디스크 캐시 최대 크기(MB, 넘으면 오래 읽히지 않은 것부터 삭제)")
+    PREVIEW_RENDERER: str = Field(default="raster", description="미리보기 렌더러 (raster | placeholder, raster는 pypdfium2/Pillow 필요 — 없으면 시작 시 실패)")
+    PREVIEW_WORKERS: int = Field(default=2, description="미리보기 렌더링 프로세스 수")
+    PREVIEW_WIDTHS: list[int] = Field(default=[240, 480, 960, 1600], description="허용 미리보기 너비(px, 요청 너비는 이 중 하나로 맞춤)")
+    PREVIEW_THUMBNAIL_WIDTH: int = Field(default=240, description="썸네일 너비(px)")
+    PREVIEW_PAGE_WIDTH: int = Field(default=960, description="페이지 미리보기 기본 너비(px)")
+    PREVIEW_MAX_AGE_SECONDS: int = Field(default=3600, description="미리보기 응답 Cache-Control max-age(초)")
+    PREVIEW_PREFETCH_PAGES: int = Field(default=3, description="OCR 완료 시 미리 렌더링할 앞쪽 페이지 수")
+    PREVIEW_PREFETCH_QUEUE: int = Field(default=1000, description="미리 렌더링 대기 문서 수 (넘치면 건너뜀)")
+
+    # 내보내기 설정 (CSV/NDJSON 스트리밍, 비동기 작업)
+    EXPORT_BATCH_ROWS: int = Field(default=1000, description="서버 측 커서에서 한 번에 읽어 인코딩할 행 수")
+    EXPORT_STORAGE_DIR: str = Field(default="./data/exports", description="비동기 내보내기 작업 파일 저장 디렉터리")
+    EXPORT_JOB_CONCURRENCY: int = Field(default=2, description="동시에 실행할 내보내기 작업 수")
+    EXPORT_HEARTBEAT_SECONDS: float = Field(default=15.0, description="실행 중인 내보내기 작업의 하트비트를 갱신하는 주기(초)")
+    EXPORT_STALE_SECONDS: float = Field(default=120.0, description="하트비트가 이 시간(초) 넘게 끊긴 작업을 중단된 것으로 보고 실패 처리")
+    EXPORT_RETENTION_SECONDS: float = Field(default=604800.0, description="끝난 내보내기 작업 행과 파일 보관 기간(초)")
+    EXPORT_SWEEP_INTERVAL_SECONDS: float = Field(default=3600.0, description="보관 기간이 지난 내보내기 작업과 파일 삭제 주기(초)")
+
+    # 검색 기록 설정
+    RAG_HISTORY_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, description="모인 검색 기록을 일괄 저장하는 주기(초)")
+    RAG_HISTORY_MAX_PENDING: int = Field(default=10000, description="저장 대기 검색 기록 최대 수 (넘치면 오래된 것부터 버림)")
+
+    # 검색어 자동완성 설정
+    SUGGESTION_TOP_K: int = Field(default=16, description="자동완성 트라이 노드별로 유지하는 상위 후보 수")
+    SUGGESTION_MAX_DEPTH: int = Field(default=24, description="트라이 최대 깊이(자모 수, 더 긴 접두어는 해당 깊이 노드의 후보를 걸러 냄)")
+    SUGGESTION_MAX_TERMS: int = Field(default=200000, description="테넌트별 자동완성 후보 최대 수 (넘치면 점수 상위 절반으로 재구성)")
+    SUGGESTION_USER_MAX_TERMS: int = Field(default=1000, description="사용자별 과거 질의 자동완성 후보 최대 수 (과거 질의는 본인에게만 제안)")
+    SUGGESTION_HALF_LIFE_DAYS: float = Field(default=7.0, description="자동완성 빈도 가중치가 절반이 되는 기간(일)")
+    SUGGESTION_BOOTSTRAP_DAYS: int = Field(default=90, description="테넌트 자동완성 색인을 처음 만들 때 반영할 검색 기록 기간(일)")
+    SUGGESTION_LIMIT: int = Field(default=5, description="자동완성 기본 반환 수")
+
+    # 질의 트렌드 설정
+    TRENDS_SKETCH_WIDTH: int = Field(default=2048, description="트렌드 count-min 스케치 너비 (오차 약 e/너비 x 버킷 전체 수)")
+    TRENDS_SKETCH_DEPTH: int = Field(default=4, description="트렌드 count-min 스케치 깊이 (해시 함수 수)")
+    TRENDS_CANDIDATES: int = Field(default=100, description="버킷별로 유지하는 상위 후보 수")
+    TRENDS_FLUSH_INTERVAL_SECONDS: float = Field(default=10.0, description="트렌드 증분을 버킷 행에 합쳐 쓰고 다른 워커 갱신을 읽는 주기(초)")
+    TRENDS_LIMIT: int = Field(default=10, description="트렌드 기본 반환 수")
+
+    # 사용량 계량 설정
+    METERING_WINDOW_SECONDS: float = Field(default=5.0, description="사용량 증분을 닫아 기록하는 텀블링 윈도우 길이(초)")
+
+    # 쿼터 설정
+    QUOTA_ENABLED: bool = Field(default=True, description="요금제 한도 적용 여부 (끄면 계량만 함)")
+    QUOTA_DEFAULT_PLAN: str = Field(default="pro", description="요금제가 지정되지 않은 테넌트의 요금제")
+    QUOTA_WORKERS: int = Field(default=4, description="남은 한도를 나눠 갖는 최대 워커 수")
+    QUOTA_MIN_SLICE: int = Field(default=10, description="워커가 계량 윈도우마다 받는 최소 허용량 (한도 초과 상한 = 워커 수 x 최소 허용량)")
+    QUOTA_REFRESH_DELAY_SECONDS: float = Field(default=0.5, description="윈도우 경계 후 월별 누적을 다시 읽기까지 기다리는 시간(초, 워커들의 기록 완료 대기)")
+    QUOTA_THRESHOLDS: list[int] = Field(default=[80, 100], description="billing.threshold 이벤트를 보내는 사용률(%)")
+
+    # 청킹 설정
+    CHUNK_MAX_TOKENS: int = Field(default=256, description="청크당 최대 토큰 수")
+    CHUNK_OVERLAP_TOKENS: int = Field(default=32, description="인접 청크 간 겹치는 토큰 수")
+    
     # 모니터링 설정
     PROMETHEUS_URL: Optional[str] = Field(default=None, description="Prometheus URL")
     GRAFANA_URL: Optional[str] = Field(default=None, description="Grafana URL")
@@ -0,0 +1,94 @@
+"""
+파이프라인 이벤트 버스
+
+Kafka 토픽 이름과 프로세스 내 이벤트 디스패처
+
+Kafka 컨슈머는 레코드를 받아 `event_bus.publish`로 전달하고, 각 도메인은
+관심 있는 토픽에 핸들러를 등록합니다. 브로커가 없는 로컬/테스트 환경에서는
+같은 버스에 직접 이벤트를 발행해 동일한 경로를 검증할 수 있습니다.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 핸들러 타입 (동기/비동기 모두 허용)
+EventHandler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class Topics:
+    """Kafka 토픽 이름 상수입니다."""
+
+    DOCUMENTS_UPLOADED = "documents.uploaded"
+    DOCUMENTS_PARSED = "documents.parsed"
+    DOCUMENTS_VALIDATED = "documents.validated"
+    DOCUMENTS_REVIEWED = "documents.reviewed"
+    DOCUMENTS_INDEXED = "documents.indexed"
+    INDEX_META = "index.meta"
+    BILLING_USAGE = "billing.usage"
+    BILLING_THRESHOLD = "billing.threshold"
+    ML_MODELS_REGISTERED = "ml.models.registered"
+
+
+class EventBus:
+    """토픽별 핸들러에 이벤트를 전달하는 프로세스 내 이벤트 버스입니다."""
+
+    def __init__(self):
+        """이벤트 버스를 초기화합니다."""
+        self._handlers: DefaultDict[str, List[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: EventHandler) -> None:
+        """토픽에 핸들러를 등록합니다 (같은 핸들러는 한 번만 등록됩니다).
+
+        Args:
+            topic (str): 토픽 이름
+            handler (EventHandler): 이벤트 값을 받는 핸들러
+        """
+        if handler not in self._handlers[topic]:
+            self._handlers[topic].append(handler)
+
+    def unsubscribe(self, topic: str, handler: EventHandler) -> None:
+        """토픽에서 핸들러를 제거합니다.
+
+        Args:
+            topic (str): 토픽 이름
+            handler (EventHandler): 제거할 핸들러
+        """
+        if handler in self._handlers[topic]:
+            self._handlers[topic].remove(handler)
+
+    async def publish(
+        self, topic: str, value: Dict[str, Any], key: Optional[str] = None
+    ) -> None:
+        """이벤트를 등록된 핸들러에 전달합니다.
+
+        한 핸들러의 실패가 다른 핸들러 실행을 막지 않도록 예외는 로깅만 합니다.
+
+        Args:
+            topic (str): 토픽 이름
+            value (Dict[str, Any]): 이벤트 값
+            key (Optional[str]): 파티션 키 (로깅용)
+        """
+        for handler in list(self._handlers.get(topic, ())):
+            try:
+                result = handler(value)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("이벤트 핸들러 실패 (topic=%s, key=%s)", topic, key)
+
+
+# 전역 이벤트 버스 인스턴스
+event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """이벤트 버스 인스턴스를 반환합니다.
+
+    Returns:
+        EventBus: 전역 이벤트 버스
+    """
+    return event_bus
@@ -77,6 +77,118 @@ class TokenExpired(BusinessException):
         )
 
 
+class VerificationNotFound(BusinessException):
+    """근거 검증 결과를 찾을 수 없을 때 발생하는 예외입니다."""
+    
+    def __init__(self, verification_id: str):
+        super().__init__(
+            message=f"근거 검증 결과를 찾을 수 없습니다: {verification_id}",
+            error_code="VERIFICATION_NOT_FOUND"
+        )
+
+
+class ValidationRuleNotFound(BusinessException):
+    """검증 규칙을 찾을 수 없을 때 발생하는 예외입니다."""
+    
+    def __init__(self, rule_id: str):
+        super().__init__(
+            message=f"검증 규칙을 찾을 수 없습니다: {rule_id}",
+            error_code="VALIDATION_RULE_NOT_FOUND"
+        )
+
+
+class InvalidValidationRule(BusinessException):
+    """검증 규칙을 실행 계획으로 컴파일할 수 없을 때 발생하는 예외입니다."""
+    
+    def __init__(self, reason: str):
+        super().__init__(
+            message=f"유효하지 않은 검증 규칙입니다: {reason}",
+            error_code="INVALID_VALIDATION_RULE"
+        )
+
+
+class ReprocessJobNotFound(BusinessException):
+    """재처리 작업을 찾을 수 없는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, job_id: str):
+        super().__init__(
+            message=f"재처리 작업을 찾을 수 없습니다: {job_id}",
+            error_code="REPROCESS_JOB_NOT_FOUND"
+        )
+
+
+class DocumentNotFound(BusinessException):
+    """문서를 찾을 수 없는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, document_id: str):
+        super().__init__(
+            message=f"문서를 찾을 수 없습니다: {document_id}",
+            error_code="DOCUMENT_NOT_FOUND"
+        )
+
+
+class PreviewPageNotFound(BusinessException):
+    """미리보기를 만들 페이지가 문서에 없는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, document_id: str, page: int):
+        super().__init__(
+            message=f"문서에 해당 페이지가 없습니다: {document_id} (page={page})",
+            error_code="PREVIEW_PAGE_NOT_FOUND"
+        )
+
+
+class InvalidCursor(BusinessException):
+    """목록 커서를 해석할 수 없는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, cursor: str):
+        super().__init__(
+            message=f"유효하지 않은 목록 커서입니다: {cursor}",
+            error_code="INVALID_CURSOR"
+        )
+
+
+class ExportJobNotFound(BusinessException):
+    """내보내기 작업을 찾을 수 없는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, job_id: str):
+        super().__init__(
+            message=f"내보내기 작업을 찾을 수 없습니다: {job_id}",
+            error_code="EXPORT_JOB_NOT_FOUND"
+        )
+
+
+class ExportNotReady(BusinessException):
+    """완료되지 않은 내보내기 작업 파일을 내려받으려는 경우 발생하는 예외입니다."""
+    
+    def __init__(self, job_id: str, status: str):
+        super().__init__(
+            message=f"내보내기 작업이 완료되지 않았습니다: {job_id} (status={status})",
+            error_code="EXPORT_NOT_READY"
+        )
+
+
+class QuotaExceeded(BusinessException):
+    """요금제의 과금 기간 한도를 다 쓴 경우 발생하는 예외입니다."""
+    
+    def __init__(self, metric: str, limit: int, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(
+            message=f"요금제 한도를 모두 사용했습니다: {metric} (limit={limit})",
+            error_code="QUOTA_EXCEEDED"
+        )
+
+
+class QuotaThrottled(BusinessException):
+    """한도는 남았지만 이 워커의 갱신 주기 허용량을 다 쓴 경우 발생하는 예외입니다."""
+    
+    def __init__(self, metric: str, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(
+            message=f"요청이 많아 잠시 후 다시 시도해야 합니다: {metric}",
+            error_code="QUOTA_THROTTLED"
+        )
+
+
 # HTTP 상태 코드 매핑
 EXCEPTION_STATUS_MAP = {
     UserAlreadyExists: status.HTTP_409_CONFLICT,
@@ -85,6 +197,17 @@ EXCEPTION_STATUS_MAP = {
     InactiveUser: status.HTTP_403_FORBIDDEN,
     InvalidToken: status.HTTP_401_UNAUTHORIZED,
     TokenExpired: status.HTTP_401_UNAUTHORIZED,
+    VerificationNotFound: status.HTTP_404_NOT_FOUND,
+    ValidationRuleNotFound: status.HTTP_404_NOT_FOUND,
+    InvalidValidationRule: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ReprocessJobNotFound: status.HTTP_404_NOT_FOUND,
+    DocumentNotFound: status.HTTP_404_NOT_FOUND,
+    PreviewPageNotFound: status.HTTP_404_NOT_FOUND,
+    InvalidCursor: status.HTTP_400_BAD_REQUEST,
+    ExportJobNotFound: status.HTTP_404_NOT_FOUND,
+    ExportNotReady: status.HTTP_409_CONFLICT,
+    QuotaExceeded: status.HTTP_429_TOO_MANY_REQUESTS,
+    QuotaThrottled: status.HTTP_429_TOO_MANY_REQUESTS,
 }
 
 
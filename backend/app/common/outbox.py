@@ -0,0 +1,257 @@
+"""
+트랜잭션 아웃박스
+
+상태 변경과 같은 트랜잭션에 이벤트 행을 쓰고, 커밋된 행을 릴레이가 이벤트 버스로 발행합니다.
+
+- 요청 경로는 아웃박스 INSERT 한 번과 릴레이 깨우기만 하므로 발행 지연이 응답 시간에 들어가지
+  않습니다. 커밋 전에 프로세스가 죽으면 상태 변경과 이벤트가 함께 사라지고, 커밋 후 발행 전에
+  죽으면 다음 릴레이 주기에 발행됩니다.
+- 여러 프로세스가 같은 행을 발행할 수 있으므로 전달은 at-least-once이며, 컨슈머는 이벤트 값의
+  키로 멱등 처리해야 합니다.
+- 발행된 행은 보관 기간(`OUTBOX_RETENTION_SECONDS`)이 지나면 릴레이가 정리 주기마다 배치 단위로
+  삭제하므로 테이블과 `published_at` 인덱스가 발행량에 비례해 계속 커지지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import JSON, Column, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Field, SQLModel
+
+from .config import settings
+from .database import db_manager
+from .events import EventBus, event_bus
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxEvent(SQLModel, table=True):
+    """발행 대기 중인 이벤트를 저장하는 아웃박스 모델입니다.
+
+    Attributes:
+        id (int): 증가 순번 (발행 순서)
+        topic (str): 토픽 이름
+        key (Optional[str]): 파티션 키
+        payload (Dict[str, Any]): 이벤트 값
+        created_at (datetime): 기록 시간
+        published_at (Optional[datetime]): 발행 시간 (미발행이면 None)
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="증가 순번"
+    )
+    topic: str = Field(
+        description="토픽 이름"
+    )
+    key: Optional[str] = Field(
+        default=None,
+        description="파티션 키"
+    )
+    payload: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="이벤트 값"
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="기록 시간"
+    )
+    published_at: Optional[datetime] = Field(
+        default=None,
+        index=True,
+        description="발행 시간"
+    )
+
+
+async def stage_event(
+    session: AsyncSession, topic: str, value: Dict[str, Any], key: Optional[str] = None
+) -> None:
+    """현재 트랜잭션에 아웃박스 이벤트를 기록합니다 (커밋은 호출자가 상태 변경과 함께 수행).
+
+    Args:
+        session (AsyncSession): 상태 변경과 같은 데이터베이스 세션
+        topic (str): 토픽 이름
+        value (Dict[str, Any]): 이벤트 값 (JSON 직렬화 가능해야 함)
+        key (Optional[str]): 파티션 키
+    """
+    await session.execute(
+        insert(OutboxEvent).values(topic=topic, key=key, payload=value, created_at=datetime.utcnow())
+    )
+
+
+async def stage_events(
+    session: AsyncSession, topic: str, events: Sequence[Tuple[Dict[str, Any], Optional[str]]]
+) -> None:
+    """현재 트랜잭션에 같은 토픽의 아웃박스 이벤트 여러 개를 한 번에 기록합니다 (순서 유지).
+
+    Args:
+        session (AsyncSession): 상태 변경과 같은 데이터베이스 세션
+        topic (str): 토픽 이름
+        events (Sequence[Tuple[Dict[str, Any], Optional[str]]]): (이벤트 값, 파티션 키) 목록
+    """
+    if not events:
+        return
+    now = datetime.utcnow()
+    await session.execute(
+        insert(OutboxEvent),
+        [{"topic": topic, "key": key, "payload": value, "created_at": now} for value, key in events],
+    )
+
+
+class OutboxRelay:
+    """미발행 아웃박스 이벤트를 순서대로 이벤트 버스에 발행하는 릴레이 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        bus: Optional[EventBus] = None,
+        batch_size: Optional[int] = None,
+        retention: Optional[float] = None,
+    ):
+        """릴레이를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            bus (Optional[EventBus]): 발행할 이벤트 버스
+            batch_size (Optional[int]): 한 번에 읽어 발행하거나 삭제할 이벤트 수
+            retention (Optional[float]): 발행된 이벤트 보관 기간(초)
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.bus = bus or event_bus
+        self.batch_size = batch_size or settings.OUTBOX_RELAY_BATCH
+        self.retention = settings.OUTBOX_RETENTION_SECONDS if retention is None else retention
+        self.published = 0
+        self.swept = 0
+        self._swept_at = time.monotonic()
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def notify(self) -> None:
+        """커밋된 새 이벤트가 있음을 알려 다음 주기를 기다리지 않고 발행하게 합니다."""
+        self._wakeup.set()
+
+    async def flush(self) -> int:
+        """미발행 이벤트를 모두 발행하고 발행 시간을 기록합니다.
+
+        Returns:
+            int: 발행한 이벤트 수
+        """
+        published = 0
+        async with self._lock:
+            while True:
+                async with self.session_factory() as session:
+                    result = await session.execute(
+                        select(OutboxEvent.id, OutboxEvent.topic, OutboxEvent.key, OutboxEvent.payload)
+                        .where(OutboxEvent.published_at.is_(None))
+                        .order_by(OutboxEvent.id)
+                        .limit(self.batch_size)
+                    )
+                    rows = result.all()
+                    if not rows:
+                        break
+                    for row in rows:
+                        await self.bus.publish(row.topic, row.payload, key=row.key)
+                    await session.execute(
+                        update(OutboxEvent)
+                        .where(OutboxEvent.id.in_([row.id for row in rows]))
+                        .values(published_at=datetime.utcnow())
+                    )
+                    await session.commit()
+                published += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+        self.published += published
+        return published
+
+    async def sweep(self) -> int:
+        """보관 기간이 지난 발행된 이벤트를 배치 단위로 삭제합니다.
+
+        미발행 이벤트는 오래되었어도 삭제하지 않습니다.
+
+        Returns:
+            int: 삭제한 이벤트 수
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        expired = (
+            select(OutboxEvent.id)
+            .where(OutboxEvent.published_at.is_not(None), OutboxEvent.published_at < cutoff)
+            .limit(self.batch_size)
+        )
+        deleted = 0
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    delete(OutboxEvent).where(OutboxEvent.id.in_(expired.scalar_subquery()))
+                )
+                await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.batch_size:
+                break
+        self._swept_at = time.monotonic()
+        self.swept += deleted
+        return deleted
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """알림 또는 주기마다 발행하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 알림이 없을 때 확인 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.OUTBOX_RELAY_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.exception("아웃박스 발행 실패")
+                if time.monotonic() - self._swept_at >= settings.OUTBOX_SWEEP_INTERVAL_SECONDS:
+                    try:
+                        await self.sweep()
+                    except Exception:
+                        logger.exception("아웃박스 정리 실패")
+
+        self._task = asyncio.create_task(_loop(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 남은 이벤트를 발행합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("종료 시 아웃박스 발행 실패")
+
+
+# 전역 아웃박스 릴레이 인스턴스
+outbox_relay = OutboxRelay()
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """아웃박스 릴레이 인스턴스를 반환합니다.
+
+    Returns:
+        OutboxRelay: 전역 아웃박스 릴레이
+    """
+    return outbox_relay
@@ -0,0 +1,40 @@
+"""
+문자 n-gram 싱글
+
+근거 검증(`rag.citations`)과 유사 중복 탐지(`validation.dedup`)가 함께 쓰는 본문 싱글 해시
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+
+# 단어 문자가 아닌 글자 (공백, 문장부호, 밑줄)
+_NON_WORD = re.compile(r"[\W_]+")
+# 싱글 다항 해시 기수 (uint64 오버플로 순환 허용)
+_SHINGLE_BASE = np.uint64(1_000_003)
+
+
+def shingles(text: str, size: int) -> np.ndarray:
+    """문자 n-gram 싱글 해시 집합을 계산합니다.
+
+    NFKC 정규화, 소문자화 후 공백/문장부호를 제거한 문자열에서 연속 `size`글자의 다항 해시를
+    구합니다. 조사·어미가 붙는 한국어에서도 어절 경계와 무관하게 겹침을 잡습니다.
+
+    Args:
+        text (str): 원문
+        size (int): 싱글 글자 수
+
+    Returns:
+        np.ndarray: 정렬된 고유 uint64 해시 배열 (글자가 size보다 적으면 전체를 싱글 하나로)
+    """
+    normalized = _NON_WORD.sub("", unicodedata.normalize("NFKC", text).lower())
+    codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) == 0:
+        return codes
+    width = min(size, len(codes))
+    hashes = np.zeros(len(codes) - width + 1, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for offset in range(width):
+            hashes = hashes * _SHINGLE_BASE + codes[offset:offset + len(hashes)]
+    return np.unique(hashes)
@@ -0,0 +1,33 @@
+"""
+이벤트 스트리밍 인코딩
+
+RAG 질의와 문서 검증 진행 상황처럼 이벤트를 스트리밍하는 엔드포인트가 함께 쓰는
+Server-Sent Events(기본)/NDJSON(`Accept: application/x-ndjson`) 인코딩
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, Tuple
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+async def encode_events(
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]], ndjson: bool
+) -> AsyncIterator[bytes]:
+    """이벤트를 SSE 또는 NDJSON 바이트로 인코딩합니다.
+
+    Args:
+        events (AsyncIterator[Tuple[str, Dict[str, Any]]]): (이벤트 이름, 데이터) 스트림
+        ndjson (bool): NDJSON 여부 (아니면 SSE)
+
+    Yields:
+        bytes: 이벤트 한 건 (SSE 프레임 또는 NDJSON 한 줄)
+    """
+    async for event, data in events:
+        if ndjson:
+            line = json.dumps({"event": event, "data": data}, ensure_ascii=False)
+            yield (line + "\n").encode()
+        else:
+            payload = json.dumps(data, ensure_ascii=False)
+            yield f"event: {event}\ndata: {payload}\n\n".encode()
@@ -14,7 +14,7 @@ from ...common.database import get_db_session
 from ...common.security import verify_token
 from ...common.exceptions import business_exception_handler
 from ...common.config import settings
-from .schemas import UserCreate, UserRead, LoginRequest, LoginResponse, TokenRefreshRequest, TokenRefreshResponse
+from .schemas import UserCreate, UserRead, LoginRequest, LoginResponse, TokenRefreshRequest, TokenRefreshResponse, TokenPayload
 from .services import AuthService
 
 # HTTP Bearer 토큰 스키마
@@ -59,6 +59,31 @@ def get_current_user_id(
     return UUID(payload["sub"])
 
 
+def get_current_token(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
+) -> TokenPayload:
+    """현재 액세스 토큰의 페이로드(사용자, 테넌트, 역할)를 추출합니다.
+    
+    Args:
+        credentials (HTTPAuthorizationCredentials): 인증 정보
+        
+    Returns:
+        TokenPayload: 토큰 페이로드
+        
+    Raises:
+        HTTPException: 토큰이 유효하지 않은 경우
+    """
+    payload = verify_token(credentials.credentials)
+    
+    if not payload or payload.get("type") != "access":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다"
+        )
+    
+    return TokenPayload(**payload)
+
+
 # 인증 라우터 생성
 router = APIRouter(prefix="/api/v1/auth", tags=["인증"])
 
@@ -5,7 +5,7 @@
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field, validator
 
@@ -88,6 +88,7 @@ class TokenPayload(BaseModel):
     email: str = Field(description="이메일 주소")
     tenant_id: str = Field(description="테넌트 ID")
     role: UserRole = Field(description="사용자 역할")
+    groups: List[str] = Field(default_factory=list, description="소속 그룹 ID 목록 (문서 권한 판정용)")
     type: str = Field(description="토큰 타입 (access/refresh)")
     exp: datetime = Field(description="만료 시간")
 
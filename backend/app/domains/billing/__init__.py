@@ -0,0 +1,5 @@
+"""
+과금 도메인
+
+테넌트 사용량 계량과 월별 사용량 집계 관련 모듈들
+"""
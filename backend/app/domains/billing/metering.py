@@ -0,0 +1,384 @@
+"""
+사용량 계량
+
+API 요청과 파이프라인 단계의 사용량을 테넌트별 메모리 카운터에 더하고, 텀블링 윈도우가 닫힐 때마다
+증분을 한 트랜잭션으로 기록합니다.
+
+- 요청 경로의 기록은 이벤트 루프 스레드에서 딕셔너리 증분 하나뿐이라 잠금도 DB 쓰기도 없습니다.
+  METERING_WINDOW_SECONDS 경계마다 열린 카운터를 새 딕셔너리로 바꿔 윈도우를 닫습니다.
+- 닫힌 윈도우는 테넌트마다 `{테넌트}:{워커}:{순번}` 키를 받고, 한 트랜잭션에서 윈도우 행
+  (`usage_windows`), 월별 누적(`tenant_usage`), `billing.usage` 아웃박스 이벤트로 함께 쓰입니다.
+  이미 기록된 키는 건너뛰므로 커밋 응답을 잃고 같은 윈도우를 다시 써도 두 번 더해지지 않습니다.
+- 기록에 실패한 윈도우는 키를 유지한 채 다음 주기에 다시 시도합니다 (at-least-once + 멱등 키).
+  `billing.usage` 컨슈머도 이벤트의 `window_key`로 중복을 걸러야 합니다.
+- 윈도우를 닫기 전에 프로세스가 죽으면 열린 윈도우(최대 METERING_WINDOW_SECONDS)의 증분은 사라집니다.
+- 쿼터 집행(`quotas`)이 요청마다 DB를 읽지 않도록, 아직 기록하지 않은 이 워커의 증분(`pending`)과
+  마지막 기록 트랜잭션에서 읽은 월별 누적(`committed`)을 O(1)로 돌려줍니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from sqlalchemy import bindparam, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ...common.events import Topics
+from ...common.outbox import OutboxRelay, outbox_relay, stage_events
+from .models import TenantUsage, UsageWindow
+
+logger = logging.getLogger(__name__)
+
+WINDOW_TABLE = UsageWindow.__table__
+USAGE_TABLE = TenantUsage.__table__
+
+# 계량 지표 (월별 누적 컬럼과 같은 이름)
+USAGE_METRICS = tuple(
+    column.name for column in USAGE_TABLE.columns
+    if column.name not in ("tenant_id", "period", "updated_at")
+)
+_METRIC_SET = frozenset(USAGE_METRICS)
+
+
+def usage_period(at: datetime) -> str:
+    """시각이 속한 과금 기간(UTC 기준 월)을 반환합니다.
+
+    Args:
+        at (datetime): 시각 (UTC)
+
+    Returns:
+        str: `YYYY-MM` 형식 과금 기간
+    """
+    return at.strftime("%Y-%m")
+
+
+@dataclass
+class UsageDelta:
+    """닫힌 윈도우 하나의 테넌트 사용량 증분입니다.
+
+    Attributes:
+        key (str): 윈도우 멱등 키
+        tenant_id (str): 테넌트 ID
+        start (datetime): 윈도우 시작 시간 (UTC)
+        end (datetime): 윈도우 종료 시간 (UTC)
+        usage (Dict[str, int]): 지표별 증분
+    """
+
+    key: str
+    tenant_id: str
+    start: datetime
+    end: datetime
+    usage: Dict[str, int]
+
+    @property
+    def period(self) -> str:
+        """윈도우가 더해지는 과금 기간 (윈도우 시작 기준)."""
+        return usage_period(self.start)
+
+
+class UsageMeter:
+    """테넌트별 사용량을 메모리에서 세고, 닫힌 윈도우를 멱등 키로 일괄 기록하는 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        relay: Optional[OutboxRelay] = None,
+        window: Optional[float] = None,
+        worker_id: Optional[str] = None,
+    ):
+        """사용량 계량기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            relay (Optional[OutboxRelay]): 기록 후 깨울 아웃박스 릴레이
+            window (Optional[float]): 텀블링 윈도우 길이(초)
+            worker_id (Optional[str]): 윈도우 키에 넣을 워커 식별자 (기본: 호스트-PID-난수)
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.relay = relay or outbox_relay
+        self.window = window or settings.METERING_WINDOW_SECONDS
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+        self.windows_written = 0
+        self._open: DefaultDict[str, Counter] = defaultdict(Counter)
+        self._opened_at = datetime.utcnow()
+        self._sequence = 0
+        self._closed: List[UsageDelta] = []
+        self._backlog: DefaultDict[str, Counter] = defaultdict(Counter)
+        self._committed: Dict[str, Tuple[str, Dict[str, int]]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def record(self, tenant_id: str, metric: str, amount: int = 1) -> None:
+        """열린 윈도우에 테넌트 사용량을 더합니다 (다음 윈도우 경계에 기록).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            metric (str): 지표 이름 (`USAGE_METRICS` 중 하나)
+            amount (int): 증분
+
+        Raises:
+            ValueError: 알 수 없는 지표인 경우
+        """
+        if metric not in _METRIC_SET:
+            raise ValueError(f"알 수 없는 사용량 지표입니다: {metric}")
+        if amount:
+            self._open[tenant_id][metric] += amount
+
+    def on_documents_uploaded(self, event: Dict[str, Any]) -> None:
+        """`documents.uploaded` 이벤트로 업로드 문서 수를 기록합니다 (재처리는 제외).
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `reprocess`(선택)를 포함한 이벤트
+        """
+        if not event.get("reprocess"):
+            self.record(event["tenant_id"], "documents")
+
+    def on_documents_parsed(self, event: Dict[str, Any]) -> None:
+        """`documents.parsed` 이벤트로 파싱 페이지 수를 기록합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `pages`를 포함한 이벤트
+        """
+        self.record(event["tenant_id"], "pages", len(event.get("pages") or ()))
+
+    def on_documents_indexed(self, event: Dict[str, Any]) -> None:
+        """`documents.indexed` 이벤트로 임베딩한 청크 토큰 수를 기록합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `chunks`([{token_count}])를 포함한 이벤트
+        """
+        tokens = sum(chunk.get("token_count", 0) for chunk in event.get("chunks") or ())
+        self.record(event["tenant_id"], "embedding_tokens", tokens)
+
+    def pending(self, tenant_id: str, metric: str) -> int:
+        """아직 기록하지 않은 이 워커의 테넌트 증분을 반환합니다 (열린 윈도우 + 기록 대기 윈도우).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            metric (str): 지표 이름
+
+        Returns:
+            int: 증분 합계
+        """
+        opened = self._open.get(tenant_id)
+        closed = self._backlog.get(tenant_id)
+        return (opened[metric] if opened else 0) + (closed[metric] if closed else 0)
+
+    def committed(self, tenant_id: str, metric: str, period: str) -> int:
+        """이 워커가 마지막으로 기록한 트랜잭션에서 읽은 테넌트 월별 누적을 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            metric (str): 지표 이름
+            period (str): 과금 기간
+
+        Returns:
+            int: 월별 누적 (기록한 적이 없거나 다른 기간이면 0)
+        """
+        committed = self._committed.get(tenant_id)
+        if committed is None or committed[0] != period:
+            return 0
+        return committed[1][metric]
+
+    async def usage(
+        self, session: AsyncSession, tenant_id: str, period: Optional[str] = None
+    ) -> Dict[str, int]:
+        """월별 누적을 기본 키로 읽고 아직 기록하지 않은 이 프로세스의 증분을 더해 반환합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            tenant_id (str): 테넌트 ID
+            period (Optional[str]): 과금 기간 (기본: 이번 달)
+
+        Returns:
+            Dict[str, int]: 지표별 사용량 (행이 없으면 0)
+        """
+        period = period or usage_period(datetime.utcnow())
+        result = await session.execute(
+            select(USAGE_TABLE).where(USAGE_TABLE.c.tenant_id == tenant_id, USAGE_TABLE.c.period == period)
+        )
+        row = result.mappings().first()
+        usage = {metric: (row[metric] if row is not None else 0) for metric in USAGE_METRICS}
+        pending = [delta.usage for delta in self._closed if delta.tenant_id == tenant_id and delta.period == period]
+        if usage_period(self._opened_at) == period:
+            pending.append(self._open.get(tenant_id) or {})
+        for deltas in pending:
+            for metric, amount in deltas.items():
+                usage[metric] += amount
+        return usage
+
+    def _close_window(self) -> int:
+        """열린 윈도우를 닫고 테넌트별 증분에 멱등 키를 붙여 기록 대기열에 넣습니다."""
+        closed_at = datetime.utcnow()
+        batch, opened_at = self._open, self._opened_at
+        self._open, self._opened_at = defaultdict(Counter), closed_at
+        if not batch:
+            return 0
+        self._sequence += 1
+        for tenant_id, usage in batch.items():
+            self._backlog[tenant_id].update(usage)
+            self._closed.append(UsageDelta(
+                key=f"{tenant_id}:{self.worker_id}:{self._sequence}",
+                tenant_id=tenant_id,
+                start=opened_at,
+                end=closed_at,
+                usage=dict(usage),
+            ))
+        return len(batch)
+
+    async def flush(self) -> int:
+        """열린 윈도우를 닫고 기록하지 못한 윈도우를 모두 한 트랜잭션으로 씁니다.
+
+        실패하면 윈도우를 같은 키로 남겨 두고 다음 주기에 다시 시도합니다.
+
+        Returns:
+            int: 새로 기록한 윈도우 수 (이미 기록된 키는 제외)
+        """
+        async with self._lock:
+            self._close_window()
+            if not self._closed:
+                return 0
+            batch = list(self._closed)
+            written = await self._write(batch)
+            del self._closed[:len(batch)]
+            for delta in batch:
+                backlog = self._backlog[delta.tenant_id]
+                backlog.subtract(delta.usage)
+                if not any(backlog.values()):
+                    del self._backlog[delta.tenant_id]
+        self.windows_written += written
+        return written
+
+    async def _write(self, batch: Sequence[UsageDelta]) -> int:
+        """윈도우 행, 월별 누적, `billing.usage` 이벤트를 한 트랜잭션으로 씁니다 (기록된 키는 건너뜀)."""
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(WINDOW_TABLE.c.window_key).where(WINDOW_TABLE.c.window_key.in_([delta.key for delta in batch]))
+            )
+            applied = set(result.scalars())
+            fresh = [delta for delta in batch if delta.key not in applied]
+            if not fresh:
+                return 0
+            await session.execute(insert(WINDOW_TABLE), [
+                {
+                    "window_key": delta.key,
+                    "tenant_id": delta.tenant_id,
+                    "window_start": delta.start,
+                    "window_end": delta.end,
+                    "usage": delta.usage,
+                    "created_at": now,
+                }
+                for delta in fresh
+            ])
+
+            totals: DefaultDict[Tuple[str, str], Counter] = defaultdict(Counter)
+            for delta in fresh:
+                totals[(delta.tenant_id, delta.period)].update(delta.usage)
+            keyed = tuple_(USAGE_TABLE.c.tenant_id, USAGE_TABLE.c.period).in_(list(totals))
+            result = await session.execute(select(USAGE_TABLE.c.tenant_id, USAGE_TABLE.c.period).where(keyed))
+            existing = set(map(tuple, result.all()))
+            missing = [
+                {"tenant_id": tenant_id, "period": period,
+                 **{metric: deltas.get(metric, 0) for metric in USAGE_METRICS}, "updated_at": now}
+                for (tenant_id, period), deltas in totals.items() if (tenant_id, period) not in existing
+            ]
+            if missing:
+                await session.execute(insert(USAGE_TABLE), missing)
+            if existing:
+                # 지표마다 증분 파라미터를 두고 executemany 한 번으로 갱신
+                await session.execute(
+                    update(USAGE_TABLE)
+                    .where(USAGE_TABLE.c.tenant_id == bindparam("key_tenant"),
+                           USAGE_TABLE.c.period == bindparam("key_period"))
+                    .values({
+                        **{metric: USAGE_TABLE.c[metric] + bindparam(f"delta_{metric}") for metric in USAGE_METRICS},
+                        "updated_at": now,
+                    }),
+                    [
+                        {"key_tenant": tenant_id, "key_period": period,
+                         **{f"delta_{metric}": totals[(tenant_id, period)].get(metric, 0) for metric in USAGE_METRICS}}
+                        for tenant_id, period in existing
+                    ],
+                )
+
+            result = await session.execute(select(USAGE_TABLE).where(keyed))
+            current = {(row["tenant_id"], row["period"]): row for row in result.mappings()}
+            await stage_events(session, Topics.BILLING_USAGE, [
+                (
+                    {
+                        "tenant_id": delta.tenant_id,
+                        "period": delta.period,
+                        "window_key": delta.key,
+                        "window_start": delta.start.isoformat(),
+                        "window_end": delta.end.isoformat(),
+                        "usage": delta.usage,
+                        "totals": {metric: current[(delta.tenant_id, delta.period)][metric] for metric in USAGE_METRICS},
+                    },
+                    delta.tenant_id,
+                )
+                for delta in fresh
+            ])
+            await session.commit()
+        for (tenant_id, period), row in current.items():
+            self._committed[tenant_id] = (period, {metric: row[metric] for metric in USAGE_METRICS})
+        self.relay.notify()
+        return len(fresh)
+
+    async def start(self, window: Optional[float] = None) -> None:
+        """윈도우 경계마다 닫고 기록하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            window (Optional[float]): 텀블링 윈도우 길이(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        if window:
+            self.window = window
+
+        async def _loop() -> None:
+            while True:
+                # 워커들이 같은 시각 경계로 윈도우를 닫도록 주기를 벽시계에 맞춘다
+                await asyncio.sleep(self.window - time.time() % self.window)
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.exception("사용량 기록 실패 (대기 윈도우 %d개)", len(self._closed))
+
+        self._task = asyncio.create_task(_loop(), name="usage-meter")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 열린 윈도우를 닫아 기록합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("종료 시 사용량 기록 실패 (대기 윈도우 %d개)", len(self._closed))
+
+
+# 전역 사용량 계량기 인스턴스
+usage_meter = UsageMeter()
+
+
+def get_usage_meter() -> UsageMeter:
+    """사용량 계량기 인스턴스를 반환합니다.
+
+    Returns:
+        UsageMeter: 전역 사용량 계량기
+    """
+    return usage_meter
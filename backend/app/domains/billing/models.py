@@ -0,0 +1,91 @@
+"""
+과금 도메인 모델
+
+사용량 윈도우와 테넌트 월별 사용량, 테넌트 요금제 SQLModel 모델 정의 (README `db.usage`/`billing.usage` 형식)
+"""
+
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import Field, SQLModel
+
+
+class UsageWindow(SQLModel, table=True):
+    """워커 하나가 닫은 텀블링 윈도우의 테넌트 사용량 증분을 저장하는 모델입니다.
+
+    윈도우 키가 기본 키이므로 같은 윈도우를 다시 기록하면 건너뛰고, 월별 누적에는 한 번만 더해집니다.
+
+    Attributes:
+        window_key (str): 윈도우 멱등 키 (`{테넌트}:{워커}:{순번}`)
+        tenant_id (str): 테넌트 ID
+        window_start (datetime): 윈도우 시작 시간 (UTC)
+        window_end (datetime): 윈도우 종료 시간 (UTC)
+        usage (Dict[str, int]): 지표별 증분
+        created_at (datetime): 기록 시간
+    """
+
+    __tablename__ = "usage_windows"
+
+    window_key: str = Field(primary_key=True, description="윈도우 멱등 키")
+    tenant_id: str = Field(index=True, description="테넌트 ID")
+    window_start: datetime = Field(description="윈도우 시작 시간 (UTC)")
+    window_end: datetime = Field(description="윈도우 종료 시간 (UTC)")
+    usage: Dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="지표별 증분"
+    )
+    created_at: datetime = Field(default_factory=datetime.utcnow, description="기록 시간")
+
+
+class TenantUsage(SQLModel, table=True):
+    """테넌트의 월별 누적 사용량 모델입니다.
+
+    사용량 윈도우를 기록하는 트랜잭션에서 증분으로 갱신되며 사용량 API는 이 행 하나를 기본 키로 읽습니다.
+
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        period (str): 과금 기간 (UTC 기준 `YYYY-MM`)
+        requests (int): 인증된 API 요청 수
+        queries (int): RAG 질의 수
+        documents (int): 업로드 문서 수 (재처리 제외)
+        pages (int): 파싱(OCR) 페이지 수
+        tokens (int): 답변 생성 토큰 수 (캐시 응답 제외)
+        embedding_tokens (int): 색인 임베딩 토큰 수
+        updated_at (datetime): 마지막 갱신 시간
+    """
+
+    __tablename__ = "tenant_usage"
+    __table_args__ = (
+        # 쿼터 집행기가 이번 기간에 바뀐 누적만 다시 읽음
+        Index("ix_tenant_usage_period_updated", "period", "updated_at"),
+    )
+
+    tenant_id: str = Field(primary_key=True, description="테넌트 ID")
+    period: str = Field(primary_key=True, description="과금 기간 (YYYY-MM)")
+    requests: int = Field(default=0, description="인증된 API 요청 수")
+    queries: int = Field(default=0, description="RAG 질의 수")
+    documents: int = Field(default=0, description="업로드 문서 수")
+    pages: int = Field(default=0, description="파싱 페이지 수")
+    tokens: int = Field(default=0, description="답변 생성 토큰 수")
+    embedding_tokens: int = Field(default=0, description="색인 임베딩 토큰 수")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, description="마지막 갱신 시간")
+
+
+class TenantPlan(SQLModel, table=True):
+    """테넌트에 지정된 요금제 모델입니다 (행이 없으면 QUOTA_DEFAULT_PLAN).
+
+    쿼터 집행기는 갱신 주기마다 바뀐 행만 다시 읽어 한도에 반영합니다.
+
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        plan (str): 요금제 ID (starter, pro, enterprise)
+        updated_at (datetime): 마지막 변경 시간
+    """
+
+    __tablename__ = "tenant_plans"
+
+    tenant_id: str = Field(primary_key=True, description="테넌트 ID")
+    plan: str = Field(description="요금제 ID")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, index=True, description="마지막 변경 시간")
@@ -0,0 +1,390 @@
+"""
+요금제 쿼터 집행
+
+RAG 질의와 업로드를 받아들이기 전에 테넌트의 남은 한도를 메모리에서 O(1)로 확인합니다.
+
+- 한도는 요금제(`tenant_plans`, 행이 없으면 QUOTA_DEFAULT_PLAN)별 과금 기간(UTC 월) 사용량입니다.
+  사용량은 마지막으로 읽은 월별 누적(`tenant_usage`와 `billing.usage` 이벤트의 누적 중 큰 값)에
+  아직 기록하지 않은 이 워커의 계량 증분을 더해 계산하므로 요청 경로에서 DB를 읽지 않습니다.
+- 여러 워커가 같은 테넌트의 요청을 받으므로, 각 워커는 계량 윈도우마다 남은 한도의
+  1/QUOTA_WORKERS(최소 QUOTA_MIN_SLICE)까지만 받아들입니다. 윈도우 경계에서 워커들이 증분을
+  기록하고 QUOTA_REFRESH_DELAY_SECONDS 뒤 누적을 다시 읽어 몫을 새로 나눕니다. 처음 보는 테넌트나
+  누적을 다시 읽기 전의 새 윈도우에서는 다른 워커가 마지막으로 읽은 뒤 받은 몫을 모두 썼다고 보고
+  남은 한도를 나눕니다. 워커 수가 QUOTA_WORKERS 이하이고 기록이 제때 끝나면 한도 초과는
+  테넌트·지표당 QUOTA_WORKERS x QUOTA_MIN_SLICE 이내입니다. 누적을 한 번도 읽지 못한 워커(시작 적재 실패,
+  백그라운드 작업 없이 쓰는 경우)는 몫 없이 한도만 확인합니다.
+- 받아들인 양은 바로 계량기에 기록합니다. 집행 대상 지표를 다른 경로에서 다시 기록하면 두 번 셉니다.
+- 사용률이 QUOTA_THRESHOLDS(기본 80%, 100%)를 처음 넘으면 `billing.threshold` 이벤트를 아웃박스로
+  발행합니다. 여러 워커가 같은 경계를 알릴 수 있으므로 컨슈머는 `event_key`로 중복을 거릅니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ...common.events import Topics
+from ...common.exceptions import QuotaExceeded, QuotaThrottled
+from ...common.outbox import OutboxRelay, outbox_relay, stage_events
+from .metering import USAGE_TABLE, UsageMeter, usage_meter, usage_period
+from .models import TenantPlan
+
+logger = logging.getLogger(__name__)
+
+# 요금제별 과금 기간 한도 (프론트엔드 요금제 `features`와 같은 값, 없는 지표는 무제한)
+PLAN_LIMITS: Dict[str, Dict[str, int]] = {
+    "starter": {"documents": 500, "queries": 2000},
+    "pro": {"documents": 2000, "queries": 10000},
+    "enterprise": {"documents": 10000, "queries": 50000},
+}
+
+# 한도를 집행하는 지표
+QUOTA_METRICS = ("documents", "queries")
+
+# 다른 워커가 기록한 누적을 놓치지 않도록 마지막 갱신 시각보다 앞에서부터 다시 읽는 여유
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class Allowance:
+    """테넌트 지표 하나의 한도, 알려진 누적, 이 워커의 윈도우 몫입니다.
+
+    Attributes:
+        limit (Optional[int]): 과금 기간 한도 (None이면 무제한)
+        used (int): 마지막으로 읽은 전체 워커 누적
+        epoch (int): 몫을 나눈 계량 윈도우 번호
+        share (int): 이 윈도우에 받아들일 수 있는 양
+        granted (int): 이 윈도우에 받아들인 양
+        unseen (int): 누적을 마지막으로 읽은 뒤 다른 워커가 받았을 수 있는 최대량
+        level (int): 마지막으로 넘은 사용률 경계(%)
+    """
+
+    __slots__ = ("limit", "used", "epoch", "share", "granted", "unseen", "level")
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.used = 0
+        self.epoch = -1
+        self.share = 0
+        self.granted = 0
+        self.unseen = 0
+        self.level = 0
+
+
+class QuotaEnforcer:
+    """테넌트별 남은 한도를 메모리에 두고 요청을 받아들일지 결정하는 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        meter: Optional[UsageMeter] = None,
+        relay: Optional[OutboxRelay] = None,
+        workers: Optional[int] = None,
+        min_slice: Optional[int] = None,
+        thresholds: Optional[Sequence[int]] = None,
+        default_plan: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """쿼터 집행기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            meter (Optional[UsageMeter]): 받아들인 양을 기록하고 미기록 증분을 읽을 계량기
+            relay (Optional[OutboxRelay]): 경계 이벤트 기록 후 깨울 아웃박스 릴레이
+            workers (Optional[int]): 남은 한도를 나눠 갖는 최대 워커 수
+            min_slice (Optional[int]): 워커가 윈도우마다 받는 최소 허용량
+            thresholds (Optional[Sequence[int]]): `billing.threshold` 이벤트를 보내는 사용률(%)
+            default_plan (Optional[str]): 요금제가 지정되지 않은 테넌트의 요금제
+            enabled (Optional[bool]): 한도 적용 여부 (끄면 계량만 함)
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.meter = meter or usage_meter
+        self.relay = relay or outbox_relay
+        self.workers = workers or settings.QUOTA_WORKERS
+        self.min_slice = min_slice or settings.QUOTA_MIN_SLICE
+        self.thresholds = sorted(thresholds or settings.QUOTA_THRESHOLDS, reverse=True)
+        self.default_plan = default_plan or settings.QUOTA_DEFAULT_PLAN
+        self.enabled = settings.QUOTA_ENABLED if enabled is None else enabled
+        self.delay = settings.QUOTA_REFRESH_DELAY_SECONDS
+        self.period = usage_period(datetime.utcnow())
+        self.refreshes = 0
+        self._plans: Dict[str, str] = {}
+        self._allowances: Dict[Tuple[str, str], Allowance] = {}
+        self._alerts: List[Tuple[Dict[str, Any], str]] = []
+        self._synced_at: Optional[datetime] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def plan(self, tenant_id: str) -> str:
+        """테넌트 요금제를 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            str: 요금제 ID
+        """
+        return self._plans.get(tenant_id, self.default_plan)
+
+    def admit(self, tenant_id: str, metric: str, amount: int = 1) -> None:
+        """남은 한도와 이 워커의 윈도우 몫을 확인하고 받아들인 양을 계량기에 기록합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            metric (str): 지표 이름
+            amount (int): 받아들일 양 (0이면 한도가 남았는지만 확인)
+
+        Raises:
+            QuotaExceeded: 과금 기간 한도를 넘는 경우
+            QuotaThrottled: 한도는 남았지만 이 윈도우의 몫을 다 쓴 경우
+        """
+        if self.enabled:
+            allowance = self._allowances.get((tenant_id, metric)) or self._allowance(tenant_id, metric)
+            if allowance.limit is not None:
+                used = self._used(tenant_id, metric, allowance)
+                if used + max(amount, 1) > allowance.limit:
+                    self._announce(tenant_id, metric, allowance, used)
+                    raise QuotaExceeded(metric, allowance.limit, self._until_next_period())
+                if self._synced_at is not None:
+                    epoch = int(time.time() // self.meter.window)
+                    if allowance.epoch != epoch:
+                        self._provision(allowance, epoch, used)
+                    if allowance.granted + amount > allowance.share:
+                        raise QuotaThrottled(metric, self._until_next_refresh(epoch))
+                    allowance.granted += amount
+                self._announce(tenant_id, metric, allowance, used + amount)
+        if amount:
+            self.meter.record(tenant_id, metric, amount)
+
+    def status(self, tenant_id: str) -> Dict[str, Tuple[Optional[int], int]]:
+        """집행 지표별 한도와 현재 사용량을 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            Dict[str, Tuple[Optional[int], int]]: 지표별 (한도, 사용량)
+        """
+        status = {}
+        for metric in QUOTA_METRICS:
+            allowance = self._allowances.get((tenant_id, metric)) or self._allowance(tenant_id, metric)
+            status[metric] = (allowance.limit, self._used(tenant_id, metric, allowance))
+        return status
+
+    def on_billing_usage(self, event: Dict[str, Any]) -> None:
+        """`billing.usage` 이벤트의 월별 누적을 반영합니다 (누적은 단조 증가하므로 중복/역순 이벤트에 안전).
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `period`, `totals`를 포함한 이벤트
+        """
+        if event.get("period") != self.period:
+            return
+        totals = event.get("totals") or {}
+        for metric in QUOTA_METRICS:
+            allowance = self._allowances.get((event["tenant_id"], metric))
+            if allowance is not None and totals.get(metric, 0) > allowance.used:
+                allowance.used = totals[metric]
+
+    async def refresh(self) -> int:
+        """바뀐 요금제와 월별 누적을 읽어 한도를 갱신하고 이번 윈도우 몫을 다시 나눕니다.
+
+        처음 읽을 때(과금 기간이 바뀐 경우 포함)는 이미 넘은 경계를 알리지 않고 기록만 합니다.
+
+        Returns:
+            int: 읽은 월별 누적 행 수
+        """
+        now = datetime.utcnow()
+        epoch = int(time.time() // self.meter.window)
+        period = usage_period(now)
+        if period != self.period:
+            self.period, self._synced_at = period, None
+            self._allowances.clear()
+        bootstrap = self._synced_at is None
+        plans = select(TenantPlan.tenant_id, TenantPlan.plan)
+        usage = select(USAGE_TABLE.c.tenant_id, *(USAGE_TABLE.c[metric] for metric in QUOTA_METRICS)).where(
+            USAGE_TABLE.c.period == period
+        )
+        if not bootstrap:
+            since = self._synced_at - SYNC_OVERLAP
+            plans = plans.where(TenantPlan.updated_at >= since)
+            usage = usage.where(USAGE_TABLE.c.updated_at >= since)
+        async with self.session_factory() as session:
+            plan_rows = (await session.execute(plans)).all()
+            usage_rows = (await session.execute(usage)).mappings().all()
+
+        for tenant_id, plan in plan_rows:
+            self._plans[tenant_id] = plan
+            limits = self._limits(tenant_id)
+            for metric in QUOTA_METRICS:
+                allowance = self._allowances.get((tenant_id, metric))
+                if allowance is not None:
+                    allowance.limit = limits.get(metric)
+        for row in usage_rows:
+            for metric in QUOTA_METRICS:
+                allowance = self._allowances.get((row["tenant_id"], metric)) or self._allowance(row["tenant_id"], metric)
+                allowance.used = max(allowance.used, row[metric])
+        for (tenant_id, metric), allowance in self._allowances.items():
+            self._reslice(tenant_id, metric, allowance, epoch, announce=not bootstrap)
+        self._synced_at = now
+        self.refreshes += 1
+        return len(usage_rows)
+
+    async def publish(self) -> int:
+        """모인 사용률 경계 이벤트를 아웃박스에 기록합니다 (실패하면 다음 주기에 다시 시도).
+
+        Returns:
+            int: 기록한 이벤트 수
+        """
+        if not self._alerts:
+            return 0
+        batch = list(self._alerts)
+        async with self.session_factory() as session:
+            await stage_events(session, Topics.BILLING_THRESHOLD, batch)
+            await session.commit()
+        del self._alerts[:len(batch)]
+        self.relay.notify()
+        return len(batch)
+
+    def _limits(self, tenant_id: str) -> Dict[str, int]:
+        """테넌트 요금제의 지표별 한도 (알 수 없는 요금제는 기본 요금제 한도)."""
+        return PLAN_LIMITS.get(self.plan(tenant_id)) or PLAN_LIMITS.get(self.default_plan, {})
+
+    def _allowance(self, tenant_id: str, metric: str) -> Allowance:
+        """테넌트 지표의 허용량 상태를 만듭니다."""
+        allowance = self._allowances[(tenant_id, metric)] = Allowance(self._limits(tenant_id).get(metric))
+        return allowance
+
+    def _used(self, tenant_id: str, metric: str, allowance: Allowance) -> int:
+        """알려진 전체 누적(읽은 값과 이 워커가 마지막으로 기록한 값 중 큰 값)에 미기록 증분을 더합니다."""
+        committed = max(allowance.used, self.meter.committed(tenant_id, metric, self.period))
+        return committed + self.meter.pending(tenant_id, metric)
+
+    def _provision(self, allowance: Allowance, epoch: int, used: int) -> None:
+        """누적을 다시 읽기 전 새 윈도우 몫을 나눕니다.
+
+        다른 워커가 마지막으로 읽은 뒤 받은 몫을 모두 썼다고 보고 남은 한도를 워커 수로 나누므로,
+        처음 보는 테넌트는 바로 남은 한도의 1/워커 수를 받습니다.
+        """
+        if allowance.epoch >= 0:
+            allowance.unseen += (self.workers - 1) * allowance.share
+        remaining = allowance.limit - used - allowance.unseen
+        allowance.epoch, allowance.granted = epoch, 0
+        allowance.share = max(self.min_slice, remaining // self.workers)
+
+    def _reslice(self, tenant_id: str, metric: str, allowance: Allowance, epoch: int, announce: bool) -> None:
+        """이번 윈도우 몫을 남은 한도의 1/워커 수로 나누고 사용률 경계를 확인합니다."""
+        if allowance.limit is None:
+            return
+        if allowance.epoch != epoch:
+            allowance.epoch, allowance.granted = epoch, 0
+        allowance.unseen = 0
+        used = self._used(tenant_id, metric, allowance)
+        # 이번 윈도우에 이미 받아들인 양은 몫에서 쓴 것으로 본다
+        remaining = allowance.limit - used + allowance.granted
+        allowance.share = max(self.min_slice, remaining // self.workers)
+        if announce:
+            self._announce(tenant_id, metric, allowance, used)
+        else:
+            allowance.level = self._level(allowance.limit, used)
+
+    def _level(self, limit: int, used: int) -> int:
+        """사용량이 넘은 가장 높은 사용률 경계(%)를 반환합니다 (없으면 0)."""
+        return next((threshold for threshold in self.thresholds if used * 100 >= threshold * limit), 0)
+
+    def _announce(self, tenant_id: str, metric: str, allowance: Allowance, used: int) -> None:
+        """새 사용률 경계를 넘었으면 `billing.threshold` 이벤트를 모으고 발행 작업을 깨웁니다."""
+        level = self._level(allowance.limit, used)
+        if level <= allowance.level:
+            # 요금제 변경으로 한도가 늘면 경계를 낮춰 다시 넘을 때 알린다
+            allowance.level = level
+            return
+        allowance.level = level
+        self._alerts.append(({
+            "event_key": f"{tenant_id}:{self.period}:{metric}:{level}",
+            "tenant_id": tenant_id,
+            "period": self.period,
+            "plan": self.plan(tenant_id),
+            "metric": metric,
+            "threshold": level,
+            "used": used,
+            "limit": allowance.limit,
+            "at": datetime.utcnow().isoformat(),
+        }, tenant_id))
+        self._wakeup.set()
+
+    def _until_next_period(self) -> int:
+        """다음 과금 기간 시작까지 남은 시간(초)."""
+        now = datetime.utcnow()
+        start = datetime(now.year + now.month // 12, now.month % 12 + 1, 1)
+        return max(1, math.ceil((start - now).total_seconds()))
+
+    def _until_next_refresh(self, epoch: int) -> int:
+        """다음 윈도우 몫을 나누는 시각까지 남은 시간(초)."""
+        return max(1, math.ceil((epoch + 1) * self.meter.window + self.delay - time.time()))
+
+    async def start(self, delay: Optional[float] = None) -> None:
+        """누적을 처음 읽고, 윈도우 경계마다 몫을 다시 나누며 경계 이벤트를 발행하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            delay (Optional[float]): 윈도우 경계 후 누적을 다시 읽기까지 기다리는 시간(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        if delay is not None:
+            self.delay = delay
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("쿼터 초기 적재 실패 (다음 윈도우에 다시 시도, 그 전까지는 한도만 확인)")
+
+        async def _loop() -> None:
+            while True:
+                window = self.meter.window
+                # 계량기가 경계에서 증분을 기록한 뒤 읽도록 경계보다 delay만큼 늦춘다
+                timeout = window - (time.time() - self.delay) % window
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    try:
+                        await self.refresh()
+                    except Exception:
+                        logger.exception("쿼터 갱신 실패")
+                self._wakeup.clear()
+                try:
+                    await self.publish()
+                except Exception:
+                    logger.exception("사용률 경계 이벤트 기록 실패 (대기 %d건)", len(self._alerts))
+
+        self._task = asyncio.create_task(_loop(), name="quota-enforcer")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 남은 경계 이벤트를 기록합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.publish()
+        except Exception:
+            logger.exception("종료 시 사용률 경계 이벤트 기록 실패 (대기 %d건)", len(self._alerts))
+
+
+# 전역 쿼터 집행기 인스턴스
+quota_enforcer = QuotaEnforcer()
+
+
+def get_quota_enforcer() -> QuotaEnforcer:
+    """쿼터 집행기 인스턴스를 반환합니다.
+
+    Returns:
+        QuotaEnforcer: 전역 쿼터 집행기
+    """
+    return quota_enforcer
@@ -0,0 +1,143 @@
+"""
+과금 도메인 라우터
+
+테넌트 사용량/쿼터 조회 REST API 엔드포인트, 요청 계량과 요청 받아들이기 전 쿼터 확인 의존성
+"""
+
+from datetime import datetime
+from typing import Annotated, Callable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import get_db_session
+from ...common.exceptions import QuotaExceeded, QuotaThrottled, business_exception_handler
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from .metering import UsageMeter, get_usage_meter, usage_period
+from .quotas import QuotaEnforcer, get_quota_enforcer
+from .schemas import QuotaStatus, QuotaUsage, UsageSummary
+
+
+def metered_request(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    meter: Annotated[UsageMeter, Depends(get_usage_meter)]
+) -> None:
+    """인증된 테넌트 API 요청 하나를 계량하는 라우터 수준 의존성입니다.
+
+    토큰 의존성은 요청 안에서 캐시되므로 엔드포인트가 같은 토큰을 다시 받아도 한 번만 계량됩니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰
+        meter (UsageMeter): 사용량 계량기
+    """
+    meter.record(token.tenant_id, "requests")
+
+
+def require_quota(metric: str, amount: int = 1) -> Callable[..., TokenPayload]:
+    """요청을 받아들이기 전에 테넌트의 남은 한도를 확인하는 의존성을 만듭니다.
+
+    받아들인 양은 바로 사용량으로 계량되므로 같은 지표를 서비스에서 다시 기록하지 않습니다.
+
+    Args:
+        metric (str): 지표 이름 (documents, queries)
+        amount (int): 요청 하나가 쓰는 양 (0이면 한도가 남았는지만 확인)
+
+    Returns:
+        Callable[..., TokenPayload]: 현재 사용자 토큰을 반환하는 의존성
+    """
+
+    def dependency(
+        token: Annotated[TokenPayload, Depends(get_current_token)],
+        quotas: Annotated[QuotaEnforcer, Depends(get_quota_enforcer)]
+    ) -> TokenPayload:
+        """쿼터 확인 의존성입니다.
+
+        Raises:
+            HTTPException: 한도를 다 썼거나 이 워커의 윈도우 몫을 다 쓴 경우 (429, Retry-After 포함)
+        """
+        try:
+            quotas.admit(token.tenant_id, metric, amount)
+        except (QuotaExceeded, QuotaThrottled) as e:
+            error = business_exception_handler(e)
+            error.headers = {"Retry-After": str(e.retry_after)}
+            raise error
+        return token
+
+    return dependency
+
+
+# 과금 라우터 생성
+router = APIRouter(prefix="/api/v1/billing", tags=["과금"])
+
+
+@router.get(
+    "/usage",
+    response_model=UsageSummary,
+    summary="사용량 조회",
+    description="현재 테넌트의 과금 기간(UTC 월) 사용량을 조회합니다. 월별 누적 행 하나와 아직 기록하지 않은 "
+    "이 워커의 증분을 더해 반환하며, 다른 워커의 증분은 다음 윈도우 경계 이후에 반영됩니다."
+)
+async def get_usage(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    meter: Annotated[UsageMeter, Depends(get_usage_meter)],
+    period: Optional[str] = None
+) -> UsageSummary:
+    """사용량 조회 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        meter (UsageMeter): 사용량 계량기
+        period (Optional[str]): 과금 기간 (YYYY-MM, 기본: 이번 달)
+
+    Returns:
+        UsageSummary: 지표별 사용량
+
+    Raises:
+        HTTPException: 과금 기간 형식이 틀린 경우 (400)
+    """
+    if period is not None:
+        try:
+            period = usage_period(datetime.strptime(period, "%Y-%m"))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="과금 기간은 YYYY-MM 형식이어야 합니다"
+            )
+    period = period or usage_period(datetime.utcnow())
+    usage = await meter.usage(session, token.tenant_id, period)
+    return UsageSummary(period=period, **usage)
+
+
+@router.get(
+    "/quota",
+    response_model=QuotaStatus,
+    summary="쿼터 조회",
+    description="현재 테넌트의 요금제와 지표별 한도, 이번 과금 기간 사용량을 조회합니다. "
+    "요청 받아들이기와 같은 메모리 상태를 읽으므로 DB를 조회하지 않습니다."
+)
+async def get_quota(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    quotas: Annotated[QuotaEnforcer, Depends(get_quota_enforcer)]
+) -> QuotaStatus:
+    """쿼터 조회 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        quotas (QuotaEnforcer): 쿼터 집행기
+
+    Returns:
+        QuotaStatus: 요금제와 지표별 한도/사용량
+    """
+    return QuotaStatus(
+        period=quotas.period,
+        plan=quotas.plan(token.tenant_id),
+        quotas={
+            metric: QuotaUsage(
+                used=used, limit=limit, remaining=None if limit is None else max(limit - used, 0)
+            )
+            for metric, (limit, used) in quotas.status(token.tenant_id).items()
+        },
+    )
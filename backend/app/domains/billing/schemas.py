@@ -0,0 +1,44 @@
+"""
+과금 도메인 스키마
+
+사용량/쿼터 조회 응답 스키마 (camelCase 응답)
+"""
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+
+class UsageSummary(CamelModel):
+    """테넌트의 과금 기간 사용량 응답 스키마입니다 (아직 기록하지 않은 이 프로세스의 증분 포함)."""
+
+    period: str = Field(description="과금 기간 (YYYY-MM)")
+    requests: int = Field(default=0, description="인증된 API 요청 수")
+    queries: int = Field(default=0, description="RAG 질의 수")
+    documents: int = Field(default=0, description="업로드 문서 수")
+    pages: int = Field(default=0, description="파싱 페이지 수")
+    tokens: int = Field(default=0, description="답변 생성 토큰 수")
+    embedding_tokens: int = Field(default=0, description="색인 임베딩 토큰 수")
+
+
+class QuotaUsage(CamelModel):
+    """지표 하나의 요금제 한도와 사용량 스키마입니다 (프론트엔드 `UsageData` 항목 형식)."""
+
+    used: int = Field(description="과금 기간 사용량")
+    limit: Optional[int] = Field(default=None, description="과금 기간 한도 (없으면 무제한)")
+    remaining: Optional[int] = Field(default=None, description="남은 한도 (없으면 무제한)")
+
+
+class QuotaStatus(CamelModel):
+    """테넌트의 요금제 한도 현황 응답 스키마입니다."""
+
+    period: str = Field(description="과금 기간 (YYYY-MM)")
+    plan: str = Field(description="요금제 ID")
+    quotas: Dict[str, QuotaUsage] = Field(description="지표별 한도와 사용량 (documents, queries)")
@@ -0,0 +1,5 @@
+"""
+문서 도메인
+
+문서 처리/검토 상태 관리 관련 모듈들
+"""
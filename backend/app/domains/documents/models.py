@@ -0,0 +1,219 @@
+"""
+문서 도메인 모델
+
+문서 처리/검토 상태와 테넌트별 대시보드 통계, 재집계 리스 SQLModel 모델 정의
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class DocumentStatus(str, Enum):
+    """문서 상태 열거형입니다 (처리 중 → 검토 대기 → 완료 흐름)."""
+    UPLOADED = "uploaded"
+    PROCESSING = "processing"
+    PAUSED = "paused"
+    FAILED = "failed"
+    PENDING_REVIEW = "pending_review"
+    IN_REVIEW = "in_review"
+    REVISION_REQUESTED = "revision_requested"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    COMPLETED = "completed"
+    ARCHIVED = "archived"
+
+
+# 승인/반려할 수 있는 상태
+REVIEWABLE_STATUSES = (DocumentStatus.PENDING_REVIEW, DocumentStatus.IN_REVIEW)
+
+# 처리 완료 화면에 집계되는 상태
+COMPLETED_STATUSES = (DocumentStatus.APPROVED, DocumentStatus.COMPLETED)
+
+# 목록 화면(큐)별 상태 (처리 중 → 검토 대기 → 처리 완료)
+DOCUMENT_QUEUES = {
+    "processing": (DocumentStatus.PROCESSING, DocumentStatus.PAUSED, DocumentStatus.FAILED),
+    "pending-review": (*REVIEWABLE_STATUSES, DocumentStatus.REVISION_REQUESTED),
+    "completed": COMPLETED_STATUSES,
+}
+
+
+class Document(SQLModel, TimestampMixin, table=True):
+    """테넌트 문서의 처리/검토 상태를 저장하는 모델입니다.
+
+    Attributes:
+        id (UUID): 문서 고유 ID
+        tenant_id (str): 테넌트 ID
+        name (str): 파일 이름
+        file_type (str): 파일 형식
+        size (int): 파일 크기(바이트)
+        uploader (Optional[str]): 업로드한 사용자
+        file_path (Optional[str]): 원본 저장소 경로
+        content_hash (Optional[str]): 원본 SHA-256 (미리보기 캐시 키)
+        status (DocumentStatus): 문서 상태
+        status_changed_at (datetime): 마지막 상태 변경 시간
+        previous_status (Optional[DocumentStatus]): 직전 상태 (통계 증분 계산용)
+        previous_status_changed_at (Optional[datetime]): 직전 상태로 바뀐 시간
+        extracted_fields (Dict[str, Any]): 추출 필드
+        validation_errors (List[Dict[str, Any]]): 검증 오류
+        reviewer (Optional[str]): 검토자
+        review_reason (Optional[str]): 반려/수정 요청 사유
+        reviewed_at (Optional[datetime]): 검토 시간
+    """
+
+    __tablename__ = "documents"
+    __table_args__ = (
+        # 목록 커서 페이지네이션: 상태별로 (상태 변경 시간, id) 순서를 인덱스에서 바로 읽음
+        Index("ix_documents_tenant_status_changed", "tenant_id", "status", "status_changed_at", "id"),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="문서 고유 ID"
+    )
+    tenant_id: str = Field(
+        index=True,
+        description="테넌트 ID (멀티테넌시)"
+    )
+    name: str = Field(
+        description="파일 이름"
+    )
+    file_type: str = Field(
+        default="",
+        description="파일 형식"
+    )
+    size: int = Field(
+        default=0,
+        description="파일 크기(바이트)"
+    )
+    uploader: Optional[str] = Field(
+        default=None,
+        description="업로드한 사용자"
+    )
+    file_path: Optional[str] = Field(
+        default=None,
+        description="원본 저장소 경로"
+    )
+    content_hash: Optional[str] = Field(
+        default=None,
+        description="원본 SHA-256"
+    )
+    status: DocumentStatus = Field(
+        default=DocumentStatus.UPLOADED,
+        description="문서 상태"
+    )
+    status_changed_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="마지막 상태 변경 시간"
+    )
+    previous_status: Optional[DocumentStatus] = Field(
+        default=None,
+        description="직전 상태"
+    )
+    previous_status_changed_at: Optional[datetime] = Field(
+        default=None,
+        description="직전 상태로 바뀐 시간"
+    )
+    extracted_fields: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="추출 필드"
+    )
+    validation_errors: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        sa_column=Column(JSON, nullable=False),
+        description="검증 오류"
+    )
+    reviewer: Optional[str] = Field(
+        default=None,
+        description="검토자"
+    )
+    review_reason: Optional[str] = Field(
+        default=None,
+        description="반려/수정 요청 사유"
+    )
+    reviewed_at: Optional[datetime] = Field(
+        default=None,
+        description="검토 시간"
+    )
+
+
+class TenantStatistics(SQLModel, table=True):
+    """테넌트별 대시보드 통계 카운터 모델입니다.
+
+    상태 전이마다 증분으로 갱신되며 대시보드 통계 API는 이 행 하나를 기본 키로 읽습니다.
+    상태별 문서 수와 크기 합계는 주기적인 재집계로 문서 테이블과 다시 맞춥니다.
+
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        uploaded ~ archived (int): 상태별 문서 수 (`DocumentStatus` 값과 같은 이름)
+        total_size (int): 전체 문서 크기 합계(바이트)
+        completed_size (int): 처리 완료 문서 크기 합계(바이트)
+        processed (int): 처리 단계를 마친 누적 문서 수
+        processing_seconds (float): 처리 단계 누적 소요 시간(초)
+        reviewed (int): 검토를 마친 누적 문서 수
+        review_seconds (float): 검토 대기 누적 시간(초)
+        approvals (int): 누적 승인 수
+        rejections (int): 누적 반려 수
+        searches (int): 누적 RAG 질의 수
+        successful_searches (int): 근거와 답변을 돌려준 질의 수
+        search_seconds (float): 질의 누적 처리 시간(초)
+        search_confidence (int): 질의 신뢰도 합계
+        reconciled_at (Optional[datetime]): 마지막 재집계 시간
+        updated_at (datetime): 마지막 갱신 시간
+    """
+
+    __tablename__ = "tenant_statistics"
+
+    tenant_id: str = Field(primary_key=True, description="테넌트 ID")
+    uploaded: int = Field(default=0, description="업로드 문서 수")
+    processing: int = Field(default=0, description="처리 중 문서 수")
+    paused: int = Field(default=0, description="일시정지 문서 수")
+    failed: int = Field(default=0, description="실패 문서 수")
+    pending_review: int = Field(default=0, description="검토 대기 문서 수")
+    in_review: int = Field(default=0, description="검토 중 문서 수")
+    revision_requested: int = Field(default=0, description="수정 요청 문서 수")
+    approved: int = Field(default=0, description="승인 문서 수")
+    rejected: int = Field(default=0, description="반려 문서 수")
+    completed: int = Field(default=0, description="완료 문서 수")
+    archived: int = Field(default=0, description="보관 문서 수")
+    total_size: int = Field(default=0, description="전체 문서 크기 합계(바이트)")
+    completed_size: int = Field(default=0, description="처리 완료 문서 크기 합계(바이트)")
+    processed: int = Field(default=0, description="처리 단계를 마친 누적 문서 수")
+    processing_seconds: float = Field(default=0.0, description="처리 단계 누적 소요 시간(초)")
+    reviewed: int = Field(default=0, description="검토를 마친 누적 문서 수")
+    review_seconds: float = Field(default=0.0, description="검토 대기 누적 시간(초)")
+    approvals: int = Field(default=0, description="누적 승인 수")
+    rejections: int = Field(default=0, description="누적 반려 수")
+    searches: int = Field(default=0, description="누적 RAG 질의 수")
+    successful_searches: int = Field(default=0, description="근거와 답변을 돌려준 질의 수")
+    search_seconds: float = Field(default=0.0, description="질의 누적 처리 시간(초)")
+    search_confidence: int = Field(default=0, description="질의 신뢰도 합계")
+    reconciled_at: Optional[datetime] = Field(default=None, description="마지막 재집계 시간")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, description="마지막 갱신 시간")
+
+
+class StatisticsLease(SQLModel, table=True):
+    """통계 재집계를 한 워커만 실행하도록 하는 리스 모델입니다.
+
+    리스를 가진 워커만 재집계하고, 만료 시간 전에 다시 잡아 연장합니다. 워커가 죽으면 만료 후
+    다른 워커가 넘겨받습니다.
+
+    Attributes:
+        name (str): 리스 이름
+        holder (str): 리스를 가진 워커 식별자
+        expires_at (datetime): 만료 시간 (UTC)
+    """
+
+    __tablename__ = "statistics_leases"
+
+    name: str = Field(primary_key=True, description="리스 이름")
+    holder: str = Field(description="리스를 가진 워커 식별자")
+    expires_at: datetime = Field(description="만료 시간 (UTC)")
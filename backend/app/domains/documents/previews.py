@@ -0,0 +1,642 @@
+"""
+문서 미리보기 (썸네일/페이지 미리보기)
+
+문서 목록 행마다 요청되는 썸네일과 근거 하이라이트용 페이지 미리보기를 처음 요청될 때 렌더링하고
+콘텐츠 주소 캐시에 저장해 다시 렌더링하지 않습니다.
+
+- 캐시 키는 (원본 SHA-256, 페이지, 너비, 렌더러)입니다. 원본이 같으면 문서 ID가 달라도 한 번만
+  렌더링하고, 원본이 바뀌면 키가 바뀌므로 따로 무효화하지 않습니다. 요청 너비는 PREVIEW_WIDTHS 중
+  하나로 맞춰 키 수를 제한합니다.
+- ETag는 캐시 키로 바로 만들기 때문에 `If-None-Match`가 맞으면 문서 행 조회 한 번으로, 렌더링이나
+  캐시 읽기 없이 304를 돌려줍니다.
+- 렌더링은 spawn 프로세스 풀에서 하며, 원본은 워커가 저장소에서 직접 읽어 큰 파일을 프로세스 간에
+  복사하지 않습니다. 같은 키를 동시에 요청하면 한 번만 렌더링합니다.
+- `documents.parsed`(OCR 완료)를 받으면 썸네일과 앞쪽 PREVIEW_PREFETCH_PAGES 페이지를 미리
+  렌더링합니다. 대기열이 차면 건너뛰고 첫 요청 때 렌더링합니다.
+
+- 디스크 캐시는 PREVIEW_CACHE_MAX_MB를 넘지 않도록, 쓴 양이 예산의 1/10을 넘을 때마다 가장
+  오래 읽히지 않은 파일부터 지웁니다 (디스크 적중 시 mtime을 갱신).
+
+렌더러는 PREVIEW_RENDERER로 고릅니다. raster는 pypdfium2와 Pillow로 PDF/이미지를 JPEG로 래스터화하며,
+패키지가 없으면 다른 백엔드처럼 시작 시 실패합니다. placeholder는 파일 형식과 페이지 번호를 표시한
+SVG 자리표시자를 만듭니다 (로컬 개발/테스트용, 명시적으로 설정해야 함).
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from html import escape
+from io import BytesIO
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ...common.exceptions import DocumentNotFound, PreviewPageNotFound
+from .models import Document
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 결과가 바뀌는 변경을 하면 올려서 기존 캐시/ETag를 버린다
+RENDER_VERSION = "1"
+
+RENDERER_RASTER = "raster"
+RENDERER_PLACEHOLDER = "placeholder"
+
+# 렌더러별 (응답 형식, 캐시 파일 확장자)
+RENDERER_FORMATS = {
+    RENDERER_RASTER: ("image/jpeg", ".jpg"),
+    RENDERER_PLACEHOLDER: ("image/svg+xml", ".svg"),
+}
+
+_PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+class PageOutOfRange(Exception):
+    """원본에 요청한 페이지가 없을 때 렌더러가 발생시키는 예외입니다."""
+
+
+def is_pdf(file_type: str, path: str) -> bool:
+    """파일 형식이나 경로로 PDF 여부를 판단합니다."""
+    return "pdf" in (file_type or "").lower() or path.lower().endswith(".pdf")
+
+
+def render_placeholder(data: bytes, file_type: str, page: int, width: int, pdf: bool) -> bytes:
+    """파일 형식과 페이지 번호를 표시한 SVG 자리표시자를 만듭니다.
+
+    PDF 페이지 수는 페이지 객체 표식을 세어 어림합니다 (압축된 객체 스트림 안의 페이지는 세지 못함).
+    """
+    pages = max(len(_PDF_PAGE_PATTERN.findall(data)), 1) if pdf else 1
+    if page > pages:
+        raise PageOutOfRange(page)
+    height = round(width * 1.414)
+    label = escape((file_type or "document").split("/")[-1].upper())
+    font = max(width // 8, 10)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}"><rect width="100%" height="100%" fill="#f3f4f6"/>'
+        f'<text x="50%" y="45%" font-size="{font}" text-anchor="middle" fill="#6b7280">{label}</text>'
+        f'<text x="50%" y="60%" font-size="{font // 2}" text-anchor="middle" fill="#9ca3af">'
+        f'{page} / {pages}</text></svg>'
+    ).encode()
+
+
+def render_raster(data: bytes, file_type: str, page: int, width: int, pdf: bool) -> bytes:
+    """PDF 페이지(pypdfium2) 또는 이미지(Pillow)를 지정 너비의 JPEG로 렌더링합니다.
+
+    Raises:
+        PageOutOfRange: 원본에 페이지가 없는 경우
+        RuntimeError: pypdfium2/Pillow 패키지가 없는 경우
+    """
+    try:
+        from PIL import Image, ImageOps
+        if pdf:
+            import pypdfium2 as pdfium
+    except ImportError as exc:
+        raise RuntimeError("래스터 미리보기에는 pypdfium2, Pillow 패키지가 필요합니다") from exc
+
+    if pdf:
+        document = pdfium.PdfDocument(data)
+        try:
+            if page > len(document):
+                raise PageOutOfRange(page)
+            pdf_page = document[page - 1]
+            image = pdf_page.render(scale=width / pdf_page.get_width()).to_pil()
+            pdf_page.close()
+        finally:
+            document.close()
+    else:
+        image = Image.open(BytesIO(data))
+        if page > getattr(image, "n_frames", 1):
+            raise PageOutOfRange(page)
+        image.seek(page - 1)
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((width, width * 4))
+    output = BytesIO()
+    image.convert("RGB").save(output, "JPEG", quality=80, optimize=True)
+    return output.getvalue()
+
+
+_RENDERERS: Dict[str, Callable[[bytes, str, int, int, bool], bytes]] = {
+    RENDERER_RASTER: render_raster,
+    RENDERER_PLACEHOLDER: render_placeholder,
+}
+
+
+def render_preview(renderer: str, path: str, file_type: str, page: int, width: int) -> bytes:
+    """워커 프로세스에서 원본을 읽어 미리보기 한 장을 렌더링합니다.
+
+    Args:
+        renderer (str): 렌더러 이름 (raster | placeholder)
+        path (str): 원본 파일 경로
+        file_type (str): 파일 형식
+        page (int): 페이지 번호 (1부터)
+        width (int): 너비(px)
+
+    Returns:
+        bytes: 렌더링 결과
+    """
+    with open(path, "rb") as original:
+        data = original.read()
+    return _RENDERERS[renderer](data, file_type, page, width, is_pdf(file_type, path))
+
+
+def hash_file(path: str) -> str:
+    """원본 파일의 SHA-256 16진 문자열을 계산합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as original:
+        for block in iter(lambda: original.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resolve_renderer(name: Optional[str] = None) -> str:
+    """설정에 따라 사용할 렌더러를 정합니다.
+
+    Args:
+        name (Optional[str]): raster | placeholder (기본: PREVIEW_RENDERER)
+
+    Returns:
+        str: 렌더러 이름
+
+    Raises:
+        RuntimeError: raster인데 pypdfium2/Pillow 패키지가 없거나 알 수 없는 렌더러인 경우
+    """
+    name = name or settings.PREVIEW_RENDERER
+    if name not in RENDERER_FORMATS:
+        raise RuntimeError(f"알 수 없는 미리보기 렌더러입니다: {name}")
+    if name == RENDERER_RASTER and not all(
+        importlib.util.find_spec(module) is not None for module in ("PIL", "pypdfium2")
+    ):
+        raise RuntimeError("래스터 미리보기에는 pypdfium2, Pillow 패키지가 필요합니다")
+    return name
+
+
+def snap_width(width: int) -> int:
+    """요청 너비를 허용 너비 중 그 이상인 가장 작은 값으로 맞춥니다 (없으면 최대 너비)."""
+    allowed = sorted(settings.PREVIEW_WIDTHS)
+    return next((candidate for candidate in allowed if candidate >= width), allowed[-1])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """`If-None-Match` 헤더가 ETag와 맞는지 확인합니다 (약한 비교, `*` 허용)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class PreviewSource:
+    """미리보기를 만들 원본 정보입니다.
+
+    Attributes:
+        document_id (str): 문서 ID
+        path (str): 원본 파일 경로
+        file_type (str): 파일 형식
+        content_hash (str): 원본 SHA-256
+    """
+
+    document_id: str
+    path: str
+    file_type: str
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class Preview:
+    """렌더링된 미리보기입니다.
+
+    Attributes:
+        content (bytes): 이미지 바이트
+        media_type (str): 응답 형식
+        etag (str): 강한 ETag
+    """
+
+    content: bytes
+    media_type: str
+    etag: str
+
+
+class PreviewCache:
+    """콘텐츠 주소 디스크 캐시와 메모리 LRU로 미리보기를 보관하는 클래스입니다."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        memory_bytes: Optional[int] = None,
+        disk_bytes: Optional[int] = None,
+    ):
+        """미리보기 캐시를 초기화합니다.
+
+        Args:
+            directory (Optional[str]): 캐시 디렉터리
+            memory_bytes (Optional[int]): 메모리 LRU 최대 크기(바이트)
+            disk_bytes (Optional[int]): 디스크 캐시 최대 크기(바이트)
+        """
+        self.directory = directory or settings.PREVIEW_CACHE_DIR
+        self.memory_bytes = settings.PREVIEW_MEMORY_CACHE_MB * 1024 * 1024 if memory_bytes is None else memory_bytes
+        self.disk_bytes = settings.PREVIEW_CACHE_MAX_MB * 1024 * 1024 if disk_bytes is None else disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._written = 0
+        self._lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+
+    def path(self, key: str, extension: str) -> str:
+        """캐시 파일 경로를 반환합니다 (키 앞 두 글자로 디렉터리를 나눔)."""
+        return os.path.join(self.directory, key[:2], key + extension)
+
+    def get(self, key: str, extension: str) -> Optional[bytes]:
+        """캐시된 미리보기를 반환합니다 (없으면 None).
+
+        Args:
+            key (str): 캐시 키
+            extension (str): 파일 확장자
+
+        Returns:
+            Optional[bytes]: 이미지 바이트
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+        path = self.path(key, extension)
+        try:
+            with open(path, "rb") as cached:
+                data = cached.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(path)
+        self._remember(key, data)
+        return data
+
+    def put(self, key: str, extension: str, data: bytes) -> None:
+        """미리보기를 디스크(원자적 교체)와 메모리에 저장합니다.
+
+        마지막 정리 뒤 쓴 양이 디스크 예산의 1/10을 넘으면 정리합니다.
+
+        Args:
+            key (str): 캐시 키
+            extension (str): 파일 확장자
+            data (bytes): 이미지 바이트
+        """
+        path = self.path(key, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as cached:
+            cached.write(data)
+        os.replace(temporary, path)
+        self._remember(key, data)
+        with self._lock:
+            self._written += len(data)
+            due = self._written * 10 > self.disk_bytes
+        if due:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """디스크 캐시가 예산을 넘으면 mtime이 오래된 파일부터 지웁니다.
+
+        다른 스레드가 정리 중이면 기다리지 않고 건너뜁니다.
+
+        Returns:
+            int: 지운 파일 수
+        """
+        if not self._sweep_lock.acquire(blocking=False):
+            return 0
+        try:
+            with self._lock:
+                self._written = 0
+            entries = []
+            total = 0
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    if name.endswith(".tmp"):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.disk_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+            self.evicted += removed
+            return removed
+        finally:
+            self._sweep_lock.release()
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        # 정리가 최근에 읽힌 파일을 남기도록 mtime을 갱신한다 (noatime 마운트에서도 동작)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_size -= len(previous)
+            self._memory[key] = data
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+
+class PreviewService:
+    """미리보기 렌더링, 캐시, OCR 완료 후 미리 렌더링을 담당하는 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        cache: Optional[PreviewCache] = None,
+        executor: Optional[Executor] = None,
+        renderer: Optional[str] = None,
+        storage_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
+        """미리보기 서비스를 초기화합니다. 프로세스 풀은 처음 렌더링할 때 만듭니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 미리 렌더링에 쓸 비동기 세션 팩토리
+            cache (Optional[PreviewCache]): 미리보기 캐시
+            executor (Optional[Executor]): 렌더링 실행기 (없으면 spawn 프로세스 풀)
+            renderer (Optional[str]): 렌더러 이름 (기본: PREVIEW_RENDERER, start()나 첫 렌더링 때 확인)
+            storage_dir (Optional[str]): 원본 저장소 디렉터리
+            workers (Optional[int]): 렌더링 프로세스 수
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.cache = cache or PreviewCache()
+        self._renderer_name = renderer
+        self._renderer: Optional[str] = None
+        self.storage_dir = os.path.abspath(storage_dir or settings.DOCUMENT_STORAGE_DIR)
+        self.workers = workers or settings.PREVIEW_WORKERS
+        self.renders = 0
+        self.prefetched = 0
+        self.prefetch_skipped = 0
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+        self._queue: Optional["asyncio.Queue[Tuple[str, str, int]]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _ensure_renderer(self) -> str:
+        """렌더러를 아직 정하지 않았으면 정해 반환합니다.
+
+        Raises:
+            RuntimeError: 렌더러를 쓸 수 없는 경우 (예: raster인데 pypdfium2/Pillow 미설치)
+        """
+        if self._renderer is None:
+            self._renderer = resolve_renderer(self._renderer_name)
+        return self._renderer
+
+    @property
+    def renderer(self) -> str:
+        """사용할 렌더러 이름"""
+        return self._ensure_renderer()
+
+    @property
+    def media_type(self) -> str:
+        """미리보기 응답 형식"""
+        return RENDERER_FORMATS[self.renderer][0]
+
+    @property
+    def extension(self) -> str:
+        """캐시 파일 확장자"""
+        return RENDERER_FORMATS[self.renderer][1]
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # 이벤트 루프/스레드를 가진 서버 프로세스를 fork하지 않는다
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._executor
+
+    def original_path(self, file_path: str) -> str:
+        """저장소 경로를 절대 경로로 바꿉니다 (저장소 밖을 가리키면 ValueError)."""
+        path = os.path.abspath(os.path.join(self.storage_dir, file_path.lstrip("/")))
+        if os.path.commonpath([path, self.storage_dir]) != self.storage_dir:
+            raise ValueError(f"저장소 밖의 경로입니다: {file_path}")
+        return path
+
+    async def resolve(self, session: AsyncSession, tenant_id: str, document_id: str) -> PreviewSource:
+        """문서 행을 기본 키로 읽어 원본 정보를 반환합니다.
+
+        원본 해시가 아직 없으면 워커에서 계산해 문서 행에 저장합니다 (문서당 한 번).
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            tenant_id (str): 테넌트 ID
+            document_id (str): 문서 ID
+
+        Returns:
+            PreviewSource: 원본 정보
+
+        Raises:
+            DocumentNotFound: 문서가 없거나 다른 테넌트 문서이거나 원본이 없는 경우
+        """
+        try:
+            doc_id = UUID(document_id)
+        except ValueError:
+            raise DocumentNotFound(document_id)
+        result = await session.execute(
+            select(Document.file_path, Document.file_type, Document.content_hash)
+            .where(Document.id == doc_id, Document.tenant_id == tenant_id)
+        )
+        row = result.first()
+        if row is None or not row.file_path:
+            raise DocumentNotFound(document_id)
+        try:
+            path = self.original_path(row.file_path)
+        except ValueError:
+            raise DocumentNotFound(document_id)
+
+        content_hash = row.content_hash
+        if content_hash is None:
+            try:
+                content_hash = await asyncio.wrap_future(self._pool().submit(hash_file, path))
+            except FileNotFoundError:
+                raise DocumentNotFound(document_id)
+            await session.execute(
+                update(Document).where(Document.id == doc_id).values(content_hash=content_hash)
+            )
+            await session.commit()
+        return PreviewSource(str(doc_id), path, row.file_type, content_hash)
+
+    def key(self, source: PreviewSource, page: int, width: int) -> str:
+        """미리보기 캐시 키를 만듭니다."""
+        return f"{source.content_hash}-p{page}-w{width}-{self.renderer}{RENDER_VERSION}"
+
+    def etag(self, source: PreviewSource, page: int, width: int) -> str:
+        """렌더링하지 않고 캐시 키로 강한 ETag를 만듭니다."""
+        return f'"{self.key(source, page, width)}"'
+
+    async def render(self, source: PreviewSource, page: int, width: int) -> Preview:
+        """미리보기를 캐시에서 읽거나 렌더링합니다 (같은 키의 동시 요청은 한 번만 렌더링).
+
+        요청이 취소돼도 진행 중인 렌더링은 끝까지 돌아 캐시에 저장됩니다.
+
+        Args:
+            source (PreviewSource): 원본 정보
+            page (int): 페이지 번호 (1부터)
+            width (int): 허용 너비 중 하나
+
+        Returns:
+            Preview: 미리보기
+
+        Raises:
+            PreviewPageNotFound: 원본에 페이지가 없는 경우
+        """
+        if page < 1:
+            raise PreviewPageNotFound(source.document_id, page)
+        key = self.key(source, page, width)
+        data = self.cache.get(key, self.extension)
+        if data is None:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._render(key, source, page, width))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            data = await asyncio.shield(task)
+        return Preview(data, self.media_type, f'"{key}"')
+
+    async def _render(self, key: str, source: PreviewSource, page: int, width: int) -> bytes:
+        try:
+            data = await asyncio.wrap_future(
+                self._pool().submit(render_preview, self.renderer, source.path, source.file_type, page, width)
+            )
+        except PageOutOfRange:
+            raise PreviewPageNotFound(source.document_id, page)
+        except FileNotFoundError:
+            raise DocumentNotFound(source.document_id)
+        await asyncio.to_thread(self.cache.put, key, self.extension, data)
+        self.renders += 1
+        return data
+
+    def on_documents_parsed(self, event: Dict[str, Any]) -> None:
+        """`documents.parsed` 이벤트를 받아 미리 렌더링을 예약합니다 (대기열이 차면 건너뜀).
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `pages`를 포함한 이벤트
+        """
+        if self._queue is None:
+            return
+        try:
+            self._queue.put_nowait((event["tenant_id"], event["doc_id"], len(event.get("pages") or ()) or 1))
+        except asyncio.QueueFull:
+            self.prefetch_skipped += 1
+
+    async def prefetch(self, tenant_id: str, document_id: str, pages: int) -> int:
+        """썸네일과 앞쪽 페이지 미리보기를 렌더링해 캐시에 넣습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            document_id (str): 문서 ID
+            pages (int): 문서 페이지 수
+
+        Returns:
+            int: 캐시에 준비된 미리보기 수
+        """
+        async with self.session_factory() as session:
+            source = await self.resolve(session, tenant_id, document_id)
+        targets = [(1, snap_width(settings.PREVIEW_THUMBNAIL_WIDTH))] + [
+            (page, snap_width(settings.PREVIEW_PAGE_WIDTH))
+            for page in range(1, min(pages, settings.PREVIEW_PREFETCH_PAGES) + 1)
+        ]
+        results = await asyncio.gather(
+            *(self.render(source, page, width) for page, width in targets), return_exceptions=True
+        )
+        ready = sum(not isinstance(result, BaseException) for result in results)
+        self.prefetched += ready
+        return ready
+
+    async def start(self) -> None:
+        """렌더러를 확인하고 미리 렌더링 대기열을 처리하는 백그라운드 작업을 시작합니다.
+
+        디스크 캐시가 이전 실행에서 예산을 넘겼으면 먼저 정리합니다.
+
+        Raises:
+            RuntimeError: 렌더러를 쓸 수 없는 경우
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._ensure_renderer()
+        await asyncio.to_thread(self.cache.sweep)
+        self._queue = asyncio.Queue(maxsize=settings.PREVIEW_PREFETCH_QUEUE)
+
+        async def _loop() -> None:
+            while True:
+                tenant_id, document_id, pages = await self._queue.get()
+                try:
+                    await self.prefetch(tenant_id, document_id, pages)
+                except DocumentNotFound:
+                    logger.debug("미리 렌더링 건너뜀 (원본 없음): tenant=%s doc=%s", tenant_id, document_id)
+                except Exception:
+                    logger.exception("미리 렌더링 실패: tenant=%s doc=%s", tenant_id, document_id)
+
+        self._task = asyncio.create_task(_loop(), name="preview-prefetch")
+
+    async def stop(self) -> None:
+        """백그라운드 작업과 프로세스 풀을 종료합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._queue = None
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+# 전역 미리보기 서비스 인스턴스
+preview_service = PreviewService()
+
+
+def get_preview_service() -> PreviewService:
+    """미리보기 서비스 인스턴스를 반환합니다.
+
+    Returns:
+        PreviewService: 전역 미리보기 서비스
+    """
+    return preview_service
@@ -0,0 +1,366 @@
+"""
+문서 도메인 라우터
+
+문서 검토, 큐별 문서 목록, 대시보드 통계, 썸네일/페이지 미리보기 REST API 엔드포인트
+"""
+
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import get_db_session
+from ...common.exceptions import BusinessException, business_exception_handler
+from ...common.outbox import OutboxRelay, get_outbox_relay
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from .models import DocumentStatus
+from .previews import PreviewService, etag_matches, get_preview_service, snap_width
+from .schemas import (
+    BatchApproveRequest,
+    BatchRejectRequest,
+    BatchReviewResult,
+    CompletedDocumentsStatistics,
+    DocumentPage,
+    ProcessingStatistics,
+    ReviewStatistics,
+)
+from .services import DocumentService
+from .statistics import StatisticsRecorder, get_statistics_recorder
+
+
+def get_document_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    relay: Annotated[OutboxRelay, Depends(get_outbox_relay)],
+    statistics: Annotated[StatisticsRecorder, Depends(get_statistics_recorder)]
+) -> DocumentService:
+    """DocumentService 의존성을 제공합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션
+        relay (OutboxRelay): 아웃박스 릴레이
+        statistics (StatisticsRecorder): 대시보드 통계 기록기
+
+    Returns:
+        DocumentService: 문서 서비스 인스턴스
+    """
+    return DocumentService(session, relay, statistics)
+
+
+# 문서 라우터 생성
+router = APIRouter(prefix="/api/v1/documents", tags=["문서"])
+
+
+@router.post(
+    "/batch-approve",
+    response_model=BatchReviewResult,
+    summary="문서 일괄 승인",
+    description="검토 대기 문서를 한 번에 승인합니다. 문서별 결과(updated, not_found, invalid_status)를 "
+    "요청 순서대로 반환합니다."
+)
+async def batch_approve(
+    request: BatchApproveRequest,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)]
+) -> BatchReviewResult:
+    """문서 일괄 승인 엔드포인트입니다.
+
+    Args:
+        request (BatchApproveRequest): 승인할 문서 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위와 검토자 결정)
+        service (DocumentService): 문서 서비스
+
+    Returns:
+        BatchReviewResult: 문서별 결과
+    """
+    return await service.batch_review(
+        token.tenant_id, token.email, request.document_ids, DocumentStatus.APPROVED
+    )
+
+
+@router.post(
+    "/batch-reject",
+    response_model=BatchReviewResult,
+    summary="문서 일괄 반려",
+    description="검토 대기 문서를 한 번에 반려합니다. 문서별 결과(updated, not_found, invalid_status)를 "
+    "요청 순서대로 반환합니다."
+)
+async def batch_reject(
+    request: BatchRejectRequest,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)]
+) -> BatchReviewResult:
+    """문서 일괄 반려 엔드포인트입니다.
+
+    Args:
+        request (BatchRejectRequest): 반려할 문서 ID와 사유
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위와 검토자 결정)
+        service (DocumentService): 문서 서비스
+
+    Returns:
+        BatchReviewResult: 문서별 결과
+    """
+    return await service.batch_review(
+        token.tenant_id, token.email, request.document_ids, DocumentStatus.REJECTED, request.reason
+    )
+
+
+async def document_page(
+    service: DocumentService, tenant_id: str, queue: str, cursor: Optional[str], limit: int
+) -> DocumentPage:
+    """페이지 크기를 허용 범위로 맞춰 큐의 문서 목록을 조회합니다."""
+    limit = max(1, min(limit, settings.DOCUMENT_LIST_MAX_PAGE_SIZE))
+    try:
+        return await service.list_documents(tenant_id, queue, cursor, limit)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.get(
+    "/processing",
+    response_model=DocumentPage,
+    summary="처리 중 문서 목록",
+    description="처리 중/일시정지/실패 문서를 오래된 순서로 조회합니다. 다음 페이지는 응답의 "
+    "nextCursor를 cursor로 넘겨 조회합니다."
+)
+async def processing_documents(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)],
+    cursor: Optional[str] = None,
+    limit: int = settings.DOCUMENT_LIST_PAGE_SIZE
+) -> DocumentPage:
+    """처리 중 문서 목록 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+        cursor (Optional[str]): 다음 페이지 커서
+        limit (int): 페이지 크기
+
+    Returns:
+        DocumentPage: 문서 목록 페이지
+
+    Raises:
+        HTTPException: 커서 형식이 틀린 경우 (400)
+    """
+    return await document_page(service, token.tenant_id, "processing", cursor, limit)
+
+
+@router.get(
+    "/pending-review",
+    response_model=DocumentPage,
+    summary="검토 대기 문서 목록",
+    description="검토 대기/검토 중/수정 요청 문서를 오래 기다린 순서로 조회합니다. 다음 페이지는 응답의 "
+    "nextCursor를 cursor로 넘겨 조회합니다."
+)
+async def pending_review_documents(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)],
+    cursor: Optional[str] = None,
+    limit: int = settings.DOCUMENT_LIST_PAGE_SIZE
+) -> DocumentPage:
+    """검토 대기 문서 목록 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+        cursor (Optional[str]): 다음 페이지 커서
+        limit (int): 페이지 크기
+
+    Returns:
+        DocumentPage: 문서 목록 페이지
+
+    Raises:
+        HTTPException: 커서 형식이 틀린 경우 (400)
+    """
+    return await document_page(service, token.tenant_id, "pending-review", cursor, limit)
+
+
+@router.get(
+    "/completed",
+    response_model=DocumentPage,
+    summary="처리 완료 문서 목록",
+    description="처리 완료(승인 포함) 문서를 최근 순서로 조회합니다. 다음 페이지는 응답의 "
+    "nextCursor를 cursor로 넘겨 조회합니다."
+)
+async def completed_documents(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)],
+    cursor: Optional[str] = None,
+    limit: int = settings.DOCUMENT_LIST_PAGE_SIZE
+) -> DocumentPage:
+    """처리 완료 문서 목록 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+        cursor (Optional[str]): 다음 페이지 커서
+        limit (int): 페이지 크기
+
+    Returns:
+        DocumentPage: 문서 목록 페이지
+
+    Raises:
+        HTTPException: 커서 형식이 틀린 경우 (400)
+    """
+    return await document_page(service, token.tenant_id, "completed", cursor, limit)
+
+
+@router.get(
+    "/processing/statistics",
+    response_model=ProcessingStatistics,
+    summary="처리 중 문서 통계",
+    description="현재 테넌트의 처리 중/일시정지/실패 문서 수와 완료율을 조회합니다."
+)
+async def processing_statistics(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)]
+) -> ProcessingStatistics:
+    """처리 중 문서 통계 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+
+    Returns:
+        ProcessingStatistics: 처리 중 문서 통계
+    """
+    return await service.processing_statistics(token.tenant_id)
+
+
+@router.get(
+    "/completed/statistics",
+    response_model=CompletedDocumentsStatistics,
+    summary="처리 완료 문서 통계",
+    description="현재 테넌트의 처리 완료 문서 수와 크기 합계, 평균 처리 시간을 조회합니다."
+)
+async def completed_statistics(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)]
+) -> CompletedDocumentsStatistics:
+    """처리 완료 문서 통계 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+
+    Returns:
+        CompletedDocumentsStatistics: 처리 완료 문서 통계
+    """
+    return await service.completed_statistics(token.tenant_id)
+
+
+@router.get(
+    "/review/statistics",
+    response_model=ReviewStatistics,
+    summary="검토 통계",
+    description="현재 테넌트의 검토 대기 문서 수와 승인/반려 비율, 평균 검토 대기 시간을 조회합니다."
+)
+async def review_statistics(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[DocumentService, Depends(get_document_service)]
+) -> ReviewStatistics:
+    """검토 통계 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (DocumentService): 문서 서비스
+
+    Returns:
+        ReviewStatistics: 검토 통계
+    """
+    return await service.review_statistics(token.tenant_id)
+
+
+async def preview_response(
+    previews: PreviewService,
+    session: AsyncSession,
+    tenant_id: str,
+    document_id: str,
+    page: int,
+    width: int,
+    http_request: Request,
+) -> Response:
+    """미리보기 응답을 만듭니다 (`If-None-Match`가 맞으면 렌더링 없이 304)."""
+    try:
+        source = await previews.resolve(session, tenant_id, document_id)
+        width = snap_width(width)
+        etag = previews.etag(source, page, width)
+        headers = {"ETag": etag, "Cache-Control": f"private, max-age={settings.PREVIEW_MAX_AGE_SECONDS}"}
+        if etag_matches(http_request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        preview = await previews.render(source, page, width)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+    return Response(preview.content, media_type=preview.media_type, headers=headers)
+
+
+@router.get(
+    "/{document_id}/thumbnail",
+    response_class=Response,
+    summary="문서 썸네일",
+    description="문서 첫 페이지 썸네일을 반환합니다. ETag와 Cache-Control을 함께 보내며 "
+    "If-None-Match가 맞으면 304를 반환합니다."
+)
+async def thumbnail(
+    document_id: str,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    previews: Annotated[PreviewService, Depends(get_preview_service)],
+    http_request: Request
+) -> Response:
+    """문서 썸네일 엔드포인트입니다.
+
+    Args:
+        document_id (str): 문서 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        previews (PreviewService): 미리보기 서비스
+        http_request (Request): HTTP 요청 (If-None-Match 헤더)
+
+    Returns:
+        Response: 썸네일 이미지 또는 304
+
+    Raises:
+        HTTPException: 문서나 원본이 없는 경우 (404)
+    """
+    return await preview_response(
+        previews, session, token.tenant_id, document_id, 1, settings.PREVIEW_THUMBNAIL_WIDTH, http_request
+    )
+
+
+@router.get(
+    "/{document_id}/pages/{page}/preview",
+    response_class=Response,
+    summary="페이지 미리보기",
+    description="문서 페이지 미리보기를 반환합니다. width는 허용 너비(PREVIEW_WIDTHS) 중 하나로 맞춥니다. "
+    "ETag와 Cache-Control을 함께 보내며 If-None-Match가 맞으면 304를 반환합니다."
+)
+async def page_preview(
+    document_id: str,
+    page: int,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    previews: Annotated[PreviewService, Depends(get_preview_service)],
+    http_request: Request,
+    width: int = settings.PREVIEW_PAGE_WIDTH
+) -> Response:
+    """페이지 미리보기 엔드포인트입니다.
+
+    Args:
+        document_id (str): 문서 ID
+        page (int): 페이지 번호 (1부터)
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        previews (PreviewService): 미리보기 서비스
+        http_request (Request): HTTP 요청 (If-None-Match 헤더)
+        width (int): 요청 너비(px)
+
+    Returns:
+        Response: 페이지 미리보기 이미지 또는 304
+
+    Raises:
+        HTTPException: 문서, 원본 또는 페이지가 없는 경우 (404)
+    """
+    return await preview_response(previews, session, token.tenant_id, document_id, page, width, http_request)
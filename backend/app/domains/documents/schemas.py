@@ -0,0 +1,103 @@
+"""
+문서 도메인 스키마
+
+문서 검토 API 요청/응답 스키마 (프론트엔드 `use-pending-review` 형식에 맞춘 camelCase)
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from ...common.config import settings
+from .models import DocumentStatus
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+
+class BatchApproveRequest(CamelModel):
+    """일괄 승인 요청 스키마입니다."""
+
+    document_ids: List[str] = Field(
+        min_length=1, max_length=settings.REVIEW_BATCH_MAX_IDS, description="승인할 문서 ID"
+    )
+
+
+class BatchRejectRequest(BatchApproveRequest):
+    """일괄 반려 요청 스키마입니다."""
+
+    reason: str = Field(min_length=1, max_length=1000, description="반려 사유")
+
+
+class BatchReviewItem(CamelModel):
+    """문서별 일괄 검토 결과 스키마입니다."""
+
+    document_id: str = Field(description="문서 ID")
+    outcome: str = Field(description="결과 (updated | not_found | invalid_status)")
+    status: Optional[DocumentStatus] = Field(default=None, description="처리 후 문서 상태 (없는 문서는 None)")
+
+
+class BatchReviewResult(CamelModel):
+    """일괄 검토 결과 스키마입니다."""
+
+    status: DocumentStatus = Field(description="바꾼 상태 (approved | rejected)")
+    requested: int = Field(description="요청 문서 수 (중복 제외)")
+    updated: int = Field(description="상태를 바꾼 문서 수")
+    reviewed_at: datetime = Field(description="검토 시간")
+    results: List[BatchReviewItem] = Field(description="요청 순서대로의 문서별 결과")
+
+
+class DocumentListItem(CamelModel):
+    """문서 목록 행 스키마입니다 (목록 화면에 필요한 컬럼만)."""
+
+    id: str = Field(description="문서 ID")
+    name: str = Field(description="파일 이름")
+    type: str = Field(description="파일 형식")
+    size: int = Field(description="파일 크기(바이트)")
+    status: DocumentStatus = Field(description="문서 상태")
+    uploader: Optional[str] = Field(default=None, description="업로드한 사용자")
+    reviewer: Optional[str] = Field(default=None, description="검토자")
+    uploaded_at: datetime = Field(description="업로드 시간")
+    status_changed_at: datetime = Field(description="현재 상태가 된 시간 (목록 정렬 기준)")
+
+
+class DocumentPage(CamelModel):
+    """커서 기반 문서 목록 페이지 스키마입니다."""
+
+    items: List[DocumentListItem] = Field(description="문서 목록")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (마지막 페이지면 None)")
+    total: int = Field(description="목록의 전체 문서 수 (대시보드 통계 기준)")
+
+
+class ProcessingStatistics(CamelModel):
+    """처리 중 문서 통계 스키마입니다 (`use-documents-in-progress`)."""
+
+    processing: int = Field(description="처리 중 문서 수")
+    paused: int = Field(description="일시정지 문서 수")
+    failed: int = Field(description="실패 문서 수")
+    completion_rate: float = Field(description="전체 문서 중 처리 완료 비율(%)")
+    average_processing_time: float = Field(description="평균 처리 시간(분)")
+    total_documents: int = Field(description="전체 문서 수")
+
+
+class CompletedDocumentsStatistics(CamelModel):
+    """처리 완료 문서 통계 스키마입니다 (`use-completed-documents`)."""
+
+    completed: int = Field(description="처리 완료(승인 포함) 문서 수")
+    average_processing_time: float = Field(description="평균 처리 시간(분)")
+    total_size: int = Field(description="처리 완료 문서 크기 합계(바이트)")
+
+
+class ReviewStatistics(CamelModel):
+    """검토 통계 스키마입니다 (`use-pending-review`)."""
+
+    pending: int = Field(description="검토 대기(검토 중 포함) 문서 수")
+    average_processing_time: float = Field(description="평균 검토 대기 시간(분)")
+    total_documents: int = Field(description="전체 문서 수")
+    approval_rate: float = Field(description="검토 완료 중 승인 비율(%)")
+    rejection_rate: float = Field(description="검토 완료 중 반려 비율(%)")
@@ -0,0 +1,485 @@
+"""
+문서 도메인 서비스
+
+문서 검토 상태 변경 (일괄 승인/반려), 파이프라인 이벤트별 처리 상태 변경, 큐별 문서 목록, 대시보드 통계 조회
+
+일괄 검토는 행마다 읽고 바꾸고 커밋하지 않고, `UPDATE ... WHERE tenant_id = ? AND id IN (...)
+AND status IN (검토 가능 상태) RETURNING id` 한 문장으로 바꿉니다. 바뀌지 않은 ID가 있을 때만
+현재 상태를 한 번 더 읽어 없는 문서와 이미 처리된 문서를 구분합니다. 이벤트는 배치 전체를 담은
+아웃박스 한 행을 같은 트랜잭션에 기록하므로, 요청 한 번의 왕복 수는 문서 수와 무관합니다.
+같은 UPDATE가 직전 상태를 `previous_status`에 남기므로, 커밋 후 상태별 통계 증분도 추가 조회 없이
+계산합니다.
+
+문서 목록은 JSON 컬럼(추출 필드, 검증 오류)을 읽지 않도록 목록 컬럼만 선택하고, OFFSET 대신
+(상태 변경 시간, id) 커서 이후 행을 읽습니다. 상태마다 `(tenant_id, status, status_changed_at, id)`
+인덱스 범위를 LIMIT만큼 읽어 UNION ALL로 합치므로 깊은 페이지도 첫 페이지와 비용이 같고,
+전체 문서 수는 `COUNT(*)` 대신 대시보드 통계 행에서 읽습니다.
+"""
+
+import base64
+import binascii
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import db_manager
+from ...common.events import Topics
+from ...common.exceptions import InvalidCursor
+from ...common.outbox import OutboxRelay, outbox_relay, stage_event
+from ..auth.services import BaseRepository
+from .models import COMPLETED_STATUSES, DOCUMENT_QUEUES, REVIEWABLE_STATUSES, Document, DocumentStatus
+from .schemas import (
+    BatchReviewItem,
+    BatchReviewResult,
+    CompletedDocumentsStatistics,
+    DocumentListItem,
+    DocumentPage,
+    ProcessingStatistics,
+    ReviewStatistics,
+)
+from .statistics import StatisticsRecorder, statistics_recorder
+
+logger = logging.getLogger(__name__)
+
+# 문서별 일괄 검토 결과
+OUTCOME_UPDATED = "updated"
+OUTCOME_NOT_FOUND = "not_found"
+OUTCOME_INVALID_STATUS = "invalid_status"
+
+# 목록 화면에 필요한 컬럼 (JSON 컬럼 제외)
+LIST_COLUMNS = (
+    Document.id,
+    Document.name,
+    Document.file_type,
+    Document.size,
+    Document.status,
+    Document.uploader,
+    Document.reviewer,
+    Document.created_at,
+    Document.status_changed_at,
+)
+
+# 오래 기다린 문서부터 보여주는 큐 (나머지는 최근 문서부터)
+OLDEST_FIRST_QUEUES = ("processing", "pending-review")
+
+
+class DocumentRepository(BaseRepository):
+    """문서 Repository 클래스입니다."""
+
+    async def transition(
+        self,
+        tenant_id: str,
+        doc_ids: Sequence[UUID],
+        from_statuses: Sequence[DocumentStatus],
+        to_status: DocumentStatus,
+        **values,
+    ) -> List[Row]:
+        """허용된 상태의 문서만 한 문장으로 새 상태로 바꿉니다 (커밋은 호출자가 수행).
+
+        SET 절의 우변은 변경 전 값을 읽으므로 직전 상태와 그 변경 시간을 같은 문장에서 보존합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            doc_ids (Sequence[UUID]): 문서 ID
+            from_statuses (Sequence[DocumentStatus]): 바꿀 수 있는 현재 상태
+            to_status (DocumentStatus): 새 상태
+            **values: 함께 바꿀 컬럼 값
+
+        Returns:
+            List[Row]: 바뀐 문서의 `id`, `previous_status`, `previous_status_changed_at`, `size`
+        """
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(Document)
+            .where(
+                Document.tenant_id == tenant_id,
+                Document.id.in_(doc_ids),
+                Document.status.in_(from_statuses),
+            )
+            .values(
+                previous_status=Document.status,
+                previous_status_changed_at=Document.status_changed_at,
+                status=to_status,
+                status_changed_at=now,
+                updated_at=now,
+                **values,
+            )
+            .returning(Document.id, Document.previous_status, Document.previous_status_changed_at, Document.size)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.all())
+
+    async def get_statuses(self, tenant_id: str, doc_ids: Sequence[UUID]) -> Dict[UUID, DocumentStatus]:
+        """문서 ID별 현재 상태를 조회합니다 (다른 테넌트 문서는 제외).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            doc_ids (Sequence[UUID]): 문서 ID
+
+        Returns:
+            Dict[UUID, DocumentStatus]: 존재하는 문서의 현재 상태
+        """
+        result = await self.session.execute(
+            select(Document.id, Document.status).where(Document.tenant_id == tenant_id, Document.id.in_(doc_ids))
+        )
+        return {row.id: row.status for row in result}
+
+    async def list_page(
+        self,
+        tenant_id: str,
+        statuses: Sequence[DocumentStatus],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        oldest_first: bool = True,
+    ) -> List[Row]:
+        """상태별 문서 목록 한 페이지를 목록 컬럼만 읽어 (상태 변경 시간, id) 순서로 조회합니다.
+
+        상태마다 인덱스 범위를 `limit`행까지만 읽고 합친 뒤 다시 정렬하므로 읽는 행 수는
+        페이지 위치와 관계없이 최대 `limit * len(statuses)`입니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            statuses (Sequence[DocumentStatus]): 목록에 포함할 상태
+            after (Optional[Tuple[datetime, UUID]]): 이전 페이지 마지막 행의 (상태 변경 시간, id)
+            limit (int): 읽을 행 수
+            oldest_first (bool): 오래된 순서로 정렬할지 여부
+
+        Returns:
+            List[Row]: `LIST_COLUMNS` 행
+        """
+        def ordered(columns):
+            return [column if oldest_first else column.desc() for column in columns]
+
+        parts = []
+        for status in statuses:
+            query = select(*LIST_COLUMNS).where(Document.tenant_id == tenant_id, Document.status == status)
+            if after is not None:
+                key = tuple_(Document.status_changed_at, Document.id)
+                query = query.where(key > tuple_(*after) if oldest_first else key < tuple_(*after))
+            parts.append(query.order_by(*ordered((Document.status_changed_at, Document.id))).limit(limit))
+
+        if len(parts) == 1:
+            query = parts[0]
+        else:
+            merged = union_all(*(select(part.subquery()) for part in parts)).subquery()
+            query = select(merged).order_by(*ordered((merged.c.status_changed_at, merged.c.id))).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+
+def parse_ids(document_ids: Sequence[str]) -> Dict[str, Optional[UUID]]:
+    """요청 문서 ID를 중복 없이 순서대로 UUID로 바꿉니다 (형식이 틀린 ID는 None)."""
+    parsed: Dict[str, Optional[UUID]] = {}
+    for raw in document_ids:
+        if raw in parsed:
+            continue
+        try:
+            parsed[raw] = UUID(raw)
+        except ValueError:
+            parsed[raw] = None
+    return parsed
+
+
+def encode_cursor(changed_at: datetime, doc_id: UUID) -> str:
+    """목록 행의 정렬 키를 불투명한 커서 문자열로 만듭니다."""
+    raw = f"{changed_at.isoformat()}|{doc_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """커서 문자열을 (상태 변경 시간, id)로 되돌립니다.
+
+    Raises:
+        InvalidCursor: 커서 형식이 틀린 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        changed_at, doc_id = raw.split("|")
+        return datetime.fromisoformat(changed_at), UUID(doc_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+
+
+def percent(part: float, whole: float) -> float:
+    """비율(%)을 소수 첫째 자리까지 계산합니다 (분모가 0이면 0)."""
+    return round(part * 100 / whole, 1) if whole else 0.0
+
+
+def average_minutes(seconds: float, count: float) -> float:
+    """누적 시간(초)의 건당 평균을 분 단위로 계산합니다 (건수가 0이면 0)."""
+    return round(seconds / count / 60, 1) if count else 0.0
+
+
+def completed_count(counters: Dict[str, Any]) -> int:
+    """처리 완료 화면에 집계되는 문서 수를 계산합니다."""
+    return sum(counters[status.value] for status in COMPLETED_STATUSES)
+
+
+class DocumentService:
+    """문서 상태 관리 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        relay: Optional[OutboxRelay] = None,
+        statistics: Optional[StatisticsRecorder] = None,
+    ):
+        """DocumentService를 초기화합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            relay (Optional[OutboxRelay]): 아웃박스 릴레이 (커밋 후 발행 알림)
+            statistics (Optional[StatisticsRecorder]): 대시보드 통계 기록기
+        """
+        self.session = session
+        self.document_repo = DocumentRepository(session)
+        self.relay = relay or outbox_relay
+        self.statistics = statistics or statistics_recorder
+
+    async def batch_review(
+        self,
+        tenant_id: str,
+        reviewer: str,
+        document_ids: Sequence[str],
+        status: DocumentStatus,
+        reason: Optional[str] = None,
+    ) -> BatchReviewResult:
+        """검토 대기 문서를 한 번에 승인/반려하고 `documents.reviewed` 이벤트 한 건을 기록합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            reviewer (str): 검토자
+            document_ids (Sequence[str]): 문서 ID
+            status (DocumentStatus): 새 상태 (approved | rejected)
+            reason (Optional[str]): 반려 사유
+
+        Returns:
+            BatchReviewResult: 요청 순서대로의 문서별 결과
+        """
+        parsed = parse_ids(document_ids)
+        valid = [doc_id for doc_id in parsed.values() if doc_id is not None]
+        reviewed_at = datetime.utcnow()
+        transitions = await self.document_repo.transition(
+            tenant_id, valid, REVIEWABLE_STATUSES, status,
+            reviewer=reviewer, review_reason=reason, reviewed_at=reviewed_at,
+        ) if valid else []
+        updated = {row.id for row in transitions}
+        leftover = [doc_id for doc_id in valid if doc_id not in updated]
+        current = await self.document_repo.get_statuses(tenant_id, leftover) if leftover else {}
+
+        if updated:
+            await stage_event(
+                self.session,
+                Topics.DOCUMENTS_REVIEWED,
+                {
+                    "tenant_id": tenant_id,
+                    "doc_ids": [str(doc_id) for doc_id in valid if doc_id in updated],
+                    "status": status.value,
+                    "reviewer": reviewer,
+                    "reason": reason,
+                    "reviewed_at": reviewed_at.isoformat(),
+                },
+                key=tenant_id,
+            )
+        await self.session.commit()
+        if updated:
+            self.relay.notify()
+            self.statistics.record_transitions(tenant_id, transitions, status, reviewed_at)
+
+        results = []
+        for raw, doc_id in parsed.items():
+            if doc_id in updated:
+                results.append(BatchReviewItem(document_id=raw, outcome=OUTCOME_UPDATED, status=status))
+            elif doc_id in current:
+                results.append(
+                    BatchReviewItem(document_id=raw, outcome=OUTCOME_INVALID_STATUS, status=current[doc_id])
+                )
+            else:
+                results.append(BatchReviewItem(document_id=raw, outcome=OUTCOME_NOT_FOUND))
+        logger.info("일괄 검토: tenant=%s status=%s requested=%d updated=%d",
+                    tenant_id, status.value, len(parsed), len(updated))
+        return BatchReviewResult(
+            status=status,
+            requested=len(parsed),
+            updated=len(updated),
+            reviewed_at=reviewed_at,
+            results=results,
+        )
+
+    async def list_documents(
+        self, tenant_id: str, queue: str, cursor: Optional[str], limit: int
+    ) -> DocumentPage:
+        """큐(처리 중, 검토 대기, 처리 완료)의 문서 목록 한 페이지를 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            queue (str): `DOCUMENT_QUEUES` 키
+            cursor (Optional[str]): 이전 페이지의 `next_cursor` (None이면 첫 페이지)
+            limit (int): 페이지 크기
+
+        Returns:
+            DocumentPage: 문서 목록과 다음 페이지 커서, 전체 문서 수
+
+        Raises:
+            InvalidCursor: 커서 형식이 틀린 경우
+        """
+        statuses = DOCUMENT_QUEUES[queue]
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self.document_repo.list_page(
+            tenant_id, statuses, after, limit + 1, oldest_first=queue in OLDEST_FIRST_QUEUES
+        )
+        counters = await self.statistics.snapshot(self.session, tenant_id)
+
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(page[-1].status_changed_at, page[-1].id)
+        return DocumentPage(
+            items=[
+                DocumentListItem(
+                    id=str(row.id),
+                    name=row.name,
+                    type=row.file_type,
+                    size=row.size,
+                    status=row.status,
+                    uploader=row.uploader,
+                    reviewer=row.reviewer,
+                    uploaded_at=row.created_at,
+                    status_changed_at=row.status_changed_at,
+                )
+                for row in page
+            ],
+            next_cursor=next_cursor,
+            total=max(0, sum(counters[status.value] for status in statuses)),
+        )
+
+    async def processing_statistics(self, tenant_id: str) -> ProcessingStatistics:
+        """처리 중 문서 통계를 조회합니다 (통계 행 기본 키 조회 한 번).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            ProcessingStatistics: 처리 중 문서 통계
+        """
+        counters = await self.statistics.snapshot(self.session, tenant_id)
+        total = sum(counters[status.value] for status in DocumentStatus)
+        return ProcessingStatistics(
+            processing=counters[DocumentStatus.PROCESSING.value],
+            paused=counters[DocumentStatus.PAUSED.value],
+            failed=counters[DocumentStatus.FAILED.value],
+            completion_rate=percent(completed_count(counters), total),
+            average_processing_time=average_minutes(counters["processing_seconds"], counters["processed"]),
+            total_documents=total,
+        )
+
+    async def completed_statistics(self, tenant_id: str) -> CompletedDocumentsStatistics:
+        """처리 완료 문서 통계를 조회합니다 (통계 행 기본 키 조회 한 번).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            CompletedDocumentsStatistics: 처리 완료 문서 통계
+        """
+        counters = await self.statistics.snapshot(self.session, tenant_id)
+        return CompletedDocumentsStatistics(
+            completed=completed_count(counters),
+            average_processing_time=average_minutes(counters["processing_seconds"], counters["processed"]),
+            total_size=counters["completed_size"],
+        )
+
+    async def review_statistics(self, tenant_id: str) -> ReviewStatistics:
+        """검토 통계를 조회합니다 (통계 행 기본 키 조회 한 번).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            ReviewStatistics: 검토 통계
+        """
+        counters = await self.statistics.snapshot(self.session, tenant_id)
+        decided = counters["approvals"] + counters["rejections"]
+        return ReviewStatistics(
+            pending=sum(counters[status.value] for status in REVIEWABLE_STATUSES),
+            average_processing_time=average_minutes(counters["review_seconds"], counters["reviewed"]),
+            total_documents=sum(counters[status.value] for status in DocumentStatus),
+            approval_rate=percent(counters["approvals"], decided),
+            rejection_rate=percent(counters["rejections"], decided),
+        )
+
+
+class PipelineStatusHandler:
+    """파이프라인 이벤트로 문서 처리 상태를 바꾸고 대시보드 통계 증분을 기록하는 클래스입니다.
+
+    - `documents.uploaded`: 업로드/일시정지/실패 상태 문서를 처리 중으로 (완료된 문서의 재처리는 상태 유지)
+    - `documents.validated`: 업로드/처리 중 문서를 검토 대기로 (검증 실패는 실패로)
+    """
+
+    # `documents.validated` 이벤트의 검증 결과(`status`)별 새 상태
+    VALIDATED_STATUSES = {
+        "validated": DocumentStatus.PENDING_REVIEW,
+        "review": DocumentStatus.PENDING_REVIEW,
+        "failed": DocumentStatus.FAILED,
+    }
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        statistics: Optional[StatisticsRecorder] = None,
+    ):
+        """파이프라인 상태 처리기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            statistics (Optional[StatisticsRecorder]): 대시보드 통계 기록기
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.statistics = statistics or statistics_recorder
+
+    async def on_documents_uploaded(self, event: Dict[str, Any]) -> None:
+        """`documents.uploaded` 이벤트의 문서를 처리 중 상태로 바꿉니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`를 포함한 이벤트
+        """
+        await self._transition(
+            event,
+            (DocumentStatus.UPLOADED, DocumentStatus.PAUSED, DocumentStatus.FAILED),
+            DocumentStatus.PROCESSING,
+        )
+
+    async def on_documents_validated(self, event: Dict[str, Any]) -> None:
+        """`documents.validated` 이벤트의 문서를 검증 결과에 따라 검토 대기/실패 상태로 바꿉니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `status`를 포함한 이벤트
+        """
+        status = self.VALIDATED_STATUSES.get(event.get("status"))
+        if status is not None:
+            await self._transition(event, (DocumentStatus.UPLOADED, DocumentStatus.PROCESSING), status)
+
+    async def _transition(
+        self, event: Dict[str, Any], from_statuses: Sequence[DocumentStatus], status: DocumentStatus
+    ) -> int:
+        """문서 하나의 상태를 바꾸고 커밋 후 통계 증분을 기록합니다 (없는 문서나 다른 상태면 그대로)."""
+        doc_id = parse_ids([str(event.get("doc_id"))]).popitem()[1]
+        if doc_id is None:
+            return 0
+        changed_at = datetime.utcnow()
+        async with self.session_factory() as session:
+            transitions = await DocumentRepository(session).transition(
+                event["tenant_id"], [doc_id], from_statuses, status
+            )
+            await session.commit()
+        if transitions:
+            self.statistics.record_transitions(event["tenant_id"], transitions, status, changed_at)
+        return len(transitions)
+
+
+# 전역 파이프라인 상태 처리기 인스턴스
+pipeline_status_handler = PipelineStatusHandler()
@@ -0,0 +1,439 @@
+"""
+문서 도메인 대시보드 통계
+
+테넌트별 통계 카운터(`tenant_statistics`)를 상태 전이 증분으로 유지합니다.
+
+- 상태 전이와 RAG 질의는 커밋 후 `StatisticsRecorder`에 증분만 더하고, 백그라운드 작업이
+  STATS_FLUSH_INTERVAL_SECONDS마다 바뀐 테넌트당 `UPDATE ... SET c = c + :delta` 한 문장으로 씁니다.
+  초당 전이가 수천 건이어도 쓰기 수는 바뀐 테넌트 수만큼입니다.
+- 대시보드 통계 API는 `COUNT(*) ... GROUP BY status` 대신 기본 키로 한 행을 읽고, 아직 쓰지 않은
+  이 프로세스의 증분을 더해 돌려줍니다.
+- 커밋 후 기록 전에 프로세스가 죽거나 다른 경로로 문서가 바뀌면 카운터가 어긋나므로, 재집계 작업이
+  STATS_RECONCILE_INTERVAL_SECONDS마다 상태별 문서 수와 크기 합계를 문서 테이블 기준으로 다시
+  맞춥니다. 처리 시간, 승인 수, 질의 수 같은 누적 카운터는 재집계 대상이 아닙니다. 재집계는
+  테넌트를 STATS_RECONCILE_BATCH_TENANTS개씩 나눠, 배치마다 그 테넌트들의 행만 잠그고 집계합니다.
+- 재집계 대상 컬럼의 증분은 기록 시간과 함께 보관하고, 재집계는 집계를 읽기 직전 시간을
+  `reconciled_at`에 남깁니다. 증분은 커밋 후 기록되므로 그보다 먼저 기록된 증분(이 워커와 다른
+  워커가 아직 쓰지 않은 것 포함)은 이미 집계에 들어 있어, 기록·조회할 때 버립니다.
+- 재집계는 리스(`statistics_leases`)를 가진 워커 하나만 실행합니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Mapping, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import db_manager
+from .models import (
+    COMPLETED_STATUSES,
+    REVIEWABLE_STATUSES,
+    Document,
+    DocumentStatus,
+    StatisticsLease,
+    TenantStatistics,
+)
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_TABLE = TenantStatistics.__table__
+
+# 증분으로 유지하는 카운터 컬럼
+COUNTER_COLUMNS = tuple(
+    column.name for column in STATISTICS_TABLE.columns
+    if column.name not in ("tenant_id", "reconciled_at", "updated_at")
+)
+
+# 재집계로 문서 테이블과 다시 맞추는 컬럼
+RECONCILED_COLUMNS = (*(status.value for status in DocumentStatus), "total_size", "completed_size")
+_RECONCILED_SET = frozenset(RECONCILED_COLUMNS)
+
+# 재집계 리스 이름
+RECONCILE_LEASE = "statistics-reconcile"
+
+# 재집계 대상 컬럼 증분 (기록 시간, 컬럼별 증분)
+Stamped = List[Tuple[datetime, Counter]]
+
+
+def stamped_deltas(entries: Iterable[Tuple[datetime, Counter]], reconciled_at: Optional[datetime]) -> Counter:
+    """재집계 이후에 기록된 증분만 더합니다 (재집계 전 증분은 이미 집계에 포함).
+
+    Args:
+        entries (Iterable[Tuple[datetime, Counter]]): 기록 시간별 증분
+        reconciled_at (Optional[datetime]): 테넌트 통계 행의 마지막 재집계 시간
+
+    Returns:
+        Counter: 컬럼별 증분 합계
+    """
+    total: Counter = Counter()
+    for recorded_at, deltas in entries:
+        if reconciled_at is None or recorded_at >= reconciled_at:
+            total.update(deltas)
+    return total
+
+
+class StatisticsRecorder:
+    """테넌트별 통계 증분을 모아 주기적으로 쓰고, 문서 테이블과 재집계하는 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        worker_id: Optional[str] = None,
+        reconcile_batch: Optional[int] = None,
+    ):
+        """통계 기록기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            worker_id (Optional[str]): 재집계 리스에 남길 워커 식별자 (기본: 호스트-PID-난수)
+            reconcile_batch (Optional[int]): 재집계 트랜잭션 하나에서 잠그고 집계할 테넌트 수
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+        self.reconcile_batch = reconcile_batch or settings.STATS_RECONCILE_BATCH_TENANTS
+        self.flushes = 0
+        self._pending: DefaultDict[str, Counter] = defaultdict(Counter)
+        self._stamped: DefaultDict[str, Stamped] = defaultdict(list)
+        self._flushing: Tuple[Mapping[str, Counter], Mapping[str, Stamped]] = ({}, {})
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def record(self, tenant_id: str, deltas: Mapping[str, float]) -> None:
+        """테넌트 카운터 증분을 더합니다 (다음 주기에 기록, 재집계 대상 컬럼은 기록 시간과 함께 보관).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            deltas (Mapping[str, float]): 컬럼별 증분
+        """
+        pending = self._pending[tenant_id]
+        stamped: Counter = Counter()
+        for column, delta in deltas.items():
+            if delta:
+                if column in _RECONCILED_SET:
+                    stamped[column] += delta
+                else:
+                    pending[column] += delta
+        if stamped:
+            self._stamped[tenant_id].append((datetime.utcnow(), stamped))
+
+    def record_transitions(
+        self, tenant_id: str, transitions: Iterable[Any], status: DocumentStatus, changed_at: datetime
+    ) -> None:
+        """문서 상태 전이 결과를 카운터 증분으로 기록합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            transitions (Iterable[Any]): `previous_status`, `previous_status_changed_at`, `size`
+                속성을 가진 전이 결과 행 (`DocumentRepository.transition` 반환값)
+            status (DocumentStatus): 새 상태
+            changed_at (datetime): 전이 시간
+        """
+        deltas: Counter = Counter()
+        completed = status in COMPLETED_STATUSES
+        for row in transitions:
+            previous = row.previous_status
+            deltas[status.value] += 1
+            if previous is not None:
+                deltas[previous.value] -= 1
+            if completed != (previous in COMPLETED_STATUSES):
+                deltas["completed_size"] += row.size if completed else -row.size
+            if row.previous_status_changed_at is None:
+                continue
+            elapsed = (changed_at - row.previous_status_changed_at).total_seconds()
+            if previous == DocumentStatus.PROCESSING:
+                deltas["processed"] += 1
+                deltas["processing_seconds"] += elapsed
+            elif previous in REVIEWABLE_STATUSES and status in (DocumentStatus.APPROVED, DocumentStatus.REJECTED):
+                deltas["reviewed"] += 1
+                deltas["review_seconds"] += elapsed
+                deltas["approvals" if status == DocumentStatus.APPROVED else "rejections"] += 1
+        self.record(tenant_id, deltas)
+
+    def record_search(self, tenant_id: str, seconds: float, confidence: int, success: bool) -> None:
+        """RAG 질의 한 건을 기록합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            seconds (float): 처리 시간(초)
+            confidence (int): 답변 신뢰도 (0~100)
+            success (bool): 근거와 답변을 돌려줬는지 여부
+        """
+        self.record(tenant_id, {
+            "searches": 1,
+            "successful_searches": int(success),
+            "search_seconds": seconds,
+            "search_confidence": confidence,
+        })
+
+    async def snapshot(self, session: AsyncSession, tenant_id: str) -> Dict[str, float]:
+        """테넌트 카운터를 기본 키로 읽고 아직 기록하지 않은 증분(재집계 이후 것만)을 더해 반환합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            Dict[str, float]: 컬럼별 카운터 값 (행이 없으면 0)
+        """
+        result = await session.execute(
+            select(STATISTICS_TABLE).where(STATISTICS_TABLE.c.tenant_id == tenant_id)
+        )
+        row = result.mappings().first()
+        counters = {column: (row[column] if row is not None else 0) for column in COUNTER_COLUMNS}
+        reconciled_at = row["reconciled_at"] if row is not None else None
+        (flushing, flushing_stamped), deltas = self._flushing, Counter()
+        for pending in (flushing.get(tenant_id), self._pending.get(tenant_id)):
+            deltas.update(pending or {})
+        entries = [*flushing_stamped.get(tenant_id, ()), *self._stamped.get(tenant_id, ())]
+        deltas.update(stamped_deltas(entries, reconciled_at))
+        for column, delta in deltas.items():
+            counters[column] += delta
+        return counters
+
+    async def flush(self) -> int:
+        """모인 증분을 테넌트당 한 문장으로 기록합니다 (실패하면 다음 주기에 다시 시도).
+
+        Returns:
+            int: 기록한 테넌트 수
+        """
+        async with self._lock:
+            if not self._pending and not self._stamped:
+                return 0
+            batch, self._pending = self._pending, defaultdict(Counter)
+            stamped, self._stamped = self._stamped, defaultdict(list)
+            self._flushing = (batch, stamped)
+            try:
+                written = await self._write(batch, stamped)
+            except Exception:
+                for tenant_id, deltas in batch.items():
+                    self._pending[tenant_id].update(deltas)
+                for tenant_id, entries in stamped.items():
+                    self._stamped[tenant_id][:0] = entries
+                raise
+            finally:
+                self._flushing = ({}, {})
+        self.flushes += 1
+        return written
+
+    async def _write(self, batch: Mapping[str, Counter], stamped: Mapping[str, Stamped]) -> int:
+        """증분을 한 트랜잭션으로 씁니다 (행이 없는 테넌트는 증분을 초기값으로 INSERT).
+
+        테넌트 행을 잠그고 `reconciled_at`을 읽어, 재집계 전에 기록된 재집계 대상 증분은 버립니다.
+        """
+        now = datetime.utcnow()
+        tenants = batch.keys() | stamped.keys()
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(STATISTICS_TABLE.c.tenant_id, STATISTICS_TABLE.c.reconciled_at)
+                .where(STATISTICS_TABLE.c.tenant_id.in_(list(tenants)))
+                .with_for_update()
+            )
+            existing = dict(result.all())
+            merged: Dict[str, Counter] = {}
+            for tenant_id in tenants:
+                deltas = Counter(batch.get(tenant_id) or {})
+                deltas.update(stamped_deltas(stamped.get(tenant_id, ()), existing.get(tenant_id)))
+                merged[tenant_id] = deltas
+            missing = [
+                {"tenant_id": tenant_id, **{column: deltas.get(column, 0) for column in COUNTER_COLUMNS},
+                 "updated_at": now}
+                for tenant_id, deltas in merged.items() if tenant_id not in existing
+            ]
+            if missing:
+                await session.execute(insert(STATISTICS_TABLE), missing)
+            for tenant_id in existing:
+                deltas = {column: delta for column, delta in merged[tenant_id].items() if delta}
+                if not deltas:
+                    continue
+                await session.execute(
+                    update(STATISTICS_TABLE)
+                    .where(STATISTICS_TABLE.c.tenant_id == tenant_id)
+                    .values({
+                        **{column: STATISTICS_TABLE.c[column] + delta for column, delta in deltas.items()},
+                        "updated_at": now,
+                    })
+                )
+            await session.commit()
+        return len(tenants)
+
+    async def acquire_lease(self, ttl: float) -> bool:
+        """재집계 리스를 잡거나 연장합니다.
+
+        Args:
+            ttl (float): 리스 유효 시간(초)
+
+        Returns:
+            bool: 이 워커가 리스를 가졌는지 여부
+        """
+        now = datetime.utcnow()
+        values = {"holder": self.worker_id, "expires_at": now + timedelta(seconds=ttl)}
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(StatisticsLease)
+                .where(
+                    StatisticsLease.name == RECONCILE_LEASE,
+                    or_(StatisticsLease.holder == self.worker_id, StatisticsLease.expires_at < now),
+                )
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                try:
+                    await session.execute(insert(StatisticsLease).values(name=RECONCILE_LEASE, **values))
+                except IntegrityError:
+                    # 다른 워커가 유효한 리스를 가지고 있음
+                    await session.rollback()
+                    return False
+            await session.commit()
+        return True
+
+    async def reconcile(self, tenant_id: Optional[str] = None) -> int:
+        """상태별 문서 수와 크기 합계를 문서 테이블 기준으로 다시 맞춥니다.
+
+        모인 증분을 먼저 기록한 뒤, 대상 테넌트를 잠그지 않고 모아 STATS_RECONCILE_BATCH_TENANTS개씩
+        나눠 재집계합니다. 배치마다 그 테넌트들의 통계 행만 잠그고 그 테넌트들의 문서만 집계하므로,
+        잠금은 배치 하나의 집계 동안만 유지되고 다른 테넌트의 증분 기록을 막지 않습니다.
+
+        Args:
+            tenant_id (Optional[str]): 재집계할 테넌트 (None이면 전체)
+
+        Returns:
+            int: 카운터가 어긋나 있던 테넌트 수
+        """
+        await self.flush()
+        if tenant_id is not None:
+            tenants = [tenant_id]
+        else:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(Document.tenant_id).distinct().union(select(STATISTICS_TABLE.c.tenant_id))
+                )
+                tenants = sorted(result.scalars().all())
+        drifted = 0
+        for start in range(0, len(tenants), self.reconcile_batch):
+            drifted += await self._reconcile_batch(tenants[start:start + self.reconcile_batch])
+        if drifted:
+            logger.warning("통계 재집계: 어긋난 테넌트 %d개 보정", drifted)
+        return drifted
+
+    async def _reconcile_batch(self, tenants: List[str]) -> int:
+        """테넌트 한 배치의 통계 행을 잠그고 문서 테이블 집계로 다시 맞춥니다.
+
+        행을 잠근 뒤 집계를 읽기 직전 시간을 `reconciled_at`으로 남깁니다. 그 전에 기록된 증분(이
+        워커나 다른 워커가 아직 쓰지 않은 것)은 집계에 이미 들어 있으므로 다음 기록과 조회에서 버려지고,
+        이후에 기록된 증분만 더해집니다. 커밋과 증분 기록 사이에 집계가 시작된 전이는 두 번 셀 수 있으며
+        다음 재집계에서 바로잡힙니다.
+        """
+        async with self._lock, self.session_factory() as session:
+            # 행을 잠근 뒤 집계를 읽으므로, 그 사이 다른 워커의 기록은 재집계 커밋 후 reconciled_at을 본다
+            stored_rows = select(STATISTICS_TABLE).where(STATISTICS_TABLE.c.tenant_id.in_(tenants)).with_for_update()
+            stored = {row["tenant_id"]: row for row in (await session.execute(stored_rows)).mappings()}
+            now = datetime.utcnow()
+            counts = (
+                select(
+                    Document.tenant_id,
+                    Document.status,
+                    func.count(),
+                    func.coalesce(func.sum(Document.size), 0),
+                )
+                .where(Document.tenant_id.in_(tenants))
+                .group_by(Document.tenant_id, Document.status)
+            )
+            actual: DefaultDict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(RECONCILED_COLUMNS, 0))
+            for tenant, status, count, size in (await session.execute(counts)).all():
+                values = actual[tenant]
+                values[status.value] = count
+                values["total_size"] += size
+                if status in COMPLETED_STATUSES:
+                    values["completed_size"] += size
+
+            drifted = 0
+            for tenant in stored.keys() | actual.keys():
+                values = actual.get(tenant) or dict.fromkeys(RECONCILED_COLUMNS, 0)
+                row = stored.get(tenant)
+                if row is None:
+                    await session.execute(insert(STATISTICS_TABLE).values({
+                        **dict.fromkeys(COUNTER_COLUMNS, 0), **values,
+                        "tenant_id": tenant, "reconciled_at": now, "updated_at": now,
+                    }))
+                else:
+                    await session.execute(
+                        update(STATISTICS_TABLE)
+                        .where(STATISTICS_TABLE.c.tenant_id == tenant)
+                        .values(**values, reconciled_at=now)
+                    )
+                if row is None or any(row[column] != value for column, value in values.items()):
+                    drifted += 1
+            await session.commit()
+        return drifted
+
+    async def start(
+        self, flush_interval: Optional[float] = None, reconcile_interval: Optional[float] = None
+    ) -> None:
+        """증분 기록과 재집계를 주기적으로 실행하는 백그라운드 작업을 시작합니다.
+
+        시작 직후 한 번 재집계해 이전 프로세스가 기록하지 못한 증분을 보정합니다. 재집계는 리스를
+        가진 워커만 실행하며, 리스는 재집계 주기의 두 배 동안 유효합니다.
+
+        Args:
+            flush_interval (Optional[float]): 증분 기록 주기(초)
+            reconcile_interval (Optional[float]): 재집계 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        flush_interval = flush_interval or settings.STATS_FLUSH_INTERVAL_SECONDS
+        reconcile_interval = reconcile_interval or settings.STATS_RECONCILE_INTERVAL_SECONDS
+        loop = asyncio.get_running_loop()
+
+        async def _loop() -> None:
+            next_reconcile = loop.time()
+            while True:
+                try:
+                    if loop.time() >= next_reconcile:
+                        next_reconcile = loop.time() + reconcile_interval
+                        if await self.acquire_lease(reconcile_interval * 2):
+                            await self.reconcile()
+                        else:
+                            await self.flush()
+                    else:
+                        await self.flush()
+                except Exception:
+                    logger.exception("통계 기록 실패")
+                await asyncio.sleep(flush_interval)
+
+        self._task = asyncio.create_task(_loop(), name="statistics-recorder")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 남은 증분을 기록합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("종료 시 통계 기록 실패")
+
+
+# 전역 통계 기록기 인스턴스
+statistics_recorder = StatisticsRecorder()
+
+
+def get_statistics_recorder() -> StatisticsRecorder:
+    """통계 기록기 인스턴스를 반환합니다.
+
+    Returns:
+        StatisticsRecorder: 전역 통계 기록기
+    """
+    return statistics_recorder
@@ -0,0 +1,5 @@
+"""
+임베딩 도메인
+
+파싱된 텍스트의 청킹 및 임베딩 생성 관련 모듈들
+"""
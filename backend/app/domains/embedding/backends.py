@@ -0,0 +1,214 @@
+"""
+임베딩 모델 백엔드
+
+CPU 전용 환경을 위한 ONNX Runtime 백엔드와 개발/테스트용 해싱 백엔드
+
+ONNX 모델은 sentence-transformers 모델을 optimum으로 내보낸 디렉터리를 사용합니다.
+    optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 models/minilm
+디렉터리에는 `model.onnx`와 `tokenizer.json`이 있어야 합니다.
+"""
+
+import logging
+import os
+import re
+import zlib
+from typing import Optional, Protocol, Sequence
+
+import numpy as np
+
+from ...common.config import settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+class EmbeddingBackend(Protocol):
+    """임베딩 백엔드 인터페이스입니다.
+
+    Attributes:
+        model_id (str): 모델 식별자
+        model_version (str): 모델 버전
+        dim (int): 임베딩 차원
+    """
+
+    model_id: str
+    model_version: str
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 배치를 L2 정규화된 (N, dim) float32 배열로 임베딩합니다."""
+        ...
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """행 단위로 L2 정규화합니다.
+
+    Args:
+        vectors (np.ndarray): (N, dim) 배열
+
+    Returns:
+        np.ndarray: 정규화된 float32 배열
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class OnnxEmbeddingBackend:
+    """ONNX Runtime 기반 CPU 임베딩 백엔드입니다.
+
+    토크나이저는 배치 내 최장 길이에 맞춰 패딩하므로, 호출 측에서 길이별로
+    정렬된 배치를 넘기면 패딩 연산이 줄어듭니다.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_id: Optional[str] = None,
+        model_version: Optional[str] = None,
+        max_length: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+    ):
+        """ONNX 세션과 토크나이저를 로드합니다.
+
+        Args:
+            model_dir (str): `model.onnx`와 `tokenizer.json`이 있는 디렉터리
+            model_id (Optional[str]): 모델 식별자
+            model_version (Optional[str]): 모델 버전
+            max_length (Optional[int]): 최대 시퀀스 길이 (초과분은 잘림)
+            intra_op_threads (Optional[int]): 연산자 내부 병렬 스레드 수 (0이면 ORT 기본값)
+            inter_op_threads (Optional[int]): 연산자 간 병렬 스레드 수 (0이면 ORT 기본값)
+
+        Raises:
+            RuntimeError: onnxruntime/tokenizers 패키지가 없는 경우
+        """
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "ONNX 임베딩 백엔드에는 onnxruntime, tokenizers 패키지가 필요합니다 "
+                "(poetry install -E onnx)"
+            ) from exc
+
+        self.model_id = model_id or settings.EMBEDDING_MODEL
+        self.model_version = model_version or settings.EMBEDDING_MODEL_VERSION
+        max_length = settings.EMBEDDING_MAX_SEQ_LENGTH if max_length is None else max_length
+        intra = settings.EMBEDDING_INTRA_OP_THREADS if intra_op_threads is None else intra_op_threads
+        inter = settings.EMBEDDING_INTER_OP_THREADS if inter_op_threads is None else inter_op_threads
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if intra:
+            options.intra_op_num_threads = intra
+        if inter:
+            options.inter_op_num_threads = inter
+
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {node.name for node in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        output_dim = self.session.get_outputs()[0].shape[-1]
+        self.dim = output_dim if isinstance(output_dim, int) else settings.EMBEDDING_DIM
+
+        logger.info(
+            "ONNX 임베딩 모델 로드 완료: %s@%s (intra=%s, inter=%s)",
+            self.model_id, self.model_version, intra or "auto", inter or "auto",
+        )
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 배치를 임베딩합니다.
+
+        Args:
+            texts (Sequence[str]): 임베딩할 텍스트 목록
+
+        Returns:
+            np.ndarray: (N, dim) L2 정규화 임베딩
+        """
+        encodings = self.tokenizer.encode_batch(list(texts))
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+        output = self.session.run(None, feeds)[0]
+        if output.ndim == 3:
+            # 토큰 임베딩 → 마스크 기반 평균 풀링
+            mask = attention_mask[:, :, None].astype(output.dtype)
+            output = (output * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        return l2_normalize(output)
+
+
+class HashingEmbeddingBackend:
+    """토큰 해싱 기반 결정적 임베딩 백엔드입니다.
+
+    모델 파일 없이 동작하므로 로컬 개발, 테스트, 벤치마크 용도로만 사용합니다.
+    같은 텍스트는 프로세스와 무관하게 항상 같은 벡터를 돌려줍니다.
+    """
+
+    def __init__(self, dim: Optional[int] = None, model_version: str = "1"):
+        """해싱 백엔드를 초기화합니다.
+
+        Args:
+            dim (Optional[int]): 임베딩 차원
+            model_version (str): 모델 버전
+        """
+        self.dim = settings.EMBEDDING_DIM if dim is None else dim
+        self.model_id = "hashing"
+        self.model_version = model_version
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 배치를 임베딩합니다.
+
+        Args:
+            texts (Sequence[str]): 임베딩할 텍스트 목록
+
+        Returns:
+            np.ndarray: (N, dim) L2 정규화 임베딩
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_PATTERN.findall(text.lower()):
+                digest = zlib.crc32(token.encode("utf-8"))
+                vectors[row, digest % self.dim] += 1.0 if digest & 0x80000000 else -1.0
+        return l2_normalize(vectors)
+
+
+def create_embedding_backend(
+    model_version: Optional[str] = None, model_dir: Optional[str] = None
+) -> EmbeddingBackend:
+    """설정에 따라 임베딩 백엔드를 생성합니다.
+
+    Args:
+        model_version (Optional[str]): 모델 버전 (기본: EMBEDDING_MODEL_VERSION)
+        model_dir (Optional[str]): ONNX 모델 디렉터리 (기본: EMBEDDING_ONNX_DIR)
+
+    Returns:
+        EmbeddingBackend: 임베딩 백엔드
+
+    Raises:
+        RuntimeError: ONNX 백엔드인데 모델 디렉터리가 설정되지 않은 경우
+    """
+    model_version = model_version or settings.EMBEDDING_MODEL_VERSION
+    if settings.EMBEDDING_BACKEND == "hashing":
+        logger.warning("해싱 임베딩 백엔드를 사용합니다 (개발/테스트 전용)")
+        return HashingEmbeddingBackend(model_version=model_version)
+
+    model_dir = model_dir or settings.EMBEDDING_ONNX_DIR
+    if not model_dir:
+        raise RuntimeError(
+            "EMBEDDING_ONNX_DIR가 설정되지 않았습니다 (모델 없이 실행하려면 EMBEDDING_BACKEND=hashing)"
+        )
+    return OnnxEmbeddingBackend(model_dir, model_version=model_version)
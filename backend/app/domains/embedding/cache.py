@@ -0,0 +1,336 @@
+"""
+임베딩 캐시
+
+(정규화된 청크 해시, 모델 ID, 모델 버전)을 키로 하는 2계층 임베딩 캐시
+
+- 핫 계층: 최근 사용 벡터를 담는 프로세스 내 LRU
+- 디스크 계층: 모델 버전별 디렉터리에 float32 벡터를 memmap으로 저장하는 추가 전용 스토어
+  (`vectors.f32` 행 = `keys.bin`의 16바이트 다이제스트 순서)
+
+벡터를 먼저 기록한 뒤 키를 추가하므로, 비정상 종료 시에도 키가 있으면 벡터가 존재합니다.
+디스크 스토어는 프로세스 하나가 쓰는 것을 전제로 합니다.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...common.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (모델 ID, 모델 버전)
+ModelKey = Tuple[str, str]
+
+_DIGEST_SIZE = 16
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산용으로 텍스트를 정규화합니다.
+
+    유니코드 NFKC 정규화 후 공백을 하나로 합치고 양끝 공백을 제거합니다.
+
+    Args:
+        text (str): 원문 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def content_digest(text: str) -> bytes:
+    """정규화된 텍스트의 16바이트 다이제스트를 반환합니다.
+
+    Args:
+        text (str): 원문 텍스트
+
+    Returns:
+        bytes: BLAKE2b 다이제스트
+    """
+    return hashlib.blake2b(
+        normalize_text(text).encode("utf-8"), digest_size=_DIGEST_SIZE
+    ).digest()
+
+
+def _safe_model_id(model_id: str) -> str:
+    """모델 ID를 디렉터리 이름으로 쓸 수 있게 변환합니다."""
+    return re.sub(r"[^\w.-]", "_", model_id)
+
+
+def _namespace_dir(root: str, model: ModelKey) -> str:
+    """모델 키에 해당하는 스토어 디렉터리 경로를 반환합니다."""
+    model_id, version = model
+    return os.path.join(root, f"{_safe_model_id(model_id)}@{version}")
+
+
+class MmapVectorStore:
+    """추가 전용 memmap 벡터 스토어입니다."""
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, directory: str, dim: int):
+        """스토어를 열고 기존 키 인덱스를 적재합니다.
+
+        Args:
+            directory (str): 스토어 디렉터리
+            dim (int): 벡터 차원
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.dim = dim
+        self._row_bytes = dim * 4
+        self._keys_path = os.path.join(directory, "keys.bin")
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._index: Dict[bytes, int] = {}
+
+        keys = b""
+        if os.path.exists(self._keys_path):
+            with open(self._keys_path, "rb") as f:
+                keys = f.read()
+        vector_rows = (
+            os.path.getsize(self._vectors_path) // self._row_bytes
+            if os.path.exists(self._vectors_path) else 0
+        )
+        # 마지막 키가 일부만 기록된 경우(비정상 종료)는 잘라낸다
+        self.count = min(len(keys) // _DIGEST_SIZE, vector_rows)
+        for row in range(self.count):
+            self._index[keys[row * _DIGEST_SIZE:(row + 1) * _DIGEST_SIZE]] = row
+        if len(keys) != self.count * _DIGEST_SIZE:
+            with open(self._keys_path, "r+b" if keys else "wb") as f:
+                f.truncate(self.count * _DIGEST_SIZE)
+
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._remap(max(vector_rows, self.count, self._INITIAL_CAPACITY))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _remap(self, capacity: int) -> None:
+        """벡터 파일을 capacity 행 이상으로 늘리고 다시 매핑합니다."""
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        size = capacity * self._row_bytes
+        if not os.path.exists(self._vectors_path):
+            open(self._vectors_path, "wb").close()
+        if os.path.getsize(self._vectors_path) < size:
+            os.truncate(self._vectors_path, size)
+        self._capacity = capacity
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+
+    def lookup(self, digests: Sequence[bytes]) -> List[Optional[int]]:
+        """다이제스트별 행 번호를 반환합니다 (없으면 None)."""
+        return [self._index.get(digest) for digest in digests]
+
+    def read(self, rows: Sequence[int]) -> np.ndarray:
+        """행 번호 목록의 벡터를 복사해 반환합니다."""
+        return np.asarray(self._vectors[np.asarray(rows, dtype=np.int64)])
+
+    def append(self, digests: Sequence[bytes], vectors: np.ndarray) -> None:
+        """새 벡터를 추가합니다 (이미 있는 키는 건너뜁니다).
+
+        Args:
+            digests (Sequence[bytes]): 다이제스트 목록
+            vectors (np.ndarray): (N, dim) 벡터
+        """
+        seen = set()
+        fresh = []
+        for i, digest in enumerate(digests):
+            if digest not in self._index and digest not in seen:
+                seen.add(digest)
+                fresh.append(i)
+        if not fresh:
+            return
+        needed = self.count + len(fresh)
+        if needed > self._capacity:
+            self._remap(max(needed, self._capacity * 2))
+
+        start = self.count
+        self._vectors[start:start + len(fresh)] = vectors[fresh]
+        self._vectors.flush()
+        with open(self._keys_path, "ab") as f:
+            f.write(b"".join(digests[i] for i in fresh))
+        for offset, i in enumerate(fresh):
+            self._index[digests[i]] = start + offset
+        self.count = needed
+
+    def close(self) -> None:
+        """매핑을 해제합니다."""
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+
+
+class EmbeddingCache:
+    """LRU 핫 계층과 memmap 디스크 계층으로 구성된 임베딩 캐시 클래스입니다."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        hot_entries: Optional[int] = None,
+    ):
+        """임베딩 캐시를 초기화합니다. 디스크 스토어는 처음 사용할 때 열립니다.
+
+        Args:
+            directory (Optional[str]): 디스크 스토어 루트 디렉터리 (None이면 핫 계층만 사용)
+            hot_entries (Optional[int]): 핫 계층 최대 항목 수
+        """
+        self.directory = directory
+        self.hot_entries = (
+            settings.EMBEDDING_CACHE_HOT_ENTRIES if hot_entries is None else hot_entries
+        )
+        self._hot: "OrderedDict[Tuple[ModelKey, bytes], np.ndarray]" = OrderedDict()
+        self._stores: Dict[ModelKey, MmapVectorStore] = {}
+
+        self.hits = 0
+        self.hot_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def keys(texts: Sequence[str]) -> List[bytes]:
+        """텍스트 목록의 캐시 키(다이제스트)를 계산합니다."""
+        return [content_digest(text) for text in texts]
+
+    def _store(self, model: ModelKey, dim: int) -> Optional[MmapVectorStore]:
+        if self.directory is None:
+            return None
+        store = self._stores.get(model)
+        if store is None:
+            store = MmapVectorStore(_namespace_dir(self.directory, model), dim)
+            self._stores[model] = store
+            logger.info("임베딩 캐시 스토어 열기: %s (%d개)", store.directory, len(store))
+        return store
+
+    def get_many(
+        self, keys: Sequence[bytes], model: ModelKey, dim: int
+    ) -> Tuple[np.ndarray, List[int]]:
+        """키 배치를 한 번에 조회합니다.
+
+        Args:
+            keys (Sequence[bytes]): 캐시 키 목록
+            model (ModelKey): (모델 ID, 모델 버전)
+            dim (int): 벡터 차원
+
+        Returns:
+            Tuple[np.ndarray, List[int]]: 적중 행이 채워진 (N, dim) 배열과 미적중 인덱스 목록
+        """
+        vectors = np.zeros((len(keys), dim), dtype=np.float32)
+        cold: List[int] = []
+        for i, key in enumerate(keys):
+            vector = self._hot.get((model, key))
+            if vector is not None:
+                self._hot.move_to_end((model, key))
+                vectors[i] = vector
+                self.hot_hits += 1
+            else:
+                cold.append(i)
+
+        missing: List[int] = []
+        store = self._store(model, dim)
+        if store is not None and cold:
+            rows = store.lookup([keys[i] for i in cold])
+            found = [(i, row) for i, row in zip(cold, rows) if row is not None]
+            if found:
+                loaded = store.read([row for _, row in found])
+                for (i, _), vector in zip(found, loaded):
+                    vectors[i] = vector
+                    self._remember(model, keys[i], vector)
+            missing = [i for i, row in zip(cold, rows) if row is None]
+        else:
+            missing = cold
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return vectors, missing
+
+    def put_many(
+        self, keys: Sequence[bytes], vectors: np.ndarray, model: ModelKey
+    ) -> None:
+        """계산된 벡터를 두 계층에 저장합니다.
+
+        Args:
+            keys (Sequence[bytes]): 캐시 키 목록
+            vectors (np.ndarray): (N, dim) 벡터
+            model (ModelKey): (모델 ID, 모델 버전)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        store = self._store(model, vectors.shape[1])
+        if store is not None:
+            store.append(keys, vectors)
+        for key, vector in zip(keys, vectors):
+            self._remember(model, key, vector)
+
+    def _remember(self, model: ModelKey, key: bytes, vector: np.ndarray) -> None:
+        if self.hot_entries <= 0:
+            return
+        self._hot[(model, key)] = np.array(vector, dtype=np.float32)
+        self._hot.move_to_end((model, key))
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+
+    def invalidate_model(self, model_id: str, keep_version: Optional[str] = None) -> int:
+        """모델의 이전 버전 캐시를 폐기합니다.
+
+        Args:
+            model_id (str): 모델 ID
+            keep_version (Optional[str]): 유지할 버전 (None이면 모든 버전 폐기)
+
+        Returns:
+            int: 폐기된 핫 계층 항목 수
+        """
+        stale = [
+            entry for entry in self._hot
+            if entry[0][0] == model_id and entry[0][1] != keep_version
+        ]
+        for entry in stale:
+            del self._hot[entry]
+
+        for model in [m for m in self._stores if m[0] == model_id and m[1] != keep_version]:
+            self._stores.pop(model).close()
+
+        if self.directory is not None and os.path.isdir(self.directory):
+            safe_id = _safe_model_id(model_id)
+            for name in os.listdir(self.directory):
+                prefix, _, version = name.rpartition("@")
+                if prefix == safe_id and version != keep_version:
+                    shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+                    logger.info("임베딩 캐시 스토어 폐기: %s", name)
+        return len(stale)
+
+    def stats(self, seconds_per_text: float = 0.0) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다.
+
+        Args:
+            seconds_per_text (float): 텍스트 1건당 평균 임베딩 계산 시간(초)
+
+        Returns:
+            Dict[str, Any]: 적중률, 절약한 계산 시간 등
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "hot_hits": self.hot_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_seconds": self.hits * seconds_per_text,
+            "hot_entries": len(self._hot),
+            "disk_entries": sum(len(store) for store in self._stores.values()),
+        }
+
+    def close(self) -> None:
+        """열린 디스크 스토어를 모두 닫습니다."""
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
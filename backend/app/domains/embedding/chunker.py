@@ -0,0 +1,293 @@
+"""
+스트리밍 토큰 기반 청커
+
+`documents.parsed`의 페이지 텍스트를 제너레이터로 받아 토큰 예산에 맞춘
+겹침(overlap) 청크를 생성합니다.
+
+- 페이지마다 한 번만 토큰화하고, 토큰은 (시작, 끝) 오프셋 배열로만 보관합니다.
+- 청크는 원문 문자열을 복사하지 않고 (페이지, 오프셋) 구간만 참조하며,
+  텍스트는 실제로 필요할 때 한 번만 만들어집니다.
+- 전체 처리량은 토큰 수에 선형이며, 메모리에는 현재 윈도우가 참조하는 페이지만 남습니다.
+"""
+
+import re
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...common.config import settings
+
+
+# (시작, 끝) 문자 오프셋 목록을 돌려주는 토큰화 함수 타입
+TokenSpanFunc = Callable[[str], Iterable[Tuple[int, int]]]
+
+# 기본 토큰 패턴: 단어(한글/영문/숫자) 또는 단일 구두점
+_DEFAULT_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def regex_token_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """정규식 기반으로 토큰 오프셋을 생성합니다.
+
+    실제 서브워드 토크나이저가 없을 때 사용하는 근사 토큰화입니다.
+
+    Args:
+        text (str): 토큰화할 텍스트
+
+    Returns:
+        Iterator[Tuple[int, int]]: 토큰별 (시작, 끝) 문자 오프셋
+    """
+    for match in _DEFAULT_TOKEN_PATTERN.finditer(text):
+        yield match.span()
+
+
+def hf_token_spans(tokenizer: Any) -> TokenSpanFunc:
+    """HuggingFace `tokenizers` 토크나이저를 오프셋 함수로 감쌉니다.
+
+    임베딩 모델과 동일한 토크나이저를 쓰면 토큰 예산이 정확히 맞습니다.
+
+    Args:
+        tokenizer (Any): `encode(text, add_special_tokens=False)`를 지원하는 토크나이저
+
+    Returns:
+        TokenSpanFunc: (시작, 끝) 오프셋을 돌려주는 함수
+    """
+    def _spans(text: str) -> List[Tuple[int, int]]:
+        encoding = tokenizer.encode(text, add_special_tokens=False)
+        return [(start, end) for start, end in encoding.offsets if end > start]
+
+    return _spans
+
+
+@dataclass(frozen=True, slots=True)
+class PageText:
+    """파싱된 한 페이지의 텍스트입니다.
+
+    Attributes:
+        page (int): 페이지 번호 (1부터 시작)
+        text (str): 페이지 텍스트
+    """
+
+    page: int
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkSpan:
+    """청크가 참조하는 페이지 내 구간입니다 (인용 하이라이트용).
+
+    Attributes:
+        page (int): 페이지 번호
+        start (int): 페이지 텍스트 기준 시작 문자 오프셋
+        end (int): 페이지 텍스트 기준 끝 문자 오프셋 (미포함)
+    """
+
+    page: int
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class Chunk:
+    """토큰 예산에 맞춰 잘린 청크입니다.
+
+    Attributes:
+        doc_id (str): 문서 ID
+        chunk_id (str): 청크 ID (`{doc_id}:{index}`)
+        index (int): 문서 내 청크 순번
+        token_count (int): 청크의 토큰 수
+        spans (Tuple[ChunkSpan, ...]): 페이지별 원문 구간
+    """
+
+    doc_id: str
+    chunk_id: str
+    index: int
+    token_count: int
+    spans: Tuple[ChunkSpan, ...]
+    _sources: Tuple[str, ...] = field(repr=False)
+    _text: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def page(self) -> int:
+        """청크가 시작하는 페이지 번호입니다."""
+        return self.spans[0].page
+
+    @property
+    def text(self) -> str:
+        """청크 텍스트입니다. 최초 접근 시 한 번만 만들어집니다."""
+        if self._text is None:
+            self._text = "\n".join(
+                source[span.start:span.end]
+                for source, span in zip(self._sources, self.spans)
+            )
+        return self._text
+
+    def release(self) -> None:
+        """원문 페이지 참조를 해제합니다 (텍스트는 먼저 확정됩니다)."""
+        _ = self.text
+        self._sources = ()
+
+    def to_payload(self) -> Dict[str, Any]:
+        """`documents.parsed` 청크 이벤트 페이로드로 변환합니다.
+
+        Returns:
+            Dict[str, Any]: doc_id/chunk_id 키와 텍스트, 페이지 구간 정보
+        """
+        return {
+            "doc_id": self.doc_id,
+            "chunk_id": self.chunk_id,
+            "index": self.index,
+            "page": self.page,
+            "text": self.text,
+            "token_count": self.token_count,
+            "spans": [
+                {"page": span.page, "start": span.start, "end": span.end}
+                for span in self.spans
+            ],
+        }
+
+
+class _PageTokens:
+    """페이지 원문과 토큰 오프셋 배열입니다."""
+
+    __slots__ = ("page", "text", "starts", "ends")
+
+    def __init__(self, page: int, text: str, token_spans: TokenSpanFunc):
+        self.page = page
+        self.text = text
+        self.starts = array("I")
+        self.ends = array("I")
+        for start, end in token_spans(text):
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+class StreamingChunker:
+    """페이지 스트림을 겹침이 있는 토큰 예산 청크로 나누는 클래스입니다.
+
+    윈도우는 (페이지, 토큰 인덱스 범위) 세그먼트의 덱으로 관리되어,
+    토큰을 한 번씩만 지나가며 청크를 만들어 냅니다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None,
+        token_spans: Optional[TokenSpanFunc] = None,
+    ):
+        """청커를 초기화합니다.
+
+        Args:
+            max_tokens (Optional[int]): 청크당 최대 토큰 수
+            overlap_tokens (Optional[int]): 인접 청크 간 겹치는 토큰 수
+            token_spans (Optional[TokenSpanFunc]): 토큰 오프셋 함수 (기본: 정규식 근사)
+
+        Raises:
+            ValueError: 토큰 예산 설정이 올바르지 않은 경우
+        """
+        self.max_tokens = settings.CHUNK_MAX_TOKENS if max_tokens is None else max_tokens
+        self.overlap_tokens = (
+            settings.CHUNK_OVERLAP_TOKENS if overlap_tokens is None else overlap_tokens
+        )
+        if self.max_tokens <= 0:
+            raise ValueError("max_tokens는 1 이상이어야 합니다")
+        if not 0 <= self.overlap_tokens < self.max_tokens:
+            raise ValueError("overlap_tokens는 0 이상 max_tokens 미만이어야 합니다")
+        self.token_spans = token_spans or regex_token_spans
+
+    def chunk(self, doc_id: str, pages: Iterable[PageText]) -> Iterator[Chunk]:
+        """페이지 스트림을 청크 스트림으로 변환합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+            pages (Iterable[PageText]): 페이지 순서대로 들어오는 텍스트
+
+        Yields:
+            Chunk: 토큰 예산에 맞춘 청크
+        """
+        # 윈도우 세그먼트: [페이지 토큰, 시작 인덱스, 끝 인덱스(미포함)]
+        window: Deque[List[Any]] = deque()
+        count = 0
+        fresh = 0
+        index = 0
+        stride = self.max_tokens - self.overlap_tokens
+
+        for page in pages:
+            tokens = _PageTokens(page.page, page.text, self.token_spans)
+            total = len(tokens)
+            pos = 0
+            while pos < total:
+                take = min(self.max_tokens - count, total - pos)
+                if window and window[-1][0] is tokens:
+                    window[-1][2] += take
+                else:
+                    window.append([tokens, pos, pos + take])
+                count += take
+                fresh += take
+                pos += take
+
+                if count == self.max_tokens:
+                    yield self._emit(doc_id, index, window, count)
+                    index += 1
+                    count -= self._drop(window, stride)
+                    fresh = 0
+
+        if fresh > 0:
+            yield self._emit(doc_id, index, window, count)
+
+    @staticmethod
+    def _emit(
+        doc_id: str, index: int, window: Deque[List[Any]], count: int
+    ) -> Chunk:
+        """현재 윈도우로 청크를 만듭니다."""
+        spans = []
+        sources = []
+        for tokens, lo, hi in window:
+            spans.append(ChunkSpan(tokens.page, tokens.starts[lo], tokens.ends[hi - 1]))
+            sources.append(tokens.text)
+        return Chunk(
+            doc_id=doc_id,
+            chunk_id=f"{doc_id}:{index}",
+            index=index,
+            token_count=count,
+            spans=tuple(spans),
+            _sources=tuple(sources),
+        )
+
+    @staticmethod
+    def _drop(window: Deque[List[Any]], n: int) -> int:
+        """윈도우 앞쪽에서 토큰 n개를 제거하고 제거한 수를 반환합니다."""
+        dropped = 0
+        while window and dropped < n:
+            segment = window[0]
+            size = segment[2] - segment[1]
+            if size <= n - dropped:
+                window.popleft()
+                dropped += size
+            else:
+                segment[1] += n - dropped
+                dropped = n
+        return dropped
+
+
+def chunk_pages(
+    doc_id: str,
+    pages: Iterable[PageText],
+    max_tokens: Optional[int] = None,
+    overlap_tokens: Optional[int] = None,
+) -> Iterator[Chunk]:
+    """기본 설정의 청커로 페이지 스트림을 청크로 나눕니다.
+
+    Args:
+        doc_id (str): 문서 ID
+        pages (Iterable[PageText]): 페이지 텍스트 스트림
+        max_tokens (Optional[int]): 청크당 최대 토큰 수
+        overlap_tokens (Optional[int]): 겹치는 토큰 수
+
+    Returns:
+        Iterator[Chunk]: 청크 스트림
+    """
+    return StreamingChunker(max_tokens, overlap_tokens).chunk(doc_id, pages)
@@ -0,0 +1,370 @@
+"""
+임베딩 서비스
+
+색인 워커와 질의 경로가 공유하는 동적 마이크로배칭 임베딩 서비스
+
+- 여러 문서의 청크와 질의를 하나의 대기열로 모아 (최대 배치 크기, 최대 대기 시간) 중
+  먼저 도달하는 조건에서 배치를 만듭니다.
+- 질의는 대기열 앞쪽에 배치되어 대량 색인 작업 뒤에서 기다리지 않습니다.
+- 모인 요청은 길이순으로 정렬한 뒤 나누어 패딩을 최소화합니다.
+- 추론은 전용 스레드에서 한 번에 하나씩 실행되며, 병렬성은 ONNX Runtime의
+  intra/inter-op 스레드 설정으로 조절합니다.
+- 임베딩 캐시가 설정되면 배치 단위로 먼저 조회해 미적중 텍스트만 계산합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ...common.config import settings
+from .backends import EmbeddingBackend, create_embedding_backend
+from .cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingPriority(str, Enum):
+    """임베딩 요청 우선순위 열거형입니다."""
+    QUERY = "query"
+    DOCUMENT = "document"
+
+
+@dataclass(slots=True)
+class _PendingText:
+    """배치 대기 중인 텍스트 한 건입니다."""
+
+    text: str
+    future: "asyncio.Future[np.ndarray]"
+    enqueued_at: float
+
+
+class EmbeddingService:
+    """동적 마이크로배칭 임베딩 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        backend_factory: Optional[Callable[[], EmbeddingBackend]] = None,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        sort_window_batches: int = 4,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        """임베딩 서비스를 초기화합니다.
+
+        Args:
+            backend_factory (Optional[Callable[[], EmbeddingBackend]]): 백엔드 생성 함수 (최초 배치 시 호출)
+            max_batch_size (Optional[int]): 추론 1회당 최대 텍스트 수
+            max_wait_ms (Optional[float]): 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간(ms)
+            sort_window_batches (int): 길이 정렬을 위해 한 번에 꺼내는 배치 수
+            cache (Optional[EmbeddingCache]): 임베딩 캐시 (None이면 캐시 미사용)
+        """
+        self._backend_factory = backend_factory or create_embedding_backend
+        self._backend: Optional[EmbeddingBackend] = None
+        self.max_batch_size = settings.EMBEDDING_MAX_BATCH_SIZE if max_batch_size is None else max_batch_size
+        self.max_wait = (
+            settings.EMBEDDING_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms
+        ) / 1000
+        self.sort_window = self.max_batch_size * max(1, sort_window_batches)
+        self.cache = cache
+
+        self._queries: Deque[_PendingText] = deque()
+        self._documents: Deque[_PendingText] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._batches = 0
+        self._texts = 0
+        self._inference_seconds = 0.0
+
+    @property
+    def backend(self) -> EmbeddingBackend:
+        """임베딩 백엔드입니다 (최초 접근 시 생성)."""
+        return self._ensure_backend()
+
+    def _ensure_backend(self) -> EmbeddingBackend:
+        """백엔드가 없으면 만들어 반환합니다.
+
+        Raises:
+            RuntimeError: 임베딩 백엔드를 만들 수 없는 경우
+        """
+        if self._backend is None:
+            self._backend = self._backend_factory()
+        return self._backend
+
+    async def start(self) -> None:
+        """백엔드를 만들고 배칭 루프를 시작합니다.
+
+        백엔드를 첫 임베딩 요청이 아니라 시작 시점에 만들어, 모델 설정이 잘못되었으면
+        첫 요청이 500으로 실패하는 대신 애플리케이션이 뜨지 않게 합니다.
+
+        Raises:
+            RuntimeError: 임베딩 백엔드를 만들 수 없는 경우 (예: ONNX 모델 디렉터리 미설정)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._ensure_backend()
+        self._wakeup = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._task = asyncio.create_task(self._run(), name="embedding-batcher")
+        logger.info(
+            "임베딩 서비스 시작 (max_batch_size=%d, max_wait_ms=%.1f)",
+            self.max_batch_size, self.max_wait * 1000,
+        )
+
+    async def stop(self) -> None:
+        """배칭 루프를 중지하고 대기 중인 요청을 취소합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for queue in (self._queries, self._documents):
+            while queue:
+                item = queue.popleft()
+                if not item.future.done():
+                    item.future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def embed(
+        self,
+        texts: Sequence[str],
+        priority: EmbeddingPriority = EmbeddingPriority.DOCUMENT,
+    ) -> np.ndarray:
+        """텍스트 목록을 임베딩합니다.
+
+        Args:
+            texts (Sequence[str]): 임베딩할 텍스트 목록
+            priority (EmbeddingPriority): 요청 우선순위
+
+        Returns:
+            np.ndarray: (N, dim) L2 정규화 임베딩
+        """
+        backend = self.backend
+        if not texts:
+            return np.zeros((0, backend.dim), dtype=np.float32)
+        if self.cache is None:
+            return await self._enqueue(texts, priority)
+
+        # 캐시를 배치로 조회하고, 미적중 텍스트는 중복을 제거해 한 번씩만 계산한다
+        model = (backend.model_id, backend.model_version)
+        keys = self.cache.keys(texts)
+        vectors, missing = self.cache.get_many(keys, model, backend.dim)
+        if missing:
+            groups: Dict[bytes, List[int]] = {}
+            for i in missing:
+                groups.setdefault(keys[i], []).append(i)
+            unique = [indices[0] for indices in groups.values()]
+            computed = await self._enqueue([texts[i] for i in unique], priority)
+            for indices, vector in zip(groups.values(), computed):
+                vectors[indices] = vector
+            if self._backend is backend:
+                self.cache.put_many(list(groups), computed, model)
+        return vectors
+
+    async def _enqueue(
+        self, texts: Sequence[str], priority: EmbeddingPriority
+    ) -> np.ndarray:
+        """텍스트를 배치 대기열에 넣고 결과를 기다립니다."""
+        if self._task is None or self._task.done():
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        queue = self._queries if priority == EmbeddingPriority.QUERY else self._documents
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.append(_PendingText(text, future, now))
+            futures.append(future)
+        self._wakeup.set()
+
+        try:
+            vectors = await asyncio.gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return np.stack(vectors)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        """질의 텍스트 하나를 높은 우선순위로 임베딩합니다.
+
+        Args:
+            text (str): 질의 텍스트
+
+        Returns:
+            np.ndarray: (dim,) 임베딩
+        """
+        return (await self.embed([text], EmbeddingPriority.QUERY))[0]
+
+    async def embed_documents(self, texts: Sequence[str]) -> np.ndarray:
+        """문서 청크 텍스트 목록을 임베딩합니다.
+
+        Args:
+            texts (Sequence[str]): 청크 텍스트 목록
+
+        Returns:
+            np.ndarray: (N, dim) 임베딩
+        """
+        return await self.embed(texts, EmbeddingPriority.DOCUMENT)
+
+    async def on_model_registered(self, event: Dict[str, Any]) -> None:
+        """`ml.models.registered` 이벤트를 처리합니다.
+
+        서빙 중인 모델의 새 버전이 등록되면 다음 배치부터 새 백엔드를 사용하고,
+        이전 버전의 캐시를 폐기합니다. ONNX 백엔드는 `artifact_uri`가 로컬 디렉터리일 때만
+        교체하며, 그렇지 않으면 경고만 남기고 현재 모델을 유지합니다 (이전 모델 파일에
+        새 버전 라벨을 붙이지 않도록).
+
+        Args:
+            event (Dict[str, Any]): `model_id`, `version`, `artifact_uri`(선택)를 포함한 이벤트
+        """
+        model_id = event.get("model_id")
+        version = str(event.get("version", ""))
+        current = self.backend
+        if model_id != current.model_id or not version or version == current.model_version:
+            return
+
+        artifact = event.get("artifact_uri")
+        model_dir = artifact if artifact and os.path.isdir(artifact) else None
+        if model_dir is None and settings.EMBEDDING_BACKEND != "hashing":
+            logger.warning(
+                "임베딩 모델 %s 버전 %s의 아티팩트를 로컬에서 찾을 수 없어 교체하지 않습니다: %s (현재 버전 %s 유지)",
+                model_id, version, artifact, current.model_version,
+            )
+            return
+        self._backend_factory = partial(
+            create_embedding_backend, model_version=version, model_dir=model_dir
+        )
+        self._backend = None
+        if self.cache is not None:
+            dropped = self.cache.invalidate_model(model_id, keep_version=version)
+            logger.info(
+                "임베딩 모델 버전 변경 %s: %s → %s (핫 캐시 %d개 폐기)",
+                model_id, current.model_version, version, dropped,
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """배칭 및 캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 배치 수, 처리 텍스트 수, 평균 배치 크기, 대기열 길이, 캐시 적중률 등
+        """
+        stats: Dict[str, Any] = {
+            "batches": self._batches,
+            "texts": self._texts,
+            "avg_batch_size": self._texts / self._batches if self._batches else 0.0,
+            "inference_seconds": self._inference_seconds,
+            "queued_queries": len(self._queries),
+            "queued_documents": len(self._documents),
+        }
+        if self.cache is not None:
+            seconds_per_text = self._inference_seconds / self._texts if self._texts else 0.0
+            stats["cache"] = self.cache.stats(seconds_per_text)
+        return stats
+
+    def _pending(self) -> int:
+        return len(self._queries) + len(self._documents)
+
+    def _oldest(self) -> float:
+        heads = [queue[0].enqueued_at for queue in (self._queries, self._documents) if queue]
+        return min(heads)
+
+    def _take(self, limit: int) -> List[_PendingText]:
+        """질의를 우선해 최대 limit건의 유효한 요청을 꺼냅니다."""
+        taken: List[_PendingText] = []
+        for queue in (self._queries, self._documents):
+            while queue and len(taken) < limit:
+                item = queue.popleft()
+                if not item.future.done():
+                    taken.append(item)
+        return taken
+
+    async def _run(self) -> None:
+        """배칭 루프입니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._pending():
+                continue
+
+            # 배치가 가득 차거나 가장 오래된 요청의 대기 한도에 도달할 때까지 모은다
+            deadline = self._oldest() + self.max_wait
+            while self._pending() < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                self._wakeup.clear()
+
+            items = self._take(self.sort_window)
+            items.sort(key=lambda item: len(item.text))
+            for start in range(0, len(items), self.max_batch_size):
+                batch = items[start:start + self.max_batch_size]
+                await self._infer(loop, batch)
+
+            if self._pending():
+                self._wakeup.set()
+
+    async def _infer(
+        self, loop: asyncio.AbstractEventLoop, batch: List[_PendingText]
+    ) -> None:
+        """배치 하나를 추론하고 결과를 요청별로 전달합니다."""
+        batch = [item for item in batch if not item.future.done()]
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        try:
+            vectors = await loop.run_in_executor(
+                self._executor, self._embed_sync, [item.text for item in batch]
+            )
+        except Exception as exc:
+            logger.exception("임베딩 배치 추론 실패 (size=%d)", len(batch))
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+
+        self._inference_seconds += time.perf_counter() - started
+        self._batches += 1
+        self._texts += len(batch)
+        for item, vector in zip(batch, vectors):
+            if not item.future.done():
+                item.future.set_result(vector)
+
+    def _embed_sync(self, texts: List[str]) -> np.ndarray:
+        return self.backend.embed(texts)
+
+
+# 전역 임베딩 서비스 인스턴스 (색인 워커와 질의 경로가 공유)
+embedding_service = EmbeddingService(
+    cache=EmbeddingCache(settings.EMBEDDING_CACHE_DIR) if settings.EMBEDDING_CACHE_ENABLED else None
+)
+
+
+def get_embedding_service() -> EmbeddingService:
+    """임베딩 서비스 인스턴스를 반환합니다.
+
+    Returns:
+        EmbeddingService: 공유 임베딩 서비스
+    """
+    return embedding_service
@@ -0,0 +1,71 @@
+"""
+색인 워커
+
+`documents.parsed` 이벤트를 받아 청킹 → 임베딩 → 벡터 색인 업서트 후
+`documents.indexed` 이벤트를 발행합니다.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from ...common.events import EventBus, Topics, event_bus
+from ..search.services import vector_index
+from ..search.vector_index import VectorIndex
+from .chunker import PageText, StreamingChunker
+from .services import EmbeddingService, embedding_service
+
+logger = logging.getLogger(__name__)
+
+
+class IndexingWorker:
+    """파싱된 문서를 색인하는 워커 클래스입니다."""
+
+    def __init__(
+        self,
+        embedding: Optional[EmbeddingService] = None,
+        index: Optional[VectorIndex] = None,
+        chunker: Optional[StreamingChunker] = None,
+        bus: Optional[EventBus] = None,
+    ):
+        """색인 워커를 초기화합니다.
+
+        Args:
+            embedding (Optional[EmbeddingService]): 임베딩 서비스
+            index (Optional[VectorIndex]): 벡터 색인
+            chunker (Optional[StreamingChunker]): 청커
+            bus (Optional[EventBus]): 결과 이벤트를 발행할 이벤트 버스
+        """
+        self.embedding = embedding or embedding_service
+        self.index = index or vector_index
+        self.chunker = chunker or StreamingChunker()
+        self.bus = bus or event_bus
+
+    async def handle_parsed(self, event: Dict[str, Any]) -> None:
+        """`documents.parsed` 이벤트를 처리합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `doc_name`(선택), `pages`([{page, text}])를 포함한 이벤트
+        """
+        tenant_id = event["tenant_id"]
+        doc_id = event["doc_id"]
+        pages = (PageText(page["page"], page["text"]) for page in event.get("pages", ()))
+        chunks = list(self.chunker.chunk(doc_id, pages))
+
+        vectors = await self.embedding.embed_documents([chunk.text for chunk in chunks])
+        await self.index.upsert(tenant_id, doc_id, [chunk.chunk_id for chunk in chunks], vectors)
+        logger.info("문서 색인 완료: tenant=%s doc=%s chunks=%d", tenant_id, doc_id, len(chunks))
+
+        await self.bus.publish(
+            Topics.DOCUMENTS_INDEXED,
+            {
+                "tenant_id": tenant_id,
+                "doc_id": doc_id,
+                "doc_name": event.get("doc_name"),
+                "chunks": [chunk.to_payload() for chunk in chunks],
+            },
+            key=doc_id,
+        )
+
+
+# 전역 색인 워커 인스턴스
+indexing_worker = IndexingWorker()
@@ -0,0 +1,5 @@
+"""
+내보내기 도메인
+
+CSV/NDJSON 스트리밍 내보내기와 비동기 내보내기 작업 관련 모듈들
+"""
@@ -0,0 +1,102 @@
+"""
+내보내기 도메인 모델
+
+비동기 내보내기 작업 SQLModel 모델 정의
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class ExportStatus(str, Enum):
+    """내보내기 작업 상태 열거형입니다."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportJob(SQLModel, TimestampMixin, table=True):
+    """비동기 내보내기 작업을 저장하는 모델입니다.
+
+    대량 내보내기는 요청 응답으로 스트리밍하지 않고 백그라운드에서 파일로 쓴 뒤
+    다운로드 링크로 내려받습니다.
+
+    Attributes:
+        id (UUID): 작업 고유 ID
+        tenant_id (str): 테넌트 ID
+        user_id (str): 요청한 사용자 ID (다운로드 권한)
+        source (str): 내보낸 데이터 (history | favorites | alerts)
+        format (str): 파일 형식 (csv | ndjson)
+        compressed (bool): gzip 압축 여부
+        status (ExportStatus): 작업 상태
+        rows (int): 쓴 행 수
+        size (int): 파일 크기(바이트)
+        path (Optional[str]): 저장소 내 파일 경로 (완료 후)
+        error (Optional[str]): 실패 사유
+        completed_at (Optional[datetime]): 완료 시간
+        owner (str): 작업을 실행하는 워커 식별자
+        heartbeat_at (datetime): 실행 워커가 마지막으로 살아 있음을 알린 시간
+    """
+
+    __tablename__ = "export_jobs"
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="작업 고유 ID"
+    )
+    tenant_id: str = Field(
+        index=True,
+        description="테넌트 ID (멀티테넌시)"
+    )
+    user_id: str = Field(
+        description="요청한 사용자 ID"
+    )
+    source: str = Field(
+        description="내보낸 데이터"
+    )
+    format: str = Field(
+        description="파일 형식"
+    )
+    compressed: bool = Field(
+        default=False,
+        description="gzip 압축 여부"
+    )
+    status: ExportStatus = Field(
+        default=ExportStatus.QUEUED,
+        description="작업 상태"
+    )
+    rows: int = Field(
+        default=0,
+        description="쓴 행 수"
+    )
+    size: int = Field(
+        default=0,
+        description="파일 크기(바이트)"
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description="저장소 내 파일 경로"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="실패 사유"
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None,
+        description="완료 시간"
+    )
+    owner: str = Field(
+        description="작업을 실행하는 워커 식별자"
+    )
+    heartbeat_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="실행 워커의 마지막 하트비트 시간"
+    )
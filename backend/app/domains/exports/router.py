@@ -0,0 +1,98 @@
+"""
+내보내기 도메인 라우터
+
+비동기 내보내기 작업 조회와 파일 다운로드 REST API 엔드포인트
+"""
+
+import os
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import get_db_session
+from ...common.exceptions import BusinessException, ExportJobNotFound, ExportNotReady, business_exception_handler
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from .models import ExportStatus
+from .schemas import ExportJobRead
+from .services import EXPORT_MEDIA_TYPES, GZIP_MEDIA_TYPE, ExportService, export_filename, get_export_service, job_read
+
+# 내보내기 라우터 생성
+router = APIRouter(prefix="/api/v1/exports", tags=["내보내기"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ExportJobRead,
+    summary="내보내기 작업 조회",
+    description="내보내기 작업 상태를 조회합니다. 완료되면 downloadUrl로 파일을 내려받습니다."
+)
+async def get_export_job(
+    job_id: str,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    exports: Annotated[ExportService, Depends(get_export_service)]
+) -> ExportJobRead:
+    """내보내기 작업 조회 엔드포인트입니다.
+
+    Args:
+        job_id (str): 작업 ID
+        token (TokenPayload): 현재 사용자 토큰 (요청한 사용자의 작업만 조회)
+        session (AsyncSession): 데이터베이스 세션
+        exports (ExportService): 내보내기 서비스
+
+    Returns:
+        ExportJobRead: 작업 상태
+
+    Raises:
+        HTTPException: 작업이 없는 경우 (404)
+    """
+    try:
+        job = await exports.get(session, token.tenant_id, token.sub, job_id)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+    return job_read(job)
+
+
+@router.get(
+    "/{job_id}/download",
+    response_class=FileResponse,
+    summary="내보내기 파일 다운로드",
+    description="완료된 내보내기 작업 파일을 내려받습니다."
+)
+async def download_export(
+    job_id: str,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    exports: Annotated[ExportService, Depends(get_export_service)]
+) -> FileResponse:
+    """내보내기 파일 다운로드 엔드포인트입니다.
+
+    Args:
+        job_id (str): 작업 ID
+        token (TokenPayload): 현재 사용자 토큰 (요청한 사용자의 작업만 다운로드)
+        session (AsyncSession): 데이터베이스 세션
+        exports (ExportService): 내보내기 서비스
+
+    Returns:
+        FileResponse: 내보낸 파일
+
+    Raises:
+        HTTPException: 작업이나 파일이 없는 경우 (404), 작업이 완료되지 않은 경우 (409)
+    """
+    try:
+        job = await exports.get(session, token.tenant_id, token.sub, job_id)
+        if job.status != ExportStatus.COMPLETED:
+            raise ExportNotReady(job_id, job.status.value)
+        path = exports.file_path(job)
+        if not os.path.isfile(path):
+            raise ExportJobNotFound(job_id)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+    return FileResponse(
+        path,
+        media_type=GZIP_MEDIA_TYPE if job.compressed else EXPORT_MEDIA_TYPES[job.format],
+        filename=export_filename(job.source, job.format, job.compressed),
+    )
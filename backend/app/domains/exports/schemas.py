@@ -0,0 +1,36 @@
+"""
+내보내기 도메인 스키마
+
+내보내기 작업 API 응답 스키마 (camelCase 응답)
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from .models import ExportStatus
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+
+class ExportJobRead(CamelModel):
+    """내보내기 작업 조회 응답 스키마입니다."""
+
+    id: UUID = Field(description="작업 고유 ID")
+    source: str = Field(description="내보낸 데이터 (history | favorites | alerts)")
+    format: str = Field(description="파일 형식 (csv | ndjson)")
+    compressed: bool = Field(description="gzip 압축 여부")
+    status: ExportStatus = Field(description="작업 상태")
+    rows: int = Field(description="쓴 행 수")
+    size: int = Field(description="파일 크기(바이트)")
+    download_url: Optional[str] = Field(default=None, description="다운로드 경로 (완료 후)")
+    error: Optional[str] = Field(default=None, description="실패 사유")
+    created_at: datetime = Field(description="생성 시간")
+    completed_at: Optional[datetime] = Field(default=None, description="완료 시간")
@@ -0,0 +1,570 @@
+"""
+내보내기 도메인 서비스
+
+검색 기록, 즐겨찾기, 알림 같은 테넌트 데이터를 CSV/NDJSON(선택적으로 gzip)으로 내보냅니다.
+
+- 조회는 서버 측 커서(`session.stream` + `yield_per`)로 EXPORT_BATCH_ROWS행씩 읽고, 배치마다
+  인코딩(과 압축)한 바이트를 바로 `StreamingResponse`로 흘려보냅니다. 전체 결과를 목록으로 모으지
+  않으므로 메모리 사용량은 행 수와 관계없이 배치 하나 분량입니다.
+- 내보내기 쿼리는 `select(컬럼.label("헤더"), ...)` 형태이며, 라벨이 CSV 헤더와 NDJSON 키가 됩니다.
+- 대량 내보내기는 작업(`ExportJob`)으로 만들어 백그라운드에서 같은 인코더로 EXPORT_STORAGE_DIR에
+  파일을 쓰고, 완료되면 다운로드 경로를 돌려줍니다. 파일 쓰기는 스레드에서 실행해 이벤트 루프를 막지
+  않습니다.
+- 작업에는 실행 워커(`owner`)와 하트비트를 남깁니다. 워커는 EXPORT_HEARTBEAT_SECONDS마다 자기 작업의
+  하트비트를 갱신하고, 하트비트가 EXPORT_STALE_SECONDS 넘게 끊긴 작업(죽은 워커의 작업)만 실패로
+  표시하므로 재시작이나 증설이 다른 워커의 작업을 중단시키지 않습니다.
+- 끝난 작업 행과 작업 파일은 보관 기간(`EXPORT_RETENTION_SECONDS`)이 지나면 정리 주기마다 삭제하므로
+  저장소와 `export_jobs` 테이블이 내보내기 횟수에 비례해 계속 커지지 않습니다.
+- CSV는 엑셀에서 여는 것을 전제로 하므로, 수식으로 해석될 수 있는 값(`=`, `+`, `-`, `@`, 탭, CR로
+  시작)은 앞에 `'`를 붙여 수식 주입을 막습니다.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import socket
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, List, Mapping, Optional, Sequence, Set
+from uuid import UUID, uuid4
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import Select, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ...common.exceptions import ExportJobNotFound
+from .models import ExportJob, ExportStatus
+from .schemas import ExportJobRead
+
+logger = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+# 형식별 응답 미디어 타입 (압축하면 application/gzip, text/*에는 charset=utf-8이 붙음)
+EXPORT_MEDIA_TYPES = {
+    FORMAT_CSV: "text/csv",
+    FORMAT_NDJSON: "application/x-ndjson",
+}
+GZIP_MEDIA_TYPE = "application/gzip"
+
+# 엑셀에서 한글 CSV를 UTF-8로 열도록 붙이는 BOM
+CSV_BOM = "\ufeff"
+
+# CSV 줄 끝 (RFC 4180, CR이나 LF가 들어간 값은 따옴표로 감싸짐)
+CSV_LINE_TERMINATOR = "\r\n"
+
+# 스프레드시트가 수식으로 해석하는 값의 첫 글자
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# 끝나지 않은 작업 상태
+ACTIVE_STATUSES = (ExportStatus.QUEUED, ExportStatus.RUNNING)
+
+
+def export_value(value: Any, flat: bool) -> Any:
+    """내보낼 값을 JSON 호환 값으로 바꿉니다.
+
+    Args:
+        value (Any): 컬럼 값
+        flat (bool): CSV처럼 중첩 값(목록, 객체)을 JSON 문자열로 펴야 하는지 여부
+
+    Returns:
+        Any: 변환한 값
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if flat and isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def csv_value(value: Any) -> Any:
+    """CSV 셀 값을 만듭니다 (수식으로 해석될 수 있는 문자열은 `'`를 붙여 텍스트로 고정)."""
+    if value is None:
+        return ""
+    value = export_value(value, True)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def encode_csv(rows: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> str:
+    """행 배치를 CSV 문자열로 인코딩합니다 (헤더 제외)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=CSV_LINE_TERMINATOR)
+    for row in rows:
+        writer.writerow([csv_value(row[column]) for column in columns])
+    return buffer.getvalue()
+
+
+def encode_ndjson(rows: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> str:
+    """행 배치를 NDJSON 문자열로 인코딩합니다."""
+    return "".join(
+        json.dumps({column: export_value(row[column], False) for column in columns}, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+async def encode_rows(
+    partitions: AsyncIterator[Sequence[Mapping[str, Any]]],
+    format: str,
+    columns: Sequence[str],
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """행 배치 스트림을 CSV/NDJSON 바이트 스트림으로 인코딩합니다.
+
+    Args:
+        partitions (AsyncIterator[Sequence[Mapping[str, Any]]]): 행 배치 스트림
+        format (str): 형식 (csv | ndjson)
+        columns (Sequence[str]): 컬럼 이름 (CSV 헤더, NDJSON 키 순서)
+        compress (bool): gzip 압축 여부
+
+    Yields:
+        bytes: 배치 하나 분량의 인코딩(압축) 결과
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def emit(text: str) -> bytes:
+        data = text.encode()
+        return compressor.compress(data) if compressor is not None else data
+
+    if format == FORMAT_CSV:
+        header = io.StringIO()
+        csv.writer(header, lineterminator=CSV_LINE_TERMINATOR).writerow(columns)
+        chunk = emit(CSV_BOM + header.getvalue())
+        if chunk:
+            yield chunk
+    encode = encode_csv if format == FORMAT_CSV else encode_ndjson
+    async for rows in partitions:
+        chunk = emit(encode(rows, columns))
+        if chunk:
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def remove_if_exists(path: str) -> None:
+    """파일이 있으면 지웁니다."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def remove_files_before(directory: str, before: float) -> int:
+    """디렉터리 아래(테넌트별 하위 디렉터리 포함)에서 수정 시각이 `before`보다 이른 파일을 지웁니다.
+
+    Args:
+        directory (str): 저장소 디렉터리
+        before (float): 기준 시각 (Unix 초)
+
+    Returns:
+        int: 지운 파일 수
+    """
+    removed = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < before:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    return removed
+
+
+def job_read(job: ExportJob) -> ExportJobRead:
+    """내보내기 작업을 응답 스키마로 바꿉니다 (완료된 작업에는 다운로드 경로 포함)."""
+    download_url = f"/api/v1/exports/{job.id}/download" if job.status == ExportStatus.COMPLETED else None
+    return ExportJobRead.model_validate(job).model_copy(update={"download_url": download_url})
+
+
+def export_filename(name: str, format: str, compress: bool) -> str:
+    """내려받을 파일 이름을 만듭니다 (예: `history-2024-01-24.csv.gz`)."""
+    return f"{name}-{datetime.utcnow():%Y-%m-%d}.{format}{'.gz' if compress else ''}"
+
+
+class ExportService:
+    """스트리밍 내보내기와 비동기 내보내기 작업을 처리하는 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        storage_dir: Optional[str] = None,
+        batch_rows: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        worker_id: Optional[str] = None,
+        retention: Optional[float] = None,
+    ):
+        """내보내기 서비스를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+                (요청 세션과 별도로 응답을 보내는 동안 커서를 유지)
+            storage_dir (Optional[str]): 내보내기 작업 파일 저장 디렉터리
+            batch_rows (Optional[int]): 서버 측 커서에서 한 번에 읽는 행 수
+            concurrency (Optional[int]): 동시에 실행할 내보내기 작업 수
+            worker_id (Optional[str]): 작업에 남길 워커 식별자 (기본: 호스트-PID-난수)
+            retention (Optional[float]): 끝난 작업과 파일 보관 기간(초)
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.storage_dir = storage_dir or settings.EXPORT_STORAGE_DIR
+        self.batch_rows = batch_rows or settings.EXPORT_BATCH_ROWS
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+        self._slots = asyncio.Semaphore(concurrency or settings.EXPORT_JOB_CONCURRENCY)
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._heartbeat: Optional["asyncio.Task[None]"] = None
+        self.retention = settings.EXPORT_RETENTION_SECONDS if retention is None else retention
+        self.swept = 0
+        self._swept_at = time.monotonic()
+
+    async def partitions(self, query: Select) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """쿼리 결과를 서버 측 커서로 배치씩 읽습니다.
+
+        Args:
+            query (Select): 라벨을 붙인 컬럼을 선택하는 쿼리
+
+        Yields:
+            List[Mapping[str, Any]]: 최대 `batch_rows`행
+        """
+        async with self.session_factory() as session:
+            result = await session.stream(query.execution_options(yield_per=self.batch_rows))
+            async for partition in result.mappings().partitions():
+                yield partition
+
+    def stream(self, query: Select, format: str, compress: bool = False) -> AsyncIterator[bytes]:
+        """쿼리 결과를 인코딩한 바이트 스트림을 만듭니다.
+
+        Args:
+            query (Select): 라벨을 붙인 컬럼을 선택하는 쿼리
+            format (str): 형식 (csv | ndjson)
+            compress (bool): gzip 압축 여부
+
+        Returns:
+            AsyncIterator[bytes]: 인코딩된 바이트 스트림
+        """
+        columns = [column.key for column in query.selected_columns]
+        return encode_rows(self.partitions(query), format, columns, compress)
+
+    def response(self, query: Select, name: str, format: str, compress: bool = False) -> StreamingResponse:
+        """쿼리 결과를 내려받는 스트리밍 응답을 만듭니다.
+
+        Args:
+            query (Select): 라벨을 붙인 컬럼을 선택하는 쿼리
+            name (str): 파일 이름 접두어
+            format (str): 형식 (csv | ndjson)
+            compress (bool): gzip 압축 여부
+
+        Returns:
+            StreamingResponse: 첨부 파일 응답
+        """
+        filename = export_filename(name, format, compress)
+        return StreamingResponse(
+            self.stream(query, format, compress),
+            media_type=GZIP_MEDIA_TYPE if compress else EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
+        )
+
+    async def export(
+        self,
+        session: AsyncSession,
+        tenant_id: str,
+        user_id: str,
+        source: str,
+        query: Select,
+        format: str,
+        compress: bool = False,
+        background: bool = False,
+    ) -> Response:
+        """내보내기 요청을 스트리밍 응답 또는 비동기 작업(202)으로 처리합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션 (작업 생성용)
+            tenant_id (str): 테넌트 ID
+            user_id (str): 요청한 사용자 ID
+            source (str): 내보낼 데이터 이름 (파일 이름 접두어)
+            query (Select): 라벨을 붙인 컬럼을 선택하는 쿼리
+            format (str): 형식 (csv | ndjson)
+            compress (bool): gzip 압축 여부
+            background (bool): 작업으로 만들지 여부
+
+        Returns:
+            Response: 첨부 파일 스트리밍 응답 또는 작업 정보(202)
+        """
+        if not background:
+            return self.response(query, source, format, compress)
+        job = await self.submit(session, tenant_id, user_id, source, query, format, compress)
+        return JSONResponse(
+            job_read(job).model_dump(mode="json", by_alias=True), status_code=status.HTTP_202_ACCEPTED
+        )
+
+    async def submit(
+        self,
+        session: AsyncSession,
+        tenant_id: str,
+        user_id: str,
+        source: str,
+        query: Select,
+        format: str,
+        compress: bool = False,
+    ) -> ExportJob:
+        """내보내기 작업을 만들고 백그라운드에서 파일로 씁니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            tenant_id (str): 테넌트 ID
+            user_id (str): 요청한 사용자 ID
+            source (str): 내보낼 데이터 이름
+            query (Select): 라벨을 붙인 컬럼을 선택하는 쿼리
+            format (str): 형식 (csv | ndjson)
+            compress (bool): gzip 압축 여부
+
+        Returns:
+            ExportJob: 생성된 작업 (queued)
+        """
+        job = ExportJob(
+            tenant_id=tenant_id, user_id=user_id, source=source, format=format, compressed=compress,
+            owner=self.worker_id, heartbeat_at=datetime.utcnow(),
+        )
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        task = asyncio.create_task(self._run(job, query), name=f"export-{job.id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info("내보내기 작업 생성: tenant=%s job=%s source=%s", tenant_id, job.id, source)
+        return job
+
+    async def get(self, session: AsyncSession, tenant_id: str, user_id: str, job_id: str) -> ExportJob:
+        """요청한 사용자의 내보내기 작업을 조회합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            tenant_id (str): 테넌트 ID
+            user_id (str): 사용자 ID
+            job_id (str): 작업 ID
+
+        Returns:
+            ExportJob: 작업
+
+        Raises:
+            ExportJobNotFound: 작업이 없거나 다른 사용자의 작업인 경우
+        """
+        try:
+            parsed = UUID(job_id)
+        except ValueError:
+            raise ExportJobNotFound(job_id)
+        result = await session.execute(
+            select(ExportJob).where(
+                ExportJob.id == parsed, ExportJob.tenant_id == tenant_id, ExportJob.user_id == user_id
+            )
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            raise ExportJobNotFound(job_id)
+        return job
+
+    def file_path(self, job: ExportJob) -> str:
+        """작업 파일의 저장소 경로를 반환합니다."""
+        return os.path.join(self.storage_dir, job.path or "")
+
+    async def _run(self, job: ExportJob, query: Select) -> None:
+        """작업 파일을 쓰고 결과를 기록합니다 (스레드에서 임시 파일에 쓴 뒤 원자적으로 교체)."""
+        relative = os.path.join(
+            job.tenant_id, f"{job.id}.{job.format}{'.gz' if job.compressed else ''}"
+        )
+        path = os.path.join(self.storage_dir, relative)
+        temporary = f"{path}.tmp"
+        async with self._slots:
+            await self._update(job.id, status=ExportStatus.RUNNING)
+            rows = 0
+
+            async def counted() -> AsyncIterator[List[Mapping[str, Any]]]:
+                nonlocal rows
+                async for partition in self.partitions(query):
+                    rows += len(partition)
+                    yield partition
+
+            try:
+                await asyncio.to_thread(os.makedirs, os.path.dirname(path), exist_ok=True)
+                columns = [column.key for column in query.selected_columns]
+                exported = await asyncio.to_thread(open, temporary, "wb")
+                try:
+                    async for chunk in encode_rows(counted(), job.format, columns, job.compressed):
+                        await asyncio.to_thread(exported.write, chunk)
+                finally:
+                    await asyncio.to_thread(exported.close)
+                await asyncio.to_thread(os.replace, temporary, path)
+                size = await asyncio.to_thread(os.path.getsize, path)
+            except Exception as e:
+                logger.exception("내보내기 작업 실패: job=%s", job.id)
+                await self._update(job.id, status=ExportStatus.FAILED, error=str(e), rows=rows)
+                return
+            finally:
+                await asyncio.to_thread(remove_if_exists, temporary)
+            await self._update(
+                job.id, status=ExportStatus.COMPLETED, rows=rows, size=size, path=relative,
+                completed_at=datetime.utcnow(),
+            )
+
+    async def _update(self, job_id: UUID, **values) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(ExportJob).where(ExportJob.id == job_id).values(**values, updated_at=datetime.utcnow())
+            )
+            await session.commit()
+
+    async def heartbeat(self) -> int:
+        """이 워커가 실행 중인 작업의 하트비트를 갱신합니다.
+
+        Returns:
+            int: 갱신한 작업 수
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(ExportJob)
+                .where(ExportJob.owner == self.worker_id, ExportJob.status.in_(ACTIVE_STATUSES))
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def fail_stale(self, stale_after: Optional[float] = None) -> int:
+        """하트비트가 끊긴 작업(죽은 워커의 작업)을 실패로 표시합니다 (다시 요청해야 함).
+
+        Args:
+            stale_after (Optional[float]): 하트비트가 끊긴 것으로 보는 시간(초)
+
+        Returns:
+            int: 실패로 표시한 작업 수
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=stale_after or settings.EXPORT_STALE_SECONDS)
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(ExportJob)
+                .where(
+                    ExportJob.status.in_(ACTIVE_STATUSES),
+                    ExportJob.owner != self.worker_id,
+                    ExportJob.heartbeat_at < cutoff,
+                )
+                .values(status=ExportStatus.FAILED, error="작업을 실행하던 서버가 중단되었습니다",
+                        updated_at=datetime.utcnow())
+            )
+            await session.commit()
+        if result.rowcount:
+            logger.warning("중단된 내보내기 작업 %d건을 실패로 표시", result.rowcount)
+        return result.rowcount
+
+    async def sweep(self) -> int:
+        """보관 기간이 지난 작업 파일과 끝난 작업 행을 배치 단위로 삭제합니다.
+
+        파일은 수정 시각으로 고르므로 행 없이 남은 파일(완료 기록 전에 중단된 작업, 임시 파일)도 함께
+        지웁니다. 실행 중인 작업은 오래되었어도 삭제하지 않습니다.
+
+        Returns:
+            int: 삭제한 작업 수
+        """
+        files = await asyncio.to_thread(remove_files_before, self.storage_dir, time.time() - self.retention)
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        expired = (
+            select(ExportJob.id)
+            .where(ExportJob.status.not_in(ACTIVE_STATUSES), ExportJob.updated_at < cutoff)
+            .limit(self.batch_rows)
+        )
+        deleted = 0
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(delete(ExportJob).where(ExportJob.id.in_(expired.scalar_subquery())))
+                await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.batch_rows:
+                break
+        self._swept_at = time.monotonic()
+        self.swept += deleted
+        if deleted or files:
+            logger.info("만료된 내보내기 작업 정리: jobs=%d files=%d", deleted, files)
+        return deleted
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """하트비트가 끊긴 작업을 실패로 표시하고, 주기적으로 하트비트를 갱신하는 백그라운드 작업을 시작합니다.
+
+        같은 주기에 EXPORT_SWEEP_INTERVAL_SECONDS가 지났으면 보관 기간이 지난 작업도 정리합니다.
+
+        Args:
+            interval (Optional[float]): 하트비트 갱신 주기(초)
+        """
+        try:
+            await self.fail_stale()
+        except Exception:
+            logger.exception("중단된 내보내기 작업 정리 실패")
+        if self._heartbeat is not None and not self._heartbeat.done():
+            return
+        interval = interval or settings.EXPORT_HEARTBEAT_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.heartbeat()
+                    await self.fail_stale()
+                except Exception:
+                    logger.exception("내보내기 작업 하트비트 갱신 실패")
+                if time.monotonic() - self._swept_at >= settings.EXPORT_SWEEP_INTERVAL_SECONDS:
+                    try:
+                        await self.sweep()
+                    except Exception:
+                        logger.exception("만료된 내보내기 작업 정리 실패")
+
+        self._heartbeat = asyncio.create_task(_loop(), name="export-heartbeat")
+
+    async def wait(self) -> None:
+        """실행 중인 작업이 모두 끝날 때까지 기다립니다."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """하트비트 작업과 실행 중인 작업을 취소합니다."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        for task in list(self._tasks):
+            task.cancel()
+        await self.wait()
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(ExportJob)
+                    .where(ExportJob.owner == self.worker_id, ExportJob.status.in_(ACTIVE_STATUSES))
+                    .values(status=ExportStatus.FAILED, error="서버 종료로 중단되었습니다", updated_at=datetime.utcnow())
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("종료 시 내보내기 작업 상태 기록 실패")
+
+
+# 전역 내보내기 서비스 인스턴스
+export_service = ExportService()
+
+
+def get_export_service() -> ExportService:
+    """내보내기 서비스 인스턴스를 반환합니다.
+
+    Returns:
+        ExportService: 전역 내보내기 서비스
+    """
+    return export_service
@@ -0,0 +1,5 @@
+"""
+모니터링 도메인
+
+테넌트 알림 관련 모듈들
+"""
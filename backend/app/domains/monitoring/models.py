@@ -0,0 +1,87 @@
+"""
+모니터링 도메인 모델
+
+테넌트 알림 SQLModel 모델 정의 (프론트엔드 `use-alert-center` 형식)
+"""
+
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class AlertSeverity(str, Enum):
+    """알림 심각도 열거형입니다."""
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+class AlertStatus(str, Enum):
+    """알림 처리 상태 열거형입니다."""
+    ACTIVE = "active"
+    ACKNOWLEDGED = "acknowledged"
+    RESOLVED = "resolved"
+
+
+class Alert(SQLModel, TimestampMixin, table=True):
+    """테넌트 알림을 저장하는 모델입니다.
+
+    Attributes:
+        id (UUID): 알림 고유 ID
+        tenant_id (str): 테넌트 ID
+        title (str): 제목
+        message (str): 내용
+        severity (AlertSeverity): 심각도
+        category (str): 분류 (system | performance | database | network | security | document | user)
+        status (AlertStatus): 처리 상태
+        source (Optional[str]): 발생 위치
+        details (Dict[str, Any]): 부가 정보
+    """
+
+    __tablename__ = "alerts"
+    __table_args__ = (
+        # 내보내기: 테넌트 알림을 발생 순서대로 인덱스에서 읽음
+        Index("ix_alerts_tenant_created", "tenant_id", "created_at"),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="알림 고유 ID"
+    )
+    tenant_id: str = Field(
+        description="테넌트 ID (멀티테넌시)"
+    )
+    title: str = Field(
+        description="제목"
+    )
+    message: str = Field(
+        default="",
+        description="내용"
+    )
+    severity: AlertSeverity = Field(
+        default=AlertSeverity.MEDIUM,
+        description="심각도"
+    )
+    category: str = Field(
+        default="system",
+        description="분류"
+    )
+    status: AlertStatus = Field(
+        default=AlertStatus.ACTIVE,
+        description="처리 상태"
+    )
+    source: Optional[str] = Field(
+        default=None,
+        description="발생 위치"
+    )
+    details: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="부가 정보"
+    )
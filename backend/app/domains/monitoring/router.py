@@ -0,0 +1,68 @@
+"""
+모니터링 도메인 라우터
+
+알림 내보내기 REST API 엔드포인트
+"""
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import get_db_session
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from ..exports.services import ExportService, get_export_service
+from .models import Alert
+
+# 모니터링 라우터 생성
+router = APIRouter(prefix="/api/v1/monitoring", tags=["모니터링"])
+
+
+@router.get(
+    "/alerts/export",
+    response_class=Response,
+    summary="알림 내보내기",
+    description="현재 테넌트의 알림을 발생 순서대로 CSV 또는 NDJSON(gzip 선택)으로 스트리밍합니다. "
+    "mode=job이면 비동기 작업을 만들고 202를 반환합니다."
+)
+async def export_alerts(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    exports: Annotated[ExportService, Depends(get_export_service)],
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    mode: Literal["stream", "job"] = "stream"
+) -> Response:
+    """알림 내보내기 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        exports (ExportService): 내보내기 서비스
+        format (str): 형식 (csv | ndjson)
+        gzip (bool): gzip 압축 여부
+        mode (str): stream(바로 내려받기) | job(비동기 작업)
+
+    Returns:
+        Response: 첨부 파일 스트리밍 응답 또는 작업 정보(202)
+    """
+    query = (
+        select(
+            Alert.id.label("id"),
+            Alert.title.label("title"),
+            Alert.message.label("message"),
+            Alert.severity.label("severity"),
+            Alert.category.label("category"),
+            Alert.status.label("status"),
+            Alert.created_at.label("timestamp"),
+            Alert.source.label("source"),
+            Alert.details.label("metadata"),
+        )
+        .where(Alert.tenant_id == token.tenant_id)
+        .order_by(Alert.created_at, Alert.id)
+    )
+    return await exports.export(
+        session, token.tenant_id, token.sub, "alerts", query, format, gzip, background=mode == "job"
+    )
@@ -0,0 +1,5 @@
+"""
+파이프라인 도메인
+
+테넌트 간 공정 작업 스케줄러와 재처리 작업 관련 모듈들
+"""
@@ -0,0 +1,91 @@
+"""
+파이프라인 도메인 모델
+
+작업 우선순위 클래스와 재처리 작업 SQLModel 모델 정의
+"""
+
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class PriorityClass(str, Enum):
+    """파이프라인 작업 우선순위 클래스 열거형입니다 (앞일수록 가중치가 큼)."""
+    INTERACTIVE = "interactive"
+    REVIEW = "review"
+    BULK = "bulk"
+
+
+class JobStatus(str, Enum):
+    """재처리 작업 상태 열거형입니다."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ReprocessJob(SQLModel, TimestampMixin, table=True):
+    """문서 재처리 작업을 저장하는 모델입니다.
+
+    대량 작업은 `batch_size`건씩 나눠 스케줄러에 올리고, 앞에서부터 연속으로 끝난 문서 수를
+    `cursor`에 기록합니다. 서버가 재시작되면 `cursor` 이후 문서부터 이어서 처리합니다.
+
+    Attributes:
+        id (UUID): 작업 고유 ID
+        tenant_id (str): 테넌트 ID
+        priority (PriorityClass): 우선순위 클래스
+        status (JobStatus): 작업 상태
+        document_ids (List[str]): 재처리할 문서 ID (요청 순서)
+        total (int): 문서 수
+        batch_size (int): 배치당 문서 수
+        cursor (int): 앞에서부터 연속으로 처리가 끝난 문서 수
+        error (Optional[str]): 실패 사유
+    """
+
+    __tablename__ = "reprocess_jobs"
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="작업 고유 ID"
+    )
+    tenant_id: str = Field(
+        index=True,
+        description="테넌트 ID (멀티테넌시)"
+    )
+    priority: PriorityClass = Field(
+        default=PriorityClass.BULK,
+        description="우선순위 클래스"
+    )
+    status: JobStatus = Field(
+        default=JobStatus.QUEUED,
+        index=True,
+        description="작업 상태"
+    )
+    document_ids: List[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON, nullable=False),
+        description="재처리할 문서 ID"
+    )
+    total: int = Field(
+        default=0,
+        description="문서 수"
+    )
+    batch_size: int = Field(
+        default=500,
+        description="배치당 문서 수"
+    )
+    cursor: int = Field(
+        default=0,
+        description="연속으로 처리가 끝난 문서 수"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="실패 사유"
+    )
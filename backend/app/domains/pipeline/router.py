@@ -0,0 +1,168 @@
+"""
+파이프라인 도메인 라우터
+
+재처리 작업과 파이프라인 큐 통계 REST API 엔드포인트
+"""
+
+from typing import Annotated, List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import get_db_session
+from ...common.exceptions import BusinessException, business_exception_handler
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from .schemas import PipelineQueueStats, ReprocessJobRead, ReprocessRequest
+from .services import ReprocessRunner, ReprocessService, get_reprocess_runner
+
+
+def get_reprocess_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    runner: Annotated[ReprocessRunner, Depends(get_reprocess_runner)]
+) -> ReprocessService:
+    """ReprocessService 의존성을 제공합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션
+        runner (ReprocessRunner): 재처리 실행기
+
+    Returns:
+        ReprocessService: 재처리 서비스 인스턴스
+    """
+    return ReprocessService(session, runner)
+
+
+# 파이프라인 라우터 생성
+router = APIRouter(prefix="/api/v1/pipeline", tags=["파이프라인"])
+
+
+@router.post(
+    "/reprocess",
+    response_model=ReprocessJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="문서 재처리",
+    description="문서 재처리 작업을 만들고 배치로 나눠 파이프라인 큐에 올립니다. "
+    "테넌트 간 공정 배분과 우선순위 클래스(review > bulk)에 따라 실행됩니다."
+)
+async def create_reprocess_job(
+    request: ReprocessRequest,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> ReprocessJobRead:
+    """문서 재처리 엔드포인트입니다.
+
+    Args:
+        request (ReprocessRequest): 문서 ID와 우선순위
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ReprocessService): 재처리 서비스
+
+    Returns:
+        ReprocessJobRead: 생성된 작업
+    """
+    return await service.create_job(token.tenant_id, request)
+
+
+@router.get(
+    "/reprocess",
+    response_model=List[ReprocessJobRead],
+    summary="재처리 작업 목록",
+    description="현재 테넌트의 최근 재처리 작업과 진행 위치를 조회합니다."
+)
+async def list_reprocess_jobs(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> List[ReprocessJobRead]:
+    """재처리 작업 목록 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ReprocessService): 재처리 서비스
+
+    Returns:
+        List[ReprocessJobRead]: 최신순 작업 목록
+    """
+    return await service.list_jobs(token.tenant_id)
+
+
+@router.get(
+    "/reprocess/{job_id}",
+    response_model=ReprocessJobRead,
+    summary="재처리 작업 조회",
+    description="재처리 작업의 상태와 진행 위치를 조회합니다."
+)
+async def get_reprocess_job(
+    job_id: UUID,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> ReprocessJobRead:
+    """재처리 작업 조회 엔드포인트입니다.
+
+    Args:
+        job_id (UUID): 작업 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ReprocessService): 재처리 서비스
+
+    Returns:
+        ReprocessJobRead: 작업 진행 상태
+
+    Raises:
+        HTTPException: 작업이 없는 경우 (404)
+    """
+    try:
+        return await service.get_job(token.tenant_id, job_id)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.delete(
+    "/reprocess/{job_id}",
+    response_model=ReprocessJobRead,
+    summary="재처리 작업 취소",
+    description="끝나지 않은 재처리 작업을 취소합니다. 큐에서 대기 중인 배치는 빠지고 실행 중인 배치는 끝까지 돕니다."
+)
+async def cancel_reprocess_job(
+    job_id: UUID,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> ReprocessJobRead:
+    """재처리 작업 취소 엔드포인트입니다.
+
+    Args:
+        job_id (UUID): 작업 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ReprocessService): 재처리 서비스
+
+    Returns:
+        ReprocessJobRead: 취소 후 작업 상태
+
+    Raises:
+        HTTPException: 작업이 없는 경우 (404)
+    """
+    try:
+        return await service.cancel_job(token.tenant_id, job_id)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.get(
+    "/queue/stats",
+    response_model=PipelineQueueStats,
+    summary="파이프라인 큐 통계",
+    description="우선순위 클래스별 대기 작업 수와 큐 대기 시간 p50/p95를 전체와 현재 테넌트 기준으로 조회합니다."
+)
+async def queue_stats(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> PipelineQueueStats:
+    """파이프라인 큐 통계 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ReprocessService): 재처리 서비스
+
+    Returns:
+        PipelineQueueStats: 클래스별 대기 작업 수와 대기 시간
+    """
+    return service.queue_stats(token.tenant_id)
@@ -0,0 +1,516 @@
+"""
+파이프라인 작업 스케줄러
+
+테넌트 간 가중 공정 큐(weighted fair queuing)로 파이프라인 작업을 배분합니다.
+
+- 우선순위 클래스(interactive 업로드 > review 검토 수정 > bulk 대량 재처리)를 가중치대로
+  번갈아 꺼내므로 높은 클래스가 대부분의 처리량을 받되 bulk도 완전히 멈추지 않습니다.
+- 클래스 안에서는 테넌트별 흐름을 시작 시각 공정 큐(SFQ)로 번갈아 꺼냅니다. 한 테넌트가
+  20만 건을 재처리해도 다른 테넌트의 작업은 그 뒤에 줄 서지 않고 자기 몫을 받습니다.
+- 테넌트별 동시 실행 상한에 걸린 흐름은 실행 중인 작업이 끝날 때까지 후보에서 빠집니다.
+- 큐 진입부터 실행 시작까지의 대기 시간을 클래스/테넌트별로 기록해 p50/p95로 노출합니다.
+- 재처리 배치 발행뿐 아니라 프로세스 안의 단계 처리(`documents.parsed`의 색인/검증)도 `stage`로
+  감싸 이 큐를 거치게 하므로, 대량 재처리 문서가 업로드 문서의 색인/검증 앞에 줄 서지 않습니다.
+  단계 이벤트의 `priority`가 없으면 업로드(interactive)로 봅니다. 파싱/OCR은 이 프로세스 밖의
+  컨슈머가 수행하므로, 그 컨슈머가 `documents.uploaded`의 `priority`를 존중하고
+  `documents.parsed`에 그대로 실어 보내야 끝까지 공정하게 배분됩니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, DefaultDict, Deque, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from ...common.config import settings
+from .models import PriorityClass
+
+logger = logging.getLogger(__name__)
+
+# 클래스/테넌트별로 보관할 최근 대기 시간 표본 수
+WAIT_WINDOW = 1024
+
+# 작업 종류별 실행 함수
+WorkHandler = Callable[["WorkItem"], Awaitable[None]]
+
+# 스케줄러를 거쳐 실행할 단계 이벤트 핸들러
+StageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# 공정 큐를 거치는 `documents.parsed` 단계 작업 종류
+INDEX_STAGE_KIND = "documents.parsed.index"
+VALIDATE_STAGE_KIND = "documents.parsed.validate"
+
+
+def default_class_weights() -> Dict[PriorityClass, float]:
+    """설정의 우선순위 클래스 가중치를 반환합니다."""
+    return {
+        PriorityClass.INTERACTIVE: settings.PIPELINE_WEIGHT_INTERACTIVE,
+        PriorityClass.REVIEW: settings.PIPELINE_WEIGHT_REVIEW,
+        PriorityClass.BULK: settings.PIPELINE_WEIGHT_BULK,
+    }
+
+
+@dataclass
+class WorkItem:
+    """스케줄러가 실행할 파이프라인 작업 하나입니다.
+
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        priority (PriorityClass): 우선순위 클래스
+        kind (str): 작업 종류 (실행 함수 선택)
+        payload (Dict[str, Any]): 실행 함수에 넘길 값
+        cost (float): 상대 비용 (보통 문서 수, 공정 배분의 단위)
+        item_id (str): 작업 ID
+        enqueued_at (float): 큐 진입 시각 (monotonic)
+        done (Optional[asyncio.Future]): 실행 결과를 기다리는 호출자의 퓨처 (`run`으로 넣은 작업)
+    """
+
+    tenant_id: str
+    priority: PriorityClass
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    cost: float = 1.0
+    item_id: str = field(default_factory=lambda: uuid4().hex)
+    enqueued_at: float = field(default_factory=time.monotonic)
+    done: Optional["asyncio.Future[None]"] = field(default=None, repr=False, compare=False)
+
+
+class _Flow:
+    """한 클래스 안의 테넌트별 작업 흐름입니다."""
+
+    __slots__ = ("tenant_id", "priority", "items", "start", "finish", "queued")
+
+    def __init__(self, tenant_id: str, priority: PriorityClass):
+        self.tenant_id = tenant_id
+        self.priority = priority
+        self.items: Deque[WorkItem] = deque()
+        self.start = 0.0
+        self.finish = 0.0
+        # 클래스 힙이나 상한 대기 목록에 들어 있는지 여부
+        self.queued = False
+
+
+class _ClassQueue:
+    """우선순위 클래스 하나의 흐름 힙과 가상 시각입니다."""
+
+    __slots__ = ("priority", "rank", "weight", "flows", "heap", "vtime", "start", "finish", "depth")
+
+    def __init__(self, priority: PriorityClass, rank: int, weight: float):
+        self.priority = priority
+        self.rank = rank
+        self.weight = weight
+        self.flows: Dict[str, _Flow] = {}
+        self.heap: List[Tuple[float, int, _Flow]] = []
+        self.vtime = 0.0
+        self.start = 0.0
+        self.finish = 0.0
+        self.depth = 0
+
+
+class WaitStats:
+    """클래스/테넌트별 큐 대기 시간 통계 클래스입니다."""
+
+    def __init__(self, window: int = WAIT_WINDOW):
+        """대기 시간 통계를 초기화합니다.
+
+        Args:
+            window (int): 키마다 보관할 최근 표본 수
+        """
+        self.window = window
+        self._waits: DefaultDict[Tuple[str, Optional[str]], Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+        self._counts: DefaultDict[Tuple[str, Optional[str]], int] = defaultdict(int)
+
+    def record(self, priority: PriorityClass, tenant_id: str, seconds: float) -> None:
+        """대기 시간 하나를 클래스 전체와 테넌트 키에 기록합니다."""
+        for key in ((priority.value, None), (priority.value, tenant_id)):
+            self._waits[key].append(seconds)
+            self._counts[key] += 1
+
+    def summary(self, priority: PriorityClass, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+        """대기 시간 요약을 반환합니다.
+
+        Args:
+            priority (PriorityClass): 우선순위 클래스
+            tenant_id (Optional[str]): 테넌트 ID (없으면 클래스 전체)
+
+        Returns:
+            Dict[str, Any]: 누적 시작 수와 최근 표본의 p50/p95/최댓값(ms)
+        """
+        key = (priority.value, tenant_id)
+        waits = np.fromiter(self._waits.get(key, ()), dtype=np.float64)
+        if waits.size == 0:
+            return {"started": self._counts.get(key, 0), "p50Ms": None, "p95Ms": None, "maxMs": None}
+        p50, p95 = np.percentile(waits, [50, 95]) * 1000
+        return {
+            "started": self._counts[key],
+            "p50Ms": round(float(p50), 2),
+            "p95Ms": round(float(p95), 2),
+            "maxMs": round(float(waits.max()) * 1000, 2),
+        }
+
+
+class FairScheduler:
+    """우선순위 클래스와 테넌트 두 단계의 가중 공정 큐 클래스입니다.
+
+    클래스 단계와 테넌트 단계 모두 시작 시각 공정 큐(start-time fair queuing)를 씁니다.
+    흐름이 비어 있다가 작업이 들어오면 시작 태그를 현재 가상 시각으로 당기므로, 쉬던 테넌트가
+    밀린 몫을 한꺼번에 가져가지 않습니다. 이벤트 루프 한 곳에서만 호출해야 합니다.
+    """
+
+    def __init__(
+        self,
+        class_weights: Optional[Dict[PriorityClass, float]] = None,
+        tenant_concurrency: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """스케줄러를 초기화합니다.
+
+        Args:
+            class_weights (Optional[Dict[PriorityClass, float]]): 클래스별 가중치
+            tenant_concurrency (Optional[int]): 테넌트별 동시 실행 상한
+            clock (Callable[[], float]): 대기 시간 측정용 시계
+        """
+        weights = class_weights or default_class_weights()
+        self._classes = [
+            _ClassQueue(priority, rank, weights[priority]) for rank, priority in enumerate(PriorityClass)
+        ]
+        self._by_priority = {queue.priority: queue for queue in self._classes}
+        self.tenant_concurrency = tenant_concurrency or settings.PIPELINE_TENANT_CONCURRENCY
+        self.clock = clock
+        self.waits = WaitStats()
+        self._tenant_weights: Dict[str, float] = {}
+        self._running: DefaultDict[str, int] = defaultdict(int)
+        self._blocked: DefaultDict[str, List[_Flow]] = defaultdict(list)
+        self._vtime = 0.0
+        self._seq = itertools.count()
+
+    def set_tenant_weight(self, tenant_id: str, weight: float) -> None:
+        """테넌트 가중치를 설정합니다 (기본 1, 요금제별 차등 배분용)."""
+        self._tenant_weights[tenant_id] = weight
+
+    def submit(self, item: WorkItem) -> None:
+        """작업을 큐에 넣습니다.
+
+        Args:
+            item (WorkItem): 파이프라인 작업
+        """
+        queue = self._by_priority[item.priority]
+        flow = queue.flows.get(item.tenant_id)
+        if flow is None:
+            flow = queue.flows[item.tenant_id] = _Flow(item.tenant_id, item.priority)
+        flow.items.append(item)
+        queue.depth += 1
+        if not flow.queued:
+            flow.start = max(queue.vtime, flow.finish)
+            self._enqueue(queue, flow)
+
+    def next(self) -> Optional[WorkItem]:
+        """공정 순서상 다음 작업을 꺼내 실행 중으로 표시합니다.
+
+        Returns:
+            Optional[WorkItem]: 실행할 작업 (실행할 수 있는 작업이 없으면 None)
+        """
+        while True:
+            ready = [queue for queue in self._classes if queue.heap]
+            if not ready:
+                return None
+            queue = min(ready, key=lambda q: (q.start, q.rank))
+            _, _, flow = heapq.heappop(queue.heap)
+            flow.queued = False
+            if not flow.items:
+                continue
+            if self._running.get(flow.tenant_id, 0) >= self.tenant_concurrency:
+                # 다른 클래스 작업으로 상한에 도달한 테넌트: 슬롯이 날 때까지 보류
+                flow.queued = True
+                self._blocked[flow.tenant_id].append(flow)
+                continue
+
+            item = flow.items.popleft()
+            queue.depth -= 1
+            self._vtime = queue.start
+            queue.vtime = flow.start
+            queue.finish = queue.start + item.cost / queue.weight
+            queue.start = queue.finish
+            flow.finish = flow.start + item.cost / self._tenant_weights.get(flow.tenant_id, 1.0)
+            self._running[flow.tenant_id] += 1
+            if flow.items:
+                flow.start = flow.finish
+                self._enqueue(queue, flow)
+            self.waits.record(item.priority, item.tenant_id, self.clock() - item.enqueued_at)
+            return item
+
+    def complete(self, item: WorkItem) -> None:
+        """실행이 끝난 작업의 테넌트 슬롯을 반환하고 보류된 흐름을 되살립니다.
+
+        Args:
+            item (WorkItem): `next`로 꺼낸 작업
+        """
+        tenant_id = item.tenant_id
+        self._running[tenant_id] -= 1
+        if self._running[tenant_id] <= 0:
+            del self._running[tenant_id]
+        blocked = self._blocked.pop(tenant_id, None)
+        for flow in blocked or ():
+            queue = self._by_priority[flow.priority]
+            flow.start = max(queue.vtime, flow.start)
+            self._push(queue, flow)
+
+    def discard(self, predicate: Callable[[WorkItem], bool]) -> int:
+        """아직 시작하지 않은 작업 중 조건에 맞는 것을 제거합니다.
+
+        Args:
+            predicate (Callable[[WorkItem], bool]): 제거할 작업 조건
+
+        Returns:
+            int: 제거한 작업 수
+        """
+        removed = 0
+        for queue in self._classes:
+            for flow in queue.flows.values():
+                kept = deque(item for item in flow.items if not predicate(item))
+                removed += len(flow.items) - len(kept)
+                queue.depth -= len(flow.items) - len(kept)
+                flow.items = kept
+        return removed
+
+    def depth(self, priority: PriorityClass, tenant_id: Optional[str] = None) -> int:
+        """대기 중인 작업 수를 반환합니다.
+
+        Args:
+            priority (PriorityClass): 우선순위 클래스
+            tenant_id (Optional[str]): 테넌트 ID (없으면 클래스 전체)
+
+        Returns:
+            int: 대기 작업 수
+        """
+        queue = self._by_priority[priority]
+        if tenant_id is None:
+            return queue.depth
+        flow = queue.flows.get(tenant_id)
+        return len(flow.items) if flow is not None else 0
+
+    def running(self, tenant_id: Optional[str] = None) -> int:
+        """실행 중인 작업 수를 반환합니다 (테넌트를 주면 그 테넌트만)."""
+        if tenant_id is None:
+            return sum(self._running.values())
+        return self._running.get(tenant_id, 0)
+
+    def stats(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+        """클래스별 대기 작업 수와 대기 시간 요약을 반환합니다 (camelCase).
+
+        Args:
+            tenant_id (Optional[str]): 함께 볼 테넌트 ID
+
+        Returns:
+            Dict[str, Any]: 클래스별 전체/테넌트 대기 작업 수와 대기 시간, 실행 중 작업 수
+        """
+        classes = []
+        for queue in self._classes:
+            entry = {
+                "priority": queue.priority.value,
+                "weight": queue.weight,
+                "queued": queue.depth,
+                "wait": self.waits.summary(queue.priority),
+            }
+            if tenant_id is not None:
+                entry["tenant"] = {
+                    "queued": self.depth(queue.priority, tenant_id),
+                    "wait": self.waits.summary(queue.priority, tenant_id),
+                }
+            classes.append(entry)
+        stats: Dict[str, Any] = {"running": self.running(), "classes": classes}
+        if tenant_id is not None:
+            stats["tenantRunning"] = self.running(tenant_id)
+            stats["tenantConcurrency"] = self.tenant_concurrency
+        return stats
+
+    def _enqueue(self, queue: _ClassQueue, flow: _Flow) -> None:
+        flow.queued = True
+        if self._running.get(flow.tenant_id, 0) >= self.tenant_concurrency:
+            self._blocked[flow.tenant_id].append(flow)
+        else:
+            self._push(queue, flow)
+
+    def _push(self, queue: _ClassQueue, flow: _Flow) -> None:
+        if not queue.heap:
+            # 쉬던 클래스는 현재 가상 시각에서 다시 시작한다
+            queue.start = max(self._vtime, queue.finish)
+        flow.queued = True
+        heapq.heappush(queue.heap, (flow.start, next(self._seq), flow))
+
+
+class PipelineScheduler:
+    """공정 큐에서 작업을 꺼내 종류별 실행 함수로 돌리는 비동기 디스패처 클래스입니다."""
+
+    def __init__(self, workers: Optional[int] = None, queue: Optional[FairScheduler] = None):
+        """디스패처를 초기화합니다.
+
+        Args:
+            workers (Optional[int]): 동시에 실행할 작업 수
+            queue (Optional[FairScheduler]): 공정 큐
+        """
+        self.workers = workers or settings.PIPELINE_WORKERS
+        self.queue = queue or FairScheduler()
+        self._handlers: Dict[str, WorkHandler] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._outstanding = 0
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def register(self, kind: str, handler: WorkHandler) -> None:
+        """작업 종류의 실행 함수를 등록합니다.
+
+        Args:
+            kind (str): 작업 종류
+            handler (WorkHandler): `WorkItem`을 받는 비동기 함수
+        """
+        self._handlers[kind] = handler
+
+    def stage(self, kind: str, handler: StageHandler) -> StageHandler:
+        """이벤트 핸들러를 공정 큐를 거쳐 실행되는 단계 핸들러로 감쌉니다.
+
+        감싼 핸들러는 이벤트를 이벤트의 테넌트와 `priority`(없으면 interactive) 작업으로 큐에 넣고
+        실행이 끝날 때까지 기다리므로, 발행자는 지금처럼 처리 완료 후에 다음으로 넘어갑니다.
+
+        Args:
+            kind (str): 작업 종류
+            handler (StageHandler): 이벤트 값을 받는 비동기 함수
+
+        Returns:
+            StageHandler: 이벤트 버스에 등록할 핸들러
+        """
+        async def execute(item: WorkItem) -> None:
+            await handler(item.payload)
+
+        async def admitted(event: Dict[str, Any]) -> None:
+            priority = PriorityClass(event.get("priority") or PriorityClass.INTERACTIVE.value)
+            await self.run(WorkItem(tenant_id=event["tenant_id"], priority=priority, kind=kind, payload=event))
+
+        self.register(kind, execute)
+        return admitted
+
+    async def run(self, item: WorkItem) -> None:
+        """작업을 큐에 넣고 공정 순서대로 실행되어 끝날 때까지 기다립니다.
+
+        기다리던 호출자가 취소되면 아직 시작하지 않은 작업은 큐에서 뺍니다.
+
+        Args:
+            item (WorkItem): 파이프라인 작업
+
+        Raises:
+            Exception: 실행 함수가 올린 예외
+        """
+        item.done = asyncio.get_running_loop().create_future()
+        self.submit(item)
+        try:
+            await item.done
+        except asyncio.CancelledError:
+            self.discard(lambda queued: queued is item)
+            raise
+
+    def submit(self, item: WorkItem) -> None:
+        """작업을 큐에 넣고 쉬고 있는 작업자를 깨웁니다.
+
+        Args:
+            item (WorkItem): 파이프라인 작업
+        """
+        self.queue.submit(item)
+        self._outstanding += 1
+        self._idle.clear()
+        self._wakeup.set()
+
+    def discard(self, predicate: Callable[[WorkItem], bool]) -> int:
+        """아직 시작하지 않은 작업 중 조건에 맞는 것을 제거합니다."""
+        removed = self.queue.discard(predicate)
+        self._settle(removed)
+        return removed
+
+    async def join(self) -> None:
+        """큐에 넣은 작업이 모두 끝날 때까지 기다립니다."""
+        await self._idle.wait()
+
+    async def start(self) -> None:
+        """작업자 태스크를 시작합니다."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"pipeline-worker-{i}") for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """작업자 태스크를 중지합니다.
+
+        실행 중인 작업은 취소하고, 큐의 작업 중 `run`으로 기다리는 호출자가 있는 것은 빼서 호출자를
+        취소합니다 (재처리 배치처럼 기다리는 호출자가 없는 작업은 큐에 그대로 남김).
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        waiting: List[WorkItem] = []
+
+        def awaited(item: WorkItem) -> bool:
+            if item.done is None:
+                return False
+            waiting.append(item)
+            return True
+
+        self.discard(awaited)
+        for item in waiting:
+            item.done.cancel()
+
+    def _settle(self, count: int) -> None:
+        self._outstanding -= count
+        if self._outstanding <= 0:
+            self._outstanding = 0
+            self._idle.set()
+
+    async def _work(self) -> None:
+        while True:
+            item = self.queue.next()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            try:
+                await self._handlers[item.kind](item)
+            except asyncio.CancelledError:
+                if item.done is not None:
+                    item.done.cancel()
+                raise
+            except Exception as exc:
+                if item.done is not None and not item.done.done():
+                    # 기다리는 호출자(이벤트 버스)가 실패를 로깅한다
+                    item.done.set_exception(exc)
+                else:
+                    logger.exception("파이프라인 작업 실패 (kind=%s, tenant=%s)", item.kind, item.tenant_id)
+            else:
+                if item.done is not None and not item.done.done():
+                    item.done.set_result(None)
+            finally:
+                self.queue.complete(item)
+                self._settle(1)
+                # 슬롯이 나서 보류 흐름이 풀렸을 수 있다
+                self._wakeup.set()
+
+
+# 전역 파이프라인 스케줄러 인스턴스
+pipeline_scheduler = PipelineScheduler()
+
+
+def get_pipeline_scheduler() -> PipelineScheduler:
+    """파이프라인 스케줄러 인스턴스를 반환합니다.
+
+    Returns:
+        PipelineScheduler: 전역 파이프라인 스케줄러
+    """
+    return pipeline_scheduler
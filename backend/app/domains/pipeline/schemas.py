@@ -0,0 +1,60 @@
+"""
+파이프라인 도메인 스키마
+
+재처리 작업 API 요청/응답 스키마 (camelCase 응답)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.alias_generators import to_camel
+
+from .models import JobStatus, PriorityClass
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+
+class ReprocessRequest(CamelModel):
+    """문서 재처리 요청 스키마입니다."""
+
+    document_ids: List[str] = Field(min_length=1, max_length=500_000, description="재처리할 문서 ID")
+    priority: Optional[PriorityClass] = Field(
+        default=None, description="우선순위 클래스 (review 또는 bulk, 기본: 배치 하나 분량이면 review)"
+    )
+
+    @field_validator("priority")
+    @classmethod
+    def validate_priority(cls, v: Optional[PriorityClass]) -> Optional[PriorityClass]:
+        """interactive 클래스는 새 업로드 전용입니다."""
+        if v == PriorityClass.INTERACTIVE:
+            raise ValueError("interactive 클래스는 업로드 전용입니다")
+        return v
+
+
+class ReprocessJobRead(CamelModel):
+    """재처리 작업 조회 응답 스키마입니다."""
+
+    id: UUID = Field(description="작업 고유 ID")
+    priority: PriorityClass = Field(description="우선순위 클래스")
+    status: JobStatus = Field(description="작업 상태")
+    total: int = Field(description="문서 수")
+    batch_size: int = Field(description="배치당 문서 수")
+    cursor: int = Field(description="연속으로 처리가 끝난 문서 수 (재시작 시 이어서 처리할 위치)")
+    error: Optional[str] = Field(default=None, description="실패 사유")
+    created_at: datetime = Field(description="생성 시간")
+    updated_at: datetime = Field(description="수정 시간")
+
+
+class PipelineQueueStats(CamelModel):
+    """파이프라인 큐 통계 스키마입니다."""
+
+    running: int = Field(description="실행 중인 작업 수 (전체)")
+    tenant_running: int = Field(description="현재 테넌트의 실행 중인 작업 수")
+    tenant_concurrency: int = Field(description="테넌트별 동시 실행 상한")
+    classes: List[Dict[str, Any]] = Field(description="클래스별 가중치, 대기 작업 수, 대기 시간 p50/p95 (전체와 현재 테넌트)")
@@ -0,0 +1,394 @@
+"""
+파이프라인 도메인 서비스
+
+재처리 작업 관리와 배치 단위 재처리 실행기
+
+재처리 작업은 문서 ID 목록을 `batch_size`건 배치로 나눠 공정 스케줄러에 올립니다. 작업 하나가
+큐에 동시에 올려 두는 배치는 몇 개로 제한하고 배치가 끝날 때마다 다음 배치를 올리므로, 20만 건
+작업도 큐에는 배치 몇 개만 차지하고 다른 테넌트 작업과 배치 단위로 번갈아 실행됩니다.
+배치는 문서를 `documents.uploaded`로 다시 발행하는 것까지만 하며, 이후 색인/검증 단계는 이벤트의
+`priority`로 같은 스케줄러에 다시 들어가 문서 단위로 공정하게 실행됩니다 (`PipelineScheduler.stage`).
+앞에서부터 연속으로 끝난 위치(cursor)를 배치마다 한 행 UPDATE로 기록해, 서버가 재시작되면
+그 위치부터 이어서 처리합니다 (재시작 직전 배치는 다시 발행될 수 있음).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ...common.events import EventBus, Topics, event_bus
+from ...common.exceptions import ReprocessJobNotFound
+from ..auth.services import BaseRepository
+from .models import JobStatus, PriorityClass, ReprocessJob
+from .scheduler import PipelineScheduler, WorkItem, pipeline_scheduler
+from .schemas import PipelineQueueStats, ReprocessJobRead, ReprocessRequest
+
+logger = logging.getLogger(__name__)
+
+# 재처리 배치 작업 종류
+BATCH_KIND = "reprocess.batch"
+
+# 재처리 작업 목록 조회 상한
+MAX_LISTED_JOBS = 50
+
+# 재시작 시 이어서 처리할 작업 상태
+RESUMABLE_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class ReprocessJobRepository(BaseRepository):
+    """재처리 작업 Repository 클래스입니다."""
+
+    async def get_job(self, tenant_id: str, job_id: UUID) -> Optional[ReprocessJob]:
+        """테넌트의 재처리 작업을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            job_id (UUID): 작업 ID
+
+        Returns:
+            Optional[ReprocessJob]: 조회된 작업 또는 None (다른 테넌트의 작업 포함)
+        """
+        result = await self.session.execute(
+            select(ReprocessJob)
+            .options(defer(ReprocessJob.document_ids))
+            .where(ReprocessJob.id == job_id, ReprocessJob.tenant_id == tenant_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_jobs(self, tenant_id: str, limit: int = MAX_LISTED_JOBS) -> List[ReprocessJob]:
+        """테넌트의 최근 재처리 작업을 조회합니다 (문서 ID 목록은 읽지 않음).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            limit (int): 최대 작업 수
+
+        Returns:
+            List[ReprocessJob]: 최신순 작업 목록
+        """
+        result = await self.session.execute(
+            select(ReprocessJob)
+            .options(defer(ReprocessJob.document_ids))
+            .where(ReprocessJob.tenant_id == tenant_id)
+            .order_by(ReprocessJob.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_resumable(self) -> List[ReprocessJob]:
+        """끝나지 않은 모든 테넌트의 재처리 작업을 생성 순으로 조회합니다.
+
+        Returns:
+            List[ReprocessJob]: 대기/실행 중 작업 목록
+        """
+        result = await self.session.execute(
+            select(ReprocessJob)
+            .where(ReprocessJob.status.in_(RESUMABLE_STATUSES))
+            .order_by(ReprocessJob.created_at)
+        )
+        return list(result.scalars().all())
+
+    async def save_progress(
+        self, job_id: UUID, cursor: int, status: JobStatus, error: Optional[str] = None
+    ) -> None:
+        """진행 위치와 상태를 기록합니다 (취소된 작업은 건드리지 않음).
+
+        Args:
+            job_id (UUID): 작업 ID
+            cursor (int): 연속으로 처리가 끝난 문서 수
+            status (JobStatus): 작업 상태
+            error (Optional[str]): 실패 사유
+        """
+        await self.session.execute(
+            update(ReprocessJob)
+            .where(ReprocessJob.id == job_id, ReprocessJob.status != JobStatus.CANCELLED)
+            .values(cursor=cursor, status=status, error=error, updated_at=datetime.utcnow())
+        )
+        await self.session.commit()
+
+
+@dataclass
+class _JobRun:
+    """실행 중인 재처리 작업의 메모리 상태입니다."""
+
+    job_id: UUID
+    tenant_id: str
+    priority: PriorityClass
+    document_ids: List[str]
+    batch_size: int
+    cursor: int
+    next_offset: int
+    in_flight: int = 0
+    # 끝났지만 cursor 뒤에 떨어져 있는 배치 (시작 위치 → 문서 수)
+    done: Dict[int, int] = field(default_factory=dict)
+    stopped: bool = False
+
+    @property
+    def total(self) -> int:
+        return len(self.document_ids)
+
+
+class ReprocessRunner:
+    """재처리 작업을 배치로 나눠 파이프라인 스케줄러에서 실행하는 클래스입니다."""
+
+    def __init__(
+        self,
+        scheduler: Optional[PipelineScheduler] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        bus: Optional[EventBus] = None,
+        parallelism: Optional[int] = None,
+    ):
+        """재처리 실행기를 초기화합니다.
+
+        Args:
+            scheduler (Optional[PipelineScheduler]): 파이프라인 스케줄러
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            bus (Optional[EventBus]): 재처리 문서를 발행할 이벤트 버스
+            parallelism (Optional[int]): 작업 하나가 동시에 큐에 올리는 배치 수
+        """
+        self.scheduler = scheduler or pipeline_scheduler
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.bus = bus or event_bus
+        self.parallelism = parallelism or settings.REPROCESS_JOB_PARALLELISM
+        self._runs: Dict[UUID, _JobRun] = {}
+        self.scheduler.register(BATCH_KIND, self._run_batch)
+
+    def enqueue(self, job: ReprocessJob) -> None:
+        """작업의 `cursor` 이후 문서를 배치로 나눠 스케줄러에 올립니다.
+
+        Args:
+            job (ReprocessJob): 문서 ID 목록을 읽은 재처리 작업
+        """
+        run = _JobRun(
+            job_id=job.id,
+            tenant_id=job.tenant_id,
+            priority=job.priority,
+            document_ids=list(job.document_ids),
+            batch_size=job.batch_size,
+            cursor=job.cursor,
+            next_offset=job.cursor,
+        )
+        self._runs[job.id] = run
+        self._fill(run)
+
+    def cancel(self, job_id: UUID) -> int:
+        """작업의 대기 중인 배치를 큐에서 빼고 다음 배치를 올리지 않습니다.
+
+        Args:
+            job_id (UUID): 작업 ID
+
+        Returns:
+            int: 큐에서 뺀 배치 수 (실행 중인 배치는 끝까지 돈다)
+        """
+        run = self._runs.pop(job_id, None)
+        if run is None:
+            return 0
+        run.stopped = True
+        return self.scheduler.discard(lambda item: item.payload.get("job_id") == job_id)
+
+    def active(self) -> int:
+        """메모리에 올라 있는 작업 수를 반환합니다."""
+        return len(self._runs)
+
+    async def start(self) -> None:
+        """끝나지 않은 작업을 이어서 올리고 스케줄러를 시작합니다."""
+        async with self.session_factory() as session:
+            jobs = await ReprocessJobRepository(session).get_resumable()
+        for job in jobs:
+            if job.id not in self._runs:
+                self.enqueue(job)
+        if jobs:
+            logger.info("재처리 작업 재개: %d개", len(jobs))
+        await self.scheduler.start()
+
+    async def stop(self) -> None:
+        """스케줄러를 중지합니다 (진행 위치는 이미 배치마다 기록됨)."""
+        await self.scheduler.stop()
+
+    def _fill(self, run: _JobRun) -> None:
+        while not run.stopped and run.in_flight < self.parallelism and run.next_offset < run.total:
+            offset = run.next_offset
+            batch = run.document_ids[offset:offset + run.batch_size]
+            run.next_offset += len(batch)
+            run.in_flight += 1
+            self.scheduler.submit(
+                WorkItem(
+                    tenant_id=run.tenant_id,
+                    priority=run.priority,
+                    kind=BATCH_KIND,
+                    payload={"job_id": run.job_id, "offset": offset, "document_ids": batch},
+                    cost=len(batch),
+                )
+            )
+
+    async def _run_batch(self, item: WorkItem) -> None:
+        """배치의 문서를 `documents.uploaded`(재처리 표시)로 다시 발행하고 진행 위치를 기록합니다."""
+        run = self._runs.get(item.payload["job_id"])
+        if run is None or run.stopped:
+            return
+        offset, batch = item.payload["offset"], item.payload["document_ids"]
+        try:
+            for doc_id in batch:
+                await self.bus.publish(
+                    Topics.DOCUMENTS_UPLOADED,
+                    {
+                        "tenant_id": run.tenant_id,
+                        "doc_id": doc_id,
+                        "reprocess": True,
+                        "job_id": str(run.job_id),
+                        "priority": run.priority.value,
+                    },
+                    key=doc_id,
+                )
+        except Exception as exc:
+            logger.exception("재처리 배치 실패: job=%s offset=%d", run.job_id, offset)
+            run.stopped = True
+            self._runs.pop(run.job_id, None)
+            self.scheduler.discard(lambda queued: queued.payload.get("job_id") == run.job_id)
+            await self._save(run, JobStatus.FAILED, str(exc))
+            return
+
+        run.in_flight -= 1
+        run.done[offset] = len(batch)
+        while run.cursor in run.done:
+            run.cursor += run.done.pop(run.cursor)
+        if run.cursor >= run.total:
+            self._runs.pop(run.job_id, None)
+            await self._save(run, JobStatus.COMPLETED)
+            logger.info("재처리 작업 완료: job=%s tenant=%s docs=%d", run.job_id, run.tenant_id, run.total)
+            return
+        await self._save(run, JobStatus.RUNNING)
+        self._fill(run)
+
+    async def _save(self, run: _JobRun, status: JobStatus, error: Optional[str] = None) -> None:
+        async with self.session_factory() as session:
+            await ReprocessJobRepository(session).save_progress(run.job_id, run.cursor, status, error)
+
+
+# 전역 재처리 실행기 인스턴스
+reprocess_runner = ReprocessRunner()
+
+
+def get_reprocess_runner() -> ReprocessRunner:
+    """재처리 실행기 인스턴스를 반환합니다.
+
+    Returns:
+        ReprocessRunner: 전역 재처리 실행기
+    """
+    return reprocess_runner
+
+
+class ReprocessService:
+    """재처리 작업 관리 서비스 클래스입니다."""
+
+    def __init__(self, session: AsyncSession, runner: Optional[ReprocessRunner] = None):
+        """ReprocessService를 초기화합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            runner (Optional[ReprocessRunner]): 재처리 실행기
+        """
+        self.session = session
+        self.job_repo = ReprocessJobRepository(session)
+        self.runner = runner or reprocess_runner
+
+    async def create_job(self, tenant_id: str, request: ReprocessRequest) -> ReprocessJobRead:
+        """재처리 작업을 저장하고 스케줄러에 올립니다.
+
+        우선순위를 지정하지 않으면 배치 하나 분량 이하는 review, 그보다 크면 bulk로 둡니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            request (ReprocessRequest): 문서 ID와 우선순위
+
+        Returns:
+            ReprocessJobRead: 생성된 작업
+        """
+        document_ids = list(dict.fromkeys(request.document_ids))
+        batch_size = settings.REPROCESS_BATCH_DOCS
+        priority = request.priority or (
+            PriorityClass.REVIEW if len(document_ids) <= batch_size else PriorityClass.BULK
+        )
+        job = await self.job_repo.create(
+            ReprocessJob(
+                tenant_id=tenant_id,
+                priority=priority,
+                document_ids=document_ids,
+                total=len(document_ids),
+                batch_size=batch_size,
+            )
+        )
+        self.runner.enqueue(job)
+        logger.info("재처리 작업 생성: job=%s tenant=%s docs=%d priority=%s",
+                    job.id, tenant_id, job.total, priority.value)
+        return ReprocessJobRead.model_validate(job)
+
+    async def list_jobs(self, tenant_id: str) -> List[ReprocessJobRead]:
+        """테넌트의 최근 재처리 작업 목록을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            List[ReprocessJobRead]: 최신순 작업 목록
+        """
+        return [ReprocessJobRead.model_validate(job) for job in await self.job_repo.list_jobs(tenant_id)]
+
+    async def get_job(self, tenant_id: str, job_id: UUID) -> ReprocessJobRead:
+        """재처리 작업을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            job_id (UUID): 작업 ID
+
+        Returns:
+            ReprocessJobRead: 작업 진행 상태
+
+        Raises:
+            ReprocessJobNotFound: 작업이 없는 경우
+        """
+        job = await self.job_repo.get_job(tenant_id, job_id)
+        if job is None:
+            raise ReprocessJobNotFound(str(job_id))
+        return ReprocessJobRead.model_validate(job)
+
+    async def cancel_job(self, tenant_id: str, job_id: UUID) -> ReprocessJobRead:
+        """끝나지 않은 재처리 작업을 취소합니다 (끝난 작업은 그대로 반환).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            job_id (UUID): 작업 ID
+
+        Returns:
+            ReprocessJobRead: 취소 후 작업 상태
+
+        Raises:
+            ReprocessJobNotFound: 작업이 없는 경우
+        """
+        job = await self.job_repo.get_job(tenant_id, job_id)
+        if job is None:
+            raise ReprocessJobNotFound(str(job_id))
+        if job.status in RESUMABLE_STATUSES:
+            self.runner.cancel(job_id)
+            job.status = JobStatus.CANCELLED
+            job.updated_at = datetime.utcnow()
+            job = await self.job_repo.update(job)
+        return ReprocessJobRead.model_validate(job)
+
+    def queue_stats(self, tenant_id: str) -> PipelineQueueStats:
+        """파이프라인 큐 통계를 반환합니다.
+
+        Args:
+            tenant_id (str): 함께 볼 테넌트 ID
+
+        Returns:
+            PipelineQueueStats: 클래스별 대기 작업 수와 대기 시간 (전체와 현재 테넌트)
+        """
+        return PipelineQueueStats.model_validate(self.runner.scheduler.queue.stats(tenant_id))
@@ -0,0 +1,5 @@
+"""
+RAG 도메인
+
+문서 검색 기반 질의응답 관련 모듈들
+"""
@@ -0,0 +1,365 @@
+"""
+RAG 답변 캐시
+
+같은 질문이 반복될 때 검색/재순위화/생성을 건너뛰기 위한 테넌트별 의미 기반 답변 캐시
+
+- 질의는 정규화 텍스트가 같으면 바로, 아니면 질의 임베딩의 코사인 유사도가 임계값 이상인
+  과거 질의와 일치시킵니다.
+- 캐시 범위(scope)는 호출자의 실제 허용 문서 집합(권한 비트맵), 문서 필터, top_k의 해시이므로
+  권한이 다른 사용자 사이에는 답변이 공유되지 않습니다. 권한이 바뀌면 범위도 바뀌어 자연히
+  미적중이 됩니다.
+- `index.meta`로 문서가 바뀌면 그 문서를 근거로 인용한 항목만 정확히 무효화합니다.
+  검색 도중 무효화된 문서를 인용한 답변은 저장하지 않습니다 (무효화 세대 비교).
+  문서별 무효화 세대는 테넌트 항목 수 한도만큼만 보관하고, 밀려난 세대보다 먼저 시작한
+  조회의 답변은 저장하지 않습니다.
+"""
+
+import hashlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ...common.config import settings
+from ..embedding.cache import normalize_text
+from ..search.acl import AccessFilter
+from .schemas import RagQueryResponse
+
+# 조회 결과 종류
+CACHE_EXACT = "exact"
+CACHE_SEMANTIC = "semantic"
+CACHE_MISS = "miss"
+
+_TRAILING = "?？.!。 "
+
+
+def normalize_query(text: str) -> str:
+    """캐시 비교용으로 질의를 정규화합니다 (NFKC, 공백 정리, 소문자, 끝 문장부호 제거).
+
+    Args:
+        text (str): 질의 텍스트
+
+    Returns:
+        str: 정규화된 질의
+    """
+    return normalize_text(text).casefold().rstrip(_TRAILING)
+
+
+def answer_scope(
+    access: Optional[AccessFilter], doc_ids: Optional[FrozenSet[str]], top_k: int
+) -> bytes:
+    """답변을 공유할 수 있는 범위의 해시를 계산합니다.
+
+    Args:
+        access (Optional[AccessFilter]): 호출자의 권한 사전 필터 (None이면 권한 검사 없음)
+        doc_ids (Optional[FrozenSet[str]]): 요청의 문서 필터
+        top_k (int): 근거 청크 수
+
+    Returns:
+        bytes: 16바이트 범위 다이제스트
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if access is None:
+        digest.update(b"*")
+    else:
+        digest.update(access.allowed.to_array().tobytes())
+    digest.update(b"\x00")
+    for doc_id in sorted(doc_ids or ()):
+        digest.update(doc_id.encode("utf-8") + b"\x00")
+    digest.update(str(top_k).encode("ascii"))
+    return digest.digest()
+
+
+@dataclass
+class CachedAnswer:
+    """캐시된 답변 한 건입니다.
+
+    Attributes:
+        entry_id (int): 항목 ID
+        query (str): 정규화된 질의
+        vector (np.ndarray): 질의 임베딩
+        scope (bytes): 캐시 범위 다이제스트
+        response (RagQueryResponse): 원래 응답
+        doc_ids (FrozenSet[str]): 인용된 문서 ID 집합
+        cost_ms (float): 원래 응답을 만드는 데 걸린 시간(ms)
+        created_at (float): 생성 시각 (monotonic)
+        hits (int): 적중 횟수
+    """
+
+    entry_id: int
+    query: str
+    vector: np.ndarray
+    scope: bytes
+    response: RagQueryResponse
+    doc_ids: FrozenSet[str]
+    cost_ms: float
+    created_at: float
+    hits: int = 0
+
+
+@dataclass
+class CacheLookup:
+    """캐시 조회 결과입니다.
+
+    Attributes:
+        kind (str): exact | semantic | miss
+        entry (Optional[CachedAnswer]): 적중한 항목
+        similarity (float): 질의 임베딩 유사도 (정확 일치면 1.0)
+        epoch (int): 조회 시점의 무효화 세대 (미적중 후 저장할 때 사용)
+    """
+
+    kind: str
+    entry: Optional[CachedAnswer] = None
+    similarity: float = 0.0
+    epoch: int = 0
+
+
+@dataclass
+class _TenantAnswers:
+    """한 테넌트의 캐시 항목과 색인입니다."""
+
+    entries: "OrderedDict[int, CachedAnswer]" = field(default_factory=OrderedDict)
+    by_text: Dict[Tuple[bytes, str], int] = field(default_factory=dict)
+    by_scope: Dict[bytes, Set[int]] = field(default_factory=dict)
+    by_doc: Dict[str, Set[int]] = field(default_factory=dict)
+    # 문서별 마지막 무효화 세대 (오래된 것부터) - 한도를 넘어 밀려난 세대 중 가장 최근 값이 floor
+    doc_epochs: "OrderedDict[str, int]" = field(default_factory=OrderedDict)
+    epoch_floor: int = 0
+    # 범위별 (항목 ID 목록, 임베딩 행렬) - 항목이 바뀌면 지운다
+    matrices: Dict[bytes, Tuple[List[int], np.ndarray]] = field(default_factory=dict)
+    counters: Dict[str, float] = field(default_factory=lambda: {
+        "exact_hits": 0, "semantic_hits": 0, "misses": 0, "saved_ms": 0.0,
+        "stores": 0, "stale_skipped": 0, "invalidations": 0, "evictions": 0, "expired": 0,
+    })
+
+
+class AnswerCache:
+    """테넌트별 의미 기반 답변 캐시 클래스입니다."""
+
+    def __init__(
+        self,
+        similarity: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """답변 캐시를 초기화합니다.
+
+        Args:
+            similarity (Optional[float]): 의미 일치로 볼 최소 코사인 유사도
+            max_entries (Optional[int]): 테넌트당 최대 항목 수 (초과 시 LRU 제거)
+            ttl_seconds (Optional[float]): 항목 유효 시간(초)
+        """
+        self.similarity = similarity or settings.RAG_ANSWER_CACHE_SIMILARITY
+        self.max_entries = max_entries or settings.RAG_ANSWER_CACHE_MAX_ENTRIES
+        self.ttl = ttl_seconds or settings.RAG_ANSWER_CACHE_TTL_SECONDS
+        self._tenants: Dict[str, _TenantAnswers] = {}
+        self._ids = itertools.count(1)
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def _tenant(self, tenant_id: str) -> _TenantAnswers:
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            tenant = self._tenants[tenant_id] = _TenantAnswers()
+        return tenant
+
+    def lookup(self, tenant_id: str, query: str, vector: np.ndarray, scope: bytes) -> CacheLookup:
+        """같은 범위에서 일치하는 과거 답변을 찾습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            query (str): 질의 텍스트
+            vector (np.ndarray): (dim,) 정규화 질의 임베딩
+            scope (bytes): `answer_scope` 결과
+
+        Returns:
+            CacheLookup: 조회 결과 (미적중이면 저장에 쓸 무효화 세대 포함)
+        """
+        with self._lock:
+            tenant = self._tenant(tenant_id)
+            now = time.monotonic()
+            entry_id = tenant.by_text.get((scope, normalize_query(query)))
+            kind, similarity = CACHE_EXACT, 1.0
+            if entry_id is None:
+                kind = CACHE_SEMANTIC
+                entry_id, similarity = self._nearest(tenant, scope, vector)
+            entry = tenant.entries.get(entry_id) if entry_id is not None else None
+            if entry is not None and now - entry.created_at > self.ttl:
+                self._remove(tenant, entry.entry_id)
+                tenant.counters["expired"] += 1
+                entry = None
+            if entry is None:
+                tenant.counters["misses"] += 1
+                return CacheLookup(CACHE_MISS, epoch=self._epoch)
+
+            entry.hits += 1
+            tenant.entries.move_to_end(entry.entry_id)
+            tenant.counters[f"{kind}_hits"] += 1
+            tenant.counters["saved_ms"] += entry.cost_ms
+            return CacheLookup(kind, entry, similarity, self._epoch)
+
+    def _nearest(
+        self, tenant: _TenantAnswers, scope: bytes, vector: np.ndarray
+    ) -> Tuple[Optional[int], float]:
+        """같은 범위의 항목 중 임계값 이상으로 가장 유사한 항목을 찾습니다."""
+        if not tenant.by_scope.get(scope):
+            return None, 0.0
+        cached = tenant.matrices.get(scope)
+        if cached is None:
+            ids = list(tenant.by_scope[scope])
+            cached = tenant.matrices[scope] = (
+                ids, np.stack([tenant.entries[i].vector for i in ids])
+            )
+        ids, matrix = cached
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity:
+            return None, float(scores[best])
+        return ids[best], float(scores[best])
+
+    def put(
+        self,
+        tenant_id: str,
+        query: str,
+        vector: np.ndarray,
+        scope: bytes,
+        response: RagQueryResponse,
+        cost_ms: float,
+        epoch: int,
+    ) -> Optional[CachedAnswer]:
+        """응답을 캐시에 저장합니다.
+
+        조회 이후(epoch 이후) 무효화된 문서를 인용한 응답은 이미 낡았을 수 있으므로 저장하지 않습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            query (str): 질의 텍스트
+            vector (np.ndarray): (dim,) 정규화 질의 임베딩
+            scope (bytes): `answer_scope` 결과
+            response (RagQueryResponse): 저장할 응답
+            cost_ms (float): 응답 생성 시간(ms)
+            epoch (int): 조회 시 받은 무효화 세대
+
+        Returns:
+            Optional[CachedAnswer]: 저장된 항목 (저장하지 않았으면 None)
+        """
+        doc_ids = frozenset(source.document_id for source in response.sources)
+        with self._lock:
+            tenant = self._tenant(tenant_id)
+            if epoch < tenant.epoch_floor or any(tenant.doc_epochs.get(doc_id, 0) > epoch for doc_id in doc_ids):
+                tenant.counters["stale_skipped"] += 1
+                return None
+
+            text = normalize_query(query)
+            previous = tenant.by_text.get((scope, text))
+            if previous is not None:
+                self._remove(tenant, previous)
+            entry = CachedAnswer(
+                next(self._ids), text, np.asarray(vector, dtype=np.float32), scope,
+                response, doc_ids, cost_ms, time.monotonic(),
+            )
+            tenant.entries[entry.entry_id] = entry
+            tenant.by_text[(scope, text)] = entry.entry_id
+            tenant.by_scope.setdefault(scope, set()).add(entry.entry_id)
+            for doc_id in doc_ids:
+                tenant.by_doc.setdefault(doc_id, set()).add(entry.entry_id)
+            tenant.matrices.pop(scope, None)
+            tenant.counters["stores"] += 1
+
+            while len(tenant.entries) > self.max_entries:
+                oldest = next(iter(tenant.entries))
+                self._remove(tenant, oldest)
+                tenant.counters["evictions"] += 1
+            return entry
+
+    def _remove(self, tenant: _TenantAnswers, entry_id: int) -> None:
+        entry = tenant.entries.pop(entry_id, None)
+        if entry is None:
+            return
+        tenant.by_text.pop((entry.scope, entry.query), None)
+        scope_ids = tenant.by_scope.get(entry.scope)
+        if scope_ids is not None:
+            scope_ids.discard(entry_id)
+            if not scope_ids:
+                del tenant.by_scope[entry.scope]
+        tenant.matrices.pop(entry.scope, None)
+        for doc_id in entry.doc_ids:
+            doc_entries = tenant.by_doc.get(doc_id)
+            if doc_entries is not None:
+                doc_entries.discard(entry_id)
+                if not doc_entries:
+                    del tenant.by_doc[doc_id]
+
+    def invalidate_document(self, tenant_id: str, doc_id: str) -> int:
+        """문서를 인용한 항목을 모두 제거합니다.
+
+        캐시를 조회한 적 없는 테넌트는 저장 대기 중인 답변도 없으므로 상태를 만들지 않습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            doc_id (str): 변경된 문서 ID
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                return 0
+            self._epoch += 1
+            tenant.doc_epochs.pop(doc_id, None)
+            tenant.doc_epochs[doc_id] = self._epoch
+            while len(tenant.doc_epochs) > self.max_entries:
+                _, tenant.epoch_floor = tenant.doc_epochs.popitem(last=False)
+            entry_ids = list(tenant.by_doc.get(doc_id, ()))
+            for entry_id in entry_ids:
+                self._remove(tenant, entry_id)
+            tenant.counters["invalidations"] += len(entry_ids)
+            return len(entry_ids)
+
+    def on_index_meta(self, event: Dict[str, Any]) -> None:
+        """`index.meta` 업서트 이벤트로 바뀐 문서를 인용한 답변을 무효화합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`를 포함한 문서 메타 이벤트
+        """
+        self.invalidate_document(event["tenant_id"], event["doc_id"])
+
+    def stats(self, tenant_id: str) -> Dict[str, float]:
+        """테넌트의 캐시 적중/절감 통계를 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            Dict[str, float]: 적중/미적중 수, 적중률, 절감 시간(ms), 항목 수 등
+        """
+        with self._lock:
+            tenant = self._tenants.get(tenant_id) or _TenantAnswers()
+            counters = dict(tenant.counters)
+            hits = counters["exact_hits"] + counters["semantic_hits"]
+            lookups = hits + counters["misses"]
+            counters.update({
+                "hits": hits,
+                "lookups": lookups,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "entries": len(tenant.entries),
+            })
+            return counters
+
+
+# 전역 답변 캐시 인스턴스
+answer_cache = AnswerCache()
+
+
+def get_answer_cache() -> AnswerCache:
+    """답변 캐시 인스턴스를 반환합니다.
+
+    Returns:
+        AnswerCache: 공유 답변 캐시
+    """
+    return answer_cache
@@ -0,0 +1,680 @@
+"""
+근거 검증(Citation Verifier)
+
+생성된 답변의 주장(문장)이 인용한 근거 청크에 실제로 뒷받침되는지 2단계로 확인합니다.
+
+- 동기 단계: 청크마다 미리 계산한 문자 n-gram 싱글(shingle) 해시 집합과 주장의 싱글을 비교해
+  포함률(주장 싱글 중 청크에 있는 비율)로 판정합니다. 인용 하나당 0.1ms 미만이라 응답
+  경로에서 바로 실행합니다.
+- 비동기 단계: (근거 청크, 주장) 쌍을 큐에 넣고 전용 스레드의 함의(NLI) 모델로 채점해 결과를
+  캐시에 저장합니다. 응답에는 검증 ID만 실리고, 클라이언트는 나중에 결과를 조회하거나
+  (long-poll) 구독(SSE)합니다. 큐가 가득 차면 정밀 검증을 건너뛰어 p95를 보호합니다.
+
+ONNX 함의 모델은 NLI 크로스 인코더를 optimum으로 내보낸 디렉터리를 사용합니다.
+    optimum-cli export onnx --model cross-encoder/nli-deberta-v3-xsmall models/nli
+
+함의 백엔드는 임베딩과 같이 시작 시점에 만들며, 설정이 잘못되었으면 애플리케이션이 뜨지 않습니다
+(동기 단계만 쓰려면 CITATION_DEEP_BACKEND=none).
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from ...common.config import settings
+from ...common.shingles import shingles
+from ..embedding.cache import content_digest
+from ..search.services import RetrievedChunk
+from ..search.tokenizer import tokenize
+from .generation import CITATION_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# 동기 단계 주장 판정
+VERDICT_SUPPORTED = "supported"
+VERDICT_PARTIAL = "partial"
+VERDICT_UNSUPPORTED = "unsupported"
+VERDICT_INVALID = "invalid"
+VERDICT_UNCITED = "uncited"
+
+# 비동기(정밀) 검증 상태
+DEEP_PENDING = "pending"
+DEEP_DONE = "done"
+DEEP_FAILED = "failed"
+DEEP_SKIPPED = "skipped"
+DEEP_DISABLED = "disabled"
+DEEP_EXPIRED = "expired"
+
+# 정밀 검증 판정
+DEEP_ENTAILED = "entailed"
+DEEP_NOT_ENTAILED = "not_entailed"
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?。])\s+|\n+")
+_NON_WORD = re.compile(r"[\W_]+")
+_LEADING_MARKERS = re.compile(r"^\s*(?:\[\d{1,3}\]\s*)+")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+(?=[.,!?。])")
+
+
+def containment(claim: np.ndarray, chunk: np.ndarray) -> float:
+    """주장 싱글 중 청크 싱글에 포함된 비율을 반환합니다 (둘 다 정렬된 고유 배열)."""
+    if len(claim) == 0 or len(chunk) == 0:
+        return 0.0
+    positions = np.minimum(np.searchsorted(chunk, claim), len(chunk) - 1)
+    return float(np.count_nonzero(chunk[positions] == claim)) / len(claim)
+
+
+@dataclass
+class Claim:
+    """답변의 주장(문장) 하나입니다.
+
+    Attributes:
+        index (int): 답변 내 순번 (0부터)
+        text (str): 근거 표기를 뺀 문장
+        markers (List[int]): 문장에 붙은 근거 번호 (등장 순서, 중복 제거)
+    """
+
+    index: int
+    text: str
+    markers: List[int] = field(default_factory=list)
+
+
+def split_claims(answer: str) -> List[Claim]:
+    """답변을 문장 단위 주장으로 나눕니다.
+
+    문장 끝 뒤에 떨어진 근거 표기(예: "지급한다. [1] 다음 문장")는 앞 문장에 붙입니다.
+
+    Args:
+        answer (str): 답변
+
+    Returns:
+        List[Claim]: 주장 목록
+    """
+    claims: List[Claim] = []
+    for segment in _SENTENCE_BREAK.split(answer):
+        leading = _LEADING_MARKERS.match(segment)
+        if leading and claims:
+            for number in CITATION_PATTERN.findall(leading.group()):
+                if int(number) not in claims[-1].markers:
+                    claims[-1].markers.append(int(number))
+            segment = segment[leading.end():]
+        markers = [int(number) for number in CITATION_PATTERN.findall(segment)]
+        text = _SPACE_BEFORE_PUNCT.sub("", " ".join(CITATION_PATTERN.sub("", segment).split()))
+        if _NON_WORD.sub("", text):
+            claims.append(Claim(len(claims), text, list(dict.fromkeys(markers))))
+    return claims
+
+
+class ShingleIndex:
+    """청크별 싱글 해시 집합을 미리 계산해 두는 LRU 색인입니다."""
+
+    def __init__(self, size: Optional[int] = None, max_entries: Optional[int] = None):
+        """싱글 색인을 초기화합니다.
+
+        Args:
+            size (Optional[int]): 싱글 글자 수
+            max_entries (Optional[int]): 최대 청크 수 (초과 시 오래 쓰지 않은 청크부터 제거)
+        """
+        self.size = size or settings.CITATION_SHINGLE_SIZE
+        self.max_entries = max_entries or settings.CITATION_SHINGLE_ENTRIES
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._computed = 0
+
+    def add(self, tenant_id: str, chunk_id: str, text: str) -> np.ndarray:
+        """청크의 싱글 집합을 계산해 저장합니다."""
+        key = (tenant_id, chunk_id)
+        self._entries[key] = value = shingles(text, self.size)
+        self._entries.move_to_end(key)
+        self._computed += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def get(self, tenant_id: str, chunk_id: str, text: str) -> np.ndarray:
+        """청크의 싱글 집합을 반환합니다 (없으면 원문으로 계산해 저장)."""
+        value = self._entries.get((tenant_id, chunk_id))
+        if value is None:
+            return self.add(tenant_id, chunk_id, text)
+        self._entries.move_to_end((tenant_id, chunk_id))
+        return value
+
+    def on_documents_indexed(self, event: Dict[str, Any]) -> None:
+        """`documents.indexed` 이벤트의 청크 싱글을 미리 계산합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `chunks`(`chunk_id`, `text`)를 포함한 이벤트
+        """
+        for chunk in event.get("chunks", ()):
+            self.add(event["tenant_id"], chunk["chunk_id"], chunk["text"])
+
+    def stats(self) -> Dict[str, int]:
+        """색인 통계(항목 수, 누적 계산 수, 메모리 바이트)를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "computed": self._computed,
+            "nbytes": sum(value.nbytes for value in self._entries.values()),
+        }
+
+
+class EntailmentBackend(Protocol):
+    """함의(NLI) 모델 백엔드 인터페이스입니다.
+
+    Attributes:
+        model_id (str): 모델 식별자
+        model_version (str): 모델 버전
+    """
+
+    model_id: str
+    model_version: str
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """(전제, 가설) 쌍의 함의 확률을 (N,) float32 배열(0~1)로 반환합니다."""
+        ...
+
+
+class OnnxEntailmentBackend:
+    """ONNX Runtime 기반 CPU NLI 크로스 인코더 백엔드입니다."""
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_id: Optional[str] = None,
+        model_version: Optional[str] = None,
+        entailment_index: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ):
+        """ONNX 세션과 토크나이저를 로드합니다.
+
+        Args:
+            model_dir (str): `model.onnx`와 `tokenizer.json`이 있는 디렉터리
+            model_id (Optional[str]): 모델 식별자
+            model_version (Optional[str]): 모델 버전
+            entailment_index (Optional[int]): 출력 로짓 중 함의(entailment) 레이블 위치
+            max_length (Optional[int]): (전제 + 가설) 최대 시퀀스 길이 (초과 시 전제를 자름)
+
+        Raises:
+            RuntimeError: onnxruntime/tokenizers 패키지가 없는 경우
+        """
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "ONNX 함의 백엔드에는 onnxruntime, tokenizers 패키지가 필요합니다 "
+                "(poetry install -E onnx)"
+            ) from exc
+
+        self.model_id = model_id or settings.CITATION_NLI_MODEL
+        self.model_version = model_version or settings.CITATION_NLI_MODEL_VERSION
+        self.entailment_index = (
+            settings.CITATION_NLI_ENTAILMENT_INDEX if entailment_index is None else entailment_index
+        )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {node.name for node in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        # 가설(주장)은 짧으므로 길이 초과 시 전제(청크) 쪽을 자른다
+        self.tokenizer.enable_truncation(
+            max_length=max_length or settings.CITATION_NLI_MAX_SEQ_LENGTH, strategy="only_first"
+        )
+        self.tokenizer.enable_padding()
+
+        logger.info("ONNX 함의 모델 로드 완료: %s@%s", self.model_id, self.model_version)
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """(전제, 가설) 쌍 배치의 함의 확률을 계산합니다."""
+        encodings = self.tokenizer.encode_batch(list(pairs))
+        feeds = {
+            "input_ids": np.asarray([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.asarray([e.attention_mask for e in encodings], dtype=np.int64),
+        }
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encodings], dtype=np.int64)
+
+        logits = self.session.run(None, feeds)[0].astype(np.float32)
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        return probs[:, self.entailment_index]
+
+
+class LexicalEntailmentBackend:
+    """가설 토큰의 전제 포함률로 함의를 흉내 내는 결정적 백엔드입니다.
+
+    모델 파일 없이 동작하므로 로컬 개발, 테스트, 벤치마크 용도로만 사용합니다.
+    """
+
+    def __init__(self, model_version: str = "1"):
+        """백엔드를 초기화합니다.
+
+        Args:
+            model_version (str): 모델 버전
+        """
+        self.model_id = "lexical"
+        self.model_version = model_version
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """(전제, 가설) 쌍 배치를 채점합니다 (가설 토큰 재현율)."""
+        scores = np.zeros(len(pairs), dtype=np.float32)
+        for i, (premise, hypothesis) in enumerate(pairs):
+            terms = set(tokenize(hypothesis))
+            if terms:
+                present = set(tokenize(premise))
+                scores[i] = len(terms & present) / len(terms)
+        return scores
+
+
+def create_entailment_backend() -> Optional[EntailmentBackend]:
+    """설정(CITATION_DEEP_BACKEND)에 따라 함의 백엔드를 생성합니다.
+
+    Returns:
+        Optional[EntailmentBackend]: 함의 백엔드 (none이면 None)
+
+    Raises:
+        RuntimeError: ONNX 백엔드인데 모델 디렉터리가 설정되지 않은 경우
+    """
+    if settings.CITATION_DEEP_BACKEND == "none":
+        return None
+    if settings.CITATION_DEEP_BACKEND == "lexical":
+        logger.warning("어휘 기반 함의 백엔드를 사용합니다 (개발/테스트 전용)")
+        return LexicalEntailmentBackend(settings.CITATION_NLI_MODEL_VERSION)
+    if not settings.CITATION_NLI_ONNX_DIR:
+        raise RuntimeError("CITATION_NLI_ONNX_DIR가 설정되지 않았습니다")
+    return OnnxEntailmentBackend(settings.CITATION_NLI_ONNX_DIR)
+
+
+@dataclass
+class DeepCheck:
+    """정밀 검증할 (주장, 근거 청크) 쌍과 결과입니다.
+
+    Attributes:
+        claim (int): 주장 순번
+        marker (int): 근거 번호
+        document_id (str): 근거 문서 ID
+        hypothesis (str): 주장 문장
+        premise (str): 근거 청크 원문
+        entailment (Optional[float]): 함의 확률 (채점 전 None)
+    """
+
+    claim: int
+    marker: int
+    document_id: str
+    hypothesis: str
+    premise: str
+    entailment: Optional[float] = None
+
+
+@dataclass
+class DeepVerification:
+    """답변 한 건의 정밀 검증 작업입니다.
+
+    Attributes:
+        verification_id (str): 검증 ID
+        tenant_id (str): 테넌트 ID
+        checks (List[DeepCheck]): 검증 쌍 목록
+        status (str): pending | done | failed
+        model (Optional[str]): 함의 모델 식별자
+        created_at (datetime): 생성 시각
+        completed_at (Optional[datetime]): 완료 시각
+        done (asyncio.Event): 완료 알림
+    """
+
+    verification_id: str
+    tenant_id: str
+    checks: List[DeepCheck]
+    status: str = DEEP_PENDING
+    model: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    completed_at: Optional[datetime] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class DeepVerifier:
+    """함의 모델로 근거를 비동기 정밀 검증하는 큐/캐시 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        backend_factory: Optional[Callable[[], Optional[EntailmentBackend]]] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        threshold: Optional[float] = None,
+        result_entries: Optional[int] = None,
+        cache_entries: Optional[int] = None,
+    ):
+        """정밀 검증 서비스를 초기화합니다.
+
+        Args:
+            backend_factory (Optional[Callable[[], Optional[EntailmentBackend]]]): 백엔드 생성 함수
+                (시작 시 호출, None을 반환하면 정밀 검증 비활성화)
+            batch_size (Optional[int]): 추론 1회당 최대 쌍 수
+            queue_size (Optional[int]): 대기 작업 최대 수 (초과 시 건너뜀)
+            threshold (Optional[float]): 함의로 판정할 최소 확률
+            result_entries (Optional[int]): 보관할 검증 결과 수
+            cache_entries (Optional[int]): (모델, 주장, 청크) 점수 캐시 항목 수
+        """
+        self._backend_factory = backend_factory or create_entailment_backend
+        self._backend: Optional[EntailmentBackend] = None
+        self._loaded = False
+        self.batch_size = batch_size or settings.CITATION_DEEP_BATCH_SIZE
+        self.queue_size = queue_size or settings.CITATION_DEEP_QUEUE_SIZE
+        self.threshold = settings.CITATION_DEEP_THRESHOLD if threshold is None else threshold
+        self.result_entries = result_entries or settings.CITATION_DEEP_RESULT_ENTRIES
+        self.cache_entries = cache_entries or settings.CITATION_DEEP_CACHE_ENTRIES
+
+        self._queue: Optional["asyncio.Queue[DeepVerification]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: "OrderedDict[str, DeepVerification]" = OrderedDict()
+        self._cache: "OrderedDict[Tuple[str, str, bytes, bytes], float]" = OrderedDict()
+
+        self._submitted = 0
+        self._skipped = 0
+        self._scored = 0
+        self._cache_hits = 0
+
+    @property
+    def backend(self) -> Optional[EntailmentBackend]:
+        """함의 백엔드입니다 (시작 전이면 최초 접근 시 생성)."""
+        return self._ensure_backend()
+
+    def _ensure_backend(self) -> Optional[EntailmentBackend]:
+        """백엔드를 아직 만들지 않았으면 만들어 반환합니다.
+
+        Raises:
+            RuntimeError: 함의 백엔드를 만들 수 없는 경우 (예: ONNX 모델 디렉터리 미설정)
+        """
+        if not self._loaded:
+            self._backend = self._backend_factory()
+            self._loaded = True
+        return self._backend
+
+    async def start(self) -> None:
+        """백엔드를 만듭니다 (설정이 잘못되었으면 애플리케이션이 뜨지 않음).
+
+        Raises:
+            RuntimeError: 함의 백엔드를 만들 수 없는 경우
+        """
+        if self._ensure_backend() is None:
+            logger.info("정밀 근거 검증 비활성화 (CITATION_DEEP_BACKEND=none)")
+
+    def submit(self, tenant_id: str, checks: List[DeepCheck]) -> Tuple[str, Optional[str]]:
+        """정밀 검증 작업을 큐에 넣습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            checks (List[DeepCheck]): 검증 쌍 목록
+
+        Returns:
+            Tuple[str, Optional[str]]: (상태, 검증 ID) - pending이 아니면 ID는 None
+        """
+        if self.backend is None:
+            return DEEP_DISABLED, None
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        verification = DeepVerification(
+            uuid.uuid4().hex, tenant_id, checks, model=self.backend.model_id
+        )
+        try:
+            self._queue.put_nowait(verification)
+        except asyncio.QueueFull:
+            self._skipped += 1
+            logger.warning("정밀 근거 검증 큐가 가득 차 건너뜁니다 (size=%d)", self.queue_size)
+            return DEEP_SKIPPED, None
+        self._submitted += 1
+        self._results[verification.verification_id] = verification
+        while len(self._results) > self.result_entries:
+            self._results.popitem(last=False)
+        return DEEP_PENDING, verification.verification_id
+
+    def get(self, tenant_id: str, verification_id: str) -> Optional[DeepVerification]:
+        """테넌트의 검증 결과를 조회합니다 (없거나 다른 테넌트면 None)."""
+        verification = self._results.get(verification_id)
+        if verification is None or verification.tenant_id != tenant_id:
+            return None
+        return verification
+
+    def resolve(self, tenant_id: str, deep: Dict[str, Any]) -> Dict[str, Any]:
+        """저장된 응답의 `citations.deep`을 지금의 검증 상태로 바꿉니다.
+
+        캐시에서 다시 보내는 응답이 저장 당시의 pending 상태를 그대로 보여주지 않도록,
+        검증 ID가 있으면 현재 상태를, 결과가 이미 사라졌으면 expired를 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            deep (Dict[str, Any]): 저장된 `status`, `verificationId`
+
+        Returns:
+            Dict[str, Any]: 현재 `status`, `verificationId`
+        """
+        verification_id = deep.get("verificationId")
+        if verification_id is None:
+            return deep
+        verification = self.get(tenant_id, verification_id)
+        if verification is None:
+            return {"status": DEEP_EXPIRED, "verificationId": None}
+        return {"status": verification.status, "verificationId": verification_id}
+
+    async def wait(
+        self, tenant_id: str, verification_id: str, timeout: float
+    ) -> Optional[DeepVerification]:
+        """검증이 끝나거나 `timeout`초가 지날 때까지 기다린 뒤 결과를 반환합니다."""
+        verification = self.get(tenant_id, verification_id)
+        if verification is not None and timeout > 0:
+            try:
+                await asyncio.wait_for(verification.done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return verification
+
+    async def _run(self) -> None:
+        """큐의 검증 작업을 순서대로 처리합니다."""
+        while True:
+            verification = await self._queue.get()
+            try:
+                await self._verify(verification)
+                verification.status = DEEP_DONE
+            except Exception:
+                verification.status = DEEP_FAILED
+                logger.exception("정밀 근거 검증 실패 (id=%s)", verification.verification_id)
+            finally:
+                verification.completed_at = datetime.now(timezone.utc)
+                verification.done.set()
+                self._queue.task_done()
+
+    async def _verify(self, verification: DeepVerification) -> None:
+        """캐시에 없는 쌍만 배치로 채점해 결과를 채웁니다."""
+        backend = self.backend
+        # 버전 문자열이 같아도 다른 모델의 점수를 섞지 않도록 모델 식별자까지 키에 넣는다
+        keys = [
+            (backend.model_id, backend.model_version, content_digest(check.hypothesis), content_digest(check.premise))
+            for check in verification.checks
+        ]
+        missing = []
+        for check, key in zip(verification.checks, keys):
+            cached = self._cache.get(key)
+            if cached is None:
+                missing.append((check, key))
+            else:
+                self._cache.move_to_end(key)
+                check.entailment = cached
+                self._cache_hits += 1
+
+        if missing and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="citation-nli")
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            pairs = [(check.premise, check.hypothesis) for check, _ in batch]
+            scores = await loop.run_in_executor(self._executor, backend.score, pairs)
+            self._scored += len(batch)
+            for (check, key), score in zip(batch, scores):
+                check.entailment = float(score)
+                self._cache[key] = check.entailment
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def verdict(self, check: DeepCheck) -> Optional[str]:
+        """검증 쌍의 판정(entailed | not_entailed, 채점 전이면 None)을 반환합니다."""
+        if check.entailment is None:
+            return None
+        return DEEP_ENTAILED if check.entailment >= self.threshold else DEEP_NOT_ENTAILED
+
+    async def stop(self) -> None:
+        """작업 루프와 추론 스레드를 종료합니다."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._queue = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        """정밀 검증 통계(제출/건너뜀/채점/캐시 적중 수, 대기 작업 수)를 반환합니다."""
+        return {
+            "submitted": self._submitted,
+            "skipped": self._skipped,
+            "scored": self._scored,
+            "cache_hits": self._cache_hits,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "results": len(self._results),
+        }
+
+
+class CitationVerifier:
+    """동기 싱글 검사와 비동기 정밀 검증을 묶은 근거 검증 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        index: Optional[ShingleIndex] = None,
+        deep: Optional[DeepVerifier] = None,
+        support_threshold: Optional[float] = None,
+        partial_threshold: Optional[float] = None,
+    ):
+        """근거 검증 서비스를 초기화합니다.
+
+        Args:
+            index (Optional[ShingleIndex]): 청크 싱글 색인
+            deep (Optional[DeepVerifier]): 정밀 검증 서비스
+            support_threshold (Optional[float]): 뒷받침(supported)으로 판정할 최소 포함률
+            partial_threshold (Optional[float]): 부분 뒷받침(partial)으로 판정할 최소 포함률
+        """
+        self.index = index or shingle_index
+        self.deep = deep or deep_verifier
+        self.support_threshold = (
+            settings.CITATION_SUPPORT_THRESHOLD if support_threshold is None else support_threshold
+        )
+        self.partial_threshold = (
+            settings.CITATION_PARTIAL_THRESHOLD if partial_threshold is None else partial_threshold
+        )
+
+    def _verdict(self, score: float) -> str:
+        if score >= self.support_threshold:
+            return VERDICT_SUPPORTED
+        if score >= self.partial_threshold:
+            return VERDICT_PARTIAL
+        return VERDICT_UNSUPPORTED
+
+    def verify(self, tenant_id: str, answer: str, chunks: Sequence[RetrievedChunk]) -> Dict[str, Any]:
+        """답변의 근거 표기를 동기 검사하고 정밀 검증을 예약합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            answer (str): 답변
+            chunks (Sequence[RetrievedChunk]): 근거 청크 (근거 번호 순서)
+
+        Returns:
+            Dict[str, Any]: 인용 목록, 주장별 판정, 판정 요약, 정밀 검증 상태/ID (camelCase)
+        """
+        started = time.perf_counter()
+        claims = split_claims(answer)
+        cited: List[int] = []
+        invalid: List[int] = []
+        summary = dict.fromkeys(
+            (VERDICT_SUPPORTED, VERDICT_PARTIAL, VERDICT_UNSUPPORTED, VERDICT_INVALID, VERDICT_UNCITED), 0
+        )
+        results = []
+        checks: List[DeepCheck] = []
+        for claim in claims:
+            scores = []
+            claim_shingles = shingles(claim.text, self.index.size)
+            for marker in claim.markers:
+                if not 1 <= marker <= len(chunks):
+                    if marker not in invalid:
+                        invalid.append(marker)
+                    continue
+                if marker not in cited:
+                    cited.append(marker)
+                chunk = chunks[marker - 1]
+                text = chunk.passage.text if chunk.passage else ""
+                scores.append(containment(claim_shingles, self.index.get(tenant_id, chunk.chunk_id, text)))
+                checks.append(DeepCheck(claim.index, marker, chunk.doc_id, claim.text, text))
+            if scores:
+                score = max(scores)
+                verdict = self._verdict(score)
+            else:
+                score = 0.0
+                verdict = VERDICT_INVALID if claim.markers else VERDICT_UNCITED
+            summary[verdict] += 1
+            results.append({
+                "index": claim.index,
+                "text": claim.text,
+                "markers": claim.markers,
+                "score": round(score, 4),
+                "verdict": verdict,
+            })
+
+        status, verification_id = DEEP_DISABLED, None
+        if checks:
+            status, verification_id = self.deep.submit(tenant_id, checks)
+        return {
+            "cited": [
+                {
+                    "marker": marker,
+                    "documentId": chunks[marker - 1].doc_id,
+                    "page": chunks[marker - 1].passage.page if chunks[marker - 1].passage else 0,
+                }
+                for marker in cited
+            ],
+            "invalid": invalid,
+            "claims": results,
+            "summary": summary,
+            "verifyMs": round((time.perf_counter() - started) * 1000, 3),
+            "deep": {"status": status, "verificationId": verification_id},
+        }
+
+
+# 전역 근거 검증 인스턴스
+shingle_index = ShingleIndex()
+deep_verifier = DeepVerifier()
+citation_verifier = CitationVerifier(shingle_index, deep_verifier)
+
+
+def get_deep_verifier() -> DeepVerifier:
+    """DeepVerifier 의존성을 제공합니다.
+
+    Returns:
+        DeepVerifier: 정밀 근거 검증 서비스
+    """
+    return deep_verifier
@@ -0,0 +1,352 @@
+"""
+답변 생성(LLM)
+
+검색된 근거 청크로 프롬프트를 구성하고, LLM 응답을 토큰 단위로 스트리밍하는 단계
+
+- LLM 클라이언트는 교체 가능한 인터페이스(`LlmClient`)로, OpenAI 호환 Chat Completions
+  스트리밍 API 클라이언트와 오프라인 벤치마크/테스트용 가짜 생성기를 제공합니다.
+- 토큰은 비동기 이터레이터로 전달되므로, 소비자가 이터레이터를 닫거나(클라이언트 연결 종료)
+  작업이 취소되면 상위 LLM HTTP 스트림도 함께 닫혀 생성이 중단됩니다.
+- 답변의 근거 표기는 `[1]`처럼 프롬프트의 근거 번호를 사용합니다.
+
+클라이언트는 임베딩과 같이 시작 시점에 만들며, 설정이 잘못되었으면 애플리케이션이 뜨지 않습니다
+(답변 생성 없이 근거 문서만 반환하려면 LLM_BACKEND=none).
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Protocol, Sequence
+
+from ...common.config import settings
+from ..search.services import RetrievedChunk
+
+logger = logging.getLogger(__name__)
+
+# 답변 생성 상태
+GENERATION_GENERATED = "generated"
+GENERATION_CACHED = "cached"
+GENERATION_FAILED = "failed"
+GENERATION_DISABLED = "disabled"
+
+# 답변 본문의 근거 표기 ([1], [2] ...)
+CITATION_PATTERN = re.compile(r"\[(\d{1,3})\]")
+
+_SYSTEM_PROMPT = (
+    "당신은 회사 문서를 근거로 답하는 질의응답 도우미입니다. "
+    "아래 번호가 붙은 문서 발췌만 근거로 한국어로 간결하게 답하고, "
+    "근거로 쓴 문장 끝에 [1]처럼 발췌 번호를 표기하세요. "
+    "발췌에서 답을 찾을 수 없으면 찾을 수 없다고 답하세요."
+)
+
+_NO_CONTEXT_ANSWER = "제공된 문서에서 답을 찾을 수 없습니다."
+
+
+class LlmClient(Protocol):
+    """스트리밍 LLM 클라이언트 인터페이스입니다.
+
+    Attributes:
+        model_id (str): 모델 식별자
+    """
+
+    model_id: str
+
+    def stream(self, messages: Sequence[Dict[str, str]]) -> AsyncIterator[str]:
+        """대화 메시지에 대한 응답을 생성되는 대로 토큰(텍스트 조각) 단위로 반환합니다."""
+        ...
+
+    async def aclose(self) -> None:
+        """연결 등 클라이언트 자원을 정리합니다."""
+        ...
+
+
+class OpenAIChatClient:
+    """OpenAI 호환 Chat Completions 스트리밍(SSE) API 클라이언트입니다.
+
+    응답 스트림을 한 줄씩 읽어 `choices[0].delta.content`를 전달합니다. 소비자가 이터레이터를
+    닫거나 작업이 취소되면 HTTP 스트림을 닫아 서버 측 생성도 중단시킵니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = "https://api.openai.com/v1",
+        max_tokens: int = 512,
+        temperature: float = 0.0,
+        timeout_seconds: float = 30.0,
+    ):
+        """클라이언트를 초기화합니다.
+
+        Args:
+            api_key (str): API 키
+            model (str): 모델 이름
+            base_url (str): API 기본 URL (OpenAI 호환 서버, 예: vLLM)
+            max_tokens (int): 응답 최대 토큰 수
+            temperature (float): 샘플링 온도
+            timeout_seconds (float): 연결/토큰 간 대기 시간 제한(초)
+        """
+        import httpx
+
+        self.model_id = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self._url = base_url.rstrip("/") + "/chat/completions"
+        self._client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=httpx.Timeout(timeout_seconds),
+        )
+
+    async def stream(self, messages: Sequence[Dict[str, str]]) -> AsyncIterator[str]:
+        payload = {
+            "model": self.model_id,
+            "messages": list(messages),
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "stream": True,
+        }
+        async with self._client.stream("POST", self._url, json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or [{}]
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield content
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class FakeLlmClient:
+    """오프라인 벤치마크/테스트용 가짜 LLM 클라이언트입니다.
+
+    프롬프트의 첫 번째 근거 발췌에서 첫 문장을 골라 `[1]` 표기와 함께 어절 단위로 내보냅니다.
+    첫 토큰 전 지연(prefill)과 토큰 간 지연(decode)을 흉내 낼 수 있습니다.
+    """
+
+    model_id = "fake"
+
+    def __init__(self, first_token_ms: float = 0.0, token_ms: float = 0.0, repeat: int = 1):
+        """가짜 클라이언트를 초기화합니다.
+
+        Args:
+            first_token_ms (float): 첫 토큰까지의 지연(ms)
+            token_ms (float): 토큰 간 지연(ms)
+            repeat (int): 답변 반복 횟수 (긴 응답 흉내)
+        """
+        self.first_token_ms = first_token_ms
+        self.token_ms = token_ms
+        self.repeat = max(1, repeat)
+        self.emitted = 0
+
+    @staticmethod
+    def compose(messages: Sequence[Dict[str, str]]) -> str:
+        """프롬프트에서 답변 문장을 만듭니다."""
+        prompt = messages[-1]["content"] if messages else ""
+        match = re.search(r"^\[(\d+)\][^\n]*\n(.+)$", prompt, re.MULTILINE)
+        if not match:
+            return _NO_CONTEXT_ANSWER
+        sentence = re.split(r"(?<=[.!?。])\s+", match.group(2).strip())[0]
+        return f"{sentence} [{match.group(1)}]"
+
+    async def stream(self, messages: Sequence[Dict[str, str]]) -> AsyncIterator[str]:
+        answer = " ".join([self.compose(messages)] * self.repeat)
+        for index, token in enumerate(re.findall(r"\S+\s*", answer)):
+            delay = self.first_token_ms if index == 0 else self.token_ms
+            await asyncio.sleep(delay / 1000)
+            self.emitted += 1
+            yield token
+
+    async def aclose(self) -> None:
+        return None
+
+
+def create_llm_client() -> Optional[LlmClient]:
+    """설정(LLM_BACKEND)에 따라 LLM 클라이언트를 생성합니다.
+
+    Returns:
+        Optional[LlmClient]: LLM 클라이언트 (none이면 None)
+
+    Raises:
+        RuntimeError: OpenAI 백엔드인데 API 키가 설정되지 않은 경우
+    """
+    if settings.LLM_BACKEND == "none":
+        return None
+    if settings.LLM_BACKEND == "fake":
+        logger.warning("가짜 LLM 클라이언트를 사용합니다 (개발/벤치마크 전용)")
+        return FakeLlmClient(settings.LLM_FAKE_FIRST_TOKEN_MS, settings.LLM_FAKE_TOKEN_MS)
+    if not settings.OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다")
+    return OpenAIChatClient(
+        settings.OPENAI_API_KEY,
+        settings.LLM_MODEL,
+        settings.LLM_BASE_URL,
+        settings.LLM_MAX_TOKENS,
+        settings.LLM_TEMPERATURE,
+        settings.LLM_TIMEOUT_SECONDS,
+    )
+
+
+def build_messages(query: str, chunks: Sequence[RetrievedChunk], max_chars: int) -> List[Dict[str, str]]:
+    """근거 청크에 번호를 붙여 대화 메시지를 구성합니다.
+
+    Args:
+        query (str): 질의 텍스트
+        chunks (Sequence[RetrievedChunk]): 근거 청크 (응답 sources와 같은 순서)
+        max_chars (int): 청크당 최대 글자 수
+
+    Returns:
+        List[Dict[str, str]]: system/user 메시지 목록
+    """
+    blocks = []
+    for number, chunk in enumerate(chunks, start=1):
+        passage = chunk.passage
+        name = (passage.doc_name if passage else None) or chunk.doc_id
+        page = passage.page if passage else 0
+        text = " ".join((passage.text if passage else "").split())[:max_chars]
+        blocks.append(f"[{number}] {name} (p.{page})\n{text}")
+    context = "\n\n".join(blocks) if blocks else "(검색된 문서 없음)"
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": f"문서 발췌:\n{context}\n\n질문: {query}"},
+    ]
+
+
+@dataclass
+class GenerationResult:
+    """답변 생성 결과입니다.
+
+    Attributes:
+        status (str): generated | failed | disabled
+        tokens (List[str]): 생성된 토큰 목록
+        first_token_ms (Optional[float]): 생성 시작부터 첫 토큰까지의 시간(ms)
+        elapsed_ms (float): 생성 소요 시간(ms)
+    """
+
+    status: str = GENERATION_DISABLED
+    tokens: List[str] = field(default_factory=list)
+    first_token_ms: Optional[float] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def answer(self) -> str:
+        """생성된 답변 전체입니다."""
+        return "".join(self.tokens).strip()
+
+
+class AnswerGenerator:
+    """근거 청크로 답변을 스트리밍 생성하는 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[], Optional[LlmClient]]] = None,
+        context_chars: Optional[int] = None,
+    ):
+        """답변 생성기를 초기화합니다.
+
+        Args:
+            client_factory (Optional[Callable[[], Optional[LlmClient]]]): LLM 클라이언트 생성 함수
+                (시작 시 호출, None을 반환하면 답변 생성 비활성화)
+            context_chars (Optional[int]): 프롬프트에 넣을 청크당 최대 글자 수
+        """
+        self._client_factory = client_factory or create_llm_client
+        self._client: Optional[LlmClient] = None
+        self._loaded = False
+        self.context_chars = context_chars or settings.LLM_CONTEXT_CHARS
+
+    @property
+    def client(self) -> Optional[LlmClient]:
+        """LLM 클라이언트입니다 (시작 전이면 최초 접근 시 생성)."""
+        return self._ensure_client()
+
+    def _ensure_client(self) -> Optional[LlmClient]:
+        """클라이언트를 아직 만들지 않았으면 만들어 반환합니다.
+
+        Raises:
+            RuntimeError: LLM 클라이언트를 만들 수 없는 경우 (예: OPENAI_API_KEY 미설정)
+        """
+        if not self._loaded:
+            self._client = self._client_factory()
+            self._loaded = True
+        return self._client
+
+    async def start(self) -> None:
+        """클라이언트를 만듭니다 (설정이 잘못되었으면 애플리케이션이 뜨지 않음).
+
+        Raises:
+            RuntimeError: LLM 클라이언트를 만들 수 없는 경우
+        """
+        if self._ensure_client() is None:
+            logger.info("답변 생성 비활성화 (LLM_BACKEND=none)")
+
+    @property
+    def status(self) -> str:
+        """클라이언트가 있으면 generated, 없으면(비활성화) disabled입니다."""
+        return GENERATION_GENERATED if self.client is not None else GENERATION_DISABLED
+
+    async def stream(
+        self, query: str, chunks: Sequence[RetrievedChunk], result: GenerationResult
+    ) -> AsyncIterator[str]:
+        """답변 토큰을 생성되는 대로 반환하고 결과를 `result`에 기록합니다.
+
+        이터레이터를 닫거나 취소하면 상위 LLM 스트림도 닫힙니다. 생성 중 오류는 기록만 하고
+        그때까지 생성한 토큰으로 끝냅니다.
+
+        Args:
+            query (str): 질의 텍스트
+            chunks (Sequence[RetrievedChunk]): 근거 청크
+            result (GenerationResult): 상태/토큰/소요 시간을 기록할 결과 객체
+        """
+        result.status = self.status
+        client = self.client
+        if client is None:
+            return
+        started = time.perf_counter()
+        tokens = client.stream(build_messages(query, chunks, self.context_chars))
+        try:
+            async for token in tokens:
+                if result.first_token_ms is None:
+                    result.first_token_ms = (time.perf_counter() - started) * 1000
+                result.tokens.append(token)
+                yield token
+        except Exception:
+            result.status = GENERATION_FAILED
+            logger.exception("답변 생성 실패")
+        finally:
+            await tokens.aclose()
+            result.elapsed_ms = (time.perf_counter() - started) * 1000
+
+    async def generate(self, query: str, chunks: Sequence[RetrievedChunk]) -> GenerationResult:
+        """답변 전체를 생성합니다 (비스트리밍 응답용)."""
+        result = GenerationResult()
+        async for _ in self.stream(query, chunks, result):
+            pass
+        return result
+
+    async def stop(self) -> None:
+        """LLM 클라이언트 자원을 정리합니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loaded = False
+
+
+# 전역 답변 생성기 인스턴스
+answer_generator = AnswerGenerator()
+
+
+def get_answer_generator() -> AnswerGenerator:
+    """AnswerGenerator 의존성을 제공합니다.
+
+    Returns:
+        AnswerGenerator: 답변 생성기 인스턴스
+    """
+    return answer_generator
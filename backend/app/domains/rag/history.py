@@ -0,0 +1,133 @@
+"""
+RAG 검색 기록
+
+답변한 질의를 사용자별 검색 기록(`search_history`)에 남깁니다.
+
+질의 경로는 메모리 목록에 행을 추가만 하고, 백그라운드 작업이 RAG_HISTORY_FLUSH_INTERVAL_SECONDS마다
+모인 행을 INSERT 한 문장(executemany)으로 씁니다. 저장에 실패하면 다음 주기에 다시 시도하며,
+대기 행이 RAG_HISTORY_MAX_PENDING을 넘으면 오래된 것부터 버립니다.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import insert
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ..auth.schemas import TokenPayload
+from .models import SearchHistory
+from .schemas import RagQueryResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SearchHistoryRecorder:
+    """검색 기록을 모아 주기적으로 일괄 저장하는 클래스입니다."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None, max_pending: Optional[int] = None):
+        """검색 기록기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            max_pending (Optional[int]): 저장 대기 기록 최대 수
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.max_pending = max_pending or settings.RAG_HISTORY_MAX_PENDING
+        self.dropped = 0
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def record(self, token: TokenPayload, response: RagQueryResponse) -> None:
+        """답변한 질의를 기록합니다 (다음 주기에 저장).
+
+        Args:
+            token (TokenPayload): 질의한 사용자 토큰
+            response (RagQueryResponse): 질의 응답
+        """
+        self._pending.append({
+            "id": uuid4(),
+            "tenant_id": token.tenant_id,
+            "user_id": token.sub,
+            "query": response.query,
+            "answer": response.answer,
+            "result_count": len(response.sources),
+            "confidence": response.confidence,
+            "processing_time": response.processing_time,
+            "created_at": datetime.utcnow(),
+        })
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+
+    async def flush(self) -> int:
+        """모인 기록을 한 문장으로 저장합니다 (실패하면 다음 주기에 다시 시도).
+
+        Returns:
+            int: 저장한 기록 수
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch = list(self._pending)
+            self._pending.clear()
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(SearchHistory), batch)
+                    await session.commit()
+            except Exception:
+                self._pending.extendleft(reversed(batch))
+                raise
+        return len(batch)
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """주기적으로 기록을 저장하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 저장 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.RAG_HISTORY_FLUSH_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.exception("검색 기록 저장 실패")
+
+        self._task = asyncio.create_task(_loop(), name="search-history")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 남은 기록을 저장합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("종료 시 검색 기록 저장 실패")
+
+
+# 전역 검색 기록기 인스턴스
+search_history = SearchHistoryRecorder()
+
+
+def get_search_history() -> SearchHistoryRecorder:
+    """검색 기록기 인스턴스를 반환합니다.
+
+    Returns:
+        SearchHistoryRecorder: 전역 검색 기록기
+    """
+    return search_history
@@ -0,0 +1,160 @@
+"""
+RAG 도메인 모델
+
+검색 기록과 즐겨찾기, 질의 트렌드 버킷 SQLModel 모델 정의 (프론트엔드 `use-ai-search` 형식)
+"""
+
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, Index, LargeBinary
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class SearchHistory(SQLModel, table=True):
+    """사용자가 답변받은 RAG 질의 기록을 저장하는 모델입니다.
+
+    Attributes:
+        id (UUID): 기록 고유 ID
+        tenant_id (str): 테넌트 ID
+        user_id (str): 질의한 사용자 ID
+        query (str): 질의 텍스트
+        answer (str): 답변
+        result_count (int): 근거 문서 수
+        confidence (int): 답변 신뢰도 (0~100)
+        processing_time (float): 처리 시간(초)
+        created_at (datetime): 질의 시간
+    """
+
+    __tablename__ = "search_history"
+    __table_args__ = (
+        # 사용자별 기록을 시간 순서대로 인덱스에서 읽음 (목록, 내보내기)
+        Index("ix_search_history_user_created", "tenant_id", "user_id", "created_at"),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="기록 고유 ID"
+    )
+    tenant_id: str = Field(
+        description="테넌트 ID (멀티테넌시)"
+    )
+    user_id: str = Field(
+        description="질의한 사용자 ID"
+    )
+    query: str = Field(
+        description="질의 텍스트"
+    )
+    answer: str = Field(
+        default="",
+        description="답변"
+    )
+    result_count: int = Field(
+        default=0,
+        description="근거 문서 수"
+    )
+    confidence: int = Field(
+        default=0,
+        description="답변 신뢰도"
+    )
+    processing_time: float = Field(
+        default=0.0,
+        description="처리 시간(초)"
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="질의 시간"
+    )
+
+
+class Favorite(SQLModel, TimestampMixin, table=True):
+    """사용자가 저장한 질의/답변 즐겨찾기 모델입니다.
+
+    Attributes:
+        id (UUID): 즐겨찾기 고유 ID
+        tenant_id (str): 테넌트 ID
+        user_id (str): 저장한 사용자 ID
+        query (str): 질의 텍스트
+        answer (str): 답변
+        category (str): 분류
+        tags (List[str]): 태그
+    """
+
+    __tablename__ = "favorites"
+    __table_args__ = (
+        Index("ix_favorites_user_created", "tenant_id", "user_id", "created_at"),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="즐겨찾기 고유 ID"
+    )
+    tenant_id: str = Field(
+        description="테넌트 ID (멀티테넌시)"
+    )
+    user_id: str = Field(
+        description="저장한 사용자 ID"
+    )
+    query: str = Field(
+        description="질의 텍스트"
+    )
+    answer: str = Field(
+        default="",
+        description="답변"
+    )
+    category: str = Field(
+        default="",
+        description="분류"
+    )
+    tags: List[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON, nullable=False),
+        description="태그"
+    )
+
+
+class TrendBucket(SQLModel, table=True):
+    """테넌트 질의 트렌드의 시간 버킷 하나(스케치와 상위 후보)를 저장하는 모델입니다.
+
+    여러 워커가 같은 행에 자기 증분을 더해 쓰므로 버전 컬럼으로 동시 갱신을 감지합니다.
+
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        granularity (str): 버킷 단위 (hour, day, week)
+        track (str): 집계 대상 (queries: 질의 텍스트, topics: 질의 단어)
+        bucket_start (datetime): 버킷 시작 시간 (UTC)
+        total (int): 버킷에 더한 전체 수
+        width (int): count-min 스케치 너비
+        depth (int): count-min 스케치 깊이 (해시 함수 수)
+        sketch (bytes): count-min 스케치 (uint32, depth x width 행 우선)
+        candidates (Dict[str, int]): 상위 후보와 추정 횟수
+        version (int): 갱신 버전
+        updated_at (datetime): 마지막 갱신 시간
+    """
+
+    __tablename__ = "trend_buckets"
+    __table_args__ = (
+        # 다른 워커가 갱신한 버킷만 다시 읽음
+        Index("ix_trend_buckets_updated", "updated_at"),
+    )
+
+    tenant_id: str = Field(primary_key=True, description="테넌트 ID")
+    granularity: str = Field(primary_key=True, description="버킷 단위")
+    track: str = Field(primary_key=True, description="집계 대상")
+    bucket_start: datetime = Field(primary_key=True, description="버킷 시작 시간 (UTC)")
+    total: int = Field(default=0, description="버킷에 더한 전체 수")
+    width: int = Field(description="count-min 스케치 너비")
+    depth: int = Field(description="count-min 스케치 깊이")
+    sketch: bytes = Field(sa_column=Column(LargeBinary, nullable=False), description="count-min 스케치")
+    candidates: Dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+        description="상위 후보와 추정 횟수"
+    )
+    version: int = Field(default=1, description="갱신 버전")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, description="마지막 갱신 시간")
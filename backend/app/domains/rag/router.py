@@ -0,0 +1,428 @@
+"""
+RAG 도메인 라우터
+
+문서 검색 기반 질의응답 REST API 엔드포인트
+
+`stream: true` 질의는 Server-Sent Events(기본) 또는 NDJSON(`Accept: application/x-ndjson`)으로
+근거 문서 → 답변 토큰 → 근거 표기 확인 결과 → 완료 순서의 이벤트를 스트리밍합니다.
+검색어 자동완성은 테넌트별 메모리 트라이(`suggestions`)에서, 질의 트렌드는 시간 버킷별
+count-min 스케치와 상위 후보(`trends`)에서 바로 답합니다.
+검색 기록과 즐겨찾기는 CSV/NDJSON으로 스트리밍 내보내기(또는 비동기 작업)를 지원합니다.
+"""
+
+from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Tuple, Union
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+
+from ...common.config import settings
+from ...common.database import get_db_session
+from ...common.exceptions import VerificationNotFound, business_exception_handler
+from ...common.streaming import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, encode_events
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from ..billing.router import require_quota
+from ..documents.statistics import StatisticsRecorder, get_statistics_recorder
+from ..exports.services import ExportService, get_export_service
+from .cache import AnswerCache, get_answer_cache
+from .citations import DEEP_EXPIRED, DeepVerification, DeepVerifier, get_deep_verifier
+from .models import Favorite, SearchHistory
+from .schemas import (
+    CitationVerificationResponse,
+    DeepCheckResult,
+    FavoriteCreate,
+    FavoriteRead,
+    RagCacheStats,
+    RagQueryRequest,
+    RagQueryResponse,
+    RagSearchStatistics,
+    RagTrends,
+    SearchSuggestion,
+)
+from .services import RagService, get_rag_service, search_statistics
+from .suggestions import SuggestionIndex, get_suggestion_index
+from .trends import TrendTracker, get_trend_tracker
+
+# RAG 라우터 생성
+router = APIRouter(prefix="/api/v1/rag", tags=["RAG"])
+
+# 정밀 근거 검증 결과 대기(long-poll/구독) 최대 시간(초)
+MAX_VERIFICATION_WAIT_SECONDS = 30.0
+
+
+@router.post(
+    "/query",
+    response_model=RagQueryResponse,
+    summary="RAG 질의",
+    description="BM25와 벡터 검색을 융합해 근거 문서를 찾고 답변을 생성합니다. "
+    "stream이 true이면 SSE(또는 Accept: application/x-ndjson이면 NDJSON)로 스트리밍합니다."
+)
+async def query(
+    request: RagQueryRequest,
+    token: Annotated[TokenPayload, Depends(require_quota("queries"))],
+    rag_service: Annotated[RagService, Depends(get_rag_service)],
+    http_request: Request
+) -> Union[RagQueryResponse, StreamingResponse]:
+    """RAG 질의 엔드포인트입니다.
+    
+    스트리밍 응답은 클라이언트 연결이 끊기면 이벤트 스트림을 닫아 진행 중인 LLM 생성을 취소합니다.
+    
+    Args:
+        request (RagQueryRequest): 질의 요청
+        token (TokenPayload): 현재 사용자 토큰 (테넌트와 문서 권한 결정, 질의 한도 확인 후)
+        rag_service (RagService): RAG 서비스
+        http_request (Request): HTTP 요청 (Accept 헤더로 스트리밍 형식 결정)
+        
+    Returns:
+        Union[RagQueryResponse, StreamingResponse]: 답변과 근거 문서, 또는 이벤트 스트림
+
+    Raises:
+        HTTPException: 요금제 질의 한도를 다 쓴 경우 (429)
+    """
+    if not request.stream:
+        return await rag_service.query(token, request)
+    ndjson = NDJSON_MEDIA_TYPE in http_request.headers.get("accept", "")
+    events = rag_service.stream(token, request)
+    return StreamingResponse(
+        encode_events(events, ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 연결 종료로 스트리밍이 중단돼도 이벤트 스트림을 닫아 LLM 생성을 취소한다
+        background=BackgroundTask(events.aclose),
+    )
+
+
+@router.get(
+    "/cache/stats",
+    response_model=RagCacheStats,
+    summary="답변 캐시 통계",
+    description="현재 테넌트의 답변 캐시 적중률과 절감 시간을 조회합니다."
+)
+async def cache_stats(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    answers: Annotated[AnswerCache, Depends(get_answer_cache)]
+) -> RagCacheStats:
+    """답변 캐시 통계 엔드포인트입니다.
+    
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        answers (AnswerCache): 답변 캐시
+        
+    Returns:
+        RagCacheStats: 캐시 적중/절감 통계
+    """
+    return RagCacheStats(**answers.stats(token.tenant_id))
+
+
+@router.get(
+    "/statistics",
+    response_model=RagSearchStatistics,
+    summary="RAG 질의 통계",
+    description="현재 테넌트의 누적 질의 수, 성공률, 평균 처리 시간과 신뢰도를 조회합니다."
+)
+async def rag_statistics(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    recorder: Annotated[StatisticsRecorder, Depends(get_statistics_recorder)]
+) -> RagSearchStatistics:
+    """RAG 질의 통계 엔드포인트입니다.
+    
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        recorder (StatisticsRecorder): 대시보드 통계 기록기
+        
+    Returns:
+        RagSearchStatistics: RAG 질의 통계 (테넌트 통계 행 기본 키 조회 한 번)
+    """
+    return search_statistics(await recorder.snapshot(session, token.tenant_id))
+
+
+@router.get(
+    "/suggestions",
+    response_model=List[SearchSuggestion],
+    summary="검색어 자동완성",
+    description="입력 중인 접두어로 시작하는 본인의 과거 질의, 문서 제목, 추출 값을 빈도와 최근성 순으로 제안합니다. "
+    "한글은 자모 단위로 비교하므로 조합 중인 글자도 맞습니다."
+)
+async def suggestions(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    rag_service: Annotated[RagService, Depends(get_rag_service)],
+    index: Annotated[SuggestionIndex, Depends(get_suggestion_index)],
+    q: str = "",
+    limit: int = settings.SUGGESTION_LIMIT
+) -> List[SearchSuggestion]:
+    """검색어 자동완성 엔드포인트입니다.
+    
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트와 문서 권한 결정)
+        rag_service (RagService): RAG 서비스 (권한 사전 필터 생성)
+        index (SuggestionIndex): 자동완성 색인
+        q (str): 입력 중인 텍스트 (비우면 인기 후보, 과거 질의는 본인 것만)
+        limit (int): 최대 반환 수 (최대 SUGGESTION_TOP_K)
+        
+    Returns:
+        List[SearchSuggestion]: 제안 목록
+    """
+    limit = min(max(limit, 1), settings.SUGGESTION_TOP_K)
+    await index.load(token.tenant_id)
+    return index.suggest(token.tenant_id, q, limit, rag_service.access_for(token), token.sub)
+
+
+@router.get(
+    "/trends",
+    response_model=RagTrends,
+    summary="질의 트렌드",
+    description="현재 시간/일/주 구간(UTC)에 많이 검색된 질의와 주제 단어를 직전 구간과 비교해 조회합니다. "
+    "횟수는 count-min 스케치 추정치입니다."
+)
+async def trends(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    tracker: Annotated[TrendTracker, Depends(get_trend_tracker)],
+    window: Literal["hour", "day", "week"] = "day",
+    limit: int = settings.TRENDS_LIMIT
+) -> RagTrends:
+    """질의 트렌드 엔드포인트입니다.
+    
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        tracker (TrendTracker): 트렌드 집계기
+        window (Literal["hour", "day", "week"]): 구간 단위
+        limit (int): 대상별 최대 반환 수 (최대 TRENDS_CANDIDATES)
+        
+    Returns:
+        RagTrends: 상위 질의/주제와 직전 구간 대비 증가율
+    """
+    limit = min(max(limit, 1), settings.TRENDS_CANDIDATES)
+    return tracker.trends(token.tenant_id, window, limit)
+
+
+@router.get(
+    "/history/export",
+    response_class=Response,
+    summary="검색 기록 내보내기",
+    description="현재 사용자의 검색 기록을 시간 순서대로 CSV 또는 NDJSON(gzip 선택)으로 스트리밍합니다. "
+    "mode=job이면 비동기 작업을 만들고 202를 반환합니다."
+)
+async def export_history(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    exports: Annotated[ExportService, Depends(get_export_service)],
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    mode: Literal["stream", "job"] = "stream"
+) -> Response:
+    """검색 기록 내보내기 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트와 사용자 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        exports (ExportService): 내보내기 서비스
+        format (str): 형식 (csv | ndjson)
+        gzip (bool): gzip 압축 여부
+        mode (str): stream(바로 내려받기) | job(비동기 작업)
+
+    Returns:
+        Response: 첨부 파일 스트리밍 응답 또는 작업 정보(202)
+    """
+    query = (
+        select(
+            SearchHistory.id.label("id"),
+            SearchHistory.query.label("query"),
+            SearchHistory.answer.label("answer"),
+            SearchHistory.created_at.label("timestamp"),
+            SearchHistory.result_count.label("resultCount"),
+            SearchHistory.confidence.label("confidence"),
+            SearchHistory.processing_time.label("processingTime"),
+        )
+        .where(SearchHistory.tenant_id == token.tenant_id, SearchHistory.user_id == token.sub)
+        .order_by(SearchHistory.created_at, SearchHistory.id)
+    )
+    return await exports.export(
+        session, token.tenant_id, token.sub, "history", query, format, gzip, background=mode == "job"
+    )
+
+
+@router.post(
+    "/favorites",
+    response_model=FavoriteRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="즐겨찾기 저장",
+    description="질의와 답변을 현재 사용자의 즐겨찾기에 저장합니다."
+)
+async def create_favorite(
+    request: FavoriteCreate,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> FavoriteRead:
+    """즐겨찾기 저장 엔드포인트입니다.
+
+    Args:
+        request (FavoriteCreate): 질의, 답변, 분류, 태그
+        token (TokenPayload): 현재 사용자 토큰 (테넌트와 사용자 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+
+    Returns:
+        FavoriteRead: 저장한 즐겨찾기
+    """
+    favorite = Favorite(tenant_id=token.tenant_id, user_id=token.sub, **request.model_dump())
+    session.add(favorite)
+    await session.commit()
+    return FavoriteRead(
+        id=str(favorite.id),
+        query=favorite.query,
+        answer=favorite.answer,
+        category=favorite.category,
+        tags=favorite.tags,
+        saved_at=favorite.created_at,
+    )
+
+
+@router.get(
+    "/favorites/export",
+    response_class=Response,
+    summary="즐겨찾기 내보내기",
+    description="현재 사용자의 즐겨찾기를 저장 순서대로 CSV 또는 NDJSON(gzip 선택)으로 스트리밍합니다. "
+    "mode=job이면 비동기 작업을 만들고 202를 반환합니다."
+)
+async def export_favorites(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    exports: Annotated[ExportService, Depends(get_export_service)],
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    mode: Literal["stream", "job"] = "stream"
+) -> Response:
+    """즐겨찾기 내보내기 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트와 사용자 범위 결정)
+        session (AsyncSession): 데이터베이스 세션
+        exports (ExportService): 내보내기 서비스
+        format (str): 형식 (csv | ndjson)
+        gzip (bool): gzip 압축 여부
+        mode (str): stream(바로 내려받기) | job(비동기 작업)
+
+    Returns:
+        Response: 첨부 파일 스트리밍 응답 또는 작업 정보(202)
+    """
+    query = (
+        select(
+            Favorite.id.label("id"),
+            Favorite.query.label("query"),
+            Favorite.answer.label("answer"),
+            Favorite.created_at.label("savedAt"),
+            Favorite.category.label("category"),
+            Favorite.tags.label("tags"),
+        )
+        .where(Favorite.tenant_id == token.tenant_id, Favorite.user_id == token.sub)
+        .order_by(Favorite.created_at, Favorite.id)
+    )
+    return await exports.export(
+        session, token.tenant_id, token.sub, "favorites", query, format, gzip, background=mode == "job"
+    )
+
+
+def verification_response(
+    verifier: DeepVerifier, verification: DeepVerification
+) -> CitationVerificationResponse:
+    """정밀 검증 작업을 응답 스키마로 변환합니다."""
+    return CitationVerificationResponse(
+        verification_id=verification.verification_id,
+        status=verification.status,
+        model=verification.model,
+        results=[
+            DeepCheckResult(
+                claim=check.claim,
+                marker=check.marker,
+                document_id=check.document_id,
+                entailment=check.entailment,
+                verdict=verifier.verdict(check),
+            )
+            for check in verification.checks
+        ],
+        created_at=verification.created_at,
+        completed_at=verification.completed_at,
+    )
+
+
+@router.get(
+    "/verifications/{verification_id}",
+    response_model=CitationVerificationResponse,
+    summary="정밀 근거 검증 결과 조회",
+    description="응답 metadata.citations.deep.verificationId로 함의 모델 검증 결과를 조회합니다. "
+    "wait_ms를 주면 완료될 때까지 최대 그 시간만큼 기다립니다 (long-poll)."
+)
+async def get_verification(
+    verification_id: str,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    verifier: Annotated[DeepVerifier, Depends(get_deep_verifier)],
+    wait_ms: float = 0.0
+) -> CitationVerificationResponse:
+    """정밀 근거 검증 결과 조회 엔드포인트입니다.
+    
+    Args:
+        verification_id (str): 검증 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        verifier (DeepVerifier): 정밀 근거 검증 서비스
+        wait_ms (float): 완료 대기 최대 시간(ms, 최대 30초)
+        
+    Returns:
+        CitationVerificationResponse: 검증 상태와 쌍별 결과
+        
+    Raises:
+        HTTPException: 검증 결과가 없거나 다른 테넌트의 결과인 경우 (404)
+    """
+    timeout = min(max(wait_ms, 0.0) / 1000, MAX_VERIFICATION_WAIT_SECONDS)
+    verification = await verifier.wait(token.tenant_id, verification_id, timeout)
+    if verification is None:
+        raise business_exception_handler(VerificationNotFound(verification_id))
+    return verification_response(verifier, verification)
+
+
+@router.get(
+    "/verifications/{verification_id}/events",
+    summary="정밀 근거 검증 결과 구독",
+    description="검증이 끝나면 결과를 SSE `verification` 이벤트 하나로 보내고 스트림을 닫습니다."
+)
+async def subscribe_verification(
+    verification_id: str,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    verifier: Annotated[DeepVerifier, Depends(get_deep_verifier)]
+) -> StreamingResponse:
+    """정밀 근거 검증 결과 구독 엔드포인트입니다.
+    
+    Args:
+        verification_id (str): 검증 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        verifier (DeepVerifier): 정밀 근거 검증 서비스
+        
+    Returns:
+        StreamingResponse: 완료(또는 최대 대기 시간 경과) 시 결과 이벤트 하나를 보내는 SSE 스트림.
+            기다리는 사이 결과가 만료되어 사라지면 `status="expired"`인 이벤트를 보냅니다.
+        
+    Raises:
+        HTTPException: 검증 결과가 없거나 다른 테넌트의 결과인 경우 (404)
+    """
+    if verifier.get(token.tenant_id, verification_id) is None:
+        raise business_exception_handler(VerificationNotFound(verification_id))
+
+    async def events() -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        verification = await verifier.wait(
+            token.tenant_id, verification_id, MAX_VERIFICATION_WAIT_SECONDS
+        )
+        if verification is None:
+            # 스트림은 이미 200으로 시작했으므로 404 대신 만료 상태를 알린다
+            yield "verification", {"verificationId": verification_id, "status": DEEP_EXPIRED, "results": []}
+            return
+        response = verification_response(verifier, verification)
+        yield "verification", response.model_dump(mode="json", by_alias=True)
+
+    return StreamingResponse(
+        encode_events(events(), ndjson=False),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,147 @@
+"""
+RAG 도메인 스키마
+
+질의응답 API 요청/응답 스키마 (프론트엔드 `use-ai-search` 형식에 맞춘 camelCase 응답)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+class RagQueryRequest(CamelModel):
+    """RAG 질의 요청 스키마입니다."""
+
+    query: str = Field(min_length=1, max_length=1000, description="질의 텍스트")
+    filters: List[str] = Field(default_factory=list, description="검색 대상 문서 ID 목록 (비어 있으면 전체)")
+    stream: bool = Field(default=False, description="스트리밍 응답 여부")
+    top_k: Optional[int] = Field(default=None, ge=1, le=50, description="근거로 사용할 청크 수 (기본: RAG_TOP_K)")
+
+
+class RagSource(CamelModel):
+    """답변 근거 문서 스키마입니다."""
+
+    document_id: str = Field(description="문서 ID")
+    document_name: str = Field(description="문서 이름")
+    page: int = Field(description="페이지 번호")
+    confidence: int = Field(ge=0, le=100, description="관련도 (0~100)")
+    highlight: str = Field(description="질의와 관련된 본문 일부")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="청크 ID, 검색기별 순위 등 부가 정보")
+
+
+class RagQueryResponse(CamelModel):
+    """RAG 질의 응답 스키마입니다."""
+
+    answer: str = Field(description="답변")
+    confidence: int = Field(ge=0, le=100, description="답변 신뢰도 (0~100)")
+    sources: List[RagSource] = Field(description="근거 문서 목록")
+    query: str = Field(description="질의 텍스트")
+    timestamp: datetime = Field(description="응답 시각")
+    processing_time: float = Field(description="처리 시간(초)")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="검색 단계 정보")
+
+
+class RagCacheStats(CamelModel):
+    """답변 캐시 통계 스키마입니다."""
+
+    lookups: int = Field(description="캐시 조회 수")
+    hits: int = Field(description="적중 수 (정확 + 의미)")
+    exact_hits: int = Field(description="정규화 텍스트 일치 적중 수")
+    semantic_hits: int = Field(description="임베딩 유사도 일치 적중 수")
+    misses: int = Field(description="미적중 수")
+    hit_rate: float = Field(description="적중률 (0~1)")
+    saved_ms: float = Field(description="적중으로 절감한 누적 처리 시간(ms)")
+    entries: int = Field(description="현재 항목 수")
+    stores: int = Field(description="저장 수")
+    stale_skipped: int = Field(description="처리 중 근거 문서가 바뀌어 저장하지 않은 응답 수")
+    invalidations: int = Field(description="근거 문서 변경으로 무효화된 항목 수")
+    evictions: int = Field(description="용량 초과로 제거된 항목 수")
+    expired: int = Field(description="유효 시간 만료로 제거된 항목 수")
+
+
+class RagSearchStatistics(CamelModel):
+    """RAG 질의 통계 스키마입니다 (`use-search-history`)."""
+
+    total_searches: int = Field(description="누적 질의 수")
+    success_rate: float = Field(description="근거와 답변을 돌려준 질의 비율(%)")
+    average_response_time: float = Field(description="평균 처리 시간(초)")
+    average_confidence: float = Field(description="평균 답변 신뢰도 (0~100)")
+
+
+class FavoriteCreate(CamelModel):
+    """즐겨찾기 저장 요청 스키마입니다."""
+
+    query: str = Field(min_length=1, max_length=1000, description="질의 텍스트")
+    answer: str = Field(default="", max_length=20000, description="답변")
+    category: str = Field(default="", max_length=100, description="분류")
+    tags: List[str] = Field(default_factory=list, max_length=20, description="태그")
+
+
+class FavoriteRead(CamelModel):
+    """즐겨찾기 응답 스키마입니다."""
+
+    id: str = Field(description="즐겨찾기 고유 ID")
+    query: str = Field(description="질의 텍스트")
+    answer: str = Field(description="답변")
+    category: str = Field(description="분류")
+    tags: List[str] = Field(description="태그")
+    saved_at: datetime = Field(description="저장 시간")
+
+
+class SearchSuggestion(CamelModel):
+    """검색어 자동완성 후보 스키마입니다 (`use-ai-search`)."""
+
+    text: str = Field(description="제안 텍스트")
+    category: str = Field(description="출처 (query: 과거 질의, document: 문서 제목, entity: 추출 값)")
+    popularity: int = Field(description="반환 목록 최고 점수 대비 인기도 (0~100)")
+
+
+class TrendItem(CamelModel):
+    """트렌드 항목(질의 또는 주제 단어) 스키마입니다."""
+
+    text: str = Field(description="질의 텍스트 또는 주제 단어")
+    count: int = Field(description="현재 구간 추정 횟수 (count-min 스케치, 과대 추정만 가능)")
+    previous_count: int = Field(description="직전 구간 추정 횟수")
+    growth: Optional[float] = Field(
+        default=None, description="직전 구간 대비 증가율 (현재 구간은 경과 비율로 환산, 직전 구간에 없으면 null)"
+    )
+
+
+class RagTrends(CamelModel):
+    """테넌트 질의 트렌드 스키마입니다."""
+
+    window: str = Field(description="구간 단위 (hour, day, week)")
+    since: datetime = Field(description="현재 구간 시작 시간 (UTC)")
+    total: int = Field(description="현재 구간 질의 수")
+    previous_total: int = Field(description="직전 구간 질의 수")
+    queries: List[TrendItem] = Field(description="많이 검색된 질의")
+    topics: List[TrendItem] = Field(description="많이 검색된 주제 단어")
+
+
+class DeepCheckResult(CamelModel):
+    """(주장, 근거 청크) 쌍 하나의 정밀 검증 결과 스키마입니다."""
+
+    claim: int = Field(description="주장 순번 (응답 metadata.citations.claims의 index)")
+    marker: int = Field(description="근거 번호")
+    document_id: str = Field(description="근거 문서 ID")
+    entailment: Optional[float] = Field(default=None, description="함의 확률 (채점 전이면 null)")
+    verdict: Optional[str] = Field(default=None, description="entailed | not_entailed (채점 전이면 null)")
+
+
+class CitationVerificationResponse(CamelModel):
+    """비동기 정밀 근거 검증 결과 스키마입니다."""
+
+    verification_id: str = Field(description="검증 ID")
+    status: str = Field(description="pending | done | failed | expired (구독 중 결과가 만료된 경우)")
+    model: Optional[str] = Field(default=None, description="함의 모델")
+    results: List[DeepCheckResult] = Field(description="검증 쌍별 결과")
+    created_at: datetime = Field(description="요청 시각")
+    completed_at: Optional[datetime] = Field(default=None, description="완료 시각")
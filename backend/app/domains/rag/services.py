@@ -0,0 +1,458 @@
+"""
+RAG 도메인 서비스
+
+하이브리드 검색과 크로스 인코더 재순위화 결과를 근거 문서 목록으로 가공하고,
+그 근거로 LLM 답변을 생성하는 질의 서비스
+
+검색은 `index.meta` 권한 비트맵으로 사전 필터링되므로, 사용자는 자신(또는 소속 그룹/역할)에게
+허용되었거나 테넌트 전체에 공개된 문서만 근거로 받습니다.
+응답 메타데이터에는 단계별 소요 시간(ms)과 재순위화 상태가 포함됩니다.
+같은 권한 범위에서 이미 답한 질문(정규화 텍스트 또는 임베딩 유사도 일치)은 답변 캐시에서 돌려줍니다.
+답변의 근거 표기는 싱글 포함률로 바로 검사하고, 함의 모델 정밀 검증은 큐에 예약합니다.
+스트리밍 모드에서는 근거 문서, 답변 토큰, 근거 검증 결과 순으로 이벤트를 보냅니다.
+끝까지 응답한 질의는 테넌트 대시보드 통계에 증분으로, 사용자 검색 기록에 한 행으로 기록하고,
+근거를 찾은 질의는 검색어 자동완성 색인에, 모든 질의는 테넌트 질의 트렌드에 반영합니다.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...common.config import settings
+from ..auth.schemas import TokenPayload
+from ..billing.metering import UsageMeter, usage_meter
+from ..documents.statistics import StatisticsRecorder, statistics_recorder
+from ..search.acl import AccessFilter, PermissionIndex, permission_index
+from ..search.rerank import RERANK_FAILED, RERANK_TIMEOUT, Reranker, reranker as shared_reranker
+from ..search.services import HybridRetriever, RetrievedChunk, hybrid_retriever
+from ..search.tokenizer import tokenize
+from .cache import AnswerCache, CacheLookup, answer_cache, answer_scope
+from .citations import CitationVerifier, citation_verifier
+from .generation import (
+    GENERATION_CACHED,
+    GENERATION_FAILED,
+    GENERATION_GENERATED,
+    AnswerGenerator,
+    GenerationResult,
+    answer_generator,
+)
+from .history import SearchHistoryRecorder, search_history
+from .schemas import RagQueryRequest, RagQueryResponse, RagSearchStatistics, RagSource
+from .suggestions import SuggestionIndex, suggestion_index
+from .trends import TrendTracker, trend_tracker
+
+
+def make_highlight(text: str, query: str, width: int = 160) -> str:
+    """질의 토큰이 처음 등장하는 위치 주변의 본문 일부를 잘라냅니다.
+
+    Args:
+        text (str): 청크 원문
+        query (str): 질의 텍스트
+        width (int): 최대 글자 수
+
+    Returns:
+        str: 하이라이트 문자열 (앞뒤가 잘렸으면 "..." 표시)
+    """
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in tokenize(query)]
+    positions = [p for p in positions if p >= 0]
+    start = max(0, min(positions) - width // 4) if positions else 0
+    end = min(len(text), start + width)
+    snippet = " ".join(text[start:end].split())
+    return ("..." if start > 0 else "") + snippet + ("..." if end < len(text) else "")
+
+
+def source_confidence(chunk: RetrievedChunk, top_keyword_score: float) -> int:
+    """검색 결과의 관련도를 0~100 정수로 환산합니다.
+
+    재순위화 점수가 있으면 그 값을, 없으면 코사인 유사도를, 키워드 검색에서만 찾았으면
+    최고 BM25 점수 대비 비율을 씁니다.
+    """
+    if chunk.rerank_score is not None:
+        value = chunk.rerank_score
+    elif chunk.vector_score is not None:
+        value = chunk.vector_score
+    elif chunk.keyword_score is not None and top_keyword_score > 0:
+        value = chunk.keyword_score / top_keyword_score
+    else:
+        value = 0.0
+    return int(round(min(max(value, 0.0), 1.0) * 100))
+
+
+@dataclass
+class QueryState:
+    """질의 한 건의 처리 상태입니다.
+
+    Attributes:
+        started (float): 처리 시작 시각 (perf_counter)
+        top_k (int): 근거로 사용할 청크 수
+        doc_ids (Optional[FrozenSet[str]]): 검색 대상 문서 ID (None이면 전체)
+        access (Optional[AccessFilter]): 권한 사전 필터
+        timings (Dict[str, float]): 단계별 소요 시간(ms)
+        vector (Optional[np.ndarray]): 질의 임베딩 (답변 캐시 사용 시)
+        scope (bytes): 답변 캐시 범위 키
+        lookup (Optional[CacheLookup]): 답변 캐시 조회 결과
+        chunks (List[RetrievedChunk]): 최종 근거 청크
+        sources (List[RagSource]): 근거 문서 목록
+        rerank_status (str): 재순위화 상태
+        metadata (Dict[str, Any]): 응답 메타데이터 (검색 단계 정보)
+    """
+
+    started: float
+    top_k: int
+    doc_ids: Optional[FrozenSet[str]]
+    access: Optional[AccessFilter]
+    timings: Dict[str, float] = field(default_factory=dict)
+    vector: Optional[np.ndarray] = None
+    scope: bytes = b""
+    lookup: Optional[CacheLookup] = None
+    chunks: List[RetrievedChunk] = field(default_factory=list)
+    sources: List[RagSource] = field(default_factory=list)
+    rerank_status: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class RagService:
+    """RAG 질의 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        retriever: Optional[HybridRetriever] = None,
+        permissions: Optional[PermissionIndex] = None,
+        reranker: Optional[Reranker] = None,
+        answers: Optional[AnswerCache] = None,
+        generator: Optional[AnswerGenerator] = None,
+        verifier: Optional[CitationVerifier] = None,
+        statistics: Optional[StatisticsRecorder] = None,
+        history: Optional[SearchHistoryRecorder] = None,
+        suggestions: Optional[SuggestionIndex] = None,
+        trends: Optional[TrendTracker] = None,
+        meter: Optional[UsageMeter] = None,
+    ):
+        """RAG 서비스를 초기화합니다.
+
+        Args:
+            retriever (Optional[HybridRetriever]): 하이브리드 검색기
+            permissions (Optional[PermissionIndex]): 문서 권한 색인
+            reranker (Optional[Reranker]): 재순위화 서비스
+            answers (Optional[AnswerCache]): 답변 캐시 (기본: RAG_ANSWER_CACHE_ENABLED이면 공유 캐시)
+            generator (Optional[AnswerGenerator]): 답변 생성기
+            verifier (Optional[CitationVerifier]): 근거 검증 서비스
+            statistics (Optional[StatisticsRecorder]): 대시보드 통계 기록기
+            history (Optional[SearchHistoryRecorder]): 검색 기록기
+            suggestions (Optional[SuggestionIndex]): 검색어 자동완성 색인
+            trends (Optional[TrendTracker]): 질의 트렌드 집계기
+            meter (Optional[UsageMeter]): 사용량 계량기
+        """
+        self.retriever = retriever or hybrid_retriever
+        self.permissions = permissions or permission_index
+        self.reranker = reranker or shared_reranker
+        if answers is None and settings.RAG_ANSWER_CACHE_ENABLED:
+            answers = answer_cache
+        self.answers = answers
+        self.generator = generator or answer_generator
+        self.verifier = verifier or citation_verifier
+        self.statistics = statistics or statistics_recorder
+        self.history = history or search_history
+        self.suggestions = suggestions or suggestion_index
+        self.trends = trends or trend_tracker
+        self.meter = meter or usage_meter
+
+    def access_for(self, token: TokenPayload) -> Optional[AccessFilter]:
+        """토큰 사용자의 권한 사전 필터를 만듭니다 (권한 검사를 끄면 None).
+
+        Args:
+            token (TokenPayload): 현재 사용자 토큰
+
+        Returns:
+            Optional[AccessFilter]: 사용자 ID와 그룹 클레임, 역할로 허용된 문서 필터
+        """
+        if not settings.SEARCH_ACL_ENABLED:
+            return None
+        return self.permissions.access_filter(token.tenant_id, token.sub, token.groups, [token.role.value])
+
+    def build_sources(self, chunks: Sequence[RetrievedChunk], query: str) -> List[RagSource]:
+        """검색 결과를 근거 문서 목록으로 변환합니다."""
+        top_keyword = max((c.keyword_score or 0.0 for c in chunks), default=0.0)
+        sources = []
+        for chunk in chunks:
+            passage = chunk.passage
+            sources.append(RagSource(
+                document_id=chunk.doc_id,
+                document_name=(passage.doc_name if passage else None) or chunk.doc_id,
+                page=passage.page if passage else 0,
+                confidence=source_confidence(chunk, top_keyword),
+                highlight=make_highlight(passage.text, query) if passage else "",
+                metadata={
+                    "chunkId": chunk.chunk_id,
+                    "fusedScore": chunk.score,
+                    "vectorRank": chunk.vector_rank,
+                    "keywordRank": chunk.keyword_rank,
+                    "rerankScore": chunk.rerank_score,
+                },
+            ))
+        return sources
+
+    async def _prepare(self, token: TokenPayload, request: RagQueryRequest) -> QueryState:
+        """권한 필터와 캐시 범위를 정하고 답변 캐시를 조회합니다."""
+        state = QueryState(
+            started=time.perf_counter(),
+            top_k=request.top_k or settings.RAG_TOP_K,
+            doc_ids=frozenset(request.filters) if request.filters else None,
+            access=self.access_for(token),
+        )
+        if self.answers is not None:
+            embed_started = time.perf_counter()
+            state.vector = await self.retriever.embedding.embed_query(request.query)
+            lookup_started = time.perf_counter()
+            state.timings["embedMs"] = (lookup_started - embed_started) * 1000
+            state.scope = answer_scope(state.access, state.doc_ids, state.top_k)
+            state.lookup = self.answers.lookup(token.tenant_id, request.query, state.vector, state.scope)
+            state.timings["cacheLookupMs"] = (time.perf_counter() - lookup_started) * 1000
+        return state
+
+    async def _retrieve(self, token: TokenPayload, request: RagQueryRequest, state: QueryState) -> None:
+        """하이브리드 검색과 재순위화로 근거 청크와 근거 문서 목록을 채웁니다."""
+        # 재순위화할 수 있으면 현재 부하에서 감당 가능한 만큼 후보를 더 가져온다
+        depth = max(state.top_k, self.reranker.candidate_limit()) if self.reranker.enabled else state.top_k
+
+        retrieval_started = time.perf_counter()
+        candidates = await self.retriever.retrieve(
+            token.tenant_id, request.query, depth, state.doc_ids, state.access, state.timings, state.vector
+        )
+        state.timings["retrievalMs"] = (time.perf_counter() - retrieval_started) * 1000
+
+        outcome = await self.reranker.rerank(
+            request.query, [chunk.passage.text if chunk.passage else "" for chunk in candidates]
+        )
+        state.timings["rerankMs"] = outcome.elapsed_ms
+        for index in outcome.order[:state.top_k]:
+            chunk = candidates[index]
+            chunk.rerank_score = outcome.scores.get(index)
+            state.chunks.append(chunk)
+
+        state.sources = self.build_sources(state.chunks, request.query)
+        state.rerank_status = outcome.status
+        state.metadata.update({
+            "retrieval": "hybrid",
+            "candidates": len(candidates),
+            "rerank": {
+                "status": outcome.status,
+                "candidates": outcome.candidates,
+                "cacheHits": outcome.cache_hits,
+            },
+        })
+        state.timings["sourcesMs"] = (time.perf_counter() - state.started) * 1000
+
+    def _finish(
+        self,
+        token: TokenPayload,
+        request: RagQueryRequest,
+        state: QueryState,
+        generation: GenerationResult,
+        generation_started: float,
+    ) -> RagQueryResponse:
+        """생성 결과로 응답을 만들고, 재사용할 만하면 답변 캐시에 저장합니다."""
+        answer = generation.answer
+        if generation.status == GENERATION_GENERATED:
+            state.timings["generationMs"] = generation.elapsed_ms
+            if generation.first_token_ms is not None:
+                state.timings["firstTokenMs"] = (
+                    (generation_started - state.started) * 1000 + generation.first_token_ms
+                )
+        citations = self.verifier.verify(token.tenant_id, answer, state.chunks)
+        state.timings["citationMs"] = citations["verifyMs"]
+        state.timings["totalMs"] = (time.perf_counter() - state.started) * 1000
+        client = self.generator.client
+        response = RagQueryResponse(
+            answer=answer,
+            confidence=state.sources[0].confidence if state.sources else 0,
+            sources=state.sources,
+            query=request.query,
+            timestamp=datetime.now(timezone.utc),
+            processing_time=time.perf_counter() - state.started,
+            metadata={
+                **state.metadata,
+                "generation": {
+                    "status": generation.status,
+                    "model": client.model_id if client is not None else None,
+                    "tokens": len(generation.tokens),
+                },
+                "citations": citations,
+                "cache": {"status": state.lookup.kind if state.lookup is not None else "disabled"},
+                "timings": {name: round(value, 3) for name, value in state.timings.items()},
+            },
+        )
+        # 근거가 없거나 재순위화/생성이 폴백된 응답은 재사용 가치가 낮으므로 저장하지 않는다
+        if (
+            state.lookup is not None
+            and state.sources
+            and state.rerank_status not in (RERANK_TIMEOUT, RERANK_FAILED)
+            and generation.status != GENERATION_FAILED
+        ):
+            self.answers.put(
+                token.tenant_id, request.query, state.vector, state.scope, response,
+                state.timings["totalMs"], state.lookup.epoch,
+            )
+        return response
+
+    async def query(self, token: TokenPayload, request: RagQueryRequest) -> RagQueryResponse:
+        """질의에 대한 근거 문서를 검색하고 답변을 생성합니다.
+
+        Args:
+            token (TokenPayload): 현재 사용자 토큰 (테넌트와 문서 권한 결정)
+            request (RagQueryRequest): 질의 요청
+
+        Returns:
+            RagQueryResponse: 질의 응답
+        """
+        state = await self._prepare(token, request)
+        if state.lookup is not None and state.lookup.entry is not None:
+            response = self._cached_response(token, request, state.lookup, state.started, state.timings)
+        else:
+            await self._retrieve(token, request, state)
+            generation_started = time.perf_counter()
+            generation = await self.generator.generate(request.query, state.chunks)
+            response = self._finish(token, request, state, generation, generation_started)
+        self._record(token, response)
+        return response
+
+    async def stream(
+        self, token: TokenPayload, request: RagQueryRequest
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """질의 응답을 단계별 이벤트로 스트리밍합니다.
+
+        근거 문서(`sources`)를 먼저, 이어서 생성되는 답변 토큰(`token`)을, 마지막으로
+        근거 표기 확인 결과(`citations`)와 최종 메타데이터(`done`)를 보냅니다.
+        소비자가 이터레이터를 닫으면(클라이언트 연결 종료) 진행 중인 LLM 생성도 취소되며,
+        끝까지 보내지 못한 응답은 답변 캐시에 저장하지 않습니다.
+
+        Args:
+            token (TokenPayload): 현재 사용자 토큰 (테넌트와 문서 권한 결정)
+            request (RagQueryRequest): 질의 요청
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: (이벤트 이름, camelCase 데이터)
+        """
+        state = await self._prepare(token, request)
+        if state.lookup is not None and state.lookup.entry is not None:
+            response = self._cached_response(token, request, state.lookup, state.started, state.timings)
+            yield "sources", self._sources_event(request.query, response.sources, response.confidence)
+            if response.answer:
+                yield "token", {"text": response.answer}
+            yield "citations", response.metadata.get("citations", {})
+            self._record(token, response)
+            yield "done", self._done_event(response)
+            return
+
+        await self._retrieve(token, request, state)
+        confidence = state.sources[0].confidence if state.sources else 0
+        yield "sources", self._sources_event(request.query, state.sources, confidence)
+
+        generation = GenerationResult()
+        generation_started = time.perf_counter()
+        async for text in self.generator.stream(request.query, state.chunks, generation):
+            yield "token", {"text": text}
+
+        response = self._finish(token, request, state, generation, generation_started)
+        yield "citations", response.metadata["citations"]
+        self._record(token, response)
+        yield "done", self._done_event(response)
+
+    def _record(self, token: TokenPayload, response: RagQueryResponse) -> None:
+        """응답한 질의를 대시보드 통계와 검색 기록, 트렌드, 자동완성 색인, 사용량에 기록합니다.
+
+        질의 수는 쿼터 집행(`require_quota`)이 받아들일 때 계량하므로 여기서는 생성 토큰 수만 더합니다.
+        """
+        successful = bool(response.sources and response.answer)
+        generation = response.metadata.get("generation", {})
+        # 캐시 응답은 생성하지 않았으므로 토큰을 세지 않는다
+        if generation.get("status") != GENERATION_CACHED:
+            self.meter.record(token.tenant_id, "tokens", generation.get("tokens", 0))
+        self.statistics.record_search(
+            token.tenant_id, response.processing_time, response.confidence, successful
+        )
+        self.history.record(token, response)
+        self.trends.record(token.tenant_id, response.query)
+        if successful:
+            self.suggestions.on_query_answered(token.tenant_id, token.sub, response.query)
+
+    @staticmethod
+    def _sources_event(query: str, sources: Sequence[RagSource], confidence: int) -> Dict[str, Any]:
+        """근거 문서 이벤트 데이터를 만듭니다."""
+        return {
+            "query": query,
+            "confidence": confidence,
+            "sources": [source.model_dump(mode="json", by_alias=True) for source in sources],
+        }
+
+    @staticmethod
+    def _done_event(response: RagQueryResponse) -> Dict[str, Any]:
+        """최종 이벤트 데이터를 만듭니다 (근거 문서 목록 제외)."""
+        return response.model_dump(mode="json", by_alias=True, exclude={"sources"})
+
+    def _cached_response(
+        self,
+        token: TokenPayload,
+        request: RagQueryRequest,
+        lookup: CacheLookup,
+        started: float,
+        timings: Dict[str, float],
+    ) -> RagQueryResponse:
+        """캐시된 답변을 현재 질의의 응답으로 만듭니다 (정밀 검증 상태는 지금 상태로 다시 읽음)."""
+        cached = lookup.entry.response
+        timings["totalMs"] = (time.perf_counter() - started) * 1000
+        metadata = {
+            **cached.metadata,
+            "generation": {**cached.metadata.get("generation", {}), "status": GENERATION_CACHED},
+            "cache": {
+                "status": lookup.kind,
+                "similarity": round(lookup.similarity, 4),
+                "cachedQuery": cached.query,
+                "savedMs": round(lookup.entry.cost_ms, 3),
+            },
+            "timings": {name: round(value, 3) for name, value in timings.items()},
+        }
+        citations = cached.metadata.get("citations")
+        if citations and "deep" in citations:
+            metadata["citations"] = {
+                **citations, "deep": self.verifier.deep.resolve(token.tenant_id, citations["deep"])
+            }
+        return cached.model_copy(update={
+            "query": request.query,
+            "timestamp": datetime.now(timezone.utc),
+            "processing_time": time.perf_counter() - started,
+            "metadata": metadata,
+        })
+
+
+def search_statistics(counters: Dict[str, float]) -> RagSearchStatistics:
+    """테넌트 통계 카운터로 RAG 질의 통계를 만듭니다.
+
+    Args:
+        counters (Dict[str, float]): `StatisticsRecorder.snapshot` 결과
+
+    Returns:
+        RagSearchStatistics: RAG 질의 통계
+    """
+    searches = counters["searches"]
+    if not searches:
+        return RagSearchStatistics(total_searches=0, success_rate=0, average_response_time=0, average_confidence=0)
+    return RagSearchStatistics(
+        total_searches=searches,
+        success_rate=round(counters["successful_searches"] * 100 / searches, 1),
+        average_response_time=round(counters["search_seconds"] / searches, 3),
+        average_confidence=round(counters["search_confidence"] / searches, 1),
+    )
+
+
+def get_rag_service() -> RagService:
+    """RagService 의존성을 제공합니다.
+
+    Returns:
+        RagService: RAG 서비스 인스턴스
+    """
+    return RagService()
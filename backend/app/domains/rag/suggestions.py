@@ -0,0 +1,526 @@
+"""
+RAG 검색어 자동완성
+
+과거 질의, 문서 제목, 추출 엔터티 값을 메모리 트라이로 접두어 검색합니다.
+디바운스된 키 입력마다 호출되므로 DB를 거치지 않고 트라이 노드 몇 개만 따라가 답합니다.
+
+- 키는 NFC 정규화·소문자·공백 정리 후 한글 음절을 호환 자모로 풀어 쓴 문자열입니다.
+  겹모음/겹받침도 낱자로 나누므로 입력 중인 "계야"(→ 계약)나 "갑"(→ 가방)도 접두어로 맞습니다.
+- 각 노드는 점수 상위 SUGGESTION_TOP_K개 후보를 정렬해 들고 있습니다. 점수는
+  `가중치 * 2^((기록 시각 - 기준 시각) / 반감기)`의 누적이라 최근 기록일수록 크고, 기존 점수를
+  낮추지 않고도 오래된 기록의 비중이 줄어듭니다. 점수가 늘기만 하므로 기록 한 건은 해당 후보의
+  경로에 있는 노드의 상위 목록만 고치면 됩니다.
+- 트라이 깊이는 SUGGESTION_MAX_DEPTH 자모로 제한하고, 더 긴 접두어는 마지막 깊이 노드에 모아 둔
+  후보를 접두어로 걸러 냅니다.
+- 문서 제목/엔터티 후보는 테넌트 트라이에 두고 출처 문서를 최대 MAX_TERM_DOCS개 기억해,
+  사용자에게 허용된 문서가 하나라도 있을 때만 보여 줍니다.
+- 과거 질의는 질의 원문에 다른 사용자가 볼 수 없는 문서 내용이 들어 있을 수 있으므로 사용자별
+  트라이(최대 SUGGESTION_USER_MAX_TERMS개)에 두고 본인에게만 제안합니다. 두 트라이의 후보는
+  기준 시각을 맞춘 점수로 합쳐 정렬합니다.
+
+테넌트 색인은 그 테넌트의 첫 자동완성 요청 때 최근 검색 기록과 문서 목록으로 한 번 만들고
+(모든 테넌트의 문서를 시작 시 한꺼번에 읽지 않음), 이후에는 답변한 질의와
+`documents.indexed`/`documents.validated` 이벤트로 증분 갱신합니다. 아직 적재하지 않은 테넌트의
+이벤트는 버립니다 (해당 행은 적재 때 DB에서 읽음).
+"""
+
+import asyncio
+import logging
+import os
+import time
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ..documents.models import Document
+from ..search.acl import AccessFilter
+from .models import SearchHistory
+from .schemas import SearchSuggestion
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_QUERY = "query"
+CATEGORY_DOCUMENT = "document"
+CATEGORY_ENTITY = "entity"
+
+# 후보별로 기억하는 출처 문서 수 (권한 검사용)
+MAX_TERM_DOCS = 8
+# 질의 후보 최대 길이(글자)
+MAX_QUERY_CHARS = 100
+# 엔터티 후보 길이 범위(글자)
+MIN_ENTITY_CHARS = 2
+MAX_ENTITY_CHARS = 50
+# 점수 지수가 이 값을 넘으면 기준 시각을 옮겨 부동소수 범위를 유지
+REBASE_EXPONENT = 256.0
+# 시작 시 읽는 행 배치 크기
+BOOTSTRAP_BATCH_ROWS = 1000
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+)
+_JONGSEONG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+# 낱자로 입력된 겹모음/겹받침
+_COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def _jamo_table() -> Dict[int, str]:
+    """한글 음절(가~힣)과 겹자모를 낱자 호환 자모열로 바꾸는 `str.translate` 표를 만듭니다."""
+    table = {ord(jamo): letters for jamo, letters in _COMPOUND_JAMO.items()}
+    for index in range(len(_CHOSEONG) * len(_JUNGSEONG) * len(_JONGSEONG)):
+        initial, rest = divmod(index, len(_JUNGSEONG) * len(_JONGSEONG))
+        medial, final = divmod(rest, len(_JONGSEONG))
+        table[0xAC00 + index] = _CHOSEONG[initial] + _JUNGSEONG[medial] + _JONGSEONG[final]
+    return table
+
+
+_JAMO_TABLE = _jamo_table()
+
+
+def normalize(text: str) -> str:
+    """NFC 정규화, 소문자화, 연속 공백 정리를 적용합니다."""
+    return " ".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+def jamo_key(text: str) -> str:
+    """정규화한 텍스트를 접두어 비교용 자모 키로 바꿉니다.
+
+    Args:
+        text (str): `normalize`를 거친 텍스트
+
+    Returns:
+        str: 한글 음절과 겹자모를 낱자 호환 자모로 풀어 쓴 문자열 (그 밖의 문자는 그대로)
+    """
+    return text.translate(_JAMO_TABLE)
+
+
+def entity_values(fields: Mapping[str, Any]) -> List[str]:
+    """추출 필드에서 자동완성 후보로 쓸 값(글자를 포함한 짧은 문자열)을 고릅니다.
+
+    금액, 날짜, 번호처럼 숫자와 기호뿐인 값은 제외합니다.
+    """
+    values = []
+    for value in fields.values():
+        if not isinstance(value, str):
+            continue
+        value = " ".join(value.split())
+        if MIN_ENTITY_CHARS <= len(value) <= MAX_ENTITY_CHARS and any(ch.isalpha() for ch in value):
+            values.append(value)
+    return values
+
+
+def _score(term: "Term") -> float:
+    return term.score
+
+
+class Term:
+    """자동완성 후보 하나입니다."""
+
+    __slots__ = ("text", "category", "key", "score", "doc_ids")
+
+    def __init__(self, text: str, category: str, key: str):
+        self.text = text
+        self.category = category
+        self.key = key
+        self.score = 0.0
+        self.doc_ids: List[str] = []
+
+    def visible(self, access: Optional[AccessFilter]) -> bool:
+        """사용자에게 보여도 되는지 확인합니다 (출처 문서가 없는 사용자 트라이의 질의 후보는 항상 보임)."""
+        if access is None or not self.doc_ids:
+            return True
+        return any(access.allows(doc_id) for doc_id in self.doc_ids)
+
+
+class _Node:
+    """트라이 노드 (자식, 점수 상위 후보, 최대 깊이 노드의 전체 후보)입니다."""
+
+    __slots__ = ("children", "top", "bucket")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[Term] = []
+        self.bucket: Optional[List[Term]] = None
+
+
+class TenantSuggestions:
+    """한 테넌트(문서 제목/엔터티) 또는 한 사용자(과거 질의)의 자동완성 트라이입니다."""
+
+    def __init__(self, top_k: int, max_depth: int, half_life: float, max_terms: int):
+        """트라이를 초기화합니다.
+
+        Args:
+            top_k (int): 노드별 상위 후보 수
+            max_depth (int): 트라이 최대 깊이(자모 수)
+            half_life (float): 점수 반감기(초)
+            max_terms (int): 최대 후보 수
+        """
+        self.top_k = top_k
+        self.max_depth = max_depth
+        self.half_life = half_life
+        self.max_terms = max_terms
+        self.root = _Node()
+        self.terms: Dict[Tuple[str, str], Term] = {}
+        self.origin: Optional[float] = None
+
+    def add(self, text: str, category: str, weight: float, at: float, doc_id: Optional[str] = None) -> None:
+        """후보의 점수를 올립니다 (없으면 새로 만듭니다).
+
+        Args:
+            text (str): 후보 텍스트
+            category (str): 출처 분류
+            weight (float): 기록 가중치 (발생 횟수)
+            at (float): 기록 시각 (Unix 초)
+            doc_id (Optional[str]): 출처 문서 ID (권한 검사용)
+        """
+        text = normalize(text)
+        if not text:
+            return
+        if self.origin is None:
+            self.origin = at
+        exponent = (at - self.origin) / self.half_life
+        if exponent > REBASE_EXPONENT:
+            self._rebase(at)
+            exponent = 0.0
+
+        term = self.terms.get((category, text))
+        created = term is None
+        if term is None:
+            term = self.terms[(category, text)] = Term(text, category, jamo_key(text))
+        term.score += weight * 2.0 ** exponent
+        if doc_id is not None and doc_id not in term.doc_ids and len(term.doc_ids) < MAX_TERM_DOCS:
+            term.doc_ids.append(doc_id)
+        self._promote(term, created)
+        if len(self.terms) > self.max_terms:
+            self._compact()
+
+    def suggest(self, prefix: str, limit: int, access: Optional[AccessFilter] = None) -> List[Term]:
+        """접두어로 시작하는 후보를 점수 순으로 반환합니다.
+
+        같은 텍스트가 여러 출처에 있으면 점수가 높은 하나만 돌려줍니다. 권한으로 가려진 후보는
+        건너뛰므로 노드 상위 목록이 모자라면 limit보다 적게 반환할 수 있습니다.
+
+        Args:
+            prefix (str): 입력 중인 텍스트 (빈 문자열이면 테넌트 전체 상위 후보)
+            limit (int): 최대 반환 수
+            access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+
+        Returns:
+            List[Term]: 후보 목록
+        """
+        key = jamo_key(normalize(prefix))
+        node = self.root
+        for letter in key[:self.max_depth]:
+            node = node.children.get(letter)
+            if node is None:
+                return []
+        candidates = node.top
+        if len(key) > self.max_depth:
+            candidates = sorted(
+                (term for term in node.bucket or () if term.key.startswith(key)), key=_score, reverse=True
+            )
+
+        results: List[Term] = []
+        seen = set()
+        for term in candidates:
+            if term.text in seen or not term.visible(access):
+                continue
+            seen.add(term.text)
+            results.append(term)
+            if len(results) == limit:
+                break
+        return results
+
+    def weight(self, term: Term, origin: float) -> float:
+        """다른 기준 시각(origin 이후)으로 옮긴 후보 점수를 반환합니다 (트라이 간 비교용)."""
+        return term.score * 2.0 ** ((self.origin - origin) / self.half_life)
+
+    def _promote(self, term: Term, created: bool) -> None:
+        """후보 경로의 노드 상위 목록에 새 점수를 반영합니다."""
+        node = self.root
+        self._offer(node, term)
+        for letter in term.key[:self.max_depth]:
+            child = node.children.get(letter)
+            if child is None:
+                child = node.children[letter] = _Node()
+            node = child
+            self._offer(node, term)
+        if created and len(term.key) >= self.max_depth:
+            if node.bucket is None:
+                node.bucket = []
+            node.bucket.append(term)
+
+    def _offer(self, node: _Node, term: Term) -> None:
+        """노드 상위 목록에 후보를 넣거나 순서를 고칩니다."""
+        top = node.top
+        if term not in top:
+            if len(top) < self.top_k:
+                top.append(term)
+            elif term.score > top[-1].score:
+                top[-1] = term
+            else:
+                return
+        top.sort(key=_score, reverse=True)
+
+    def _rebase(self, at: float) -> None:
+        """기준 시각을 옮기고 모든 점수를 같은 비율로 줄입니다 (순서는 그대로)."""
+        factor = 2.0 ** (-(at - self.origin) / self.half_life)
+        for term in self.terms.values():
+            term.score *= factor
+        self.origin = at
+
+    def _compact(self) -> None:
+        """점수 상위 절반의 후보로 트라이를 다시 만듭니다."""
+        kept = sorted(self.terms.values(), key=_score, reverse=True)[:self.max_terms // 2]
+        self.root = _Node()
+        self.terms = {(term.category, term.text): term for term in kept}
+        for term in kept:
+            self._promote(term, created=True)
+
+
+class SuggestionIndex:
+    """테넌트별 검색어 자동완성 색인 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        top_k: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        half_life_days: Optional[float] = None,
+        max_terms: Optional[int] = None,
+        user_max_terms: Optional[int] = None,
+    ):
+        """자동완성 색인을 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            top_k (Optional[int]): 노드별 상위 후보 수
+            max_depth (Optional[int]): 트라이 최대 깊이(자모 수)
+            half_life_days (Optional[float]): 점수 반감기(일)
+            max_terms (Optional[int]): 테넌트별 최대 후보 수
+            user_max_terms (Optional[int]): 사용자별 최대 과거 질의 후보 수
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.top_k = top_k or settings.SUGGESTION_TOP_K
+        self.max_depth = max_depth or settings.SUGGESTION_MAX_DEPTH
+        self.half_life = (half_life_days or settings.SUGGESTION_HALF_LIFE_DAYS) * 86400
+        self.max_terms = max_terms or settings.SUGGESTION_MAX_TERMS
+        self.user_max_terms = user_max_terms or settings.SUGGESTION_USER_MAX_TERMS
+        self._tenants: Dict[str, TenantSuggestions] = {}
+        self._users: Dict[Tuple[str, str], TenantSuggestions] = {}
+        # 적재를 시작한(또는 마친) 테넌트별 적재 작업
+        self._loads: Dict[str, "asyncio.Future[None]"] = {}
+
+    def tenant(self, tenant_id: str) -> TenantSuggestions:
+        """테넌트 트라이를 반환합니다 (없으면 만듭니다)."""
+        trie = self._tenants.get(tenant_id)
+        if trie is None:
+            trie = self._tenants[tenant_id] = TenantSuggestions(
+                self.top_k, self.max_depth, self.half_life, self.max_terms
+            )
+        return trie
+
+    def user(self, tenant_id: str, user_id: str) -> TenantSuggestions:
+        """사용자의 과거 질의 트라이를 반환합니다 (없으면 만듭니다)."""
+        trie = self._users.get((tenant_id, user_id))
+        if trie is None:
+            trie = self._users[(tenant_id, user_id)] = TenantSuggestions(
+                self.top_k, self.max_depth, self.half_life, self.user_max_terms
+            )
+        return trie
+
+    def record_query(
+        self, tenant_id: str, user_id: str, query: str, weight: float = 1.0, at: Optional[float] = None
+    ) -> None:
+        """답변한 질의를 질의한 사용자의 후보에 반영합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            user_id (str): 질의한 사용자 ID
+            query (str): 질의 텍스트
+            weight (float): 발생 횟수
+            at (Optional[float]): 기록 시각 (기본: 현재)
+        """
+        if len(query) <= MAX_QUERY_CHARS:
+            self.user(tenant_id, user_id).add(query, CATEGORY_QUERY, weight, time.time() if at is None else at)
+
+    def record_document(
+        self, tenant_id: str, doc_id: str, name: Optional[str],
+        fields: Optional[Mapping[str, Any]] = None, at: Optional[float] = None,
+    ) -> None:
+        """문서 제목(확장자 제외)과 추출 엔터티 값을 후보에 반영합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            doc_id (str): 문서 ID
+            name (Optional[str]): 파일 이름
+            fields (Optional[Mapping[str, Any]]): 추출 필드
+            at (Optional[float]): 기록 시각 (기본: 현재)
+        """
+        trie = self.tenant(tenant_id)
+        at = time.time() if at is None else at
+        if name:
+            trie.add(os.path.splitext(name)[0], CATEGORY_DOCUMENT, 1.0, at, doc_id)
+        for value in entity_values(fields or {}):
+            trie.add(value, CATEGORY_ENTITY, 1.0, at, doc_id)
+
+    def suggest(
+        self, tenant_id: str, prefix: str, limit: int,
+        access: Optional[AccessFilter] = None, user_id: Optional[str] = None,
+    ) -> List[SearchSuggestion]:
+        """접두어 자동완성 후보를 반환합니다.
+
+        테넌트의 문서 제목/엔터티 후보와 사용자 본인의 과거 질의 후보를 합쳐 점수 순으로 돌려줍니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            prefix (str): 입력 중인 텍스트
+            limit (int): 최대 반환 수
+            access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+            user_id (Optional[str]): 요청한 사용자 ID (None이면 과거 질의 후보 제외)
+
+        Returns:
+            List[SearchSuggestion]: 점수 순 후보 (인기도는 첫 후보 대비 비율)
+        """
+        tries = [
+            trie for trie in (self._tenants.get(tenant_id), self._users.get((tenant_id, user_id)))
+            if trie is not None and trie.origin is not None
+        ]
+        if not tries:
+            return []
+        origin = max(trie.origin for trie in tries)
+        ranked = sorted(
+            ((trie.weight(term, origin), term) for trie in tries for term in trie.suggest(prefix, limit, access)),
+            key=lambda pair: pair[0], reverse=True,
+        )
+
+        results: List[Tuple[float, Term]] = []
+        seen = set()
+        for weight, term in ranked:
+            if term.text in seen:
+                continue
+            seen.add(term.text)
+            results.append((weight, term))
+            if len(results) == limit:
+                break
+        if not results:
+            return []
+        best = results[0][0] or 1.0
+        return [
+            SearchSuggestion(text=term.text, category=term.category, popularity=round(weight * 100 / best))
+            for weight, term in results
+        ]
+
+    def on_query_answered(self, tenant_id: str, user_id: str, query: str) -> None:
+        """답변한 질의를 적재한 테넌트의 사용자 후보에 반영합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            user_id (str): 질의한 사용자 ID
+            query (str): 질의 텍스트
+        """
+        if tenant_id in self._loads:
+            self.record_query(tenant_id, user_id, query)
+
+    def on_documents_indexed(self, event: Dict[str, Any]) -> None:
+        """`documents.indexed` 이벤트의 문서 제목을 후보에 반영합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `doc_name`을 포함한 이벤트
+        """
+        if event["tenant_id"] in self._loads:
+            self.record_document(event["tenant_id"], event["doc_id"], event.get("doc_name"))
+
+    def on_documents_validated(self, event: Dict[str, Any]) -> None:
+        """`documents.validated` 이벤트의 추출 값을 엔터티 후보에 반영합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `validated_data`를 포함한 이벤트
+        """
+        if event["tenant_id"] in self._loads:
+            self.record_document(event["tenant_id"], event["doc_id"], None, event.get("validated_data"))
+
+    async def load(self, tenant_id: str) -> None:
+        """테넌트 색인을 처음 쓸 때 한 번 만듭니다 (동시 요청은 같은 적재를 기다림).
+
+        적재에 실패하면 로그만 남기고 다음 요청에서 다시 시도합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+        """
+        task = self._loads.get(tenant_id)
+        if task is None:
+            task = self._loads[tenant_id] = asyncio.ensure_future(self._load(tenant_id))
+        await asyncio.shield(task)
+
+    async def _load(self, tenant_id: str) -> None:
+        """테넌트의 최근 검색 기록(사용자·질의별 집계)과 문서 제목/추출 값으로 색인을 만듭니다.
+
+        질의별 횟수는 마지막 검색 시각에 한꺼번에 기록한 것으로 근사합니다. 적재 중에 도착한
+        이벤트는 바로 반영하므로, 같은 행이 한 번 더 더해질 수 있습니다 (점수 근사에만 영향).
+        """
+        since = datetime.utcnow() - timedelta(days=settings.SUGGESTION_BOOTSTRAP_DAYS)
+        history = (
+            select(SearchHistory.user_id, SearchHistory.query, func.count(), func.max(SearchHistory.created_at))
+            .where(SearchHistory.tenant_id == tenant_id, SearchHistory.created_at >= since)
+            .group_by(SearchHistory.user_id, SearchHistory.query)
+            .execution_options(yield_per=BOOTSTRAP_BATCH_ROWS)
+        )
+        documents = (
+            select(Document.id, Document.name, Document.extracted_fields, Document.status_changed_at)
+            .where(Document.tenant_id == tenant_id)
+            .execution_options(yield_per=BOOTSTRAP_BATCH_ROWS)
+        )
+        queries = docs = 0
+        try:
+            async with self.session_factory() as session:
+                async for user_id, query, count, last in await session.stream(history):
+                    self.record_query(tenant_id, user_id, query, count, _timestamp(last))
+                    queries += 1
+                async for doc_id, name, fields, changed in await session.stream(documents):
+                    self.record_document(tenant_id, str(doc_id), name, fields, _timestamp(changed))
+                    docs += 1
+        except Exception:
+            logger.exception("자동완성 색인 적재 실패: tenant=%s", tenant_id)
+            self._loads.pop(tenant_id, None)
+            return
+        logger.info("자동완성 색인 적재 완료: tenant=%s queries=%d docs=%d", tenant_id, queries, docs)
+
+    def stats(self) -> Dict[str, int]:
+        """색인 통계(적재한 테넌트 수, 테넌트 수, 사용자 수, 후보 수)를 반환합니다."""
+        return {
+            "loaded": sum(1 for task in self._loads.values() if task.done()),
+            "tenants": len(self._tenants),
+            "users": len(self._users),
+            "terms": sum(len(trie.terms) for trie in (*self._tenants.values(), *self._users.values())),
+        }
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """DB의 UTC naive 시각을 Unix 초로 바꿉니다."""
+    return value.replace(tzinfo=timezone.utc).timestamp() if value is not None else None
+
+
+# 전역 자동완성 색인 인스턴스
+suggestion_index = SuggestionIndex()
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """자동완성 색인 인스턴스를 반환합니다.
+
+    Returns:
+        SuggestionIndex: 전역 자동완성 색인
+    """
+    return suggestion_index
@@ -0,0 +1,505 @@
+"""
+RAG 질의 트렌드
+
+테넌트별로 많이 검색된 질의와 주제(질의 단어)를 시간/일/주 버킷으로 집계합니다.
+
+- 질의 한 건은 세 단위의 현재 버킷마다 질의 텍스트와 주제 단어를 count-min 스케치에 더하고,
+  스케치 추정치가 후보 최소값보다 크면 상위 후보(TRENDS_CANDIDATES개)에 넣습니다. 조회는 원본
+  기록을 읽지 않고 후보 정렬과 직전 버킷 스케치 조회만 하므로 O(k)입니다.
+- 버킷은 UTC 기준 고정 구간(주는 월요일 시작)이며, 단위별로 현재와 직전 버킷만 유지하므로
+  테넌트당 메모리는 스케치 크기 x 버킷 수로 제한됩니다.
+- 같은 크기의 스케치는 칸별로 더하면 두 스트림을 합친 스케치가 되므로 워커별 버킷을 합칠 수
+  있습니다. 각 워커는 TRENDS_FLUSH_INTERVAL_SECONDS마다 쌓인 증분을 `trend_buckets` 행에 합쳐 쓰고
+  (버전 컬럼으로 동시 갱신 감지 후 재시도), 다른 워커가 갱신한 행을 다시 읽어 조회 상태를 맞춥니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ...common.config import settings
+from ...common.database import db_manager
+from ..search.tokenizer import strip_josa
+from .models import TrendBucket
+from .schemas import RagTrends, TrendItem
+from .suggestions import normalize
+
+logger = logging.getLogger(__name__)
+
+TREND_TABLE = TrendBucket.__table__
+
+# 버킷 단위별 길이(초)
+GRANULARITIES = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+# 1970-01-05(월요일)부터 주 버킷을 나눔
+WEEK_OFFSET = 4 * 86400
+
+TRACK_QUERIES = "queries"
+TRACK_TOPICS = "topics"
+
+# 질의 텍스트 최대 길이(글자)
+MAX_QUERY_CHARS = 200
+# 증가율 환산에 쓰는 현재 구간 최소 경과 비율 (구간 초반의 과대 환산 방지)
+MIN_ELAPSED_RATIO = 0.1
+# 동시 갱신 충돌 시 재시도 횟수
+MAX_WRITE_ATTEMPTS = 5
+# 다른 워커 갱신을 다시 읽을 때 이전 동기화 시각보다 앞당겨 읽는 시간(초)
+SYNC_OVERLAP_SECONDS = 5.0
+
+_TOPIC_WORD = re.compile(r"[가-힣]+|[a-z][a-z0-9]*(?:[-_][a-z0-9]+)*")
+
+# (테넌트 ID, 버킷 단위, 집계 대상, 버킷 시작 Unix 초)
+BucketKey = Tuple[str, str, str, float]
+
+
+def bucket_start(granularity: str, at: float) -> float:
+    """시각이 속한 버킷의 시작 시각(Unix 초)을 반환합니다."""
+    size = GRANULARITIES[granularity]
+    offset = WEEK_OFFSET if granularity == "week" else 0
+    return (at - offset) // size * size + offset
+
+
+def topics(query: str) -> List[str]:
+    """정규화한 질의에서 주제 단어(조사를 뗀 한글 어절, 영문 단어)를 중복 없이 뽑습니다.
+
+    Args:
+        query (str): `normalize`를 거친 질의
+
+    Returns:
+        List[str]: 두 글자 이상인 주제 단어 (등장 순서)
+    """
+    words: List[str] = []
+    for word in _TOPIC_WORD.findall(query):
+        if "가" <= word[0] <= "힣":
+            word = strip_josa(word)
+        if len(word) >= 2 and word not in words:
+            words.append(word)
+    return words
+
+
+def sketch_cells(key: str, width: int, depth: int) -> List[int]:
+    """키의 count-min 스케치 행별 칸 위치(평탄화한 표 기준)를 이중 해싱으로 구합니다.
+
+    해시는 blake2b 기반이라 프로세스나 워커가 달라도 같은 키가 같은 칸에 들어가고, 같은 크기의
+    스케치끼리는 위치가 같으므로 한 번 구해 여러 스케치에 씁니다.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    first = int.from_bytes(digest[:4], "little")
+    second = int.from_bytes(digest[4:], "little") | 1
+    return [row * width + (first + row * second) % width for row in range(depth)]
+
+
+def _datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class CountMinSketch:
+    """같은 크기끼리 칸별로 더해 합칠 수 있는 count-min 스케치입니다.
+
+    추정치는 실제 횟수 이상이며, 초과분은 확률적으로 e/너비 x 전체 수 이하입니다.
+    """
+
+    def __init__(self, width: int, depth: int, table: Optional[np.ndarray] = None):
+        """스케치를 초기화합니다.
+
+        Args:
+            width (int): 행별 칸 수
+            depth (int): 해시 함수(행) 수
+            table (Optional[np.ndarray]): 기존 카운터 표 (depth x width uint32)
+        """
+        self.width = width
+        self.depth = depth
+        self.table = table if table is not None else np.zeros((depth, width), dtype=np.uint32)
+        # 칸 몇 개를 읽고 쓰는 데는 numpy 색인보다 memoryview 원소 접근이 훨씬 빠르다
+        self._cells = memoryview(self.table.reshape(-1))
+
+    def cells(self, key: str) -> List[int]:
+        """키의 칸 위치를 반환합니다 (`sketch_cells`)."""
+        return sketch_cells(key, self.width, self.depth)
+
+    def add(self, cells: List[int], count: int = 1) -> int:
+        """칸 위치의 횟수를 더하고 새 추정치(최소값)를 반환합니다."""
+        table = self._cells
+        estimate = None
+        for cell in cells:
+            value = table[cell] + count
+            table[cell] = value
+            if estimate is None or value < estimate:
+                estimate = value
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """키의 추정 횟수를 반환합니다."""
+        table = self._cells
+        return min(table[cell] for cell in self.cells(key))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """같은 크기의 다른 스케치를 더합니다."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("크기가 다른 count-min 스케치는 합칠 수 없습니다")
+        self.table += other.table
+
+    def to_bytes(self) -> bytes:
+        return self.table.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, width: int, depth: int) -> "CountMinSketch":
+        table = np.frombuffer(data, dtype=np.uint32).reshape(depth, width).copy()
+        return cls(width, depth, table)
+
+
+class TrendCounter:
+    """버킷 하나의 스케치, 전체 수, 상위 후보입니다."""
+
+    def __init__(
+        self,
+        sketch: CountMinSketch,
+        capacity: int,
+        total: int = 0,
+        candidates: Optional[Mapping[str, int]] = None,
+    ):
+        """버킷 카운터를 초기화합니다.
+
+        Args:
+            sketch (CountMinSketch): count-min 스케치
+            capacity (int): 상위 후보 수
+            total (int): 더한 전체 수
+            candidates (Optional[Mapping[str, int]]): 상위 후보와 추정 횟수
+        """
+        self.sketch = sketch
+        self.capacity = capacity
+        self.total = total
+        self.candidates: Dict[str, int] = dict(candidates or {})
+        self._floor = min(self.candidates.values(), default=0)
+
+    def add(self, key: str, cells: List[int], count: int = 1) -> None:
+        """키의 횟수를 더하고, 추정치가 후보 최소값보다 크면 후보에 넣습니다.
+
+        Args:
+            key (str): 질의 또는 주제 단어
+            cells (List[int]): `CountMinSketch.cells`로 구한 키의 칸 위치
+            count (int): 더할 횟수
+        """
+        self.total += count
+        estimate = self.sketch.add(cells, count)
+        candidates = self.candidates
+        if key in candidates or len(candidates) < self.capacity:
+            candidates[key] = estimate
+            return
+        # 최소값 캐시는 실제 최소값 이하이므로, 그 이하인 키는 훑어보지 않고 거른다
+        if estimate <= self._floor:
+            return
+        weakest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[weakest]:
+            del candidates[weakest]
+            candidates[key] = estimate
+        self._floor = min(candidates.values())
+
+    def estimate(self, key: str) -> int:
+        """키의 추정 횟수를 반환합니다."""
+        return self.sketch.estimate(key)
+
+    def merge(self, other: "TrendCounter") -> None:
+        """다른 카운터(같은 버킷의 다른 워커 증분)를 합칩니다.
+
+        스케치와 전체 수는 더하고, 후보는 양쪽 후보를 합친 스케치로 다시 추정해 상위만 남깁니다.
+        """
+        self.sketch.merge(other.sketch)
+        self.total += other.total
+        keys = set(self.candidates) | set(other.candidates)
+        estimates = sorted(((self.sketch.estimate(key), key) for key in keys), reverse=True)
+        self.candidates = {key: count for count, key in estimates[:self.capacity]}
+        self._floor = min(self.candidates.values(), default=0)
+
+    def copy(self) -> "TrendCounter":
+        sketch = CountMinSketch(self.sketch.width, self.sketch.depth, self.sketch.table.copy())
+        return TrendCounter(sketch, self.capacity, self.total, self.candidates)
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        """추정 횟수 상위 후보를 반환합니다."""
+        return sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+class TrendTracker:
+    """테넌트별 질의 트렌드 집계 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        width: Optional[int] = None,
+        depth: Optional[int] = None,
+        capacity: Optional[int] = None,
+    ):
+        """트렌드 집계기를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            width (Optional[int]): 스케치 너비
+            depth (Optional[int]): 스케치 깊이
+            capacity (Optional[int]): 버킷별 상위 후보 수
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.width = width or settings.TRENDS_SKETCH_WIDTH
+        self.depth = depth or settings.TRENDS_SKETCH_DEPTH
+        self.capacity = capacity or settings.TRENDS_CANDIDATES
+        self.flushes = 0
+        # 조회용 버킷 (마지막으로 읽은 행 + 이후 이 워커의 증분)
+        self._views: Dict[BucketKey, TrendCounter] = {}
+        # 아직 행에 합치지 않은 이 워커의 증분
+        self._pending: Dict[BucketKey, TrendCounter] = {}
+        self._synced_at: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _counter(self) -> TrendCounter:
+        return TrendCounter(CountMinSketch(self.width, self.depth), self.capacity)
+
+    def record(self, tenant_id: str, query: str, at: Optional[float] = None) -> None:
+        """질의 한 건을 세 단위의 현재 버킷에 더합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            query (str): 질의 텍스트
+            at (Optional[float]): 질의 시각 (기본: 현재)
+        """
+        text = normalize(query)[:MAX_QUERY_CHARS]
+        if not text:
+            return
+        at = time.time() if at is None else at
+        width, depth = self.width, self.depth
+        tracks = [
+            (TRACK_QUERIES, [(text, sketch_cells(text, width, depth))]),
+            (TRACK_TOPICS, [(word, sketch_cells(word, width, depth)) for word in topics(text)]),
+        ]
+        for granularity in GRANULARITIES:
+            start = bucket_start(granularity, at)
+            for track, keys in tracks:
+                if not keys:
+                    continue
+                bucket = (tenant_id, granularity, track, start)
+                for buckets in (self._views, self._pending):
+                    counter = buckets.get(bucket)
+                    if counter is None:
+                        counter = buckets[bucket] = self._counter()
+                    for key, key_cells in keys:
+                        counter.add(key, key_cells)
+
+    def trends(self, tenant_id: str, granularity: str, limit: int, at: Optional[float] = None) -> RagTrends:
+        """현재 구간의 상위 질의와 주제를 직전 구간과 비교해 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            granularity (str): 구간 단위 (hour, day, week)
+            limit (int): 대상별 최대 반환 수
+            at (Optional[float]): 기준 시각 (기본: 현재)
+
+        Returns:
+            RagTrends: 현재 구간 시작 시간, 질의 수, 상위 질의/주제
+        """
+        at = time.time() if at is None else at
+        size = GRANULARITIES[granularity]
+        start = bucket_start(granularity, at)
+        elapsed = max((at - start) / size, MIN_ELAPSED_RATIO)
+
+        def items(track: str) -> Tuple[List[TrendItem], int, int]:
+            current = self._views.get((tenant_id, granularity, track, start))
+            previous = self._views.get((tenant_id, granularity, track, start - size))
+            result = []
+            for key, count in current.top(limit) if current is not None else ():
+                before = previous.estimate(key) if previous is not None else 0
+                result.append(TrendItem(
+                    text=key, count=count, previous_count=before,
+                    growth=round(count / elapsed / before - 1, 3) if before else None,
+                ))
+            return (
+                result,
+                current.total if current is not None else 0,
+                previous.total if previous is not None else 0,
+            )
+
+        queries, total, previous_total = items(TRACK_QUERIES)
+        return RagTrends(
+            window=granularity,
+            since=_datetime(start),
+            total=total,
+            previous_total=previous_total,
+            queries=queries,
+            topics=items(TRACK_TOPICS)[0],
+        )
+
+    async def flush(self) -> int:
+        """쌓인 증분을 버킷 행에 합쳐 쓰고, 다른 워커가 갱신한 버킷을 다시 읽습니다.
+
+        증분 쓰기에 실패하면 다음 주기에 다시 시도합니다.
+
+        Returns:
+            int: 쓴 버킷 수
+        """
+        async with self._lock:
+            batch, self._pending = self._pending, {}
+            written = 0
+            try:
+                for bucket, delta in list(batch.items()):
+                    merged = await self._write(bucket, delta)
+                    # 쓴 버킷은 실패 시 되돌릴 증분에서 뺀다 (두 번 더하지 않도록)
+                    del batch[bucket]
+                    written += 1
+                    self._set_view(bucket, merged)
+            except Exception:
+                for bucket, delta in batch.items():
+                    pending = self._pending.get(bucket)
+                    if pending is not None:
+                        delta.merge(pending)
+                    self._pending[bucket] = delta
+                raise
+            await self._sync()
+            self._prune(time.time())
+        self.flushes += 1
+        return written
+
+    def _set_view(self, bucket: BucketKey, counter: TrendCounter) -> None:
+        """행에서 읽은 버킷을 조회 상태로 두고, 그동안 쌓인 이 워커의 증분을 더합니다."""
+        pending = self._pending.get(bucket)
+        if pending is not None:
+            counter.merge(pending)
+        self._views[bucket] = counter
+
+    async def _write(self, bucket: BucketKey, delta: TrendCounter) -> TrendCounter:
+        """버킷 행에 증분을 합쳐 씁니다 (다른 워커와 충돌하면 다시 읽어 재시도).
+
+        Returns:
+            TrendCounter: 합친 결과 (행의 새 상태)
+        """
+        tenant_id, granularity, track, start = bucket
+        key = {"tenant_id": tenant_id, "granularity": granularity, "track": track, "bucket_start": _datetime(start)}
+        where = [TREND_TABLE.c[column] == value for column, value in key.items()]
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            async with self.session_factory() as session:
+                row = (await session.execute(select(TREND_TABLE).where(*where))).mappings().first()
+                stored = self._from_row(row) if row is not None else None
+                merged = delta.copy()
+                if stored is not None:
+                    stored.merge(merged)
+                    merged = stored
+                values = {
+                    "total": merged.total,
+                    "width": self.width,
+                    "depth": self.depth,
+                    "sketch": merged.sketch.to_bytes(),
+                    "candidates": merged.candidates,
+                    "updated_at": datetime.utcnow(),
+                }
+                if row is None:
+                    try:
+                        await session.execute(insert(TREND_TABLE).values(**key, **values, version=1))
+                        await session.commit()
+                    except IntegrityError:
+                        continue
+                    return merged
+                result = await session.execute(
+                    update(TREND_TABLE)
+                    .where(*where, TREND_TABLE.c.version == row["version"])
+                    .values(**values, version=row["version"] + 1)
+                )
+                await session.commit()
+                if result.rowcount:
+                    return merged
+        raise RuntimeError(f"트렌드 버킷 동시 갱신이 계속 충돌합니다: {bucket}")
+
+    def _from_row(self, row: Mapping[str, Any]) -> Optional[TrendCounter]:
+        """행을 카운터로 읽습니다 (스케치 크기 설정이 바뀐 행은 None)."""
+        if (row["width"], row["depth"]) != (self.width, self.depth):
+            logger.warning("스케치 크기가 달라 트렌드 버킷을 새로 시작합니다: %s", row["bucket_start"])
+            return None
+        sketch = CountMinSketch.from_bytes(row["sketch"], self.width, self.depth)
+        return TrendCounter(sketch, self.capacity, row["total"], row["candidates"])
+
+    async def _sync(self) -> None:
+        """마지막 동기화 이후 갱신된 현재/직전 버킷 행을 다시 읽고, 지난 버킷 행을 지웁니다."""
+        started = datetime.utcnow()
+        now = _timestamp(started)
+        async with self.session_factory() as session:
+            for granularity, size in GRANULARITIES.items():
+                oldest = _datetime(bucket_start(granularity, now) - size)
+                await session.execute(
+                    delete(TREND_TABLE)
+                    .where(TREND_TABLE.c.granularity == granularity, TREND_TABLE.c.bucket_start < oldest)
+                )
+                query = select(TREND_TABLE).where(
+                    TREND_TABLE.c.granularity == granularity, TREND_TABLE.c.bucket_start >= oldest
+                )
+                if self._synced_at is not None:
+                    query = query.where(TREND_TABLE.c.updated_at >= self._synced_at)
+                for row in (await session.execute(query)).mappings():
+                    counter = self._from_row(row)
+                    if counter is not None:
+                        bucket = (row["tenant_id"], granularity, row["track"], _timestamp(row["bucket_start"]))
+                        self._set_view(bucket, counter)
+            await session.commit()
+        self._synced_at = started - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+
+    def _prune(self, now: float) -> None:
+        """직전 구간보다 오래된 조회용 버킷을 버립니다."""
+        oldest = {granularity: bucket_start(granularity, now) - size for granularity, size in GRANULARITIES.items()}
+        for bucket in [bucket for bucket in self._views if bucket[3] < oldest[bucket[1]]]:
+            del self._views[bucket]
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """저장된 버킷을 읽고 주기적으로 증분을 쓰는 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 쓰기/동기화 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        async with self._lock:
+            await self._sync()
+        interval = interval or settings.TRENDS_FLUSH_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.exception("트렌드 버킷 저장 실패")
+
+        self._task = asyncio.create_task(_loop(), name="rag-trends")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 남은 증분을 씁니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("종료 시 트렌드 버킷 저장 실패")
+
+
+# 전역 트렌드 집계기 인스턴스
+trend_tracker = TrendTracker()
+
+
+def get_trend_tracker() -> TrendTracker:
+    """트렌드 집계기 인스턴스를 반환합니다.
+
+    Returns:
+        TrendTracker: 전역 트렌드 집계기
+    """
+    return trend_tracker
@@ -0,0 +1,5 @@
+"""
+검색 도메인
+
+벡터/키워드 색인 및 검색 관련 모듈들
+"""
@@ -0,0 +1,658 @@
+"""
+검색 권한 색인
+
+`index.meta` 업서트 토픽으로 갱신되는 테넌트별 문서 권한 캐시
+
+- 사용자/그룹/역할/전체 공개별로 허용 문서 서수 집합을 압축 비트맵(roaring 방식)으로 보관합니다.
+- 그룹 ID와 역할 이름은 서로 다른 주체 종류로 따로 보관하므로, ID가 역할 이름과 같은 그룹이
+  역할 권한을 얻지 않습니다.
+- 질의 시 사용자와 소속 그룹, 역할 비트맵의 합집합을 구해 벡터/BM25 검색에 사전 필터로 넘기므로,
+  권한이 좁은 사용자도 k를 키우지 않고 허용된 문서 안에서만 상위 결과를 찾습니다.
+- 이 앱은 `index.meta`를 발행하거나 지난 이벤트를 다시 읽지 않으므로, 테넌트별 문서 권한 메타를
+  주기적으로(그리고 종료 시) 스냅샷 파일에 저장하고 테넌트를 처음 조회할 때 스냅샷에서 비트맵을
+  다시 만듭니다. 마지막 스냅샷 이후의 변경은 비정상 종료 시 사라지므로 `index.meta` 생산자가
+  다시 보내야 합니다.
+- 권한 메타가 아직 도착하지 않은 문서는 검색되지 않습니다 (기본 거부).
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import threading
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Protocol, Sequence, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from ...common.config import settings
+
+logger = logging.getLogger(__name__)
+
+_ARRAY_MAX = 4096
+
+
+def _popcount(bits: np.ndarray) -> int:
+    return int(np.unpackbits(bits.view(np.uint8)).sum())
+
+
+def _bits_to_array(bits: np.ndarray) -> np.ndarray:
+    """비트셋 컨테이너를 정렬된 하위 16비트 값 배열로 변환합니다."""
+    return np.flatnonzero(np.unpackbits(bits.view(np.uint8), bitorder="little")).astype(np.uint16)
+
+
+def _array_to_bits(values: np.ndarray) -> np.ndarray:
+    """하위 16비트 값 배열을 비트셋 컨테이너로 변환합니다."""
+    flags = np.zeros(65536, dtype=bool)
+    flags[values] = True
+    return np.packbits(flags, bitorder="little").view(np.uint64)
+
+
+def _normalize(container: np.ndarray) -> Optional[np.ndarray]:
+    """크기에 맞는 컨테이너 형태(배열/비트셋)로 바꾸고, 비었으면 None을 반환합니다."""
+    if container.dtype == np.uint16:
+        if not len(container):
+            return None
+        return _array_to_bits(container) if len(container) > _ARRAY_MAX else container
+    count = _popcount(container)
+    if not count:
+        return None
+    return _bits_to_array(container) if count <= _ARRAY_MAX else container
+
+
+def _contains(container: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """하위 16비트 값들이 컨테이너에 있는지 여부를 반환합니다."""
+    if container.dtype == np.uint16:
+        positions = np.searchsorted(container, low)
+        positions = np.minimum(positions, len(container) - 1)
+        return container[positions] == low
+    low = low.astype(np.uint64)
+    return ((container[low >> np.uint64(6)] >> (low & np.uint64(63))) & np.uint64(1)).astype(bool)
+
+
+class Bitmap:
+    """정수 집합을 상위 16비트별 컨테이너로 나누어 저장하는 압축 비트맵입니다.
+
+    컨테이너는 원소가 4096개 이하이면 정렬된 uint16 배열, 그보다 많으면
+    65536비트 비트셋(uint64 x 1024)입니다.
+    """
+
+    __slots__ = ("_containers",)
+
+    def __init__(self, values: Optional[Iterable[int]] = None):
+        """비트맵을 만듭니다.
+
+        Args:
+            values (Optional[Iterable[int]]): 초기 원소
+        """
+        self._containers: Dict[int, np.ndarray] = {}
+        if values is not None:
+            self.update(np.fromiter(values, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return sum(
+            len(c) if c.dtype == np.uint16 else _popcount(c) for c in self._containers.values()
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __contains__(self, value: int) -> bool:
+        container = self._containers.get(value >> 16)
+        if container is None:
+            return False
+        return bool(_contains(container, np.array([value & 0xFFFF], dtype=np.uint16))[0])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bitmap) and np.array_equal(self.to_array(), other.to_array())
+
+    def copy(self) -> "Bitmap":
+        """복사본을 반환합니다."""
+        bitmap = Bitmap()
+        bitmap._containers = {high: c.copy() for high, c in self._containers.items()}
+        return bitmap
+
+    def add(self, value: int) -> None:
+        """원소 하나를 추가합니다."""
+        high, low = value >> 16, value & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = np.array([low], dtype=np.uint16)
+        elif container.dtype == np.uint16:
+            position = int(np.searchsorted(container, low))
+            if position < len(container) and container[position] == low:
+                return
+            self._containers[high] = _normalize(np.insert(container, position, low))
+        else:
+            container[low >> 6] |= np.uint64(1) << np.uint64(low & 63)
+
+    def discard(self, value: int) -> None:
+        """원소 하나를 제거합니다 (없으면 무시)."""
+        high, low = value >> 16, value & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            return
+        if container.dtype == np.uint16:
+            position = int(np.searchsorted(container, low))
+            if position >= len(container) or container[position] != low:
+                return
+            container = np.delete(container, position)
+        else:
+            container = container.copy()
+            container[low >> 6] &= ~(np.uint64(1) << np.uint64(low & 63))
+        normalized = _normalize(container)
+        if normalized is None:
+            del self._containers[high]
+        else:
+            self._containers[high] = normalized
+
+    def update(self, values: np.ndarray) -> None:
+        """원소 배열을 한 번에 추가합니다."""
+        values = np.unique(np.asarray(values, dtype=np.int64))
+        highs = values >> 16
+        for high in np.unique(highs):
+            low = (values[highs == high] & 0xFFFF).astype(np.uint16)
+            self._merge(int(high), low)
+
+    def _merge(self, high: int, other: np.ndarray) -> None:
+        container = self._containers.get(high)
+        if container is None:
+            merged = other.copy()
+        elif container.dtype == np.uint16 and other.dtype == np.uint16:
+            merged = np.union1d(container, other).astype(np.uint16)
+        else:
+            left = container if container.dtype == np.uint64 else _array_to_bits(container)
+            right = other if other.dtype == np.uint64 else _array_to_bits(other)
+            merged = left | right
+        self._containers[high] = _normalize(merged)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        result = self.copy()
+        result |= other
+        return result
+
+    def __ior__(self, other: "Bitmap") -> "Bitmap":
+        for high, container in other._containers.items():
+            self._merge(high, container)
+        return self
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high in self._containers.keys() & other._containers.keys():
+            left, right = self._containers[high], other._containers[high]
+            if left.dtype == np.uint64 and right.dtype == np.uint64:
+                merged = _normalize(left & right)
+            else:
+                if left.dtype == np.uint64:
+                    left, right = right, left
+                merged = _normalize(left[_contains(right, left)])
+            if merged is not None:
+                result._containers[high] = merged
+        return result
+
+    @classmethod
+    def union(cls, bitmaps: Sequence["Bitmap"]) -> "Bitmap":
+        """여러 비트맵의 합집합을 반환합니다."""
+        result = Bitmap()
+        for bitmap in bitmaps:
+            result |= bitmap
+        return result
+
+    def to_array(self) -> np.ndarray:
+        """정렬된 원소 배열(int64)을 반환합니다."""
+        parts = []
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            low = container if container.dtype == np.uint16 else _bits_to_array(container)
+            parts.append(low.astype(np.int64) + (high << 16))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def to_mask(self, size: int) -> np.ndarray:
+        """길이 size의 불리언 마스크로 변환합니다 (size 이상의 원소는 무시)."""
+        mask = np.zeros(size, dtype=bool)
+        for high, container in self._containers.items():
+            base = high << 16
+            if base >= size:
+                continue
+            if container.dtype == np.uint64:
+                flags = np.unpackbits(container.view(np.uint8), bitorder="little").view(bool)
+                end = min(size, base + 65536)
+                mask[base:end] = flags[:end - base]
+            else:
+                positions = container.astype(np.int64) + base
+                mask[positions[positions < size]] = True
+        return mask
+
+    @property
+    def nbytes(self) -> int:
+        """컨테이너 바이트 수입니다."""
+        return sum(container.nbytes for container in self._containers.values())
+
+
+class OrdinalSource(Protocol):
+    """문서 ID → 서수 변환을 제공하는 색인 컬렉션 인터페이스입니다."""
+
+    @property
+    def doc_count(self) -> int:
+        """등록된 문서 서수 수입니다."""
+        ...
+
+    def doc_ordinal(self, doc_id: str, create: bool = False) -> Optional[int]:
+        """문서 ID의 서수를 반환합니다."""
+        ...
+
+
+class TenantPermissions:
+    """한 테넌트의 문서 권한 비트맵입니다."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._doc_ids: List[str] = []
+        self._doc_ord: Dict[str, int] = {}
+        self._acl: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], bool]] = {}
+        self.users: Dict[str, Bitmap] = {}
+        self.groups: Dict[str, Bitmap] = {}
+        self.roles: Dict[str, Bitmap] = {}
+        self.public = Bitmap()
+        self.documents = Bitmap()
+        # 색인 컬렉션별 (권한 서수 → 컬렉션 서수) 변환표와 만들 때의 컬렉션 문서 수
+        self._translations: "weakref.WeakKeyDictionary[Any, Tuple[np.ndarray, int]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.dirty = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """락 안에서 문서별 권한 메타를 복사해 저장용 상태를 만들고 변경 표시를 지웁니다.
+
+        비트맵은 권한 메타에서 다시 만들 수 있으므로 저장하지 않습니다.
+
+        Returns:
+            Dict[str, Any]: `doc_ids`(서수 순 문서 ID)와 `acl`(서수별 사용자/그룹/역할/공개 여부)
+        """
+        with self._lock:
+            self.dirty = False
+            return {"doc_ids": list(self._doc_ids), "acl": dict(self._acl)}
+
+    @classmethod
+    def restore(cls, state: Dict[str, Any]) -> "TenantPermissions":
+        """스냅샷 상태에서 권한 비트맵을 다시 만듭니다.
+
+        Args:
+            state (Dict[str, Any]): `snapshot()`이 만든 상태
+
+        Returns:
+            TenantPermissions: 복원한 테넌트 권한
+        """
+        permissions = cls()
+        permissions._doc_ids = list(state["doc_ids"])
+        permissions._doc_ord = {doc_id: i for i, doc_id in enumerate(permissions._doc_ids)}
+        permissions._acl = dict(state["acl"])
+        users: DefaultDict[str, List[int]] = defaultdict(list)
+        groups: DefaultDict[str, List[int]] = defaultdict(list)
+        roles: DefaultDict[str, List[int]] = defaultdict(list)
+        public = []
+        for ordinal, (user_ids, group_ids, role_names, is_public) in permissions._acl.items():
+            for user in user_ids:
+                users[user].append(ordinal)
+            for group in group_ids:
+                groups[group].append(ordinal)
+            for role in role_names:
+                roles[role].append(ordinal)
+            if is_public:
+                public.append(ordinal)
+        permissions.users = {user: Bitmap(ordinals) for user, ordinals in users.items()}
+        permissions.groups = {group: Bitmap(ordinals) for group, ordinals in groups.items()}
+        permissions.roles = {role: Bitmap(ordinals) for role, ordinals in roles.items()}
+        permissions.public = Bitmap(public)
+        permissions.documents = Bitmap(permissions._acl)
+        return permissions
+
+    def doc_id(self, ordinal: int) -> str:
+        """서수에 해당하는 문서 ID를 반환합니다."""
+        return self._doc_ids[ordinal]
+
+    def ordinal(self, doc_id: str) -> Optional[int]:
+        """문서 ID의 권한 서수를 반환합니다 (권한 정보가 없으면 None)."""
+        return self._doc_ord.get(doc_id)
+
+    def upsert(
+        self,
+        doc_id: str,
+        users: Sequence[str],
+        groups: Sequence[str],
+        public: bool = False,
+        roles: Sequence[str] = (),
+    ) -> None:
+        """문서의 권한을 최신 상태로 교체합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+            users (Sequence[str]): 접근 가능한 사용자 ID 목록
+            groups (Sequence[str]): 접근 가능한 그룹 ID 목록
+            public (bool): 테넌트 전체 공개 여부
+            roles (Sequence[str]): 접근 가능한 역할 이름 목록
+        """
+        with self._lock:
+            ordinal = self._doc_ord.get(doc_id)
+            if ordinal is None:
+                ordinal = len(self._doc_ids)
+                self._doc_ids.append(doc_id)
+                self._doc_ord[doc_id] = ordinal
+            else:
+                self._clear(ordinal)
+            self._acl[ordinal] = (tuple(users), tuple(groups), tuple(roles), public)
+            for user in users:
+                self.users.setdefault(user, Bitmap()).add(ordinal)
+            for group in groups:
+                self.groups.setdefault(group, Bitmap()).add(ordinal)
+            for role in roles:
+                self.roles.setdefault(role, Bitmap()).add(ordinal)
+            if public:
+                self.public.add(ordinal)
+            self.documents.add(ordinal)
+            self.dirty = True
+
+    def remove(self, doc_id: str) -> None:
+        """문서의 권한을 모두 제거합니다 (검색 불가)."""
+        with self._lock:
+            ordinal = self._doc_ord.get(doc_id)
+            if ordinal is not None:
+                self._clear(ordinal)
+                self.dirty = True
+
+    def _clear(self, ordinal: int) -> None:
+        acl = self._acl.pop(ordinal, None)
+        if acl is None:
+            return
+        users, groups, roles, _ = acl
+        for name, table in ((users, self.users), (groups, self.groups), (roles, self.roles)):
+            for key in name:
+                bitmap = table.get(key)
+                if bitmap is not None:
+                    bitmap.discard(ordinal)
+                    if not bitmap:
+                        del table[key]
+        self.public.discard(ordinal)
+        self.documents.discard(ordinal)
+
+    def allowed(self, user_id: str, groups: Sequence[str] = (), roles: Sequence[str] = ()) -> Bitmap:
+        """사용자가 접근할 수 있는 문서 서수 비트맵을 반환합니다.
+
+        Args:
+            user_id (str): 사용자 ID
+            groups (Sequence[str]): 사용자가 속한 그룹 ID 목록
+            roles (Sequence[str]): 사용자 역할 이름 목록
+
+        Returns:
+            Bitmap: 허용 문서 서수 비트맵
+        """
+        with self._lock:
+            parts = [self.public]
+            if user_id in self.users:
+                parts.append(self.users[user_id])
+            parts.extend(self.groups[group] for group in groups if group in self.groups)
+            parts.extend(self.roles[role] for role in roles if role in self.roles)
+            return Bitmap.union(parts)
+
+    def translation(self, source: OrdinalSource) -> np.ndarray:
+        """권한 서수를 색인 컬렉션의 문서 서수로 바꾸는 변환표를 반환합니다.
+
+        새 권한 문서와, 지난번에 컬렉션에 없던 문서만 다시 조회하므로 대부분의 질의에서는
+        캐시된 배열을 그대로 씁니다.
+
+        Args:
+            source (OrdinalSource): 벡터/키워드 컬렉션
+
+        Returns:
+            np.ndarray: 권한 서수별 컬렉션 서수 (없으면 -1)
+        """
+        with self._lock:
+            table, seen = self._translations.get(source, (np.zeros(0, dtype=np.int64), -1))
+            count = len(self._doc_ids)
+            if len(table) < count or source.doc_count != seen:
+                grown = np.full(count, -1, dtype=np.int64)
+                grown[:len(table)] = table
+                for ordinal in np.flatnonzero(grown < 0):
+                    resolved = source.doc_ordinal(self._doc_ids[ordinal])
+                    if resolved is not None:
+                        grown[ordinal] = resolved
+                table = grown
+                self._translations[source] = (table, source.doc_count)
+            return table
+
+    def stats(self) -> Dict[str, int]:
+        """권한 비트맵 통계를 반환합니다."""
+        with self._lock:
+            bitmaps = [
+                self.public, self.documents, *self.users.values(), *self.groups.values(), *self.roles.values()
+            ]
+            return {
+                "documents": len(self._acl),
+                "users": len(self.users),
+                "groups": len(self.groups),
+                "roles": len(self.roles),
+                "bitmap_bytes": sum(bitmap.nbytes for bitmap in bitmaps),
+            }
+
+
+@dataclass(frozen=True)
+class AccessFilter:
+    """검색 사전 필터로 전달되는 허용 문서 집합입니다.
+
+    Attributes:
+        permissions (TenantPermissions): 테넌트 권한 색인
+        allowed (Bitmap): 허용 문서의 권한 서수 비트맵
+    """
+
+    permissions: TenantPermissions
+    allowed: Bitmap
+
+    def __len__(self) -> int:
+        return len(self.allowed)
+
+    def allows(self, doc_id: str) -> bool:
+        """문서 하나가 허용되는지 확인합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+
+        Returns:
+            bool: 허용 여부 (권한 정보가 없는 문서는 허용하지 않음)
+        """
+        ordinal = self.permissions.ordinal(doc_id)
+        return ordinal is not None and ordinal in self.allowed
+
+    def mask_for(self, source: OrdinalSource) -> np.ndarray:
+        """색인 컬렉션의 문서 서수 마스크로 변환합니다.
+
+        Args:
+            source (OrdinalSource): 벡터/키워드 컬렉션
+
+        Returns:
+            np.ndarray: 컬렉션 문서 서수별 허용 여부
+        """
+        mapped = self.permissions.translation(source)[self.allowed.to_array()]
+        mask = np.zeros(source.doc_count, dtype=bool)
+        mapped = mapped[(mapped >= 0) & (mapped < len(mask))]
+        mask[mapped] = True
+        return mask
+
+    def doc_ids(self) -> FrozenSet[str]:
+        """허용 문서 ID 집합을 반환합니다 (서수 공간이 없는 백엔드용)."""
+        return frozenset(self.permissions.doc_id(int(o)) for o in self.allowed.to_array())
+
+
+def filter_mask(
+    source: OrdinalSource,
+    doc_ids: Optional[FrozenSet[str]] = None,
+    access: Optional[AccessFilter] = None,
+) -> Optional[np.ndarray]:
+    """문서 ID 필터와 권한 필터를 컬렉션의 문서 서수 마스크 하나로 합칩니다.
+
+    Args:
+        source (OrdinalSource): 벡터/키워드 컬렉션
+        doc_ids (Optional[FrozenSet[str]]): 허용할 문서 ID 집합 (None이면 제한 없음)
+        access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+
+    Returns:
+        Optional[np.ndarray]: 문서 서수별 허용 여부 (제한이 없으면 None)
+    """
+    mask = None
+    if doc_ids is not None:
+        mask = np.zeros(source.doc_count, dtype=bool)
+        ordinals = [source.doc_ordinal(doc_id) for doc_id in doc_ids]
+        mask[[o for o in ordinals if o is not None]] = True
+    if access is not None:
+        allowed = access.mask_for(source)
+        mask = allowed if mask is None else mask & allowed[:len(mask)]
+    return mask
+
+
+class PermissionIndex:
+    """테넌트별 `TenantPermissions`를 관리하는 권한 색인 클래스입니다."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """권한 색인을 초기화합니다. 테넌트 권한은 처음 조회할 때 스냅샷에서 복원됩니다.
+
+        Args:
+            directory (Optional[str]): 스냅샷 디렉터리 (빈 문자열이면 저장하지 않음)
+        """
+        self.directory = settings.SEARCH_ACL_DIR if directory is None else directory
+        self._tenants: Dict[str, TenantPermissions] = {}
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _snapshot_path(self, tenant_id: str) -> str:
+        return os.path.join(self.directory, quote(tenant_id, safe="") + ".acl")
+
+    def tenant(self, tenant_id: str) -> TenantPermissions:
+        """테넌트 권한 색인을 반환합니다 (없으면 스냅샷에서 복원하거나 새로 만듭니다)."""
+        permissions = self._tenants.get(tenant_id)
+        if permissions is None:
+            with self._lock:
+                permissions = self._tenants.get(tenant_id)
+                if permissions is None:
+                    permissions = self._load(tenant_id) or TenantPermissions()
+                    self._tenants[tenant_id] = permissions
+        return permissions
+
+    def _load(self, tenant_id: str) -> Optional[TenantPermissions]:
+        if not self.directory:
+            return None
+        path = self._snapshot_path(tenant_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            permissions = TenantPermissions.restore(pickle.load(f))
+        logger.info("권한 색인 스냅샷 열기: %s (문서 %d개)", path, len(permissions.documents))
+        return permissions
+
+    def save(self, tenant_id: str) -> None:
+        """테넌트 권한 메타의 스냅샷을 원자적으로 기록합니다.
+
+        락 안에서는 권한 메타만 복사하고 직렬화와 쓰기는 락 밖에서 합니다. 기록에 실패하면 다음
+        주기에 다시 저장하도록 변경 표시를 되돌립니다.
+        """
+        permissions = self._tenants.get(tenant_id)
+        if permissions is None or not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._snapshot_path(tenant_id)
+        state = permissions.snapshot()
+        try:
+            payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(path + ".tmp", "wb") as f:
+                f.write(payload)
+            os.replace(path + ".tmp", path)
+        except BaseException:
+            permissions.dirty = True
+            raise
+
+    def maintain(self) -> None:
+        """변경된 테넌트 권한을 저장합니다."""
+        for tenant_id, permissions in list(self._tenants.items()):
+            if permissions.dirty:
+                self.save(tenant_id)
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """주기적 스냅샷 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 스냅샷 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.SEARCH_ACL_SNAPSHOT_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await asyncio.to_thread(self.maintain)
+                except Exception:
+                    logger.exception("권한 색인 스냅샷 실패")
+
+        self._task = asyncio.create_task(_loop(), name="permission-index-snapshot")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 변경된 테넌트 권한을 저장합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.maintain)
+
+    def on_index_meta(self, event: Dict[str, Any]) -> None:
+        """`index.meta` 업서트 이벤트를 반영합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `users`, `groups`, `roles`, `public`,
+                `deleted`(선택)를 포함한 문서 최신 권한 메타
+        """
+        permissions = self.tenant(event["tenant_id"])
+        if event.get("deleted"):
+            permissions.remove(event["doc_id"])
+            return
+        permissions.upsert(
+            event["doc_id"],
+            [str(user) for user in event.get("users") or ()],
+            [str(group) for group in event.get("groups") or ()],
+            bool(event.get("public", False)),
+            [str(role) for role in event.get("roles") or ()],
+        )
+
+    def access_filter(
+        self, tenant_id: str, user_id: str, groups: Sequence[str] = (), roles: Sequence[str] = ()
+    ) -> AccessFilter:
+        """사용자의 검색 사전 필터를 만듭니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            user_id (str): 사용자 ID
+            groups (Sequence[str]): 사용자가 속한 그룹 ID 목록
+            roles (Sequence[str]): 사용자 역할 이름 목록
+
+        Returns:
+            AccessFilter: 허용 문서 필터
+        """
+        permissions = self.tenant(tenant_id)
+        return AccessFilter(permissions, permissions.allowed(user_id, groups, roles))
+
+
+# 전역 권한 색인 인스턴스
+permission_index = PermissionIndex()
+
+
+def get_permission_index() -> PermissionIndex:
+    """권한 색인 인스턴스를 반환합니다.
+
+    Returns:
+        PermissionIndex: 공유 권한 색인
+    """
+    return permission_index
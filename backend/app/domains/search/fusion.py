@@ -0,0 +1,32 @@
+"""
+순위 융합
+
+서로 점수 척도가 다른 검색 결과(BM25, 코사인 유사도)를 순위만으로 합치는 RRF
+"""
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[Hashable, float]]:
+    """여러 순위 목록을 RRF로 합칩니다.
+
+    각 항목의 점수는 `sum(weight / (k + rank))`이며 rank는 1부터 시작합니다.
+
+    Args:
+        rankings (Sequence[Sequence[Hashable]]): 순위 순으로 정렬된 항목 목록들
+        k (int): 하위 순위의 영향을 줄이는 상수
+        weights (Optional[Sequence[float]]): 목록별 가중치 (기본: 모두 1)
+
+    Returns:
+        List[Tuple[Hashable, float]]: (항목, 융합 점수) 내림차순 목록
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[Hashable, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda entry: entry[1], reverse=True)
@@ -0,0 +1,626 @@
+"""
+키워드 색인
+
+테넌트별 BM25 역색인 (외부 검색 클러스터 대체)
+
+- 색인 단위는 청크이며, 청크 서수는 추가 순서대로 증가합니다. 따라서 포스팅은
+  항상 뒤에 덧붙이기만 하면 정렬이 유지되어 증분 갱신 비용이 O(토큰 수)입니다.
+- 포스팅은 델타 부호화 후 최대 간격에 맞는 가장 작은 정수 폭(1/2/4바이트)으로
+  압축된 런(run)들의 목록으로 저장하고, 런이 많아지면 하나로 다시 압축합니다.
+- 문서 재색인/삭제 시 이전 청크는 삭제 표시만 하고, 삭제 비율이 커지면 서수를
+  다시 매기며 압축(compaction)합니다. df는 압축 전까지 삭제된 청크를 포함한 근삿값입니다.
+- 청크 원문은 zlib으로 압축해 보관하며 하이라이트/재순위화에 사용합니다.
+
+색인 상태는 테넌트별 스냅샷 파일로 주기적으로 저장되고 시작 시 다시 읽습니다.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import pickle
+import threading
+import zlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from ...common.config import settings
+from .acl import AccessFilter, filter_mask
+from .tokenizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+_WIDTHS = (np.uint8, np.uint16, np.uint32)
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordHit:
+    """키워드 검색 결과 한 건입니다.
+
+    Attributes:
+        chunk_id (str): 청크 ID
+        doc_id (str): 문서 ID
+        score (float): BM25 점수
+    """
+
+    chunk_id: str
+    doc_id: str
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class Passage:
+    """색인된 청크의 원문과 위치 정보입니다.
+
+    Attributes:
+        chunk_id (str): 청크 ID
+        doc_id (str): 문서 ID
+        doc_name (Optional[str]): 문서 이름
+        page (int): 시작 페이지
+        text (str): 청크 원문
+    """
+
+    chunk_id: str
+    doc_id: str
+    doc_name: Optional[str]
+    page: int
+    text: str
+
+
+def _encode_run(ordinals: np.ndarray, tfs: np.ndarray) -> Tuple[int, int, bytes, bytes]:
+    """정렬된 서수/빈도 배열을 (시작 서수, 개수, 델타 바이트, 빈도 바이트)로 압축합니다."""
+    deltas = np.diff(ordinals.astype(np.int64))
+    width = np.uint8
+    if len(deltas):
+        peak = int(deltas.max())
+        width = next(w for w in _WIDTHS if peak <= np.iinfo(w).max)
+    return (
+        int(ordinals[0]),
+        len(ordinals),
+        deltas.astype(width).tobytes(),
+        np.minimum(tfs, 255).astype(np.uint8).tobytes(),
+    )
+
+
+def _decode_run(run: Tuple[int, int, bytes, bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """압축된 런을 (서수, 빈도) 배열로 복원합니다."""
+    base, count, delta_bytes, tf_bytes = run
+    ordinals = np.empty(count, dtype=np.int64)
+    ordinals[0] = base
+    if count > 1:
+        width = _WIDTHS[[1, 2, 4].index(len(delta_bytes) // (count - 1))]
+        np.cumsum(np.frombuffer(delta_bytes, dtype=width), out=ordinals[1:])
+        ordinals[1:] += base
+    return ordinals, np.frombuffer(tf_bytes, dtype=np.uint8)
+
+
+class PostingList:
+    """압축 런과 미압축 꼬리로 구성된 포스팅 리스트입니다."""
+
+    __slots__ = ("runs", "tail_ordinals", "tail_tfs", "count")
+
+    RUN_SIZE = 128
+    MAX_RUNS = 16
+
+    def __init__(self):
+        self.runs: List[Tuple[int, int, bytes, bytes]] = []
+        self.tail_ordinals = array("I")
+        self.tail_tfs = array("B")
+        self.count = 0
+
+    def add(self, ordinal: int, tf: int) -> None:
+        """포스팅 하나를 추가합니다 (서수는 증가 순서여야 합니다)."""
+        self.tail_ordinals.append(ordinal)
+        self.tail_tfs.append(min(tf, 255))
+        self.count += 1
+        if len(self.tail_ordinals) >= self.RUN_SIZE:
+            self.runs.append(_encode_run(
+                np.frombuffer(self.tail_ordinals, dtype=np.uint32),
+                np.frombuffer(self.tail_tfs, dtype=np.uint8),
+            ))
+            self.tail_ordinals = array("I")
+            self.tail_tfs = array("B")
+            if len(self.runs) > self.MAX_RUNS:
+                ordinals, tfs = self.decode()
+                self.runs = [_encode_run(ordinals, tfs)]
+
+    def decode(self) -> Tuple[np.ndarray, np.ndarray]:
+        """전체 포스팅을 (서수, 빈도) 배열로 복원합니다."""
+        parts = [_decode_run(run) for run in self.runs]
+        if self.tail_ordinals:
+            parts.append((
+                np.frombuffer(self.tail_ordinals, dtype=np.uint32).astype(np.int64),
+                np.frombuffer(self.tail_tfs, dtype=np.uint8).copy(),
+            ))
+        if not parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8)
+        if len(parts) == 1:
+            return parts[0]
+        return (
+            np.concatenate([ordinals for ordinals, _ in parts]),
+            np.concatenate([tfs for _, tfs in parts]),
+        )
+
+    def copy(self) -> "PostingList":
+        """이후 추가와 무관한 사본을 만듭니다 (압축 런은 불변 bytes라 공유)."""
+        postings = PostingList()
+        postings.runs = list(self.runs)
+        postings.tail_ordinals = array("I", self.tail_ordinals)
+        postings.tail_tfs = array("B", self.tail_tfs)
+        postings.count = self.count
+        return postings
+
+    @classmethod
+    def from_arrays(cls, ordinals: np.ndarray, tfs: np.ndarray) -> "PostingList":
+        """정렬된 배열로 압축된 포스팅 리스트를 만듭니다."""
+        postings = cls()
+        if len(ordinals):
+            postings.runs = [_encode_run(ordinals, tfs)]
+            postings.count = len(ordinals)
+        return postings
+
+    @property
+    def nbytes(self) -> int:
+        """압축된 포스팅 바이트 수입니다."""
+        return (
+            sum(len(run[2]) + len(run[3]) for run in self.runs)
+            + self.tail_ordinals.itemsize * len(self.tail_ordinals)
+            + len(self.tail_tfs)
+        )
+
+
+def _grown(values: np.ndarray, needed: int, fill: Any = 0) -> np.ndarray:
+    """배열 길이가 needed 이상이 되도록 두 배씩 늘린 배열을 반환합니다."""
+    if needed <= len(values):
+        return values
+    grown = np.full(max(needed, len(values) * 2), fill, dtype=values.dtype)
+    grown[:len(values)] = values
+    return grown
+
+
+class KeywordCollection:
+    """한 테넌트의 BM25 역색인입니다."""
+
+    def __init__(self, k1: Optional[float] = None, b: Optional[float] = None):
+        """빈 색인을 만듭니다.
+
+        Args:
+            k1 (Optional[float]): BM25 k1 (빈도 포화)
+            b (Optional[float]): BM25 b (길이 정규화)
+        """
+        self.k1 = settings.BM25_K1 if k1 is None else k1
+        self.b = settings.BM25_B if b is None else b
+        self._lock = threading.RLock()
+
+        self._terms: Dict[str, PostingList] = {}
+        self._chunk_ids: List[str] = []
+        self._chunk_ord: Dict[str, int] = {}
+        self._chunk_pages = array("I")
+        self._texts: List[bytes] = []
+        self._chunk_docs = np.zeros(1024, dtype=np.int32)
+        self._lengths = np.zeros(1024, dtype=np.int32)
+        self._alive = np.zeros(1024, dtype=bool)
+
+        self._doc_ids: List[str] = []
+        self._doc_ord: Dict[str, int] = {}
+        self._doc_names: Dict[int, str] = {}
+        self._doc_chunks: Dict[int, List[int]] = {}
+
+        self._live_chunks = 0
+        self._live_length = 0
+        self.dirty = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def snapshot(self) -> "KeywordCollection":
+        """락 안에서 색인 상태를 복사해 저장용 사본을 만들고 변경 표시를 지웁니다.
+
+        복사는 컨테이너 얕은 복사와 배열 복사뿐이므로 직렬화(pickle)보다 훨씬 짧게 락을 잡습니다.
+        사본은 이후 색인/삭제/압축의 영향을 받지 않으므로 락 밖에서 직렬화할 수 있습니다.
+
+        Returns:
+            KeywordCollection: 현재 상태의 사본
+        """
+        with self._lock:
+            state = self.__getstate__()
+            state.update({
+                "_terms": {term: postings.copy() for term, postings in self._terms.items()},
+                "_chunk_ids": list(self._chunk_ids),
+                "_chunk_ord": dict(self._chunk_ord),
+                "_chunk_pages": array("I", self._chunk_pages),
+                "_texts": list(self._texts),
+                "_chunk_docs": self._chunk_docs.copy(),
+                "_lengths": self._lengths.copy(),
+                "_alive": self._alive.copy(),
+                "_doc_ids": list(self._doc_ids),
+                "_doc_ord": dict(self._doc_ord),
+                "_doc_names": dict(self._doc_names),
+                "_doc_chunks": dict(self._doc_chunks),
+                "dirty": False,
+            })
+            self.dirty = False
+        copy = KeywordCollection.__new__(KeywordCollection)
+        copy.__setstate__(state)
+        return copy
+
+    @property
+    def doc_count(self) -> int:
+        """등록된 문서 서수 수입니다."""
+        return len(self._doc_ids)
+
+    def doc_ordinal(self, doc_id: str, create: bool = False) -> Optional[int]:
+        """문서 ID의 서수를 반환합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+            create (bool): 없으면 새로 배정할지 여부
+
+        Returns:
+            Optional[int]: 문서 서수
+        """
+        ordinal = self._doc_ord.get(doc_id)
+        if ordinal is None and create:
+            ordinal = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._doc_ord[doc_id] = ordinal
+        return ordinal
+
+    def index_document(
+        self, doc_id: str, chunks: Sequence[Dict[str, Any]], doc_name: Optional[str] = None
+    ) -> None:
+        """문서의 청크들을 색인합니다 (기존 청크는 교체됩니다).
+
+        Args:
+            doc_id (str): 문서 ID
+            chunks (Sequence[Dict[str, Any]]): `chunk_id`, `text`, `page`를 포함한 청크 목록
+            doc_name (Optional[str]): 문서 이름
+        """
+        tokenized = [Counter(tokenize(chunk["text"])) for chunk in chunks]
+        with self._lock:
+            self._remove_chunks(doc_id)
+            doc_ord = self.doc_ordinal(doc_id, create=True)
+            if doc_name:
+                self._doc_names[doc_ord] = doc_name
+
+            start = len(self._chunk_ids)
+            needed = start + len(chunks)
+            self._chunk_docs = _grown(self._chunk_docs, needed)
+            self._lengths = _grown(self._lengths, needed)
+            self._alive = _grown(self._alive, needed, False)
+
+            ordinals = []
+            for offset, (chunk, counts) in enumerate(zip(chunks, tokenized)):
+                ordinal = start + offset
+                ordinals.append(ordinal)
+                self._chunk_ids.append(chunk["chunk_id"])
+                self._chunk_ord[chunk["chunk_id"]] = ordinal
+                self._chunk_pages.append(int(chunk.get("page") or 0))
+                self._texts.append(zlib.compress(chunk["text"].encode("utf-8")))
+                length = sum(counts.values())
+                self._chunk_docs[ordinal] = doc_ord
+                self._lengths[ordinal] = length
+                self._alive[ordinal] = True
+                self._live_length += length
+                for term, tf in counts.items():
+                    postings = self._terms.get(term)
+                    if postings is None:
+                        postings = self._terms[term] = PostingList()
+                    postings.add(ordinal, tf)
+            self._doc_chunks[doc_ord] = ordinals
+            self._live_chunks += len(ordinals)
+            self.dirty = True
+
+    def delete_document(self, doc_id: str) -> None:
+        """문서의 청크들을 색인에서 제거합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+        """
+        with self._lock:
+            self._remove_chunks(doc_id)
+            self.dirty = True
+
+    def _remove_chunks(self, doc_id: str) -> None:
+        """문서의 현재 청크에 삭제 표시를 합니다 (락 보유 상태에서 호출)."""
+        doc_ord = self._doc_ord.get(doc_id)
+        if doc_ord is None:
+            return
+        for ordinal in self._doc_chunks.pop(doc_ord, ()):
+            if self._alive[ordinal]:
+                self._alive[ordinal] = False
+                self._live_chunks -= 1
+                self._live_length -= int(self._lengths[ordinal])
+                self._chunk_ord.pop(self._chunk_ids[ordinal], None)
+                self._texts[ordinal] = b""
+
+    @property
+    def dead_ratio(self) -> float:
+        """삭제 표시된 청크 비율입니다."""
+        total = len(self._chunk_ids)
+        return 1 - self._live_chunks / total if total else 0.0
+
+    def compact(self) -> None:
+        """삭제된 청크를 제거하고 청크 서수를 다시 매깁니다."""
+        with self._lock:
+            total = len(self._chunk_ids)
+            alive = self._alive[:total]
+            remap = np.full(total, -1, dtype=np.int64)
+            keep = np.flatnonzero(alive)
+            remap[keep] = np.arange(len(keep))
+
+            terms: Dict[str, PostingList] = {}
+            for term, postings in self._terms.items():
+                ordinals, tfs = postings.decode()
+                live = alive[ordinals]
+                if live.any():
+                    terms[term] = PostingList.from_arrays(remap[ordinals[live]], tfs[live])
+            self._terms = terms
+
+            self._chunk_ids = [self._chunk_ids[i] for i in keep]
+            self._chunk_ord = {chunk_id: i for i, chunk_id in enumerate(self._chunk_ids)}
+            self._chunk_pages = array("I", (self._chunk_pages[i] for i in keep))
+            self._texts = [self._texts[i] for i in keep]
+            self._chunk_docs = _grown(self._chunk_docs[keep].copy(), 1024)
+            self._lengths = _grown(self._lengths[keep].copy(), 1024)
+            self._alive = _grown(np.ones(len(keep), dtype=bool), 1024, False)
+            self._doc_chunks = {
+                doc_ord: [int(remap[i]) for i in ordinals]
+                for doc_ord, ordinals in self._doc_chunks.items()
+            }
+            self.dirty = True
+        logger.info("키워드 색인 압축: 청크 %d → %d", total, len(keep))
+
+    def search(
+        self, query: str, k: int, doc_mask: Optional[np.ndarray] = None
+    ) -> List[KeywordHit]:
+        """질의와 BM25 점수가 높은 청크 k개를 찾습니다.
+
+        Args:
+            query (str): 질의 텍스트
+            k (int): 반환할 결과 수
+            doc_mask (Optional[np.ndarray]): 문서 서수별 허용 여부 (True만 검색)
+
+        Returns:
+            List[KeywordHit]: 점수 내림차순 결과
+        """
+        query_terms = Counter(tokenize(query))
+        with self._lock:
+            total = len(self._chunk_ids)
+            if not total or not self._live_chunks or not query_terms:
+                return []
+            live = self._live_chunks
+            avgdl = max(self._live_length / live, 1e-9)
+            lengths = self._lengths[:total].astype(np.float32)
+            norms = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+
+            scores = np.zeros(total, dtype=np.float32)
+            for term, weight in query_terms.items():
+                postings = self._terms.get(term)
+                if postings is None:
+                    continue
+                ordinals, tfs = postings.decode()
+                df = min(postings.count, live)
+                idf = math.log(1 + (live - df + 0.5) / (df + 0.5))
+                tf = tfs.astype(np.float32)
+                scores[ordinals] += weight * idf * tf * (self.k1 + 1) / (tf + norms[ordinals])
+
+            keep = (scores > 0) & self._alive[:total]
+            if doc_mask is not None:
+                docs = self._chunk_docs[:total]
+                allowed = np.zeros(total, dtype=bool)
+                in_range = docs < len(doc_mask)
+                allowed[in_range] = doc_mask[docs[in_range]]
+                keep &= allowed
+            candidates = np.flatnonzero(keep)
+            if len(candidates) > k:
+                top = np.argpartition(-scores[candidates], k - 1)[:k]
+                candidates = candidates[top]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [
+                KeywordHit(
+                    self._chunk_ids[i],
+                    self._doc_ids[self._chunk_docs[i]],
+                    float(scores[i]),
+                )
+                for i in candidates
+            ]
+
+    def passage(self, chunk_id: str) -> Optional[Passage]:
+        """청크 ID의 원문과 위치 정보를 반환합니다.
+
+        Args:
+            chunk_id (str): 청크 ID
+
+        Returns:
+            Optional[Passage]: 청크 정보 (없거나 삭제되었으면 None)
+        """
+        with self._lock:
+            ordinal = self._chunk_ord.get(chunk_id)
+            if ordinal is None:
+                return None
+            doc_ord = int(self._chunk_docs[ordinal])
+            return Passage(
+                chunk_id=chunk_id,
+                doc_id=self._doc_ids[doc_ord],
+                doc_name=self._doc_names.get(doc_ord),
+                page=self._chunk_pages[ordinal],
+                text=zlib.decompress(self._texts[ordinal]).decode("utf-8"),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 통계를 반환합니다."""
+        with self._lock:
+            postings = sum(p.count for p in self._terms.values())
+            return {
+                "documents": len(self._doc_chunks),
+                "chunks": self._live_chunks,
+                "dead_ratio": self.dead_ratio,
+                "terms": len(self._terms),
+                "postings": postings,
+                "posting_bytes": sum(p.nbytes for p in self._terms.values()),
+                "text_bytes": sum(len(text) for text in self._texts),
+            }
+
+
+class LocalKeywordIndex:
+    """테넌트별 `KeywordCollection`을 관리하는 키워드 색인 클래스입니다."""
+
+    def __init__(self, directory: Optional[str] = None, compact_ratio: float = 0.3):
+        """키워드 색인을 초기화합니다. 컬렉션은 처음 접근할 때 스냅샷에서 열립니다.
+
+        Args:
+            directory (Optional[str]): 스냅샷 디렉터리 (빈 문자열이면 저장하지 않음)
+            compact_ratio (float): 압축을 시작할 삭제 청크 비율
+        """
+        self.directory = settings.KEYWORD_INDEX_DIR if directory is None else directory
+        self.compact_ratio = compact_ratio
+        self._collections: Dict[str, KeywordCollection] = {}
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _snapshot_path(self, tenant_id: str) -> str:
+        return os.path.join(self.directory, quote(tenant_id, safe="") + ".bm25")
+
+    def collection(self, tenant_id: str) -> KeywordCollection:
+        """테넌트 컬렉션을 반환합니다 (없으면 스냅샷에서 열거나 새로 만듭니다).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            KeywordCollection: 테넌트 컬렉션
+        """
+        collection = self._collections.get(tenant_id)
+        if collection is None:
+            with self._lock:
+                collection = self._collections.get(tenant_id)
+                if collection is None:
+                    collection = self._load(tenant_id) or KeywordCollection()
+                    self._collections[tenant_id] = collection
+        return collection
+
+    def _load(self, tenant_id: str) -> Optional[KeywordCollection]:
+        if not self.directory:
+            return None
+        path = self._snapshot_path(tenant_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            collection = pickle.load(f)
+        logger.info("키워드 색인 스냅샷 열기: %s", path)
+        return collection
+
+    def save(self, tenant_id: str) -> None:
+        """테넌트 컬렉션의 스냅샷을 원자적으로 기록합니다.
+
+        락 안에서는 상태만 복사하고 직렬화와 쓰기는 락 밖에서 하므로, 저장 중에도 색인과 검색이
+        멈추지 않습니다. 기록에 실패하면 다음 주기에 다시 저장하도록 변경 표시를 되돌립니다.
+        """
+        collection = self._collections.get(tenant_id)
+        if collection is None or not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._snapshot_path(tenant_id)
+        snapshot = collection.snapshot()
+        try:
+            payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(path + ".tmp", "wb") as f:
+                f.write(payload)
+            os.replace(path + ".tmp", path)
+        except BaseException:
+            collection.dirty = True
+            raise
+
+    async def on_documents_indexed(self, event: Dict[str, Any]) -> None:
+        """`documents.indexed` 이벤트를 받아 청크를 색인합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `doc_name`(선택), `chunks`를 포함한 이벤트
+        """
+        collection = self.collection(event["tenant_id"])
+        await asyncio.to_thread(
+            collection.index_document, event["doc_id"], event.get("chunks", ()), event.get("doc_name")
+        )
+
+    async def delete(self, tenant_id: str, doc_id: str) -> None:
+        """문서를 색인에서 제거합니다."""
+        self.collection(tenant_id).delete_document(doc_id)
+
+    async def search(
+        self,
+        tenant_id: str,
+        query: str,
+        k: int,
+        doc_ids: Optional[FrozenSet[str]] = None,
+        access: Optional[AccessFilter] = None,
+    ) -> List[KeywordHit]:
+        """테넌트 컬렉션에서 BM25 검색을 수행합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            query (str): 질의 텍스트
+            k (int): 반환할 결과 수
+            doc_ids (Optional[FrozenSet[str]]): 허용할 문서 ID 집합 (None이면 제한 없음)
+            access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+
+        Returns:
+            List[KeywordHit]: 점수 내림차순 결과
+        """
+        collection = self.collection(tenant_id)
+        doc_mask = filter_mask(collection, doc_ids, access)
+        return await asyncio.to_thread(collection.search, query, k, doc_mask)
+
+    def passage(self, tenant_id: str, chunk_id: str) -> Optional[Passage]:
+        """청크 원문과 위치 정보를 반환합니다."""
+        return self.collection(tenant_id).passage(chunk_id)
+
+    def maintain(self) -> None:
+        """삭제 비율이 높은 컬렉션을 압축하고 변경된 컬렉션을 저장합니다."""
+        for tenant_id, collection in list(self._collections.items()):
+            if collection.dead_ratio >= self.compact_ratio:
+                collection.compact()
+            if collection.dirty:
+                self.save(tenant_id)
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """주기적 압축/스냅샷 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 유지보수 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.KEYWORD_INDEX_SNAPSHOT_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await asyncio.to_thread(self.maintain)
+                except Exception:
+                    logger.exception("키워드 색인 유지보수 실패")
+
+        self._task = asyncio.create_task(_loop(), name="keyword-index-maintenance")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 변경된 컬렉션을 저장합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.maintain)
@@ -0,0 +1,136 @@
+"""
+pgvector 벡터 색인
+
+`VectorIndex` 인터페이스의 PostgreSQL + pgvector 구현
+
+스키마는 `ensure_schema()`로 생성하며, HNSW 색인(vector_cosine_ops)을 사용합니다.
+"""
+
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.config import settings
+from ...common.database import db_manager
+from .vector_index import VectorFilter, VectorHit
+
+
+def _vector_literal(vector: np.ndarray) -> str:
+    """numpy 벡터를 pgvector 문자열 리터럴로 변환합니다."""
+    return "[" + ",".join(f"{value:.7g}" for value in np.asarray(vector, dtype=np.float32)) + "]"
+
+
+class PgVectorIndex:
+    """pgvector 기반 벡터 색인 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        dim: Optional[int] = None,
+    ):
+        """pgvector 색인을 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], AsyncSession]]): 세션 팩토리
+            dim (Optional[int]): 벡터 차원
+        """
+        self._session_factory = session_factory or db_manager.SessionLocal
+        self.dim = dim or settings.EMBEDDING_DIM
+
+    async def ensure_schema(self) -> None:
+        """확장, 테이블, 색인을 생성합니다."""
+        statements = [
+            "CREATE EXTENSION IF NOT EXISTS vector",
+            f"""CREATE TABLE IF NOT EXISTS chunk_embeddings (
+                tenant_id TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                embedding vector({self.dim}) NOT NULL,
+                PRIMARY KEY (tenant_id, chunk_id)
+            )""",
+            "CREATE INDEX IF NOT EXISTS ix_chunk_embeddings_doc ON chunk_embeddings (tenant_id, doc_id)",
+            "CREATE INDEX IF NOT EXISTS ix_chunk_embeddings_hnsw "
+            "ON chunk_embeddings USING hnsw (embedding vector_cosine_ops)",
+        ]
+        async with self._session_factory() as session:
+            for statement in statements:
+                await session.execute(text(statement))
+            await session.commit()
+
+    async def start(self) -> None:
+        """스키마를 준비합니다 (애플리케이션 시작 시 호출)."""
+        await self.ensure_schema()
+
+    async def stop(self) -> None:
+        """종료 시 정리할 상태가 없습니다 (연결은 db_manager가 관리)."""
+
+    async def upsert(
+        self, tenant_id: str, doc_id: str, chunk_ids: Sequence[str], vectors: np.ndarray
+    ) -> None:
+        """문서의 청크 벡터를 통째로 교체합니다."""
+        async with self._session_factory() as session:
+            await session.execute(
+                text("DELETE FROM chunk_embeddings WHERE tenant_id = :tenant_id AND doc_id = :doc_id"),
+                {"tenant_id": tenant_id, "doc_id": doc_id},
+            )
+            if len(chunk_ids):
+                await session.execute(
+                    text(
+                        "INSERT INTO chunk_embeddings (tenant_id, doc_id, chunk_id, embedding) "
+                        "VALUES (:tenant_id, :doc_id, :chunk_id, CAST(:embedding AS vector))"
+                    ),
+                    [
+                        {
+                            "tenant_id": tenant_id,
+                            "doc_id": doc_id,
+                            "chunk_id": chunk_id,
+                            "embedding": _vector_literal(vector),
+                        }
+                        for chunk_id, vector in zip(chunk_ids, vectors)
+                    ],
+                )
+            await session.commit()
+
+    async def delete(self, tenant_id: str, doc_id: str) -> None:
+        """문서의 청크 벡터를 삭제합니다."""
+        async with self._session_factory() as session:
+            await session.execute(
+                text("DELETE FROM chunk_embeddings WHERE tenant_id = :tenant_id AND doc_id = :doc_id"),
+                {"tenant_id": tenant_id, "doc_id": doc_id},
+            )
+            await session.commit()
+
+    async def search(
+        self,
+        tenant_id: str,
+        query: np.ndarray,
+        k: int,
+        vector_filter: Optional[VectorFilter] = None,
+    ) -> List[VectorHit]:
+        """질의 벡터와 가장 가까운 청크 k개를 반환합니다."""
+        params = {"tenant_id": tenant_id, "query": _vector_literal(query), "k": k}
+        where = "tenant_id = :tenant_id"
+        doc_ids = vector_filter.doc_ids if vector_filter is not None else None
+        if vector_filter is not None and vector_filter.access is not None:
+            # 문서 서수 공간이 없으므로 권한 비트맵을 문서 ID 목록으로 풀어 같은 조건에 합친다
+            allowed = vector_filter.access.doc_ids()
+            doc_ids = allowed if doc_ids is None else doc_ids & allowed
+        if doc_ids is not None:
+            if not doc_ids:
+                return []
+            where += " AND doc_id IN :doc_ids"
+            params["doc_ids"] = list(doc_ids)
+
+        statement = text(
+            "SELECT chunk_id, doc_id, 1 - (embedding <=> CAST(:query AS vector)) AS score "
+            f"FROM chunk_embeddings WHERE {where} "
+            "ORDER BY embedding <=> CAST(:query AS vector) LIMIT :k"
+        )
+        if "doc_ids" in params:
+            statement = statement.bindparams(bindparam("doc_ids", expanding=True))
+
+        async with self._session_factory() as session:
+            result = await session.execute(statement, params)
+            return [VectorHit(row.chunk_id, row.doc_id, float(row.score)) for row in result]
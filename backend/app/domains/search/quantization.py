@@ -0,0 +1,273 @@
+"""
+벡터 양자화
+
+벡터 색인 세그먼트의 메모리 상주 코드를 줄이기 위한 양자화기
+
+- `ScalarQuantizer`: 차원별 최소/최대 범위로 8비트 스칼라 양자화 (4배 축소)
+- `ProductQuantizer`: 부분 공간별 256개 코드북으로 곱 양자화 (dim*4 / m 배 축소)
+
+두 양자화기 모두 질의를 한 번 전처리(`prepare`)한 뒤 코드 블록에 대해
+행렬 곱/테이블 조회만 수행하므로 BLAS·NumPy 벡터화 연산으로 처리됩니다.
+근사 점수로 후보를 고른 뒤 원본 벡터로 재채점하는 것은 세그먼트 검색 쪽에서 합니다.
+"""
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+# 양자화 방식 이름
+QUANTIZATION_NONE = "none"
+QUANTIZATION_INT8 = "int8"
+QUANTIZATION_PQ = "pq"
+
+_BLOCK = 16384
+
+
+class ScalarQuantizer:
+    """차원별 8비트 스칼라 양자화기입니다.
+
+    `code = round((x - lower) / scale)`로 부호화하므로
+    내적은 `code · (q * scale) + q · lower`로 근사됩니다.
+    """
+
+    kind = QUANTIZATION_INT8
+
+    def __init__(self, lower: Optional[np.ndarray] = None, scale: Optional[np.ndarray] = None):
+        """양자화기를 초기화합니다.
+
+        Args:
+            lower (Optional[np.ndarray]): 차원별 최솟값
+            scale (Optional[np.ndarray]): 차원별 양자화 간격
+        """
+        self.lower = lower
+        self.scale = scale
+
+    def train(self, vectors: np.ndarray) -> "ScalarQuantizer":
+        """벡터의 차원별 범위를 학습합니다.
+
+        Args:
+            vectors (np.ndarray): (N, dim) 벡터
+
+        Returns:
+            ScalarQuantizer: 학습된 자기 자신
+        """
+        lower = vectors.min(axis=0).astype(np.float32)
+        upper = vectors.max(axis=0).astype(np.float32)
+        self.lower = lower
+        self.scale = np.maximum((upper - lower) / 255.0, 1e-12).astype(np.float32)
+        return self
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터를 (N, dim) uint8 코드로 부호화합니다."""
+        codes = np.empty(vectors.shape, dtype=np.uint8)
+        for start in range(0, len(vectors), _BLOCK):
+            block = (vectors[start:start + _BLOCK] - self.lower) / self.scale
+            codes[start:start + _BLOCK] = np.clip(np.rint(block), 0, 255)
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드를 근사 벡터로 복원합니다."""
+        return codes.astype(np.float32) * self.scale + self.lower
+
+    def prepare(self, query: np.ndarray) -> Tuple[np.ndarray, float]:
+        """질의를 코드 공간의 가중치와 상수항으로 변환합니다."""
+        return (query * self.scale).astype(np.float32), float(query @ self.lower)
+
+    def score(self, prepared: Tuple[np.ndarray, float], codes: np.ndarray) -> np.ndarray:
+        """코드 블록의 근사 내적 점수를 계산합니다.
+
+        Args:
+            prepared (Tuple[np.ndarray, float]): `prepare` 결과
+            codes (np.ndarray): (N, dim) 코드
+
+        Returns:
+            np.ndarray: (N,) 근사 점수
+        """
+        weights, bias = prepared
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), _BLOCK):
+            block = codes[start:start + _BLOCK].astype(np.float32)
+            scores[start:start + _BLOCK] = block @ weights
+        scores += bias
+        return scores
+
+    def state(self) -> dict:
+        """저장할 상태 배열을 반환합니다."""
+        return {"lower": self.lower, "scale": self.scale}
+
+
+class ProductQuantizer:
+    """곱 양자화(PQ) 양자화기입니다.
+
+    벡터를 m개의 부분 벡터로 나누고 부분 공간마다 최대 256개 중심점 중 하나의
+    번호(1바이트)로 부호화합니다. 질의는 부분 공간별 내적 조회표로 바꾸어
+    코드당 m번의 조회와 덧셈으로 점수를 구합니다(ADC).
+    """
+
+    kind = QUANTIZATION_PQ
+
+    def __init__(self, m: int, codebooks: Optional[np.ndarray] = None):
+        """양자화기를 초기화합니다.
+
+        Args:
+            m (int): 부분 공간 수 (차원을 나누어떨어지게 해야 함)
+            codebooks (Optional[np.ndarray]): (m, ksub, dsub) 코드북
+        """
+        self.m = m
+        self.codebooks = codebooks
+
+    @staticmethod
+    def subspaces_for(dim: int, requested: int) -> int:
+        """차원을 나누어떨어지게 하는, 요청값 이하의 가장 큰 부분 공간 수를 반환합니다."""
+        for m in range(min(requested, dim), 0, -1):
+            if dim % m == 0:
+                return m
+        return 1
+
+    def train(
+        self, vectors: np.ndarray, iterations: int = 10, sample: int = 10000, seed: int = 0
+    ) -> "ProductQuantizer":
+        """부분 공간별 k-means로 코드북을 학습합니다.
+
+        Args:
+            vectors (np.ndarray): (N, dim) 벡터
+            iterations (int): k-means 반복 횟수
+            sample (int): 학습에 쓸 최대 표본 수
+            seed (int): 난수 시드
+
+        Returns:
+            ProductQuantizer: 학습된 자기 자신
+        """
+        rng = np.random.default_rng(seed)
+        if len(vectors) > sample:
+            vectors = vectors[rng.choice(len(vectors), sample, replace=False)]
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        n, dim = vectors.shape
+        if dim % self.m:
+            raise ValueError(f"차원 {dim}은 부분 공간 수 {self.m}로 나누어떨어지지 않습니다")
+        dsub = dim // self.m
+        ksub = min(256, n)
+
+        codebooks = np.empty((self.m, ksub, dsub), dtype=np.float32)
+        for j in range(self.m):
+            sub = vectors[:, j * dsub:(j + 1) * dsub]
+            centroids = sub[rng.choice(n, ksub, replace=False)].copy()
+            for _ in range(iterations):
+                labels = self._nearest(sub, centroids)
+                counts = np.bincount(labels, minlength=ksub)
+                # 부분 벡터 차원이 작으므로 차원별 bincount가 np.add.at보다 훨씬 빠르다
+                sums = np.stack(
+                    [np.bincount(labels, weights=sub[:, d], minlength=ksub) for d in range(dsub)],
+                    axis=1,
+                )
+                filled = counts > 0
+                centroids[filled] = sums[filled] / counts[filled, None]
+            codebooks[j] = centroids
+        self.codebooks = codebooks
+        return self
+
+    @staticmethod
+    def _nearest(sub: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """부분 벡터별 가장 가까운(L2) 중심점 번호를 반환합니다."""
+        distances = (centroids ** 2).sum(axis=1) - 2 * (sub @ centroids.T)
+        return np.argmin(distances, axis=1)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터를 (N, m) uint8 코드로 부호화합니다."""
+        dsub = self.codebooks.shape[2]
+        codes = np.empty((len(vectors), self.m), dtype=np.uint8)
+        for start in range(0, len(vectors), _BLOCK):
+            block = np.asarray(vectors[start:start + _BLOCK], dtype=np.float32)
+            for j in range(self.m):
+                codes[start:start + _BLOCK, j] = self._nearest(
+                    block[:, j * dsub:(j + 1) * dsub], self.codebooks[j]
+                )
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드를 근사 벡터로 복원합니다."""
+        parts = [self.codebooks[j][codes[:, j]] for j in range(self.m)]
+        return np.concatenate(parts, axis=1)
+
+    def prepare(self, query: np.ndarray) -> np.ndarray:
+        """질의를 평탄화된 (m * ksub,) 내적 조회표로 변환합니다."""
+        dsub = self.codebooks.shape[2]
+        table = np.einsum("md,mkd->mk", query.reshape(self.m, dsub), self.codebooks)
+        return np.ascontiguousarray(table, dtype=np.float32).ravel()
+
+    def score(self, prepared: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """코드 블록의 근사 내적 점수를 계산합니다.
+
+        Args:
+            prepared (np.ndarray): `prepare` 결과 조회표
+            codes (np.ndarray): (N, m) 코드
+
+        Returns:
+            np.ndarray: (N,) 근사 점수
+        """
+        ksub = self.codebooks.shape[1]
+        offsets = np.arange(self.m, dtype=np.intp) * ksub
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), _BLOCK):
+            index = codes[start:start + _BLOCK].astype(np.intp)
+            index += offsets
+            scores[start:start + _BLOCK] = prepared.take(index).sum(axis=1)
+        return scores
+
+    def state(self) -> dict:
+        """저장할 상태 배열을 반환합니다."""
+        return {"codebooks": self.codebooks}
+
+
+Quantizer = Union[ScalarQuantizer, ProductQuantizer]
+
+
+def create_quantizer(kind: str, dim: int, pq_subvectors: int = 48) -> Optional[Quantizer]:
+    """양자화 방식 이름으로 (학습 전) 양자화기를 생성합니다.
+
+    Args:
+        kind (str): 양자화 방식 (none | int8 | pq)
+        dim (int): 벡터 차원
+        pq_subvectors (int): PQ 부분 공간 수 (차원의 약수로 조정됨)
+
+    Returns:
+        Optional[Quantizer]: 양자화기 (none이면 None)
+
+    Raises:
+        ValueError: 알 수 없는 양자화 방식인 경우
+    """
+    if kind == QUANTIZATION_NONE:
+        return None
+    if kind == QUANTIZATION_INT8:
+        return ScalarQuantizer()
+    if kind == QUANTIZATION_PQ:
+        return ProductQuantizer(ProductQuantizer.subspaces_for(dim, pq_subvectors))
+    raise ValueError(f"알 수 없는 양자화 방식입니다: {kind}")
+
+
+def save_quantizer(path: str, quantizer: Quantizer) -> None:
+    """양자화기 상태를 `.npz` 파일로 저장합니다."""
+    np.savez(path, kind=np.array(quantizer.kind), **quantizer.state())
+
+
+def load_quantizer(path: str) -> Quantizer:
+    """저장된 양자화기를 불러옵니다.
+
+    Args:
+        path (str): `.npz` 파일 경로
+
+    Returns:
+        Quantizer: 양자화기
+
+    Raises:
+        ValueError: 알 수 없는 양자화 방식인 경우
+    """
+    with np.load(path) as data:
+        kind = str(data["kind"])
+        state: Any = {name: data[name] for name in data.files if name != "kind"}
+    if kind == QUANTIZATION_INT8:
+        return ScalarQuantizer(state["lower"], state["scale"])
+    if kind == QUANTIZATION_PQ:
+        codebooks = state["codebooks"]
+        return ProductQuantizer(codebooks.shape[0], codebooks)
+    raise ValueError(f"알 수 없는 양자화 방식입니다: {kind}")
@@ -0,0 +1,470 @@
+"""
+재순위화(rerank)
+
+1차 검색(BM25 + 벡터) 상위 후보를 크로스 인코더로 다시 채점하는 단계
+
+- 후보 (질의, 본문) 쌍을 배치로 묶어 전용 스레드의 ONNX Runtime(CPU)에서 추론합니다.
+- 요청마다 시간 예산을 두고, 예산 안에 모든 배치를 채점하지 못하면 1차 검색 순서를
+  그대로 반환합니다 (늦게 끝난 배치 점수는 캐시에만 저장).
+- 재순위화할 후보 수는 최근 본문당 추론 시간과 동시 요청 수로 조절해, 부하가 높을 때도
+  예산 안에 끝날 만큼만 채점합니다.
+- (모델 식별자, 모델 버전, 질의 해시, 본문 해시) 단위로 점수를 캐시해 같은 질의의 반복/페이지 이동 시
+  추론을 건너뜁니다.
+
+ONNX 모델은 크로스 인코더를 optimum으로 내보낸 디렉터리를 사용합니다.
+    optimum-cli export onnx --model cross-encoder/ms-marco-MiniLM-L-6-v2 models/reranker
+
+백엔드는 임베딩과 같이 시작 시점에 만들며, 설정이 잘못되었으면 애플리케이션이 뜨지 않습니다
+(재순위화 없이 실행하려면 RERANK_BACKEND=none).
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from ...common.config import settings
+from ..embedding.cache import content_digest
+from .tokenizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+# 재순위화 결과 상태
+RERANK_RERANKED = "reranked"
+RERANK_CACHED = "cached"
+RERANK_TIMEOUT = "timeout"
+RERANK_FAILED = "failed"
+RERANK_DISABLED = "disabled"
+
+# 본문당 추론 시간 이동 평균의 가중치
+_EWMA_ALPHA = 0.2
+
+
+class RerankBackend(Protocol):
+    """크로스 인코더 백엔드 인터페이스입니다.
+
+    Attributes:
+        model_id (str): 모델 식별자
+        model_version (str): 모델 버전
+    """
+
+    model_id: str
+    model_version: str
+
+    def score(self, query: str, passages: Sequence[str]) -> np.ndarray:
+        """(질의, 본문) 쌍의 관련도를 (N,) float32 배열(0~1)로 반환합니다."""
+        ...
+
+
+class OnnxCrossEncoderBackend:
+    """ONNX Runtime 기반 CPU 크로스 인코더 백엔드입니다."""
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_id: Optional[str] = None,
+        model_version: Optional[str] = None,
+        max_length: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+    ):
+        """ONNX 세션과 토크나이저를 로드합니다.
+
+        Args:
+            model_dir (str): `model.onnx`와 `tokenizer.json`이 있는 디렉터리
+            model_id (Optional[str]): 모델 식별자
+            model_version (Optional[str]): 모델 버전
+            max_length (Optional[int]): (질의 + 본문) 최대 시퀀스 길이 (초과분은 잘림)
+            intra_op_threads (Optional[int]): 연산자 내부 병렬 스레드 수 (0이면 ORT 기본값)
+
+        Raises:
+            RuntimeError: onnxruntime/tokenizers 패키지가 없는 경우
+        """
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "ONNX 재순위화 백엔드에는 onnxruntime, tokenizers 패키지가 필요합니다 "
+                "(poetry install -E onnx)"
+            ) from exc
+
+        self.model_id = model_id or settings.RERANK_MODEL
+        self.model_version = model_version or settings.RERANK_MODEL_VERSION
+        max_length = max_length or settings.RERANK_MAX_SEQ_LENGTH
+        intra = settings.RERANK_INTRA_OP_THREADS if intra_op_threads is None else intra_op_threads
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if intra:
+            options.intra_op_num_threads = intra
+
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {node.name for node in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        # 질의는 짧으므로 길이 초과 시 본문 쪽을 자른다
+        self.tokenizer.enable_truncation(max_length=max_length, strategy="only_second")
+        self.tokenizer.enable_padding()
+
+        logger.info("ONNX 재순위화 모델 로드 완료: %s@%s", self.model_id, self.model_version)
+
+    def score(self, query: str, passages: Sequence[str]) -> np.ndarray:
+        """본문 배치를 채점합니다.
+
+        Args:
+            query (str): 질의 텍스트
+            passages (Sequence[str]): 본문 목록
+
+        Returns:
+            np.ndarray: (N,) 관련도 확률
+        """
+        encodings = self.tokenizer.encode_batch([(query, passage) for passage in passages])
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        feeds = {
+            "input_ids": input_ids,
+            "attention_mask": np.asarray([e.attention_mask for e in encodings], dtype=np.int64),
+        }
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encodings], dtype=np.int64)
+
+        logits = self.session.run(None, feeds)[0]
+        # 단일 로짓(관련도) 또는 [무관, 관련] 두 로짓 출력을 모두 지원한다
+        logits = logits[:, -1] if logits.ndim == 2 else logits
+        return (1.0 / (1.0 + np.exp(-logits))).astype(np.float32)
+
+
+class LexicalRerankBackend:
+    """질의 토큰 겹침 기반 결정적 재순위화 백엔드입니다.
+
+    모델 파일 없이 동작하므로 로컬 개발, 테스트, 벤치마크 용도로만 사용합니다.
+    """
+
+    def __init__(self, model_version: str = "1"):
+        """백엔드를 초기화합니다.
+
+        Args:
+            model_version (str): 모델 버전
+        """
+        self.model_id = "lexical"
+        self.model_version = model_version
+
+    def score(self, query: str, passages: Sequence[str]) -> np.ndarray:
+        """본문 배치를 채점합니다 (질의 토큰 재현율에 본문 길이 감쇠를 곱한 값)."""
+        terms = set(tokenize(query))
+        scores = np.zeros(len(passages), dtype=np.float32)
+        if not terms:
+            return scores
+        for i, passage in enumerate(passages):
+            counts = Counter(tokenize(passage))
+            matched = sum(1 for term in terms if counts[term])
+            scores[i] = matched / len(terms) / (1.0 + math.log1p(sum(counts.values())) / 10)
+        return scores
+
+
+def create_rerank_backend() -> Optional[RerankBackend]:
+    """설정(RERANK_BACKEND)에 따라 재순위화 백엔드를 생성합니다.
+
+    Returns:
+        Optional[RerankBackend]: 재순위화 백엔드 (none이면 None)
+
+    Raises:
+        RuntimeError: ONNX 백엔드인데 모델 디렉터리가 설정되지 않은 경우
+    """
+    if settings.RERANK_BACKEND == "none":
+        return None
+    if settings.RERANK_BACKEND == "lexical":
+        logger.warning("어휘 기반 재순위화 백엔드를 사용합니다 (개발/테스트 전용)")
+        return LexicalRerankBackend(settings.RERANK_MODEL_VERSION)
+    if not settings.RERANK_ONNX_DIR:
+        raise RuntimeError("RERANK_ONNX_DIR가 설정되지 않았습니다")
+    return OnnxCrossEncoderBackend(settings.RERANK_ONNX_DIR)
+
+
+@dataclass
+class RerankOutcome:
+    """재순위화 결과입니다.
+
+    Attributes:
+        order (List[int]): 입력 후보 인덱스의 최종 순서
+        scores (Dict[int, float]): 채점된 후보 인덱스별 관련도 (폴백 시 비어 있음)
+        status (str): reranked | cached | timeout | failed | disabled
+        candidates (int): 채점 대상으로 고른 후보 수
+        cache_hits (int): 캐시에서 찾은 점수 수
+        elapsed_ms (float): 재순위화 단계 소요 시간(ms)
+    """
+
+    order: List[int]
+    scores: Dict[int, float] = field(default_factory=dict)
+    status: str = RERANK_DISABLED
+    candidates: int = 0
+    cache_hits: int = 0
+    elapsed_ms: float = 0.0
+
+
+class Reranker:
+    """배치/시간 예산/적응형 후보 수/점수 캐시를 갖춘 재순위화 서비스 클래스입니다."""
+
+    def __init__(
+        self,
+        backend_factory: Optional[Callable[[], Optional[RerankBackend]]] = None,
+        batch_size: Optional[int] = None,
+        budget_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        min_candidates: Optional[int] = None,
+        cache_entries: Optional[int] = None,
+    ):
+        """재순위화 서비스를 초기화합니다.
+
+        Args:
+            backend_factory (Optional[Callable[[], Optional[RerankBackend]]]): 백엔드 생성 함수
+                (시작 시 호출, None을 반환하면 재순위화 비활성화)
+            batch_size (Optional[int]): 추론 1회당 최대 본문 수
+            budget_ms (Optional[float]): 요청당 재순위화 시간 예산(ms)
+            max_candidates (Optional[int]): 재순위화할 최대 후보 수
+            min_candidates (Optional[int]): 부하가 높아도 보장할 최소 후보 수
+            cache_entries (Optional[int]): 점수 캐시 최대 항목 수
+        """
+        self._backend_factory = backend_factory or create_rerank_backend
+        self._backend: Optional[RerankBackend] = None
+        self._loaded = False
+        self.batch_size = batch_size or settings.RERANK_BATCH_SIZE
+        self.budget = (settings.RERANK_BUDGET_MS if budget_ms is None else budget_ms) / 1000
+        self.max_candidates = max_candidates or settings.RERANK_MAX_CANDIDATES
+        self.min_candidates = min(min_candidates or settings.RERANK_MIN_CANDIDATES, self.max_candidates)
+        self.cache_entries = settings.RERANK_CACHE_ENTRIES if cache_entries is None else cache_entries
+
+        self._cache: "OrderedDict[Tuple[str, str, bytes, bytes], float]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight = 0
+        self._seconds_per_passage = 0.0
+
+        self._requests = 0
+        self._timeouts = 0
+        self._passages = 0
+        self._cache_hits = 0
+
+    @property
+    def backend(self) -> Optional[RerankBackend]:
+        """재순위화 백엔드입니다 (시작 전이면 최초 접근 시 생성)."""
+        return self._ensure_backend()
+
+    def _ensure_backend(self) -> Optional[RerankBackend]:
+        """백엔드를 아직 만들지 않았으면 만들어 반환합니다.
+
+        Raises:
+            RuntimeError: 재순위화 백엔드를 만들 수 없는 경우 (예: ONNX 모델 디렉터리 미설정)
+        """
+        if not self._loaded:
+            self._backend = self._backend_factory()
+            self._loaded = True
+        return self._backend
+
+    async def start(self) -> None:
+        """백엔드를 만듭니다.
+
+        첫 질의가 모델을 읽느라 이벤트 루프를 막거나 조용히 1차 순서로 떨어지는 대신,
+        설정이 잘못되었으면 애플리케이션이 뜨지 않게 합니다.
+
+        Raises:
+            RuntimeError: 재순위화 백엔드를 만들 수 없는 경우
+        """
+        backend = self._ensure_backend()
+        if backend is None:
+            logger.info("재순위화 비활성화 (RERANK_BACKEND=none)")
+
+    @property
+    def enabled(self) -> bool:
+        """재순위화 백엔드를 사용할 수 있는지 여부입니다."""
+        return self.backend is not None
+
+    def candidate_limit(self) -> int:
+        """현재 부하에서 예산 안에 채점할 수 있는 후보 수를 반환합니다.
+
+        추론은 한 스레드에서 순서대로 실행되므로, 진행 중인 요청 수만큼 예산을 나눠
+        최근 본문당 추론 시간으로 처리 가능한 본문 수를 추정합니다.
+
+        Returns:
+            int: min_candidates 이상 max_candidates 이하의 후보 수
+        """
+        limit = self.max_candidates
+        if self._seconds_per_passage > 0:
+            affordable = self.budget / (self._seconds_per_passage * (self._inflight + 1))
+            limit = min(limit, int(affordable))
+        return max(self.min_candidates, limit)
+
+    def _cache_key(self, backend: RerankBackend, query: bytes, passage: str) -> Tuple[str, str, bytes, bytes]:
+        # 버전 문자열이 같아도 다른 모델의 점수를 섞지 않도록 모델 식별자까지 키에 넣는다
+        return backend.model_id, backend.model_version, query, content_digest(passage)
+
+    def _cache_put(self, key: Tuple[str, str, bytes, bytes], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+
+    async def rerank(self, query: str, passages: Sequence[str]) -> RerankOutcome:
+        """1차 검색 순서의 본문 목록을 재순위화합니다.
+
+        상위 `candidate_limit()`개만 채점하고 나머지는 1차 순서대로 뒤에 붙입니다.
+
+        Args:
+            query (str): 질의 텍스트
+            passages (Sequence[str]): 1차 검색 순서의 본문 목록
+
+        Returns:
+            RerankOutcome: 최종 순서, 점수, 상태, 소요 시간
+        """
+        started = time.perf_counter()
+        first_stage = list(range(len(passages)))
+        backend = self.backend
+        if backend is None or not passages:
+            return RerankOutcome(first_stage, status=RERANK_DISABLED)
+
+        self._requests += 1
+        count = min(len(passages), self.candidate_limit())
+        query_digest = content_digest(query)
+        keys = [self._cache_key(backend, query_digest, p) for p in passages[:count]]
+        scores: Dict[int, float] = {}
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                scores[i] = cached
+        hits = len(scores)
+        self._cache_hits += hits
+
+        missing = [i for i in range(count) if i not in scores]
+        status = RERANK_RERANKED if missing else RERANK_CACHED
+        self._inflight += 1
+        try:
+            deadline = started + self.budget
+            for start in range(0, len(missing), self.batch_size):
+                batch = missing[start:start + self.batch_size]
+                try:
+                    computed = await self._score_batch(
+                        backend, query, [passages[i] for i in batch], [keys[i] for i in batch], deadline
+                    )
+                except Exception:
+                    logger.exception("재순위화 배치 추론 실패 (size=%d)", len(batch))
+                    status = RERANK_FAILED
+                    break
+                if computed is None:
+                    status = RERANK_TIMEOUT
+                    break
+                scores.update(zip(batch, computed))
+        finally:
+            self._inflight -= 1
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if status in (RERANK_TIMEOUT, RERANK_FAILED):
+            if status == RERANK_TIMEOUT:
+                self._timeouts += 1
+                logger.warning(
+                    "재순위화 시간 예산 초과 (%.1fms, 후보 %d개) - 1차 순서 사용", elapsed_ms, count
+                )
+            return RerankOutcome(first_stage, {}, status, count, hits, elapsed_ms)
+
+        # 점수가 같으면 1차 순서를 유지한다
+        reranked = sorted(range(count), key=lambda i: (-scores[i], i))
+        return RerankOutcome(reranked + first_stage[count:], scores, status, count, hits, elapsed_ms)
+
+    async def _score_batch(
+        self,
+        backend: RerankBackend,
+        query: str,
+        passages: List[str],
+        keys: List[Tuple[str, str, bytes, bytes]],
+        deadline: float,
+    ) -> Optional[List[float]]:
+        """배치 하나를 남은 예산 안에서 채점합니다.
+
+        Returns:
+            Optional[List[float]]: 본문별 점수 (예산 초과 시 None)
+
+        Raises:
+            Exception: 백엔드 추론이 실패한 경우
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        future = loop.run_in_executor(self._executor, self._score_sync, backend, query, passages)
+
+        def _store(done: "asyncio.Future[Tuple[np.ndarray, float]]") -> None:
+            # 예산을 넘겨 버려진 배치도 끝나면 캐시와 추론 속도 추정에 반영한다
+            if done.cancelled() or done.exception() is not None:
+                return
+            scores, seconds = done.result()
+            self._passages += len(passages)
+            per_passage = seconds / max(1, len(passages))
+            self._seconds_per_passage = (
+                per_passage if not self._seconds_per_passage
+                else (1 - _EWMA_ALPHA) * self._seconds_per_passage + _EWMA_ALPHA * per_passage
+            )
+            for key, score in zip(keys, scores):
+                self._cache_put(key, float(score))
+
+        future.add_done_callback(_store)
+        try:
+            scores, _ = await asyncio.wait_for(asyncio.shield(future), timeout=remaining)
+        except asyncio.TimeoutError:
+            logger.debug("재순위화 배치 대기 %.1fms 후 포기", (time.perf_counter() - submitted) * 1000)
+            return None
+        return [float(score) for score in scores]
+
+    @staticmethod
+    def _score_sync(backend: RerankBackend, query: str, passages: List[str]) -> Tuple[np.ndarray, float]:
+        started = time.perf_counter()
+        scores = backend.score(query, passages)
+        return scores, time.perf_counter() - started
+
+    async def stop(self) -> None:
+        """추론 스레드를 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, float]:
+        """재순위화 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 요청 수, 예산 초과 수, 채점 본문 수, 캐시 적중 수, 본문당 추론 시간 등
+        """
+        return {
+            "requests": self._requests,
+            "timeouts": self._timeouts,
+            "passages": self._passages,
+            "cache_hits": self._cache_hits,
+            "cache_entries": len(self._cache),
+            "ms_per_passage": self._seconds_per_passage * 1000,
+            "candidate_limit": self.candidate_limit(),
+        }
+
+
+# 전역 재순위화 서비스 인스턴스
+reranker = Reranker()
+
+
+def get_reranker() -> Reranker:
+    """재순위화 서비스 인스턴스를 반환합니다.
+
+    Returns:
+        Reranker: 공유 재순위화 서비스
+    """
+    return reranker
@@ -0,0 +1,205 @@
+"""
+검색 도메인 서비스
+
+설정에 따른 색인 구현 선택, 공유 인스턴스, 하이브리드(BM25 + 벡터) 검색
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+
+import numpy as np
+
+from ...common.config import settings
+from ..embedding.services import EmbeddingService, embedding_service
+from .acl import AccessFilter
+from .fusion import reciprocal_rank_fusion
+from .keyword_index import LocalKeywordIndex, Passage
+from .vector_index import LocalVectorIndex, VectorFilter, VectorIndex
+
+
+def create_vector_index() -> VectorIndex:
+    """설정(VECTOR_INDEX_BACKEND)에 따라 벡터 색인을 생성합니다.
+
+    Returns:
+        VectorIndex: 로컬 IVF 색인 또는 pgvector 색인
+    """
+    if settings.VECTOR_INDEX_BACKEND == "pgvector":
+        from .pgvector_index import PgVectorIndex
+        return PgVectorIndex()
+    return LocalVectorIndex()
+
+
+# 전역 벡터/키워드 색인 인스턴스
+vector_index = create_vector_index()
+keyword_index = LocalKeywordIndex()
+
+
+def get_vector_index() -> VectorIndex:
+    """벡터 색인 인스턴스를 반환합니다.
+
+    Returns:
+        VectorIndex: 공유 벡터 색인
+    """
+    return vector_index
+
+
+def get_keyword_index() -> LocalKeywordIndex:
+    """키워드 색인 인스턴스를 반환합니다.
+
+    Returns:
+        LocalKeywordIndex: 공유 키워드 색인
+    """
+    return keyword_index
+
+
+@dataclass(slots=True)
+class RetrievedChunk:
+    """하이브리드 검색 결과 한 건입니다.
+
+    Attributes:
+        chunk_id (str): 청크 ID
+        doc_id (str): 문서 ID
+        score (float): RRF 융합 점수
+        vector_rank (Optional[int]): 벡터 검색 순위 (1부터, 없으면 None)
+        vector_score (Optional[float]): 코사인 유사도
+        keyword_rank (Optional[int]): BM25 검색 순위 (1부터, 없으면 None)
+        keyword_score (Optional[float]): BM25 점수
+        rerank_score (Optional[float]): 크로스 인코더 관련도 (재순위화하지 않았으면 None)
+        passage (Optional[Passage]): 청크 원문과 위치 정보
+    """
+
+    chunk_id: str
+    doc_id: str
+    score: float
+    vector_rank: Optional[int] = None
+    vector_score: Optional[float] = None
+    keyword_rank: Optional[int] = None
+    keyword_score: Optional[float] = None
+    rerank_score: Optional[float] = None
+    passage: Optional[Passage] = None
+
+
+class HybridRetriever:
+    """BM25와 벡터 검색을 동시에 실행해 RRF로 합치는 검색기 클래스입니다."""
+
+    def __init__(
+        self,
+        embedding: Optional[EmbeddingService] = None,
+        vectors: Optional[VectorIndex] = None,
+        keywords: Optional[LocalKeywordIndex] = None,
+        candidates: Optional[int] = None,
+        rrf_k: Optional[int] = None,
+    ):
+        """하이브리드 검색기를 초기화합니다.
+
+        Args:
+            embedding (Optional[EmbeddingService]): 질의 임베딩 서비스
+            vectors (Optional[VectorIndex]): 벡터 색인
+            keywords (Optional[LocalKeywordIndex]): 키워드 색인
+            candidates (Optional[int]): 검색기별로 가져올 후보 수
+            rrf_k (Optional[int]): RRF 상수
+        """
+        self.embedding = embedding or embedding_service
+        self.vectors = vectors or vector_index
+        self.keywords = keywords or keyword_index
+        self.candidates = candidates or settings.HYBRID_CANDIDATES
+        self.rrf_k = rrf_k or settings.HYBRID_RRF_K
+
+    @staticmethod
+    async def _timed(coro, timings: Optional[Dict[str, float]], name: str):
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            if timings is not None:
+                timings[name] = (time.perf_counter() - started) * 1000
+
+    async def _vector_search(
+        self,
+        tenant_id: str,
+        query: str,
+        depth: int,
+        vector_filter: VectorFilter,
+        timings: Optional[Dict[str, float]],
+        vector: Optional[np.ndarray],
+    ):
+        if vector is None:
+            vector = await self._timed(self.embedding.embed_query(query), timings, "embedMs")
+        return await self._timed(
+            self.vectors.search(tenant_id, vector, depth, vector_filter), timings, "vectorMs"
+        )
+
+    async def retrieve(
+        self,
+        tenant_id: str,
+        query: str,
+        k: int,
+        doc_ids: Optional[FrozenSet[str]] = None,
+        access: Optional[AccessFilter] = None,
+        timings: Optional[Dict[str, float]] = None,
+        query_vector: Optional[np.ndarray] = None,
+    ) -> List[RetrievedChunk]:
+        """질의와 관련된 청크 k개를 찾습니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            query (str): 질의 텍스트
+            k (int): 반환할 결과 수
+            doc_ids (Optional[FrozenSet[str]]): 허용할 문서 ID 집합 (None이면 제한 없음)
+            access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+            timings (Optional[Dict[str, float]]): 단계별 소요 시간(ms)을 기록할 딕셔너리
+                (embedMs, vectorMs, keywordMs, fusionMs)
+            query_vector (Optional[np.ndarray]): 미리 계산한 질의 임베딩 (없으면 새로 임베딩)
+
+        Returns:
+            List[RetrievedChunk]: 융합 점수 내림차순 결과 (원문 포함)
+        """
+        depth = max(k, self.candidates)
+        vector_hits, keyword_hits = await asyncio.gather(
+            self._vector_search(tenant_id, query, depth, VectorFilter(doc_ids, access), timings, query_vector),
+            self._timed(
+                self.keywords.search(tenant_id, query, depth, doc_ids, access), timings, "keywordMs"
+            ),
+        )
+        fusion_started = time.perf_counter()
+
+        results = {}
+        for rank, hit in enumerate(vector_hits, start=1):
+            results[hit.chunk_id] = RetrievedChunk(
+                hit.chunk_id, hit.doc_id, 0.0, vector_rank=rank, vector_score=hit.score
+            )
+        for rank, hit in enumerate(keyword_hits, start=1):
+            entry = results.get(hit.chunk_id)
+            if entry is None:
+                entry = results[hit.chunk_id] = RetrievedChunk(hit.chunk_id, hit.doc_id, 0.0)
+            entry.keyword_rank = rank
+            entry.keyword_score = hit.score
+
+        fused = reciprocal_rank_fusion(
+            [[hit.chunk_id for hit in vector_hits], [hit.chunk_id for hit in keyword_hits]],
+            k=self.rrf_k,
+        )
+        retrieved = []
+        for chunk_id, score in fused[:k]:
+            entry = results[chunk_id]
+            entry.score = score
+            entry.passage = self.keywords.passage(tenant_id, chunk_id)
+            retrieved.append(entry)
+        if timings is not None:
+            timings["fusionMs"] = (time.perf_counter() - fusion_started) * 1000
+        return retrieved
+
+
+# 전역 하이브리드 검색기 인스턴스
+hybrid_retriever = HybridRetriever()
+
+
+def get_hybrid_retriever() -> HybridRetriever:
+    """하이브리드 검색기 인스턴스를 반환합니다.
+
+    Returns:
+        HybridRetriever: 공유 검색기
+    """
+    return hybrid_retriever
@@ -0,0 +1,80 @@
+"""
+검색용 토크나이저
+
+BM25 색인과 질의에 같은 규칙을 적용하는 한국어 인지 토크나이저
+
+- 식별자(계약번호, 사업자등록번호, 날짜 등 숫자와 구분자 조합)는 통째로 보존하고,
+  구분자를 뺀 숫자열도 함께 색인해 "123-45-67890"과 "1234567890"이 서로 찾아지게 합니다.
+- 한글 어절은 끝의 조사를 떼어 어간을 만들고, 세 글자 이상이면 글자 바이그램을 더해
+  "손해배상청구"처럼 띄어 쓰지 않은 복합명사도 "손해배상"으로 찾을 수 있게 합니다.
+- 영문/숫자 단어는 소문자로 정규화합니다.
+
+형태소 분석기 없이 동작하므로 색인 처리량이 높고 외부 의존성이 없습니다.
+"""
+
+import re
+import unicodedata
+from typing import List
+
+# 숫자와 구분자(-./)가 섞인 식별자
+_IDENTIFIER = re.compile(r"\d+(?:[-./]\d+)+")
+# 영문/숫자 단어 (하이픈/밑줄로 이어진 코드 포함)
+_WORD = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+# 한글 어절
+_HANGUL = re.compile(r"[가-힣]+")
+_TOKEN = re.compile(f"{_IDENTIFIER.pattern}|{_WORD.pattern}|{_HANGUL.pattern}")
+
+# 길이가 긴 것부터 검사하는 조사/어미 목록
+_JOSA = sorted(
+    [
+        "으로부터", "에서부터", "이라는", "에서는", "에게서", "으로써", "으로서", "이라고",
+        "에서", "에게", "으로", "까지", "부터", "보다", "처럼", "만큼", "이나", "에는",
+        "와는", "과는", "이며", "이고", "라는", "한테", "께서",
+        "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "만", "며",
+    ],
+    key=len,
+    reverse=True,
+)
+
+
+def strip_josa(word: str) -> str:
+    """한글 어절 끝의 조사를 제거합니다 (어간이 두 글자 이상 남는 경우에만).
+
+    Args:
+        word (str): 한글 어절
+
+    Returns:
+        str: 조사를 뗀 어간
+    """
+    for josa in _JOSA:
+        if word.endswith(josa) and len(word) - len(josa) >= 2:
+            return word[:-len(josa)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 검색 토큰 목록으로 변환합니다.
+
+    Args:
+        text (str): 원문 텍스트
+
+    Returns:
+        List[str]: 토큰 목록 (중복 포함, 등장 순서)
+    """
+    tokens: List[str] = []
+    for match in _TOKEN.finditer(unicodedata.normalize("NFKC", text).lower()):
+        token = match.group()
+        first = token[0]
+        if "가" <= first <= "힣":
+            stem = strip_josa(token)
+            tokens.append(stem)
+            if len(stem) >= 3:
+                tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+        elif _IDENTIFIER.fullmatch(token):
+            tokens.append(token)
+            tokens.append(re.sub(r"\D", "", token))
+        else:
+            tokens.append(token)
+            if "-" in token or "_" in token:
+                tokens.extend(part for part in re.split(r"[-_]", token) if part)
+    return tokens
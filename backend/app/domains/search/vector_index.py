@@ -0,0 +1,929 @@
+"""
+벡터 색인
+
+테넌트별 컬렉션을 가진 프로세스 내 IVF 벡터 색인 (로컬 pgvector 대체)
+
+- 새 벡터는 메모리 버퍼(memtable)에 쌓였다가 불변 세그먼트로 플러시됩니다.
+- 세그먼트는 IVF 리스트 순서로 정렬된 `.npy` 파일로 저장되고 memmap으로 열리므로,
+  콜드 스타트 시 재구축 없이 매핑만 합니다.
+- 문서 단위 업서트/삭제는 문서 서수별 현재 버전으로 처리하며, 오래된 행은 검색 시 걸러지고
+  백그라운드 병합 때 제거됩니다. 디스크에는 행이 세그먼트로 플러시된 버전만 기록하므로,
+  플러시 전에 종료되면 직전에 플러시된 버전으로 돌아갑니다.
+- 세그먼트 이름은 디스크에 이미 있는 이름을 건너뛰어 정하고, 열 때 매니페스트에 없는 세그먼트와
+  `.tmp` 디렉터리를 지웁니다. 세그먼트 생성에 실패하면 버퍼를 다시 memtable로 돌려 다음 플러시에
+  재시도합니다.
+- 검색 필터(문서 ID, 권한 비트맵)는 문서 서수 마스크로 세그먼트 스캔 중에 적용됩니다
+  (사후 필터링 아님).
+- 양자화(int8/PQ)를 켜면 세그먼트는 코드만 메모리에 올리고, 코드로 고른 상위 후보를
+  디스크(memmap)의 원본 벡터로 재채점합니다.
+
+같은 `VectorIndex` 인터페이스를 `PgVectorIndex`도 구현하므로 설정으로 교체할 수 있습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Sequence, Tuple, Union
+from urllib.parse import quote
+
+import numpy as np
+
+from ...common.config import settings
+from .acl import AccessFilter, OrdinalSource, filter_mask
+from .quantization import (
+    QUANTIZATION_NONE,
+    Quantizer,
+    create_quantizer,
+    load_quantizer,
+    save_quantizer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class VectorHit:
+    """벡터 검색 결과 한 건입니다.
+
+    Attributes:
+        chunk_id (str): 청크 ID
+        doc_id (str): 문서 ID
+        score (float): 코사인 유사도 (내적)
+    """
+
+    chunk_id: str
+    doc_id: str
+    score: float
+
+
+@dataclass(frozen=True)
+class VectorFilter:
+    """벡터 검색 필터입니다.
+
+    Attributes:
+        doc_ids (Optional[FrozenSet[str]]): 허용할 문서 ID 집합 (None이면 제한 없음)
+        access (Optional[AccessFilter]): 권한 사전 필터 (None이면 권한 검사 없음)
+    """
+
+    doc_ids: Optional[FrozenSet[str]] = None
+    access: Optional[AccessFilter] = None
+
+    def mask_for(self, source: OrdinalSource) -> Optional[np.ndarray]:
+        """컬렉션의 문서 서수 마스크로 변환합니다 (제한이 없으면 None)."""
+        return filter_mask(source, self.doc_ids, self.access)
+
+
+class VectorIndex(Protocol):
+    """벡터 색인 인터페이스입니다 (로컬 색인/pgvector 공통)."""
+
+    async def start(self) -> None:
+        """백그라운드 작업이나 스키마를 준비합니다."""
+        ...
+
+    async def stop(self) -> None:
+        """보류 중인 쓰기를 마무리합니다."""
+        ...
+
+    async def upsert(
+        self, tenant_id: str, doc_id: str, chunk_ids: Sequence[str], vectors: np.ndarray
+    ) -> None:
+        """문서의 청크 벡터를 통째로 교체합니다."""
+        ...
+
+    async def delete(self, tenant_id: str, doc_id: str) -> None:
+        """문서의 청크 벡터를 삭제합니다."""
+        ...
+
+    async def search(
+        self,
+        tenant_id: str,
+        query: np.ndarray,
+        k: int,
+        vector_filter: Optional[VectorFilter] = None,
+    ) -> List[VectorHit]:
+        """질의 벡터와 가장 가까운 청크 k개를 반환합니다."""
+        ...
+
+
+def train_ivf(
+    vectors: np.ndarray, nlist: int, iterations: int = 10, sample: int = 50000, seed: int = 0
+) -> np.ndarray:
+    """구면 k-means로 IVF 중심점을 학습합니다.
+
+    Args:
+        vectors (np.ndarray): (N, dim) 정규화 벡터
+        nlist (int): 리스트(클러스터) 수
+        iterations (int): 반복 횟수
+        sample (int): 학습에 쓸 최대 표본 수
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: (nlist, dim) 정규화 중심점
+    """
+    rng = np.random.default_rng(seed)
+    if len(vectors) > sample:
+        vectors = vectors[rng.choice(len(vectors), sample, replace=False)]
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        labels = assign_ivf(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, vectors)
+        counts = np.bincount(labels, minlength=nlist)
+        empty = counts == 0
+        if empty.any():
+            # 빈 클러스터는 임의의 표본으로 다시 시작
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+    return centroids.astype(np.float32)
+
+
+def assign_ivf(vectors: np.ndarray, centroids: np.ndarray, block: int = 65536) -> np.ndarray:
+    """각 벡터를 가장 가까운 중심점에 배정합니다.
+
+    Args:
+        vectors (np.ndarray): (N, dim) 벡터
+        centroids (np.ndarray): (nlist, dim) 중심점
+        block (int): 한 번에 처리할 행 수
+
+    Returns:
+        np.ndarray: (N,) 리스트 번호
+    """
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), block):
+        labels[start:start + block] = np.argmax(vectors[start:start + block] @ centroids.T, axis=1)
+    return labels
+
+
+class ChunkIds:
+    """세그먼트의 청크 ID 목록입니다.
+
+    UTF-8로 이어 붙인 `chunk_ids.bin`과 행별 경계 `chunk_offsets.npy`를 memmap으로 열어,
+    세그먼트를 열 때 목록 전체를 읽지 않고 결과로 나가는 행만 디코딩합니다.
+    """
+
+    def __init__(self, directory: str):
+        """청크 ID 파일을 memmap으로 엽니다.
+
+        Args:
+            directory (str): 세그먼트 디렉터리
+        """
+        self.offsets = np.load(os.path.join(directory, "chunk_offsets.npy"), mmap_mode="r")
+        path = os.path.join(directory, "chunk_ids.bin")
+        # 길이가 0인 파일은 memmap으로 열 수 없다
+        if os.path.getsize(path):
+            self.blob = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            self.blob = np.zeros(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return self.blob[start:end].tobytes().decode("utf-8")
+
+    @staticmethod
+    def write(directory: str, chunk_ids: Sequence[str]) -> None:
+        """청크 ID 목록을 경계 배열과 바이트 파일로 기록합니다.
+
+        Args:
+            directory (str): 세그먼트 디렉터리
+            chunk_ids (Sequence[str]): 행 순서의 청크 ID 목록
+        """
+        encoded = [chunk_id.encode("utf-8") for chunk_id in chunk_ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        np.save(os.path.join(directory, "chunk_offsets.npy"), offsets)
+        with open(os.path.join(directory, "chunk_ids.bin"), "wb") as f:
+            f.write(b"".join(encoded))
+
+
+class Segment:
+    """IVF 리스트 순으로 정렬된 불변 세그먼트입니다.
+
+    파일 구성: `vectors.npy`, `centroids.npy`, `offsets.npy`, `doc_ords.npy`,
+    `row_versions.npy`, `chunk_offsets.npy`, `chunk_ids.bin`, (양자화 시) `codes.npy`, `quantizer.npz`
+    """
+
+    def __init__(self, directory: str):
+        """세그먼트 파일을 memmap으로 엽니다.
+
+        Args:
+            directory (str): 세그먼트 디렉터리
+        """
+        self.directory = directory
+        self.name = os.path.basename(directory)
+        self.vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r")
+        self.centroids = np.load(os.path.join(directory, "centroids.npy"))
+        self.offsets = np.load(os.path.join(directory, "offsets.npy"))
+        self.doc_ords = np.load(os.path.join(directory, "doc_ords.npy"), mmap_mode="r")
+        self.row_versions = np.load(os.path.join(directory, "row_versions.npy"), mmap_mode="r")
+        self.chunk_ids = ChunkIds(directory)
+
+        # 양자화 코드는 메모리에 올리고, 원본 벡터는 재채점할 때만 디스크에서 읽는다
+        self.quantizer: Optional[Quantizer] = None
+        self.codes: Optional[np.ndarray] = None
+        quantizer_path = os.path.join(directory, "quantizer.npz")
+        if os.path.exists(quantizer_path):
+            self.quantizer = load_quantizer(quantizer_path)
+            self.codes = np.load(os.path.join(directory, "codes.npy"))
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    @classmethod
+    def build(
+        cls,
+        directory: str,
+        vectors: np.ndarray,
+        doc_ords: np.ndarray,
+        row_versions: np.ndarray,
+        chunk_ids: Sequence[str],
+        quantization: str = QUANTIZATION_NONE,
+        pq_subvectors: int = 48,
+    ) -> "Segment":
+        """행들로 새 세그먼트를 만들어 디스크에 기록합니다.
+
+        임시 디렉터리에 모두 기록한 뒤 이름을 바꿔, 절반만 쓰인 세그먼트가 보이지 않게 합니다.
+
+        Args:
+            directory (str): 만들 세그먼트 디렉터리
+            vectors (np.ndarray): (N, dim) 정규화 벡터
+            doc_ords (np.ndarray): (N,) 문서 서수
+            row_versions (np.ndarray): (N,) 행이 속한 문서 버전
+            chunk_ids (Sequence[str]): 청크 ID 목록
+            quantization (str): 양자화 방식 (none | int8 | pq)
+            pq_subvectors (int): PQ 부분 공간 수
+
+        Returns:
+            Segment: 열린 세그먼트
+        """
+        count = len(vectors)
+        nlist = max(1, int(np.sqrt(count))) if count >= 1024 else 1
+        if nlist > 1:
+            centroids = train_ivf(vectors, nlist)
+            labels = assign_ivf(vectors, centroids)
+        else:
+            centroids = np.zeros((1, vectors.shape[1]), dtype=np.float32)
+            labels = np.zeros(count, dtype=np.int64)
+
+        order = np.argsort(labels, kind="stable")
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=nlist), out=offsets[1:])
+
+        tmp = directory + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            ordered = np.ascontiguousarray(vectors[order], dtype=np.float32)
+            np.save(os.path.join(tmp, "vectors.npy"), ordered)
+            quantizer = create_quantizer(quantization, ordered.shape[1], pq_subvectors)
+            if quantizer is not None and count:
+                quantizer.train(ordered)
+                np.save(os.path.join(tmp, "codes.npy"), quantizer.encode(ordered))
+                save_quantizer(os.path.join(tmp, "quantizer.npz"), quantizer)
+            np.save(os.path.join(tmp, "centroids.npy"), centroids)
+            np.save(os.path.join(tmp, "offsets.npy"), offsets)
+            np.save(os.path.join(tmp, "doc_ords.npy"), np.asarray(doc_ords, dtype=np.int64)[order])
+            np.save(os.path.join(tmp, "row_versions.npy"), np.asarray(row_versions, dtype=np.int64)[order])
+            ChunkIds.write(tmp, [chunk_ids[i] for i in order])
+            os.replace(tmp, directory)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return cls(directory)
+
+    def probe(self, query: np.ndarray, nprobe: int) -> List[Tuple[int, int]]:
+        """질의와 가까운 IVF 리스트의 행 범위를 반환합니다."""
+        nlist = len(self.centroids)
+        if nlist <= nprobe:
+            return [(0, len(self))]
+        scores = self.centroids @ query
+        lists = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return [
+            (int(self.offsets[i]), int(self.offsets[i + 1]))
+            for i in lists if self.offsets[i + 1] > self.offsets[i]
+        ]
+
+    @property
+    def resident_bytes(self) -> int:
+        """검색 시 메모리에 상주해야 하는 벡터/코드 바이트 수입니다."""
+        if self.codes is not None:
+            return self.codes.nbytes
+        return self.vectors.nbytes
+
+
+class _RowBuffer:
+    """세그먼트로 플러시되기 전의 행 버퍼입니다.
+
+    행은 미리 할당된 배열 뒤에 추가되고 `count`는 기록이 끝난 뒤 증가하므로,
+    검색 스레드는 락 안에서 `count`까지의 뷰만 잡으면 됩니다.
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.doc_ords = np.zeros(capacity, dtype=np.int64)
+        self.row_versions = np.zeros(capacity, dtype=np.int64)
+        self.chunk_ids: List[str] = []
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, doc_ord: int, version: int, chunk_ids: Sequence[str], vectors: np.ndarray) -> None:
+        self._append(vectors, doc_ord, version, chunk_ids)
+
+    def extend(self, other: "_RowBuffer") -> None:
+        """다른 버퍼의 행을 뒤에 추가합니다."""
+        vectors, doc_ords, row_versions = other.view()
+        self._append(vectors, doc_ords, row_versions, other.chunk_ids[:len(vectors)])
+
+    def _append(
+        self,
+        vectors: np.ndarray,
+        doc_ords: Union[int, np.ndarray],
+        row_versions: Union[int, np.ndarray],
+        chunk_ids: Sequence[str],
+    ) -> None:
+        needed = self.count + len(chunk_ids)
+        if needed > len(self.vectors):
+            capacity = max(needed, len(self.vectors) * 2)
+            for name in ("vectors", "doc_ords", "row_versions"):
+                old = getattr(self, name)
+                grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:self.count] = old[:self.count]
+                setattr(self, name, grown)
+        rows = slice(self.count, needed)
+        self.vectors[rows] = vectors
+        self.doc_ords[rows] = doc_ords
+        self.row_versions[rows] = row_versions
+        self.chunk_ids.extend(chunk_ids)
+        self.count = needed
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(벡터, 문서 서수, 행 버전) 뷰를 반환합니다."""
+        n = self.count
+        return self.vectors[:n], self.doc_ords[:n], self.row_versions[:n]
+
+
+class VectorCollection:
+    """한 테넌트의 벡터 컬렉션입니다.
+
+    `manifest.json`에 세그먼트 목록과 버전 카운터를, `docs.json`/`doc_versions.npy`에
+    문서 서수와 버전을 저장합니다. 저장하는 버전은 메모리의 현재 버전이 아니라 행이 세그먼트로
+    플러시된 버전(`_durable_versions`)이므로, 재시작 후에도 버전이 가리키는 행이 항상 디스크에 있습니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        dim: int,
+        memtable_rows: Optional[int] = None,
+        quantization: Optional[str] = None,
+    ):
+        """컬렉션을 열거나 새로 만듭니다.
+
+        Args:
+            directory (str): 컬렉션 디렉터리
+            dim (int): 벡터 차원
+            memtable_rows (Optional[int]): 자동 플러시 기준 버퍼 행 수
+            quantization (Optional[str]): 새 세그먼트의 양자화 방식 (none | int8 | pq)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.dim = dim
+        self.memtable_rows = memtable_rows or settings.VECTOR_INDEX_MEMTABLE_ROWS
+        self.quantization = quantization or settings.VECTOR_INDEX_QUANTIZATION
+        self._lock = threading.RLock()
+
+        self._doc_ids: List[str] = []
+        self._doc_ord: Dict[str, int] = {}
+        self._doc_versions = np.full(1024, -1, dtype=np.int64)
+        self._durable_versions = self._doc_versions.copy()
+        self._next_version = 1
+        self._next_segment = 1
+        self._flush_at = self.memtable_rows
+        self.segments: List[Segment] = []
+
+        self._memtable = _RowBuffer(dim)
+        self._flushing: List[_RowBuffer] = []
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        manifest_path = os.path.join(self.directory, "manifest.json")
+        manifest = {"segments": []}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        # 매니페스트 기록 전에 종료되어 남은 세그먼트와 기록 중이던 디렉터리를 지운다
+        for name in os.listdir(self.directory):
+            if name.startswith("seg-") and name not in manifest["segments"]:
+                logger.warning("매니페스트에 없는 벡터 세그먼트 삭제: %s", name)
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        if not os.path.exists(manifest_path):
+            return
+        with open(os.path.join(self.directory, "docs.json"), encoding="utf-8") as f:
+            self._doc_ids = json.load(f)
+        self._doc_ord = {doc_id: i for i, doc_id in enumerate(self._doc_ids)}
+        versions = np.load(os.path.join(self.directory, "doc_versions.npy"))
+        self._doc_versions = np.full(max(1024, len(versions) * 2), -1, dtype=np.int64)
+        self._doc_versions[:len(versions)] = versions
+        self._durable_versions = self._doc_versions.copy()
+        self._next_version = manifest["next_version"]
+        self._next_segment = manifest["next_segment"]
+        self.segments = [
+            Segment(os.path.join(self.directory, name)) for name in manifest["segments"]
+        ]
+        logger.info(
+            "벡터 컬렉션 열기: %s (세그먼트 %d개, 문서 %d개)",
+            self.directory, len(self.segments), len(self._doc_ids),
+        )
+
+    def _save(self) -> None:
+        """매니페스트와 문서 상태를 원자적으로 기록합니다 (락 보유 상태에서 호출)."""
+        def write(name: str, payload: object) -> None:
+            tmp = os.path.join(self.directory, name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, os.path.join(self.directory, name))
+
+        tmp_versions = os.path.join(self.directory, "doc_versions.tmp.npy")
+        np.save(tmp_versions, self._durable_versions[:len(self._doc_ids)])
+        os.replace(tmp_versions, os.path.join(self.directory, "doc_versions.npy"))
+        write("docs.json", self._doc_ids)
+        write("manifest.json", {
+            "dim": self.dim,
+            "next_version": self._next_version,
+            "next_segment": self._next_segment,
+            "segments": [segment.name for segment in self.segments],
+        })
+        self._dirty = False
+
+    def _segment_name(self) -> str:
+        """디스크에 없는 새 세그먼트 이름을 정합니다 (락 보유 상태에서 호출)."""
+        while True:
+            name = f"seg-{self._next_segment:08d}"
+            self._next_segment += 1
+            path = os.path.join(self.directory, name)
+            if not os.path.exists(path) and not os.path.exists(path + ".tmp"):
+                return name
+
+    @property
+    def doc_count(self) -> int:
+        """등록된 문서 서수 수입니다."""
+        return len(self._doc_ids)
+
+    def doc_ordinal(self, doc_id: str, create: bool = False) -> Optional[int]:
+        """문서 ID의 서수를 반환합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+            create (bool): 없으면 새로 배정할지 여부
+
+        Returns:
+            Optional[int]: 문서 서수
+        """
+        ordinal = self._doc_ord.get(doc_id)
+        if ordinal is None and create:
+            with self._lock:
+                ordinal = self._doc_ord.get(doc_id)
+                if ordinal is None:
+                    ordinal = len(self._doc_ids)
+                    self._doc_ids.append(doc_id)
+                    self._doc_ord[doc_id] = ordinal
+                    if ordinal >= len(self._doc_versions):
+                        self._doc_versions = self._grow(self._doc_versions)
+                        self._durable_versions = self._grow(self._durable_versions)
+        return ordinal
+
+    @staticmethod
+    def _grow(versions: np.ndarray) -> np.ndarray:
+        grown = np.full(len(versions) * 2, -1, dtype=np.int64)
+        grown[:len(versions)] = versions
+        return grown
+
+    def doc_id(self, ordinal: int) -> str:
+        """서수에 해당하는 문서 ID를 반환합니다."""
+        return self._doc_ids[ordinal]
+
+    def upsert(self, doc_id: str, chunk_ids: Sequence[str], vectors: np.ndarray) -> None:
+        """문서의 청크 벡터를 통째로 교체합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+            chunk_ids (Sequence[str]): 청크 ID 목록
+            vectors (np.ndarray): (N, dim) 정규화 벡터
+        """
+        if len(chunk_ids) != len(vectors):
+            raise ValueError("chunk_ids와 vectors의 길이가 다릅니다")
+        with self._lock:
+            ordinal = self.doc_ordinal(doc_id, create=True)
+            version = self._next_version
+            self._next_version += 1
+            self._memtable.add(ordinal, version, chunk_ids, vectors)
+            self._doc_versions[ordinal] = version
+            self._dirty = True
+        if len(self._memtable) >= self._flush_at:
+            try:
+                self.flush()
+            except Exception:
+                # 행은 memtable로 돌아가 계속 검색되며, 버퍼가 다시 차거나 다음 유지보수 때 재시도한다
+                logger.exception("벡터 버퍼 플러시 실패: %s", self.directory)
+                with self._lock:
+                    self._flush_at = len(self._memtable) + self.memtable_rows
+
+    def delete(self, doc_id: str) -> None:
+        """문서의 청크 벡터를 삭제합니다.
+
+        Args:
+            doc_id (str): 문서 ID
+        """
+        ordinal = self._doc_ord.get(doc_id)
+        if ordinal is None:
+            return
+        with self._lock:
+            self._doc_versions[ordinal] = -1
+            self._durable_versions[ordinal] = -1
+            self._dirty = True
+
+    def flush(self) -> Optional[Segment]:
+        """메모리 버퍼를 새 세그먼트로 기록하고 상태를 저장합니다.
+
+        세그먼트 생성에 실패하면 버퍼의 행을 memtable로 되돌리고 예외를 그대로 올립니다.
+
+        Returns:
+            Optional[Segment]: 새로 만든 세그먼트 (버퍼가 비어 있으면 None)
+        """
+        with self._lock:
+            buffer = self._memtable
+            if not len(buffer):
+                if self._dirty:
+                    self._save()
+                return None
+            self._memtable = _RowBuffer(self.dim)
+            self._flushing.append(buffer)
+            name = self._segment_name()
+
+        # 세그먼트 생성(k-means 포함)은 락 밖에서 수행하고, 그동안 버퍼는 계속 검색된다
+        vectors, doc_ords, row_versions = buffer.view()
+        try:
+            segment = self._build_segment(name, vectors, doc_ords, row_versions, buffer.chunk_ids)
+        except Exception:
+            with self._lock:
+                # 그사이 들어온 행을 뒤에 붙여 버퍼를 memtable로 되돌린다
+                buffer.extend(self._memtable)
+                self._memtable = buffer
+                self._flushing.remove(buffer)
+            raise
+        with self._lock:
+            self.segments = self.segments + [segment]
+            self._flushing.remove(buffer)
+            self._flush_at = self.memtable_rows
+            # 그사이 다시 업서트되거나 삭제된 문서는 디스크 버전을 올리지 않는다
+            current = self._doc_versions[doc_ords] == row_versions
+            self._durable_versions[doc_ords[current]] = row_versions[current]
+            self._save()
+        return segment
+
+    def _build_segment(
+        self,
+        name: str,
+        vectors: np.ndarray,
+        doc_ords: np.ndarray,
+        row_versions: np.ndarray,
+        chunk_ids: Sequence[str],
+    ) -> Segment:
+        return Segment.build(
+            os.path.join(self.directory, name), vectors, doc_ords, row_versions, chunk_ids,
+            quantization=self.quantization,
+            pq_subvectors=settings.VECTOR_INDEX_PQ_SUBVECTORS,
+        )
+
+    def merge(self, max_segments: Optional[int] = None) -> Optional[Segment]:
+        """세그먼트 수가 한도를 넘으면 작은 세그먼트들을 병합하고 삭제된 행을 제거합니다.
+
+        Args:
+            max_segments (Optional[int]): 유지할 최대 세그먼트 수
+
+        Returns:
+            Optional[Segment]: 병합으로 만들어진 세그먼트 (병합하지 않았으면 None)
+        """
+        max_segments = max_segments or settings.VECTOR_INDEX_MAX_SEGMENTS
+        with self._lock:
+            if len(self.segments) <= max_segments:
+                return None
+            count = max(2, len(self.segments) - max_segments + 1)
+            victims = sorted(self.segments, key=len)[:count]
+            name = self._segment_name()
+            doc_versions, durable_versions = self._doc_versions, self._durable_versions
+
+        vectors, doc_ords, row_versions, chunk_ids = [], [], [], []
+        for segment in victims:
+            # 디스크 버전의 행은 새 버전이 플러시될 때까지 재시작 시 복구할 행이므로 남긴다
+            live = (doc_versions[segment.doc_ords] == segment.row_versions) | (
+                durable_versions[segment.doc_ords] == segment.row_versions
+            )
+            rows = np.flatnonzero(live)
+            vectors.append(np.asarray(segment.vectors[rows]))
+            doc_ords.append(np.asarray(segment.doc_ords[rows]))
+            row_versions.append(np.asarray(segment.row_versions[rows]))
+            chunk_ids.extend(segment.chunk_ids[i] for i in rows)
+
+        merged = None
+        if chunk_ids:
+            merged = self._build_segment(
+                name,
+                np.concatenate(vectors),
+                np.concatenate(doc_ords),
+                np.concatenate(row_versions),
+                chunk_ids,
+            )
+        with self._lock:
+            remaining = [segment for segment in self.segments if segment not in victims]
+            self.segments = remaining + ([merged] if merged is not None else [])
+            self._save()
+        for segment in victims:
+            # 진행 중인 검색은 열린 memmap을 계속 사용할 수 있다
+            shutil.rmtree(segment.directory, ignore_errors=True)
+        logger.info(
+            "벡터 세그먼트 병합: %s → %s (%d행)",
+            [segment.name for segment in victims], name, len(chunk_ids),
+        )
+        return merged
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        nprobe: Optional[int] = None,
+        doc_mask: Optional[np.ndarray] = None,
+        rescore_factor: Optional[int] = None,
+    ) -> List[VectorHit]:
+        """질의 벡터와 가장 가까운 청크 k개를 찾습니다.
+
+        양자화된 세그먼트는 코드로 k * rescore_factor개 후보를 고른 뒤
+        원본 벡터로 재채점합니다.
+
+        Args:
+            query (np.ndarray): (dim,) 정규화 질의 벡터
+            k (int): 반환할 결과 수
+            nprobe (Optional[int]): 세그먼트별로 탐색할 IVF 리스트 수
+            doc_mask (Optional[np.ndarray]): 문서 서수별 허용 여부 (True만 검색)
+            rescore_factor (Optional[int]): 재채점 후보 배수
+
+        Returns:
+            List[VectorHit]: 점수 내림차순 결과 (필터가 좁으면 k개보다 적을 수 있음)
+        """
+        nprobe = nprobe or settings.VECTOR_INDEX_NPROBE
+        rescore_factor = rescore_factor or settings.VECTOR_INDEX_RESCORE_FACTOR
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            segments = self.segments
+            buffers = [(buffer, buffer.view()) for buffer in [self._memtable, *self._flushing]]
+            doc_versions = self._doc_versions
+
+        if doc_mask is not None and len(doc_mask) < len(doc_versions):
+            padded = np.zeros(len(doc_versions), dtype=bool)
+            padded[:len(doc_mask)] = doc_mask
+            doc_mask = padded
+
+        # 필터가 좁으면 탐색한 리스트 안에 허용 행이 k개보다 적을 수 있으므로,
+        # 결과가 모자랄 때만 nprobe를 넓혀 다시 탐색한다 (k를 키우는 사후 필터링 대신)
+        widest = max((len(segment.centroids) for segment in segments), default=1)
+        while True:
+            hits = self._scan(
+                query, k, nprobe, doc_mask, rescore_factor, segments, buffers, doc_versions
+            )
+            if doc_mask is None or len(hits) >= k or nprobe >= widest:
+                return hits
+            nprobe = min(widest, nprobe * 4)
+
+    def _scan(
+        self,
+        query: np.ndarray,
+        k: int,
+        nprobe: int,
+        doc_mask: Optional[np.ndarray],
+        rescore_factor: int,
+        segments: List[Segment],
+        buffers: List[Tuple[_RowBuffer, Tuple[np.ndarray, np.ndarray, np.ndarray]]],
+        doc_versions: np.ndarray,
+    ) -> List[VectorHit]:
+        """세그먼트와 버퍼의 스냅샷을 한 번 탐색합니다."""
+        candidates: List[Tuple[np.ndarray, np.ndarray, object]] = []
+
+        def select(scores: np.ndarray, doc_ords: np.ndarray, versions: np.ndarray,
+                   rows: np.ndarray, limit: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+            """살아 있고 필터를 통과한 행 중 상위 limit개를 고릅니다."""
+            keep = doc_versions[doc_ords] == versions
+            if doc_mask is not None:
+                keep &= doc_mask[doc_ords]
+            if not keep.any():
+                return None
+            scores, rows = scores[keep], rows[keep]
+            if len(scores) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                scores, rows = scores[top], rows[top]
+            return scores, rows
+
+        for segment in segments:
+            ranges = segment.probe(query, nprobe)
+            if segment.quantizer is None:
+                for start, end in ranges:
+                    selected = select(
+                        segment.vectors[start:end] @ query,
+                        np.asarray(segment.doc_ords[start:end]),
+                        np.asarray(segment.row_versions[start:end]),
+                        np.arange(start, end),
+                        k,
+                    )
+                    if selected is not None:
+                        candidates.append((*selected, segment))
+                continue
+
+            # 1단계: 메모리의 코드로 근사 점수를 매겨 후보를 넉넉히 고른다
+            prepared = segment.quantizer.prepare(query)
+            approx = []
+            for start, end in ranges:
+                selected = select(
+                    segment.quantizer.score(prepared, segment.codes[start:end]),
+                    np.asarray(segment.doc_ords[start:end]),
+                    np.asarray(segment.row_versions[start:end]),
+                    np.arange(start, end),
+                    k * rescore_factor,
+                )
+                if selected is not None:
+                    approx.append(selected)
+            if not approx:
+                continue
+            # 2단계: 후보 행만 원본 벡터로 재채점한다 (행 순서대로 읽어 디스크 접근을 모음)
+            rows = np.concatenate([rows for _, rows in approx])
+            approx_scores = np.concatenate([scores for scores, _ in approx])
+            if len(rows) > k * rescore_factor:
+                top = np.argpartition(-approx_scores, k * rescore_factor - 1)[:k * rescore_factor]
+                rows = rows[top]
+            rows = np.sort(rows)
+            exact = np.asarray(segment.vectors[rows]) @ query
+            if len(exact) > k:
+                top = np.argpartition(-exact, k - 1)[:k]
+                exact, rows = exact[top], rows[top]
+            candidates.append((exact, rows, segment))
+
+        for buffer, (vectors, doc_ords, row_versions) in buffers:
+            if len(vectors):
+                selected = select(vectors @ query, doc_ords, row_versions, np.arange(len(vectors)), k)
+                if selected is not None:
+                    candidates.append((*selected, buffer))
+
+        merged = [
+            (float(score), int(row), source)
+            for scores, rows, source in candidates
+            for score, row in zip(scores, rows)
+        ]
+        merged.sort(key=lambda item: item[0], reverse=True)
+        hits = []
+        for score, row, source in merged[:k]:
+            doc_ord = int(source.doc_ords[row])
+            hits.append(VectorHit(source.chunk_ids[row], self._doc_ids[doc_ord], score))
+        return hits
+
+    def stats(self) -> Dict[str, Any]:
+        """컬렉션 통계를 반환합니다."""
+        segments = self.segments
+        return {
+            "segments": len(segments),
+            "segment_rows": sum(len(segment) for segment in segments),
+            "memtable_rows": len(self._memtable),
+            "documents": len(self._doc_ids),
+            "quantization": self.quantization,
+            "resident_bytes": sum(segment.resident_bytes for segment in segments),
+            "full_precision_bytes": sum(segment.vectors.nbytes for segment in segments),
+        }
+
+
+class LocalVectorIndex:
+    """테넌트별 `VectorCollection`을 관리하는 로컬 벡터 색인 클래스입니다."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        dim: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        memtable_rows: Optional[int] = None,
+        max_segments: Optional[int] = None,
+        quantization: Optional[str] = None,
+    ):
+        """로컬 벡터 색인을 초기화합니다. 컬렉션은 처음 접근할 때 열립니다.
+
+        Args:
+            directory (Optional[str]): 색인 루트 디렉터리
+            dim (Optional[int]): 벡터 차원
+            nprobe (Optional[int]): 탐색할 IVF 리스트 수
+            memtable_rows (Optional[int]): 자동 플러시 기준 버퍼 행 수
+            max_segments (Optional[int]): 컬렉션당 최대 세그먼트 수 (초과 시 병합)
+            quantization (Optional[str]): 세그먼트 양자화 방식 (none | int8 | pq)
+        """
+        self.directory = directory or settings.VECTOR_INDEX_DIR
+        self.dim = dim or settings.EMBEDDING_DIM
+        self.nprobe = nprobe or settings.VECTOR_INDEX_NPROBE
+        self.memtable_rows = memtable_rows or settings.VECTOR_INDEX_MEMTABLE_ROWS
+        self.max_segments = max_segments or settings.VECTOR_INDEX_MAX_SEGMENTS
+        self.quantization = quantization or settings.VECTOR_INDEX_QUANTIZATION
+        self._collections: Dict[str, VectorCollection] = {}
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def collection(self, tenant_id: str) -> VectorCollection:
+        """테넌트 컬렉션을 반환합니다 (없으면 디스크에서 열거나 새로 만듭니다).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            VectorCollection: 테넌트 컬렉션
+        """
+        collection = self._collections.get(tenant_id)
+        if collection is None:
+            with self._lock:
+                collection = self._collections.get(tenant_id)
+                if collection is None:
+                    collection = VectorCollection(
+                        os.path.join(self.directory, quote(tenant_id, safe="")),
+                        self.dim,
+                        self.memtable_rows,
+                        self.quantization,
+                    )
+                    self._collections[tenant_id] = collection
+        return collection
+
+    async def upsert(
+        self, tenant_id: str, doc_id: str, chunk_ids: Sequence[str], vectors: np.ndarray
+    ) -> None:
+        """문서의 청크 벡터를 통째로 교체합니다."""
+        # 버퍼가 가득 차면 플러시(세그먼트 생성)가 일어나므로 스레드에서 실행한다
+        await asyncio.to_thread(self.collection(tenant_id).upsert, doc_id, chunk_ids, vectors)
+
+    async def delete(self, tenant_id: str, doc_id: str) -> None:
+        """문서의 청크 벡터를 삭제합니다."""
+        self.collection(tenant_id).delete(doc_id)
+
+    async def search(
+        self,
+        tenant_id: str,
+        query: np.ndarray,
+        k: int,
+        vector_filter: Optional[VectorFilter] = None,
+    ) -> List[VectorHit]:
+        """테넌트 컬렉션에서 질의 벡터와 가장 가까운 청크 k개를 반환합니다."""
+        collection = self.collection(tenant_id)
+        doc_mask = vector_filter.mask_for(collection) if vector_filter is not None else None
+        return await asyncio.to_thread(collection.search, query, k, self.nprobe, doc_mask)
+
+    def flush_all(self) -> None:
+        """모든 컬렉션의 버퍼를 플러시합니다."""
+        for collection in list(self._collections.values()):
+            collection.flush()
+
+    def maintain(self) -> None:
+        """모든 컬렉션을 플러시하고 필요한 경우 병합합니다."""
+        for collection in list(self._collections.values()):
+            collection.flush()
+            collection.merge(self.max_segments)
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """주기적 플러시/병합 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 유지보수 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.VECTOR_INDEX_MERGE_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await asyncio.to_thread(self.maintain)
+                except Exception:
+                    logger.exception("벡터 색인 유지보수 실패")
+
+        self._task = asyncio.create_task(_loop(), name="vector-index-maintenance")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 버퍼를 플러시합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush_all)
@@ -0,0 +1,5 @@
+"""
+검증 도메인
+
+추출 필드 검증 규칙 관리와 Validation Worker 관련 모듈들
+"""
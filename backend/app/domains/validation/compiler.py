@@ -0,0 +1,554 @@
+"""
+검증 규칙 컴파일러
+
+테넌트의 규칙 집합을 한 번 컴파일해 두고 문서 배치를 열(column) 단위로 검증하는 실행 계획
+
+- 정규식은 컴파일 시점에 한 번만 컴파일합니다.
+- 정규화(NFKC/공백 정리, 구분자 제거, 숫자/날짜 변환)는 배치의 (필드, 정규화) 열마다 한 번만
+  계산해 같은 필드를 보는 규칙끼리 공유합니다.
+- 규칙은 비용 대비 실패 확률이 높은 순서(비용 / 실패율)로 평가하고, 이미 실패한 문서는
+  이후 규칙에서 제외합니다 (short-circuit). 실패율은 평가하면서 갱신해 순서를 조정합니다.
+- 숫자 임계값, 날짜 형식, 필드 간 숫자/날짜 비교는 numpy 배열 연산으로 한 번에 평가합니다.
+- 유사도 규칙은 배치 전체의 기대값을 추출 값과 후보 구간에 한 번에 대조합니다 (`matching`).
+- 휴먼검토 규칙은 실패를 만들지 않고 검토 대상 표시만 하므로 short-circuit과 무관하게 평가합니다.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import CompareOperator, FieldType, ValidationType
+
+# 문서 검증 결과 상태
+STATUS_VALIDATED = "validated"
+STATUS_FAILED = "failed"
+STATUS_REVIEW = "review"
+
+# 정규화 단계 이름
+PASS_RAW = "raw"
+PASS_TEXT = "text"
+PASS_COMPACT = "compact"
+PASS_FOLD = "fold"
+PASS_NUMBER = "number"
+PASS_DATE = "date"
+PASS_DAYS = "days"
+
+# 유사도 규칙의 기본 최소 유사도
+DEFAULT_SIMILARITY = 0.8
+
+# 검증 방식별 상대 비용 (행당)과 실패율 사전값
+_RULE_COST = {
+    ValidationType.THRESHOLD: 1.0,
+    ValidationType.CROSS_FIELD: 2.0,
+    ValidationType.FORMAT: 4.0,
+    ValidationType.REGEX: 5.0,
+    ValidationType.SIMILARITY: 30.0,
+}
+_PRIOR_FAILURES = 1.0
+_PRIOR_SEEN = 10.0
+
+# fieldType별 내장 형식 검사 (format 규칙)
+_EMAIL = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+_PHONE = re.compile(r"^(?:01[016789]\d{7,8}|0\d{8,10})$")
+_COMPACT_STRIP = str.maketrans("", "", " \t\n-.,()")
+_NUMBER_STRIP = str.maketrans("", "", ", \t\n원₩$%")
+_DATE = re.compile(r"^(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})\s*일?$")
+_DATE_DIGITS = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+_SPACES = re.compile(r"\s+")
+
+_OPERATORS: Dict[CompareOperator, Callable[[Any, Any], Any]] = {
+    CompareOperator.EQ: lambda a, b: a == b,
+    CompareOperator.NE: lambda a, b: a != b,
+    CompareOperator.LT: lambda a, b: a < b,
+    CompareOperator.LE: lambda a, b: a <= b,
+    CompareOperator.GT: lambda a, b: a > b,
+    CompareOperator.GE: lambda a, b: a >= b,
+}
+
+
+class RuleCompileError(ValueError):
+    """규칙을 실행 계획으로 컴파일할 수 없을 때 발생하는 예외입니다."""
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """컴파일 입력이 되는 규칙 한 건의 스냅샷입니다 (DB 모델과 분리, 프로세스 간 전달 가능)."""
+
+    rule_id: str
+    name: str
+    field_type: FieldType
+    validation_type: ValidationType
+    field_name: Optional[str] = None
+    regex: Optional[str] = None
+    threshold: Optional[float] = None
+    compare_field: Optional[str] = None
+    operator: Optional[CompareOperator] = None
+    human_review_required: bool = False
+
+    @property
+    def target(self) -> str:
+        """검증할 추출 필드 이름 (지정하지 않으면 fieldType 값)"""
+        return self.field_name or self.field_type.value
+
+    @classmethod
+    def from_model(cls, rule: Any) -> "RuleSpec":
+        """`ValidationRule` 모델(또는 같은 속성을 가진 객체)에서 스냅샷을 만듭니다.
+
+        Args:
+            rule (Any): 검증 규칙
+
+        Returns:
+            RuleSpec: 규칙 스냅샷
+        """
+        return cls(
+            rule_id=str(rule.id),
+            name=rule.name,
+            field_type=FieldType(rule.field_type),
+            validation_type=ValidationType(rule.validation_type),
+            field_name=rule.field_name,
+            regex=rule.regex,
+            threshold=rule.threshold,
+            compare_field=rule.compare_field,
+            operator=CompareOperator(rule.operator) if rule.operator else None,
+            human_review_required=rule.human_review_required,
+        )
+
+
+def field_value(value: Any) -> Optional[str]:
+    """추출 필드 값을 문자열로 바꿉니다 (`{"value": ...}` 형태도 허용, 빈 값은 None).
+
+    Args:
+        value (Any): 추출 필드 값
+
+    Returns:
+        Optional[str]: 문자열 값 또는 None
+    """
+    if value.__class__ is not str:
+        if isinstance(value, dict):
+            value = value.get("value")
+        if value is None:
+            return None
+        value = str(value)
+    return value if value.strip() else None
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """NFKC 정규화 후 앞뒤 공백을 제거합니다."""
+    if value is None:
+        return None
+    if not value.isascii():
+        value = unicodedata.normalize("NFKC", value)
+    return value.strip() or None
+
+
+def parse_number(value: Optional[str]) -> float:
+    """쉼표/통화 기호를 뺀 숫자로 바꿉니다 (바꿀 수 없으면 NaN)."""
+    if value is None:
+        return np.nan
+    try:
+        return float(value.translate(_NUMBER_STRIP))
+    except ValueError:
+        return np.nan
+
+
+@lru_cache(maxsize=65536)
+def parse_date(value: Optional[str]) -> Optional[str]:
+    """`2024-01-15`, `2024.1.15`, `2024년 1월 15일`, `20240115`를 ISO 날짜로 바꿉니다."""
+    if value is None:
+        return None
+    match = _DATE.match(value) or _DATE_DIGITS.match(value)
+    if match is None:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups())).isoformat()
+    except ValueError:
+        return None
+
+
+class ColumnBatch:
+    """문서 배치의 필드 열과 정규화 결과를 (필드, 정규화 단계)별로 한 번만 계산해 공유합니다."""
+
+    def __init__(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        expected: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+    ):
+        """열 배치를 초기화합니다.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): 문서별 추출 필드
+            expected (Optional[Sequence[Optional[Mapping[str, Any]]]]): 문서별 기대 필드 (업로드 시 입력값)
+        """
+        self.rows = rows
+        self.expected = expected
+        self.size = len(rows)
+        self._columns: Dict[Tuple[str, str, bool], Any] = {}
+
+    def column(self, name: str, stage: str, expected: bool = False) -> Any:
+        """정규화된 필드 열을 반환합니다.
+
+        Args:
+            name (str): 필드 이름
+            stage (str): 정규화 단계 (raw | text | compact | fold | number | date | days)
+            expected (bool): 기대 필드 열 여부
+
+        Returns:
+            Any: 문자열 목록 (None은 값 없음), 숫자 단계면 float 배열 (NaN은 변환 불가),
+                days 단계면 datetime64[D] 배열 (NaT는 변환 불가)
+        """
+        key = (name, stage, expected)
+        cached = self._columns.get(key)
+        if cached is not None:
+            return cached
+        if stage == PASS_RAW:
+            source = self.expected if expected else self.rows
+            if source is None:
+                values: Any = [None] * self.size
+            else:
+                values = [field_value(row.get(name)) if row else None for row in source]
+        elif stage == PASS_TEXT:
+            values = [v if v is None else normalize_text(v) for v in self.column(name, PASS_RAW, expected)]
+        elif stage == PASS_COMPACT:
+            values = [
+                v.translate(_COMPACT_STRIP) if v is not None else None
+                for v in self.column(name, PASS_TEXT, expected)
+            ]
+        elif stage == PASS_FOLD:
+            values = [
+                _SPACES.sub(" ", v.casefold()) if v is not None else None
+                for v in self.column(name, PASS_TEXT, expected)
+            ]
+        elif stage == PASS_NUMBER:
+            texts = self.column(name, PASS_TEXT, expected)
+            try:
+                # 대부분 숫자인 열은 numpy가 한 번에 변환하고, 실패하면 값별로 NaN 처리
+                values = np.array(
+                    ["nan" if v is None else v.translate(_NUMBER_STRIP) for v in texts], dtype=np.float64
+                )
+            except ValueError:
+                values = np.fromiter((parse_number(v) for v in texts), dtype=np.float64, count=self.size)
+        elif stage == PASS_DATE:
+            values = [parse_date(v) for v in self.column(name, PASS_TEXT, expected)]
+        elif stage == PASS_DAYS:
+            dates = self.column(name, PASS_DATE, expected)
+            values = np.array(["NaT" if v is None else v for v in dates], dtype="datetime64[D]")
+        else:
+            raise ValueError(f"알 수 없는 정규화 단계: {stage}")
+        self._columns[key] = values
+        return values
+
+    def candidates(self, name: str) -> List[List[str]]:
+        """문서별 추출 값과 후보 구간 목록을 반환합니다 (`{"value": ..., "candidates": [...]}` 형태).
+
+        Args:
+            name (str): 필드 이름
+
+        Returns:
+            List[List[str]]: 문서별 후보 문자열 목록 (추출 값이 맨 앞, 빈 값 제외)
+        """
+        key = (name, "candidates", False)
+        cached = self._columns.get(key)
+        if cached is None:
+            cached = []
+            for row in self.rows:
+                raw = row.get(name) if row else None
+                spans = [raw]
+                if isinstance(raw, dict):
+                    spans.extend(raw.get("candidates") or ())
+                cached.append([v for v in map(field_value, spans) if v is not None])
+            self._columns[key] = cached
+        return cached
+
+    def missing(self, name: str) -> np.ndarray:
+        """필드 값이 없는 문서 마스크를 반환합니다."""
+        key = (name, "missing", False)
+        cached = self._columns.get(key)
+        if cached is None:
+            raw = self.column(name, PASS_RAW)
+            cached = np.fromiter((v is None for v in raw), dtype=bool, count=self.size)
+            self._columns[key] = cached
+        return cached
+
+
+def _check_strings(
+    values: List[Optional[str]], rows: np.ndarray, test: Callable[[str], bool]
+) -> np.ndarray:
+    """선택된 행의 문자열에 검사 함수를 적용합니다 (값이 없으면 통과)."""
+    return np.fromiter(
+        (values[i] is None or test(values[i]) for i in rows), dtype=bool, count=rows.size
+    )
+
+
+@dataclass
+class CompiledRule:
+    """실행 계획에 포함된 컴파일된 규칙입니다."""
+
+    spec: RuleSpec
+    check: Callable[[ColumnBatch, np.ndarray], np.ndarray]
+    cost: float
+    message: str
+    seen: float = _PRIOR_SEEN
+    failures: float = _PRIOR_FAILURES
+
+    @property
+    def rank(self) -> float:
+        """평가 순서 (작을수록 먼저): 실패 하나를 찾는 데 드는 기대 비용"""
+        return self.cost / (self.failures / self.seen)
+
+
+def _compile_regex(spec: RuleSpec) -> Callable[[ColumnBatch, np.ndarray], np.ndarray]:
+    if not spec.regex:
+        raise RuleCompileError(f"정규식 규칙에 정규식이 없습니다: {spec.name}")
+    try:
+        search = re.compile(spec.regex).search
+    except re.error as exc:
+        raise RuleCompileError(f"잘못된 정규식입니다: {spec.name} ({exc})") from exc
+    target = spec.target
+
+    def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+        return _check_strings(batch.column(target, PASS_TEXT), rows, lambda v: search(v) is not None)
+
+    return check
+
+
+def _compile_format(spec: RuleSpec) -> Callable[[ColumnBatch, np.ndarray], np.ndarray]:
+    target = spec.target
+    kind = spec.field_type
+
+    if kind == FieldType.NUMBER:
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            numbers = batch.column(target, PASS_NUMBER)[rows]
+            return batch.missing(target)[rows] | np.isfinite(numbers)
+    elif kind == FieldType.DATE:
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            days = batch.column(target, PASS_DAYS)[rows]
+            return batch.missing(target)[rows] | ~np.isnat(days)
+    elif kind == FieldType.PHONE:
+        match = _PHONE.match
+
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            return _check_strings(batch.column(target, PASS_COMPACT), rows, lambda v: match(v) is not None)
+    elif kind == FieldType.EMAIL:
+        match = _EMAIL.match
+
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            return _check_strings(batch.column(target, PASS_TEXT), rows, lambda v: match(v) is not None)
+    else:
+        # text/custom은 형식 제약이 없으므로 값이 있으면 통과
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            return np.ones(rows.size, dtype=bool)
+
+    return check
+
+
+def _compile_threshold(spec: RuleSpec) -> Callable[[ColumnBatch, np.ndarray], np.ndarray]:
+    if spec.threshold is None:
+        raise RuleCompileError(f"임계값 규칙에 임계값이 없습니다: {spec.name}")
+    target = spec.target
+    threshold = float(spec.threshold)
+
+    def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+        numbers = batch.column(target, PASS_NUMBER)[rows]
+        # NaN 비교는 False이므로 숫자가 아닌 값은 실패
+        return batch.missing(target)[rows] | (numbers >= threshold)
+
+    return check
+
+
+def _compile_similarity(spec: RuleSpec) -> Callable[[ColumnBatch, np.ndarray], np.ndarray]:
+    # matching이 이 모듈의 정규화 함수를 쓰므로 컴파일 시점에 가져온다
+    from .matching import KIND_DATE, KIND_NAME, KIND_NUMBER, KIND_TEXT, FieldMatcher
+
+    target = spec.target
+    threshold = DEFAULT_SIMILARITY if spec.threshold is None else float(spec.threshold)
+    if not 0.0 <= threshold <= 1.0:
+        raise RuleCompileError(f"유사도 임계값은 0~1이어야 합니다: {spec.name}")
+    # 숫자/날짜는 정규화 값 일치, 텍스트는 이름 정규화 + Jaro-Winkler, 나머지는 편집 거리 비율
+    kind = {
+        FieldType.NUMBER: KIND_NUMBER,
+        FieldType.DATE: KIND_DATE,
+        FieldType.TEXT: KIND_NAME,
+    }.get(spec.field_type, KIND_TEXT)
+    matcher = FieldMatcher()
+
+    def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+        expected = batch.column(target, PASS_RAW, expected=True)
+        candidates = batch.candidates(target)
+        matches = matcher.match_batch(
+            kind, [expected[i] for i in rows], [candidates[i] for i in rows], threshold
+        )
+        # 기대값이 없으면 통과, 추출 값과 후보가 모두 없으면 실패
+        return np.fromiter(
+            (match is None or match.score >= threshold for match in matches), dtype=bool, count=rows.size
+        )
+
+    return check
+
+
+def _compile_cross_field(spec: RuleSpec) -> Callable[[ColumnBatch, np.ndarray], np.ndarray]:
+    if not spec.compare_field or spec.operator is None:
+        raise RuleCompileError(f"필드 간 비교 규칙에 비교 필드/연산자가 없습니다: {spec.name}")
+    left, right = spec.target, spec.compare_field
+    compare = _OPERATORS[spec.operator]
+    # 비교 영역(숫자/날짜)은 fieldType으로 컴파일 시점에 정해 배열 비교로 평가한다
+    if spec.field_type in (FieldType.NUMBER, FieldType.DATE):
+        stage = PASS_NUMBER if spec.field_type == FieldType.NUMBER else PASS_DAYS
+
+        def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+            skip = batch.missing(left)[rows] | batch.missing(right)[rows]
+            a = batch.column(left, stage)[rows]
+            b = batch.column(right, stage)[rows]
+            with np.errstate(invalid="ignore"):
+                # 변환할 수 없는 값(NaN/NaT)과의 비교는 실패
+                return skip | compare(a, b)
+
+        return check
+
+    def check(batch: ColumnBatch, rows: np.ndarray) -> np.ndarray:
+        fold_a, fold_b = batch.column(left, PASS_FOLD), batch.column(right, PASS_FOLD)
+        return np.fromiter(
+            (fold_a[i] is None or fold_b[i] is None or compare(fold_a[i], fold_b[i]) for i in rows),
+            dtype=bool,
+            count=rows.size,
+        )
+
+    return check
+
+
+_COMPILERS = {
+    ValidationType.REGEX: (_compile_regex, "정규식 검증 실패"),
+    ValidationType.FORMAT: (_compile_format, "형식 검증 실패"),
+    ValidationType.THRESHOLD: (_compile_threshold, "임계값 미만"),
+    ValidationType.SIMILARITY: (_compile_similarity, "기대값과 일치하지 않음"),
+    ValidationType.CROSS_FIELD: (_compile_cross_field, "필드 간 비교 실패"),
+}
+
+
+@dataclass
+class ValidationOutcome:
+    """문서 한 건의 검증 결과입니다."""
+
+    status: str
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    review_rules: List[str] = field(default_factory=list)
+
+
+class CompiledPlan:
+    """테넌트 규칙 집합 한 버전을 컴파일한 실행 계획 클래스입니다."""
+
+    def __init__(self, version: int, rules: List[CompiledRule], review: List[RuleSpec]):
+        """실행 계획을 초기화합니다.
+
+        Args:
+            version (int): 규칙 집합 버전
+            rules (List[CompiledRule]): 실패를 만드는 컴파일된 규칙
+            review (List[RuleSpec]): 휴먼검토 규칙
+        """
+        self.version = version
+        self.rules = sorted(rules, key=lambda rule: rule.rank)
+        self.review = review
+        self.documents = 0
+
+    def evaluate(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        expected: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+        short_circuit: bool = True,
+    ) -> List[ValidationOutcome]:
+        """문서 배치를 열 단위로 검증합니다.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): 문서별 추출 필드
+            expected (Optional[Sequence[Optional[Mapping[str, Any]]]]): 문서별 기대 필드 (similarity 규칙용)
+            short_circuit (bool): 첫 실패 후 남은 규칙을 건너뛸지 여부 (False면 모든 실패를 보고)
+
+        Returns:
+            List[ValidationOutcome]: 입력 순서대로의 문서별 검증 결과
+        """
+        batch = ColumnBatch(rows, expected)
+        size = batch.size
+        alive = np.ones(size, dtype=bool)
+        errors: List[List[Dict[str, Any]]] = [[] for _ in range(size)]
+        for rule in self.rules:
+            candidates = np.flatnonzero(alive) if short_circuit else np.arange(size)
+            if not candidates.size:
+                break
+            failed = candidates[~rule.check(batch, candidates)]
+            rule.seen += candidates.size
+            rule.failures += failed.size
+            alive[failed] = False
+            for i in failed:
+                errors[i].append({
+                    "ruleId": rule.spec.rule_id,
+                    "rule": rule.spec.name,
+                    "field": rule.spec.target,
+                    "message": rule.message,
+                })
+        # 관측한 실패율로 다음 배치의 평가 순서를 조정
+        self.rules.sort(key=lambda rule: rule.rank)
+        self.documents += size
+
+        flagged = [
+            ~batch.missing(spec.target) if spec.field_name else np.ones(size, dtype=bool)
+            for spec in self.review
+        ]
+        outcomes = []
+        for i in range(size):
+            review_rules = [spec.rule_id for spec, mask in zip(self.review, flagged) if mask[i]]
+            if errors[i]:
+                status = STATUS_FAILED
+            elif review_rules:
+                status = STATUS_REVIEW
+            else:
+                status = STATUS_VALIDATED
+            outcomes.append(ValidationOutcome(status, errors[i], review_rules))
+        return outcomes
+
+    def stats(self) -> Dict[str, Any]:
+        """규칙별 평가 순서와 관측 실패율을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 버전, 검증 문서 수, 평가 순서대로의 규칙 통계
+        """
+        return {
+            "version": self.version,
+            "documents": self.documents,
+            "rules": [
+                {
+                    "ruleId": rule.spec.rule_id,
+                    "cost": rule.cost,
+                    "failureRate": round(rule.failures / rule.seen, 4),
+                }
+                for rule in self.rules
+            ],
+        }
+
+
+def compile_rules(specs: Sequence[RuleSpec], version: int = 0) -> CompiledPlan:
+    """규칙 집합을 실행 계획으로 컴파일합니다.
+
+    Args:
+        specs (Sequence[RuleSpec]): 활성 규칙 목록
+        version (int): 규칙 집합 버전
+
+    Returns:
+        CompiledPlan: 실행 계획
+
+    Raises:
+        RuleCompileError: 정규식 오류 등 규칙을 컴파일할 수 없는 경우
+    """
+    rules: List[CompiledRule] = []
+    review: List[RuleSpec] = []
+    for spec in specs:
+        if spec.validation_type == ValidationType.HUMAN_REVIEW:
+            if spec.human_review_required:
+                review.append(spec)
+            continue
+        compiler, message = _COMPILERS[spec.validation_type]
+        rules.append(CompiledRule(spec, compiler(spec), _RULE_COST[spec.validation_type], message))
+    return CompiledPlan(version, rules, review)
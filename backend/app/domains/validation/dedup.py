@@ -0,0 +1,633 @@
+"""
+유사 중복 문서 탐지
+
+파싱된 본문의 MinHash 서명을 LSH 밴드로 버킷팅하는 테넌트별 유사 중복 색인
+
+- 본문은 문자 n-gram 싱글(`common.shingles`)로 바꾸고, 순열 수만큼의 범용 해시 최솟값으로
+  서명을 만듭니다. 두 서명에서 값이 같은 위치의 비율이 Jaccard 유사도의 추정치입니다.
+- 서명을 `bands`개 밴드로 나눠 밴드별 해시(밴드 번호 포함)를 버킷 키로 씁니다. 유사도가
+  임계값 근처 이상인 문서는 높은 확률로 한 밴드 이상에서 같은 버킷에 들어가므로, 조회는
+  버킷이 겹친 후보만 서명으로 검증합니다 (테넌트 문서 수와 무관한 후보 수).
+- 새 서명은 메모리 버퍼(memtable)에 쌓였다가 불변 세그먼트로 플러시됩니다. 세그먼트는
+  정렬된 버킷 키 배열과 서명 배열을 `.npy`로 저장하고 memmap으로 열어, 조회는 세그먼트마다
+  `searchsorted` 두 번으로 끝납니다. 세그먼트가 많아지면 백그라운드에서 병합합니다.
+- 재스캔/재OCR 사본처럼 글자 일부가 다른 문서도 잡으며, 본문이 같은 문서는 유사도 1.0입니다.
+- 이미 있는 문서를 다시 추가하면 새 문서 서수를 배정하고, 이전 서수의 행은 조회에서 걸러지며
+  플러시/병합 때 제거됩니다 (버퍼에 있던 이전 밴드는 바로 뺍니다).
+- 세그먼트 이름은 디스크에 이미 있는 이름을 건너뛰어 정하고, 열 때 매니페스트에 없는 세그먼트와
+  `.tmp` 디렉터리(기록 도중 종료된 흔적)를 지웁니다. 플러시에 실패하면 버퍼를 그대로 두고
+  버퍼가 다시 찰 때 또는 다음 유지보수 때 재시도하므로 쓰기는 실패하지 않습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, List, Optional, Sequence
+from urllib.parse import quote
+
+import numpy as np
+
+from ...common.config import settings
+from ...common.shingles import shingles
+
+logger = logging.getLogger(__name__)
+
+# 범용 해시 (a·x + b) mod p 의 메르센 소수와 32비트 서명 값 범위
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+# 밴드 해시 (FNV 계열 곱셈 상수)
+_BAND_PRIME = np.uint64(0x100000001B3)
+_BAND_SEED = np.uint64(0xCBF29CE484222325)
+# 서명 계산 시 한 번에 처리할 싱글 수 (순열 수 × 블록 크기 만큼의 임시 배열)
+_SHINGLE_BLOCK = 2048
+
+
+class MinHasher:
+    """본문을 MinHash 서명으로 바꾸는 클래스입니다."""
+
+    def __init__(self, num_perm: int, shingle_size: int, seed: int = 1):
+        """MinHash 해시 계수를 준비합니다.
+
+        Args:
+            num_perm (int): 순열(서명 길이) 수
+            shingle_size (int): 싱글 글자 수
+            seed (int): 해시 계수 시드 (같은 색인을 쓰는 모든 프로세스에서 같아야 함)
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # a, b < 2^32 이고 x < 2^32 이므로 a·x + b 가 uint64를 넘지 않는다
+        self._a = rng.integers(1, 1 << 32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """본문의 MinHash 서명을 계산합니다.
+
+        Args:
+            text (str): 본문
+
+        Returns:
+            Optional[np.ndarray]: uint32 서명 (num_perm,) (싱글이 없으면 None)
+        """
+        hashes = shingles(text, self.shingle_size)
+        if len(hashes) == 0:
+            return None
+        folded = (hashes ^ (hashes >> np.uint64(32))) & _MAX_HASH
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(folded), _SHINGLE_BLOCK):
+            block = folded[start:start + _SHINGLE_BLOCK][np.newaxis, :]
+            permuted = ((self._a * block + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature.astype(np.uint32)
+
+
+def band_keys(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """서명을 밴드별 버킷 키로 바꿉니다 (밴드 번호가 섞여 있어 밴드 간 키가 충돌하지 않음).
+
+    Args:
+        signatures (np.ndarray): uint32 서명 (n, num_perm) 또는 (num_perm,)
+        bands (int): 밴드 수 (num_perm의 약수)
+
+    Returns:
+        np.ndarray: uint64 버킷 키 (n, bands) 또는 (bands,)
+    """
+    single = signatures.ndim == 1
+    matrix = np.atleast_2d(signatures)
+    rows = matrix.shape[1] // bands
+    grouped = matrix.reshape(len(matrix), bands, rows).astype(np.uint64)
+    keys = np.broadcast_to(
+        _BAND_SEED ^ np.arange(bands, dtype=np.uint64), (len(matrix), bands)
+    ).copy()
+    with np.errstate(over="ignore"):
+        for column in range(rows):
+            keys = (keys ^ grouped[:, :, column]) * _BAND_PRIME
+    return keys[0] if single else keys
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """유사 중복 조회 결과 한 건입니다.
+
+    Attributes:
+        doc_id (str): 기존 문서 ID
+        similarity (float): Jaccard 유사도 추정치 (0~1)
+    """
+
+    doc_id: str
+    similarity: float
+
+
+class DedupSegment:
+    """정렬된 버킷 키와 서명을 가진 불변 세그먼트입니다.
+
+    파일 구성: `keys.npy`(밴드 키, 정렬), `rows.npy`(키별 세그먼트 행), `signatures.npy`, `doc_ords.npy`
+    """
+
+    def __init__(self, directory: str):
+        """세그먼트 파일을 memmap으로 엽니다.
+
+        Args:
+            directory (str): 세그먼트 디렉터리
+        """
+        self.directory = directory
+        self.name = os.path.basename(directory)
+        self.keys = np.load(os.path.join(directory, "keys.npy"), mmap_mode="r")
+        self.rows = np.load(os.path.join(directory, "rows.npy"), mmap_mode="r")
+        self.signatures = np.load(os.path.join(directory, "signatures.npy"), mmap_mode="r")
+        self.doc_ords = np.load(os.path.join(directory, "doc_ords.npy"), mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self.doc_ords)
+
+    @classmethod
+    def build(
+        cls, directory: str, signatures: np.ndarray, doc_ords: np.ndarray, bands: int
+    ) -> "DedupSegment":
+        """서명으로 세그먼트를 만들어 기록합니다.
+
+        Args:
+            directory (str): 세그먼트 디렉터리
+            signatures (np.ndarray): uint32 서명 (n, num_perm)
+            doc_ords (np.ndarray): 행별 문서 서수 (n,)
+            bands (int): 밴드 수
+
+        Returns:
+            DedupSegment: 기록한 세그먼트
+        """
+        tmp = directory + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            keys = band_keys(signatures, bands).ravel()
+            rows = np.repeat(np.arange(len(signatures), dtype=np.uint32), bands)
+            order = np.argsort(keys, kind="stable")
+            np.save(os.path.join(tmp, "keys.npy"), keys[order])
+            np.save(os.path.join(tmp, "rows.npy"), rows[order])
+            np.save(os.path.join(tmp, "signatures.npy"), np.ascontiguousarray(signatures, dtype=np.uint32))
+            np.save(os.path.join(tmp, "doc_ords.npy"), np.asarray(doc_ords, dtype=np.int64))
+            os.replace(tmp, directory)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return cls(directory)
+
+    def candidates(self, keys: np.ndarray) -> np.ndarray:
+        """버킷 키가 하나라도 같은 세그먼트 행을 반환합니다.
+
+        Args:
+            keys (np.ndarray): 조회할 밴드 키 (bands,)
+
+        Returns:
+            np.ndarray: 후보 행 (중복 포함, 겹친 밴드 수만큼 반복)
+        """
+        lo = np.searchsorted(self.keys, keys, side="left")
+        hi = np.searchsorted(self.keys, keys, side="right")
+        hit = hi > lo
+        if not hit.any():
+            return np.empty(0, dtype=np.uint32)
+        return np.concatenate([self.rows[start:end] for start, end in zip(lo[hit], hi[hit])])
+
+
+class DedupCollection:
+    """한 테넌트의 유사 중복 색인입니다.
+
+    `manifest.json`에 세그먼트 목록을, `docs.json`에 문서 서수별 ID를 저장합니다. 다시 추가된
+    문서는 `docs.json`에 여러 번 나오며, 가장 뒤의 서수가 현재 서수입니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        num_perm: int,
+        bands: int,
+        memtable_docs: Optional[int] = None,
+        max_candidates: Optional[int] = None,
+    ):
+        """컬렉션을 열거나 새로 만듭니다.
+
+        Args:
+            directory (str): 컬렉션 디렉터리
+            num_perm (int): 서명 길이
+            bands (int): 밴드 수
+            memtable_docs (Optional[int]): 자동 플러시 기준 버퍼 문서 수
+            max_candidates (Optional[int]): 조회당 서명으로 검증할 최대 후보 수
+        """
+        if num_perm % bands:
+            raise ValueError(f"서명 길이({num_perm})는 밴드 수({bands})의 배수여야 합니다")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.num_perm = num_perm
+        self.bands = bands
+        self.memtable_docs = memtable_docs or settings.DEDUP_MEMTABLE_DOCS
+        self.max_candidates = max_candidates or settings.DEDUP_MAX_CANDIDATES
+        self._lock = threading.RLock()
+
+        self._doc_ids: List[str] = []
+        self._doc_ord: Dict[str, int] = {}
+        self._next_segment = 1
+        self._flush_at = self.memtable_docs
+        self.segments: List[DedupSegment] = []
+
+        self._mem_signatures: List[np.ndarray] = []
+        self._mem_ords: List[int] = []
+        self._mem_buckets: DefaultDict[int, List[int]] = defaultdict(list)
+        self._load()
+
+    def _load(self) -> None:
+        manifest_path = os.path.join(self.directory, "manifest.json")
+        manifest = {"next_segment": 1, "segments": []}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            with open(os.path.join(self.directory, "docs.json"), encoding="utf-8") as f:
+                self._doc_ids = json.load(f)
+        self._doc_ord = {doc_id: i for i, doc_id in enumerate(self._doc_ids)}
+        self._next_segment = manifest["next_segment"]
+        # 매니페스트 기록 전에 종료되어 남은 세그먼트와 기록 중이던 디렉터리를 지운다
+        for name in os.listdir(self.directory):
+            if name.startswith("seg-") and name not in manifest["segments"]:
+                logger.warning("매니페스트에 없는 중복 탐지 세그먼트 삭제: %s", name)
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        self.segments = [
+            DedupSegment(os.path.join(self.directory, name)) for name in manifest["segments"]
+        ]
+        if not self.segments and not self._doc_ids:
+            return
+        logger.info(
+            "중복 탐지 색인 열기: %s (세그먼트 %d개, 문서 %d개)",
+            self.directory, len(self.segments), len(self._doc_ids),
+        )
+
+    def _save(self) -> None:
+        """매니페스트와 문서 목록을 원자적으로 기록합니다 (락 보유 상태에서 호출)."""
+        def write(name: str, payload: object) -> None:
+            tmp = os.path.join(self.directory, name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, os.path.join(self.directory, name))
+
+        # 세그먼트에 들어간 문서까지만 기록한다 (버퍼 문서 서수는 항상 가장 뒤쪽)
+        persisted = len(self._doc_ids) - len(self._mem_ords)
+        write("docs.json", self._doc_ids[:persisted])
+        write("manifest.json", {
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "next_segment": self._next_segment,
+            "segments": [segment.name for segment in self.segments],
+        })
+
+    def _segment_path(self) -> str:
+        """디스크에 없는 새 세그먼트 경로를 정합니다 (락 보유 상태에서 호출)."""
+        while True:
+            path = os.path.join(self.directory, f"seg-{self._next_segment:06d}")
+            self._next_segment += 1
+            if not os.path.exists(path) and not os.path.exists(path + ".tmp"):
+                return path
+
+    @property
+    def doc_count(self) -> int:
+        """색인된 문서 수입니다."""
+        return len(self._doc_ord)
+
+    def _current(self, doc_ords: np.ndarray) -> np.ndarray:
+        """문서 서수가 그 문서의 현재 서수인지 나타내는 마스크를 반환합니다 (다시 추가된 문서의 이전 행 제외)."""
+        return np.fromiter(
+            (self._doc_ord.get(self._doc_ids[ordinal]) == ordinal for ordinal in doc_ords.tolist()),
+            dtype=bool, count=len(doc_ords),
+        )
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_ord
+
+    def add(self, doc_id: str, signature: np.ndarray) -> bool:
+        """문서 서명을 추가합니다 (이미 있는 문서는 이전 서명을 빼고 새 서명으로 바꿈).
+
+        Args:
+            doc_id (str): 문서 ID
+            signature (np.ndarray): uint32 서명 (num_perm,)
+
+        Returns:
+            bool: 새 문서였으면 True (기존 문서의 서명을 바꿨으면 False)
+        """
+        with self._lock:
+            previous = self._doc_ord.get(doc_id)
+            # 버퍼 문서 서수는 항상 가장 뒤쪽이므로 서수로 버퍼 행을 바로 찾는다
+            row = -1 if previous is None else previous - (len(self._doc_ids) - len(self._mem_ords))
+            if row >= 0:
+                for key in band_keys(self._mem_signatures[row], self.bands).tolist():
+                    self._mem_buckets[key].remove(row)
+            ordinal = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._doc_ord[doc_id] = ordinal
+            row = len(self._mem_ords)
+            self._mem_signatures.append(signature.astype(np.uint32, copy=False))
+            self._mem_ords.append(ordinal)
+            for key in band_keys(signature, self.bands).tolist():
+                self._mem_buckets[key].append(row)
+            full = len(self._mem_ords) >= self._flush_at
+        if full:
+            try:
+                self.flush()
+            except Exception:
+                # 서명은 버퍼에 남아 조회되며, 버퍼가 다시 차거나 다음 유지보수 때 재시도한다
+                logger.exception("중복 탐지 버퍼 플러시 실패: %s", self.directory)
+                with self._lock:
+                    self._flush_at = len(self._mem_ords) + self.memtable_docs
+        return previous is None
+
+    def add_bulk(self, doc_ids: Sequence[str], signatures: np.ndarray) -> Optional[DedupSegment]:
+        """서명 여러 개를 버퍼를 거치지 않고 세그먼트 하나로 바로 기록합니다 (백필용).
+
+        Args:
+            doc_ids (Sequence[str]): 문서 ID 목록
+            signatures (np.ndarray): uint32 서명 (n, num_perm)
+
+        Returns:
+            Optional[DedupSegment]: 새 세그먼트 (새 문서가 없으면 None)
+        """
+        self.flush()
+        with self._lock:
+            fresh = [i for i, doc_id in enumerate(doc_ids) if doc_id not in self._doc_ord]
+            if not fresh:
+                return None
+            doc_ords = np.arange(len(self._doc_ids), len(self._doc_ids) + len(fresh), dtype=np.int64)
+            for i in fresh:
+                self._doc_ord[doc_ids[i]] = len(self._doc_ids)
+                self._doc_ids.append(doc_ids[i])
+            segment = DedupSegment.build(self._segment_path(), signatures[fresh], doc_ords, self.bands)
+            self.segments.append(segment)
+            self._save()
+        return segment
+
+    def query(self, signature: np.ndarray, threshold: float, k: int = 1) -> List[DuplicateMatch]:
+        """서명과 유사도가 임계값 이상인 기존 문서를 찾습니다.
+
+        버킷이 겹친 후보를 겹친 밴드 수 순으로 최대 `max_candidates`개까지 서명으로 검증합니다.
+
+        Args:
+            signature (np.ndarray): uint32 서명 (num_perm,)
+            threshold (float): 최소 Jaccard 유사도 추정치
+            k (int): 반환할 최대 문서 수
+
+        Returns:
+            List[DuplicateMatch]: 유사도 내림차순 결과
+        """
+        keys = band_keys(signature, self.bands)
+        with self._lock:
+            segments = list(self.segments)
+            mem_rows = sorted({row for key in keys.tolist() for row in self._mem_buckets.get(key, ())})
+            mem_signatures = [self._mem_signatures[row] for row in mem_rows]
+            mem_ords = [self._mem_ords[row] for row in mem_rows]
+
+        ords: List[np.ndarray] = []
+        scores: List[np.ndarray] = []
+        if mem_signatures:
+            ords.append(np.asarray(mem_ords, dtype=np.int64))
+            scores.append((np.stack(mem_signatures) == signature).mean(axis=1))
+        for segment in segments:
+            rows = segment.candidates(keys)
+            if not len(rows):
+                continue
+            rows, hits = np.unique(rows, return_counts=True)
+            if len(rows) > self.max_candidates:
+                # 공통 서식 문서처럼 버킷이 붐비면 많이 겹친 후보부터 검증한다
+                rows = np.sort(rows[np.argsort(-hits, kind="stable")[:self.max_candidates]])
+            ords.append(np.asarray(segment.doc_ords[rows]))
+            scores.append((segment.signatures[rows] == signature).mean(axis=1))
+        if not ords:
+            return []
+
+        all_ords = np.concatenate(ords)
+        all_scores = np.concatenate(scores)
+        keep = (all_scores >= threshold) & self._current(all_ords)
+        all_ords, all_scores = all_ords[keep], all_scores[keep]
+        order = np.argsort(-all_scores, kind="stable")[:k]
+        return [
+            DuplicateMatch(self._doc_ids[int(all_ords[i])], round(float(all_scores[i]), 4))
+            for i in order
+        ]
+
+    def flush(self) -> Optional[DedupSegment]:
+        """버퍼를 세그먼트로 플러시합니다.
+
+        세그먼트 기록에 실패하면 버퍼를 비우지 않고 예외를 그대로 올립니다.
+
+        Returns:
+            Optional[DedupSegment]: 새 세그먼트 (버퍼가 비었거나 모두 다시 추가된 문서의 이전 행이면 None)
+        """
+        with self._lock:
+            if not self._mem_ords:
+                return None
+            doc_ords = np.asarray(self._mem_ords, dtype=np.int64)
+            live = self._current(doc_ords)
+            segment = None
+            if live.any():
+                signatures = np.stack(self._mem_signatures)[live]
+                segment = DedupSegment.build(self._segment_path(), signatures, doc_ords[live], self.bands)
+                self.segments.append(segment)
+            self._mem_signatures = []
+            self._mem_ords = []
+            self._mem_buckets = defaultdict(list)
+            self._flush_at = self.memtable_docs
+            self._save()
+        if segment is None:
+            return None
+        logger.info("중복 탐지 세그먼트 플러시: %s (%d건)", segment.directory, len(segment))
+        return segment
+
+    def merge(self, max_segments: Optional[int] = None) -> Optional[DedupSegment]:
+        """세그먼트 수가 최대치를 넘으면 전부 하나로 병합합니다.
+
+        Args:
+            max_segments (Optional[int]): 최대 세그먼트 수
+
+        Returns:
+            Optional[DedupSegment]: 병합된 세그먼트 (병합하지 않았거나 남은 행이 없으면 None)
+        """
+        max_segments = max_segments or settings.DEDUP_MAX_SEGMENTS
+        with self._lock:
+            sources = list(self.segments)
+        if len(sources) <= max_segments:
+            return None
+        signatures = np.concatenate([np.asarray(segment.signatures) for segment in sources])
+        doc_ords = np.concatenate([np.asarray(segment.doc_ords) for segment in sources])
+        with self._lock:
+            # 다시 추가된 문서의 이전 행은 병합하면서 버린다
+            live = self._current(doc_ords)
+            path = self._segment_path()
+        signatures, doc_ords = signatures[live], doc_ords[live]
+        merged = None
+        if len(doc_ords):
+            merged = DedupSegment.build(path, signatures, doc_ords, self.bands)
+        with self._lock:
+            self.segments = ([merged] if merged is not None else []) + [
+                s for s in self.segments if s not in sources
+            ]
+            self._save()
+        for segment in sources:
+            shutil.rmtree(segment.directory, ignore_errors=True)
+        logger.info(
+            "중복 탐지 세그먼트 병합: %d개 → %s (%d건)", len(sources), os.path.basename(path), len(doc_ords)
+        )
+        return merged
+
+    def stats(self) -> Dict[str, Any]:
+        """컬렉션 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "docs": len(self._doc_ord),
+                "segments": len(self.segments),
+                "memtable_docs": len(self._mem_ords),
+            }
+
+
+class NearDuplicateIndex:
+    """테넌트별 `DedupCollection`을 관리하는 유사 중복 색인 클래스입니다."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        shingle_size: Optional[int] = None,
+        threshold: Optional[float] = None,
+        memtable_docs: Optional[int] = None,
+        max_segments: Optional[int] = None,
+        max_candidates: Optional[int] = None,
+    ):
+        """유사 중복 색인을 초기화합니다. 컬렉션은 처음 접근할 때 열립니다.
+
+        Args:
+            directory (Optional[str]): 색인 루트 디렉터리
+            num_perm (Optional[int]): 서명 길이
+            bands (Optional[int]): LSH 밴드 수
+            shingle_size (Optional[int]): 싱글 글자 수
+            threshold (Optional[float]): 중복으로 판정할 최소 Jaccard 유사도 추정치
+            memtable_docs (Optional[int]): 자동 플러시 기준 버퍼 문서 수
+            max_segments (Optional[int]): 컬렉션당 최대 세그먼트 수 (초과 시 병합)
+            max_candidates (Optional[int]): 조회당 서명으로 검증할 최대 후보 수
+        """
+        self.directory = directory or settings.DEDUP_INDEX_DIR
+        self.num_perm = num_perm or settings.DEDUP_NUM_PERM
+        self.bands = bands or settings.DEDUP_BANDS
+        self.threshold = threshold if threshold is not None else settings.DEDUP_THRESHOLD
+        self.memtable_docs = memtable_docs or settings.DEDUP_MEMTABLE_DOCS
+        self.max_segments = max_segments or settings.DEDUP_MAX_SEGMENTS
+        self.max_candidates = max_candidates or settings.DEDUP_MAX_CANDIDATES
+        self.hasher = MinHasher(self.num_perm, shingle_size or settings.DEDUP_SHINGLE_SIZE)
+        self._collections: Dict[str, DedupCollection] = {}
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def collection(self, tenant_id: str) -> DedupCollection:
+        """테넌트 컬렉션을 반환합니다 (없으면 디스크에서 열거나 새로 만듭니다).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            DedupCollection: 테넌트 컬렉션
+        """
+        collection = self._collections.get(tenant_id)
+        if collection is None:
+            with self._lock:
+                collection = self._collections.get(tenant_id)
+                if collection is None:
+                    collection = DedupCollection(
+                        os.path.join(self.directory, quote(tenant_id, safe="")),
+                        self.num_perm,
+                        self.bands,
+                        self.memtable_docs,
+                        self.max_candidates,
+                    )
+                    self._collections[tenant_id] = collection
+        return collection
+
+    def check_and_add(self, tenant_id: str, doc_id: str, text: str) -> Optional[DuplicateMatch]:
+        """본문과 유사한 기존 문서를 찾고 문서를 색인에 추가합니다.
+
+        같은 문서가 다시 들어오면(재처리) 자기 자신은 결과에서 제외합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            doc_id (str): 문서 ID
+            text (str): 파싱된 본문
+
+        Returns:
+            Optional[DuplicateMatch]: 가장 유사한 기존 문서 (없거나 본문이 비어 있으면 None)
+        """
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return None
+        collection = self.collection(tenant_id)
+        matches = collection.query(signature, self.threshold, k=2)
+        collection.add(doc_id, signature)
+        return next((match for match in matches if match.doc_id != doc_id), None)
+
+    async def check(self, tenant_id: str, doc_id: str, text: str) -> Optional[DuplicateMatch]:
+        """`check_and_add`를 스레드에서 실행합니다 (싱글/서명 계산은 CPU 작업)."""
+        return await asyncio.to_thread(self.check_and_add, tenant_id, doc_id, text)
+
+    def flush_all(self) -> None:
+        """모든 컬렉션의 버퍼를 플러시합니다."""
+        for collection in list(self._collections.values()):
+            collection.flush()
+
+    def maintain(self) -> None:
+        """모든 컬렉션을 플러시하고 필요한 경우 병합합니다."""
+        for collection in list(self._collections.values()):
+            collection.flush()
+            collection.merge(self.max_segments)
+
+    async def start(self, interval: Optional[float] = None) -> None:
+        """주기적 플러시/병합 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (Optional[float]): 유지보수 주기(초)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        interval = interval or settings.DEDUP_MERGE_INTERVAL_SECONDS
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await asyncio.to_thread(self.maintain)
+                except Exception:
+                    logger.exception("중복 탐지 색인 유지보수 실패")
+
+        self._task = asyncio.create_task(_loop(), name="dedup-index-maintenance")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 버퍼를 플러시합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush_all)
+
+    def stats(self, tenant_id: str) -> Dict[str, Any]:
+        """테넌트 컬렉션 통계를 반환합니다."""
+        return self.collection(tenant_id).stats()
+
+
+# 전역 유사 중복 색인 인스턴스
+near_duplicate_index = NearDuplicateIndex()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """유사 중복 색인 인스턴스를 반환합니다.
+
+    Returns:
+        NearDuplicateIndex: 전역 유사 중복 색인
+    """
+    return near_duplicate_index
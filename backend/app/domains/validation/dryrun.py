@@ -0,0 +1,315 @@
+"""
+검증 규칙 시험 실행 (dry-run)
+
+초안 규칙 집합을 저장하기 전에 테넌트의 최근 파싱 문서 표본에 적용해 통과/실패 통계를 봅니다.
+
+- 표본은 검증 워커가 `documents.parsed`를 처리할 때 추출/기대 필드를 테넌트별 최근 N건으로
+  보관해 둔 것이라, 시험 실행 때 객체 스토리지에서 문서를 다시 읽지 않습니다.
+- 표본을 청크로 나눠 프로세스 풀에서 평가합니다. 규칙 스냅샷(`RuleSpec`)과 필드만 넘기고
+  실행 계획은 프로세스마다 한 번 컴파일해 재사용합니다.
+- 풀에 넣는 청크는 프로세스 수의 두 배까지만 유지하고, 청크가 끝날 때마다 누적 통계를
+  내보냅니다. 클라이언트가 떠나면 아직 시작하지 않은 청크를 취소합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ...common.config import settings
+from .compiler import STATUS_FAILED, STATUS_REVIEW, CompiledPlan, RuleSpec, compile_rules
+
+logger = logging.getLogger(__name__)
+
+# 결과에 담을 실패 문서 예시 수
+MAX_FAILED_EXAMPLES = 20
+
+
+@dataclass(frozen=True)
+class SampleDocument:
+    """시험 실행 표본 문서 한 건입니다.
+
+    Attributes:
+        doc_id (str): 문서 ID
+        fields (Mapping[str, Any]): 추출 필드
+        expected (Optional[Mapping[str, Any]]): 기대 필드
+    """
+
+    doc_id: str
+    fields: Mapping[str, Any]
+    expected: Optional[Mapping[str, Any]]
+
+
+class SampleStore:
+    """테넌트별 최근 파싱 문서를 보관하는 표본 저장소 클래스입니다."""
+
+    def __init__(self, max_docs: Optional[int] = None):
+        """표본 저장소를 초기화합니다.
+
+        Args:
+            max_docs (Optional[int]): 테넌트별 보관 문서 수
+        """
+        self.max_docs = max_docs or settings.DRYRUN_SAMPLE_DOCS
+        self._samples: Dict[str, Deque[SampleDocument]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tenant_id: str, events: Sequence[Mapping[str, Any]]) -> None:
+        """파싱 이벤트의 필드를 표본에 추가합니다 (같은 문서는 최신 값으로 교체).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            events (Sequence[Mapping[str, Any]]): `doc_id`, `extracted_fields`, `expected_fields`를 가진 이벤트
+        """
+        documents = [
+            SampleDocument(event["doc_id"], event.get("extracted_fields") or {}, event.get("expected_fields"))
+            for event in events
+        ]
+        reprocessed = {document.doc_id for document in documents}
+        with self._lock:
+            samples = self._samples.get(tenant_id)
+            if samples is None:
+                samples = self._samples[tenant_id] = deque(maxlen=self.max_docs)
+            elif any(sample.doc_id in reprocessed for sample in samples):
+                samples = self._samples[tenant_id] = deque(
+                    (sample for sample in samples if sample.doc_id not in reprocessed), maxlen=self.max_docs
+                )
+            samples.extend(documents)
+
+    def recent(self, tenant_id: str, limit: int) -> List[SampleDocument]:
+        """최근 문서부터 최대 `limit`건을 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            limit (int): 최대 문서 수
+
+        Returns:
+            List[SampleDocument]: 최신순 표본
+        """
+        with self._lock:
+            samples = list(self._samples.get(tenant_id, ()))
+        return samples[::-1][:limit]
+
+    def size(self, tenant_id: str) -> int:
+        """테넌트 표본 문서 수를 반환합니다."""
+        with self._lock:
+            return len(self._samples.get(tenant_id, ()))
+
+
+# 전역 표본 저장소 인스턴스
+sample_store = SampleStore()
+
+
+def get_sample_store() -> SampleStore:
+    """표본 저장소 인스턴스를 반환합니다.
+
+    Returns:
+        SampleStore: 전역 표본 저장소
+    """
+    return sample_store
+
+
+@lru_cache(maxsize=32)
+def _plan(specs: Tuple[RuleSpec, ...]) -> CompiledPlan:
+    """작업 프로세스에서 규칙 집합별 실행 계획을 한 번만 컴파일합니다."""
+    return compile_rules(specs)
+
+
+def evaluate_chunk(
+    specs: Tuple[RuleSpec, ...], documents: Sequence[SampleDocument]
+) -> Dict[str, Any]:
+    """표본 청크 하나를 평가합니다 (프로세스 풀에서 실행되는 최상위 함수).
+
+    모든 규칙의 실패 수를 세기 위해 short-circuit 없이 평가합니다.
+
+    Args:
+        specs (Tuple[RuleSpec, ...]): 규칙 스냅샷
+        documents (Sequence[SampleDocument]): 표본 문서
+
+    Returns:
+        Dict[str, Any]: 문서 수, 상태별 수, 규칙별 실패 수, 실패 문서 ID
+    """
+    outcomes = _plan(specs).evaluate(
+        [document.fields for document in documents],
+        [document.expected for document in documents],
+        short_circuit=False,
+    )
+    rule_failures: Dict[str, int] = {}
+    failed_docs: List[str] = []
+    review = 0
+    for document, outcome in zip(documents, outcomes):
+        review += outcome.status == STATUS_REVIEW
+        if outcome.status == STATUS_FAILED:
+            failed_docs.append(document.doc_id)
+            for error in outcome.errors:
+                rule_failures[error["ruleId"]] = rule_failures.get(error["ruleId"], 0) + 1
+    return {
+        "documents": len(documents),
+        "failed": len(failed_docs),
+        "review": review,
+        "rule_failures": rule_failures,
+        "failed_docs": failed_docs[:MAX_FAILED_EXAMPLES],
+    }
+
+
+class DryRunStats:
+    """청크 결과를 누적하는 시험 실행 통계 클래스입니다."""
+
+    def __init__(self, specs: Sequence[RuleSpec], total: int):
+        """통계를 초기화합니다.
+
+        Args:
+            specs (Sequence[RuleSpec]): 규칙 스냅샷
+            total (int): 평가할 표본 문서 수
+        """
+        self.specs = specs
+        self.total = total
+        self.evaluated = 0
+        self.failed = 0
+        self.review = 0
+        self.rule_failures: Dict[str, int] = {spec.rule_id: 0 for spec in specs}
+        self.failed_docs: List[str] = []
+        self.started = time.perf_counter()
+
+    def add(self, chunk: Mapping[str, Any]) -> None:
+        """청크 결과를 더합니다."""
+        self.evaluated += chunk["documents"]
+        self.failed += chunk["failed"]
+        self.review += chunk["review"]
+        for rule_id, failures in chunk["rule_failures"].items():
+            self.rule_failures[rule_id] = self.rule_failures.get(rule_id, 0) + failures
+        room = MAX_FAILED_EXAMPLES - len(self.failed_docs)
+        self.failed_docs.extend(chunk["failed_docs"][:room])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 통계를 반환합니다 (camelCase).
+
+        Returns:
+            Dict[str, Any]: 평가 문서 수, 상태별 수, 통과율, 규칙별 실패 수/실패율, 실패 문서 예시
+        """
+        evaluated = self.evaluated
+        return {
+            "evaluated": evaluated,
+            "total": self.total,
+            "validated": evaluated - self.failed - self.review,
+            "failed": self.failed,
+            "review": self.review,
+            "passRate": round((evaluated - self.failed) / evaluated, 4) if evaluated else None,
+            "rules": [
+                {
+                    "ruleId": spec.rule_id,
+                    "name": spec.name,
+                    "failures": self.rule_failures.get(spec.rule_id, 0),
+                    "failureRate": round(self.rule_failures.get(spec.rule_id, 0) / evaluated, 4) if evaluated else None,
+                }
+                for spec in self.specs
+            ],
+            "failedDocs": list(self.failed_docs),
+            "elapsedMs": round((time.perf_counter() - self.started) * 1000, 1),
+        }
+
+
+class DryRunner:
+    """프로세스 풀에서 초안 규칙 집합을 표본에 적용하는 시험 실행기 클래스입니다."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_docs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """시험 실행기를 초기화합니다. 프로세스 풀은 처음 실행할 때 만듭니다.
+
+        Args:
+            workers (Optional[int]): 프로세스 수 (0이면 CPU 수)
+            chunk_docs (Optional[int]): 작업 하나에 넣을 문서 수
+            executor (Optional[Executor]): 사용할 실행기 (없으면 spawn 프로세스 풀)
+        """
+        workers = settings.DRYRUN_WORKERS if workers is None else workers
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_docs = chunk_docs or settings.DRYRUN_CHUNK_DOCS
+        self._executor = executor
+        self._lock = threading.Lock()
+        self.cancelled_chunks = 0
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # 이벤트 루프/스레드를 가진 서버 프로세스를 fork하지 않는다
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._executor
+
+    async def run(
+        self,
+        specs: Sequence[RuleSpec],
+        documents: Sequence[SampleDocument],
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """표본을 평가하며 청크가 끝날 때마다 누적 통계를 내보냅니다.
+
+        스트림을 닫거나(`aclose`) `is_disconnected`가 True를 돌려주면 대기 중인 청크를 취소합니다.
+
+        Args:
+            specs (Sequence[RuleSpec]): 컴파일되는 것이 확인된 규칙 스냅샷
+            documents (Sequence[SampleDocument]): 표본 문서
+            is_disconnected (Optional[Callable[[], Awaitable[bool]]]): 클라이언트 연결 종료 확인 함수
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: ("progress" | "done", 누적 통계)
+        """
+        frozen = tuple(specs)
+        stats = DryRunStats(frozen, len(documents))
+        chunks = deque(
+            documents[start:start + self.chunk_docs] for start in range(0, len(documents), self.chunk_docs)
+        )
+        pool = self._pool()
+        loop = asyncio.get_running_loop()
+        pending: Dict["asyncio.Future[Dict[str, Any]]", Future] = {}
+        try:
+            while chunks or pending:
+                while chunks and len(pending) < self.workers * 2:
+                    future = pool.submit(evaluate_chunk, frozen, chunks.popleft())
+                    pending[asyncio.wrap_future(future, loop=loop)] = future
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in done:
+                    del pending[waiter]
+                    stats.add(waiter.result())
+                if is_disconnected is not None and await is_disconnected():
+                    logger.info("시험 실행 취소 (연결 종료): %d/%d건 평가", stats.evaluated, stats.total)
+                    return
+                if chunks or pending:
+                    yield "progress", stats.snapshot()
+            yield "done", stats.snapshot()
+        finally:
+            # 이미 실행 중인 청크는 끝까지 돌지만 청크 크기만큼으로 제한된다
+            self.cancelled_chunks += len(chunks) + sum(future.cancel() for future in pending.values())
+            for waiter in pending:
+                waiter.cancel()
+
+    async def stop(self) -> None:
+        """프로세스 풀을 종료합니다 (대기 중인 작업은 취소)."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+# 전역 시험 실행기 인스턴스
+dry_runner = DryRunner()
+
+
+def get_dry_runner() -> DryRunner:
+    """시험 실행기 인스턴스를 반환합니다.
+
+    Returns:
+        DryRunner: 전역 시험 실행기
+    """
+    return dry_runner
@@ -0,0 +1,487 @@
+"""
+기대값-추출값 필드 매칭
+
+업로드 시 입력한 기대 필드(이름/날짜/번호)를 추출 값과 후보 구간들에 배치로 대조하는 매처
+
+- 정규화: 이름은 NFKC/소문자화 후 공백·문장부호, 존칭(님/씨/귀하), 법인 표기((주)/주식회사)를
+  지우고, 날짜는 ISO 날짜로, 숫자는 `1억 2천만`, `금 오백만원정` 같은 한글 단위 표기까지 실수로
+  바꿉니다. 같은 값이 반복되므로 정규화 결과는 캐시합니다.
+- 날짜/숫자는 정규화 결과가 같은지로, 이름/텍스트는 유사도(이름은 Jaro-Winkler, 텍스트는
+  편집 거리 비율)로 판정합니다.
+- 유사도 커널은 (기대값, 후보) 쌍 배치를 코드 포인트 행렬로 바꿔 numpy로 한 번에 계산합니다.
+  편집 거리는 비트 병렬(Myers/Hyyrö) 방식이라 열 하나당 배열 연산 몇 번으로 끝납니다.
+- 비싼 커널 전에 길이 차와 글자 히스토그램 교집합으로 유사도 상한을 구해, 임계값에 못 미치는
+  후보 쌍을 걸러냅니다. 남은 쌍은 길이순으로 묶어 패딩을 줄입니다.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .compiler import normalize_text, parse_date, parse_number
+
+# 필드 종류
+KIND_NAME = "name"
+KIND_TEXT = "text"
+KIND_DATE = "date"
+KIND_NUMBER = "number"
+KINDS = (KIND_NAME, KIND_TEXT, KIND_DATE, KIND_NUMBER)
+
+DEFAULT_THRESHOLD = 0.8
+# 비트 병렬 편집 거리의 최대 패턴 길이 (uint64 비트 수)
+_WORD_BITS = 64
+# 가지치기용 글자 히스토그램 버킷 수 (버킷을 합쳐도 교집합 상한은 유지된다)
+_HISTOGRAM_BUCKETS = 64
+# 점수 반올림 자릿수 (부동소수 오차로 임계값 경계의 판정이 흔들리지 않게 한다)
+_SCORE_DIGITS = 6
+# Jaro-Winkler 접두사 가중치/최대 길이/가산 기준
+_PREFIX_WEIGHT = 0.1
+_PREFIX_LENGTH = 4
+_BOOST_THRESHOLD = 0.7
+
+_SEPARATORS = re.compile(r"[\s.,·ㆍ\-_/()\[\]'\"]+")
+_CORPORATE = re.compile(r"\((?:주|유|사|재)\)|^(?:주식회사|유한회사|사단법인|재단법인)|(?:주식회사|유한회사)$")
+_HONORIFICS = re.compile(r"\s*(?:선생님|귀하|님|씨|貴下)$")
+_SHORT_DATE = re.compile(r"^(\d{2})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})\s*일?$")
+_WEEKDAY = re.compile(r"\s*\(\s*[월화수목금토일]\s*\)$")
+_AMOUNT_AFFIXES = re.compile(r"^금\s*|\s*(?:원정|원整|정|整|원)$")
+_KOREAN_NUMBER = re.compile(r"(\d+(?:\.\d+)?)|([영공일이삼사오육칠팔구])|([십백천])|([만억조])")
+_KOREAN_NUMBER_FULL = re.compile(r"(?:\d+(?:\.\d+)?|[영공일이삼사오육칠팔구십백천만억조])+")
+_NATIVE_DIGITS = {c: float(i) for i, c in enumerate("영일이삼사오육칠팔구")}
+_NATIVE_DIGITS["공"] = 0.0
+_SMALL_UNITS = {"십": 10.0, "백": 100.0, "천": 1000.0}
+_BIG_UNITS = {"만": 1e4, "억": 1e8, "조": 1e12}
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(value: Optional[str]) -> Optional[str]:
+    """이름/상호를 비교용으로 정규화합니다 (`홍 길동 님` → `홍길동`, `㈜ 갑` → `갑`).
+
+    Args:
+        value (Optional[str]): 원본 값
+
+    Returns:
+        Optional[str]: 정규화된 이름 (비면 None)
+    """
+    text = normalize_text(value)
+    if text is None:
+        return None
+    text = _CORPORATE.sub("", _HONORIFICS.sub("", text.casefold())).strip()
+    return _SEPARATORS.sub("", text) or None
+
+
+@lru_cache(maxsize=65536)
+def normalize_plain(value: Optional[str]) -> Optional[str]:
+    """일반 텍스트를 비교용으로 정규화합니다 (NFKC, 소문자화, 공백/구분자 제거)."""
+    text = normalize_text(value)
+    if text is None:
+        return None
+    return _SEPARATORS.sub("", text.casefold()) or None
+
+
+@lru_cache(maxsize=65536)
+def normalize_date(value: Optional[str]) -> Optional[str]:
+    """날짜를 ISO 형식으로 바꿉니다 (`parse_date` 형식 + `24.1.5`, 끝의 요일 표기 허용).
+
+    두 자리 연도는 70 미만이면 2000년대, 이상이면 1900년대로 봅니다.
+
+    Args:
+        value (Optional[str]): 원본 값
+
+    Returns:
+        Optional[str]: ISO 날짜 (바꿀 수 없으면 None)
+    """
+    text = normalize_text(value)
+    if text is None:
+        return None
+    text = _WEEKDAY.sub("", text)
+    parsed = parse_date(text)
+    if parsed is not None:
+        return parsed
+    match = _SHORT_DATE.match(text)
+    if match is None:
+        return None
+    year = int(match.group(1))
+    return parse_date(f"{year + (2000 if year < 70 else 1900)}-{match.group(2)}-{match.group(3)}")
+
+
+@lru_cache(maxsize=65536)
+def canonical_number(value: Optional[str]) -> float:
+    """숫자 표기를 실수로 바꿉니다 (`1,500원`, `1억 2천만`, `금 오백만원정`, `12만 3,456`).
+
+    Args:
+        value (Optional[str]): 원본 값
+
+    Returns:
+        float: 값 (바꿀 수 없으면 NaN)
+    """
+    text = normalize_text(value)
+    if text is None:
+        return math.nan
+    number = parse_number(text)
+    if not math.isnan(number):
+        return number
+    compact = "".join(_AMOUNT_AFFIXES.sub("", text).split()).replace(",", "")
+    if not _KOREAN_NUMBER_FULL.fullmatch(compact):
+        return math.nan
+    total, section, current = 0.0, 0.0, None
+    for digits, native, small, big in _KOREAN_NUMBER.findall(compact):
+        if digits:
+            current = float(digits)
+        elif native:
+            current = _NATIVE_DIGITS[native]
+        elif small:
+            section += (1.0 if current is None else current) * _SMALL_UNITS[small]
+            current = None
+        else:
+            chunk = section + (current or 0.0)
+            total += (chunk or 1.0) * _BIG_UNITS[big]
+            section, current = 0.0, None
+    return total + section + (current or 0.0)
+
+
+_NORMALIZERS = {
+    KIND_NAME: normalize_name,
+    KIND_TEXT: normalize_plain,
+    KIND_DATE: normalize_date,
+}
+
+
+def encode(values: Sequence[str], pad: int) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 목록을 패딩된 코드 포인트 행렬로 바꿉니다.
+
+    Args:
+        values (Sequence[str]): 문자열 목록
+        pad (int): 패딩 값 (음수, 양쪽 행렬의 패딩이 서로 같지 않게 지정)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: int32 코드 행렬 (n, 최대 길이), int64 길이 배열 (n,)
+    """
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    width = max(int(lengths.max(initial=0)), 1)
+    codes = np.full((len(values), width), pad, dtype=np.int32)
+    flat = np.frombuffer("".join(values).encode("utf-32-le"), dtype=np.uint32).astype(np.int32)
+    if len(flat):
+        rows = np.repeat(np.arange(len(values)), lengths)
+        cols = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        codes[rows, cols] = flat
+    return codes, lengths
+
+
+def _levenshtein(a: str, b: str) -> int:
+    """두 문자열의 편집 거리를 행 단위 DP로 계산합니다 (64자를 넘는 쌍 대체 경로)."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def levenshtein_batch(left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+    """문자열 쌍 배치의 편집 거리를 계산합니다.
+
+    쌍마다 짧은 쪽을 패턴으로 삼아 비트 병렬(Hyyrö) 알고리즘을 배치 전체에 벡터화합니다.
+    두 문자열이 모두 64자를 넘는 쌍만 DP로 따로 계산합니다.
+
+    Args:
+        left (Sequence[str]): 왼쪽 문자열 목록
+        right (Sequence[str]): 오른쪽 문자열 목록 (같은 길이)
+
+    Returns:
+        np.ndarray: int64 편집 거리 (n,)
+    """
+    n = len(left)
+    distances = np.zeros(n, dtype=np.int64)
+    patterns: List[str] = []
+    texts: List[str] = []
+    positions: List[int] = []
+    for i, (a, b) in enumerate(zip(left, right)):
+        if len(a) > len(b):
+            a, b = b, a
+        if len(a) > _WORD_BITS:
+            distances[i] = _levenshtein(a, b)
+        else:
+            patterns.append(a)
+            texts.append(b)
+            positions.append(i)
+    if not positions:
+        return distances
+
+    pattern, plen = encode(patterns, -1)
+    text, tlen = encode(texts, -2)
+    one = np.uint64(1)
+    weights = one << np.arange(pattern.shape[1], dtype=np.uint64)
+    plen_bits = plen.astype(np.uint64)
+    mask = np.where(plen >= _WORD_BITS, ~np.uint64(0), (one << plen_bits) - one)
+    high = np.where(plen > 0, one << (np.maximum(plen_bits, one) - one), np.uint64(0))
+    pv = mask.copy()
+    mv = np.zeros(len(positions), dtype=np.uint64)
+    score = plen.copy()
+    for j in range(text.shape[1]):
+        active = j < tlen
+        eq = ((pattern == text[:, j, np.newaxis]) * weights).sum(axis=1, dtype=np.uint64)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        score += active & ((ph & high) != 0)
+        score -= active & ((mh & high) != 0)
+        ph = (ph << one) | one
+        mh = mh << one
+        pv = np.where(active, (mh | ~(xv | ph)) & mask, pv)
+        mv = np.where(active, ph & xv & mask, mv)
+    # 빈 패턴은 상위 비트가 없어 위 갱신이 없으므로 텍스트 길이가 거리
+    distances[positions] = np.where(plen > 0, score, tlen)
+    return distances
+
+
+def levenshtein_similarity_batch(left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+    """편집 거리 비율 유사도 `1 - 거리 / 긴 쪽 길이`를 계산합니다 (둘 다 비면 1)."""
+    longest = np.fromiter((max(len(a), len(b)) for a, b in zip(left, right)), dtype=np.float64, count=len(left))
+    distances = levenshtein_batch(left, right)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(longest > 0, 1.0 - distances / longest, 1.0)
+
+
+def jaro_winkler_batch(
+    left: Sequence[str], right: Sequence[str], prefix_weight: float = _PREFIX_WEIGHT
+) -> np.ndarray:
+    """문자열 쌍 배치의 Jaro-Winkler 유사도를 계산합니다.
+
+    일치 글자 탐색은 왼쪽 글자 위치마다 배치 전체를 한 번에 처리하고, 전치 수는 일치 글자를
+    앞으로 모은 두 행렬을 비교해 구합니다. Jaro 유사도가 0.7을 넘을 때만 공통 접두사(최대 4자)로
+    가산합니다.
+
+    Args:
+        left (Sequence[str]): 왼쪽 문자열 목록
+        right (Sequence[str]): 오른쪽 문자열 목록 (같은 길이)
+        prefix_weight (float): 접두사 가중치
+
+    Returns:
+        np.ndarray: float64 유사도 (n,) (둘 다 비면 1)
+    """
+    a, alen = encode(left, -1)
+    b, blen = encode(right, -2)
+    window = np.maximum(np.maximum(alen, blen) // 2 - 1, 0)[:, np.newaxis]
+    columns = np.arange(b.shape[1])[np.newaxis, :]
+    a_matched = np.zeros(a.shape, dtype=bool)
+    b_matched = np.zeros(b.shape, dtype=bool)
+    for i in range(a.shape[1]):
+        near = np.abs(columns - i) <= window
+        candidates = (b == a[:, i, np.newaxis]) & near & ~b_matched
+        hit = candidates.any(axis=1)
+        rows = np.nonzero(hit)[0]
+        b_matched[rows, candidates[rows].argmax(axis=1)] = True
+        a_matched[:, i] = hit
+
+    matches = a_matched.sum(axis=1)
+    width = min(a.shape[1], b.shape[1])
+    a_seq = np.take_along_axis(a, np.argsort(~a_matched, axis=1, kind="stable"), axis=1)[:, :width]
+    b_seq = np.take_along_axis(b, np.argsort(~b_matched, axis=1, kind="stable"), axis=1)[:, :width]
+    transposed = ((a_seq != b_seq) & (np.arange(width) < matches[:, np.newaxis])).sum(axis=1) / 2.0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        m = matches.astype(np.float64)
+        jaro = np.where(matches > 0, (m / alen + m / blen + (m - transposed) / m) / 3.0, 0.0)
+    span = min(_PREFIX_LENGTH, width)
+    prefix = np.cumprod(a[:, :span] == b[:, :span], axis=1).sum(axis=1)
+    boosted = np.where(jaro > _BOOST_THRESHOLD, jaro + prefix * prefix_weight * (1.0 - jaro), jaro)
+    return np.where((alen == 0) & (blen == 0), 1.0, boosted)
+
+
+def _histograms(codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """행별 글자 히스토그램(코드 포인트 버킷)을 계산합니다."""
+    valid = np.arange(codes.shape[1])[np.newaxis, :] < lengths[:, np.newaxis]
+    rows = np.nonzero(valid)[0]
+    cells = rows * _HISTOGRAM_BUCKETS + codes[valid] % _HISTOGRAM_BUCKETS
+    counts = np.bincount(cells, minlength=len(codes) * _HISTOGRAM_BUCKETS)
+    return counts.reshape(len(codes), _HISTOGRAM_BUCKETS)
+
+
+def _bound(common: np.ndarray, alen: np.ndarray, blen: np.ndarray, kind: str) -> np.ndarray:
+    """공통 글자 수 상한으로 유사도 상한을 계산합니다."""
+    common = common.astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if kind == KIND_NAME:
+            jaro = np.where(common > 0, (common / alen + common / blen + 1.0) / 3.0, 0.0)
+            bound = jaro + _PREFIX_LENGTH * _PREFIX_WEIGHT * (1.0 - jaro)
+        else:
+            bound = common / np.maximum(alen, blen)
+    return np.where((alen == 0) & (blen == 0), 1.0, bound)
+
+
+def similarity_upper_bound(left: Sequence[str], right: Sequence[str], kind: str) -> np.ndarray:
+    """쌍별 유사도 상한을 글자 히스토그램 교집합으로 계산합니다 (커널보다 훨씬 싼 가지치기용).
+
+    공통 글자 수 상한 c에 대해 편집 거리 비율은 c / 긴 길이 이하이고, Jaro는
+    (c/|a| + c/|b| + 1) / 3 이하이며 Winkler 가산은 최대 4 × 가중치 비율입니다.
+
+    Args:
+        left (Sequence[str]): 왼쪽 문자열 목록
+        right (Sequence[str]): 오른쪽 문자열 목록
+        kind (str): 필드 종류 (name이면 Jaro-Winkler, 아니면 편집 거리 비율)
+
+    Returns:
+        np.ndarray: float64 유사도 상한 (n,)
+    """
+    a, alen = encode(left, -1)
+    b, blen = encode(right, -2)
+    common = np.minimum(_histograms(a, alen), _histograms(b, blen)).sum(axis=1)
+    return _bound(np.minimum(common, np.minimum(alen, blen)), alen, blen, kind)
+
+
+@dataclass(frozen=True)
+class FieldMatch:
+    """기대값 하나의 매칭 결과입니다.
+
+    Attributes:
+        score (float): 가장 높은 후보 점수 (0~1, 가지치기된 후보는 0으로 봄)
+        value (Optional[str]): 가장 높은 점수의 후보 원문 (후보가 없으면 None)
+        index (int): 후보 목록에서의 위치 (-1은 없음)
+    """
+
+    score: float
+    value: Optional[str]
+    index: int
+
+
+class FieldMatcher:
+    """기대값과 후보 구간을 배치로 대조하는 매처 클래스입니다."""
+
+    def __init__(self, chunk_size: int = 4096, prune: bool = True):
+        """필드 매처를 초기화합니다.
+
+        Args:
+            chunk_size (int): 유사도 커널에 한 번에 넣을 최대 쌍 수
+            prune (bool): 유사도 상한으로 후보 쌍을 미리 걸러낼지 여부
+        """
+        self.chunk_size = chunk_size
+        self.prune = prune
+        self.pairs_scored = 0
+        self.pairs_pruned = 0
+
+    def score_pairs(self, kind: str, left: Sequence[str], right: Sequence[str], threshold: float) -> np.ndarray:
+        """정규화된 이름/텍스트 쌍의 유사도를 계산합니다.
+
+        길이 상한, 글자 히스토그램 상한 순으로 임계값에 못 미치는 쌍을 걸러 0점으로 두고,
+        남은 쌍만 커널로 계산합니다.
+
+        Args:
+            kind (str): name | text
+            left (Sequence[str]): 정규화된 기대값 목록
+            right (Sequence[str]): 정규화된 후보 목록
+            threshold (float): 판정 임계값
+
+        Returns:
+            np.ndarray: float64 유사도 (n,)
+        """
+        scores = np.zeros(len(left), dtype=np.float64)
+        alen = np.fromiter(map(len, left), dtype=np.int64, count=len(left))
+        blen = np.fromiter(map(len, right), dtype=np.int64, count=len(right))
+        todo = np.arange(len(left))
+        if self.prune and len(todo):
+            floor = threshold - 10.0 ** -_SCORE_DIGITS
+            todo = todo[_bound(np.minimum(alen, blen), alen, blen, kind) >= floor]
+            if len(todo):
+                bound = similarity_upper_bound([left[i] for i in todo], [right[i] for i in todo], kind)
+                todo = todo[bound >= floor]
+            self.pairs_pruned += len(left) - len(todo)
+        if not len(todo):
+            return scores
+
+        # 길이가 비슷한 쌍끼리 묶어 패딩 열을 줄인다
+        todo = todo[np.argsort(np.maximum(alen, blen)[todo], kind="stable")]
+        kernel = jaro_winkler_batch if kind == KIND_NAME else levenshtein_similarity_batch
+        for start in range(0, len(todo), self.chunk_size):
+            chunk = todo[start:start + self.chunk_size]
+            scores[chunk] = kernel([left[i] for i in chunk], [right[i] for i in chunk])
+        self.pairs_scored += len(todo)
+        return scores
+
+    def match_batch(
+        self,
+        kind: str,
+        expected: Sequence[Optional[str]],
+        candidates: Sequence[Sequence[str]],
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> List[Optional[FieldMatch]]:
+        """기대값마다 후보 구간 중 가장 잘 맞는 것을 찾습니다.
+
+        날짜/숫자는 정규화 값이 같으면 1점, 다르면 0점이고, 이름/텍스트는 정규화 후 유사도입니다.
+        서식 문구처럼 배치 안에서 반복되는 (기대값, 후보) 쌍은 한 번만 계산합니다.
+
+        Args:
+            kind (str): 필드 종류 (name | text | date | number)
+            expected (Sequence[Optional[str]]): 기대값 목록 (None이면 매칭하지 않음)
+            candidates (Sequence[Sequence[str]]): 기대값별 후보 구간 목록 (추출 값 포함)
+            threshold (float): 이름/텍스트 가지치기 임계값
+
+        Returns:
+            List[Optional[FieldMatch]]: 기대값별 결과 (기대값이 None이면 None)
+
+        Raises:
+            ValueError: 알 수 없는 필드 종류인 경우
+        """
+        if kind not in KINDS:
+            raise ValueError(f"알 수 없는 필드 종류: {kind}")
+        counts = np.fromiter(
+            (0 if value is None else len(spans) for value, spans in zip(expected, candidates)),
+            dtype=np.int64,
+            count=len(expected),
+        )
+        owners = np.repeat(np.arange(len(expected)), counts)
+        spans = [span for value, group in zip(expected, candidates) if value is not None for span in group]
+
+        if kind == KIND_NUMBER:
+            targets = np.array([canonical_number(value) for value in expected], dtype=np.float64)
+            values = np.fromiter(map(canonical_number, spans), dtype=np.float64, count=len(spans))
+            scores = np.isclose(targets[owners], values, rtol=1e-9, atol=1e-9).astype(np.float64)
+        else:
+            normalize = _NORMALIZERS[kind]
+            targets_text = [None if value is None else normalize(value) for value in expected]
+            unique: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+            index = np.fromiter(
+                (
+                    unique.setdefault((targets_text[owner], normalize(span)), len(unique))
+                    for owner, span in zip(owners.tolist(), spans)
+                ),
+                dtype=np.int64,
+                count=len(spans),
+            )
+            scores = self._score_unique(kind, list(unique), threshold)[index]
+
+        results: List[Optional[FieldMatch]] = [
+            None if value is None else FieldMatch(0.0, None, -1) for value in expected
+        ]
+        if len(spans):
+            # 기대값별 최고점 (동점이면 앞선 후보)
+            order = np.lexsort((np.arange(len(spans)), -scores, owners))
+            first = order[np.r_[True, owners[order][1:] != owners[order][:-1]]]
+            starts = np.cumsum(counts) - counts
+            for pair in first.tolist():
+                owner = int(owners[pair])
+                slot = pair - int(starts[owner])
+                results[owner] = FieldMatch(round(float(scores[pair]), _SCORE_DIGITS), candidates[owner][slot], slot)
+        return results
+
+    def _score_unique(
+        self, kind: str, pairs: Sequence[Tuple[Optional[str], Optional[str]]], threshold: float
+    ) -> np.ndarray:
+        """정규화된 고유 쌍의 점수를 계산합니다 (빈 값 0점, 같은 값 1점)."""
+        count = len(pairs)
+        empty = np.fromiter((not a or not b for a, b in pairs), dtype=bool, count=count)
+        same = np.fromiter((a == b for a, b in pairs), dtype=bool, count=count)
+        scores = np.where(same & ~empty, 1.0, 0.0)
+        if kind != KIND_DATE:
+            fuzzy = np.nonzero(~same & ~empty)[0]
+            if len(fuzzy):
+                scores[fuzzy] = self.score_pairs(
+                    kind, [pairs[i][0] for i in fuzzy], [pairs[i][1] for i in fuzzy], threshold
+                )
+        return scores
@@ -0,0 +1,145 @@
+"""
+검증 도메인 모델
+
+검증 규칙과 테넌트별 규칙 집합 버전 SQLModel 모델 정의
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import Field, SQLModel
+
+from ..auth.models import TimestampMixin
+
+
+class FieldType(str, Enum):
+    """검증 대상 필드 타입 열거형입니다."""
+    TEXT = "text"
+    NUMBER = "number"
+    DATE = "date"
+    EMAIL = "email"
+    PHONE = "phone"
+    CUSTOM = "custom"
+
+
+class ValidationType(str, Enum):
+    """검증 방식 열거형입니다."""
+    REGEX = "regex"
+    FORMAT = "format"
+    THRESHOLD = "threshold"
+    SIMILARITY = "similarity"
+    CROSS_FIELD = "cross_field"
+    HUMAN_REVIEW = "human_review"
+
+
+class CompareOperator(str, Enum):
+    """필드 간 비교 연산자 열거형입니다."""
+    EQ = "eq"
+    NE = "ne"
+    LT = "lt"
+    LE = "le"
+    GT = "gt"
+    GE = "ge"
+
+
+class ValidationRule(SQLModel, TimestampMixin, table=True):
+    """테넌트의 추출 필드 검증 규칙을 저장하는 모델입니다.
+    
+    Attributes:
+        id (UUID): 규칙 고유 ID
+        tenant_id (str): 테넌트 ID
+        name (str): 규칙 이름
+        description (Optional[str]): 설명
+        field_type (FieldType): 대상 필드 타입
+        validation_type (ValidationType): 검증 방식
+        field_name (Optional[str]): 대상 추출 필드 이름 (없으면 field_type 값)
+        regex (Optional[str]): 정규식 (regex)
+        threshold (Optional[float]): 최솟값 (threshold) 또는 최소 유사도 0~1 (similarity)
+        compare_field (Optional[str]): 비교할 다른 필드 이름 (cross_field)
+        operator (Optional[CompareOperator]): 비교 연산자 (cross_field)
+        human_review_required (bool): 휴먼검토 필요 여부 (human_review)
+        is_active (bool): 활성 상태
+    """
+    
+    __tablename__ = "validation_rules"
+    
+    id: UUID = Field(
+        default_factory=uuid4,
+        primary_key=True,
+        description="규칙 고유 ID"
+    )
+    tenant_id: str = Field(
+        index=True,
+        description="테넌트 ID (멀티테넌시)"
+    )
+    name: str = Field(
+        description="규칙 이름"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="설명"
+    )
+    field_type: FieldType = Field(
+        description="대상 필드 타입"
+    )
+    validation_type: ValidationType = Field(
+        description="검증 방식"
+    )
+    field_name: Optional[str] = Field(
+        default=None,
+        description="대상 추출 필드 이름"
+    )
+    regex: Optional[str] = Field(
+        default=None,
+        description="정규식"
+    )
+    threshold: Optional[float] = Field(
+        default=None,
+        description="최솟값 또는 최소 유사도"
+    )
+    compare_field: Optional[str] = Field(
+        default=None,
+        description="비교할 다른 필드 이름"
+    )
+    operator: Optional[CompareOperator] = Field(
+        default=None,
+        description="비교 연산자"
+    )
+    human_review_required: bool = Field(
+        default=False,
+        description="휴먼검토 필요 여부"
+    )
+    is_active: bool = Field(
+        default=True,
+        description="활성 상태"
+    )
+
+
+class ValidationRuleSet(SQLModel, table=True):
+    """테넌트 규칙 집합의 버전을 저장하는 모델입니다.
+    
+    규칙이 추가/수정/삭제될 때마다 같은 트랜잭션에서 버전을 올리므로, 컴파일된
+    실행 계획은 버전 한 행만 읽어 재사용 여부를 판단할 수 있습니다.
+    
+    Attributes:
+        tenant_id (str): 테넌트 ID
+        version (int): 규칙 집합 버전
+        updated_at (datetime): 마지막 변경 시간
+    """
+    
+    __tablename__ = "validation_rule_sets"
+    
+    tenant_id: str = Field(
+        primary_key=True,
+        description="테넌트 ID"
+    )
+    version: int = Field(
+        default=0,
+        description="규칙 집합 버전"
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="마지막 변경 시간"
+    )
@@ -0,0 +1,266 @@
+"""
+검증 도메인 라우터
+
+검증 규칙 관리 및 테스트 REST API 엔드포인트
+"""
+
+from typing import Annotated, List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+
+from ...common.database import get_db_session
+from ...common.exceptions import BusinessException, business_exception_handler
+from ...common.streaming import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, encode_events
+from ..auth.router import get_current_token
+from ..auth.schemas import TokenPayload
+from .dryrun import DryRunner, SampleStore, get_dry_runner, get_sample_store
+from .schemas import (
+    ValidationDryRunRequest,
+    ValidationPlanStats,
+    ValidationRuleCreate,
+    ValidationRuleRead,
+    ValidationRuleUpdate,
+    ValidationTestRequest,
+    ValidationTestResult,
+)
+from .services import PlanCache, ValidationService, draft_specs, get_plan_cache
+
+
+def get_validation_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    plans: Annotated[PlanCache, Depends(get_plan_cache)]
+) -> ValidationService:
+    """ValidationService 의존성을 제공합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션
+        plans (PlanCache): 실행 계획 캐시
+
+    Returns:
+        ValidationService: 검증 서비스 인스턴스
+    """
+    return ValidationService(session, plans)
+
+
+# 검증 라우터 생성
+router = APIRouter(prefix="/api/v1/validation", tags=["검증"])
+
+
+@router.get(
+    "/rules",
+    response_model=List[ValidationRuleRead],
+    summary="검증 규칙 목록",
+    description="현재 테넌트의 검증 규칙 목록을 조회합니다."
+)
+async def list_rules(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> List[ValidationRuleRead]:
+    """검증 규칙 목록 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        List[ValidationRuleRead]: 규칙 목록
+    """
+    return await service.list_rules(token.tenant_id)
+
+
+@router.post(
+    "/rules",
+    response_model=ValidationRuleRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="검증 규칙 생성",
+    description="검증 규칙을 생성합니다. 규칙 집합 버전이 올라가 다음 검증 때 실행 계획을 다시 컴파일합니다."
+)
+async def create_rule(
+    data: ValidationRuleCreate,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> ValidationRuleRead:
+    """검증 규칙 생성 엔드포인트입니다.
+
+    Args:
+        data (ValidationRuleCreate): 규칙 생성 데이터
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        ValidationRuleRead: 생성된 규칙
+
+    Raises:
+        HTTPException: 규칙을 컴파일할 수 없는 경우 (422)
+    """
+    try:
+        return await service.create_rule(token.tenant_id, data)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.put(
+    "/rules/{rule_id}",
+    response_model=ValidationRuleRead,
+    summary="검증 규칙 수정",
+    description="검증 규칙을 수정합니다. 보낸 필드만 반영합니다."
+)
+async def update_rule(
+    rule_id: UUID,
+    data: ValidationRuleUpdate,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> ValidationRuleRead:
+    """검증 규칙 수정 엔드포인트입니다.
+
+    Args:
+        rule_id (UUID): 규칙 ID
+        data (ValidationRuleUpdate): 수정할 필드
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        ValidationRuleRead: 수정된 규칙
+
+    Raises:
+        HTTPException: 규칙이 없거나 (404) 컴파일할 수 없는 경우 (422)
+    """
+    try:
+        return await service.update_rule(token.tenant_id, rule_id, data)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.delete(
+    "/rules/{rule_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="검증 규칙 삭제",
+    description="검증 규칙을 삭제합니다."
+)
+async def delete_rule(
+    rule_id: UUID,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> Response:
+    """검증 규칙 삭제 엔드포인트입니다.
+
+    Args:
+        rule_id (UUID): 규칙 ID
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        Response: 빈 응답
+
+    Raises:
+        HTTPException: 규칙이 없는 경우 (404)
+    """
+    try:
+        await service.delete_rule(token.tenant_id, rule_id)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/test",
+    response_model=ValidationTestResult,
+    summary="검증 규칙 테스트",
+    description="저장된 규칙 하나를 입력값에 적용해 통과 여부를 확인합니다."
+)
+async def test_rule(
+    request: ValidationTestRequest,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> ValidationTestResult:
+    """검증 규칙 테스트 엔드포인트입니다.
+
+    Args:
+        request (ValidationTestRequest): 규칙 ID와 입력값
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        ValidationTestResult: 통과 여부와 메시지
+
+    Raises:
+        HTTPException: 규칙이 없는 경우 (404)
+    """
+    try:
+        return await service.test_rule(token.tenant_id, request)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+
+
+@router.post(
+    "/dry-run",
+    summary="검증 규칙 시험 실행",
+    description="저장하지 않은 초안 규칙 집합을 최근 파싱 문서 표본에 적용하고 누적 통과/실패 통계를 "
+    "SSE(또는 Accept: application/x-ndjson이면 NDJSON)로 스트리밍합니다."
+)
+async def dry_run(
+    request: ValidationDryRunRequest,
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    samples: Annotated[SampleStore, Depends(get_sample_store)],
+    runner: Annotated[DryRunner, Depends(get_dry_runner)],
+    http_request: Request
+) -> StreamingResponse:
+    """검증 규칙 시험 실행 엔드포인트입니다.
+
+    표본 청크가 끝날 때마다 `progress` 이벤트를, 마지막에 `done` 이벤트를 보냅니다.
+    클라이언트 연결이 끊기면 아직 시작하지 않은 청크를 취소합니다.
+
+    Args:
+        request (ValidationDryRunRequest): 초안 규칙과 표본 크기
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        samples (SampleStore): 최근 파싱 문서 표본 저장소
+        runner (DryRunner): 시험 실행기
+        http_request (Request): HTTP 요청 (Accept 헤더와 연결 종료 확인)
+
+    Returns:
+        StreamingResponse: 진행 통계 이벤트 스트림
+
+    Raises:
+        HTTPException: 컴파일할 수 없는 규칙이 있는 경우 (422)
+    """
+    try:
+        specs = draft_specs(request)
+    except BusinessException as e:
+        raise business_exception_handler(e)
+    documents = samples.recent(token.tenant_id, request.sample_size)
+    events = runner.run(specs, documents, http_request.is_disconnected)
+    ndjson = NDJSON_MEDIA_TYPE in http_request.headers.get("accept", "")
+    return StreamingResponse(
+        encode_events(events, ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 연결 종료로 스트리밍이 중단돼도 스트림을 닫아 대기 중인 청크를 취소한다
+        background=BackgroundTask(events.aclose),
+    )
+
+
+@router.get(
+    "/plan/stats",
+    response_model=ValidationPlanStats,
+    summary="검증 실행 계획 통계",
+    description="현재 규칙 집합 버전의 컴파일된 실행 계획과 규칙별 평가 순서, 관측 실패율을 조회합니다."
+)
+async def plan_stats(
+    token: Annotated[TokenPayload, Depends(get_current_token)],
+    service: Annotated[ValidationService, Depends(get_validation_service)]
+) -> ValidationPlanStats:
+    """검증 실행 계획 통계 엔드포인트입니다.
+
+    Args:
+        token (TokenPayload): 현재 사용자 토큰 (테넌트 범위 결정)
+        service (ValidationService): 검증 서비스
+
+    Returns:
+        ValidationPlanStats: 실행 계획 통계
+    """
+    plan = await service.plan(token.tenant_id)
+    return ValidationPlanStats(compiles=service.plans.compiles(token.tenant_id), **plan.stats())
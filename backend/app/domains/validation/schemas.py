@@ -0,0 +1,108 @@
+"""
+검증 도메인 스키마
+
+검증 규칙 API 요청/응답 스키마 (프론트엔드 `use-validation-rules` 형식에 맞춘 camelCase 응답)
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.alias_generators import to_camel
+
+from .models import CompareOperator, FieldType, ValidationType
+
+
+class CamelModel(BaseModel):
+    """camelCase 별칭으로 직렬화하는 기본 스키마입니다."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, from_attributes=True)
+
+
+class ValidationRuleFields(CamelModel):
+    """검증 규칙 공통 필드 스키마입니다."""
+
+    description: Optional[str] = Field(default=None, max_length=500, description="설명")
+    field_name: Optional[str] = Field(default=None, max_length=100, description="대상 추출 필드 이름 (기본: fieldType)")
+    regex: Optional[str] = Field(default=None, max_length=1000, description="정규식 (regex)")
+    threshold: Optional[float] = Field(default=None, description="최솟값 (threshold) 또는 최소 유사도 0~1 (similarity)")
+    compare_field: Optional[str] = Field(default=None, max_length=100, description="비교할 다른 필드 이름 (cross_field)")
+    operator: Optional[CompareOperator] = Field(default=None, description="비교 연산자 (cross_field)")
+    human_review_required: Optional[bool] = Field(default=None, description="휴먼검토 필요 여부 (human_review)")
+
+    @field_validator("regex")
+    @classmethod
+    def validate_regex(cls, v: Optional[str]) -> Optional[str]:
+        """정규식 컴파일 가능 여부 검증입니다."""
+        if v is not None:
+            try:
+                re.compile(v)
+            except re.error as exc:
+                raise ValueError(f"잘못된 정규식입니다: {exc}") from exc
+        return v
+
+
+class ValidationRuleCreate(ValidationRuleFields):
+    """검증 규칙 생성 요청 스키마입니다."""
+
+    name: str = Field(min_length=1, max_length=100, description="규칙 이름")
+    field_type: FieldType = Field(description="대상 필드 타입")
+    validation_type: ValidationType = Field(description="검증 방식")
+    is_active: bool = Field(default=True, description="활성 상태")
+
+
+class ValidationRuleUpdate(ValidationRuleFields):
+    """검증 규칙 수정 요청 스키마입니다 (보낸 필드만 반영)."""
+
+    name: Optional[str] = Field(default=None, min_length=1, max_length=100, description="규칙 이름")
+    field_type: Optional[FieldType] = Field(default=None, description="대상 필드 타입")
+    validation_type: Optional[ValidationType] = Field(default=None, description="검증 방식")
+    is_active: Optional[bool] = Field(default=None, description="활성 상태")
+
+
+class ValidationRuleRead(ValidationRuleFields):
+    """검증 규칙 조회 응답 스키마입니다."""
+
+    id: UUID = Field(description="규칙 고유 ID")
+    name: str = Field(description="규칙 이름")
+    field_type: FieldType = Field(description="대상 필드 타입")
+    validation_type: ValidationType = Field(description="검증 방식")
+    is_active: bool = Field(description="활성 상태")
+    created_at: datetime = Field(description="생성 시간")
+    updated_at: datetime = Field(description="수정 시간")
+
+
+class ValidationTestRequest(CamelModel):
+    """검증 규칙 테스트 요청 스키마입니다."""
+
+    rule_id: UUID = Field(description="테스트할 규칙 ID")
+    test_data: str = Field(max_length=10000, description="규칙 대상 필드에 넣어 볼 값")
+    compare_data: Optional[str] = Field(
+        default=None, max_length=10000, description="비교 값 (similarity는 기대값, cross_field는 비교 필드 값)"
+    )
+
+
+class ValidationTestResult(CamelModel):
+    """검증 규칙 테스트 결과 스키마입니다."""
+
+    passed: bool = Field(description="통과 여부")
+    message: str = Field(description="결과 메시지")
+    details: Dict[str, Any] = Field(default_factory=dict, description="규칙 ID, 입력값, 검증 상태 등 부가 정보")
+
+
+class ValidationDryRunRequest(CamelModel):
+    """검증 규칙 시험 실행 요청 스키마입니다."""
+
+    rules: List[ValidationRuleCreate] = Field(min_length=1, max_length=100, description="저장 전 초안 규칙 집합")
+    sample_size: int = Field(default=500, ge=1, le=10000, description="평가할 최근 파싱 문서 수")
+
+
+class ValidationPlanStats(CamelModel):
+    """컴파일된 실행 계획 통계 스키마입니다."""
+
+    version: int = Field(description="규칙 집합 버전")
+    documents: int = Field(description="이 계획으로 검증한 문서 수")
+    compiles: int = Field(description="이 테넌트의 누적 컴파일 횟수")
+    rules: List[Dict[str, Any]] = Field(description="평가 순서대로의 규칙별 비용과 관측 실패율")
@@ -0,0 +1,488 @@
+"""
+검증 도메인 서비스
+
+검증 규칙 관리, 규칙 집합 버전별 실행 계획 캐시, Validation Worker
+
+규칙을 바꾸면 같은 트랜잭션에서 테넌트 규칙 집합 버전을 올립니다. 검증 시에는 버전 한 행만
+읽어 캐시된 실행 계획과 비교하고, 버전이 바뀐 경우에만 활성 규칙을 읽어 다시 컴파일합니다.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from itertools import groupby
+from typing import Any, Callable, DefaultDict, Dict, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...common.database import db_manager
+from ...common.events import EventBus, Topics, event_bus
+from ...common.exceptions import InvalidValidationRule, ValidationRuleNotFound
+from ..auth.services import BaseRepository
+from .compiler import (
+    STATUS_REVIEW,
+    CompiledPlan,
+    RuleCompileError,
+    RuleSpec,
+    ValidationOutcome,
+    compile_rules,
+)
+from .dedup import NearDuplicateIndex, near_duplicate_index
+from .dryrun import SampleStore, sample_store
+from .models import ValidationRule, ValidationRuleSet, ValidationType
+from .schemas import (
+    ValidationDryRunRequest,
+    ValidationRuleCreate,
+    ValidationRuleRead,
+    ValidationRuleUpdate,
+    ValidationTestRequest,
+    ValidationTestResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PlanCache:
+    """테넌트별 최신 실행 계획을 보관하는 캐시 클래스입니다."""
+
+    def __init__(self):
+        """실행 계획 캐시를 초기화합니다."""
+        self._plans: Dict[str, CompiledPlan] = {}
+        self._compiles: DefaultDict[str, int] = defaultdict(int)
+
+    def get(self, tenant_id: str, version: int) -> Optional[CompiledPlan]:
+        """버전이 같은 실행 계획을 반환합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            version (int): 현재 규칙 집합 버전
+
+        Returns:
+            Optional[CompiledPlan]: 캐시된 실행 계획 (없거나 버전이 다르면 None)
+        """
+        plan = self._plans.get(tenant_id)
+        if plan is None or plan.version != version:
+            return None
+        return plan
+
+    def put(self, tenant_id: str, plan: CompiledPlan) -> None:
+        """실행 계획을 저장합니다 (이전 버전은 교체).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            plan (CompiledPlan): 실행 계획
+        """
+        current = self._plans.get(tenant_id)
+        # 동시에 컴파일한 더 새 버전을 덮어쓰지 않는다
+        if current is None or current.version <= plan.version:
+            self._plans[tenant_id] = plan
+        self._compiles[tenant_id] += 1
+
+    def compiles(self, tenant_id: str) -> int:
+        """테넌트의 누적 컴파일 횟수를 반환합니다."""
+        return self._compiles[tenant_id]
+
+
+# 전역 실행 계획 캐시 인스턴스
+plan_cache = PlanCache()
+
+
+def get_plan_cache() -> PlanCache:
+    """실행 계획 캐시 인스턴스를 반환합니다.
+
+    Returns:
+        PlanCache: 전역 실행 계획 캐시
+    """
+    return plan_cache
+
+
+class ValidationRuleRepository(BaseRepository):
+    """검증 규칙 Repository 클래스입니다."""
+
+    async def get_rules(self, tenant_id: str, active_only: bool = False) -> List[ValidationRule]:
+        """테넌트의 검증 규칙 목록을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            active_only (bool): 활성 규칙만 조회할지 여부
+
+        Returns:
+            List[ValidationRule]: 생성 순 규칙 목록
+        """
+        statement = select(ValidationRule).where(ValidationRule.tenant_id == tenant_id)
+        if active_only:
+            statement = statement.where(ValidationRule.is_active == True)  # noqa: E712
+        result = await self.session.execute(statement.order_by(ValidationRule.created_at))
+        return list(result.scalars().all())
+
+    async def get_rule(self, tenant_id: str, rule_id: UUID) -> Optional[ValidationRule]:
+        """테넌트의 검증 규칙을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            rule_id (UUID): 규칙 ID
+
+        Returns:
+            Optional[ValidationRule]: 조회된 규칙 또는 None (다른 테넌트의 규칙 포함)
+        """
+        result = await self.session.execute(
+            select(ValidationRule).where(
+                ValidationRule.id == rule_id, ValidationRule.tenant_id == tenant_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_version(self, tenant_id: str) -> int:
+        """테넌트 규칙 집합 버전을 조회합니다 (규칙이 없으면 0).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            int: 규칙 집합 버전
+        """
+        result = await self.session.execute(
+            select(ValidationRuleSet.version).where(ValidationRuleSet.tenant_id == tenant_id)
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def bump_version(self, tenant_id: str) -> None:
+        """테넌트 규칙 집합 버전을 올립니다 (커밋은 호출자가 규칙 변경과 함께 수행).
+
+        버전 행이 없으면 세이브포인트 안에서 만들고, 그사이 다른 요청이 먼저 만들었으면
+        (기본 키 충돌) 세이브포인트만 되돌리고 UPDATE를 다시 실행합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+        """
+        bump = (
+            update(ValidationRuleSet)
+            .where(ValidationRuleSet.tenant_id == tenant_id)
+            .values(version=ValidationRuleSet.version + 1, updated_at=datetime.utcnow())
+        )
+        if (await self.session.execute(bump)).rowcount:
+            return
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(
+                    insert(ValidationRuleSet).values(tenant_id=tenant_id, version=1, updated_at=datetime.utcnow())
+                )
+        except IntegrityError:
+            await self.session.execute(bump)
+
+
+def check_compiles(rule: ValidationRule) -> None:
+    """규칙이 실행 계획으로 컴파일되는지 확인합니다.
+
+    Args:
+        rule (ValidationRule): 검증 규칙
+
+    Raises:
+        InvalidValidationRule: 필수 값이 없거나 정규식이 잘못된 경우
+    """
+    try:
+        compile_rules([RuleSpec.from_model(rule)])
+    except RuleCompileError as exc:
+        raise InvalidValidationRule(str(exc)) from exc
+
+
+def draft_specs(request: ValidationDryRunRequest) -> List[RuleSpec]:
+    """시험 실행할 초안 규칙을 스냅샷으로 바꾸고 컴파일되는지 확인합니다.
+
+    Args:
+        request (ValidationDryRunRequest): 시험 실행 요청
+
+    Returns:
+        List[RuleSpec]: 요청 순서대로 `draft-1`부터 번호를 붙인 활성 규칙 스냅샷
+
+    Raises:
+        InvalidValidationRule: 필수 값이 없거나 정규식이 잘못된 규칙이 있는 경우
+    """
+    specs = [
+        replace(RuleSpec.from_model(ValidationRule(**rule.model_dump(exclude_none=True))), rule_id=f"draft-{i}")
+        for i, rule in enumerate(request.rules, start=1)
+        if rule.is_active
+    ]
+    try:
+        compile_rules(specs)
+    except RuleCompileError as exc:
+        raise InvalidValidationRule(str(exc)) from exc
+    return specs
+
+
+class ValidationService:
+    """검증 규칙 관리와 문서 검증 서비스 클래스입니다."""
+
+    def __init__(self, session: AsyncSession, plans: Optional[PlanCache] = None):
+        """ValidationService를 초기화합니다.
+
+        Args:
+            session (AsyncSession): 데이터베이스 세션
+            plans (Optional[PlanCache]): 실행 계획 캐시
+        """
+        self.session = session
+        self.rule_repo = ValidationRuleRepository(session)
+        self.plans = plans or plan_cache
+
+    async def list_rules(self, tenant_id: str) -> List[ValidationRuleRead]:
+        """테넌트의 검증 규칙 목록을 조회합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            List[ValidationRuleRead]: 규칙 목록
+        """
+        rules = await self.rule_repo.get_rules(tenant_id)
+        return [ValidationRuleRead.model_validate(rule) for rule in rules]
+
+    async def create_rule(self, tenant_id: str, data: ValidationRuleCreate) -> ValidationRuleRead:
+        """검증 규칙을 생성하고 규칙 집합 버전을 올립니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            data (ValidationRuleCreate): 규칙 생성 데이터
+
+        Returns:
+            ValidationRuleRead: 생성된 규칙
+
+        Raises:
+            InvalidValidationRule: 규칙을 컴파일할 수 없는 경우
+        """
+        values = data.model_dump(exclude_none=True)
+        rule = ValidationRule(tenant_id=tenant_id, **values)
+        check_compiles(rule)
+        self.session.add(rule)
+        await self.rule_repo.bump_version(tenant_id)
+        await self.session.commit()
+        await self.session.refresh(rule)
+        return ValidationRuleRead.model_validate(rule)
+
+    async def update_rule(
+        self, tenant_id: str, rule_id: UUID, data: ValidationRuleUpdate
+    ) -> ValidationRuleRead:
+        """검증 규칙을 수정하고 규칙 집합 버전을 올립니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            rule_id (UUID): 규칙 ID
+            data (ValidationRuleUpdate): 수정할 필드
+
+        Returns:
+            ValidationRuleRead: 수정된 규칙
+
+        Raises:
+            ValidationRuleNotFound: 규칙이 없는 경우
+            InvalidValidationRule: 수정한 규칙을 컴파일할 수 없는 경우
+        """
+        rule = await self.rule_repo.get_rule(tenant_id, rule_id)
+        if rule is None:
+            raise ValidationRuleNotFound(str(rule_id))
+        for name, value in data.model_dump(exclude_unset=True).items():
+            setattr(rule, name, value)
+        rule.updated_at = datetime.utcnow()
+        try:
+            check_compiles(rule)
+        except InvalidValidationRule:
+            await self.session.rollback()
+            raise
+        await self.rule_repo.bump_version(tenant_id)
+        await self.session.commit()
+        await self.session.refresh(rule)
+        return ValidationRuleRead.model_validate(rule)
+
+    async def delete_rule(self, tenant_id: str, rule_id: UUID) -> None:
+        """검증 규칙을 삭제하고 규칙 집합 버전을 올립니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            rule_id (UUID): 규칙 ID
+
+        Raises:
+            ValidationRuleNotFound: 규칙이 없는 경우
+        """
+        rule = await self.rule_repo.get_rule(tenant_id, rule_id)
+        if rule is None:
+            raise ValidationRuleNotFound(str(rule_id))
+        await self.session.delete(rule)
+        await self.rule_repo.bump_version(tenant_id)
+        await self.session.commit()
+
+    async def plan(self, tenant_id: str) -> CompiledPlan:
+        """테넌트의 현재 규칙 집합 실행 계획을 반환합니다 (버전이 바뀐 경우에만 재컴파일).
+
+        Args:
+            tenant_id (str): 테넌트 ID
+
+        Returns:
+            CompiledPlan: 실행 계획
+        """
+        version = await self.rule_repo.get_version(tenant_id)
+        plan = self.plans.get(tenant_id, version)
+        if plan is not None:
+            return plan
+        rules = await self.rule_repo.get_rules(tenant_id, active_only=True)
+        specs = []
+        for rule in rules:
+            try:
+                check_compiles(rule)
+            except InvalidValidationRule as exc:
+                # 저장 시 검사를 통과했으므로 정상적으로는 일어나지 않는다
+                logger.warning("검증 규칙 제외: tenant=%s rule=%s (%s)", tenant_id, rule.id, exc.message)
+                continue
+            specs.append(RuleSpec.from_model(rule))
+        plan = compile_rules(specs, version)
+        self.plans.put(tenant_id, plan)
+        logger.info("검증 규칙 컴파일: tenant=%s version=%d rules=%d", tenant_id, version, len(specs))
+        return plan
+
+    async def validate(
+        self,
+        tenant_id: str,
+        rows: Sequence[Mapping[str, Any]],
+        expected: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+    ) -> List[ValidationOutcome]:
+        """문서 배치를 테넌트 규칙 집합으로 검증합니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            rows (Sequence[Mapping[str, Any]]): 문서별 추출 필드
+            expected (Optional[Sequence[Optional[Mapping[str, Any]]]]): 문서별 기대 필드
+
+        Returns:
+            List[ValidationOutcome]: 문서별 검증 결과
+        """
+        plan = await self.plan(tenant_id)
+        return plan.evaluate(rows, expected)
+
+    async def test_rule(self, tenant_id: str, request: ValidationTestRequest) -> ValidationTestResult:
+        """저장된 규칙 하나를 입력값에 적용해 봅니다.
+
+        Args:
+            tenant_id (str): 테넌트 ID
+            request (ValidationTestRequest): 규칙 ID와 입력값
+
+        Returns:
+            ValidationTestResult: 통과 여부와 메시지
+
+        Raises:
+            ValidationRuleNotFound: 규칙이 없는 경우
+        """
+        rule = await self.rule_repo.get_rule(tenant_id, request.rule_id)
+        if rule is None:
+            raise ValidationRuleNotFound(str(request.rule_id))
+        spec = RuleSpec.from_model(rule)
+        row = {spec.target: request.test_data}
+        if spec.compare_field:
+            row[spec.compare_field] = request.compare_data
+        expected = {spec.target: request.compare_data}
+        try:
+            plan = compile_rules([spec])
+        except RuleCompileError as exc:
+            return ValidationTestResult(passed=False, message=str(exc), details={"ruleId": spec.rule_id})
+        outcome = plan.evaluate([row], [expected], short_circuit=False)[0]
+
+        if spec.validation_type == ValidationType.HUMAN_REVIEW:
+            passed = outcome.status == STATUS_REVIEW
+            message = "휴먼검토 대상" if passed else "휴먼검토 불필요"
+        else:
+            passed = not outcome.errors
+            message = "검증 통과" if passed else outcome.errors[0]["message"]
+        return ValidationTestResult(
+            passed=passed,
+            message=message,
+            details={
+                "ruleId": spec.rule_id,
+                "field": spec.target,
+                "testData": request.test_data,
+                "status": outcome.status,
+                "errors": outcome.errors,
+            },
+        )
+
+
+class ValidationWorker:
+    """파싱된 문서의 추출 필드를 검증하는 워커 클래스입니다."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        plans: Optional[PlanCache] = None,
+        bus: Optional[EventBus] = None,
+        duplicates: Optional[NearDuplicateIndex] = None,
+        samples: Optional[SampleStore] = None,
+    ):
+        """검증 워커를 초기화합니다.
+
+        Args:
+            session_factory (Optional[Callable[[], Any]]): 비동기 세션 컨텍스트를 만드는 팩토리
+            plans (Optional[PlanCache]): 실행 계획 캐시
+            bus (Optional[EventBus]): 결과 이벤트를 발행할 이벤트 버스
+            duplicates (Optional[NearDuplicateIndex]): 유사 중복 색인
+            samples (Optional[SampleStore]): 시험 실행 표본 저장소
+        """
+        self.session_factory = session_factory or db_manager.SessionLocal
+        self.plans = plans or plan_cache
+        self.bus = bus or event_bus
+        self.duplicates = duplicates or near_duplicate_index
+        self.samples = samples or sample_store
+
+    async def handle_parsed(self, event: Dict[str, Any]) -> None:
+        """`documents.parsed` 이벤트 하나를 처리합니다.
+
+        Args:
+            event (Dict[str, Any]): `tenant_id`, `doc_id`, `pages`([{page, text}]), `extracted_fields`,
+                `expected_fields`(선택)를 포함한 이벤트
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Dict[str, Any]]) -> None:
+        """`documents.parsed` 이벤트 배치를 테넌트별 열 단위로 검증하고 `documents.validated`를 발행합니다.
+
+        본문은 유사 중복 색인으로 기존 문서와 비교한 뒤 색인에 추가하고, 추출/기대 필드는 규칙
+        시험 실행 표본으로 보관합니다.
+
+        Args:
+            events (Sequence[Dict[str, Any]]): 파싱 이벤트 목록 (Kafka poll 한 번 분량)
+        """
+        ordered = sorted(events, key=lambda event: event["tenant_id"])
+        async with self.session_factory() as session:
+            service = ValidationService(session, self.plans)
+            for tenant_id, group in groupby(ordered, key=lambda event: event["tenant_id"]):
+                batch = list(group)
+                self.samples.record(tenant_id, batch)
+                plan = await service.plan(tenant_id)
+                outcomes = plan.evaluate(
+                    [event.get("extracted_fields") or {} for event in batch],
+                    [event.get("expected_fields") for event in batch],
+                )
+                for event, outcome in zip(batch, outcomes):
+                    text = "\n".join(page.get("text", "") for page in event.get("pages", ()))
+                    duplicate = await self.duplicates.check(tenant_id, event["doc_id"], text)
+                    await self.bus.publish(
+                        Topics.DOCUMENTS_VALIDATED,
+                        {
+                            "tenant_id": tenant_id,
+                            "doc_id": event["doc_id"],
+                            "validated_data": event.get("extracted_fields") or {},
+                            "status": outcome.status,
+                            "errors": outcome.errors,
+                            "review_rules": outcome.review_rules,
+                            "duplicate": duplicate is not None,
+                            "duplicate_of": (
+                                {"doc_id": duplicate.doc_id, "similarity": duplicate.similarity}
+                                if duplicate is not None else None
+                            ),
+                            "rules_version": plan.version,
+                        },
+                        key=event["doc_id"],
+                    )
+                logger.info("문서 검증 완료: tenant=%s docs=%d version=%d", tenant_id, len(batch), plan.version)
+
+
+# 전역 검증 워커 인스턴스
+validation_worker = ValidationWorker()
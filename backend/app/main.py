@@ -5,15 +5,46 @@ FastAPI 애플리케이션 설정 및 라우터 등록
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
 
 from .common.config import settings
 from .common.database import init_db, close_db
+from .common.events import Topics, event_bus
 from .common.exceptions import BusinessException, business_exception_handler
+from .common.outbox import outbox_relay
 from .domains.auth.router import router as auth_router
+from .domains.billing.metering import usage_meter
+from .domains.billing.quotas import quota_enforcer
+from .domains.billing.router import metered_request, router as billing_router
+from .domains.documents.previews import preview_service
+from .domains.documents.router import router as documents_router
+from .domains.documents.services import pipeline_status_handler
+from .domains.documents.statistics import statistics_recorder
+from .domains.embedding.services import embedding_service
+from .domains.embedding.worker import indexing_worker
+from .domains.exports.router import router as exports_router
+from .domains.exports.services import export_service
+from .domains.monitoring.router import router as monitoring_router
+from .domains.pipeline.router import router as pipeline_router
+from .domains.pipeline.scheduler import INDEX_STAGE_KIND, VALIDATE_STAGE_KIND, pipeline_scheduler
+from .domains.pipeline.services import reprocess_runner
+from .domains.rag.cache import answer_cache
+from .domains.rag.citations import deep_verifier, shingle_index
+from .domains.rag.generation import answer_generator
+from .domains.rag.history import search_history
+from .domains.rag.router import router as rag_router
+from .domains.rag.suggestions import suggestion_index
+from .domains.rag.trends import trend_tracker
+from .domains.search.acl import permission_index
+from .domains.search.rerank import reranker
+from .domains.search.services import keyword_index, vector_index
+from .domains.validation.dedup import near_duplicate_index
+from .domains.validation.dryrun import dry_runner
+from .domains.validation.router import router as validation_router
+from .domains.validation.services import validation_worker
 
 
 # 로깅 설정
@@ -31,11 +62,67 @@ async def lifespan(app: FastAPI):
     logger.info("RagBridge Backend 시작 중...")
     await init_db()
     logger.info("데이터베이스 초기화 완료")
+    await embedding_service.start()
+    event_bus.subscribe(Topics.ML_MODELS_REGISTERED, embedding_service.on_model_registered)
+    await reranker.start()
+    await answer_generator.start()
+    await deep_verifier.start()
+    await vector_index.start()
+    await keyword_index.start()
+    await permission_index.start()
+    await near_duplicate_index.start()
+    await reprocess_runner.start()
+    await outbox_relay.start()
+    await statistics_recorder.start()
+    await preview_service.start()
+    await search_history.start()
+    await export_service.start()
+    await trend_tracker.start()
+    await usage_meter.start()
+    await quota_enforcer.start()
+    event_bus.subscribe(Topics.BILLING_USAGE, quota_enforcer.on_billing_usage)
+    event_bus.subscribe(Topics.DOCUMENTS_UPLOADED, pipeline_status_handler.on_documents_uploaded)
+    event_bus.subscribe(Topics.DOCUMENTS_UPLOADED, usage_meter.on_documents_uploaded)
+    event_bus.subscribe(Topics.DOCUMENTS_PARSED, usage_meter.on_documents_parsed)
+    # 색인/검증은 공정 큐를 거쳐 실행해 대량 재처리 문서가 업로드 문서 앞에 줄 서지 않게 한다
+    event_bus.subscribe(
+        Topics.DOCUMENTS_PARSED, pipeline_scheduler.stage(INDEX_STAGE_KIND, indexing_worker.handle_parsed)
+    )
+    event_bus.subscribe(
+        Topics.DOCUMENTS_PARSED, pipeline_scheduler.stage(VALIDATE_STAGE_KIND, validation_worker.handle_parsed)
+    )
+    event_bus.subscribe(Topics.DOCUMENTS_PARSED, preview_service.on_documents_parsed)
+    event_bus.subscribe(Topics.DOCUMENTS_INDEXED, keyword_index.on_documents_indexed)
+    event_bus.subscribe(Topics.DOCUMENTS_INDEXED, shingle_index.on_documents_indexed)
+    event_bus.subscribe(Topics.DOCUMENTS_INDEXED, suggestion_index.on_documents_indexed)
+    event_bus.subscribe(Topics.DOCUMENTS_INDEXED, usage_meter.on_documents_indexed)
+    event_bus.subscribe(Topics.DOCUMENTS_VALIDATED, pipeline_status_handler.on_documents_validated)
+    event_bus.subscribe(Topics.DOCUMENTS_VALIDATED, suggestion_index.on_documents_validated)
+    event_bus.subscribe(Topics.INDEX_META, permission_index.on_index_meta)
+    event_bus.subscribe(Topics.INDEX_META, answer_cache.on_index_meta)
     
     yield
     
     # 종료 시 실행
     logger.info("RagBridge Backend 종료 중...")
+    await reprocess_runner.stop()
+    await quota_enforcer.stop()
+    await usage_meter.stop()
+    await outbox_relay.stop()
+    await statistics_recorder.stop()
+    await preview_service.stop()
+    await search_history.stop()
+    await trend_tracker.stop()
+    await export_service.stop()
+    await keyword_index.stop()
+    await permission_index.stop()
+    await vector_index.stop()
+    await near_duplicate_index.stop()
+    await dry_runner.stop()
+    await reranker.stop()
+    await answer_generator.stop()
+    await deep_verifier.stop()
+    await embedding_service.stop()
     await close_db()
     logger.info("데이터베이스 연결 종료 완료")
 
@@ -81,8 +168,16 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# 라우터 등록
+# 라우터 등록 (테넌트 API는 인증된 요청 수를 계량, 인증 API 제외)
+metered = [Depends(metered_request)]
 app.include_router(auth_router)
+app.include_router(documents_router, dependencies=metered)
+app.include_router(rag_router, dependencies=metered)
+app.include_router(validation_router, dependencies=metered)
+app.include_router(pipeline_router, dependencies=metered)
+app.include_router(exports_router, dependencies=metered)
+app.include_router(monitoring_router, dependencies=metered)
+app.include_router(billing_router, dependencies=metered)
 
 
 @app.get("/", tags=["헬스체크"])
@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 스크립트
+
+`python -m benchmarks.<이름>` 형태로 backend 디렉터리에서 실행합니다.
+"""
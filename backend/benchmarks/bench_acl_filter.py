@@ -0,0 +1,152 @@
+"""
+권한 필터 벤치마크
+
+허용 문서 비율(selectivity)별로 권한 비트맵 사전 필터와 사후 필터링을 비교합니다.
+
+- 사전 필터: 권한 비트맵을 문서 서수 마스크로 바꿔 벡터/BM25 스캔 중에 적용
+- 사후 필터: 필터 없이 k'개를 검색한 뒤 허용 문서만 남기고, k개가 안 되면 k'를 두 배로 늘려 재검색
+
+사용법:
+    python -m benchmarks.bench_acl_filter --rows 100000 --dim 384 --queries 100
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from typing import Callable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.domains.search.acl import PermissionIndex
+from app.domains.search.keyword_index import KeywordCollection
+from app.domains.search.vector_index import VectorCollection
+
+from .bench_vector_quantization import clustered_vectors
+from .common import percentile, synthetic_sentence
+
+
+def post_filter(search: Callable[[int], list], allowed: Set[str], k: int, limit: int) -> Tuple[list, int]:
+    """허용 문서 결과가 k개가 될 때까지 k'를 두 배씩 늘려 검색합니다."""
+    depth = k
+    while True:
+        hits = [hit for hit in search(depth) if hit.doc_id in allowed]
+        if len(hits) >= k or depth >= limit:
+            return hits[:k], depth
+        depth = min(limit, depth * 2)
+
+
+def measure(run: Callable[[int], Tuple[list, int]], queries: int) -> Tuple[List[float], List[list], List[int]]:
+    """질의별 지연(ms), 결과, 검색 깊이를 기록합니다."""
+    latencies, results, depths = [], [], []
+    for i in range(queries):
+        started = time.perf_counter()
+        hits, depth = run(i)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append(hits)
+        depths.append(depth)
+    return latencies, results, depths
+
+
+def report(name: str, selectivity: float, mode: str, latencies: Sequence[float],
+           recalls: Sequence[float], depths: Sequence[int]) -> None:
+    print(
+        f"{name:>7} {selectivity:>6.0%} {mode:>5} {percentile(list(latencies), 50):>8.2f} "
+        f"{percentile(list(latencies), 95):>8.2f} {np.mean(recalls):>7.3f} {np.mean(depths):>9.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--chunks-per-doc", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--selectivities", default="0.01,0.1,1.0")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    docs = args.rows // args.chunks_per_doc
+    doc_ids = [f"doc-{d}" for d in range(docs)]
+    vectors = clustered_vectors(args.rows, args.dim, clusters=max(16, args.rows // 500), seed=args.seed)
+    queries = vectors[rng.choice(args.rows, args.queries)]
+
+    text_rng = random.Random(args.seed)
+    keywords = KeywordCollection()
+    for d, doc_id in enumerate(doc_ids):
+        keywords.index_document(doc_id, [
+            {"chunk_id": f"{doc_id}:{i}", "text": synthetic_sentence(text_rng), "page": 1}
+            for i in range(args.chunks_per_doc)
+        ])
+    text_queries = [" ".join(synthetic_sentence(text_rng).split()[:3]) for _ in range(args.queries)]
+
+    print(f"rows={args.rows} docs={docs} dim={args.dim} k={args.k} nprobe={args.nprobe}")
+    print(f"{'index':>7} {'allow':>6} {'mode':>5} {'p50 ms':>8} {'p95 ms':>8} {'recall':>7} {'depth':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        collection = VectorCollection(directory, args.dim, memtable_rows=args.rows + 1)
+        for d, doc_id in enumerate(doc_ids):
+            rows = slice(d * args.chunks_per_doc, (d + 1) * args.chunks_per_doc)
+            collection.upsert(doc_id, [f"{doc_id}:{i}" for i in range(args.chunks_per_doc)], vectors[rows])
+        collection.flush()
+
+        for selectivity in (float(s) for s in args.selectivities.split(",")):
+            permissions = PermissionIndex()
+            granted = rng.random(docs) < selectivity
+            for doc_id, grant in zip(doc_ids, granted):
+                permissions.on_index_meta({
+                    "tenant_id": "bench",
+                    "doc_id": doc_id,
+                    "users": ["user"] if grant else ["someone-else"],
+                })
+            allowed = {doc_id for doc_id, grant in zip(doc_ids, granted) if grant}
+            allowed_rows = np.repeat(granted, args.chunks_per_doc)
+            access = permissions.access_filter("bench", "user")
+
+            # 정답: 허용 행만으로 계산한 정확한 상위 k개
+            truth = []
+            for query in queries:
+                scores = np.where(allowed_rows, vectors @ query, -np.inf)
+                top = np.argsort(-scores)[:args.k]
+                truth.append({f"doc-{r // args.chunks_per_doc}:{r % args.chunks_per_doc}" for r in top})
+
+            def vector_pre(i: int) -> Tuple[list, int]:
+                return collection.search(queries[i], args.k, args.nprobe, access.mask_for(collection)), args.k
+
+            def vector_post(i: int) -> Tuple[list, int]:
+                return post_filter(
+                    lambda depth: collection.search(queries[i], depth, args.nprobe), allowed, args.k, args.rows
+                )
+
+            for mode, run in (("pre", vector_pre), ("post", vector_post)):
+                latencies, results, depths = measure(run, args.queries)
+                recalls = [
+                    len(expected & {hit.chunk_id for hit in hits}) / args.k
+                    for expected, hits in zip(truth, results)
+                ]
+                report("vector", selectivity, mode, latencies, recalls, depths)
+
+            def keyword_pre(i: int) -> Tuple[list, int]:
+                return keywords.search(text_queries[i], args.k, access.mask_for(keywords)), args.k
+
+            def keyword_post(i: int) -> Tuple[list, int]:
+                return post_filter(
+                    lambda depth: keywords.search(text_queries[i], depth), allowed, args.k, args.rows
+                )
+
+            pre_latencies, pre_results, pre_depths = measure(keyword_pre, args.queries)
+            post_latencies, post_results, post_depths = measure(keyword_post, args.queries)
+            # BM25는 정확 검색이므로 사전 필터 결과를 기준으로 사후 필터의 재현율을 잰다
+            expected = [{hit.chunk_id for hit in hits} for hits in pre_results]
+            recalls = [
+                len(e & {hit.chunk_id for hit in hits}) / max(1, len(e))
+                for e, hits in zip(expected, post_results)
+            ]
+            report("bm25", selectivity, "pre", pre_latencies, [1.0] * args.queries, pre_depths)
+            report("bm25", selectivity, "post", post_latencies, recalls, post_depths)
+
+
+if __name__ == "__main__":
+    main()
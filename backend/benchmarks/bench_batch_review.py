@@ -0,0 +1,92 @@
+"""
+문서 일괄 검토 벤치마크
+
+검토 대기 문서를 배치 크기별로 승인할 때의 지연 시간을 비교합니다 (SQLite 파일 DB).
+
+- per-row: `BaseRepository` 방식 (행마다 조회 → 변경 → 커밋 → refresh)
+- set-based: `DocumentService.batch_review` (UPDATE ... RETURNING 한 번 + 아웃박스 한 행)
+
+사용법:
+    python -m benchmarks.bench_batch_review --docs 20000 --sizes 10,100,1000,5000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.common.outbox import OutboxRelay
+from app.domains.auth.services import BaseRepository
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.documents.services import DocumentService
+
+TENANT = "bench-tenant"
+
+
+async def seed(session_factory, count: int) -> List[str]:
+    """검토 대기 문서를 만들고 ID 문자열 목록을 반환합니다."""
+    documents = [Document(tenant_id=TENANT, name=f"doc-{i}.pdf", status=DocumentStatus.PENDING_REVIEW)
+                 for i in range(count)]
+    async with session_factory() as session:
+        session.add_all(documents)
+        await session.commit()
+    return [str(document.id) for document in documents]
+
+
+async def per_row(session_factory, ids: List[str]) -> None:
+    """행마다 읽고 바꾸고 커밋하는 기준 구현."""
+    async with session_factory() as session:
+        repo = BaseRepository(session)
+        for raw in ids:
+            document = await repo.get_by_id(Document, UUID(raw))
+            if document is not None and document.tenant_id == TENANT:
+                document.status = DocumentStatus.APPROVED
+                await repo.update(document)
+
+
+async def set_based(session_factory, relay: OutboxRelay, ids: List[str]) -> None:
+    async with session_factory() as session:
+        await DocumentService(session, relay).batch_review(TENANT, "bench", ids, DocumentStatus.APPROVED)
+
+
+async def run(args: argparse.Namespace) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-review-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    relay = OutboxRelay(session_factory)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    ids = await seed(session_factory, max(args.docs, 2 * sum(sizes)))
+
+    print(f"docs={len(ids)} db=sqlite")
+    print(f"{'batch':>6} {'per-row ms':>11} {'set-based ms':>13} {'speedup':>8}")
+    offset = 0
+    for size in sizes:
+        row_ids, set_ids = ids[offset:offset + size], ids[offset + size:offset + 2 * size]
+        offset += 2 * size
+        started = time.perf_counter()
+        await per_row(session_factory, row_ids)
+        row_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        await set_based(session_factory, relay, set_ids)
+        set_ms = (time.perf_counter() - started) * 1000
+        print(f"{size:>6} {row_ms:>11.1f} {set_ms:>13.1f} {row_ms / set_ms:>7.1f}x")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--sizes", default="10,100,1000,5000")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+스트리밍 청커 벤치마크
+
+대용량 합성 코퍼스를 제너레이터로 흘려보내며 처리량(MB/s)과 최대 RSS를 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_chunker --size-mb 200 --max-tokens 256 --overlap 32
+"""
+
+import argparse
+import random
+from itertools import islice
+from typing import Iterator
+
+from app.domains.embedding.chunker import PageText, StreamingChunker
+
+from .common import peak_rss_mb, synthetic_page, timer
+
+
+def generate_pages(total_bytes: int, seed: int) -> Iterator[PageText]:
+    """총 `total_bytes`(UTF-8 기준)에 도달할 때까지 페이지를 생성합니다."""
+    rng = random.Random(seed)
+    produced = 0
+    page = 1
+    while produced < total_bytes:
+        text = synthetic_page(rng)
+        produced += len(text.encode("utf-8"))
+        yield PageText(page=page, text=text)
+        page += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=100, help="코퍼스 크기(MB)")
+    parser.add_argument("--max-tokens", type=int, default=256)
+    parser.add_argument("--overlap", type=int, default=32)
+    parser.add_argument("--pages-per-doc", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    chunker = StreamingChunker(args.max_tokens, args.overlap)
+    total_bytes = args.size_mb * 1024 * 1024
+    baseline_rss = peak_rss_mb()
+
+    chunks = 0
+    tokens = 0
+    bytes_seen = 0
+
+    def pages() -> Iterator[PageText]:
+        nonlocal bytes_seen
+        for page in generate_pages(total_bytes, args.seed):
+            bytes_seen += len(page.text.encode("utf-8"))
+            yield page
+
+    # 생성 비용을 제외하기 위해 동일 코퍼스를 한 번 소비하는 기준 시간을 잰다
+    with timer() as gen_time:
+        for _ in generate_pages(total_bytes, args.seed):
+            pass
+
+    with timer() as run_time:
+        doc_pages = pages()
+        doc_index = 0
+        while True:
+            batch = list(islice(doc_pages, args.pages_per_doc))
+            if not batch:
+                break
+            for chunk in chunker.chunk(f"doc-{doc_index}", iter(batch)):
+                chunks += 1
+                tokens += chunk.token_count
+                _ = chunk.text
+            doc_index += 1
+
+    elapsed = max(run_time["elapsed"] - gen_time["elapsed"], 1e-9)
+    mb = bytes_seen / (1024 * 1024)
+    print(f"corpus        : {mb:.1f} MB, {doc_index} docs")
+    print(f"chunks        : {chunks} ({tokens} tokens incl. overlap)")
+    print(f"elapsed       : {elapsed:.2f} s (excluding corpus generation)")
+    print(f"throughput    : {mb / elapsed:.1f} MB/s")
+    print(f"peak RSS      : {peak_rss_mb():.1f} MB (baseline {baseline_rss:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
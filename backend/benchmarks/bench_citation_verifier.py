@@ -0,0 +1,76 @@
+"""
+근거 검증 벤치마크
+
+동기 싱글 검사의 인용 1건당 지연을 청크 싱글 사전 계산 여부별로 측정합니다.
+
+- 사전 계산: `documents.indexed` 시점에 청크 싱글을 계산해 두고 주장 싱글만 계산
+- 즉석 계산: 검증할 때마다 청크 싱글도 계산
+
+사용법:
+    python -m benchmarks.bench_citation_verifier --chunks 2000 --answers 500 --chunk-chars 1000
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from app.domains.rag.citations import CitationVerifier, DeepVerifier, ShingleIndex
+from app.domains.search.keyword_index import Passage
+from app.domains.search.services import RetrievedChunk
+
+from .common import percentile, synthetic_page, synthetic_sentence
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--answers", type=int, default=500)
+    parser.add_argument("--chunk-chars", type=int, default=1000)
+    parser.add_argument("--citations", type=int, default=3, help="답변당 인용 수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = [synthetic_page(rng, args.chunk_chars) for _ in range(args.chunks)]
+    chunks = [
+        RetrievedChunk(f"c{i}", f"doc-{i}", 1.0, passage=Passage(f"c{i}", f"doc-{i}", None, 1, text))
+        for i, text in enumerate(texts)
+    ]
+    answers = []
+    for _ in range(args.answers):
+        picked = rng.sample(range(args.chunks), args.citations)
+        sentences = []
+        for marker, index in enumerate(picked, start=1):
+            # 절반은 근거 문장을 그대로, 절반은 무관한 문장을 인용
+            words = texts[index].split(". ")[0] if rng.random() < 0.5 else synthetic_sentence(rng)
+            sentences.append(f"{words.rstrip('.')}. [{marker}]")
+        answers.append((" ".join(sentences), [chunks[i] for i in picked]))
+
+    deep = DeepVerifier(lambda: None)
+    print(f"chunks={args.chunks} answers={args.answers} chunk_chars={args.chunk_chars} citations={args.citations}")
+    print(f"{'mode':>12} {'p50 us/cit':>11} {'p95 us/cit':>11} {'p99 us/cit':>11} {'index MB':>9}")
+    for mode in ("precomputed", "on-demand"):
+        index = ShingleIndex(max_entries=args.chunks if mode == "precomputed" else 1)
+        if mode == "precomputed":
+            started = time.perf_counter()
+            index.on_documents_indexed({
+                "tenant_id": "bench",
+                "chunks": [{"chunk_id": c.chunk_id, "text": c.passage.text} for c in chunks],
+            })
+            build = time.perf_counter() - started
+        verifier = CitationVerifier(index, deep)
+        per_citation: List[float] = []
+        for answer, cited in answers:
+            started = time.perf_counter()
+            verifier.verify("bench", answer, cited)
+            per_citation.append((time.perf_counter() - started) * 1e6 / args.citations)
+        print(
+            f"{mode:>12} {percentile(per_citation, 50):>11.1f} {percentile(per_citation, 95):>11.1f} "
+            f"{percentile(per_citation, 99):>11.1f} {index.stats()['nbytes'] / 1e6:>9.1f}"
+        )
+    print(f"precompute build: {build * 1e6 / args.chunks:.1f} us/chunk")
+
+
+if __name__ == "__main__":
+    main()
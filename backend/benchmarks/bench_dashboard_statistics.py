@@ -0,0 +1,110 @@
+"""
+대시보드 통계 조회 벤치마크
+
+테넌트 하나의 상태별 문서 수를 `COUNT(*) ... GROUP BY status`로 계산할 때와
+증분 유지되는 `tenant_statistics` 행을 기본 키로 읽을 때의 지연 시간을 비교합니다 (SQLite 파일 DB).
+증분 기록 비용(전이 N건 → 테넌트당 UPDATE 한 번)도 함께 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_dashboard_statistics --docs 200000 --tenants 20 --reads 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.documents.statistics import StatisticsRecorder
+
+from .common import percentile
+
+
+async def seed(engine, docs: int, tenants: int) -> None:
+    """테넌트별로 상태가 섞인 문서를 만듭니다 (첫 테넌트가 절반을 차지)."""
+    rng = random.Random(7)
+    statuses = list(DocumentStatus)
+    rows = []
+    for i in range(docs):
+        tenant = "tenant-0" if i % 2 == 0 else f"tenant-{rng.randrange(1, tenants)}"
+        rows.append({
+            "id": os.urandom(16).hex(), "tenant_id": tenant, "name": f"doc-{i}.pdf", "file_type": "pdf",
+            "size": rng.randrange(10_000, 5_000_000), "status": rng.choice(statuses).name,
+            "extracted_fields": {}, "validation_errors": [],
+        })
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), 10_000):
+            await conn.execute(insert(Document.__table__), rows[start:start + 10_000])
+
+
+async def timed(reads: int, call) -> list:
+    samples = []
+    for _ in range(reads):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def run(args: argparse.Namespace) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-stats-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    recorder = StatisticsRecorder(session_factory)
+
+    started = time.perf_counter()
+    await seed(engine, args.docs, args.tenants)
+    print(f"docs={args.docs} tenants={args.tenants} seed={time.perf_counter() - started:.1f}s")
+    started = time.perf_counter()
+    await recorder.reconcile()
+    print(f"reconcile (전체 GROUP BY + 덮어쓰기): {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    async with session_factory() as session:
+        async def group_by() -> None:
+            result = await session.execute(
+                select(Document.status, func.count()).where(Document.tenant_id == "tenant-0").group_by(Document.status)
+            )
+            result.all()
+
+        async def primary_key() -> None:
+            await recorder.snapshot(session, "tenant-0")
+
+        for name, call in (("GROUP BY", group_by), ("PK read", primary_key)):
+            samples = await timed(args.reads, call)
+            print(f"{name:>9}: p50={percentile(samples, 50):8.3f} ms  p95={percentile(samples, 95):8.3f} ms")
+
+    started = time.perf_counter()
+    transitions = [
+        SimpleNamespace(previous_status=DocumentStatus.PENDING_REVIEW, previous_status_changed_at=None, size=1000)
+    ] * args.transitions
+    for tenant in range(args.tenants):
+        recorder.record_transitions(f"tenant-{tenant}", transitions, DocumentStatus.APPROVED, datetime.utcnow())
+    record_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    written = await recorder.flush()
+    print(f"record {args.transitions * args.tenants} transitions: {record_ms:.1f} ms, "
+          f"flush {written} tenants: {(time.perf_counter() - started) * 1000:.1f} ms")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--transitions", type=int, default=1000, help="테넌트당 기록할 전이 수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
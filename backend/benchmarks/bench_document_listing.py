@@ -0,0 +1,139 @@
+"""
+문서 목록 페이지네이션 벤치마크
+
+처리 완료 목록의 1페이지와 N페이지(기본 10,000)를 두 방식으로 조회해 지연 시간을 비교합니다 (SQLite 파일 DB).
+
+- OFFSET: 전체 모델(JSON 컬럼 포함)을 `ORDER BY status_changed_at DESC OFFSET ? LIMIT ?`로 읽고
+  전체 수를 `COUNT(*)`로 계산
+- 커서: 목록 컬럼만 `(tenant_id, status, status_changed_at, id)` 인덱스 범위에서 읽고
+  전체 수를 대시보드 통계 행에서 읽음 (`DocumentService.list_documents`)
+
+사용법:
+    python -m benchmarks.bench_document_listing --docs 10000000 --page 10000 --reads 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.domains.documents.models import DOCUMENT_QUEUES, Document, DocumentStatus
+from app.domains.documents.services import DocumentRepository, DocumentService, encode_cursor
+from app.domains.documents.statistics import StatisticsRecorder
+
+from .common import percentile
+
+TENANT = "tenant-0"
+BATCH = 50_000
+
+
+async def seed(engine, docs: int) -> None:
+    """한 테넌트에 상태가 섞인 문서를 만듭니다 (처리 완료가 60%, 나머지 상태가 40%)."""
+    rng = random.Random(7)
+    others = [status for status in DocumentStatus if status not in DOCUMENT_QUEUES["completed"]]
+    start = datetime(2024, 1, 1)
+    fields = {"invoice_number": "INV-0001", "amount": "1,250,000", "notes": "x" * 200}
+    errors = [{"field": "amount", "message": "금액 형식이 올바르지 않습니다"}]
+    async with engine.begin() as conn:
+        for offset in range(0, docs, BATCH):
+            rows = []
+            for i in range(offset, min(offset + BATCH, docs)):
+                completed = rng.random() < 0.6
+                rows.append({
+                    "id": os.urandom(16).hex(), "tenant_id": TENANT, "name": f"doc-{i}.pdf", "file_type": "pdf",
+                    "size": rng.randrange(10_000, 5_000_000),
+                    "status": (rng.choice(DOCUMENT_QUEUES["completed"]) if completed else rng.choice(others)).name,
+                    "status_changed_at": start + timedelta(seconds=rng.randrange(0, 365 * 86400)),
+                    "extracted_fields": fields, "validation_errors": errors,
+                })
+            await conn.execute(insert(Document.__table__), rows)
+
+
+async def timed(reads: int, call) -> list:
+    samples = []
+    for _ in range(reads):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def run(args: argparse.Namespace) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-listing-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    recorder = StatisticsRecorder(session_factory)
+
+    started = time.perf_counter()
+    await seed(engine, args.docs)
+    await recorder.reconcile()
+    print(f"docs={args.docs} seed+reconcile={time.perf_counter() - started:.1f}s")
+
+    statuses = DOCUMENT_QUEUES["completed"]
+    async with session_factory() as session:
+        service = DocumentService(session, statistics=recorder)
+        repo = DocumentRepository(session)
+
+        # N페이지 커서는 이전 페이지 마지막 행의 정렬 키 (측정 전에 한 번 구함)
+        last = (await repo.list_page(TENANT, statuses, None, (args.page - 1) * args.limit, oldest_first=False))[-1]
+        deep_cursor = encode_cursor(last.status_changed_at, last.id)
+
+        plan = await session.execute(text("EXPLAIN QUERY PLAN " + str(
+            select(Document.id).where(Document.tenant_id == TENANT, Document.status == statuses[0])
+            .order_by(Document.status_changed_at.desc(), Document.id.desc()).limit(args.limit)
+            .compile(compile_kwargs={"literal_binds": True})
+        )))
+        print("cursor plan:", " / ".join(row[-1] for row in plan))
+
+        def offset_page(page: int):
+            async def call() -> None:
+                result = await session.execute(
+                    select(Document)
+                    .where(Document.tenant_id == TENANT, Document.status.in_(statuses))
+                    .order_by(Document.status_changed_at.desc(), Document.id.desc())
+                    .offset((page - 1) * args.limit).limit(args.limit)
+                )
+                result.scalars().all()
+                await session.execute(
+                    select(func.count()).select_from(Document)
+                    .where(Document.tenant_id == TENANT, Document.status.in_(statuses))
+                )
+                session.expunge_all()
+            return call
+
+        def cursor_page(cursor):
+            async def call() -> None:
+                await service.list_documents(TENANT, "completed", cursor, args.limit)
+            return call
+
+        for name, call in (
+            ("OFFSET p1", offset_page(1)),
+            (f"OFFSET p{args.page}", offset_page(args.page)),
+            ("cursor p1", cursor_page(None)),
+            (f"cursor p{args.page}", cursor_page(deep_cursor)),
+        ):
+            samples = await timed(args.reads, call)
+            print(f"{name:>14}: p50={percentile(samples, 50):9.2f} ms  p95={percentile(samples, 95):9.2f} ms")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=10_000_000)
+    parser.add_argument("--page", type=int, default=10_000, help="비교할 깊은 페이지 번호")
+    parser.add_argument("--limit", type=int, default=50, help="페이지 크기")
+    parser.add_argument("--reads", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+임베딩 서비스 처리량-지연 벤치마크
+
+배치 크기별로 동시 요청자를 붙여 처리량(texts/s)과 요청 지연(p50/p95/p99)을 측정합니다.
+`--onnx-dir`을 주지 않으면 해싱 백엔드로 배칭 오버헤드만 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_embedding --onnx-dir models/minilm --batch-sizes 1,8,16,32,64
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from app.domains.embedding.backends import HashingEmbeddingBackend, OnnxEmbeddingBackend
+from app.domains.embedding.services import EmbeddingService
+
+from .common import percentile, synthetic_sentence
+
+
+async def run_once(
+    service: EmbeddingService, texts: List[str], concurrency: int
+) -> List[float]:
+    """동시 요청자 `concurrency`명이 텍스트를 나눠 보내고 요청별 지연을 반환합니다."""
+    latencies: List[float] = []
+    cursor = 0
+
+    async def client() -> None:
+        nonlocal cursor
+        while cursor < len(texts):
+            text = texts[cursor]
+            cursor += 1
+            started = time.perf_counter()
+            await service.embed_documents([text])
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--onnx-dir", default=None)
+    parser.add_argument("--batch-sizes", default="1,4,8,16,32,64")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--intra-op-threads", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.onnx_dir:
+        backend = OnnxEmbeddingBackend(args.onnx_dir, intra_op_threads=args.intra_op_threads)
+    else:
+        backend = HashingEmbeddingBackend()
+
+    rng = random.Random(args.seed)
+    texts = [" ".join(synthetic_sentence(rng) for _ in range(rng.randint(1, 12))) for _ in range(args.requests)]
+    backend.embed(texts[:8])  # 워밍업
+
+    print(f"backend={backend.model_id} requests={args.requests} concurrency={args.concurrency} max_wait_ms={args.max_wait_ms}")
+    print(f"{'batch':>6} {'texts/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'avg batch':>10}")
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        service = EmbeddingService(lambda: backend, max_batch_size=batch_size, max_wait_ms=args.max_wait_ms)
+        await service.start()
+        started = time.perf_counter()
+        latencies = await run_once(service, texts, args.concurrency)
+        elapsed = time.perf_counter() - started
+        stats = service.stats()
+        await service.stop()
+        print(
+            f"{batch_size:>6} {len(texts) / elapsed:>10.1f} "
+            f"{percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 95) * 1000:>8.2f} "
+            f"{percentile(latencies, 99) * 1000:>8.2f} {stats['avg_batch_size']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
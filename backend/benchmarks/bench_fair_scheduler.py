@@ -0,0 +1,130 @@
+"""
+파이프라인 스케줄러 벤치마크
+
+한 테넌트가 대량 재처리(기본 20만 건, 500건 배치)를 올린 상태에서 다른 테넌트의 업로드와 검토
+수정이 들어올 때 클래스별 큐 대기 시간을 가상 시각 이산 사건 시뮬레이션으로 비교합니다.
+
+- fifo: 들어온 순서대로 실행하는 단일 큐
+- fair: `FairScheduler` (클래스 가중치 + 테넌트 공정 배분 + 테넌트 동시 실행 상한)
+
+사용법:
+    python -m benchmarks.bench_fair_scheduler --bulk-docs 200000 --duration 600
+"""
+
+import argparse
+import heapq
+import random
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Tuple
+
+from app.domains.pipeline.models import PriorityClass
+from app.domains.pipeline.scheduler import FairScheduler, WorkItem
+
+from .common import percentile
+
+WEIGHTS = {PriorityClass.INTERACTIVE: 16.0, PriorityClass.REVIEW: 4.0, PriorityClass.BULK: 1.0}
+# 문서 한 건 처리 시간(초): 업로드는 OCR 포함, 재처리/검토 수정은 재검증 위주
+SERVICE_SECONDS = {PriorityClass.INTERACTIVE: 0.4, PriorityClass.REVIEW: 0.05, PriorityClass.BULK: 0.02}
+
+
+class FifoQueue:
+    """비교 기준: 들어온 순서대로 꺼내는 단일 큐."""
+
+    def __init__(self):
+        self._items: deque = deque()
+
+    def submit(self, item: WorkItem) -> None:
+        self._items.append(item)
+
+    def next(self) -> Optional[WorkItem]:
+        return self._items.popleft() if self._items else None
+
+    def complete(self, item: WorkItem) -> None:
+        pass
+
+
+def workload(rng: random.Random, args: argparse.Namespace) -> List[Tuple[float, WorkItem]]:
+    """(도착 시각, 작업) 목록을 만듭니다. 대량 재처리는 0초에 한꺼번에 들어옵니다."""
+    arrivals = []
+    for offset in range(0, args.bulk_docs, args.batch):
+        cost = min(args.batch, args.bulk_docs - offset)
+        arrivals.append((0.0, WorkItem("heavy", PriorityClass.BULK, "bulk", cost=cost, enqueued_at=0.0)))
+    for priority, rate, docs in (
+        (PriorityClass.INTERACTIVE, args.upload_rate, 1),
+        (PriorityClass.REVIEW, args.review_rate, 5),
+    ):
+        now = 0.0
+        while True:
+            now += rng.expovariate(rate)
+            if now >= args.duration:
+                break
+            tenant = f"tenant-{rng.randrange(args.tenants)}"
+            arrivals.append((now, WorkItem(tenant, priority, priority.value, cost=docs, enqueued_at=now)))
+    arrivals.sort(key=lambda pair: pair[0])
+    return arrivals
+
+
+def simulate(queue, arrivals: List[Tuple[float, WorkItem]], workers: int) -> Dict[str, object]:
+    """이산 사건 시뮬레이션으로 클래스별 대기 시간과 대량 작업 완료 시각을 구합니다."""
+    waits: Dict[PriorityClass, List[float]] = defaultdict(list)
+    running: List[Tuple[float, int, WorkItem]] = []
+    pending = deque(arrivals)
+    now, seq, bulk_done = 0.0, 0, 0.0
+    while pending or running:
+        next_arrival = pending[0][0] if pending else float("inf")
+        next_finish = running[0][0] if running else float("inf")
+        now = min(next_arrival, next_finish)
+        while pending and pending[0][0] <= now:
+            queue.submit(pending.popleft()[1])
+        while running and running[0][0] <= now:
+            _, _, item = heapq.heappop(running)
+            queue.complete(item)
+            if item.priority == PriorityClass.BULK:
+                bulk_done = now
+        while len(running) < workers:
+            item = queue.next()
+            if item is None:
+                break
+            waits[item.priority].append(now - item.enqueued_at)
+            seq += 1
+            heapq.heappush(running, (now + item.cost * SERVICE_SECONDS[item.priority], seq, item))
+    return {"waits": waits, "bulk_done": bulk_done}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bulk-docs", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=600.0, help="업로드/검토 수정 도착 구간(초)")
+    parser.add_argument("--upload-rate", type=float, default=10.0, help="초당 업로드 수")
+    parser.add_argument("--review-rate", type=float, default=2.0, help="초당 검토 수정 수")
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--tenant-concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    arrivals = workload(random.Random(args.seed), args)
+    print(
+        f"bulk_docs={args.bulk_docs} batch={args.batch} items={len(arrivals)} workers={args.workers} "
+        f"tenant_concurrency={args.tenant_concurrency}"
+    )
+    print(f"{'queue':>6} {'class':>12} {'started':>8} {'p50 s':>9} {'p95 s':>9} {'max s':>9} {'bulk done s':>12} {'sim ms':>8}")
+    for label in ("fifo", "fair"):
+        queue = FifoQueue() if label == "fifo" else FairScheduler(
+            WEIGHTS, tenant_concurrency=args.tenant_concurrency, clock=lambda: 0.0
+        )
+        started = time.perf_counter()
+        result = simulate(queue, arrivals, args.workers)
+        elapsed = (time.perf_counter() - started) * 1000
+        for priority in PriorityClass:
+            waits = result["waits"][priority]
+            print(
+                f"{label:>6} {priority.value:>12} {len(waits):>8} {percentile(waits, 50):>9.2f} "
+                f"{percentile(waits, 95):>9.2f} {max(waits):>9.2f} {result['bulk_done']:>12.1f} {elapsed:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
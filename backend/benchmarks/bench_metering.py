@@ -0,0 +1,101 @@
+"""
+사용량 계량 벤치마크
+
+테넌트 T개에 사용량 이벤트 N건을 두 방식으로 기록해 비교합니다 (SQLite 파일 DB).
+
+- 호출별 쓰기: 이벤트마다 `tenant_usage` 행을 `UPDATE ... SET c = c + 1`로 갱신하고 커밋
+- 계량기: 이벤트마다 `UsageMeter.record`로 메모리 카운터에 더하고, 윈도우마다 `flush()` 한 번
+
+계량기 쪽은 기록 비용(이벤트당)과 윈도우 기록 시간, 쓴 행 수를 출력합니다.
+
+사용법:
+    python -m benchmarks.bench_metering --events 200000 --tenants 500 --windows 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.domains.billing.metering import USAGE_METRICS, UsageMeter, usage_period
+from app.domains.billing.models import TenantUsage
+
+from .common import percentile
+
+USAGE_TABLE = TenantUsage.__table__
+
+
+class NullRelay:
+    def notify(self) -> None:
+        pass
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(7)
+    tenants = [f"tenant-{i}" for i in range(args.tenants)]
+    events = [(rng.choice(tenants), rng.choice(USAGE_METRICS)) for _ in range(args.events)]
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-metering-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    period = usage_period(datetime.utcnow())
+    async with session_factory() as session:
+        await session.execute(insert(USAGE_TABLE), [
+            {"tenant_id": tenant, "period": "direct", **dict.fromkeys(USAGE_METRICS, 0), "updated_at": datetime.utcnow()}
+            for tenant in tenants
+        ])
+        await session.commit()
+        sample = events[:args.direct]
+        started = time.perf_counter()
+        for tenant, metric in sample:
+            await session.execute(
+                update(USAGE_TABLE)
+                .where(USAGE_TABLE.c.tenant_id == tenant, USAGE_TABLE.c.period == "direct")
+                .values({metric: USAGE_TABLE.c[metric] + 1})
+            )
+            await session.commit()
+        direct_us = (time.perf_counter() - started) * 1e6 / len(sample)
+    print(f"  per-call write: {direct_us:9.1f} us/event  ({len(sample)} events, {len(sample)} commits)")
+
+    meter = UsageMeter(session_factory, relay=NullRelay(), worker_id="bench")
+    per_window = len(events) // args.windows
+    record_samples, flush_samples = [], []
+    for offset in range(0, per_window * args.windows, per_window):
+        started = time.perf_counter()
+        for tenant, metric in events[offset:offset + per_window]:
+            meter.record(tenant, metric)
+        record_samples.append((time.perf_counter() - started) * 1e6 / per_window)
+        started = time.perf_counter()
+        written = await meter.flush()
+        flush_samples.append((time.perf_counter() - started) * 1000)
+    print(f"           meter: {percentile(record_samples, 50):9.3f} us/event  "
+          f"flush p50={percentile(flush_samples, 50):.1f} ms ({written} windows/flush, {args.windows} commits)")
+
+    async with session_factory() as session:
+        usage = await meter.usage(session, tenants[0], period)
+    expected = sum(1 for tenant, _ in events[:per_window * args.windows] if tenant == tenants[0])
+    print(f"exact totals: {sum(usage.values()) == expected}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--tenants", type=int, default=500)
+    parser.add_argument("--windows", type=int, default=10, help="이벤트를 나눠 닫을 윈도우 수")
+    parser.add_argument("--direct", type=int, default=5_000, help="호출별 쓰기로 측정할 이벤트 수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+유사 중복 색인 벤치마크
+
+테넌트 컬렉션 하나에 문서 수백만 건 규모의 서명을 채운 뒤, 재OCR 사본(글자 일부 변경) 조회의
+지연(p50/p99)과 재현율, 무관한 문서의 오탐률을 측정합니다.
+
+- 배경 문서: 본문 서명 계산은 문서 수에 비례해 오래 걸리므로 무작위 서명을 세그먼트로 바로 적재
+- 원본/사본: 합성 본문에서 실제 서명을 계산해 원본은 색인에, 사본은 조회에 사용
+
+사용법:
+    python -m benchmarks.bench_near_duplicates --docs 2000000 --originals 500 --edits 6
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from app.domains.validation.dedup import NearDuplicateIndex
+
+from .common import peak_rss_mb, percentile, synthetic_page
+
+
+def rescan(rng: random.Random, text: str, edits: int) -> str:
+    """글자 몇 개를 바꿔 재OCR 사본을 흉내 냅니다."""
+    chars = list(text)
+    for _ in range(edits):
+        chars[rng.randrange(len(chars))] = rng.choice("0O1lI가나다 ")
+    return "".join(chars)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2_000_000, help="배경 문서 수")
+    parser.add_argument("--originals", type=int, default=500)
+    parser.add_argument("--chars", type=int, default=2000, help="원본 본문 글자 수")
+    parser.add_argument("--edits", type=int, default=6, help="사본당 바꿀 글자 수")
+    parser.add_argument("--segment-docs", type=int, default=250_000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    np_rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        index = NearDuplicateIndex(directory, threshold=args.threshold)
+        collection = index.collection("bench")
+
+        started = time.perf_counter()
+        for offset in range(0, args.docs, args.segment_docs):
+            count = min(args.segment_docs, args.docs - offset)
+            signatures = np_rng.integers(0, 1 << 32, size=(count, index.num_perm), dtype=np.uint64)
+            collection.add_bulk([f"bg-{offset + i}" for i in range(count)], signatures.astype(np.uint32))
+        load = time.perf_counter() - started
+        merged = collection.merge(max_segments=1)
+        merge = time.perf_counter() - started - load
+
+        originals = [synthetic_page(rng, args.chars) for _ in range(args.originals)]
+        for i, text in enumerate(originals):
+            index.check_and_add("bench", f"orig-{i}", text)
+        collection.flush()
+
+        latencies = []
+        found = 0
+        for i, text in enumerate(originals):
+            copy = rescan(rng, text, args.edits)
+            started = time.perf_counter()
+            match = index.check_and_add("bench", f"copy-{i}", copy)
+            latencies.append((time.perf_counter() - started) * 1000)
+            found += match is not None and match.doc_id == f"orig-{i}"
+
+        false_positives = 0
+        for i in range(args.originals):
+            match = index.check_and_add("bench", f"new-{i}", synthetic_page(rng, args.chars))
+            false_positives += match is not None
+
+        print(f"docs={collection.doc_count} perm={index.num_perm} bands={index.bands} threshold={args.threshold}")
+        print(f"load: {load:.1f}s merge: {merge:.1f}s segments={len(collection.segments)} "
+              f"merged={len(merged) if merged is not None else 0}")
+        print(f"check_and_add p50={percentile(latencies, 50):.2f} ms p99={percentile(latencies, 99):.2f} ms")
+        print(f"recall={found / args.originals:.3f} false_positive_rate={false_positives / args.originals:.3f}")
+        print(f"peak_rss={peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+쿼터 집행 벤치마크
+
+테넌트 T개의 요청 N건을 두 방식으로 받아들이며 판정 지연을 비교합니다 (SQLite 파일 DB).
+
+- 요청별 조회: 요청마다 `tenant_plans`와 `tenant_usage` 행을 읽어 한도와 비교
+- 집행기: `QuotaEnforcer.admit` (메모리 허용량 확인 + 계량기 기록)
+
+집행기 쪽은 `refresh()` 시간(바뀐 행만 다시 읽기)과 받아들인/거부한 요청 수도 출력합니다.
+
+사용법:
+    python -m benchmarks.bench_quotas --requests 200000 --tenants 500
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.common.exceptions import QuotaExceeded, QuotaThrottled
+from app.domains.billing.metering import USAGE_METRICS, UsageMeter, usage_period
+from app.domains.billing.models import TenantPlan, TenantUsage
+from app.domains.billing.quotas import PLAN_LIMITS, QuotaEnforcer
+
+from .common import percentile
+
+USAGE_TABLE = TenantUsage.__table__
+
+
+class NullRelay:
+    def notify(self) -> None:
+        pass
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(7)
+    tenants = [f"tenant-{i}" for i in range(args.tenants)]
+    plans = {tenant: rng.choice(list(PLAN_LIMITS)) for tenant in tenants}
+    requests = [rng.choice(tenants) for _ in range(args.requests)]
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-quotas-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    period = usage_period(datetime.utcnow())
+    async with session_factory() as session:
+        await session.execute(insert(TenantPlan), [
+            {"tenant_id": tenant, "plan": plan, "updated_at": datetime.utcnow()} for tenant, plan in plans.items()
+        ])
+        await session.execute(insert(USAGE_TABLE), [
+            {"tenant_id": tenant, "period": period, **dict.fromkeys(USAGE_METRICS, 0),
+             "queries": PLAN_LIMITS[plans[tenant]]["queries"] - rng.randint(0, 200), "updated_at": datetime.utcnow()}
+            for tenant in tenants
+        ])
+        await session.commit()
+
+        samples = []
+        for tenant in requests[:args.direct]:
+            started = time.perf_counter()
+            plan = (await session.execute(select(TenantPlan.plan).where(TenantPlan.tenant_id == tenant))).scalar()
+            used = (await session.execute(
+                select(USAGE_TABLE.c.queries).where(USAGE_TABLE.c.tenant_id == tenant, USAGE_TABLE.c.period == period)
+            )).scalar()
+            _ = used + 1 <= PLAN_LIMITS[plan]["queries"]
+            samples.append((time.perf_counter() - started) * 1e6)
+    print(f"per-request read: p50={percentile(samples, 50):8.1f} us  p99={percentile(samples, 99):8.1f} us  "
+          f"({len(samples)} requests)")
+
+    meter = UsageMeter(session_factory, relay=NullRelay(), window=3600.0, worker_id="bench")
+    enforcer = QuotaEnforcer(
+        session_factory, meter=meter, relay=NullRelay(), workers=args.workers, min_slice=10, enabled=True
+    )
+    started = time.perf_counter()
+    await enforcer.refresh()
+    bootstrap_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    await enforcer.refresh()
+    refresh_ms = (time.perf_counter() - started) * 1000
+
+    samples, admitted, denied = [], 0, 0
+    for tenant in requests:
+        started = time.perf_counter()
+        try:
+            enforcer.admit(tenant, "queries")
+            admitted += 1
+        except (QuotaExceeded, QuotaThrottled):
+            denied += 1
+        samples.append((time.perf_counter() - started) * 1e6)
+    print(f"        enforcer: p50={percentile(samples, 50):8.2f} us  p99={percentile(samples, 99):8.2f} us  "
+          f"(admitted={admitted}, denied={denied})")
+    print(f"         refresh: bootstrap={bootstrap_ms:.1f} ms  incremental={refresh_ms:.1f} ms  "
+          f"({args.tenants} tenants)")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--tenants", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4, help="남은 한도를 나눠 갖는 워커 수")
+    parser.add_argument("--direct", type=int, default=5_000, help="요청별 조회로 측정할 요청 수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
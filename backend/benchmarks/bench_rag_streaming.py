@@ -0,0 +1,144 @@
+"""
+RAG 스트리밍 벤치마크
+
+가짜 LLM(첫 토큰 지연 + 토큰 간 지연)으로 오프라인에서 스트리밍/비스트리밍 응답의
+첫 바이트 시간(TTFB), 첫 토큰 시간, 전체 시간을 비교하고, 스트림을 중간에 닫았을 때
+생성이 멈추는지 확인합니다.
+
+- 비스트리밍: 생성이 끝나야 응답 전체를 보내므로 TTFB = 전체 시간
+- 스트리밍: 검색/재순위화 직후 근거 문서 이벤트를 먼저 보내고, 토큰은 생성되는 대로 전송
+
+사용법:
+    python -m benchmarks.bench_rag_streaming --docs 200 --queries 50 --first-token-ms 300 --token-ms 20
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from app.domains.auth.models import UserRole
+from app.domains.auth.schemas import TokenPayload
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.services import EmbeddingService
+from app.domains.rag.generation import AnswerGenerator, FakeLlmClient
+from app.domains.rag.schemas import RagQueryRequest
+from app.domains.rag.services import RagService
+from app.domains.search.acl import PermissionIndex
+from app.domains.search.keyword_index import LocalKeywordIndex
+from app.domains.search.rerank import LexicalRerankBackend, Reranker
+from app.domains.search.services import HybridRetriever
+from app.domains.search.vector_index import LocalVectorIndex
+
+from .common import percentile, synthetic_sentence
+
+
+async def build_service(directory: str, docs: int, client: FakeLlmClient, seed: int) -> RagService:
+    """합성 문서를 색인한 RAG 서비스를 만듭니다 (답변 캐시 비활성화)."""
+    rng = random.Random(seed)
+    backend = HashingEmbeddingBackend(dim=128)
+    embedding = EmbeddingService(lambda: backend, max_wait_ms=0)
+    vectors = LocalVectorIndex(directory, dim=128, memtable_rows=docs * 4)
+    keywords = LocalKeywordIndex("")
+    permissions = PermissionIndex()
+    for d in range(docs):
+        doc_id = f"doc-{d}"
+        texts = [" ".join(synthetic_sentence(rng) for _ in range(4)) for _ in range(4)]
+        chunk_ids = [f"{doc_id}:{c}" for c in range(len(texts))]
+        await vectors.upsert("bench", doc_id, chunk_ids, backend.embed(texts))
+        await keywords.on_documents_indexed({
+            "tenant_id": "bench",
+            "doc_id": doc_id,
+            "chunks": [{"chunk_id": c, "text": t, "page": 1} for c, t in zip(chunk_ids, texts)],
+        })
+        permissions.on_index_meta({"tenant_id": "bench", "doc_id": doc_id, "public": True})
+    service = RagService(
+        HybridRetriever(embedding, vectors, keywords),
+        permissions,
+        Reranker(LexicalRerankBackend, budget_ms=1000),
+        generator=AnswerGenerator(lambda: client),
+    )
+    service.answers = None
+    return service
+
+
+def report(mode: str, ttfb: List[float], first_token: List[float], total: List[float]) -> None:
+    print(
+        f"{mode:>9} {percentile(ttfb, 50):>9.1f} {percentile(ttfb, 95):>9.1f} "
+        f"{percentile(first_token, 50):>10.1f} {percentile(total, 50):>9.1f} {percentile(total, 95):>9.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=4, help="답변 반복 횟수 (응답 길이)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    client = FakeLlmClient(args.first_token_ms, args.token_ms, args.repeat)
+    token = TokenPayload(
+        sub="bench-user", email="bench@example.com", tenant_id="bench", role=UserRole.VIEWER,
+        type="access", exp=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    rng = random.Random(args.seed + 1)
+    queries = [synthetic_sentence(rng) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        service = await build_service(directory, args.docs, client, args.seed)
+
+        blocking: List[float] = []
+        answer_tokens: List[int] = []
+        for query in queries:
+            started = time.perf_counter()
+            response = await service.query(token, RagQueryRequest(query=query))
+            blocking.append((time.perf_counter() - started) * 1000)
+            answer_tokens.append(response.metadata["generation"]["tokens"])
+
+        ttfb, first_token, total = [], [], []
+        for query in queries:
+            started = time.perf_counter()
+            first_event = first = None
+            async for event, _ in service.stream(token, RagQueryRequest(query=query, stream=True)):
+                elapsed = (time.perf_counter() - started) * 1000
+                first_event = elapsed if first_event is None else first_event
+                if event == "token" and first is None:
+                    first = elapsed
+            ttfb.append(first_event)
+            first_token.append(first or 0.0)
+            total.append((time.perf_counter() - started) * 1000)
+
+        # 첫 토큰 직후 스트림을 닫으면 남은 토큰을 생성하지 않아야 한다
+        client.emitted = 0
+        events = service.stream(token, RagQueryRequest(query=queries[0], stream=True))
+        async for event, _ in events:
+            if event == "token":
+                break
+        await events.aclose()
+        await asyncio.sleep(args.token_ms * 5 / 1000)
+        cancelled_tokens = client.emitted
+
+        print(
+            f"docs={args.docs} queries={args.queries} first_token_ms={args.first_token_ms} "
+            f"token_ms={args.token_ms}"
+        )
+        print(f"{'mode':>9} {'ttfb p50':>9} {'ttfb p95':>9} {'token p50':>10} {'total p50':>9} {'total p95':>9}")
+        report("blocking", blocking, blocking, blocking)
+        report("stream", ttfb, first_token, total)
+        print(
+            f"tokens generated after early close: {cancelled_tokens} "
+            f"(full answer p50 {percentile(answer_tokens, 50):.0f} tokens)"
+        )
+
+        await service.reranker.stop()
+        await service.retriever.embedding.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
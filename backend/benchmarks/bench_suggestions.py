@@ -0,0 +1,81 @@
+"""
+검색어 자동완성 벤치마크
+
+합성 질의와 문서 제목으로 한 테넌트의 트라이를 만든 뒤, 키 입력을 한 글자씩 늘려 가며
+(음절 조합 중인 상태 포함) 제안 지연 시간과 메모리를 측정합니다.
+
+- 구성: 질의 기록 N건(Zipf 분포로 반복)과 문서 제목 M건을 증분 반영
+- 조회: 접두어 길이 1~8자, 권한 필터 없음/있음
+
+사용법:
+    python -m benchmarks.bench_suggestions --queries 200000 --docs 50000 --lookups 20000
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from app.domains.rag.suggestions import SuggestionIndex, jamo_key
+from app.domains.search.acl import PermissionIndex
+
+from .common import peak_rss_mb, percentile, synthetic_sentence
+
+TENANT = "tenant-0"
+
+
+def typing_prefixes(text: str) -> List[str]:
+    """입력 중 화면에 보이는 접두어들 (조합 중인 음절은 초성/초성+중성 단계 포함)."""
+    prefixes = []
+    for end in range(1, min(len(text), 8) + 1):
+        head, last = text[:end - 1], text[end - 1]
+        letters = jamo_key(last)
+        if len(letters) > 1 and "가" <= last <= "힣":
+            prefixes.append(head + letters[0])
+        prefixes.append(head + last)
+    return prefixes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=200_000, help="질의 기록 수")
+    parser.add_argument("--distinct", type=int, default=50_000, help="서로 다른 질의 수")
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    queries = [" ".join(synthetic_sentence(rng).split()[:rng.randint(2, 5)]) for _ in range(args.distinct)]
+    index = SuggestionIndex(session_factory=lambda: None)
+    permissions = PermissionIndex()
+
+    started = time.perf_counter()
+    now = time.time()
+    for i in range(args.queries):
+        rank = min(int(rng.paretovariate(1.1)) - 1, args.distinct - 1)
+        index.record_query(TENANT, queries[rank], at=now - (args.queries - i))
+    for i in range(args.docs):
+        doc_id = f"doc-{i}"
+        permissions.on_index_meta({"tenant_id": TENANT, "doc_id": doc_id, "groups": [f"g{i % 10}"]})
+        index.record_document(TENANT, doc_id, f"{synthetic_sentence(rng)[:30]}.pdf", at=now)
+    build = time.perf_counter() - started
+    print(
+        f"records={args.queries + args.docs} terms={index.stats()['terms']} "
+        f"build={build:.1f}s ({build * 1e6 / (args.queries + args.docs):.1f} us/record) rss={peak_rss_mb():.0f}MB"
+    )
+
+    prefixes = [p for q in rng.sample(queries, min(len(queries), 2000)) for p in typing_prefixes(q)]
+    access = permissions.access_filter(TENANT, "user-1", ["g3"])
+    for name, filter_ in (("no acl", None), ("acl 10%", access)):
+        samples = []
+        for i in range(args.lookups):
+            prefix = prefixes[i % len(prefixes)]
+            began = time.perf_counter()
+            index.suggest(TENANT, prefix, 5, filter_)
+            samples.append((time.perf_counter() - began) * 1e6)
+        print(f"{name:>8}: p50={percentile(samples, 50):7.1f} us  p95={percentile(samples, 95):7.1f} us  "
+              f"p99={percentile(samples, 99):7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+질의 트렌드 벤치마크
+
+한 테넌트의 하루치 검색 기록 N건으로 인기 질의 상위 10개를 두 방식으로 구해 비교합니다 (SQLite 파일 DB).
+
+- 집계: `search_history`를 `GROUP BY query ORDER BY COUNT(*) DESC LIMIT 10`으로 매 요청 스캔
+- 스케치: 질의마다 `TrendTracker.record`로 버킷에 더해 두고 `trends()`로 상위 후보만 정렬
+
+스케치 쪽은 기록 비용(질의당), 상위 10개 정확도(정확한 집계와의 일치 수), 메모리도 출력합니다.
+
+사용법:
+    python -m benchmarks.bench_trends --rows 1000000 --distinct 100000 --reads 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.domains.rag.models import SearchHistory
+from app.domains.rag.trends import TrendTracker
+
+from .common import percentile, synthetic_sentence
+
+TENANT = "tenant-0"
+BATCH = 50_000
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(7)
+    vocabulary = [" ".join(synthetic_sentence(rng).lower().split()[:4]) + f" {i}" for i in range(args.distinct)]
+    day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    stream = [
+        (
+            vocabulary[min(int(rng.paretovariate(1.1)), args.distinct) - 1],
+            day + timedelta(seconds=rng.randrange(86400)),
+        )
+        for _ in range(args.rows)
+    ]
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-trends-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        for offset in range(0, len(stream), BATCH):
+            await conn.execute(insert(SearchHistory.__table__), [
+                {"id": os.urandom(16).hex(), "tenant_id": TENANT, "user_id": "u", "query": query,
+                 "answer": "", "result_count": 0, "confidence": 0, "processing_time": 0.0, "created_at": created}
+                for query, created in stream[offset:offset + BATCH]
+            ])
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    tracker = TrendTracker(session_factory)
+    started = time.perf_counter()
+    for query, created in stream:
+        tracker.record(TENANT, query, at=created.replace(tzinfo=timezone.utc).timestamp())
+    record_us = (time.perf_counter() - started) * 1e6 / len(stream)
+    started = time.perf_counter()
+    await tracker.flush()
+    print(f"rows={args.rows} distinct={args.distinct} record={record_us:.1f} us/query "
+          f"flush={time.perf_counter() - started:.2f}s sketch={tracker.width * tracker.depth * 4 / 1024:.0f}KB/bucket")
+
+    query = (
+        select(SearchHistory.query, func.count().label("n"))
+        .where(SearchHistory.tenant_id == TENANT, SearchHistory.created_at >= day)
+        .group_by(SearchHistory.query).order_by(func.count().desc()).limit(10)
+    )
+    samples = []
+    async with session_factory() as session:
+        for _ in range(args.reads):
+            began = time.perf_counter()
+            exact = (await session.execute(query)).all()
+            samples.append((time.perf_counter() - began) * 1000)
+    print(f"   GROUP BY: p50={percentile(samples, 50):9.3f} ms  p95={percentile(samples, 95):9.3f} ms")
+
+    at = (day + timedelta(hours=23)).replace(tzinfo=timezone.utc).timestamp()
+    samples = []
+    for _ in range(args.reads * 100):
+        began = time.perf_counter()
+        trends = tracker.trends(TENANT, "day", 10, at=at)
+        samples.append((time.perf_counter() - began) * 1000)
+    print(f"     sketch: p50={percentile(samples, 50):9.3f} ms  p95={percentile(samples, 95):9.3f} ms")
+
+    truth = Counter(query for query, _ in stream)
+    overlap = len({item.text for item in trends.queries} & {row.query for row in exact})
+    worst = max(item.count - truth[item.text] for item in trends.queries)
+    print(f"top-10 overlap={overlap}/10 max overestimate={worst}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
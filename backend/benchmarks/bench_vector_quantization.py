@@ -0,0 +1,82 @@
+"""
+벡터 양자화 벤치마크
+
+같은 합성 임베딩 집합을 양자화 방식(none/int8/pq)별로 색인해
+recall@k, 상주 메모리, 검색 지연을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_vector_quantization --rows 200000 --dim 384 --queries 200
+"""
+
+import argparse
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from app.domains.embedding.backends import l2_normalize
+from app.domains.search.vector_index import VectorCollection
+
+from .common import percentile, timer
+
+
+def clustered_vectors(rows: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """군집 구조가 있는 정규화 벡터를 생성합니다 (실제 임베딩 분포 근사)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, rows)
+    noise = rng.standard_normal((rows, dim)).astype(np.float32) * 0.6
+    return l2_normalize(centers[labels] + noise)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--rescore-factor", type=int, default=4)
+    parser.add_argument("--pq-subvectors", type=int, default=48)
+    parser.add_argument("--modes", default="none,int8,pq")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    vectors = clustered_vectors(args.rows, args.dim, clusters=max(16, args.rows // 500), seed=args.seed)
+    queries = l2_normalize(
+        vectors[np.random.default_rng(args.seed + 1).choice(args.rows, args.queries)]
+        + np.random.default_rng(args.seed + 2).standard_normal((args.queries, args.dim)).astype(np.float32) * 0.05
+    )
+    exact = [set(np.argsort(-(vectors @ query))[:args.k]) for query in queries]
+    chunk_ids = [str(i) for i in range(args.rows)]
+
+    from app.common.config import settings
+    settings.VECTOR_INDEX_PQ_SUBVECTORS = args.pq_subvectors
+
+    print(f"rows={args.rows} dim={args.dim} k={args.k} nprobe={args.nprobe} rescore={args.rescore_factor}")
+    print(f"{'mode':>6} {'build s':>8} {'resident MB':>12} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode in args.modes.split(","):
+        with tempfile.TemporaryDirectory() as directory:
+            collection = VectorCollection(directory, args.dim, memtable_rows=args.rows + 1, quantization=mode)
+            collection.upsert("doc", chunk_ids, vectors)
+            with timer() as build:
+                collection.flush()
+
+            latencies: List[float] = []
+            recalls: List[float] = []
+            for query, truth in zip(queries, exact):
+                started = time.perf_counter()
+                hits = collection.search(query, args.k, args.nprobe, rescore_factor=args.rescore_factor)
+                latencies.append((time.perf_counter() - started) * 1000)
+                recalls.append(len(truth & {int(hit.chunk_id) for hit in hits}) / args.k)
+
+            stats = collection.stats()
+            print(
+                f"{mode:>6} {build['elapsed']:>8.2f} {stats['resident_bytes'] / 2**20:>12.1f} "
+                f"{np.mean(recalls):>9.3f} {percentile(latencies, 50):>8.2f} {percentile(latencies, 95):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
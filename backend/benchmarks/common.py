@@ -0,0 +1,94 @@
+"""
+벤치마크 공통 유틸리티
+
+합성 코퍼스 생성 및 자원 사용량 측정 헬퍼
+"""
+
+import random
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+# 계약서/증빙 문서를 흉내 내는 합성 어휘
+_WORDS: List[str] = [
+    "계약", "계약서", "갑", "을", "당사자", "위임", "조항", "제1조", "제2조", "목적",
+    "기간", "해지", "손해배상", "비밀유지", "지급", "청구", "금액", "원", "부가세",
+    "사업자등록번호", "주민등록번호", "대표이사", "주식회사", "서울특별시", "강남구",
+    "agreement", "party", "term", "payment", "invoice", "shall", "liability",
+    "confidential", "the", "of", "and", "to", "in", "for", "with", "by",
+]
+
+
+def synthetic_sentence(rng: random.Random) -> str:
+    """합성 문장 하나를 생성합니다."""
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 18))]
+    if rng.random() < 0.3:
+        words.append(f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(10000, 99999)}")
+    if rng.random() < 0.2:
+        words.append(f"{rng.randint(2015, 2026)}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}")
+    return " ".join(words) + "."
+
+
+def synthetic_page(rng: random.Random, chars: int = 3000) -> str:
+    """대략 `chars` 글자 길이의 합성 페이지를 생성합니다."""
+    parts: List[str] = []
+    size = 0
+    while size < chars:
+        sentence = synthetic_sentence(rng)
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)
+
+
+_SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+_GIVEN = ["민준", "서연", "도윤", "지우", "하준", "서윤", "지호", "하은", "준서", "수아"]
+
+
+def synthetic_form(rng: random.Random) -> Dict[str, str]:
+    """OCR 추출 결과를 흉내 낸 합성 양식 필드를 생성합니다 (일부 값은 형식이 깨져 있음)."""
+    year, month, day = rng.randint(2015, 2026), rng.randint(1, 12), rng.randint(1, 28)
+    form = {
+        "name": rng.choice(_SURNAMES) + rng.choice(_GIVEN),
+        "email": f"user{rng.randint(1, 99999)}@example.com",
+        "phone": f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        "contract_no": f"CTR-{year}-{rng.randint(1, 999):03d}",
+        "amount": f"{rng.randint(1, 5000) * 1000:,}원",
+        "start_date": f"{year}.{month:02d}.{day:02d}",
+        "end_date": f"{year + rng.randint(0, 2)}년 {month}월 {day}일",
+        "confidence": str(rng.randint(60, 100)),
+    }
+    if rng.random() < 0.1:
+        form["email"] = form["email"].replace("@", " ")
+    if rng.random() < 0.1:
+        form["phone"] = form["phone"][:7]
+    return form
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS(MB)를 반환합니다."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def timer() -> Iterator[Dict[str, float]]:
+    """경과 시간(초)을 `elapsed` 키로 기록하는 컨텍스트 매니저입니다."""
+    result: Dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["elapsed"] = time.perf_counter() - start
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """정렬되지 않은 값 목록의 백분위수를 반환합니다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
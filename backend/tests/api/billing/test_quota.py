@@ -0,0 +1,134 @@
+"""
+쿼터 집행 API 테스트
+
+요금제/월별 누적 적재, 한도 초과 시 429와 Retry-After, /api/v1/billing/quota 응답,
+billing.threshold 아웃박스 이벤트 테스트
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.events import Topics
+from app.common.outbox import OutboxEvent
+from app.common.security import create_access_token
+from app.domains.billing.metering import UsageMeter
+from app.domains.billing.models import TenantPlan, TenantUsage
+from app.domains.billing.quotas import QuotaEnforcer, get_quota_enforcer
+from app.main import app
+
+
+class FakeRelay:
+    """깨우기 호출 수만 세는 아웃박스 릴레이입니다."""
+
+    def __init__(self):
+        self.notified = 0
+
+    def notify(self) -> None:
+        self.notified += 1
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 데이터가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession)
+
+
+@pytest.fixture
+def enforcer(session_factory) -> QuotaEnforcer:
+    relay = FakeRelay()
+    meter = UsageMeter(session_factory, relay=relay, worker_id="w1")
+    return QuotaEnforcer(
+        session_factory, meter=meter, relay=relay, workers=1, min_slice=1, thresholds=[80, 100], enabled=True
+    )
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestQuotaEnforcement:
+    """쿼터 집행 API 테스트 클래스"""
+
+    async def test_refresh_loads_plan_and_usage(
+        self, test_session: AsyncSession, enforcer: QuotaEnforcer, tenant_id: str
+    ):
+        """요금제와 이번 기간 누적을 읽어 한도에 반영하고, 이후에는 바뀐 행만 다시 읽는지 테스트"""
+        test_session.add(TenantPlan(tenant_id=tenant_id, plan="starter"))
+        test_session.add(TenantUsage(tenant_id=tenant_id, period=enforcer.period, queries=1500, documents=10))
+        await test_session.commit()
+
+        assert await enforcer.refresh() >= 1
+        assert enforcer.plan(tenant_id) == "starter"
+        assert enforcer.status(tenant_id) == {"documents": (500, 10), "queries": (2000, 1500)}
+
+        # billing.usage 누적은 더 큰 값만 반영한다
+        enforcer.on_billing_usage({"tenant_id": tenant_id, "period": enforcer.period, "totals": {"queries": 1600}})
+        enforcer.on_billing_usage({"tenant_id": tenant_id, "period": enforcer.period, "totals": {"queries": 1550}})
+        enforcer.on_billing_usage({"tenant_id": tenant_id, "period": "2000-01", "totals": {"queries": 1999}})
+        assert enforcer.status(tenant_id)["queries"] == (2000, 1600)
+
+        plan = await test_session.get(TenantPlan, tenant_id)
+        plan.plan = "enterprise"
+        await test_session.commit()
+        await enforcer.refresh()
+        assert enforcer.status(tenant_id)["queries"] == (50000, 1600)
+
+    async def test_exhausted_quota_returns_429_with_retry_after(
+        self, test_client: AsyncClient, enforcer: QuotaEnforcer, tenant_id: str
+    ):
+        """한도를 다 쓴 테넌트의 질의는 서비스에 닿기 전에 429와 Retry-After로 거부되는지 테스트"""
+        enforcer._plans[tenant_id] = "starter"
+        enforcer._allowance(tenant_id, "queries").used = 2000
+
+        app.dependency_overrides[get_quota_enforcer] = lambda: enforcer
+        try:
+            response = await test_client.post(
+                "/api/v1/rag/query", json={"query": "지급 조건"}, headers=auth_headers(tenant_id)
+            )
+            quota = await test_client.get("/api/v1/billing/quota", headers=auth_headers(tenant_id))
+        finally:
+            app.dependency_overrides.pop(get_quota_enforcer, None)
+
+        assert response.status_code == 429
+        assert response.json()["detail"]["error_code"] == "QUOTA_EXCEEDED"
+        assert int(response.headers["Retry-After"]) >= 1
+        assert enforcer.meter.pending(tenant_id, "queries") == 0
+
+        assert quota.status_code == 200
+        body = quota.json()
+        assert body["plan"] == "starter" and body["period"] == enforcer.period
+        assert body["quotas"]["queries"] == {"used": 2000, "limit": 2000, "remaining": 0}
+        assert body["quotas"]["documents"] == {"used": 0, "limit": 500, "remaining": 500}
+
+    async def test_threshold_events_are_written_to_outbox(
+        self, test_session: AsyncSession, enforcer: QuotaEnforcer, tenant_id: str
+    ):
+        """80% 경계를 넘으면 billing.threshold 이벤트가 아웃박스에 한 번 기록되는지 테스트"""
+        enforcer._plans[tenant_id] = "starter"
+        enforcer._allowance(tenant_id, "documents").used = 399
+        enforcer.admit(tenant_id, "documents")
+        enforcer.admit(tenant_id, "documents")
+
+        assert await enforcer.publish() == 1
+        assert await enforcer.publish() == 0
+        events = (await test_session.execute(
+            select(OutboxEvent).where(OutboxEvent.topic == Topics.BILLING_THRESHOLD, OutboxEvent.key == tenant_id)
+        )).scalars().all()
+        assert len(events) == 1
+        payload = events[0].payload
+        assert payload["event_key"] == f"{tenant_id}:{enforcer.period}:documents:80"
+        assert (payload["used"], payload["limit"], payload["threshold"]) == (400, 500, 80)
+        assert enforcer.relay.notified == 1
@@ -0,0 +1,162 @@
+"""
+사용량 계량 API 테스트
+
+윈도우 일괄 기록(월별 누적, billing.usage 아웃박스 이벤트), 실패 후 같은 키로 재시도,
+중복 윈도우 무시, /api/v1/billing/usage 응답, 라우터 수준 요청 계량 테스트
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.events import Topics
+from app.common.outbox import OutboxEvent
+from app.common.security import create_access_token
+from app.domains.billing.metering import UsageMeter, get_usage_meter
+from app.domains.billing.models import TenantUsage, UsageWindow
+from app.main import app
+
+
+class FakeRelay:
+    """깨우기 호출 수만 세는 아웃박스 릴레이입니다."""
+
+    def __init__(self):
+        self.notified = 0
+
+    def notify(self) -> None:
+        self.notified += 1
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 데이터가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession)
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def usage_row(session: AsyncSession, tenant_id: str) -> TenantUsage:
+    result = await session.execute(select(TenantUsage).where(TenantUsage.tenant_id == tenant_id))
+    return result.scalars().one()
+
+
+class TestUsageMetering:
+    """사용량 계량 API 테스트 클래스"""
+
+    async def test_flush_writes_windows_totals_and_events_in_one_transaction(
+        self, test_session: AsyncSession, session_factory, tenant_id: str
+    ):
+        """윈도우마다 증분 행, 월별 누적, billing.usage 이벤트가 함께 쓰이는지 테스트"""
+        relay = FakeRelay()
+        meter = UsageMeter(session_factory, relay=relay, worker_id="w1")
+        meter.record(tenant_id, "queries", 2)
+        meter.record(tenant_id, "tokens", 150)
+        meter.record(tenant_id, "pages", 12)
+        meter.record("other-tenant", "requests")
+
+        assert await meter.flush() == 2
+        meter.record(tenant_id, "pages", 3)
+        assert await meter.flush() == 1
+        assert await meter.flush() == 0
+
+        row = await usage_row(test_session, tenant_id)
+        assert (row.queries, row.tokens, row.pages, row.requests) == (2, 150, 15, 0)
+        windows = (await test_session.execute(
+            select(UsageWindow).where(UsageWindow.tenant_id == tenant_id).order_by(UsageWindow.window_start)
+        )).scalars().all()
+        assert [window.window_key for window in windows] == [f"{tenant_id}:w1:1", f"{tenant_id}:w1:2"]
+        assert windows[0].usage == {"queries": 2, "tokens": 150, "pages": 12}
+
+        events = (await test_session.execute(
+            select(OutboxEvent).where(OutboxEvent.topic == Topics.BILLING_USAGE, OutboxEvent.key == tenant_id)
+            .order_by(OutboxEvent.id)
+        )).scalars().all()
+        assert [event.payload["window_key"] for event in events] == [window.window_key for window in windows]
+        assert events[-1].payload["usage"] == {"pages": 3}
+        assert events[-1].payload["totals"]["pages"] == 15 and events[-1].payload["period"] == row.period
+        assert relay.notified == 2
+
+    async def test_failed_windows_retry_with_same_key_and_apply_once(
+        self, test_session: AsyncSession, session_factory, tenant_id: str
+    ):
+        """기록 실패 후 같은 키로 다시 쓰고, 이미 기록된 윈도우를 다시 보내도 한 번만 더해지는지 테스트"""
+
+        def broken_factory():
+            raise ConnectionError("db down")
+
+        meter = UsageMeter(broken_factory, relay=FakeRelay(), worker_id="w1")
+        meter.record(tenant_id, "documents", 2)
+        with pytest.raises(ConnectionError):
+            await meter.flush()
+        meter.record(tenant_id, "documents")
+        pending = list(meter._closed)
+        assert [delta.key for delta in pending] == [f"{tenant_id}:w1:1"]
+
+        meter.session_factory = session_factory
+        assert await meter.flush() == 2
+        # 커밋 응답을 잃은 워커가 같은 윈도우를 다시 보내는 경우
+        assert await meter._write(pending) == 0
+
+        row = await usage_row(test_session, tenant_id)
+        assert row.documents == 3
+        keys = (await test_session.execute(
+            select(UsageWindow.window_key).where(UsageWindow.tenant_id == tenant_id)
+        )).scalars().all()
+        assert sorted(keys) == [f"{tenant_id}:w1:1", f"{tenant_id}:w1:2"]
+
+    async def test_usage_endpoint_adds_pending_deltas(
+        self, test_client: AsyncClient, session_factory, tenant_id: str
+    ):
+        """기록된 누적에 아직 쓰지 않은 증분(이 요청 포함)을 더해 반환하는지 테스트"""
+        meter = UsageMeter(session_factory, relay=FakeRelay())
+        meter.on_documents_parsed({"tenant_id": tenant_id, "pages": [{"page": 1}, {"page": 2}]})
+        await meter.flush()
+        meter.on_documents_indexed({"tenant_id": tenant_id, "chunks": [{"token_count": 100}, {"token_count": 28}]})
+        meter.on_documents_uploaded({"tenant_id": tenant_id, "reprocess": True})
+
+        app.dependency_overrides[get_usage_meter] = lambda: meter
+        try:
+            response = await test_client.get("/api/v1/billing/usage", headers=auth_headers(tenant_id))
+            invalid = await test_client.get(
+                "/api/v1/billing/usage", params={"period": "2024-13"}, headers=auth_headers(tenant_id)
+            )
+        finally:
+            app.dependency_overrides.pop(get_usage_meter, None)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["pages"] == 2 and body["embeddingTokens"] == 128
+        assert body["requests"] == 1 and body["documents"] == 0
+        assert invalid.status_code == 400
+
+    async def test_requests_are_metered_once_per_request_at_router_level(
+        self, test_client: AsyncClient, session_factory, tenant_id: str
+    ):
+        """토큰 의존성을 여러 번 쓰는 요청도 한 번만 계량하고, 인증 실패 요청은 계량하지 않는지 테스트"""
+        meter = UsageMeter(session_factory, relay=FakeRelay())
+
+        app.dependency_overrides[get_usage_meter] = lambda: meter
+        try:
+            quota = await test_client.get("/api/v1/billing/quota", headers=auth_headers(tenant_id))
+            trends = await test_client.get("/api/v1/rag/trends", headers=auth_headers(tenant_id))
+            anonymous = await test_client.get("/api/v1/billing/quota")
+        finally:
+            app.dependency_overrides.pop(get_usage_meter, None)
+
+        assert quota.status_code == 200 and trends.status_code == 200
+        assert anonymous.status_code in (401, 403)
+        assert meter.pending(tenant_id, "requests") == 2
@@ -0,0 +1,168 @@
+"""
+문서 일괄 검토 API 테스트
+
+/api/v1/documents/batch-approve, batch-reject의 문서별 결과, 테넌트 범위, 아웃박스 이벤트,
+문서 수와 무관한 SQL 문 수, 발행된 아웃박스 이벤트 정리 테스트
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.events import EventBus, Topics
+from app.common.outbox import OutboxEvent, OutboxRelay, get_outbox_relay
+from app.common.security import create_access_token
+from app.domains.documents.models import Document, DocumentStatus
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 문서가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def reviewed() -> list:
+    """릴레이가 발행한 documents.reviewed 이벤트"""
+    return []
+
+
+@pytest.fixture
+async def relay(test_engine, reviewed: list):
+    """테스트 DB와 별도 이벤트 버스를 쓰는 아웃박스 릴레이"""
+    bus = EventBus()
+    bus.subscribe(Topics.DOCUMENTS_REVIEWED, reviewed.append)
+    instance = OutboxRelay(async_sessionmaker(test_engine, class_=AsyncSession), bus)
+    await instance.flush()  # 다른 테스트가 남긴 이벤트를 비운다
+    reviewed.clear()
+    app.dependency_overrides[get_outbox_relay] = lambda: instance
+    yield instance
+    app.dependency_overrides.pop(get_outbox_relay, None)
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 검토자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "reviewer@example.com", "tenant_id": tenant_id, "role": "operator"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_documents(session: AsyncSession, tenant_id: str, status: DocumentStatus, count: int) -> list:
+    """문서를 만들고 ID 문자열 목록을 반환합니다."""
+    documents = [Document(tenant_id=tenant_id, name=f"doc-{i}.pdf", status=status) for i in range(count)]
+    session.add_all(documents)
+    await session.commit()
+    return [str(document.id) for document in documents]
+
+
+class TestBatchReview:
+    """문서 일괄 검토 API 테스트 클래스"""
+
+    async def test_batch_approve_reports_per_id_outcomes(
+        self, test_client: AsyncClient, test_session: AsyncSession, relay: OutboxRelay, reviewed: list,
+        tenant_id: str
+    ):
+        """승인 가능 문서만 바꾸고 없는/이미 처리된/다른 테넌트 문서를 구분해 알려주는지 테스트"""
+        pending = await add_documents(test_session, tenant_id, DocumentStatus.PENDING_REVIEW, 2)
+        in_review = await add_documents(test_session, tenant_id, DocumentStatus.IN_REVIEW, 1)
+        approved = await add_documents(test_session, tenant_id, DocumentStatus.APPROVED, 1)
+        foreign = await add_documents(test_session, "other-tenant", DocumentStatus.PENDING_REVIEW, 1)
+        ids = [*pending, *in_review, *approved, *foreign, "not-a-uuid", pending[0]]
+
+        response = await test_client.post(
+            "/api/v1/documents/batch-approve", json={"documentIds": ids}, headers=auth_headers(tenant_id)
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["status"], body["requested"], body["updated"]) == ("approved", 6, 3)
+        assert [(r["outcome"], r["status"]) for r in body["results"]] == [
+            ("updated", "approved"), ("updated", "approved"), ("updated", "approved"),
+            ("invalid_status", "approved"), ("not_found", None), ("not_found", None),
+        ]
+        assert await relay.flush() == 1
+        assert reviewed[0]["doc_ids"] == [*pending, *in_review]
+        assert reviewed[0]["reviewer"] == "reviewer@example.com"
+        other = await test_session.execute(select(Document.status).where(Document.tenant_id == "other-tenant"))
+        assert set(other.scalars()) == {DocumentStatus.PENDING_REVIEW}
+
+    async def test_batch_reject_stores_reason(
+        self, test_client: AsyncClient, test_session: AsyncSession, relay: OutboxRelay, reviewed: list,
+        tenant_id: str
+    ):
+        """반려 사유를 저장하고 바뀐 문서가 없으면 이벤트를 남기지 않는지 테스트"""
+        ids = await add_documents(test_session, tenant_id, DocumentStatus.PENDING_REVIEW, 2)
+        headers = auth_headers(tenant_id)
+
+        rejected = await test_client.post(
+            "/api/v1/documents/batch-reject", json={"documentIds": ids, "reason": "서명 누락"}, headers=headers
+        )
+        again = await test_client.post(
+            "/api/v1/documents/batch-reject", json={"documentIds": ids, "reason": "서명 누락"}, headers=headers
+        )
+        missing_reason = await test_client.post("/api/v1/documents/batch-reject", json={"documentIds": ids},
+                                                headers=headers)
+
+        assert rejected.json()["updated"] == 2
+        assert again.json()["updated"] == 0
+        assert {r["outcome"] for r in again.json()["results"]} == {"invalid_status"}
+        assert missing_reason.status_code == 422
+        assert await relay.flush() == 1
+        assert reviewed[0]["status"] == "rejected" and reviewed[0]["reason"] == "서명 누락"
+        rows = await test_session.execute(select(Document.review_reason).where(Document.tenant_id == tenant_id))
+        assert set(rows.scalars()) == {"서명 누락"}
+
+    async def test_statement_count_is_independent_of_batch_size(
+        self, test_client: AsyncClient, test_session: AsyncSession, test_engine, relay: OutboxRelay,
+        tenant_id: str
+    ):
+        """문서 수와 관계없이 UPDATE와 아웃박스 INSERT 두 문장만 실행하는지 테스트"""
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith(("UPDATE", "INSERT", "SELECT")):
+                statements.append(statement.split()[0].upper())
+
+        counts = []
+        for size in (10, 1000):
+            ids = await add_documents(test_session, tenant_id, DocumentStatus.PENDING_REVIEW, size)
+            statements.clear()
+            event.listen(test_engine.sync_engine, "before_cursor_execute", count)
+            try:
+                response = await test_client.post(
+                    "/api/v1/documents/batch-approve", json={"documentIds": ids}, headers=auth_headers(tenant_id)
+                )
+            finally:
+                event.remove(test_engine.sync_engine, "before_cursor_execute", count)
+            assert response.json()["updated"] == size
+            counts.append(list(statements))
+
+        assert counts[0] == counts[1] == ["UPDATE", "INSERT"]
+
+    async def test_sweep_deletes_only_expired_published_events(
+        self, test_session: AsyncSession, relay: OutboxRelay, tenant_id: str
+    ):
+        """보관 기간이 지난 발행된 이벤트만 배치 단위로 삭제하고 미발행 이벤트는 남기는지 테스트"""
+        now = datetime.utcnow()
+        old = now - timedelta(seconds=relay.retention + 60)
+        test_session.add_all([
+            OutboxEvent(topic=Topics.DOCUMENTS_REVIEWED, key=tenant_id, created_at=old, published_at=old),
+            OutboxEvent(topic=Topics.DOCUMENTS_REVIEWED, key=tenant_id, created_at=old, published_at=old),
+            OutboxEvent(topic=Topics.DOCUMENTS_REVIEWED, key=tenant_id, created_at=now, published_at=now),
+            OutboxEvent(topic=Topics.DOCUMENTS_REVIEWED, key=tenant_id, created_at=old),
+        ])
+        await test_session.commit()
+
+        relay.batch_size = 1
+        assert await relay.sweep() == 2
+        assert await relay.sweep() == 0
+        rows = await test_session.execute(
+            select(OutboxEvent.created_at, OutboxEvent.published_at).where(OutboxEvent.key == tenant_id)
+        )
+        assert sorted(rows.all(), key=lambda row: row.published_at is None) == [(now, now), (old, None)]
@@ -0,0 +1,144 @@
+"""
+문서 목록 API 테스트
+
+/api/v1/documents/{processing,pending-review,completed}의 커서 페이지네이션, 목록 컬럼만 읽는
+조회, 대시보드 통계 기반 전체 문서 수 테스트
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.documents.statistics import StatisticsRecorder, get_statistics_recorder
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 문서가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def recorder(test_engine):
+    """테스트 DB에 기록하는 통계 기록기"""
+    instance = StatisticsRecorder(async_sessionmaker(test_engine, class_=AsyncSession))
+    app.dependency_overrides[get_statistics_recorder] = lambda: instance
+    yield instance
+    app.dependency_overrides.pop(get_statistics_recorder, None)
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "viewer@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_documents(session: AsyncSession, tenant_id: str, statuses: list, base: datetime) -> None:
+    """상태 목록 순서대로 문서를 만듭니다.
+
+    두 문서씩 같은 상태 변경 시간을 주어 id로 순서를 가르는 경우도 만듭니다.
+    """
+    documents = [
+        Document(
+            tenant_id=tenant_id, name=f"doc-{i}.pdf", file_type="application/pdf", size=i, status=status,
+            status_changed_at=base + timedelta(seconds=i // 2), extracted_fields={"amount": "1" * 1000},
+        )
+        for i, status in enumerate(statuses)
+    ]
+    session.add_all(documents)
+    await session.commit()
+
+
+async def walk(client: AsyncClient, path: str, tenant_id: str, limit: int) -> list:
+    """커서를 따라 마지막 페이지까지 읽고 페이지 목록을 반환합니다."""
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(path, params=params, headers=auth_headers(tenant_id))
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["nextCursor"]
+        if cursor is None:
+            return pages
+
+
+class TestDocumentListing:
+    """문서 목록 API 테스트 클래스"""
+
+    async def test_cursor_walks_queue_in_order_across_statuses(
+        self, test_client: AsyncClient, test_session: AsyncSession, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """여러 상태가 섞인 큐를 (상태 변경 시간, id) 순서로 빠짐없이, 중복 없이 넘기는지 테스트"""
+        base = datetime(2024, 1, 1)
+        statuses = [DocumentStatus.PROCESSING, DocumentStatus.PAUSED, DocumentStatus.FAILED] * 5
+        await add_documents(test_session, tenant_id, statuses + [DocumentStatus.COMPLETED] * 3, base)
+        await recorder.reconcile(tenant_id)
+
+        pages = await walk(test_client, "/api/v1/documents/processing", tenant_id, limit=4)
+
+        items = [item for page in pages for item in page["items"]]
+        assert [len(page["items"]) for page in pages] == [4, 4, 4, 3]
+        assert len({item["id"] for item in items}) == 15
+        keys = [(item["statusChangedAt"], item["id"]) for item in items]
+        assert keys == sorted(keys)
+        assert {item["status"] for item in items} == {"processing", "paused", "failed"}
+        assert all(page["total"] == 15 for page in pages)
+        assert set(items[0]) == {
+            "id", "name", "type", "size", "status", "uploader", "reviewer", "uploadedAt", "statusChangedAt"
+        }
+
+    async def test_completed_queue_is_newest_first_and_scoped_to_tenant(
+        self, test_client: AsyncClient, test_session: AsyncSession, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """처리 완료 목록은 최근 순서이고 다른 테넌트 문서는 보이지 않는지 테스트"""
+        base = datetime(2024, 1, 1)
+        await add_documents(test_session, tenant_id, [DocumentStatus.APPROVED, DocumentStatus.COMPLETED] * 3, base)
+        await add_documents(test_session, f"{tenant_id}-other", [DocumentStatus.COMPLETED] * 4, base)
+
+        pages = await walk(test_client, "/api/v1/documents/completed", tenant_id, limit=5)
+        review = await test_client.get("/api/v1/documents/pending-review", headers=auth_headers(tenant_id))
+
+        items = [item for page in pages for item in page["items"]]
+        keys = [(item["statusChangedAt"], item["id"]) for item in items]
+        assert len(items) == 6 and keys == sorted(keys, reverse=True)
+        assert review.json() == {"items": [], "nextCursor": None, "total": 0}
+
+    async def test_list_reads_projection_without_count(
+        self, test_client: AsyncClient, test_session: AsyncSession, test_engine, recorder: StatisticsRecorder,
+        tenant_id: str
+    ):
+        """목록 조회가 JSON 컬럼을 읽지 않고 COUNT(*) 없이 통계 행으로 전체 수를 구하는지 테스트"""
+        await add_documents(test_session, tenant_id, [DocumentStatus.PENDING_REVIEW] * 3, datetime(2024, 1, 1))
+        recorder.record(tenant_id, {"pending_review": 3})
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            response = await test_client.get(
+                "/api/v1/documents/pending-review", params={"limit": 2}, headers=auth_headers(tenant_id)
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+        invalid = await test_client.get(
+            "/api/v1/documents/pending-review", params={"cursor": "not-a-cursor"}, headers=auth_headers(tenant_id)
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 3 and len(response.json()["items"]) == 2
+        listing = [statement for statement in statements if "from documents" in statement]
+        assert len(listing) == 1
+        assert "extracted_fields" not in listing[0] and "validation_errors" not in listing[0]
+        assert not any("count(" in statement for statement in statements)
+        assert invalid.status_code == 400
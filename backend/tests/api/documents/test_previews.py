@@ -0,0 +1,192 @@
+"""
+문서 미리보기 API 테스트
+
+/api/v1/documents/{id}/thumbnail, /pages/{page}/preview의 ETag/304, 콘텐츠 주소 캐시,
+동시 요청 단일 렌더링, OCR 완료 후 미리 렌더링 테스트
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.documents.previews import PreviewCache, PreviewService, get_preview_service
+from app.main import app
+
+# 페이지 객체 두 개를 가진 최소 PDF 본문
+TWO_PAGE_PDF = b"%PDF-1.4\n1 0 obj << /Type /Pages /Count 2 >> endobj\n" \
+    b"2 0 obj << /Type /Page >> endobj\n3 0 obj << /Type /Page >> endobj\n%%EOF"
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 문서가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+async def previews(test_engine, tmp_path):
+    """임시 저장소/캐시와 스레드 풀을 쓰는 자리표시자 미리보기 서비스"""
+    (tmp_path / "originals").mkdir()
+    executor = ThreadPoolExecutor(max_workers=2)
+    service = PreviewService(
+        async_sessionmaker(test_engine, class_=AsyncSession),
+        PreviewCache(str(tmp_path / "previews"), memory_bytes=1 << 20),
+        executor,
+        renderer="placeholder",
+        storage_dir=str(tmp_path / "originals"),
+    )
+    app.dependency_overrides[get_preview_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_preview_service, None)
+    await service.stop()
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "viewer@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_document(session: AsyncSession, previews: PreviewService, tenant_id: str, name: str,
+                       content: bytes = TWO_PAGE_PDF) -> str:
+    """원본 파일을 저장소에 쓰고 문서 행을 만든 뒤 ID 문자열을 반환합니다."""
+    path = f"{tenant_id}/{name}"
+    original = previews.original_path(path)
+    os.makedirs(os.path.dirname(original), exist_ok=True)
+    with open(original, "wb") as file:
+        file.write(content)
+    document = Document(
+        tenant_id=tenant_id, name=name, file_type="application/pdf", file_path=path,
+        status=DocumentStatus.PROCESSING,
+    )
+    session.add(document)
+    await session.commit()
+    return str(document.id)
+
+
+class TestDocumentPreviews:
+    """문서 미리보기 API 테스트 클래스"""
+
+    async def test_thumbnail_is_rendered_once_and_revalidated_with_etag(
+        self, test_client: AsyncClient, test_session: AsyncSession, previews: PreviewService, tenant_id: str
+    ):
+        """첫 요청만 렌더링하고 ETag가 맞는 재요청에는 본문 없이 304를 돌려주는지 테스트"""
+        doc_id = await add_document(test_session, previews, tenant_id, "contract.pdf")
+        headers = auth_headers(tenant_id)
+
+        first = await test_client.get(f"/api/v1/documents/{doc_id}/thumbnail", headers=headers)
+        again = await test_client.get(f"/api/v1/documents/{doc_id}/thumbnail", headers=headers)
+        revalidated = await test_client.get(
+            f"/api/v1/documents/{doc_id}/thumbnail", headers={**headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "image/svg+xml"
+        assert first.headers["cache-control"] == "private, max-age=3600"
+        assert first.headers["etag"].startswith('"') and first.headers["etag"].endswith('"')
+        assert again.content == first.content and again.headers["etag"] == first.headers["etag"]
+        assert revalidated.status_code == 304 and revalidated.content == b""
+        assert revalidated.headers["etag"] == first.headers["etag"]
+        assert previews.renders == 1
+        stored = await test_session.execute(select(Document.content_hash).where(Document.tenant_id == tenant_id))
+        assert len(stored.scalar_one()) == 64
+
+    async def test_cache_is_content_addressed_and_widths_are_snapped(
+        self, test_client: AsyncClient, test_session: AsyncSession, previews: PreviewService, tenant_id: str
+    ):
+        """같은 원본의 다른 문서는 캐시를 공유하고, 요청 너비는 허용 너비로 맞추는지 테스트"""
+        first = await add_document(test_session, previews, tenant_id, "a.pdf")
+        copy = await add_document(test_session, previews, tenant_id, "b.pdf")
+        headers = auth_headers(tenant_id)
+
+        page = await test_client.get(f"/api/v1/documents/{first}/pages/2/preview?width=500", headers=headers)
+        same = await test_client.get(f"/api/v1/documents/{copy}/pages/2/preview?width=960", headers=headers)
+        missing = await test_client.get(f"/api/v1/documents/{first}/pages/3/preview", headers=headers)
+
+        assert page.status_code == 200 and b'width="960"' in page.content and b"2 / 2" in page.content
+        assert same.headers["etag"] == page.headers["etag"]
+        assert missing.status_code == 404
+        assert previews.renders == 1
+
+    async def test_concurrent_requests_render_once(
+        self, test_session: AsyncSession, previews: PreviewService, tenant_id: str
+    ):
+        """같은 키를 동시에 요청하면 한 번만 렌더링하는지 테스트"""
+        doc_id = await add_document(test_session, previews, tenant_id, "c.pdf")
+        source = await previews.resolve(test_session, tenant_id, doc_id)
+
+        results = await asyncio.gather(*(previews.render(source, 1, 480) for _ in range(20)))
+
+        assert len({result.content for result in results}) == 1
+        assert previews.renders == 1
+
+    async def test_document_is_scoped_to_tenant(
+        self, test_client: AsyncClient, test_session: AsyncSession, previews: PreviewService, tenant_id: str
+    ):
+        """다른 테넌트 문서, 잘못된 ID, 원본 없는 문서는 404인지 테스트"""
+        doc_id = await add_document(test_session, previews, tenant_id, "d.pdf")
+        bare = Document(tenant_id=tenant_id, name="no-original.pdf")
+        test_session.add(bare)
+        await test_session.commit()
+
+        other = await test_client.get(f"/api/v1/documents/{doc_id}/thumbnail", headers=auth_headers("other"))
+        invalid = await test_client.get("/api/v1/documents/not-a-uuid/thumbnail", headers=auth_headers(tenant_id))
+        no_original = await test_client.get(f"/api/v1/documents/{bare.id}/thumbnail", headers=auth_headers(tenant_id))
+
+        assert [other.status_code, invalid.status_code, no_original.status_code] == [404, 404, 404]
+        assert previews.renders == 0
+
+    async def test_parsed_event_prefetches_thumbnail_and_first_pages(
+        self, test_client: AsyncClient, test_session: AsyncSession, previews: PreviewService, tenant_id: str
+    ):
+        """OCR 완료 이벤트로 썸네일과 앞쪽 페이지를 미리 렌더링해 첫 요청이 캐시에서 나가는지 테스트"""
+        doc_id = await add_document(test_session, previews, tenant_id, "e.pdf")
+        await previews.start()
+
+        previews.on_documents_parsed({
+            "tenant_id": tenant_id, "doc_id": doc_id, "pages": [{"page": 1, "text": ""}, {"page": 2, "text": ""}],
+        })
+        for _ in range(100):
+            if previews.prefetched:
+                break
+            await asyncio.sleep(0.01)
+        rendered = previews.renders
+        response = await test_client.get(f"/api/v1/documents/{doc_id}/pages/2/preview", headers=auth_headers(tenant_id))
+
+        assert previews.prefetched == 3 and rendered == 3
+        assert response.status_code == 200
+        assert previews.renders == 3
+
+    async def test_disk_cache_evicts_least_recently_read_over_budget(self, tmp_path):
+        """디스크 캐시가 예산을 넘으면 가장 오래 읽히지 않은 미리보기부터 지우는지 테스트"""
+        cache = PreviewCache(str(tmp_path / "previews"), memory_bytes=0, disk_bytes=250)
+        cache.put("aa-old", ".svg", b"x" * 100)
+        cache.put("bb-read", ".svg", b"x" * 100)
+        os.utime(cache.path("aa-old", ".svg"), (1, 1))
+        os.utime(cache.path("bb-read", ".svg"), (1, 1))
+        assert cache.get("bb-read", ".svg") is not None
+        os.utime(cache.path("aa-old", ".svg"), (2, 2))
+
+        cache.put("cc-new", ".svg", b"x" * 100)
+
+        assert cache.evicted == 1
+        assert not os.path.exists(cache.path("aa-old", ".svg"))
+        assert cache.get("bb-read", ".svg") is not None and cache.get("cc-new", ".svg") is not None
+
+    async def test_missing_raster_packages_fail_at_start(self, tmp_path, monkeypatch):
+        """raster 렌더러에 필요한 패키지가 없으면 자리표시자로 떨어지지 않고 시작 시 실패하는지 테스트"""
+        monkeypatch.setattr("app.domains.documents.previews.importlib.util.find_spec", lambda name: None)
+        service = PreviewService(cache=PreviewCache(str(tmp_path / "previews")), renderer="raster")
+
+        with pytest.raises(RuntimeError):
+            await service.start()
@@ -0,0 +1,243 @@
+"""
+대시보드 통계 API 테스트
+
+/api/v1/documents/{processing,completed,review}/statistics의 증분 유지, 초 단위 일괄 기록,
+기본 키 조회, 재집계 보정과 재집계 중 기록된 증분, 재집계 리스, 파이프라인 상태 전이 테스트
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.documents.services import DocumentRepository, PipelineStatusHandler
+from app.domains.documents.statistics import StatisticsRecorder, get_statistics_recorder
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 통계가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def recorder(test_engine):
+    """테스트 DB에 기록하는 통계 기록기"""
+    instance = StatisticsRecorder(async_sessionmaker(test_engine, class_=AsyncSession))
+    app.dependency_overrides[get_statistics_recorder] = lambda: instance
+    yield instance
+    app.dependency_overrides.pop(get_statistics_recorder, None)
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 검토자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "reviewer@example.com", "tenant_id": tenant_id, "role": "operator"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_documents(
+    session: AsyncSession, tenant_id: str, status: DocumentStatus, count: int, size: int = 100,
+    age: timedelta = timedelta(0)
+) -> list:
+    """`age` 전에 현재 상태가 된 문서를 만들고 ID 문자열 목록을 반환합니다."""
+    changed_at = datetime.utcnow() - age
+    documents = [
+        Document(tenant_id=tenant_id, name=f"doc-{i}.pdf", size=size, status=status, status_changed_at=changed_at)
+        for i in range(count)
+    ]
+    session.add_all(documents)
+    await session.commit()
+    return [str(document.id) for document in documents]
+
+
+class TestDashboardStatistics:
+    """대시보드 통계 API 테스트 클래스"""
+
+    async def test_review_transitions_update_counters_incrementally(
+        self, test_client: AsyncClient, test_session: AsyncSession, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """승인/반려가 기록 전에도 통계에 반영되고, 기록 후 통계 행과 같은 값인지 테스트"""
+        ids = await add_documents(test_session, tenant_id, DocumentStatus.PENDING_REVIEW, 4, age=timedelta(minutes=30))
+        await add_documents(test_session, tenant_id, DocumentStatus.PROCESSING, 2)
+        await recorder.reconcile(tenant_id)
+        headers = auth_headers(tenant_id)
+
+        await test_client.post("/api/v1/documents/batch-approve", json={"documentIds": ids[:3]}, headers=headers)
+        await test_client.post(
+            "/api/v1/documents/batch-reject", json={"documentIds": ids[3:], "reason": "서명 누락"}, headers=headers
+        )
+        pending = (await test_client.get("/api/v1/documents/review/statistics", headers=headers)).json()
+        assert await recorder.flush() == 1
+        flushed = (await test_client.get("/api/v1/documents/review/statistics", headers=headers)).json()
+        completed = (await test_client.get("/api/v1/documents/completed/statistics", headers=headers)).json()
+        processing = (await test_client.get("/api/v1/documents/processing/statistics", headers=headers)).json()
+
+        assert pending == flushed
+        assert flushed["pending"] == 0 and flushed["totalDocuments"] == 6
+        assert (flushed["approvalRate"], flushed["rejectionRate"]) == (75.0, 25.0)
+        assert flushed["averageProcessingTime"] == pytest.approx(30.0, abs=0.2)
+        assert (completed["completed"], completed["totalSize"]) == (3, 300)
+        assert (processing["processing"], processing["totalDocuments"], processing["completionRate"]) == (2, 6, 50.0)
+
+    async def test_flush_writes_one_statement_per_tenant(
+        self, test_client: AsyncClient, test_engine, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """전이 수와 관계없이 테넌트당 UPDATE 한 번으로 기록하고, 조회는 기본 키 SELECT 한 번인지 테스트"""
+        other = f"{tenant_id}-other"
+        for tenant in (tenant_id, other):
+            recorder.record(tenant, {"processing": 1})
+        await recorder.flush()
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(" ".join(statement.split()[:3]).upper())
+
+        for _ in range(1000):
+            recorder.record(tenant_id, {"processing": -1, "failed": 1})
+            recorder.record(other, {"processing": 1})
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count)
+        try:
+            assert await recorder.flush() == 2
+            flushed = list(statements)
+            statements.clear()
+            response = await test_client.get("/api/v1/documents/processing/statistics", headers=auth_headers(tenant_id))
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", count)
+
+        assert [statement.split()[0] for statement in flushed] == ["SELECT", "UPDATE", "UPDATE"]
+        assert len(statements) == 1 and statements[0].startswith("SELECT")
+        assert (response.json()["processing"], response.json()["failed"]) == (-999, 1000)
+
+    async def test_reconcile_corrects_drift(
+        self, test_client: AsyncClient, test_session: AsyncSession, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """재집계가 상태별 문서 수와 크기를 문서 테이블 기준으로 고치고 누적 카운터는 유지하는지 테스트"""
+        await add_documents(test_session, tenant_id, DocumentStatus.COMPLETED, 2, size=50)
+        recorder.record(tenant_id, {"processing": 5, "approvals": 3})
+        await recorder.flush()
+        headers = auth_headers(tenant_id)
+
+        drifted = (await test_client.get("/api/v1/documents/processing/statistics", headers=headers)).json()
+        corrected = await recorder.reconcile(tenant_id)
+        processing = (await test_client.get("/api/v1/documents/processing/statistics", headers=headers)).json()
+        completed = (await test_client.get("/api/v1/documents/completed/statistics", headers=headers)).json()
+        review = (await test_client.get("/api/v1/documents/review/statistics", headers=headers)).json()
+
+        assert drifted["processing"] == 5
+        assert corrected == 1
+        assert (processing["processing"], processing["totalDocuments"]) == (0, 2)
+        assert (completed["completed"], completed["totalSize"]) == (2, 100)
+        assert review["approvalRate"] == 100.0
+        assert await recorder.reconcile(tenant_id) == 0
+
+    async def test_full_reconcile_locks_and_aggregates_tenants_in_batches(
+        self, test_engine, test_session: AsyncSession, tenant_id: str
+    ):
+        """전체 재집계가 테넌트 배치마다 그 테넌트 문서만 집계해 모든 테넌트를 고치는지 테스트"""
+        batched = StatisticsRecorder(async_sessionmaker(test_engine, class_=AsyncSession), reconcile_batch=2)
+        tenants = [tenant_id, f"{tenant_id}-b", f"{tenant_id}-c"]
+        for tenant in tenants:
+            await add_documents(test_session, tenant, DocumentStatus.FAILED, 1)
+            batched.record(tenant, {"failed": 7})
+        await batched.flush()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            if "GROUP BY" in statement:
+                statements.append([value for value in parameters if isinstance(value, str)])
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            assert await batched.reconcile() >= len(tenants)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+        assert len(statements) > 1 and all(len(batch) <= 2 for batch in statements)
+        for tenant in tenants:
+            snapshot = await batched.snapshot(test_session, tenant)
+            assert snapshot["failed"] == 1
+
+    async def test_transitions_recorded_around_reconcile_are_counted_once(
+        self, test_session: AsyncSession, test_engine, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """재집계의 선기록 직후와 다른 워커에 남은 증분은 집계에 포함돼 버리고, 재집계 후 증분만 더하는지 테스트"""
+        ids = await add_documents(test_session, tenant_id, DocumentStatus.PENDING_REVIEW, 3)
+        await recorder.reconcile(tenant_id)
+        other = StatisticsRecorder(async_sessionmaker(test_engine, class_=AsyncSession), worker_id="other")
+        repository = DocumentRepository(test_session)
+
+        async def approve(target: StatisticsRecorder, doc_id: str) -> None:
+            changed_at = datetime.utcnow()
+            rows = await repository.transition(
+                tenant_id, [UUID(doc_id)], (DocumentStatus.PENDING_REVIEW,), DocumentStatus.APPROVED
+            )
+            await test_session.commit()
+            target.record_transitions(tenant_id, rows, DocumentStatus.APPROVED, changed_at)
+
+        # 다른 워커가 커밋했지만 아직 쓰지 않은 전이
+        await approve(other, ids[0])
+        # 재집계가 모인 증분을 기록한 뒤 집계를 읽기 전에 커밋된 전이
+        flush = recorder.flush
+
+        async def flush_then_approve() -> int:
+            written = await flush()
+            await approve(recorder, ids[1])
+            return written
+
+        recorder.flush = flush_then_approve
+        try:
+            await recorder.reconcile(tenant_id)
+        finally:
+            recorder.flush = flush
+        # 재집계 후에 커밋된 전이
+        await approve(recorder, ids[2])
+
+        expected = {"pending_review": 0, "approved": 3, "completed_size": 300, "total_size": 300}
+        pending = await recorder.snapshot(test_session, tenant_id)
+        await other.flush()
+        await recorder.flush()
+        flushed = await recorder.snapshot(test_session, tenant_id)
+        for counters in (pending, flushed):
+            assert {column: counters[column] for column in expected} == expected
+        assert flushed["approvals"] == 3
+        assert await recorder.reconcile(tenant_id) == 0
+
+    async def test_reconcile_lease_has_single_holder(self, test_engine, recorder: StatisticsRecorder):
+        """리스는 한 워커만 잡고, 가진 워커는 연장하며, 만료되면 다른 워커가 넘겨받는지 테스트"""
+        factory = async_sessionmaker(test_engine, class_=AsyncSession)
+        first = StatisticsRecorder(factory, worker_id=f"first-{uuid4().hex[:6]}")
+        second = StatisticsRecorder(factory, worker_id=f"second-{uuid4().hex[:6]}")
+
+        assert await first.acquire_lease(-1)
+        assert await second.acquire_lease(60)
+        assert not await first.acquire_lease(60)
+        assert await second.acquire_lease(60)
+
+    async def test_pipeline_events_transition_documents_and_record_deltas(
+        self, test_session: AsyncSession, test_engine, recorder: StatisticsRecorder, tenant_id: str
+    ):
+        """업로드/검증 이벤트가 문서 상태를 바꾸고 처리 시간까지 통계 증분으로 기록하는지 테스트"""
+        ids = await add_documents(test_session, tenant_id, DocumentStatus.UPLOADED, 3, age=timedelta(minutes=5))
+        await recorder.reconcile(tenant_id)
+        handler = PipelineStatusHandler(async_sessionmaker(test_engine, class_=AsyncSession), statistics=recorder)
+
+        for doc_id in ids:
+            await handler.on_documents_uploaded({"tenant_id": tenant_id, "doc_id": doc_id})
+        await handler.on_documents_uploaded({"tenant_id": tenant_id, "doc_id": "not-a-uuid"})
+        await handler.on_documents_validated({"tenant_id": tenant_id, "doc_id": ids[0], "status": "validated"})
+        await handler.on_documents_validated({"tenant_id": tenant_id, "doc_id": ids[1], "status": "failed"})
+        await handler.on_documents_validated({"tenant_id": f"{tenant_id}-x", "doc_id": ids[2], "status": "review"})
+
+        counters = await recorder.snapshot(test_session, tenant_id)
+        assert (counters["uploaded"], counters["processing"]) == (0, 1)
+        assert (counters["pending_review"], counters["failed"], counters["processed"]) == (1, 1, 2)
+        await recorder.flush()
+        assert await recorder.reconcile(tenant_id) == 0
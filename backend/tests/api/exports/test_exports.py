@@ -0,0 +1,282 @@
+"""
+내보내기 API 테스트
+
+/api/v1/rag/history/export, /rag/favorites/export, /monitoring/alerts/export의 CSV/NDJSON/gzip
+스트리밍, CSV 수식 주입 차단, 서버 측 커서 배치 인코딩, 비동기 내보내기 작업과 다운로드,
+워커별 하트비트와 중단된 작업 정리, 보관 기간이 지난 작업/파일 삭제 테스트
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.auth.models import UserRole
+from app.domains.auth.schemas import TokenPayload
+from app.domains.exports.models import ExportJob, ExportStatus
+from app.domains.exports.services import ExportService, get_export_service
+from app.domains.monitoring.models import Alert, AlertSeverity
+from app.domains.rag.history import SearchHistoryRecorder
+from app.domains.rag.models import SearchHistory
+from app.domains.rag.schemas import RagQueryResponse
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 데이터가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+async def exports(test_engine, tmp_path):
+    """테스트 DB를 두 행씩 읽고 임시 디렉터리에 작업 파일을 쓰는 내보내기 서비스"""
+    service = ExportService(
+        async_sessionmaker(test_engine, class_=AsyncSession), storage_dir=str(tmp_path), batch_rows=2
+    )
+    app.dependency_overrides[get_export_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_export_service, None)
+    await service.stop()
+
+
+def auth_headers(tenant_id: str, user_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": user_id, "email": "analyst@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_history(session: AsyncSession, tenant_id: str, user_id: str, count: int) -> None:
+    """1분 간격의 검색 기록을 만듭니다."""
+    started = datetime(2024, 1, 1)
+    session.add_all([
+        SearchHistory(
+            tenant_id=tenant_id, user_id=user_id, query=f"질의 {i}, \"따옴표\"", answer=f"답변 {i}",
+            result_count=i, confidence=80, created_at=started + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ])
+    await session.commit()
+
+
+class TestExports:
+    """내보내기 API 테스트 클래스"""
+
+    async def test_history_streams_as_csv_in_order(
+        self, test_client: AsyncClient, test_session: AsyncSession, exports: ExportService, tenant_id: str
+    ):
+        """현재 사용자의 검색 기록만 시간 순서대로 CSV(BOM, 헤더 포함)로 내려받는지 테스트"""
+        user_id = str(uuid4())
+        await add_history(test_session, tenant_id, user_id, 5)
+        await add_history(test_session, tenant_id, str(uuid4()), 3)
+
+        response = await test_client.get("/api/v1/rag/history/export", headers=auth_headers(tenant_id, user_id))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert response.headers["content-disposition"].startswith('attachment; filename="history-')
+        text = response.content.decode("utf-8")
+        assert text.startswith("\ufeff")
+        rows = list(csv.DictReader(io.StringIO(text[1:])))
+        assert [row["query"] for row in rows] == [f"질의 {i}, \"따옴표\"" for i in range(5)]
+        assert list(rows[0]) == [
+            "id", "query", "answer", "timestamp", "resultCount", "confidence", "processingTime"
+        ]
+        assert rows[4]["resultCount"] == "4" and rows[0]["timestamp"] == "2024-01-01T00:00:00"
+
+    async def test_favorites_stream_as_gzip_ndjson(
+        self, test_client: AsyncClient, exports: ExportService, tenant_id: str
+    ):
+        """저장한 즐겨찾기를 gzip NDJSON으로 내려받고 태그 목록이 JSON 배열로 유지되는지 테스트"""
+        headers = auth_headers(tenant_id, str(uuid4()))
+        for i in range(3):
+            created = await test_client.post(
+                "/api/v1/rag/favorites",
+                json={"query": f"계약 해지 조건 {i}", "answer": "30일 전 통보", "tags": ["계약", f"t{i}"]},
+                headers=headers,
+            )
+            assert created.status_code == 201
+
+        response = await test_client.get(
+            "/api/v1/rag/favorites/export", params={"format": "ndjson", "gzip": "true"}, headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.headers["content-disposition"].endswith('.ndjson.gz"')
+        lines = [json.loads(line) for line in gzip.decompress(response.content).decode().splitlines()]
+        assert [line["query"] for line in lines] == [f"계약 해지 조건 {i}" for i in range(3)]
+        assert lines[2]["tags"] == ["계약", "t2"] and set(lines[0]) == {
+            "id", "query", "answer", "savedAt", "category", "tags"
+        }
+
+    async def test_stream_encodes_one_chunk_per_cursor_batch(
+        self, test_session: AsyncSession, exports: ExportService, tenant_id: str
+    ):
+        """서버 측 커서 배치마다 인코딩한 조각을 바로 내보내는지 테스트 (전체를 모으지 않음)"""
+        user_id = str(uuid4())
+        await add_history(test_session, tenant_id, user_id, 7)
+        query = select(SearchHistory.query.label("query")).where(
+            SearchHistory.tenant_id == tenant_id, SearchHistory.user_id == user_id
+        ).order_by(SearchHistory.created_at)
+
+        chunks = [chunk async for chunk in exports.stream(query, "ndjson")]
+
+        assert [len(chunk.splitlines()) for chunk in chunks] == [2, 2, 2, 1]
+
+    async def test_alerts_export_job_writes_file_for_download(
+        self, test_client: AsyncClient, test_session: AsyncSession, exports: ExportService, tenant_id: str
+    ):
+        """mode=job이면 202로 작업을 만들고, 완료 후 다운로드 파일이 스트리밍 결과와 같은지 테스트"""
+        test_session.add_all([
+            Alert(tenant_id=tenant_id, title=f"OCR 지연 {i}", severity=AlertSeverity.HIGH, details={"queue": i})
+            for i in range(5)
+        ])
+        await test_session.commit()
+        user_id = str(uuid4())
+        headers = auth_headers(tenant_id, user_id)
+
+        accepted = await test_client.get(
+            "/api/v1/monitoring/alerts/export", params={"format": "ndjson", "mode": "job"}, headers=headers
+        )
+        await exports.wait()
+        job = await test_client.get(f"/api/v1/exports/{accepted.json()['id']}", headers=headers)
+        downloaded = await test_client.get(job.json()["downloadUrl"], headers=headers)
+        streamed = await test_client.get(
+            "/api/v1/monitoring/alerts/export", params={"format": "ndjson"}, headers=headers
+        )
+        other = await test_client.get(job.json()["downloadUrl"], headers=auth_headers(tenant_id, str(uuid4())))
+
+        assert accepted.status_code == 202 and accepted.json()["status"] == "queued"
+        assert accepted.json()["downloadUrl"] is None
+        assert job.json()["status"] == "completed" and job.json()["rows"] == 5
+        assert job.json()["size"] == len(downloaded.content)
+        assert downloaded.status_code == 200 and downloaded.content == streamed.content
+        assert json.loads(downloaded.content.splitlines()[0])["metadata"] == {"queue": 0}
+        assert other.status_code == 404
+
+    async def test_answered_queries_are_recorded_in_batches(
+        self, test_client: AsyncClient, test_engine, exports: ExportService, tenant_id: str
+    ):
+        """답변한 질의를 모아 한 번에 저장하고 내보내기에 나타나는지 테스트"""
+        recorder = SearchHistoryRecorder(async_sessionmaker(test_engine, class_=AsyncSession), max_pending=3)
+        user_id = str(uuid4())
+        token = TokenPayload(
+            sub=user_id, email="analyst@example.com", tenant_id=tenant_id,
+            role=UserRole.VIEWER, type="access", exp=datetime.now(timezone.utc),
+        )
+        for i in range(4):
+            recorder.record(token, RagQueryResponse(
+                answer="답변", confidence=70, sources=[], query=f"질의 {i}",
+                timestamp=datetime.now(timezone.utc), processing_time=0.1,
+            ))
+
+        assert await recorder.flush() == 3 and recorder.dropped == 1
+        assert await recorder.flush() == 0
+        response = await test_client.get(
+            "/api/v1/rag/history/export", params={"format": "ndjson"}, headers=auth_headers(tenant_id, user_id)
+        )
+        assert [json.loads(line)["query"] for line in response.content.splitlines()] == ["질의 1", "질의 2", "질의 3"]
+
+    async def test_csv_neutralizes_formula_cells(
+        self, test_client: AsyncClient, test_session: AsyncSession, exports: ExportService, tenant_id: str
+    ):
+        """수식으로 해석될 수 있는 사용자 입력은 `'`를 붙여 내보내고 NDJSON은 그대로 두는지 테스트"""
+        user_id = str(uuid4())
+        queries = ['=HYPERLINK("http://evil")', "+1", "-2", "@SUM(A1)", "\tcmd", "\rcmd", "계약 = 30일"]
+        test_session.add_all([
+            SearchHistory(
+                tenant_id=tenant_id, user_id=user_id, query=query, answer="답변", result_count=0, confidence=0,
+                created_at=datetime(2024, 1, 1) + timedelta(minutes=i),
+            )
+            for i, query in enumerate(queries)
+        ])
+        await test_session.commit()
+        headers = auth_headers(tenant_id, user_id)
+
+        response = await test_client.get("/api/v1/rag/history/export", headers=headers)
+        ndjson = await test_client.get("/api/v1/rag/history/export", params={"format": "ndjson"}, headers=headers)
+
+        rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8")[1:], newline="")))
+        assert [row["query"] for row in rows] == [f"'{query}" for query in queries[:-1]] + ["계약 = 30일"]
+        assert rows[0]["resultCount"] == "0"
+        assert [json.loads(line)["query"] for line in ndjson.content.splitlines()] == queries
+
+    async def test_only_jobs_with_stale_heartbeats_are_failed(
+        self, test_session: AsyncSession, test_engine, exports: ExportService, tenant_id: str
+    ):
+        """다른 워커가 실행 중인 작업은 두고, 하트비트가 끊긴 작업만 실패로 표시하는지 테스트"""
+        now = datetime.utcnow()
+        jobs = {
+            name: ExportJob(
+                tenant_id=tenant_id, user_id="u", source="alerts", format="csv", status=ExportStatus.RUNNING,
+                owner=owner, heartbeat_at=heartbeat_at,
+            )
+            for name, owner, heartbeat_at in (
+                ("live", "worker-b", now),
+                ("stale", "worker-b", now - timedelta(minutes=10)),
+                ("mine", exports.worker_id, now),
+            )
+        }
+        test_session.add_all(jobs.values())
+        await test_session.commit()
+        restarted = ExportService(async_sessionmaker(test_engine, class_=AsyncSession), worker_id="worker-c")
+
+        try:
+            await restarted.start(interval=3600)
+            assert await exports.heartbeat() == 1
+        finally:
+            await restarted.stop()
+
+        statuses = {}
+        for name, job in jobs.items():
+            await test_session.refresh(job)
+            statuses[name] = job.status
+        assert statuses == {
+            "live": ExportStatus.RUNNING, "stale": ExportStatus.FAILED, "mine": ExportStatus.RUNNING,
+        }
+
+    async def test_sweep_deletes_expired_jobs_and_files(
+        self, test_session: AsyncSession, exports: ExportService, tmp_path, tenant_id: str
+    ):
+        """보관 기간이 지난 끝난 작업 행과 오래된 파일(행 없는 파일 포함)만 지우는지 테스트"""
+        old = datetime.utcnow() - timedelta(days=8)
+        jobs = {
+            name: ExportJob(
+                tenant_id=tenant_id, user_id="u", source="alerts", format="csv", status=status,
+                owner="worker-b", heartbeat_at=old, updated_at=updated_at, path=f"{tenant_id}/{name}.csv",
+            )
+            for name, status, updated_at in (
+                ("expired", ExportStatus.COMPLETED, old),
+                ("failed", ExportStatus.FAILED, old),
+                ("recent", ExportStatus.COMPLETED, datetime.utcnow()),
+                ("running", ExportStatus.RUNNING, old),
+            )
+        }
+        test_session.add_all(jobs.values())
+        await test_session.commit()
+        ids = {name: job.id for name, job in jobs.items()}
+        os.makedirs(tmp_path / tenant_id)
+        stale = time.time() - 8 * 86400
+        for name in ("expired", "recent", "orphan"):
+            (tmp_path / tenant_id / f"{name}.csv").write_text("a,b\r\n")
+        for name in ("expired", "orphan"):
+            os.utime(tmp_path / tenant_id / f"{name}.csv", (stale, stale))
+
+        assert await ExportService(exports.session_factory, storage_dir=str(tmp_path), batch_rows=1).sweep() == 2
+
+        result = await test_session.execute(select(ExportJob.id).where(ExportJob.tenant_id == tenant_id))
+        assert set(result.scalars()) == {ids["recent"], ids["running"]}
+        assert os.listdir(tmp_path / tenant_id) == ["recent.csv"]
@@ -0,0 +1,135 @@
+"""
+재처리 작업 API 테스트
+
+/api/v1/pipeline 재처리 작업 생성/조회/취소, 배치 단위 실행과 재시작 후 재개, 큐 통계 테스트
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.config import settings
+from app.common.events import EventBus, Topics
+from app.common.security import create_access_token
+from app.domains.pipeline.models import JobStatus, PriorityClass, ReprocessJob
+from app.domains.pipeline.scheduler import PipelineScheduler
+from app.domains.pipeline.services import ReprocessRunner, get_reprocess_runner
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 작업이 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def uploaded() -> list:
+    """재처리로 다시 발행된 documents.uploaded 이벤트"""
+    return []
+
+
+@pytest.fixture
+async def runner(test_engine, uploaded: list, monkeypatch):
+    """테스트 DB와 별도 이벤트 버스를 쓰는 재처리 실행기 (배치당 3건)"""
+    monkeypatch.setattr(settings, "REPROCESS_BATCH_DOCS", 3)
+    bus = EventBus()
+    bus.subscribe(Topics.DOCUMENTS_UPLOADED, uploaded.append)
+    instance = ReprocessRunner(
+        PipelineScheduler(workers=2),
+        async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+        bus,
+        parallelism=2,
+    )
+    app.dependency_overrides[get_reprocess_runner] = lambda: instance
+    yield instance
+    app.dependency_overrides.pop(get_reprocess_runner, None)
+    await instance.stop()
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "operator"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestReprocess:
+    """재처리 작업 API 테스트 클래스"""
+
+    async def test_job_runs_in_batches(
+        self, test_client: AsyncClient, runner: ReprocessRunner, uploaded: list, tenant_id: str
+    ):
+        """재처리 작업이 배치로 나뉘어 실행되고 진행 위치가 기록되는지 테스트"""
+        headers = auth_headers(tenant_id)
+        doc_ids = [f"doc-{i}" for i in range(10)]
+
+        created = await test_client.post("/api/v1/pipeline/reprocess", json={"documentIds": doc_ids}, headers=headers)
+        assert created.status_code == 202
+        job = created.json()
+        assert (job["priority"], job["status"], job["total"], job["batchSize"]) == ("bulk", "queued", 10, 3)
+
+        await runner.start()
+        await runner.scheduler.join()
+
+        assert sorted(event["doc_id"] for event in uploaded) == sorted(doc_ids)
+        assert all(event["reprocess"] and event["job_id"] == job["id"] for event in uploaded)
+        finished = (await test_client.get(f"/api/v1/pipeline/reprocess/{job['id']}", headers=headers)).json()
+        assert (finished["status"], finished["cursor"]) == ("completed", 10)
+        listed = await test_client.get("/api/v1/pipeline/reprocess", headers=headers)
+        assert [j["id"] for j in listed.json()] == [job["id"]]
+        other = await test_client.get(f"/api/v1/pipeline/reprocess/{job['id']}", headers=auth_headers("other"))
+        assert other.status_code == 404
+
+        stats = (await test_client.get("/api/v1/pipeline/queue/stats", headers=headers)).json()
+        bulk = next(entry for entry in stats["classes"] if entry["priority"] == "bulk")
+        assert bulk["tenant"]["wait"]["started"] == 4
+        assert stats["tenantConcurrency"] == runner.scheduler.queue.tenant_concurrency
+
+    async def test_unfinished_job_resumes_from_cursor(
+        self, test_engine, runner: ReprocessRunner, uploaded: list, tenant_id: str
+    ):
+        """재시작 시 끝나지 않은 작업을 기록된 위치부터 이어서 처리하는지 테스트"""
+        session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as session:
+            job = ReprocessJob(
+                tenant_id=tenant_id, priority=PriorityClass.BULK, status=JobStatus.RUNNING,
+                document_ids=[f"doc-{i}" for i in range(8)], total=8, batch_size=3, cursor=3,
+            )
+            session.add(job)
+            await session.commit()
+
+        await runner.start()
+        await runner.scheduler.join()
+
+        assert [event["doc_id"] for event in uploaded if event["tenant_id"] == tenant_id] == [
+            f"doc-{i}" for i in range(3, 8)
+        ]
+        async with session_factory() as session:
+            resumed = await session.get(ReprocessJob, job.id)
+            assert (resumed.status, resumed.cursor) == (JobStatus.COMPLETED, 8)
+
+    async def test_cancel_discards_queued_batches(
+        self, test_client: AsyncClient, runner: ReprocessRunner, uploaded: list, tenant_id: str
+    ):
+        """취소하면 대기 중인 배치가 큐에서 빠지고 interactive 클래스 요청은 거부되는지 테스트"""
+        headers = auth_headers(tenant_id)
+        job = (await test_client.post(
+            "/api/v1/pipeline/reprocess", json={"documentIds": ["a", "b"], "priority": "review"}, headers=headers
+        )).json()
+        assert runner.scheduler.queue.depth(PriorityClass.REVIEW, tenant_id) == 1
+
+        cancelled = await test_client.delete(f"/api/v1/pipeline/reprocess/{job['id']}", headers=headers)
+        interactive = await test_client.post(
+            "/api/v1/pipeline/reprocess", json={"documentIds": ["a"], "priority": "interactive"}, headers=headers
+        )
+
+        assert cancelled.json()["status"] == "cancelled"
+        assert runner.scheduler.queue.depth(PriorityClass.REVIEW, tenant_id) == 0
+        assert runner.active() == 0
+        assert interactive.status_code == 422
+        await runner.scheduler.join()
+        assert uploaded == []
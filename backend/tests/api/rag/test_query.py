@@ -0,0 +1,431 @@
+"""
+RAG 질의 API 테스트
+
+POST /api/v1/rag/query 엔드포인트의 성공/실패 케이스 테스트
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.auth.models import UserRole
+from app.domains.auth.schemas import TokenPayload
+from app.domains.documents.statistics import StatisticsRecorder, get_statistics_recorder
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.services import EmbeddingService
+from app.domains.rag.cache import AnswerCache, get_answer_cache
+from app.domains.rag.citations import (
+    CitationVerifier,
+    DeepVerifier,
+    LexicalEntailmentBackend,
+    ShingleIndex,
+    get_deep_verifier,
+)
+from app.domains.rag.generation import AnswerGenerator, FakeLlmClient
+from app.domains.rag.schemas import RagQueryRequest
+from app.domains.rag.services import RagService, get_rag_service
+from app.domains.search.acl import PermissionIndex
+from app.domains.search.rerank import LexicalRerankBackend, Reranker
+from app.domains.search.keyword_index import LocalKeywordIndex
+from app.domains.search.services import HybridRetriever
+from app.domains.search.vector_index import LocalVectorIndex
+from app.main import app
+
+
+@pytest.fixture
+async def rag_service(tmp_path):
+    """test-tenant에 공개 문서 하나와 그룹 전용 문서 하나를 색인한 RAG 서비스"""
+    backend = HashingEmbeddingBackend(dim=32)
+    embedding = EmbeddingService(lambda: backend, max_wait_ms=0)
+    vectors = LocalVectorIndex(str(tmp_path), dim=32, memtable_rows=1000)
+    keywords = LocalKeywordIndex("")
+    text = "지급 조건: 계약 체결 후 30일 이내 지급한다. 계약번호 CTR-2024-001"
+    await vectors.upsert("test-tenant", "doc-001", ["doc-001:0"], backend.embed([text]))
+    await keywords.on_documents_indexed({
+        "tenant_id": "test-tenant",
+        "doc_id": "doc-001",
+        "doc_name": "계약서_2024.pdf",
+        "chunks": [{"chunk_id": "doc-001:0", "text": text, "page": 3}],
+    })
+    restricted = "지급 조건 특례: 임원 승인 시 60일 이내 지급"
+    await vectors.upsert("test-tenant", "doc-002", ["doc-002:0"], backend.embed([restricted]))
+    await keywords.on_documents_indexed({
+        "tenant_id": "test-tenant",
+        "doc_id": "doc-002",
+        "chunks": [{"chunk_id": "doc-002:0", "text": restricted, "page": 1}],
+    })
+    permissions = PermissionIndex()
+    permissions.on_index_meta({"tenant_id": "test-tenant", "doc_id": "doc-001", "public": True})
+    permissions.on_index_meta({"tenant_id": "test-tenant", "doc_id": "doc-002", "groups": ["finance"]})
+    reranker = Reranker(LexicalRerankBackend, budget_ms=1000)
+    answers = AnswerCache(similarity=0.95, max_entries=100, ttl_seconds=60)
+    generator = AnswerGenerator(FakeLlmClient)
+    deep = DeepVerifier(LexicalEntailmentBackend)
+    verifier = CitationVerifier(ShingleIndex(), deep)
+    service = RagService(
+        HybridRetriever(embedding, vectors, keywords), permissions, reranker, answers, generator, verifier
+    )
+    app.dependency_overrides[get_rag_service] = lambda: service
+    app.dependency_overrides[get_answer_cache] = lambda: answers
+    app.dependency_overrides[get_deep_verifier] = lambda: deep
+    yield service
+    app.dependency_overrides.pop(get_rag_service, None)
+    app.dependency_overrides.pop(get_answer_cache, None)
+    app.dependency_overrides.pop(get_deep_verifier, None)
+    await deep.stop()
+    await reranker.stop()
+    await embedding.stop()
+
+
+def auth_headers(tenant_id: str = "test-tenant", groups: Optional[List[str]] = None) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={
+            "sub": str(uuid4()),
+            "email": "test@example.com",
+            "tenant_id": tenant_id,
+            "role": "viewer",
+            "groups": groups or [],
+        }
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def parse_sse(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """SSE 응답 본문을 (이벤트 이름, 데이터) 목록으로 나눕니다."""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestRagQuery:
+    """RAG 질의 테스트 클래스"""
+
+    async def test_query_returns_sources(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """질의 시 근거 문서가 camelCase 형식으로 반환되는지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "CTR-2024-001 지급 조건", "filters": []},
+            headers=auth_headers(),
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "CTR-2024-001 지급 조건"
+        assert "processingTime" in data
+        source = data["sources"][0]
+        assert source["documentId"] == "doc-001"
+        assert source["documentName"] == "계약서_2024.pdf"
+        assert source["page"] == 3
+        assert "지급 조건" in source["highlight"]
+        assert data["metadata"]["rerank"]["status"] == "reranked"
+        assert data["answer"].endswith("[1]")
+        assert data["metadata"]["generation"]["status"] == "generated"
+        citations = data["metadata"]["citations"]
+        assert citations["cited"] == [{"marker": 1, "documentId": "doc-001", "page": 3}]
+        assert citations["claims"][0]["verdict"] == "supported"
+        assert citations["deep"]["status"] == "pending"
+        assert {"embedMs", "vectorMs", "keywordMs", "retrievalMs", "rerankMs", "totalMs"} <= set(
+            data["metadata"]["timings"]
+        )
+
+    async def test_query_is_scoped_to_tenant_and_filters(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """필터에 없는 문서는 반환되지 않는지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "지급 조건", "filters": ["doc-999"]},
+            headers=auth_headers(),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["sources"] == []
+
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "지급 조건"},
+            headers=auth_headers("other-tenant"),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["sources"] == []
+
+    async def test_query_respects_document_permissions(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """그룹 전용 문서는 해당 그룹 사용자에게만 반환되는지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "지급 조건 특례"},
+            headers=auth_headers(),
+        )
+
+        assert response.status_code == 200
+        assert {s["documentId"] for s in response.json()["sources"]} == {"doc-001"}
+
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "지급 조건 특례"},
+            headers=auth_headers(groups=["finance"]),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["sources"][0]["documentId"] == "doc-002"
+
+    async def test_role_is_not_treated_as_group(self, rag_service: RagService):
+        """역할 이름과 같은 ID의 그룹 권한은 역할만으로 얻지 못하고, 역할 권한은 역할로 얻는지 테스트"""
+        token = TokenPayload(
+            sub="user-1", email="test@example.com", tenant_id="test-tenant",
+            role=UserRole.VIEWER, type="access", exp=datetime.now(timezone.utc),
+        )
+        permissions = rag_service.permissions
+        permissions.on_index_meta({"tenant_id": "test-tenant", "doc_id": "doc-010", "groups": ["viewer"]})
+        permissions.on_index_meta({"tenant_id": "test-tenant", "doc_id": "doc-011", "roles": ["viewer"]})
+
+        assert rag_service.access_for(token).doc_ids() == {"doc-001", "doc-011"}
+
+    async def test_repeated_query_is_served_from_answer_cache(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """같은 권한 범위의 반복 질의는 캐시에서, 다른 범위는 새로 처리되는지 테스트"""
+        first = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        again = await test_client.post(
+            "/api/v1/rag/query", json={"query": "ctr-2024-001  지급 조건?"}, headers=auth_headers()
+        )
+        other_scope = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "CTR-2024-001 지급 조건"},
+            headers=auth_headers(groups=["finance"]),
+        )
+
+        assert first.json()["metadata"]["cache"]["status"] == "miss"
+        assert again.json()["metadata"]["cache"]["status"] == "exact"
+        assert again.json()["sources"] == first.json()["sources"]
+        assert again.json()["query"] == "ctr-2024-001  지급 조건?"
+        assert other_scope.json()["metadata"]["cache"]["status"] == "miss"
+
+        rag_service.answers.on_index_meta({"tenant_id": "test-tenant", "doc_id": "doc-001"})
+        response = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        assert response.json()["metadata"]["cache"]["status"] == "miss"
+
+        stats = await test_client.get("/api/v1/rag/cache/stats", headers=auth_headers())
+        assert stats.status_code == 200
+        data = stats.json()
+        assert data["exactHits"] == 1
+        assert data["misses"] == 3
+        assert data["invalidations"] == 2
+        assert data["savedMs"] > 0
+
+    async def test_answered_queries_update_search_statistics(
+        self,
+        test_client: AsyncClient,
+        test_engine,
+        rag_service: RagService
+    ):
+        """캐시 적중과 근거 없는 질의를 포함해 응답한 질의가 테넌트별 통계에 기록되는지 테스트"""
+        recorder = StatisticsRecorder(async_sessionmaker(test_engine, class_=AsyncSession))
+        rag_service.statistics = recorder
+        app.dependency_overrides[get_statistics_recorder] = lambda: recorder
+        try:
+            for _ in range(2):
+                await test_client.post(
+                    "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+                )
+            await test_client.post(
+                "/api/v1/rag/query", json={"query": "지급 조건"}, headers=auth_headers("empty-tenant")
+            )
+            pending = await test_client.get("/api/v1/rag/statistics", headers=auth_headers())
+            await recorder.flush()
+            flushed = await test_client.get("/api/v1/rag/statistics", headers=auth_headers())
+            empty = await test_client.get("/api/v1/rag/statistics", headers=auth_headers("empty-tenant"))
+            other = await test_client.get("/api/v1/rag/statistics", headers=auth_headers("other-tenant"))
+        finally:
+            app.dependency_overrides.pop(get_statistics_recorder, None)
+
+        assert pending.json() == flushed.json()
+        data = flushed.json()
+        assert (data["totalSearches"], data["successRate"]) == (2, 100.0)
+        assert data["averageResponseTime"] > 0
+        assert (empty.json()["totalSearches"], empty.json()["successRate"]) == (1, 0.0)
+        assert other.json()["totalSearches"] == 0
+
+    async def test_stream_emits_sources_then_tokens_then_citations(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """SSE 스트리밍이 근거 문서, 답변 토큰, 근거 확인, 완료 순으로 이벤트를 보내는지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "CTR-2024-001 지급 조건", "stream": True},
+            headers=auth_headers(),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        names = [name for name, _ in events]
+        assert names[0] == "sources"
+        assert names[-2:] == ["citations", "done"]
+        assert set(names[1:-2]) == {"token"}
+        assert events[0][1]["sources"][0]["documentId"] == "doc-001"
+
+        done = events[-1][1]
+        assert "".join(data["text"] for name, data in events if name == "token").strip() == done["answer"]
+        assert events[-2][1]["cited"][0]["documentId"] == "doc-001"
+        assert "sources" not in done
+        assert {"sourcesMs", "firstTokenMs", "generationMs", "totalMs"} <= set(done["metadata"]["timings"])
+
+        again = await test_client.post(
+            "/api/v1/rag/query",
+            json={"query": "CTR-2024-001 지급 조건", "stream": True},
+            headers={**auth_headers(), "Accept": "application/x-ndjson"},
+        )
+
+        assert again.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in again.text.splitlines()]
+        assert [line["event"] for line in lines] == ["sources", "token", "citations", "done"]
+        assert lines[1]["data"]["text"] == done["answer"]
+        assert lines[-1]["data"]["metadata"]["cache"]["status"] == "exact"
+        assert lines[-1]["data"]["metadata"]["generation"]["status"] == "cached"
+
+    async def test_closed_stream_cancels_generation_and_skips_cache(
+        self,
+        rag_service: RagService
+    ):
+        """스트림을 중간에 닫으면 생성이 멈추고 답변이 캐시에 저장되지 않는지 테스트"""
+        client = FakeLlmClient(token_ms=1, repeat=50)
+        rag_service.generator = AnswerGenerator(lambda: client)
+        token = TokenPayload(
+            sub="user-1", email="test@example.com", tenant_id="test-tenant",
+            role=UserRole.VIEWER, type="access", exp=datetime.now(timezone.utc),
+        )
+
+        events = rag_service.stream(token, RagQueryRequest(query="지급 조건", stream=True))
+        names = []
+        async for name, _ in events:
+            names.append(name)
+            if names.count("token") == 3:
+                break
+        await events.aclose()
+        await asyncio.sleep(0.02)
+
+        assert names[0] == "sources"
+        assert client.emitted == 3
+        assert rag_service.answers.stats("test-tenant")["stores"] == 0
+
+    async def test_deep_verification_can_be_fetched_and_subscribed(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """정밀 근거 검증 결과를 조회(long-poll)/구독할 수 있고 테넌트 밖에서는 404인지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        verification_id = response.json()["metadata"]["citations"]["deep"]["verificationId"]
+
+        fetched = await test_client.get(
+            f"/api/v1/rag/verifications/{verification_id}",
+            params={"wait_ms": 1000},
+            headers=auth_headers(),
+        )
+        assert fetched.status_code == 200
+        data = fetched.json()
+        assert data["status"] == "done"
+        assert data["results"][0]["documentId"] == "doc-001"
+        assert data["results"][0]["verdict"] == "entailed"
+
+        subscribed = await test_client.get(
+            f"/api/v1/rag/verifications/{verification_id}/events", headers=auth_headers()
+        )
+        assert parse_sse(subscribed.text) == [("verification", data)]
+
+        other = await test_client.get(
+            f"/api/v1/rag/verifications/{verification_id}", headers=auth_headers("other-tenant")
+        )
+        assert other.status_code == 404
+
+    async def test_cached_answer_reports_current_deep_status(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService
+    ):
+        """캐시 적중 응답이 저장 당시의 pending이 아니라 현재 정밀 검증 상태를 보여주는지 테스트"""
+        first = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        deep = first.json()["metadata"]["citations"]["deep"]
+        assert deep["status"] == "pending"
+        await rag_service.verifier.deep.wait("test-tenant", deep["verificationId"], 1.0)
+
+        cached = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        metadata = cached.json()["metadata"]
+        assert metadata["cache"]["status"] == "exact"
+        assert metadata["citations"]["deep"] == {"status": "done", "verificationId": deep["verificationId"]}
+
+        rag_service.verifier.deep._results.clear()
+        expired = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        assert expired.json()["metadata"]["citations"]["deep"] == {"status": "expired", "verificationId": None}
+
+    async def test_verification_expired_while_subscribed(
+        self,
+        test_client: AsyncClient,
+        rag_service: RagService,
+        monkeypatch
+    ):
+        """구독 중 검증 결과가 만료되어 사라지면 500 대신 expired 이벤트를 보내는지 테스트"""
+        response = await test_client.post(
+            "/api/v1/rag/query", json={"query": "CTR-2024-001 지급 조건"}, headers=auth_headers()
+        )
+        verification_id = response.json()["metadata"]["citations"]["deep"]["verificationId"]
+        deep = rag_service.verifier.deep
+        wait = deep.wait
+
+        async def evicted(tenant_id: str, verification_id: str, timeout: float):
+            deep._results.pop(verification_id, None)
+            return await wait(tenant_id, verification_id, timeout)
+
+        monkeypatch.setattr(deep, "wait", evicted)
+        subscribed = await test_client.get(
+            f"/api/v1/rag/verifications/{verification_id}/events", headers=auth_headers()
+        )
+
+        assert subscribed.status_code == 200
+        assert parse_sse(subscribed.text) == [
+            ("verification", {"verificationId": verification_id, "status": "expired", "results": []})
+        ]
+
+    async def test_query_requires_authentication(self, test_client: AsyncClient):
+        """인증 없이 질의 시 실패하는지 테스트"""
+        response = await test_client.post("/api/v1/rag/query", json={"query": "지급 조건"})
+
+        assert response.status_code == 403
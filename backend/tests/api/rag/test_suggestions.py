@@ -0,0 +1,139 @@
+"""
+검색어 자동완성 API 테스트
+
+/api/v1/rag/suggestions의 테넌트/사용자 분리, 첫 요청 때 테넌트 색인 적재, 응답 형식 테스트
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.documents.models import Document, DocumentStatus
+from app.domains.rag.models import SearchHistory
+from app.domains.rag.suggestions import SuggestionIndex, get_suggestion_index
+from app.domains.search.acl import permission_index
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 데이터가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def suggestions(test_engine):
+    """테스트 DB로 색인을 구성하는 자동완성 색인"""
+    index = SuggestionIndex(async_sessionmaker(test_engine, class_=AsyncSession))
+    app.dependency_overrides[get_suggestion_index] = lambda: index
+    yield index
+    app.dependency_overrides.pop(get_suggestion_index, None)
+
+
+def auth_headers(tenant_id: str, user_id: Optional[str] = None) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": user_id or str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestSuggestions:
+    """검색어 자동완성 API 테스트 클래스"""
+
+    async def test_first_request_loads_tenant_from_history_and_documents(
+        self, test_client: AsyncClient, test_session: AsyncSession, suggestions: SuggestionIndex, tenant_id: str
+    ):
+        """첫 요청 때 그 테넌트의 검색 기록과 문서 제목만 읽어 색인을 만들고 인기 순으로 제안하는지 테스트"""
+        now = datetime.utcnow()
+        document = Document(
+            tenant_id=tenant_id, name="계약서_2024.pdf", file_type="pdf", size=1,
+            status=DocumentStatus.COMPLETED, status_changed_at=now,
+        )
+        test_session.add_all([
+            *(
+                SearchHistory(tenant_id=tenant_id, user_id="u1", query="계약 해지 조건", created_at=now)
+                for _ in range(3)
+            ),
+            *(SearchHistory(tenant_id=tenant_id, user_id="u1", query="계약 갱신", created_at=now) for _ in range(2)),
+            SearchHistory(
+                tenant_id=tenant_id, user_id="u1", query="계약 만료", created_at=now - timedelta(days=365)
+            ),
+            SearchHistory(tenant_id=tenant_id, user_id="u2", query="계약 해지 합의금", created_at=now),
+            SearchHistory(tenant_id="other-tenant", user_id="u3", query="계약 비밀", created_at=now),
+            document,
+        ])
+        await test_session.commit()
+        permission_index.on_index_meta({"tenant_id": tenant_id, "doc_id": str(document.id), "public": True})
+
+        response = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "계야", "limit": 10}, headers=auth_headers(tenant_id, "u1")
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["text"] for item in body] == ["계약 해지 조건", "계약 갱신", "계약서_2024"]
+        assert body[0] == {"text": "계약 해지 조건", "category": "query", "popularity": 100}
+        assert body[2]["category"] == "document"
+        stats = suggestions.stats()
+        assert (stats["loaded"], stats["tenants"], stats["users"]) == (1, 1, 2)
+
+    async def test_events_apply_only_to_loaded_tenants(
+        self, test_client: AsyncClient, suggestions: SuggestionIndex, tenant_id: str
+    ):
+        """적재 전 이벤트는 버리고(적재 때 DB에서 읽음), 적재 후 이벤트는 바로 반영하는지 테스트"""
+        suggestions.on_documents_indexed({"tenant_id": tenant_id, "doc_id": "doc-1", "doc_name": "분기 보고서.pdf"})
+        suggestions.on_query_answered(tenant_id, "u1", "분기 매출")
+        assert suggestions.stats()["terms"] == 0
+
+        await suggestions.load(tenant_id)
+        permission_index.on_index_meta({"tenant_id": tenant_id, "doc_id": "doc-2", "public": True})
+        suggestions.on_documents_indexed({"tenant_id": tenant_id, "doc_id": "doc-2", "doc_name": "분기 실적.pdf"})
+        suggestions.on_query_answered(tenant_id, "u1", "분기 손익")
+
+        response = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "분기"}, headers=auth_headers(tenant_id, "u1")
+        )
+
+        assert sorted(item["text"] for item in response.json()) == ["분기 손익", "분기 실적"]
+
+    async def test_suggestions_are_scoped_to_tenant(
+        self, test_client: AsyncClient, suggestions: SuggestionIndex, tenant_id: str
+    ):
+        """다른 테넌트의 질의는 제안하지 않고, limit만큼만 돌려주는지 테스트"""
+        for i in range(3):
+            suggestions.record_query(tenant_id, "u1", f"보고서 요약 {i}")
+        suggestions.record_query("other-tenant", "u1", "보고서 비공개")
+
+        response = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "보고서", "limit": 2}, headers=auth_headers(tenant_id, "u1")
+        )
+        other = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "보고서"},
+            headers=auth_headers(f"tenant-{uuid4().hex[:8]}", "u1"),
+        )
+
+        assert len(response.json()) == 2
+        assert all(item["text"].startswith("보고서 요약") for item in response.json())
+        assert other.status_code == 200 and other.json() == []
+
+    async def test_past_queries_are_not_shared_between_users(
+        self, test_client: AsyncClient, suggestions: SuggestionIndex, tenant_id: str
+    ):
+        """같은 테넌트라도 다른 사용자의 과거 질의는 제안하지 않는지 테스트"""
+        suggestions.record_query(tenant_id, "u1", "임원 연봉 인상안")
+
+        own = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "임원"}, headers=auth_headers(tenant_id, "u1")
+        )
+        other = await test_client.get(
+            "/api/v1/rag/suggestions", params={"q": "임원"}, headers=auth_headers(tenant_id, "u2")
+        )
+
+        assert [item["text"] for item in own.json()] == ["임원 연봉 인상안"]
+        assert other.status_code == 200 and other.json() == []
@@ -0,0 +1,98 @@
+"""
+질의 트렌드 API 테스트
+
+/api/v1/rag/trends 응답 형식과 워커 간 버킷 병합, 재시작 후 버킷 복원 테스트
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.security import create_access_token
+from app.domains.rag.models import TrendBucket
+from app.domains.rag.trends import TrendTracker, get_trend_tracker
+from app.main import app
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 데이터가 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(test_engine, class_=AsyncSession)
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "viewer"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestTrends:
+    """질의 트렌드 API 테스트 클래스"""
+
+    async def test_workers_merge_buckets_and_restore_after_restart(
+        self, test_client: AsyncClient, test_session: AsyncSession, session_factory, tenant_id: str
+    ):
+        """두 워커의 증분이 같은 버킷 행에 합쳐지고, 새 프로세스가 시작 시 그대로 읽는지 테스트"""
+        first = TrendTracker(session_factory, width=256, depth=4, capacity=5)
+        second = TrendTracker(session_factory, width=256, depth=4, capacity=5)
+        for _ in range(3):
+            first.record(tenant_id, "계약 해지 조건")
+        second.record(tenant_id, "계약 해지 조건")
+        second.record(tenant_id, "보고서 요약")
+
+        assert await first.flush() == 6
+        assert await second.flush() == 6
+        await first.flush()
+
+        for tracker in (first, second):
+            trends = tracker.trends(tenant_id, "day", 5)
+            assert [(item.text, item.count) for item in trends.queries] == [("계약 해지 조건", 4), ("보고서 요약", 1)]
+            assert trends.total == 5
+        rows = (await test_session.execute(
+            select(TrendBucket).where(TrendBucket.tenant_id == tenant_id, TrendBucket.granularity == "day")
+        )).scalars().all()
+        assert {row.track: row.version for row in rows} == {"queries": 2, "topics": 2}
+
+        restarted = TrendTracker(session_factory, width=256, depth=4, capacity=5)
+        await restarted.start(interval=3600)
+        app.dependency_overrides[get_trend_tracker] = lambda: restarted
+        try:
+            response = await test_client.get(
+                "/api/v1/rag/trends", params={"window": "week", "limit": 1}, headers=auth_headers(tenant_id)
+            )
+        finally:
+            app.dependency_overrides.pop(get_trend_tracker, None)
+            await restarted.stop()
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["window"] == "week" and body["total"] == 5 and body["previousTotal"] == 0
+        assert body["queries"] == [{"text": "계약 해지 조건", "count": 4, "previousCount": 0, "growth": None}]
+        assert body["topics"][0] == {"text": "계약", "count": 4, "previousCount": 0, "growth": None}
+
+    async def test_trends_are_scoped_to_tenant(
+        self, test_client: AsyncClient, session_factory, tenant_id: str
+    ):
+        """다른 테넌트의 질의는 보이지 않는지 테스트"""
+        tracker = TrendTracker(session_factory, width=256, depth=4, capacity=5)
+        tracker.record("other-tenant", "비공개 질의")
+        app.dependency_overrides[get_trend_tracker] = lambda: tracker
+        try:
+            response = await test_client.get(
+                "/api/v1/rag/trends", params={"window": "hour"}, headers=auth_headers(tenant_id)
+            )
+        finally:
+            app.dependency_overrides.pop(get_trend_tracker, None)
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0 and response.json()["queries"] == []
@@ -0,0 +1,233 @@
+"""
+검증 규칙 API 테스트
+
+/api/v1/validation 규칙 CRUD, 규칙 테스트, 버전별 실행 계획 재컴파일, 동시 버전 행 생성, 초안 규칙 시험 실행 테스트
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.events import EventBus, Topics
+from app.common.security import create_access_token
+from app.domains.validation.dedup import NearDuplicateIndex
+from app.domains.validation.dryrun import DryRunner, SampleStore, get_dry_runner, get_sample_store
+from app.domains.validation.models import ValidationRuleSet
+from app.domains.validation.services import (
+    PlanCache,
+    ValidationRuleRepository,
+    ValidationWorker,
+    get_plan_cache,
+)
+from app.main import app
+
+
+@pytest.fixture
+def plans():
+    """테스트마다 새로 만드는 실행 계획 캐시"""
+    cache = PlanCache()
+    app.dependency_overrides[get_plan_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_plan_cache, None)
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    """테스트 간 규칙이 섞이지 않도록 매번 새 테넌트를 씁니다."""
+    return f"tenant-{uuid4().hex[:8]}"
+
+
+def auth_headers(tenant_id: str) -> dict:
+    """테넌트 사용자의 액세스 토큰 헤더를 만듭니다."""
+    token = create_access_token(
+        data={"sub": str(uuid4()), "email": "test@example.com", "tenant_id": tenant_id, "role": "operator"}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def create_rule(client: AsyncClient, tenant_id: str, **body: Any) -> Dict[str, Any]:
+    """규칙을 만들고 응답 본문을 반환합니다."""
+    response = await client.post("/api/v1/validation/rules", json=body, headers=auth_headers(tenant_id))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+class TestValidationRules:
+    """검증 규칙 API 테스트 클래스"""
+
+    async def test_rule_crud_is_tenant_scoped(self, test_client: AsyncClient, plans: PlanCache, tenant_id: str):
+        """규칙을 생성/수정/삭제하고 다른 테넌트에는 보이지 않는지 테스트"""
+        rule = await create_rule(
+            test_client, tenant_id,
+            name="전화번호 형식 검증", fieldType="phone", validationType="regex",
+            regex=r"^01[0-9]-?[0-9]{4}-?[0-9]{4}$",
+        )
+        assert rule["isActive"] is True
+        assert rule["humanReviewRequired"] is False
+
+        listed = await test_client.get("/api/v1/validation/rules", headers=auth_headers(tenant_id))
+        assert [r["id"] for r in listed.json()] == [rule["id"]]
+        other = await test_client.get("/api/v1/validation/rules", headers=auth_headers("other-tenant"))
+        assert other.json() == []
+
+        updated = await test_client.put(
+            f"/api/v1/validation/rules/{rule['id']}", json={"isActive": False}, headers=auth_headers(tenant_id)
+        )
+        assert updated.status_code == 200
+        assert updated.json()["isActive"] is False
+        assert updated.json()["regex"] == rule["regex"]
+
+        deleted = await test_client.delete(f"/api/v1/validation/rules/{rule['id']}", headers=auth_headers(tenant_id))
+        assert deleted.status_code == 204
+        missing = await test_client.delete(f"/api/v1/validation/rules/{rule['id']}", headers=auth_headers(tenant_id))
+        assert missing.status_code == 404
+
+    async def test_invalid_rules_are_rejected(self, test_client: AsyncClient, plans: PlanCache, tenant_id: str):
+        """잘못된 정규식이나 임계값 없는 임계값 규칙은 저장되지 않는지 테스트"""
+        bad_regex = await test_client.post(
+            "/api/v1/validation/rules",
+            json={"name": "r", "fieldType": "text", "validationType": "regex", "regex": "(["},
+            headers=auth_headers(tenant_id),
+        )
+        no_threshold = await test_client.post(
+            "/api/v1/validation/rules",
+            json={"name": "t", "fieldType": "number", "validationType": "threshold"},
+            headers=auth_headers(tenant_id),
+        )
+
+        assert bad_regex.status_code == 422
+        assert no_threshold.status_code == 422
+        assert no_threshold.json()["detail"]["error_code"] == "INVALID_VALIDATION_RULE"
+
+    async def test_rule_test_endpoint(self, test_client: AsyncClient, plans: PlanCache, tenant_id: str):
+        """저장된 규칙을 입력값 하나에 적용해 보는지 테스트"""
+        rule = await create_rule(
+            test_client, tenant_id,
+            name="신뢰도 임계값 검증", fieldType="number", validationType="threshold", threshold=80,
+        )
+
+        passed = await test_client.post(
+            "/api/v1/validation/test", json={"ruleId": rule["id"], "testData": "85"}, headers=auth_headers(tenant_id)
+        )
+        failed = await test_client.post(
+            "/api/v1/validation/test", json={"ruleId": rule["id"], "testData": "72.5"}, headers=auth_headers(tenant_id)
+        )
+
+        assert passed.json()["passed"] is True
+        assert failed.json()["passed"] is False
+        assert failed.json()["message"] == "임계값 미만"
+        assert failed.json()["details"]["ruleId"] == rule["id"]
+
+    async def test_plan_recompiles_only_on_version_change(
+        self, test_client: AsyncClient, plans: PlanCache, tenant_id: str
+    ):
+        """규칙 집합 버전이 바뀔 때만 실행 계획을 다시 컴파일하는지 테스트"""
+        headers = auth_headers(tenant_id)
+        await create_rule(test_client, tenant_id, name="이메일", fieldType="email", validationType="format")
+
+        first = (await test_client.get("/api/v1/validation/plan/stats", headers=headers)).json()
+        again = (await test_client.get("/api/v1/validation/plan/stats", headers=headers)).json()
+        assert first["version"] == again["version"] == 1
+        assert again["compiles"] == 1
+
+        await create_rule(test_client, tenant_id, name="금액", fieldType="number", validationType="threshold",
+                          fieldName="amount", threshold=0)
+        latest = (await test_client.get("/api/v1/validation/plan/stats", headers=headers)).json()
+        assert latest["version"] == 2
+        assert latest["compiles"] == 2
+        assert len(latest["rules"]) == 2
+
+    async def test_bump_version_survives_concurrent_first_insert(self, test_session: AsyncSession, tenant_id: str):
+        """UPDATE가 행을 못 찾은 뒤 다른 요청이 먼저 버전 행을 만들어도 버전이 한 번 더 오르는지 테스트"""
+        repository = ValidationRuleRepository(test_session)
+        execute = test_session.execute
+        raced = False
+
+        async def racing(statement, *args, **kwargs):
+            nonlocal raced
+            result = await execute(statement, *args, **kwargs)
+            if not raced:
+                # 첫 UPDATE 직후 다른 요청이 버전 1 행을 만든 것처럼 끼워 넣는다
+                raced = True
+                await execute(insert(ValidationRuleSet).values(tenant_id=tenant_id, version=1))
+            return result
+
+        test_session.execute = racing
+        try:
+            await repository.bump_version(tenant_id)
+        finally:
+            del test_session.execute
+        await test_session.commit()
+
+        assert await repository.get_version(tenant_id) == 2
+
+    async def test_worker_publishes_validated_documents(
+        self, test_client: AsyncClient, test_engine, plans: PlanCache, tenant_id: str, tmp_path
+    ):
+        """검증 워커가 parsed 배치를 검증해 documents.validated를 발행하는지 테스트"""
+        await create_rule(test_client, tenant_id, name="이메일", fieldType="email", validationType="format")
+        await create_rule(test_client, tenant_id, name="휴먼검토", fieldType="text", validationType="human_review",
+                          fieldName="memo", humanReviewRequired=True)
+        bus = EventBus()
+        published = []
+        bus.subscribe(Topics.DOCUMENTS_VALIDATED, published.append)
+        duplicates = NearDuplicateIndex(str(tmp_path), num_perm=64, bands=16)
+        worker = ValidationWorker(async_sessionmaker(test_engine, class_=AsyncSession), plans, bus, duplicates)
+        body = "제1조 (목적) 본 계약은 갑과 을 사이의 용역 제공에 관한 사항을 정함을 목적으로 한다. " * 3
+
+        await worker.handle_batch([
+            {"tenant_id": tenant_id, "doc_id": "doc-1", "extracted_fields": {"email": "kim@example.com"},
+             "pages": [{"page": 1, "text": body}]},
+            {"tenant_id": tenant_id, "doc_id": "doc-2", "extracted_fields": {"email": "kim@"}},
+            {"tenant_id": tenant_id, "doc_id": "doc-3", "extracted_fields": {"memo": "특약"},
+             "pages": [{"page": 1, "text": body}]},
+        ])
+
+        assert [(e["doc_id"], e["status"]) for e in published] == [
+            ("doc-1", "validated"), ("doc-2", "failed"), ("doc-3", "review"),
+        ]
+        assert published[1]["errors"][0]["message"] == "형식 검증 실패"
+        assert published[0]["rules_version"] == 2
+        assert plans.compiles(tenant_id) == 1
+        assert [e["duplicate"] for e in published] == [False, False, True]
+        assert published[2]["duplicate_of"]["doc_id"] == "doc-1"
+
+    async def test_dry_run_streams_draft_rule_stats(self, test_client: AsyncClient, tenant_id: str):
+        """초안 규칙을 최근 표본에 적용해 진행 통계를 NDJSON으로 보내고 잘못된 초안은 거부하는지 테스트"""
+        samples = SampleStore(max_docs=100)
+        samples.record(tenant_id, [
+            {"doc_id": f"doc-{i}", "extracted_fields": {"email": "kim@" if i % 4 == 0 else "kim@example.com"}}
+            for i in range(40)
+        ])
+        runner = DryRunner(workers=1, chunk_docs=10, executor=ThreadPoolExecutor(max_workers=1))
+        app.dependency_overrides[get_sample_store] = lambda: samples
+        app.dependency_overrides[get_dry_runner] = lambda: runner
+        try:
+            response = await test_client.post(
+                "/api/v1/validation/dry-run",
+                json={"rules": [{"name": "이메일", "fieldType": "email", "validationType": "format"}], "sampleSize": 30},
+                headers={**auth_headers(tenant_id), "Accept": "application/x-ndjson"},
+            )
+            invalid = await test_client.post(
+                "/api/v1/validation/dry-run",
+                json={"rules": [{"name": "t", "fieldType": "number", "validationType": "threshold"}]},
+                headers=auth_headers(tenant_id),
+            )
+        finally:
+            app.dependency_overrides.pop(get_sample_store, None)
+            app.dependency_overrides.pop(get_dry_runner, None)
+            await runner.stop()
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert events[-1]["event"] == "done" and {e["event"] for e in events[:-1]} == {"progress"}
+        done = events[-1]["data"]
+        assert (done["evaluated"], done["failed"]) == (30, 7)
+        assert done["rules"][0]["ruleId"] == "draft-1" and done["rules"][0]["failures"] == 7
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"]["error_code"] == "INVALID_VALIDATION_RULE"
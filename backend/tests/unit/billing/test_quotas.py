@@ -0,0 +1,144 @@
+"""
+쿼터 집행기 테스트
+
+한도 확인과 계량, 윈도우 몫 나누기, 사용률 경계 이벤트, 여러 워커의 한도 초과 상한 검증
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.common.exceptions import QuotaExceeded, QuotaThrottled
+from app.domains.billing import quotas as quotas_module
+from app.domains.billing.metering import UsageMeter
+from app.domains.billing.quotas import QuotaEnforcer
+
+
+class FakeClock:
+    """윈도우 번호를 직접 넘기는 시계입니다."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(quotas_module, "time", clock)
+    return clock
+
+
+def enforcer(limit: int = 100, workers: int = 4, min_slice: int = 5) -> QuotaEnforcer:
+    meter = UsageMeter(session_factory=lambda: None, relay=None, window=10.0, worker_id="w1")
+    target = QuotaEnforcer(
+        session_factory=lambda: None, meter=meter, relay=None, workers=workers, min_slice=min_slice,
+        thresholds=[80, 100], default_plan="starter", enabled=True,
+    )
+    target._allowance("t", "queries").limit = limit
+    return target
+
+
+def sync(target: QuotaEnforcer, total: int) -> None:
+    """워커가 증분을 기록하고 전체 누적을 다시 읽은 것처럼 만듭니다."""
+    target.meter._open.clear()
+    target.meter._committed["t"] = (target.period, {"queries": total})
+    epoch = int(quotas_module.time.time() // target.meter.window)
+    for (tenant_id, metric), allowance in target._allowances.items():
+        target._reslice(tenant_id, metric, allowance, epoch, announce=True)
+    target._synced_at = datetime.utcnow()
+
+
+class TestQuotaEnforcer:
+    """쿼터 집행기 테스트 클래스"""
+
+    def test_admit_meters_until_limit_without_sync(self, clock: FakeClock):
+        """누적을 읽기 전에는 한도만 확인하며, 받아들인 양이 계량되고 넘으면 거부되는지 테스트"""
+        target = enforcer(limit=3)
+        for _ in range(3):
+            target.admit("t", "queries")
+
+        with pytest.raises(QuotaExceeded) as exc_info:
+            target.admit("t", "queries")
+        assert exc_info.value.retry_after >= 1
+        assert target.meter.pending("t", "queries") == 3
+        assert target.status("t")["queries"] == (3, 3)
+        # 한도가 없는 지표는 계량만 한다
+        target.admit("t", "documents", 0)
+        assert target.status("other")["documents"] == (500, 0)
+
+    def test_new_tenant_gets_its_share_of_remaining_limit(self, clock: FakeClock):
+        """처음 보는 테넌트는 최소 몫이 아니라 남은 한도의 1/워커 수를 바로 받는지 테스트"""
+        target = enforcer(limit=100, workers=4, min_slice=5)
+        sync(target, 0)
+
+        for _ in range(500):
+            target.admit("new", "queries")
+        with pytest.raises(QuotaThrottled):
+            target.admit("new", "queries")
+        assert target._allowances[("new", "queries")].share == 2000 // 4
+
+    def test_share_is_provisional_until_refresh(self, clock: FakeClock):
+        """새 윈도우에는 다른 워커가 지난 몫을 다 썼다고 보고 나누고, 누적을 다시 읽으면 다시 나누는지 테스트"""
+        target = enforcer(limit=100, workers=4, min_slice=5)
+        sync(target, 20)
+        assert target._allowances[("t", "queries")].share == 20
+
+        clock.now += 10
+        # (100 - 20 - 3 x 20) // 4
+        for _ in range(5):
+            target.admit("t", "queries")
+        with pytest.raises(QuotaThrottled) as exc_info:
+            target.admit("t", "queries")
+        assert exc_info.value.retry_after >= 1
+
+        # 이번 윈도우에 받아들인 5건은 기록 전이어도 몫에서 쓴 것으로 본다
+        sync(target, 25)
+        assert target._allowances[("t", "queries")].share == (100 - 25 + 5) // 4
+        target.admit("t", "queries", 10)
+
+    def test_threshold_events_fire_once_per_level(self, clock: FakeClock):
+        """80%, 100% 경계를 처음 넘을 때만 event_key가 붙은 이벤트를 모으는지 테스트"""
+        target = enforcer(limit=10)
+        for _ in range(7):
+            target.admit("t", "queries")
+        assert target._alerts == []
+
+        target.admit("t", "queries")
+        target.admit("t", "queries")
+        target.admit("t", "queries")
+        with pytest.raises(QuotaExceeded):
+            target.admit("t", "queries")
+
+        payloads = [payload for payload, _ in target._alerts]
+        assert [payload["threshold"] for payload in payloads] == [80, 100]
+        assert payloads[0]["event_key"] == f"t:{target.period}:queries:80"
+        assert (payloads[1]["used"], payloads[1]["limit"], payloads[1]["plan"]) == (10, 10, "starter")
+        assert target._wakeup.is_set()
+
+    def test_overshoot_is_bounded_by_workers_times_min_slice(self, clock: FakeClock):
+        """모든 워커가 몫을 끝까지 써도 전체 초과가 워커 수 x 최소 몫 이내인지 테스트"""
+        limit, workers, min_slice = 1000, 4, 5
+        fleet = [enforcer(limit, workers, min_slice) for _ in range(workers)]
+        total = 0
+        for target in fleet:
+            sync(target, total)
+
+        for _ in range(50):
+            clock.now += 10
+            # 누적을 다시 읽기 전(임시 몫)과 후(나눈 몫) 모두 요청을 끝까지 받는다
+            for phase in range(2):
+                for target in fleet:
+                    while True:
+                        try:
+                            target.admit("t", "queries")
+                        except (QuotaExceeded, QuotaThrottled):
+                            break
+                        total += 1
+                if phase == 0:
+                    for target in fleet:
+                        sync(target, total)
+
+        assert limit <= total <= limit + workers * min_slice
@@ -0,0 +1,53 @@
+"""
+사용량 계량기 테스트
+
+지표 검증, 윈도우 닫기와 멱등 키, 파이프라인 이벤트별 계량 검증
+"""
+
+import pytest
+
+from app.domains.billing.metering import USAGE_METRICS, UsageMeter
+
+
+def meter() -> UsageMeter:
+    return UsageMeter(session_factory=lambda: None, relay=None, worker_id="w1")
+
+
+class TestUsageMeter:
+    """사용량 계량기 테스트 클래스"""
+
+    def test_unknown_metric_is_rejected(self):
+        """누적 컬럼에 없는 지표는 기록 시점에 거부되는지 테스트"""
+        target = meter()
+        with pytest.raises(ValueError):
+            target.record("tenant", "storage")
+        assert set(USAGE_METRICS) == {"requests", "queries", "documents", "pages", "tokens", "embedding_tokens"}
+
+    def test_closed_windows_get_tenant_keys_per_sequence(self):
+        """윈도우를 닫을 때마다 순번이 늘고 테넌트별로 증분이 나뉘는지 테스트"""
+        target = meter()
+        target.record("a", "requests", 3)
+        target.record("b", "pages", 5)
+        assert target._close_window() == 2
+        assert target._close_window() == 0
+        target.record("a", "requests")
+        target._close_window()
+
+        assert [(delta.key, delta.usage) for delta in target._closed] == [
+            ("a:w1:1", {"requests": 3}),
+            ("b:w1:1", {"pages": 5}),
+            ("a:w1:2", {"requests": 1}),
+        ]
+        first, _, second = target._closed
+        assert first.start <= first.end <= second.start
+
+    def test_pipeline_events_are_metered(self):
+        """업로드(재처리 제외), 파싱 페이지, 임베딩 토큰이 각 지표로 더해지는지 테스트"""
+        target = meter()
+        target.on_documents_uploaded({"tenant_id": "t", "doc_id": "d1"})
+        target.on_documents_uploaded({"tenant_id": "t", "doc_id": "d1", "reprocess": True})
+        target.on_documents_parsed({"tenant_id": "t", "pages": [{"page": 1, "text": ""}] * 4})
+        target.on_documents_indexed({"tenant_id": "t", "chunks": [{"token_count": 10}, {"token_count": 5}]})
+
+        assert dict(target._open["t"]) == {"documents": 1, "pages": 4, "embedding_tokens": 15}
+        assert target.pending("t", "pages") == 4 and target.pending("other", "pages") == 0
@@ -0,0 +1,98 @@
+"""
+스트리밍 청커 테스트
+
+토큰 예산, 겹침, 페이지 구간(provenance) 검증
+"""
+
+import pytest
+
+from app.domains.embedding.chunker import (
+    ChunkSpan,
+    PageText,
+    StreamingChunker,
+    regex_token_spans,
+)
+
+
+def _words(n: int, prefix: str = "w") -> str:
+    return " ".join(f"{prefix}{i}" for i in range(n))
+
+
+class TestStreamingChunker:
+    """스트리밍 청커 테스트 클래스"""
+
+    def test_token_budget_and_overlap(self):
+        """청크가 토큰 예산을 지키고 지정한 만큼 겹치는지 테스트"""
+        chunker = StreamingChunker(max_tokens=10, overlap_tokens=3)
+        chunks = list(chunker.chunk("doc-1", [PageText(1, _words(25))]))
+
+        assert [c.token_count for c in chunks] == [10, 10, 10, 4]
+        assert chunks[0].text.split()[-3:] == chunks[1].text.split()[:3]
+        assert chunks[-1].text.split()[-1] == "w24"
+        assert chunks[2].chunk_id == "doc-1:2"
+
+    def test_no_trailing_overlap_only_chunk(self):
+        """남은 토큰이 겹침뿐이면 추가 청크를 만들지 않는지 테스트"""
+        chunker = StreamingChunker(max_tokens=10, overlap_tokens=3)
+        chunks = list(chunker.chunk("doc-1", [PageText(1, _words(17))]))
+
+        assert len(chunks) == 2
+        assert chunks[1].text.split()[-1] == "w16"
+
+    def test_chunk_spans_pages_with_provenance(self):
+        """페이지를 넘나드는 청크의 페이지/오프셋 구간 테스트"""
+        page1 = "가나 다라 마바"
+        page2 = "사아 자차"
+        chunker = StreamingChunker(max_tokens=4, overlap_tokens=1)
+        chunks = list(chunker.chunk("doc-2", iter([PageText(1, page1), PageText(2, page2)])))
+
+        first = chunks[0]
+        assert first.spans == (ChunkSpan(1, 0, len(page1)), ChunkSpan(2, 0, 2))
+        assert first.text == "가나 다라 마바\n사아"
+        assert first.page == 1
+        assert chunks[1].spans[0] == ChunkSpan(2, 0, len(page2))
+
+        for chunk in chunks:
+            for span in chunk.spans:
+                source = page1 if span.page == 1 else page2
+                assert source[span.start:span.end] in chunk.text
+
+    def test_payload_and_release(self):
+        """이벤트 페이로드 변환과 원문 참조 해제 테스트"""
+        chunker = StreamingChunker(max_tokens=50, overlap_tokens=0)
+        chunk = next(chunker.chunk("doc-3", [PageText(3, "계약 금액은 1,000원이다.")]))
+
+        chunk.release()
+        payload = chunk.to_payload()
+        assert payload["doc_id"] == "doc-3"
+        assert payload["chunk_id"] == "doc-3:0"
+        assert payload["page"] == 3
+        assert payload["text"] == "계약 금액은 1,000원이다."
+        assert payload["spans"] == [{"page": 3, "start": 0, "end": len(payload["text"])}]
+
+    def test_custom_token_spans(self):
+        """외부 토크나이저 오프셋 함수 사용 테스트"""
+        def char_spans(text):
+            return [(i, i + 1) for i, ch in enumerate(text) if not ch.isspace()]
+
+        chunker = StreamingChunker(max_tokens=3, overlap_tokens=0, token_spans=char_spans)
+        chunks = list(chunker.chunk("doc-4", [PageText(1, "abcdefg")]))
+
+        assert [c.text for c in chunks] == ["abc", "def", "g"]
+
+    def test_empty_pages(self):
+        """빈 페이지만 있는 경우 청크가 없는지 테스트"""
+        chunker = StreamingChunker(max_tokens=5, overlap_tokens=1)
+        assert list(chunker.chunk("doc-5", [PageText(1, ""), PageText(2, "   ")])) == []
+
+    @pytest.mark.parametrize("max_tokens, overlap", [(0, 0), (-1, 0), (5, 5), (5, -1)])
+    def test_invalid_budget(self, max_tokens, overlap):
+        """잘못된 토큰 예산 설정 테스트"""
+        with pytest.raises(ValueError):
+            StreamingChunker(max_tokens=max_tokens, overlap_tokens=overlap)
+
+    def test_regex_token_spans(self):
+        """기본 정규식 토큰화 오프셋 테스트"""
+        text = "제1조(목적) 본 계약은"
+        tokens = [text[s:e] for s, e in regex_token_spans(text)]
+        assert tokens == ["제1조", "(", "목적", ")", "본", "계약은"]
@@ -0,0 +1,159 @@
+"""
+임베딩 캐시 테스트
+
+정규화 키, LRU/디스크 계층, 미적중만 계산, 모델 버전 무효화와 로컬 아티팩트 없는 교체 방지 검증
+"""
+
+import numpy as np
+import pytest
+
+from app.common.config import settings
+from app.common.events import EventBus, Topics
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.cache import EmbeddingCache, MmapVectorStore, content_digest
+from app.domains.embedding.services import EmbeddingService
+
+
+class CountingBackend(HashingEmbeddingBackend):
+    """계산한 텍스트를 기록하는 테스트용 백엔드"""
+
+    def __init__(self, model_version: str = "1"):
+        super().__init__(dim=8, model_version=model_version)
+        self.computed = []
+
+    def embed(self, texts):
+        self.computed.extend(texts)
+        return super().embed(texts)
+
+
+MODEL = ("hashing", "1")
+
+
+class TestEmbeddingCache:
+    """임베딩 캐시 테스트 클래스"""
+
+    def test_digest_normalizes_whitespace_and_width(self):
+        """공백/전각 문자 차이가 같은 키가 되는지 테스트"""
+        assert content_digest("계약  금액\n１２３") == content_digest(" 계약 금액 123 ")
+        assert content_digest("계약 금액") != content_digest("계약금액")
+
+    def test_hot_tier_lru_eviction(self):
+        """핫 계층이 LRU로 항목 수를 제한하는지 테스트"""
+        cache = EmbeddingCache(directory=None, hot_entries=2)
+        keys = cache.keys(["a", "b", "c"])
+        cache.put_many(keys, np.eye(3, 4, dtype=np.float32), MODEL)
+
+        _, missing = cache.get_many(keys, MODEL, 4)
+        assert missing == [0]
+        assert cache.stats()["hot_entries"] == 2
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """디스크 계층이 재시작 후에도 벡터를 제공하는지 테스트"""
+        vectors = np.random.RandomState(0).rand(3000, 8).astype(np.float32)
+        keys = [i.to_bytes(16, "big") for i in range(3000)]
+
+        cache = EmbeddingCache(directory=str(tmp_path), hot_entries=0)
+        cache.put_many(keys, vectors, MODEL)
+        cache.close()
+
+        reopened = EmbeddingCache(directory=str(tmp_path), hot_entries=0)
+        loaded, missing = reopened.get_many(keys[::7], MODEL, 8)
+        assert missing == []
+        np.testing.assert_array_equal(loaded, vectors[::7])
+        assert reopened.stats()["disk_entries"] == 3000
+
+    def test_store_drops_torn_key(self, tmp_path):
+        """일부만 기록된 마지막 키를 버리는지 테스트"""
+        store = MmapVectorStore(str(tmp_path), dim=4)
+        store.append([b"k" * 16], np.ones((1, 4), dtype=np.float32))
+        store.close()
+        with open(tmp_path / "keys.bin", "ab") as f:
+            f.write(b"x" * 7)
+
+        reopened = MmapVectorStore(str(tmp_path), dim=4)
+        assert len(reopened) == 1
+        assert (tmp_path / "keys.bin").stat().st_size == 16
+        reopened.append([b"y" * 16], np.full((1, 4), 2, dtype=np.float32))
+        assert reopened.lookup([b"k" * 16, b"y" * 16]) == [0, 1]
+
+    def test_invalidate_model_removes_old_versions(self, tmp_path):
+        """이전 모델 버전의 핫/디스크 캐시 폐기 테스트"""
+        cache = EmbeddingCache(directory=str(tmp_path))
+        keys = cache.keys(["문서"])
+        cache.put_many(keys, np.ones((1, 4), dtype=np.float32), ("m", "1"))
+        cache.put_many(keys, np.ones((1, 4), dtype=np.float32), ("m", "2"))
+
+        assert cache.invalidate_model("m", keep_version="2") == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["m@2"]
+        _, missing = cache.get_many(keys, ("m", "2"), 4)
+        assert missing == []
+
+
+class TestCachedEmbeddingService:
+    """캐시를 사용하는 임베딩 서비스 테스트 클래스"""
+
+    @pytest.fixture
+    async def service(self, tmp_path):
+        backend = CountingBackend()
+        service = EmbeddingService(
+            lambda: backend, max_wait_ms=1, cache=EmbeddingCache(str(tmp_path))
+        )
+        yield service
+        await service.stop()
+
+    async def test_computes_only_unique_misses(self, service: EmbeddingService):
+        """미적중이면서 중복되지 않은 텍스트만 계산하는지 테스트"""
+        footer = "본 문서는 대외비입니다."
+        first = await service.embed_documents([footer, "제1조 목적", footer + "  "])
+        second = await service.embed_documents(["제1조 목적", "제2조 기간", footer])
+
+        assert sorted(service.backend.computed) == sorted([footer, "제1조 목적", "제2조 기간"])
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(first[1], second[0])
+
+        cache_stats = service.stats()["cache"]
+        assert cache_stats["hits"] == 2
+        assert cache_stats["misses"] == 4
+        assert cache_stats["hit_rate"] == pytest.approx(2 / 6)
+        assert cache_stats["saved_seconds"] >= 0
+
+    async def test_model_registered_event_invalidates(self, service: EmbeddingService, monkeypatch):
+        """새 모델 버전 등록 이벤트로 캐시가 무효화되는지 테스트"""
+        monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "hashing")
+        await service.embed_documents(["갑과 을"])
+
+        bus = EventBus()
+        bus.subscribe(Topics.ML_MODELS_REGISTERED, service.on_model_registered)
+        await bus.publish(Topics.ML_MODELS_REGISTERED, {"model_id": "other", "version": "9"})
+        assert service.backend.model_version == "1"
+
+        await bus.publish(Topics.ML_MODELS_REGISTERED, {"model_id": "hashing", "version": "2"})
+        # 이벤트 처리 후 생성될 백엔드를 테스트용으로 교체
+        service._backend_factory = lambda: CountingBackend(model_version="2")
+        await service.embed_documents(["갑과 을"])
+
+        assert service.backend.model_version == "2"
+        assert service.backend.computed == ["갑과 을"]
+        assert service.stats()["cache"]["misses"] == 2
+
+    async def test_model_without_local_artifact_is_not_swapped(
+        self, service: EmbeddingService, monkeypatch, tmp_path
+    ):
+        """ONNX 백엔드는 아티팩트가 로컬 디렉터리가 아니면 교체하지 않고 캐시도 유지하는지 테스트"""
+        monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx")
+        await service.embed_documents(["갑과 을"])
+        factory = service._backend_factory
+
+        await service.on_model_registered(
+            {"model_id": "hashing", "version": "2", "artifact_uri": "s3://models/minilm/2"}
+        )
+        await service.on_model_registered({"model_id": "hashing", "version": "2"})
+        assert service._backend_factory is factory
+        assert service.backend.model_version == "1"
+        await service.embed_documents(["갑과 을"])
+        assert service.stats()["cache"]["hits"] == 1
+
+        await service.on_model_registered(
+            {"model_id": "hashing", "version": "2", "artifact_uri": str(tmp_path)}
+        )
+        assert service._backend_factory.keywords == {"model_version": "2", "model_dir": str(tmp_path)}
@@ -0,0 +1,105 @@
+"""
+임베딩 서비스 테스트
+
+마이크로배칭, 질의 우선순위, 길이 정렬, 시작 시 백엔드 설정 검증
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.common.config import settings
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.services import EmbeddingPriority, EmbeddingService
+
+
+class RecordingBackend(HashingEmbeddingBackend):
+    """호출된 배치를 기록하는 테스트용 백엔드"""
+
+    def __init__(self):
+        super().__init__(dim=16)
+        self.batches = []
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        return super().embed(texts)
+
+
+@pytest.fixture
+async def service():
+    backend = RecordingBackend()
+    service = EmbeddingService(lambda: backend, max_batch_size=4, max_wait_ms=20)
+    await service.start()
+    yield service
+    await service.stop()
+
+
+class TestEmbeddingService:
+    """임베딩 서비스 테스트 클래스"""
+
+    async def test_results_match_backend(self, service: EmbeddingService):
+        """배칭을 거친 결과가 요청 순서대로 백엔드 결과와 같은지 테스트"""
+        texts = ["계약서 제1조", "a", "payment terms and conditions", "갑과 을"]
+        vectors = await service.embed_documents(texts)
+
+        expected = HashingEmbeddingBackend(dim=16).embed(texts)
+        assert vectors.shape == (4, 16)
+        np.testing.assert_allclose(vectors, expected, rtol=1e-6)
+
+    async def test_concurrent_requests_are_batched(self, service: EmbeddingService):
+        """여러 호출자의 요청이 하나의 배치로 모이는지 테스트"""
+        results = await asyncio.gather(
+            *(service.embed_query(f"질의 {i}") for i in range(4))
+        )
+
+        assert len(results) == 4
+        assert service.backend.batches == [sorted((f"질의 {i}" for i in range(4)), key=len)]
+        assert service.stats()["avg_batch_size"] == 4
+
+    async def test_batches_sorted_by_length(self, service: EmbeddingService):
+        """모인 요청이 길이순으로 정렬되어 배치되는지 테스트"""
+        texts = ["x" * n for n in (9, 1, 7, 3, 8, 2, 6, 4)]
+        await service.embed_documents(texts)
+
+        lengths = [len(t) for batch in service.backend.batches for t in batch]
+        assert lengths == sorted(lengths)
+        assert all(len(batch) <= 4 for batch in service.backend.batches)
+
+    async def test_queries_take_priority(self, service: EmbeddingService):
+        """질의가 대기 중인 문서 청크보다 먼저 처리되는지 테스트"""
+        documents = asyncio.create_task(
+            service.embed_documents([f"문서 청크 {i}" for i in range(8)])
+        )
+        query = asyncio.create_task(service.embed_query("급한 질의"))
+        await asyncio.gather(documents, query)
+
+        assert "급한 질의" in service.backend.batches[0]
+
+    async def test_empty_input(self, service: EmbeddingService):
+        """빈 입력 처리 테스트"""
+        vectors = await service.embed([], EmbeddingPriority.DOCUMENT)
+        assert vectors.shape == (0, 16)
+
+    async def test_backend_error_propagates(self):
+        """백엔드 오류가 호출자에게 전달되는지 테스트"""
+        class FailingBackend(HashingEmbeddingBackend):
+            def embed(self, texts):
+                raise RuntimeError("model unavailable")
+
+        service = EmbeddingService(lambda: FailingBackend(dim=8), max_wait_ms=1)
+        try:
+            with pytest.raises(RuntimeError, match="model unavailable"):
+                await service.embed_query("질의")
+        finally:
+            await service.stop()
+
+    async def test_misconfigured_backend_fails_at_start(self, monkeypatch):
+        """ONNX 모델 디렉터리가 없으면 첫 요청이 아니라 시작 시점에 실패하는지 테스트"""
+        monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx")
+        monkeypatch.setattr(settings, "EMBEDDING_ONNX_DIR", None)
+        service = EmbeddingService()
+
+        with pytest.raises(RuntimeError, match="EMBEDDING_ONNX_DIR"):
+            await service.start()
+        assert service._task is None
@@ -0,0 +1,42 @@
+"""
+색인 워커 테스트
+
+documents.parsed → 청킹/임베딩/업서트 → documents.indexed 흐름 검증
+"""
+
+from app.common.events import EventBus, Topics
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.chunker import StreamingChunker
+from app.domains.embedding.services import EmbeddingService
+from app.domains.embedding.worker import IndexingWorker
+from app.domains.search.vector_index import LocalVectorIndex
+
+
+class TestIndexingWorker:
+    """색인 워커 테스트 클래스"""
+
+    async def test_parsed_event_is_indexed_and_published(self, tmp_path):
+        """파싱 이벤트가 색인되고 indexed 이벤트가 발행되는지 테스트"""
+        embedding = EmbeddingService(lambda: HashingEmbeddingBackend(dim=16), max_wait_ms=0)
+        index = LocalVectorIndex(str(tmp_path), dim=16, memtable_rows=1000)
+        bus = EventBus()
+        published = []
+        bus.subscribe(Topics.DOCUMENTS_INDEXED, published.append)
+        worker = IndexingWorker(embedding, index, StreamingChunker(max_tokens=8, overlap_tokens=2), bus)
+
+        await worker.handle_parsed({
+            "tenant_id": "t",
+            "doc_id": "doc-1",
+            "pages": [
+                {"page": 1, "text": "공급 계약서 제1조 계약 금액은 일금 일억원으로 한다."},
+                {"page": 2, "text": "제2조 납품 기한은 계약일로부터 30일 이내로 한다."},
+            ],
+        })
+        await embedding.stop()
+
+        assert len(published) == 1
+        chunks = published[0]["chunks"]
+        assert len(chunks) > 1
+        query = embedding.backend.embed([chunks[0]["text"]])[0]
+        hits = await index.search("t", query, k=1)
+        assert hits[0].chunk_id == chunks[0]["chunk_id"]
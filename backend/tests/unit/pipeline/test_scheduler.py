@@ -0,0 +1,175 @@
+"""
+파이프라인 스케줄러 테스트
+
+테넌트 간 공정 배분, 우선순위 클래스 가중치, 테넌트 동시 실행 상한, 대기 시간 통계,
+단계 이벤트 핸들러의 공정 큐 경유 검증
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.domains.pipeline.models import PriorityClass
+from app.domains.pipeline.scheduler import INDEX_STAGE_KIND, FairScheduler, PipelineScheduler, WorkItem
+
+WEIGHTS = {PriorityClass.INTERACTIVE: 16.0, PriorityClass.REVIEW: 4.0, PriorityClass.BULK: 1.0}
+
+
+def item(tenant_id: str, priority: PriorityClass = PriorityClass.BULK, cost: float = 1.0, **payload) -> WorkItem:
+    """테스트용 작업을 만듭니다."""
+    return WorkItem(tenant_id, priority, "test", payload, cost=cost)
+
+
+def drain(scheduler: FairScheduler, count: int) -> list:
+    """작업을 꺼내 바로 완료 처리하며 순서대로 반환합니다."""
+    order = []
+    for _ in range(count):
+        work = scheduler.next()
+        if work is None:
+            break
+        scheduler.complete(work)
+        order.append(work)
+    return order
+
+
+class TestFairScheduler:
+    """가중 공정 큐 테스트 클래스"""
+
+    def test_bulk_tenant_does_not_starve_others(self):
+        """먼저 쌓인 대량 작업 뒤에 들어온 다른 테넌트 작업이 바로 번갈아 실행되는지 테스트"""
+        scheduler = FairScheduler(WEIGHTS, tenant_concurrency=100)
+        for i in range(1000):
+            scheduler.submit(item("heavy", seq=i))
+        drain(scheduler, 10)
+        for tenant in ("a", "b", "c"):
+            scheduler.submit(item(tenant))
+
+        order = [work.tenant_id for work in drain(scheduler, 8)]
+
+        # 1000건 뒤에 줄 서지 않고 다음 네 번 안에 모두 실행된다
+        assert {"a", "b", "c"} <= set(order[:4])
+        assert scheduler.depth(PriorityClass.BULK, "heavy") == 1000 - 10 - order.count("heavy")
+
+    def test_weighted_share_by_cost_and_tenant_weight(self):
+        """문서 수(cost)와 테넌트 가중치에 비례해 처리량을 나누는지 테스트"""
+        scheduler = FairScheduler(WEIGHTS, tenant_concurrency=100)
+        scheduler.set_tenant_weight("premium", 3.0)
+        for _ in range(400):
+            scheduler.submit(item("basic", cost=10))
+            scheduler.submit(item("premium", cost=10))
+            scheduler.submit(item("tiny", cost=1))
+
+        served = Counter()
+        for work in drain(scheduler, 300):
+            served[work.tenant_id] += work.cost
+
+        assert 2.7 <= served["premium"] / served["basic"] <= 3.3
+        assert 0.8 <= served["tiny"] / served["basic"] <= 1.2
+
+    def test_priority_classes_share_by_weight(self):
+        """interactive가 가중치만큼 우선하되 bulk도 멈추지 않는지 테스트"""
+        scheduler = FairScheduler(WEIGHTS, tenant_concurrency=100)
+        for _ in range(500):
+            for priority in PriorityClass:
+                scheduler.submit(item("t", priority))
+
+        served = Counter(work.priority for work in drain(scheduler, 210))
+
+        assert served[PriorityClass.INTERACTIVE] == 160
+        assert served[PriorityClass.REVIEW] == 40
+        assert served[PriorityClass.BULK] == 10
+
+    def test_tenant_concurrency_cap(self):
+        """상한에 걸린 테넌트는 건너뛰고 슬롯이 나면 다시 후보가 되는지 테스트"""
+        scheduler = FairScheduler(WEIGHTS, tenant_concurrency=2)
+        for _ in range(5):
+            scheduler.submit(item("a", PriorityClass.INTERACTIVE))
+            scheduler.submit(item("a", PriorityClass.BULK))
+        scheduler.submit(item("b"))
+
+        running = [scheduler.next() for _ in range(3)]
+        assert [work.tenant_id for work in running] == ["a", "a", "b"]
+        assert scheduler.next() is None
+        assert scheduler.running("a") == 2
+
+        scheduler.complete(running[0])
+        resumed = scheduler.next()
+        assert resumed.tenant_id == "a"
+        assert scheduler.next() is None
+
+    def test_discard_and_wait_stats(self):
+        """대기 작업 제거와 클래스/테넌트별 대기 시간 통계 테스트"""
+        now = [0.0]
+        scheduler = FairScheduler(WEIGHTS, tenant_concurrency=10, clock=lambda: now[0])
+        for i in range(4):
+            scheduler.submit(WorkItem("a", PriorityClass.REVIEW, "test", {"job": i % 2}, enqueued_at=0.0))
+        now[0] = 0.5
+
+        assert scheduler.discard(lambda work: work.payload["job"] == 1) == 2
+        assert len(drain(scheduler, 10)) == 2
+        stats = scheduler.stats("a")
+        review = next(entry for entry in stats["classes"] if entry["priority"] == "review")
+        assert review["queued"] == 0
+        assert review["wait"]["started"] == 2 and review["wait"]["p95Ms"] == 500.0
+        assert review["tenant"]["wait"]["p50Ms"] == 500.0
+
+    async def test_dispatcher_runs_handlers_within_cap(self):
+        """디스패처가 등록된 실행 함수로 작업을 돌리고 테넌트 상한을 지키는지 테스트"""
+        dispatcher = PipelineScheduler(workers=4, queue=FairScheduler(WEIGHTS, tenant_concurrency=1))
+        active, peak, done = Counter(), Counter(), []
+
+        async def handler(work: WorkItem) -> None:
+            active[work.tenant_id] += 1
+            peak[work.tenant_id] = max(peak[work.tenant_id], active[work.tenant_id])
+            await asyncio.sleep(0.001)
+            active[work.tenant_id] -= 1
+            done.append(work.payload["n"])
+
+        dispatcher.register("test", handler)
+        await dispatcher.start()
+        try:
+            for n in range(20):
+                dispatcher.submit(WorkItem(f"t{n % 2}", PriorityClass.BULK, "test", {"n": n}))
+            await asyncio.wait_for(dispatcher.join(), timeout=5)
+        finally:
+            await dispatcher.stop()
+
+        assert sorted(done) == list(range(20))
+        assert peak == {"t0": 1, "t1": 1}
+
+    async def test_stage_handler_waits_for_fair_admission(self):
+        """단계 핸들러가 우선순위대로 큐를 거쳐 실행되고, 끝난 뒤 반환하거나 실패를 올리는지 테스트"""
+        dispatcher = PipelineScheduler(workers=1, queue=FairScheduler(WEIGHTS, tenant_concurrency=10))
+        release, order = asyncio.Event(), []
+
+        async def index(event: dict) -> None:
+            if event["doc_id"] == "first":
+                await release.wait()
+            if event["doc_id"] == "broken":
+                raise ValueError("색인 실패")
+            order.append(event["doc_id"])
+
+        staged = dispatcher.stage(INDEX_STAGE_KIND, index)
+        await dispatcher.start()
+        try:
+            first = asyncio.create_task(staged({"tenant_id": "heavy", "doc_id": "first", "priority": "bulk"}))
+            await asyncio.sleep(0.01)
+            bulk = [
+                asyncio.create_task(staged({"tenant_id": "heavy", "doc_id": f"bulk-{i}", "priority": "bulk"}))
+                for i in range(50)
+            ]
+            upload = asyncio.create_task(staged({"tenant_id": "other", "doc_id": "upload"}))
+            await asyncio.sleep(0.01)
+            assert order == [] and not upload.done()
+            assert dispatcher.queue.depth(PriorityClass.BULK, "heavy") == 50
+
+            release.set()
+            await asyncio.wait_for(asyncio.gather(first, upload, *bulk), timeout=5)
+            # 대량 재처리 50건 뒤가 아니라 실행 중이던 작업 바로 다음에 실행된다
+            assert order[:2] == ["first", "upload"] and len(order) == 52
+
+            with pytest.raises(ValueError):
+                await asyncio.wait_for(staged({"tenant_id": "other", "doc_id": "broken"}), timeout=5)
+        finally:
+            await dispatcher.stop()
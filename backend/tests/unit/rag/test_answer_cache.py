@@ -0,0 +1,137 @@
+"""
+RAG 답변 캐시 테스트
+
+정규화/의미 일치, 권한 범위 분리, 문서 변경 무효화와 무효화 세대 정리, 용량 제한 검증
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.domains.embedding.backends import l2_normalize
+from app.domains.rag.cache import (
+    CACHE_EXACT,
+    CACHE_MISS,
+    CACHE_SEMANTIC,
+    AnswerCache,
+    answer_scope,
+    normalize_query,
+)
+from app.domains.rag.schemas import RagQueryResponse, RagSource
+from app.domains.search.acl import PermissionIndex
+
+
+def make_response(query: str, *doc_ids: str) -> RagQueryResponse:
+    """문서들을 인용한 응답을 만듭니다."""
+    return RagQueryResponse(
+        answer="30일 이내",
+        confidence=90,
+        sources=[
+            RagSource(document_id=d, document_name=d, page=1, confidence=90, highlight="")
+            for d in doc_ids
+        ],
+        query=query,
+        timestamp=datetime.now(timezone.utc),
+        processing_time=0.1,
+    )
+
+
+def vector(*values: float) -> np.ndarray:
+    """정규화된 질의 벡터를 만듭니다."""
+    return l2_normalize(np.asarray([values], dtype=np.float32))[0]
+
+
+SCOPE = answer_scope(None, None, 5)
+
+
+class TestAnswerCache:
+    """답변 캐시 테스트 클래스"""
+
+    def test_normalized_text_and_semantic_matches(self):
+        """정규화 텍스트가 같거나 임베딩이 충분히 가까우면 적중하는지 테스트"""
+        cache = AnswerCache(similarity=0.95, max_entries=10, ttl_seconds=60)
+        epoch = cache.lookup("t", "지급 조건은?", vector(1, 0, 0), SCOPE).epoch
+        cache.put("t", "지급 조건은?", vector(1, 0, 0), SCOPE, make_response("q", "doc-1"), 120.0, epoch)
+
+        assert normalize_query("  지급   조건은？ ") == "지급 조건은"
+        exact = cache.lookup("t", "지급  조건은", vector(0, 1, 0), SCOPE)
+        assert exact.kind == CACHE_EXACT
+
+        semantic = cache.lookup("t", "지급 조건 알려줘", vector(1, 0.1, 0), SCOPE)
+        assert semantic.kind == CACHE_SEMANTIC
+        assert semantic.similarity > 0.95
+
+        assert cache.lookup("t", "해지 조건", vector(1, 1, 0), SCOPE).kind == CACHE_MISS
+        assert cache.lookup("other", "지급 조건은?", vector(1, 0, 0), SCOPE).kind == CACHE_MISS
+
+        stats = cache.stats("t")
+        assert (stats["exact_hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 2)
+        assert stats["saved_ms"] == 240.0
+
+    def test_scope_follows_effective_permissions(self):
+        """허용 문서 집합이 다르면 범위가 달라 답변이 공유되지 않는지 테스트"""
+        permissions = PermissionIndex()
+        permissions.on_index_meta({"tenant_id": "t", "doc_id": "a", "groups": ["g1", "g2"]})
+        permissions.on_index_meta({"tenant_id": "t", "doc_id": "b", "groups": ["g2"]})
+
+        first = answer_scope(permissions.access_filter("t", "u1", ["g1"]), None, 5)
+        same = answer_scope(permissions.access_filter("t", "u2", ["g1"]), None, 5)
+        wider = answer_scope(permissions.access_filter("t", "u3", ["g2"]), None, 5)
+        assert first == same
+        assert first != wider
+        assert first != answer_scope(permissions.access_filter("t", "u1", ["g1"]), frozenset({"a"}), 5)
+
+        permissions.on_index_meta({"tenant_id": "t", "doc_id": "b", "groups": ["g1"]})
+        assert answer_scope(permissions.access_filter("t", "u1", ["g1"]), None, 5) != first
+
+    def test_index_meta_invalidates_citing_entries_only(self):
+        """문서 변경 시 그 문서를 인용한 항목만 무효화되는지 테스트"""
+        cache = AnswerCache(similarity=0.99, max_entries=10, ttl_seconds=60)
+        cache.put("t", "질문1", vector(1, 0, 0), SCOPE, make_response("q", "doc-1", "doc-2"), 10, 0)
+        cache.put("t", "질문2", vector(0, 1, 0), SCOPE, make_response("q", "doc-3"), 10, 0)
+
+        cache.on_index_meta({"tenant_id": "t", "doc_id": "doc-2"})
+
+        assert cache.lookup("t", "질문1", vector(1, 0, 0), SCOPE).kind == CACHE_MISS
+        assert cache.lookup("t", "질문2", vector(0, 1, 0), SCOPE).kind == CACHE_EXACT
+        assert cache.stats("t")["invalidations"] == 1
+
+    def test_answers_citing_changed_documents_are_not_stored(self):
+        """조회 이후 인용 문서가 바뀌었으면 응답을 저장하지 않는지 테스트"""
+        cache = AnswerCache(similarity=0.99, max_entries=10, ttl_seconds=60)
+        epoch = cache.lookup("t", "질문", vector(1, 0, 0), SCOPE).epoch
+        cache.invalidate_document("t", "doc-1")
+
+        assert cache.put("t", "질문", vector(1, 0, 0), SCOPE, make_response("q", "doc-1"), 10, epoch) is None
+        assert cache.put("t", "질문", vector(1, 0, 0), SCOPE, make_response("q", "doc-2"), 10, epoch)
+        assert cache.stats("t")["stale_skipped"] == 1
+
+    def test_lru_eviction(self):
+        """테넌트당 최대 항목 수를 넘으면 가장 오래 쓰지 않은 항목을 제거하는지 테스트"""
+        cache = AnswerCache(similarity=0.99, max_entries=2, ttl_seconds=60)
+        cache.put("t", "a", vector(1, 0, 0), SCOPE, make_response("a", "d"), 10, 0)
+        cache.put("t", "b", vector(0, 1, 0), SCOPE, make_response("b", "d"), 10, 0)
+        cache.lookup("t", "a", vector(1, 0, 0), SCOPE)
+        cache.put("t", "c", vector(0, 0, 1), SCOPE, make_response("c", "d"), 10, 0)
+
+        assert cache.lookup("t", "b", vector(0, 1, 0), SCOPE).kind == CACHE_MISS
+        assert cache.lookup("t", "a", vector(1, 0, 0), SCOPE).kind == CACHE_EXACT
+        assert cache.stats("t")["evictions"] == 1
+
+    def test_invalidation_epochs_are_bounded(self):
+        """무효화 세대는 한도만큼만 남고, 밀려난 세대 이전에 시작한 조회의 답변은 저장하지 않는지 테스트"""
+        cache = AnswerCache(similarity=0.99, max_entries=2, ttl_seconds=60)
+        assert cache.invalidate_document("unseen", "doc-1") == 0
+        assert "unseen" not in cache._tenants
+        assert cache.stats("unseen")["entries"] == 0
+        assert "unseen" not in cache._tenants
+
+        epoch = cache.lookup("t", "질문", vector(1, 0, 0), SCOPE).epoch
+        for d in range(5):
+            cache.invalidate_document("t", f"doc-{d}")
+        assert list(cache._tenants["t"].doc_epochs) == ["doc-3", "doc-4"]
+
+        # doc-0의 무효화 세대는 지워졌지만 그보다 먼저 시작한 조회는 여전히 저장하지 않는다
+        assert cache.put("t", "질문", vector(1, 0, 0), SCOPE, make_response("q", "doc-0"), 10, epoch) is None
+        fresh = cache.lookup("t", "질문", vector(1, 0, 0), SCOPE).epoch
+        assert cache.put("t", "질문", vector(1, 0, 0), SCOPE, make_response("q", "doc-0"), 10, fresh)
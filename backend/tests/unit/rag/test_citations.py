@@ -0,0 +1,171 @@
+"""
+근거 검증 테스트
+
+싱글 포함률 판정, 주장 분리, 싱글 사전 계산, 비동기 정밀 검증 큐/캐시 검증
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.common.config import settings
+from app.common.shingles import shingles
+from app.domains.rag.citations import (
+    DEEP_DISABLED,
+    DEEP_DONE,
+    DEEP_ENTAILED,
+    DEEP_NOT_ENTAILED,
+    DEEP_PENDING,
+    DEEP_SKIPPED,
+    CitationVerifier,
+    DeepCheck,
+    DeepVerifier,
+    LexicalEntailmentBackend,
+    ShingleIndex,
+    containment,
+    split_claims,
+)
+from app.domains.search.keyword_index import Passage
+from app.domains.search.services import RetrievedChunk
+
+CONTRACT = "제5조(지급 조건) 갑은 계약 체결 후 30일 이내에 대금을 을에게 지급한다. 지연 시 연 5% 이자를 부과한다."
+
+
+def make_chunk(doc_id: str, text: str) -> RetrievedChunk:
+    """원문이 있는 검색 결과를 만듭니다."""
+    return RetrievedChunk(
+        chunk_id=f"{doc_id}:0",
+        doc_id=doc_id,
+        score=1.0,
+        passage=Passage(f"{doc_id}:0", doc_id, None, 2, text),
+    )
+
+
+def make_verifier(deep_factory=lambda: None) -> CitationVerifier:
+    """테스트용 근거 검증 서비스를 만듭니다."""
+    return CitationVerifier(
+        ShingleIndex(size=3, max_entries=100),
+        DeepVerifier(deep_factory, batch_size=2, queue_size=10, threshold=0.5),
+        support_threshold=0.6,
+        partial_threshold=0.3,
+    )
+
+
+class TestShingleCheck:
+    """동기 싱글 검사 테스트 클래스"""
+
+    def test_containment_tolerates_spacing_and_particles(self):
+        """띄어쓰기/문장부호가 달라도 겹치는 주장은 높게, 무관한 주장은 낮게 나오는지 테스트"""
+        chunk = shingles(CONTRACT, 3)
+        assert np.all(chunk[:-1] < chunk[1:])
+
+        paraphrase = containment(shingles("계약 체결 후 30일이내 대금을 지급한다", 3), chunk)
+        unrelated = containment(shingles("해지 시 위약금 10%를 청구할 수 있다", 3), chunk)
+        assert paraphrase > 0.6
+        assert unrelated < 0.2
+        assert containment(shingles("", 3), chunk) == 0.0
+
+    def test_split_claims_attaches_trailing_markers(self):
+        """문장별로 나누고 문장 뒤에 떨어진 근거 표기를 앞 문장에 붙이는지 테스트"""
+        claims = split_claims("30일 이내 지급한다. [1] 지연 이자는 5%이다 [2][1].\n근거 없음")
+
+        assert [c.text for c in claims] == ["30일 이내 지급한다.", "지연 이자는 5%이다.", "근거 없음"]
+        assert [c.markers for c in claims] == [[1], [2, 1], []]
+
+    def test_verify_judges_each_claim(self):
+        """주장별로 뒷받침/무관/잘못된 번호/근거 없음을 판정하는지 테스트"""
+        verifier = make_verifier()
+        chunks = [make_chunk("doc-1", CONTRACT), make_chunk("doc-2", "비밀유지 의무는 3년간 존속한다.")]
+        answer = (
+            "계약 체결 후 30일 이내에 대금을 지급한다. [1] "
+            "위약금은 10%이다. [2] 지연 이자는 5%이다. [7] 추가 설명입니다."
+        )
+
+        result = verifier.verify("t", answer, chunks)
+
+        assert [c["verdict"] for c in result["claims"]] == ["supported", "unsupported", "invalid", "uncited"]
+        assert result["summary"]["supported"] == 1
+        assert result["cited"] == [
+            {"marker": 1, "documentId": "doc-1", "page": 2},
+            {"marker": 2, "documentId": "doc-2", "page": 2},
+        ]
+        assert result["invalid"] == [7]
+        assert result["deep"] == {"status": DEEP_DISABLED, "verificationId": None}
+        assert result["verifyMs"] < 50
+
+    def test_indexed_chunks_are_precomputed(self):
+        """documents.indexed 이벤트로 미리 계산한 싱글을 검증에 재사용하는지 테스트"""
+        verifier = make_verifier()
+        verifier.index.on_documents_indexed({
+            "tenant_id": "t",
+            "doc_id": "doc-1",
+            "chunks": [{"chunk_id": "doc-1:0", "text": CONTRACT, "page": 2}],
+        })
+        assert verifier.index.stats()["computed"] == 1
+
+        verifier.verify("t", "30일 이내에 대금을 지급한다. [1]", [make_chunk("doc-1", CONTRACT)])
+        verifier.verify("other", "30일 이내에 대금을 지급한다. [1]", [make_chunk("doc-1", CONTRACT)])
+        assert verifier.index.stats()["computed"] == 2
+
+
+class TestDeepVerifier:
+    """비동기 정밀 검증 테스트 클래스"""
+
+    async def test_results_are_written_and_cached(self):
+        """큐에서 함의 점수를 채워 결과로 보관하고, 같은 쌍은 캐시를 쓰는지 테스트"""
+        verifier = make_verifier(LexicalEntailmentBackend)
+        chunks = [make_chunk("doc-1", CONTRACT)]
+        answer = "30일 이내 지급한다. [1] 위약금은 10%이다. [1]"
+
+        result = verifier.verify("t", answer, chunks)
+        deep = verifier.deep
+        verification_id = result["deep"]["verificationId"]
+        assert result["deep"]["status"] == DEEP_PENDING
+
+        verification = await deep.wait("t", verification_id, timeout=1.0)
+        assert verification.status == DEEP_DONE
+        assert [deep.verdict(c) for c in verification.checks] == [DEEP_ENTAILED, DEEP_NOT_ENTAILED]
+        assert deep.get("other-tenant", verification_id) is None
+
+        again = verifier.verify("t", answer, chunks)["deep"]["verificationId"]
+        await deep.wait("t", again, timeout=1.0)
+        await deep.stop()
+        assert deep.stats()["scored"] == 2
+        assert deep.stats()["cache_hits"] == 2
+
+    async def test_cached_scores_are_keyed_by_model(self):
+        """버전이 같아도 다른 함의 모델의 캐시 점수를 쓰지 않는지 테스트"""
+        check = DeepCheck(0, 1, "doc-1", "주장", "본문")
+        deep = DeepVerifier(LexicalEntailmentBackend, queue_size=10)
+        _, first_id = deep.submit("t", [check])
+        await deep.wait("t", first_id, timeout=1.0)
+
+        other = LexicalEntailmentBackend()
+        other.model_id = "other"
+        deep._backend = other
+        _, second_id = deep.submit("t", [DeepCheck(0, 1, "doc-1", "주장", "본문")])
+        await deep.wait("t", second_id, timeout=1.0)
+        await deep.stop()
+
+        assert deep.stats()["scored"] == 2
+        assert deep.stats()["cache_hits"] == 0
+
+    async def test_full_queue_and_missing_backend_skip_deep_tier(self):
+        """큐가 가득 차거나 백엔드가 꺼져 있으면 정밀 검증을 건너뛰는지 테스트"""
+        check = DeepCheck(0, 1, "doc-1", "주장", "본문")
+        deep = DeepVerifier(LexicalEntailmentBackend, queue_size=1)
+        assert deep.submit("t", [check])[0] == DEEP_PENDING
+        assert deep.submit("t", [check]) == (DEEP_SKIPPED, None)
+        await asyncio.sleep(0)
+        await deep.stop()
+
+        assert DeepVerifier(lambda: None).submit("t", [check]) == (DEEP_DISABLED, None)
+
+    async def test_misconfigured_backend_fails_at_start(self, monkeypatch):
+        """ONNX 모델 디렉터리가 없으면 정밀 검증을 조용히 끄지 않고 시작 시점에 실패하는지 테스트"""
+        monkeypatch.setattr(settings, "CITATION_DEEP_BACKEND", "onnx")
+        monkeypatch.setattr(settings, "CITATION_NLI_ONNX_DIR", None)
+
+        with pytest.raises(RuntimeError, match="CITATION_NLI_ONNX_DIR"):
+            await DeepVerifier().start()
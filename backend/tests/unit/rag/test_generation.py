@@ -0,0 +1,137 @@
+"""
+답변 생성 테스트
+
+프롬프트 구성, 가짜 LLM 스트리밍, 취소 시 상위 스트림 종료, 생성 실패 처리, 시작 시 설정 오류 검증
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Sequence
+
+import pytest
+
+from app.common.config import settings
+from app.domains.rag.generation import (
+    GENERATION_DISABLED,
+    GENERATION_FAILED,
+    GENERATION_GENERATED,
+    AnswerGenerator,
+    FakeLlmClient,
+    GenerationResult,
+    build_messages,
+)
+from app.domains.search.keyword_index import Passage
+from app.domains.search.services import RetrievedChunk
+
+
+def make_chunk(doc_id: str, text: str, page: int = 1) -> RetrievedChunk:
+    """원문이 있는 검색 결과를 만듭니다."""
+    return RetrievedChunk(
+        chunk_id=f"{doc_id}:0",
+        doc_id=doc_id,
+        score=1.0,
+        passage=Passage(f"{doc_id}:0", doc_id, f"{doc_id}.pdf", page, text),
+    )
+
+
+class UpstreamClient:
+    """토큰을 끝없이 내보내며 스트림 종료 여부를 기록하는 테스트 클라이언트"""
+
+    model_id = "upstream"
+
+    def __init__(self, fail_after: int = -1):
+        self.fail_after = fail_after
+        self.closed = False
+        self.emitted = 0
+
+    async def stream(self, messages: Sequence[Dict[str, str]]) -> AsyncIterator[str]:
+        try:
+            while True:
+                if self.emitted == self.fail_after:
+                    raise ConnectionError("업스트림 연결 끊김")
+                await asyncio.sleep(0)
+                self.emitted += 1
+                yield f"t{self.emitted} "
+        finally:
+            self.closed = True
+
+    async def aclose(self) -> None:
+        return None
+
+
+class TestAnswerGenerator:
+    """답변 생성기 테스트 클래스"""
+
+    def test_prompt_numbers_sources_and_fake_answer_cites_them(self):
+        """근거 번호를 붙인 프롬프트에서 가짜 LLM이 [1] 표기 답변을 만드는지 테스트"""
+        chunks = [make_chunk("doc-1", "지급 조건: 계약 후 30일 이내 지급한다. 기타 조항", 3)]
+        messages = build_messages("지급 조건은?", chunks, max_chars=100)
+
+        assert messages[0]["role"] == "system"
+        assert "[1] doc-1.pdf (p.3)\n지급 조건" in messages[1]["content"]
+        assert messages[1]["content"].endswith("질문: 지급 조건은?")
+        assert FakeLlmClient.compose(messages) == "지급 조건: 계약 후 30일 이내 지급한다. [1]"
+        assert "찾을 수 없습니다" in FakeLlmClient.compose(build_messages("질문", [], 100))
+
+    async def test_generate_collects_streamed_tokens(self):
+        """토큰을 모아 답변과 첫 토큰 시간을 기록하는지 테스트"""
+        client = FakeLlmClient(first_token_ms=5)
+        generator = AnswerGenerator(lambda: client)
+
+        result = await generator.generate("질문", [make_chunk("doc-1", "30일 이내 지급한다.")])
+
+        assert result.status == GENERATION_GENERATED
+        assert result.answer == "30일 이내 지급한다. [1]"
+        assert len(result.tokens) == client.emitted == 4
+        assert result.first_token_ms >= 5
+        assert result.elapsed_ms >= result.first_token_ms
+
+    async def test_closing_stream_cancels_upstream(self):
+        """소비자가 스트림을 닫으면 상위 LLM 스트림도 닫히는지 테스트"""
+        client = UpstreamClient()
+        generator = AnswerGenerator(lambda: client)
+        result = GenerationResult()
+        tokens: List[str] = []
+
+        stream = generator.stream("질문", [], result)
+        async for token in stream:
+            tokens.append(token)
+            if len(tokens) == 3:
+                break
+        await stream.aclose()
+
+        assert client.closed
+        assert client.emitted == 3
+        assert result.answer == "t1 t2 t3"
+
+    async def test_cancelled_task_cancels_upstream(self):
+        """생성 작업이 취소되면 상위 LLM 스트림도 닫히는지 테스트"""
+        client = UpstreamClient()
+        generator = AnswerGenerator(lambda: FakeLlmClient(first_token_ms=1000))
+        task = asyncio.create_task(generator.generate("질문", []))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+
+        generator = AnswerGenerator(lambda: client)
+        task = asyncio.create_task(generator.generate("질문", []))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert client.closed
+
+    async def test_failures_and_missing_client(self):
+        """생성 중 오류와 비활성화 상태를 구분하는지 테스트"""
+        failed = await AnswerGenerator(lambda: UpstreamClient(fail_after=2)).generate("질문", [])
+        disabled = await AnswerGenerator(lambda: None).generate("질문", [])
+
+        assert (failed.status, failed.answer) == (GENERATION_FAILED, "t1 t2")
+        assert (disabled.status, disabled.answer) == (GENERATION_DISABLED, "")
+
+    async def test_misconfigured_client_fails_at_start(self, monkeypatch):
+        """API 키가 없으면 근거 문서만 조용히 반환하지 않고 시작 시점에 실패하는지 테스트"""
+        monkeypatch.setattr(settings, "LLM_BACKEND", "openai")
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+
+        with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
+            await AnswerGenerator().start()
@@ -0,0 +1,157 @@
+"""
+검색어 자동완성 색인 테스트
+
+자모 단위 접두어 일치, 빈도/최근성 순위, 노드 상위 목록 갱신, 깊이 제한, 권한 필터, 사용자별 질의, 용량 제한 검증
+"""
+
+from app.domains.rag.suggestions import (
+    CATEGORY_DOCUMENT,
+    CATEGORY_ENTITY,
+    CATEGORY_QUERY,
+    SuggestionIndex,
+    entity_values,
+    jamo_key,
+)
+from app.domains.search.acl import PermissionIndex
+
+DAY = 86400.0
+
+
+def make_index(**kwargs) -> SuggestionIndex:
+    """반감기 1일, 노드별 상위 3개를 유지하는 색인을 만듭니다."""
+    options = {"top_k": 3, "max_depth": 24, "half_life_days": 1.0, "max_terms": 1000, **kwargs}
+    return SuggestionIndex(session_factory=lambda: None, **options)
+
+
+def texts(index: SuggestionIndex, prefix: str, limit: int = 5, access=None, user: str = "user") -> list:
+    return [s.text for s in index.suggest("tenant", prefix, limit, access, user)]
+
+
+class TestSuggestionIndex:
+    """자동완성 색인 테스트 클래스"""
+
+    def test_jamo_key_splits_compound_letters(self):
+        """음절과 겹모음/겹받침이 낱자 자모로 풀리는지 테스트"""
+        assert jamo_key("계약") == "ㄱㅖㅇㅑㄱ"
+        assert jamo_key("과") == "ㄱㅗㅏ" and jamo_key("ㅘ") == "ㅗㅏ"
+        assert jamo_key("값") == "ㄱㅏㅂㅅ" and jamo_key("ㅄ") == "ㅂㅅ"
+        assert jamo_key("po-17") == "po-17"
+
+    def test_partial_syllables_match_prefix(self):
+        """조합 중인 글자(받침이 다음 음절 초성이 될 글자 포함)도 접두어로 맞는지 테스트"""
+        index = make_index()
+        index.record_query("tenant", "user", "계약 해지 조건", at=0)
+        index.record_query("tenant", "user", "가방 구매 내역", at=0)
+        index.record_query("tenant", "user", "과태료 부과 기준", at=0)
+
+        assert texts(index, "계야") == ["계약 해지 조건"]
+        assert texts(index, "ㄱㅖ") == ["계약 해지 조건"]
+        assert texts(index, "갑") == ["가방 구매 내역"]
+        assert texts(index, "고") == ["과태료 부과 기준"]
+        assert texts(index, "계약  해") == ["계약 해지 조건"]
+        assert texts(index, "계약서") == []
+
+    def test_ranking_weights_frequency_and_recency(self):
+        """자주 검색한 질의가 위에 오고, 반감기가 지나면 최근 질의가 앞서는지 테스트"""
+        index = make_index()
+        for _ in range(3):
+            index.record_query("tenant", "user", "계약 해지", at=0)
+        index.record_query("tenant", "user", "계약 갱신", at=0)
+        assert texts(index, "계약") == ["계약 해지", "계약 갱신"]
+
+        # 이틀 뒤 한 번은 이틀 전 4번과 같은 무게
+        index.record_query("tenant", "user", "계약 갱신", at=2 * DAY)
+        assert texts(index, "계약") == ["계약 갱신", "계약 해지"]
+        suggestions = index.suggest("tenant", "계약", 5, user_id="user")
+        assert suggestions[0].popularity == 100 and suggestions[1].popularity == 60
+
+    def test_promoted_term_enters_full_node_top_list(self):
+        """노드 상위 목록이 가득 차 있어도 점수가 오른 후보가 들어오는지 테스트"""
+        index = make_index()
+        for i, text in enumerate(["보고서 a", "보고서 b", "보고서 c", "보고서 d"]):
+            for _ in range(4 - i):
+                index.record_query("tenant", "user", text, at=0)
+        assert texts(index, "보") == ["보고서 a", "보고서 b", "보고서 c"]
+
+        for _ in range(5):
+            index.record_query("tenant", "user", "보고서 d", at=0)
+        assert texts(index, "보") == ["보고서 d", "보고서 a", "보고서 b"]
+        assert texts(index, "보고서 d") == ["보고서 d"]
+
+    def test_prefix_longer_than_depth_filters_deepest_node(self):
+        """최대 깊이보다 긴 접두어는 마지막 깊이 노드의 후보를 걸러 찾는지 테스트"""
+        index = make_index(max_depth=4)
+        index.record_query("tenant", "user", "invoice 2024-01", at=0)
+        index.record_query("tenant", "user", "invoice 2024-02", at=0)
+        index.record_query("tenant", "user", "invalid", at=0)
+
+        assert texts(index, "invoice 2024-02") == ["invoice 2024-02"]
+        assert sorted(texts(index, "invoice")) == ["invoice 2024-01", "invoice 2024-02"]
+        assert texts(index, "invoices") == []
+
+    def test_document_terms_follow_permissions(self):
+        """문서 제목/추출 값 후보는 출처 문서 권한이 있을 때만 보이는지 테스트"""
+        permissions = PermissionIndex()
+        permissions.on_index_meta({"tenant_id": "tenant", "doc_id": "doc-1", "public": True})
+        permissions.on_index_meta({"tenant_id": "tenant", "doc_id": "doc-2", "groups": ["finance"]})
+        index = make_index()
+        index.record_document("tenant", "doc-1", "계약서_2024.pdf")
+        index.record_document("tenant", "doc-2", "계약 특례.hwp")
+        index.record_document(
+            "tenant", "doc-2", None, {"vendor": "계룡건설", "amount": "1,250,000", "date": "2024-01-01"}
+        )
+
+        viewer = permissions.access_filter("tenant", "user-1", ["viewer"])
+        finance = permissions.access_filter("tenant", "user-2", ["finance"])
+
+        assert texts(index, "계", access=viewer) == ["계약서_2024"]
+        assert sorted(texts(index, "계", access=finance)) == ["계룡건설", "계약 특례", "계약서_2024"]
+        categories = {s.text: s.category for s in index.suggest("tenant", "계", 5)}
+        assert categories == {
+            "계약서_2024": CATEGORY_DOCUMENT, "계약 특례": CATEGORY_DOCUMENT, "계룡건설": CATEGORY_ENTITY,
+        }
+
+    def test_same_text_from_several_sources_is_suggested_once(self):
+        """질의와 문서 제목이 같으면 점수가 높은 하나만 제안하는지 테스트"""
+        index = make_index()
+        index.record_document("tenant", "doc-1", "연간 보고서.pdf", at=0)
+        index.record_query("tenant", "user", "연간 보고서", at=0)
+        index.record_query("tenant", "user", "연간 보고서", at=0)
+
+        suggestions = index.suggest("tenant", "연간", 5, user_id="user")
+
+        assert [(s.text, s.category) for s in suggestions] == [("연간 보고서", CATEGORY_QUERY)]
+
+    def test_past_queries_are_suggested_only_to_their_user(self):
+        """과거 질의는 질의한 사용자에게만 제안하고, 문서 후보와는 기준 시각을 맞춰 섞는지 테스트"""
+        index = make_index()
+        index.record_query("tenant", "alice", "계약 해지 위약금 비공개 조항", weight=2, at=0)
+        index.record_document("tenant", "doc-1", "계약서.pdf", at=0)
+        for _ in range(3):
+            index.record_query("tenant", "bob", "계약 갱신", at=DAY)
+
+        assert texts(index, "계약", user="alice") == ["계약 해지 위약금 비공개 조항", "계약서"]
+        assert texts(index, "계약", user="bob") == ["계약 갱신", "계약서"]
+        assert texts(index, "계약", user="carol") == ["계약서"]
+        assert texts(index, "계약", user=None) == ["계약서"]
+        popularity = [s.popularity for s in index.suggest("tenant", "계약", 5, user_id="bob")]
+        assert popularity == [100, 17]
+
+    def test_user_terms_are_capped(self):
+        """후보 수가 상한을 넘으면 점수 상위 절반만 남기고 다시 만드는지 테스트"""
+        index = make_index(user_max_terms=4)
+        for i in range(4):
+            for _ in range(i + 1):
+                index.record_query("tenant", "user", f"질의 {i}", at=0)
+        index.record_query("tenant", "user", "새 질의", at=0)
+
+        assert len(index.user("tenant", "user").terms) == 2
+        assert texts(index, "질의") == ["질의 3", "질의 2"]
+        assert texts(index, "새") == []
+        assert index.suggest("other", "질의", 5, user_id="user") == []
+
+    def test_entity_values_skip_numeric_fields(self):
+        """숫자/기호뿐이거나 너무 긴 추출 값은 엔터티 후보에서 빠지는지 테스트"""
+        fields = {"vendor": "  (주) 한빛  ", "amount": "1,250,000", "count": 3, "notes": "가" * 51}
+
+        assert entity_values(fields) == ["(주) 한빛"]
@@ -0,0 +1,111 @@
+"""
+질의 트렌드 스케치 테스트
+
+count-min 스케치 추정/병합, 상위 후보 유지, 버킷 경계, 주제 단어 추출, 증가율 계산 검증
+"""
+
+import random
+from collections import Counter
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.domains.rag.trends import (
+    CountMinSketch,
+    TrendCounter,
+    TrendTracker,
+    bucket_start,
+    sketch_cells,
+    topics,
+)
+
+HOUR = 3600.0
+
+
+def zipf_stream(seed: int, events: int, keys: int) -> list:
+    """소수의 키가 대부분을 차지하는 질의 스트림을 만듭니다."""
+    rng = random.Random(seed)
+    return [f"질의 {min(int(rng.paretovariate(1.2)), keys)}" for _ in range(events)]
+
+
+def counter(width: int = 512, depth: int = 4, capacity: int = 10) -> TrendCounter:
+    return TrendCounter(CountMinSketch(width, depth), capacity)
+
+
+def feed(target: TrendCounter, stream: list) -> None:
+    for key in stream:
+        target.add(key, sketch_cells(key, target.sketch.width, target.sketch.depth))
+
+
+class TestTrendSketch:
+    """질의 트렌드 스케치 테스트 클래스"""
+
+    def test_sketch_never_underestimates(self):
+        """추정치가 실제 횟수 이상이고 오차가 e/너비 x 전체 수 이내인지 테스트"""
+        stream = zipf_stream(1, 20000, 5000)
+        target = counter()
+        feed(target, stream)
+
+        exact = Counter(stream)
+        errors = [target.estimate(key) - count for key, count in exact.items()]
+        assert min(errors) >= 0
+        assert np.percentile(errors, 95) <= np.e / 512 * len(stream)
+
+    def test_heavy_hitters_are_kept_as_candidates(self):
+        """후보 수가 작아도 가장 많이 나온 키들이 순서대로 남는지 테스트"""
+        stream = zipf_stream(2, 20000, 5000)
+        target = counter(width=2048)
+        feed(target, stream)
+
+        expected = [key for key, _ in Counter(stream).most_common(5)]
+        assert [key for key, _ in target.top(5)] == expected
+        assert target.total == len(stream)
+
+    def test_merged_counters_equal_single_stream(self):
+        """워커별 카운터를 합치면 전체 스트림을 한 카운터에 넣은 것과 같은지 테스트"""
+        stream = zipf_stream(3, 9000, 2000)
+        whole, first, second = counter(), counter(), counter()
+        feed(whole, stream)
+        feed(first, stream[::2])
+        feed(second, stream[1::2])
+
+        first.merge(second)
+
+        assert np.array_equal(first.sketch.table, whole.sketch.table)
+        assert first.total == whole.total
+        assert [key for key, _ in first.top(3)] == [key for key, _ in whole.top(3)]
+        restored = CountMinSketch.from_bytes(first.sketch.to_bytes(), 512, 4)
+        assert restored.estimate("질의 1") == whole.estimate("질의 1")
+
+    def test_buckets_align_to_utc_calendar(self):
+        """시간/일 버킷은 정시/자정, 주 버킷은 월요일 자정에 시작하는지 테스트"""
+        at = datetime(2024, 5, 16, 13, 45, tzinfo=timezone.utc).timestamp()  # 목요일
+
+        def start(granularity: str) -> datetime:
+            return datetime.fromtimestamp(bucket_start(granularity, at), timezone.utc)
+
+        assert start("hour") == datetime(2024, 5, 16, 13, tzinfo=timezone.utc)
+        assert start("day") == datetime(2024, 5, 16, tzinfo=timezone.utc)
+        assert start("week") == datetime(2024, 5, 13, tzinfo=timezone.utc)
+
+    def test_topics_strip_particles_and_dedupe(self):
+        """주제 단어는 조사를 떼고, 한 글자 단어와 숫자만 있는 토큰을 빼는지 테스트"""
+        assert topics("계약서의 해지 조건과 계약서 위약금 2024 sla") == ["계약서", "해지", "조건", "위약금", "sla"]
+
+    def test_growth_compares_rate_with_previous_bucket(self):
+        """현재 구간 횟수를 경과 비율로 환산해 직전 구간과 비교하는지 테스트"""
+        tracker = TrendTracker(session_factory=lambda: None, width=256, depth=4, capacity=5)
+        hour = bucket_start("hour", datetime(2024, 5, 16, 10, tzinfo=timezone.utc).timestamp())
+        for _ in range(10):
+            tracker.record("tenant", "계약 해지", at=hour - HOUR + 60)
+        for _ in range(10):
+            tracker.record("tenant", "계약 해지", at=hour + 60)
+        tracker.record("tenant", "신규 질의", at=hour + 60)
+
+        trends = tracker.trends("tenant", "hour", 5, at=hour + HOUR / 2)
+
+        assert trends.since == datetime(2024, 5, 16, 10) and trends.total == 11 and trends.previous_total == 10
+        first, second = trends.queries
+        assert (first.text, first.count, first.previous_count, first.growth) == ("계약 해지", 10, 10, 1.0)
+        assert (second.text, second.previous_count, second.growth) == ("신규 질의", 0, None)
+        assert [item.text for item in trends.topics] == ["계약", "해지", "신규", "질의"]
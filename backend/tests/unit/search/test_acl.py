@@ -0,0 +1,160 @@
+"""
+검색 권한 색인 테스트
+
+압축 비트맵 연산, index.meta 갱신, 스냅샷 저장/복원, 컬렉션 서수 변환, 벡터/BM25 사전 필터 검증
+"""
+
+import numpy as np
+
+from app.domains.embedding.backends import l2_normalize
+from app.domains.search.acl import Bitmap, PermissionIndex
+from app.domains.search.keyword_index import LocalKeywordIndex
+from app.domains.search.vector_index import LocalVectorIndex, VectorCollection, VectorFilter
+
+DIM = 16
+
+
+class TestBitmap:
+    """압축 비트맵 테스트 클래스"""
+
+    def test_set_operations_match_python_sets(self):
+        """배열/비트셋 컨테이너가 섞여도 합집합/교집합이 집합 연산과 같은지 테스트"""
+        rng = np.random.default_rng(0)
+        # 희소(배열 컨테이너)와 밀집(비트셋 컨테이너) 구간을 함께 만든다
+        left = set(rng.choice(200000, 3000, replace=False).tolist()) | set(range(70000, 80000))
+        right = set(rng.choice(200000, 9000, replace=False).tolist()) | set(range(75000, 76000))
+
+        a, b = Bitmap(left), Bitmap(right)
+        assert len(a) == len(left)
+        assert set((a | b).to_array().tolist()) == left | right
+        assert set((a & b).to_array().tolist()) == left & right
+
+    def test_add_discard_converts_containers(self):
+        """원소 수가 경계를 넘나들 때 컨테이너가 바뀌어도 내용이 유지되는지 테스트"""
+        bitmap = Bitmap(range(4096))
+        bitmap.add(5000)
+        assert 5000 in bitmap and len(bitmap) == 4097
+
+        bitmap.discard(5000)
+        bitmap.discard(0)
+        assert 0 not in bitmap and len(bitmap) == 4095
+        assert bitmap.to_array()[0] == 1
+
+    def test_to_mask(self):
+        """불리언 마스크 변환이 크기를 넘는 원소를 무시하는지 테스트"""
+        mask = Bitmap([1, 3, 70000]).to_mask(10)
+        assert np.flatnonzero(mask).tolist() == [1, 3]
+
+
+class TestPermissionIndex:
+    """권한 색인 테스트 클래스"""
+
+    def test_index_meta_upsert_replaces_grants(self):
+        """index.meta 업서트가 이전 권한을 교체하고 삭제 시 제거되는지 테스트"""
+        index = PermissionIndex()
+        index.on_index_meta({"tenant_id": "t", "doc_id": "a", "users": ["u1"]})
+        index.on_index_meta({"tenant_id": "t", "doc_id": "b", "groups": ["g1"]})
+        index.on_index_meta({"tenant_id": "t", "doc_id": "c", "public": True})
+
+        assert index.access_filter("t", "u1").doc_ids() == {"a", "c"}
+        assert index.access_filter("t", "u2", ["g1"]).doc_ids() == {"b", "c"}
+
+        index.on_index_meta({"tenant_id": "t", "doc_id": "a", "groups": ["g1"]})
+        index.on_index_meta({"tenant_id": "t", "doc_id": "c", "deleted": True})
+        assert index.access_filter("t", "u1").doc_ids() == set()
+        assert index.access_filter("t", "u2", ["g1"]).doc_ids() == {"a", "b"}
+        assert index.access_filter("other", "u1", ["g1"]).doc_ids() == set()
+
+    def test_roles_are_separate_from_groups(self):
+        """역할 권한과 그룹 권한이 서로의 이름 공간을 공유하지 않는지 테스트"""
+        index = PermissionIndex("")
+        index.on_index_meta({"tenant_id": "t", "doc_id": "a", "groups": ["admin"]})
+        index.on_index_meta({"tenant_id": "t", "doc_id": "b", "roles": ["admin"]})
+
+        assert index.access_filter("t", "u", roles=["admin"]).doc_ids() == {"b"}
+        assert index.access_filter("t", "u", ["admin"]).doc_ids() == {"a"}
+
+        index.on_index_meta({"tenant_id": "t", "doc_id": "b", "users": ["u"]})
+        assert index.access_filter("t", "v", roles=["admin"]).doc_ids() == set()
+        assert index.tenant("t").stats()["roles"] == 0
+
+    def test_snapshot_restores_grants_after_restart(self, tmp_path):
+        """저장한 권한 메타로 재시작 후 같은 허용 문서를 돌려주고, 변경된 테넌트만 다시 저장하는지 테스트"""
+        index = PermissionIndex(str(tmp_path))
+        index.on_index_meta({"tenant_id": "t/1", "doc_id": "a", "users": ["u1"]})
+        index.on_index_meta({"tenant_id": "t/1", "doc_id": "b", "groups": ["g1"], "roles": ["admin"]})
+        index.on_index_meta({"tenant_id": "t/1", "doc_id": "c", "public": True})
+        index.on_index_meta({"tenant_id": "t/1", "doc_id": "d", "users": ["u1"]})
+        index.on_index_meta({"tenant_id": "t/1", "doc_id": "d", "deleted": True})
+        assert index.tenant("t/1").dirty
+        index.maintain()
+        assert not index.tenant("t/1").dirty
+
+        reopened = PermissionIndex(str(tmp_path))
+        assert reopened.access_filter("t/1", "u1").doc_ids() == {"a", "c"}
+        assert reopened.access_filter("t/1", "u2", ["g1"]).doc_ids() == {"b", "c"}
+        assert reopened.access_filter("t/1", "u2", roles=["admin"]).doc_ids() == {"b", "c"}
+        assert reopened.tenant("t/1").stats() == index.tenant("t/1").stats()
+        assert reopened.access_filter("t2", "u1").doc_ids() == set()
+
+        reopened.on_index_meta({"tenant_id": "t/1", "doc_id": "e", "users": ["u1"]})
+        reopened.maintain()
+        assert PermissionIndex(str(tmp_path)).access_filter("t/1", "u1").doc_ids() == {"a", "c", "e"}
+        assert PermissionIndex("").access_filter("t/1", "u1").doc_ids() == set()
+
+    def test_mask_follows_collection_ordinals(self, tmp_path):
+        """권한 서수와 순서가 다른 컬렉션 서수로 변환되고 새 문서도 반영되는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        vectors = l2_normalize(np.random.default_rng(0).standard_normal((3, DIM)).astype(np.float32))
+        for i, doc_id in enumerate(["z", "y", "x"]):
+            collection.upsert(doc_id, [f"{doc_id}:0"], vectors[i:i + 1])
+        index = PermissionIndex()
+        for doc_id in ["x", "new", "z"]:
+            index.on_index_meta({"tenant_id": "t", "doc_id": doc_id, "users": ["u"]})
+
+        access = index.access_filter("t", "u")
+        assert np.flatnonzero(access.mask_for(collection)).tolist() == [0, 2]
+
+        collection.upsert("new", ["new:0"], vectors[:1])
+        assert np.flatnonzero(access.mask_for(collection)).tolist() == [0, 2, 3]
+
+
+class TestAccessPrefilter:
+    """검색 사전 필터 테스트 클래스"""
+
+    async def test_vector_search_returns_k_allowed_hits(self, tmp_path):
+        """허용 문서가 1%여도 IVF 탐색을 넓혀 k개를 채우는지 테스트"""
+        rng = np.random.default_rng(1)
+        vectors = LocalVectorIndex(str(tmp_path), dim=DIM, nprobe=1, memtable_rows=100000)
+        collection = vectors.collection("t")
+        data = l2_normalize(rng.standard_normal((4000, DIM)).astype(np.float32))
+        for d in range(200):
+            collection.upsert(f"doc-{d}", [f"doc-{d}:{i}" for i in range(20)], data[d * 20:(d + 1) * 20])
+        collection.flush()
+        index = PermissionIndex()
+        index.on_index_meta({"tenant_id": "t", "doc_id": "doc-7", "users": ["u"]})
+        index.on_index_meta({"tenant_id": "t", "doc_id": "doc-150", "users": ["u"]})
+
+        access = index.access_filter("t", "u")
+        hits = await vectors.search("t", data[0], 10, VectorFilter(access=access))
+        assert len(hits) == 10
+        assert {hit.doc_id for hit in hits} <= {"doc-7", "doc-150"}
+
+        hits = await vectors.search("t", data[0], 10, VectorFilter(frozenset({"doc-7"}), access))
+        assert {hit.doc_id for hit in hits} == {"doc-7"}
+
+    async def test_keyword_search_applies_access(self):
+        """BM25 검색이 권한 없는 문서를 제외하는지 테스트"""
+        keywords = LocalKeywordIndex("")
+        for doc_id in ["a", "b"]:
+            await keywords.on_documents_indexed({
+                "tenant_id": "t",
+                "doc_id": doc_id,
+                "chunks": [{"chunk_id": f"{doc_id}:0", "text": "손해배상 청구 조항", "page": 1}],
+            })
+        index = PermissionIndex()
+        index.on_index_meta({"tenant_id": "t", "doc_id": "b", "groups": ["legal"]})
+
+        hits = await keywords.search("t", "손해배상", 5, access=index.access_filter("t", "u", ["legal"]))
+        assert [hit.doc_id for hit in hits] == ["b"]
+        assert await keywords.search("t", "손해배상", 5, access=index.access_filter("t", "u")) == []
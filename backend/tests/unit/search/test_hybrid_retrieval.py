@@ -0,0 +1,75 @@
+"""
+하이브리드 검색 테스트
+
+RRF 융합과 BM25 + 벡터 동시 검색 검증
+"""
+
+import pytest
+
+from app.domains.embedding.backends import HashingEmbeddingBackend
+from app.domains.embedding.services import EmbeddingService
+from app.domains.search.fusion import reciprocal_rank_fusion
+from app.domains.search.keyword_index import LocalKeywordIndex
+from app.domains.search.services import HybridRetriever
+from app.domains.search.vector_index import LocalVectorIndex
+
+DIM = 64
+
+TEXTS = {
+    "doc-1": ["공급 계약서 계약번호 CTR-2024-001 계약 금액 일억원", "납품 기한은 계약일로부터 30일 이내"],
+    "doc-2": ["용역 계약서 계약번호 CTR-2023-777 지급 조건 선급금 30%", "지체상금은 일 0.1%로 한다"],
+    "doc-3": ["비밀유지 계약서 당사자는 비밀을 유지한다", "계약 해지 시 자료를 반환한다"],
+}
+
+
+@pytest.fixture
+async def retriever(tmp_path):
+    """세 문서를 색인한 하이브리드 검색기"""
+    backend = HashingEmbeddingBackend(dim=DIM)
+    embedding = EmbeddingService(lambda: backend, max_wait_ms=0)
+    vectors = LocalVectorIndex(str(tmp_path / "vec"), dim=DIM, memtable_rows=1000)
+    keywords = LocalKeywordIndex("")
+    for doc_id, texts in TEXTS.items():
+        chunk_ids = [f"{doc_id}:{i}" for i in range(len(texts))]
+        await vectors.upsert("t", doc_id, chunk_ids, backend.embed(texts))
+        await keywords.on_documents_indexed({
+            "tenant_id": "t",
+            "doc_id": doc_id,
+            "chunks": [{"chunk_id": c, "text": t, "page": 1} for c, t in zip(chunk_ids, texts)],
+        })
+    yield HybridRetriever(embedding, vectors, keywords, candidates=10)
+    await embedding.stop()
+
+
+class TestReciprocalRankFusion:
+    """RRF 테스트 클래스"""
+
+    def test_items_in_both_lists_win(self):
+        """양쪽에 모두 있는 항목이 위로 오는지 테스트"""
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]], k=60)
+        assert fused[0][0] == "c"
+        assert [item for item, _ in fused] == ["c", "a", "b", "d"]
+
+    def test_weights(self):
+        """가중치가 반영되는지 테스트"""
+        fused = reciprocal_rank_fusion([["a"], ["b"]], k=1, weights=[1.0, 3.0])
+        assert fused[0] == ("b", 1.5)
+
+
+class TestHybridRetriever:
+    """하이브리드 검색기 테스트 클래스"""
+
+    async def test_identifier_query_is_found(self, retriever):
+        """식별자 질의의 청크가 1위이고 양쪽 순위 정보가 채워지는지 테스트"""
+        results = await retriever.retrieve("t", "CTR-2023-777", k=3)
+        top = results[0]
+        assert top.chunk_id == "doc-2:0"
+        assert top.keyword_rank == 1
+        assert top.vector_rank is not None
+        assert top.passage.text.startswith("용역 계약서")
+
+    async def test_doc_filter_applies_to_both_retrievers(self, retriever):
+        """문서 필터가 두 검색기에 모두 적용되는지 테스트"""
+        results = await retriever.retrieve("t", "계약서", k=5, doc_ids=frozenset({"doc-3"}))
+        assert results
+        assert {result.doc_id for result in results} == {"doc-3"}
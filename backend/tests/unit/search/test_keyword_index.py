@@ -0,0 +1,167 @@
+"""
+키워드 색인 테스트
+
+한국어 토큰화, 포스팅 압축, BM25 순위, 증분 갱신/압축, 스냅샷(락 밖 직렬화) 검증
+"""
+
+import threading
+
+import numpy as np
+
+from app.domains.search import keyword_index as keyword_index_module
+from app.domains.search.keyword_index import (
+    KeywordCollection,
+    LocalKeywordIndex,
+    PostingList,
+)
+from app.domains.search.tokenizer import strip_josa, tokenize
+
+
+def chunks(doc_id, *texts):
+    """테스트용 청크 페이로드를 만듭니다."""
+    return [{"chunk_id": f"{doc_id}:{i}", "text": text, "page": i + 1} for i, text in enumerate(texts)]
+
+
+class TestTokenizer:
+    """토크나이저 테스트 클래스"""
+
+    def test_strips_josa_and_adds_bigrams(self):
+        """조사 제거와 복합명사 바이그램 생성을 테스트"""
+        assert strip_josa("계약서를") == "계약서"
+        assert strip_josa("갑은") == "갑은"  # 어간이 한 글자면 유지
+        tokens = tokenize("손해배상청구에서")
+        assert tokens[0] == "손해배상청구"
+        assert "손해" in tokens and "배상" in tokens
+
+    def test_identifiers_are_preserved(self):
+        """식별자를 통째로, 그리고 숫자만으로도 색인하는지 테스트"""
+        tokens = tokenize("사업자등록번호 123-45-67890, 계약일 2024.01.15, CTR-2024-001")
+        assert "123-45-67890" in tokens and "1234567890" in tokens
+        assert "2024.01.15" in tokens and "20240115" in tokens
+        assert "ctr-2024-001" in tokens and "ctr" in tokens
+
+
+class TestPostingList:
+    """포스팅 리스트 테스트 클래스"""
+
+    def test_round_trip_across_runs_and_widths(self):
+        """여러 런/정수 폭에 걸친 압축 복원을 테스트"""
+        rng = np.random.default_rng(0)
+        ordinals = np.cumsum(rng.choice([1, 2, 300, 70000], size=5000))
+        tfs = rng.integers(1, 400, size=5000)
+        postings = PostingList()
+        for ordinal, tf in zip(ordinals, tfs):
+            postings.add(int(ordinal), int(tf))
+
+        decoded, decoded_tfs = postings.decode()
+        np.testing.assert_array_equal(decoded, ordinals)
+        np.testing.assert_array_equal(decoded_tfs, np.minimum(tfs, 255))
+        assert len(postings.runs) <= PostingList.MAX_RUNS + 1
+
+    def test_dense_postings_use_one_byte_deltas(self):
+        """연속 서수가 1바이트 델타로 압축되는지 테스트"""
+        postings = PostingList.from_arrays(np.arange(10000), np.ones(10000, dtype=np.uint8))
+        assert postings.nbytes < 10000 * 2 + 16
+
+
+class TestKeywordCollection:
+    """BM25 컬렉션 테스트 클래스"""
+
+    def test_exact_identifier_ranks_first(self):
+        """식별자 질의가 해당 청크를 1위로 찾는지 테스트"""
+        collection = KeywordCollection()
+        collection.index_document("doc-1", chunks("doc-1", "계약 금액은 일금 일억원으로 한다.", "계약번호 CTR-2024-001 공급 계약서"))
+        collection.index_document("doc-2", chunks("doc-2", "계약번호 CTR-2023-777 용역 계약서"))
+
+        hits = collection.search("CTR-2024-001 계약", k=3)
+        assert hits[0].chunk_id == "doc-1:1"
+        assert hits[0].score > hits[1].score
+
+    def test_reindex_and_delete(self):
+        """재색인 시 이전 청크가, 삭제 시 문서가 검색되지 않는지 테스트"""
+        collection = KeywordCollection()
+        collection.index_document("doc-1", chunks("doc-1", "선급금 지급 조건"))
+        collection.index_document("doc-1", chunks("doc-1", "잔금 지급 조건"))
+        assert [hit.chunk_id for hit in collection.search("선급금", k=5)] == []
+        assert collection.passage("doc-1:0").text == "잔금 지급 조건"
+
+        collection.delete_document("doc-1")
+        assert collection.search("지급", k=5) == []
+        assert collection.stats()["documents"] == 0
+
+    def test_compaction_preserves_results(self):
+        """압축 후에도 같은 청크가 같은 순서로 나오는지 테스트 (df 보정으로 점수는 달라질 수 있음)"""
+        collection = KeywordCollection()
+        for d in range(20):
+            collection.index_document(f"doc-{d}", chunks(f"doc-{d}", f"문서 {d} 지급 조건 {d * 7}", "비밀유지 의무"))
+        for d in range(0, 20, 2):
+            collection.delete_document(f"doc-{d}")
+        before = [hit.chunk_id for hit in collection.search("지급 조건 21", k=5)]
+        assert collection.dead_ratio == 0.5
+
+        collection.compact()
+        assert collection.dead_ratio == 0.0
+        assert [hit.chunk_id for hit in collection.search("지급 조건 21", k=5)] == before
+        assert collection.passage("doc-3:0").page == 1
+
+    def test_doc_mask_filters(self):
+        """문서 마스크 필터를 테스트"""
+        collection = KeywordCollection()
+        collection.index_document("doc-1", chunks("doc-1", "지급 조건"))
+        collection.index_document("doc-2", chunks("doc-2", "지급 조건"))
+        mask = np.zeros(collection.doc_count, dtype=bool)
+        mask[collection.doc_ordinal("doc-2")] = True
+        assert [hit.doc_id for hit in collection.search("지급", k=5, doc_mask=mask)] == ["doc-2"]
+
+
+class TestLocalKeywordIndex:
+    """키워드 색인 테스트 클래스"""
+
+    async def test_event_indexing_and_snapshot(self, tmp_path):
+        """indexed 이벤트 색인과 스냅샷 재열기를 테스트"""
+        index = LocalKeywordIndex(str(tmp_path))
+        await index.on_documents_indexed({
+            "tenant_id": "tenant/a",
+            "doc_id": "doc-1",
+            "doc_name": "계약서.pdf",
+            "chunks": chunks("doc-1", "사업자등록번호 123-45-67890"),
+        })
+        await index.stop()
+
+        reopened = LocalKeywordIndex(str(tmp_path))
+        hits = await reopened.search("tenant/a", "1234567890", k=3)
+        assert [hit.chunk_id for hit in hits] == ["doc-1:0"]
+        assert reopened.passage("tenant/a", "doc-1:0").doc_name == "계약서.pdf"
+        assert await reopened.search("tenant-b", "1234567890", k=3) == []
+        assert await reopened.search("tenant/a", "1234567890", k=3, doc_ids=frozenset({"doc-9"})) == []
+
+    async def test_snapshot_is_serialized_outside_the_lock(self, tmp_path, monkeypatch):
+        """직렬화 중에도 다른 스레드가 색인할 수 있고, 그 변경은 다음 저장까지 남는지 테스트"""
+        index = LocalKeywordIndex(str(tmp_path))
+        await index.on_documents_indexed({
+            "tenant_id": "t", "doc_id": "doc-1", "chunks": chunks("doc-1", "지급 조건 30일"),
+        })
+        collection = index.collection("t")
+        dumps = keyword_index_module.pickle.dumps
+
+        def index_while_dumping(obj, *args, **kwargs):
+            writer = threading.Thread(
+                target=collection.index_document, args=("doc-2", chunks("doc-2", "위약금 10%"))
+            )
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+            return dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr(keyword_index_module.pickle, "dumps", index_while_dumping)
+        index.save("t")
+        monkeypatch.undo()
+
+        assert collection.dirty
+        reopened = LocalKeywordIndex(str(tmp_path))
+        assert [hit.doc_id for hit in await reopened.search("t", "지급 조건", k=3)] == ["doc-1"]
+        assert await reopened.search("t", "위약금", k=3) == []
+
+        index.maintain()
+        reopened = LocalKeywordIndex(str(tmp_path))
+        assert [hit.doc_id for hit in await reopened.search("t", "위약금", k=3)] == ["doc-2"]
@@ -0,0 +1,113 @@
+"""
+벡터 양자화 테스트
+
+int8/PQ 부호화 오차, 근사 점수, 저장/복원, 재채점 검색 검증
+"""
+
+import numpy as np
+import pytest
+
+from app.domains.embedding.backends import l2_normalize
+from app.domains.search.quantization import (
+    ProductQuantizer,
+    ScalarQuantizer,
+    create_quantizer,
+    load_quantizer,
+    save_quantizer,
+)
+from app.domains.search.vector_index import VectorCollection
+
+DIM = 32
+
+
+def random_vectors(n: int, seed: int = 0) -> np.ndarray:
+    """정규화된 무작위 벡터를 만듭니다."""
+    return l2_normalize(np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32))
+
+
+class TestQuantizers:
+    """양자화기 테스트 클래스"""
+
+    @pytest.mark.parametrize("kind", ["int8", "pq"])
+    def test_score_matches_decoded_inner_product(self, kind):
+        """근사 점수가 복원 벡터와의 내적과 같은지 테스트"""
+        vectors = random_vectors(2000)
+        quantizer = create_quantizer(kind, DIM, pq_subvectors=8).train(vectors)
+        codes = quantizer.encode(vectors)
+        query = random_vectors(1, seed=1)[0]
+
+        scores = quantizer.score(quantizer.prepare(query), codes)
+        np.testing.assert_allclose(scores, quantizer.decode(codes) @ query, atol=1e-4)
+
+    def test_int8_reconstruction_error_is_small(self):
+        """int8 복원 오차가 양자화 간격 이내인지 테스트"""
+        vectors = random_vectors(1000)
+        quantizer = ScalarQuantizer().train(vectors)
+        error = np.abs(quantizer.decode(quantizer.encode(vectors)) - vectors)
+        assert (error <= quantizer.scale / 2 + 1e-6).all()
+
+    def test_pq_subspaces_divide_dimension(self):
+        """PQ 부분 공간 수가 차원의 약수로 조정되는지 테스트"""
+        assert ProductQuantizer.subspaces_for(384, 48) == 48
+        assert ProductQuantizer.subspaces_for(384, 50) == 48
+        assert ProductQuantizer.subspaces_for(10, 4) == 2
+
+    @pytest.mark.parametrize("kind", ["int8", "pq"])
+    def test_save_and_load_round_trip(self, tmp_path, kind):
+        """저장한 양자화기가 같은 코드를 만드는지 테스트"""
+        vectors = random_vectors(500)
+        quantizer = create_quantizer(kind, DIM, pq_subvectors=8).train(vectors)
+        path = str(tmp_path / "quantizer.npz")
+        save_quantizer(path, quantizer)
+
+        loaded = load_quantizer(path)
+        assert loaded.kind == kind
+        np.testing.assert_array_equal(loaded.encode(vectors), quantizer.encode(vectors))
+
+
+class TestQuantizedSearch:
+    """양자화 세그먼트 검색 테스트 클래스"""
+
+    @pytest.mark.parametrize("kind", ["int8", "pq"])
+    def test_rescored_hits_use_full_precision(self, tmp_path, kind):
+        """재채점 결과 점수가 원본 벡터 내적과 같은지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=100000, quantization=kind)
+        vectors = random_vectors(3000)
+        collection.upsert("doc-1", [str(i) for i in range(3000)], vectors)
+        segment = collection.flush()
+        assert segment.codes is not None
+
+        query = vectors[42]
+        hits = collection.search(query, k=5, nprobe=64)
+        assert hits[0].chunk_id == "42"
+        for hit in hits:
+            assert hit.score == pytest.approx(float(vectors[int(hit.chunk_id)] @ query), abs=1e-5)
+
+    @pytest.mark.parametrize("kind,min_recall", [("int8", 0.95), ("pq", 0.6)])
+    def test_recall_and_memory(self, tmp_path, kind, min_recall):
+        """양자화 검색의 재현율과 상주 메모리 축소를 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=100000, quantization=kind)
+        vectors = random_vectors(3000)
+        collection.upsert("doc-1", [str(i) for i in range(3000)], vectors)
+        collection.flush()
+
+        recall = []
+        for query in random_vectors(20, seed=5):
+            exact = set(np.argsort(-(vectors @ query))[:10].astype(str))
+            found = {hit.chunk_id for hit in collection.search(query, k=10, nprobe=64, rescore_factor=8)}
+            recall.append(len(exact & found) / 10)
+        assert np.mean(recall) >= min_recall
+
+        stats = collection.stats()
+        assert stats["resident_bytes"] * 4 <= stats["full_precision_bytes"]
+
+    def test_quantization_survives_reopen(self, tmp_path):
+        """재시작 후에도 양자화 코드가 로드되는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000, quantization="int8")
+        vectors = random_vectors(100)
+        collection.upsert("doc-1", [str(i) for i in range(100)], vectors)
+        collection.flush()
+
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000, quantization="none")
+        assert reopened.segments[0].quantizer.kind == "int8"
+        assert reopened.search(vectors[7], k=1)[0].chunk_id == "7"
@@ -0,0 +1,156 @@
+"""
+재순위화 테스트
+
+배치 채점, 점수 캐시, 시간 예산 폴백, 적응형 후보 수, 백엔드 장애 처리, 시작 시 설정 오류 검증
+"""
+
+import asyncio
+import time
+from typing import List, Sequence
+
+import numpy as np
+import pytest
+
+from app.common.config import settings
+from app.domains.search.rerank import (
+    RERANK_CACHED,
+    RERANK_DISABLED,
+    RERANK_FAILED,
+    RERANK_RERANKED,
+    RERANK_TIMEOUT,
+    LexicalRerankBackend,
+    Reranker,
+)
+
+
+class RecordingBackend:
+    """본문 길이를 점수로 쓰고 호출 배치를 기록하는 테스트 백엔드"""
+
+    model_id = "recording"
+    model_version = "1"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches: List[int] = []
+
+    def score(self, query: str, passages: Sequence[str]) -> np.ndarray:
+        time.sleep(self.delay)
+        self.batches.append(len(passages))
+        return np.asarray([len(p) / 100 for p in passages], dtype=np.float32)
+
+
+class TestReranker:
+    """재순위화 서비스 테스트 클래스"""
+
+    async def test_reorders_candidates_in_batches(self):
+        """점수순으로 재정렬하고 배치 크기 단위로 채점하는지 테스트"""
+        backend = RecordingBackend()
+        reranker = Reranker(lambda: backend, batch_size=2, budget_ms=1000, max_candidates=10)
+        passages = ["a", "aaaa", "aa", "aaa", "a" * 5]
+
+        outcome = await reranker.rerank("질의", passages)
+        await reranker.stop()
+
+        assert outcome.status == RERANK_RERANKED
+        assert outcome.order == [4, 1, 3, 2, 0]
+        assert outcome.scores[4] == np.float32(0.05)
+        assert backend.batches == [2, 2, 1]
+
+    async def test_scores_are_cached_per_query_and_passage(self):
+        """같은 (질의, 본문) 쌍은 다시 추론하지 않는지 테스트"""
+        backend = RecordingBackend()
+        reranker = Reranker(lambda: backend, batch_size=8, budget_ms=1000, max_candidates=10)
+
+        await reranker.rerank("질의", ["aa", "a"])
+        outcome = await reranker.rerank("질의", ["a", "aa"])
+        assert outcome.status == RERANK_CACHED
+        assert outcome.cache_hits == 2
+        assert outcome.order == [1, 0]
+
+        outcome = await reranker.rerank("다른 질의", ["a"])
+        await reranker.stop()
+        assert outcome.status == RERANK_RERANKED
+        assert backend.batches == [2, 1]
+
+    async def test_cached_scores_are_keyed_by_model(self):
+        """버전이 같아도 다른 모델의 캐시 점수를 쓰지 않는지 테스트"""
+        backend = RecordingBackend()
+        reranker = Reranker(lambda: backend, batch_size=8, budget_ms=1000, max_candidates=10)
+        await reranker.rerank("질의", ["aa", "a"])
+
+        other = RecordingBackend()
+        other.model_id = "other"
+        reranker._backend = other
+        outcome = await reranker.rerank("질의", ["aa", "a"])
+        await reranker.stop()
+
+        assert outcome.status == RERANK_RERANKED
+        assert outcome.cache_hits == 0
+        assert other.batches == [2]
+
+    async def test_budget_exceeded_falls_back_to_first_stage(self):
+        """시간 예산을 넘기면 1차 순서를 반환하고 늦게 끝난 점수는 캐시하는지 테스트"""
+        backend = RecordingBackend(delay=0.05)
+        reranker = Reranker(lambda: backend, batch_size=8, budget_ms=10, max_candidates=10)
+
+        outcome = await reranker.rerank("질의", ["a", "aaa", "aa"])
+        assert outcome.status == RERANK_TIMEOUT
+        assert outcome.order == [0, 1, 2]
+        assert outcome.scores == {}
+
+        await asyncio.sleep(0.1)
+        outcome = await reranker.rerank("질의", ["a", "aaa", "aa"])
+        await reranker.stop()
+        assert outcome.status == RERANK_CACHED
+        assert outcome.order == [1, 2, 0]
+
+    async def test_candidate_limit_adapts_to_latency_and_load(self):
+        """본문당 추론 시간과 동시 요청 수에 따라 후보 수가 줄어드는지 테스트"""
+        reranker = Reranker(
+            lambda: RecordingBackend(), budget_ms=100, max_candidates=50, min_candidates=5
+        )
+        assert reranker.candidate_limit() == 50
+
+        reranker._seconds_per_passage = 0.004
+        assert reranker.candidate_limit() == 25
+        reranker._inflight = 3
+        assert reranker.candidate_limit() == 6
+        reranker._inflight = 20
+        assert reranker.candidate_limit() == 5
+
+        passages = [str(i) for i in range(30)]
+        reranker._inflight = 0
+        outcome = await reranker.rerank("질의", passages)
+        await reranker.stop()
+        assert outcome.candidates <= 25
+        assert sorted(outcome.order) == list(range(30))
+        assert outcome.order[outcome.candidates:] == list(range(outcome.candidates, 30))
+
+    async def test_backend_problems_keep_first_stage_order(self):
+        """백엔드가 꺼져 있거나 추론이 실패하면 1차 순서를 유지하는지 테스트"""
+        class FailingBackend(RecordingBackend):
+            def score(self, query, passages):
+                raise ValueError("추론 실패")
+
+        disabled = await Reranker(lambda: None).rerank("질의", ["a", "b"])
+        failing = Reranker(lambda: FailingBackend(), budget_ms=1000)
+        failed = await failing.rerank("질의", ["a", "b"])
+        await failing.stop()
+
+        assert (disabled.status, disabled.order) == (RERANK_DISABLED, [0, 1])
+        assert (failed.status, failed.order) == (RERANK_FAILED, [0, 1])
+
+    async def test_misconfigured_backend_fails_at_start(self, monkeypatch):
+        """ONNX 모델 디렉터리가 없으면 1차 순서로 조용히 떨어지지 않고 시작 시점에 실패하는지 테스트"""
+        monkeypatch.setattr(settings, "RERANK_BACKEND", "onnx")
+        monkeypatch.setattr(settings, "RERANK_ONNX_DIR", None)
+
+        with pytest.raises(RuntimeError, match="RERANK_ONNX_DIR"):
+            await Reranker().start()
+
+    def test_lexical_backend_prefers_matching_passages(self):
+        """어휘 백엔드가 질의 토큰을 더 많이 포함한 본문에 높은 점수를 주는지 테스트"""
+        scores = LexicalRerankBackend().score(
+            "손해배상 청구 기간", ["손해배상 청구 기간은 3년이다", "계약 해지 조항", "손해배상 범위"]
+        )
+        assert scores[0] > scores[2] > scores[1]
@@ -0,0 +1,197 @@
+"""
+벡터 색인 테스트
+
+테넌트 격리, 필터, 업서트/삭제, 플러시 후 재열기, 플러시 전 버전의 비영속, 매니페스트 기록 전 종료 후
+재시작, 세그먼트 생성 실패 시 버퍼 복구, 병합, 재현율 검증
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from app.domains.embedding.backends import l2_normalize
+from app.domains.search.vector_index import LocalVectorIndex, Segment, VectorCollection, VectorFilter
+
+DIM = 16
+
+
+def random_vectors(n: int, seed: int = 0) -> np.ndarray:
+    """정규화된 무작위 벡터를 만듭니다."""
+    return l2_normalize(np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32))
+
+
+class TestVectorCollection:
+    """벡터 컬렉션 테스트 클래스"""
+
+    def test_search_returns_exact_match_first(self, tmp_path):
+        """같은 벡터로 검색하면 해당 청크가 1위인지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        vectors = random_vectors(20)
+        collection.upsert("doc-1", [f"doc-1:{i}" for i in range(20)], vectors)
+
+        hits = collection.search(vectors[7], k=3)
+        assert hits[0].chunk_id == "doc-1:7"
+        assert hits[0].doc_id == "doc-1"
+        assert hits[0].score == pytest.approx(1.0, abs=1e-5)
+
+    def test_upsert_replaces_and_delete_removes(self, tmp_path):
+        """재업서트 시 이전 청크가, 삭제 시 모든 청크가 사라지는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        old, new = random_vectors(5, seed=1), random_vectors(5, seed=2)
+        collection.upsert("doc-1", [f"old:{i}" for i in range(5)], old)
+        collection.flush()
+        collection.upsert("doc-1", [f"new:{i}" for i in range(5)], new)
+
+        chunk_ids = {hit.chunk_id for hit in collection.search(old[0], k=10)}
+        assert chunk_ids == {f"new:{i}" for i in range(5)}
+
+        collection.delete("doc-1")
+        assert collection.search(new[0], k=10) == []
+
+    def test_doc_mask_filters_during_scan(self, tmp_path):
+        """문서 마스크로 허용된 문서만 k개 반환하는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        for d in range(10):
+            collection.upsert(f"doc-{d}", [f"doc-{d}:{i}" for i in range(10)], random_vectors(10, seed=d))
+        mask = np.zeros(collection.doc_count, dtype=bool)
+        mask[collection.doc_ordinal("doc-3")] = True
+
+        hits = collection.search(random_vectors(1, seed=99)[0], k=5, doc_mask=mask)
+        assert len(hits) == 5
+        assert {hit.doc_id for hit in hits} == {"doc-3"}
+
+    def test_reopen_after_flush(self, tmp_path):
+        """플러시된 세그먼트와 문서 상태가 재시작 후에도 유지되는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        vectors = random_vectors(30)
+        collection.upsert("doc-1", [f"a:{i}" for i in range(15)], vectors[:15])
+        collection.upsert("doc-2", [f"b:{i}" for i in range(15)], vectors[15:])
+        collection.delete("doc-2")
+        collection.flush()
+
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        assert reopened.stats()["segments"] == 1
+        assert reopened.search(vectors[3], k=1)[0].chunk_id == "a:3"
+        assert all(hit.doc_id == "doc-1" for hit in reopened.search(vectors[20], k=30))
+
+    def test_unflushed_version_is_not_persisted(self, tmp_path):
+        """플러시 전의 새 버전은 디스크에 기록되지 않고, 재시작하면 플러시된 버전으로 돌아가는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        old, new = random_vectors(5, seed=1), random_vectors(5, seed=2)
+        collection.upsert("문서-1", [f"이전:{i}" for i in range(5)], old)
+        collection.flush()
+        collection.upsert("문서-2", [f"다른:{i}" for i in range(5)], random_vectors(5, seed=3))
+        collection.flush()
+        collection.upsert("문서-1", [f"새:{i}" for i in range(5)], new)
+        # 버퍼에 새 버전이 남은 채로 병합이 상태를 저장한다
+        collection.merge(max_segments=1)
+
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        hits = reopened.search(old[0], k=5, doc_mask=np.array([True, False]))
+        assert {hit.chunk_id for hit in hits} == {f"이전:{i}" for i in range(5)}
+        assert hits[0].doc_id == "문서-1"
+
+        collection.flush()
+        collection.merge(max_segments=1)
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        hits = reopened.search(new[0], k=5, doc_mask=np.array([True, False]))
+        assert {hit.chunk_id for hit in hits} == {f"새:{i}" for i in range(5)}
+        assert reopened.stats()["segment_rows"] == 10
+
+    def test_restart_after_crash_before_manifest_save(self, tmp_path):
+        """세그먼트 기록 후 매니페스트 저장 전에 종료되어도 다시 열어 플러시할 수 있는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        vectors = random_vectors(10)
+        collection.upsert("doc-1", [f"a:{i}" for i in range(5)], vectors[:5])
+        collection.flush()
+        # 다음 세그먼트를 기록한 뒤 매니페스트를 저장하지 못하고 종료된 상태
+        Segment.build(str(tmp_path / "seg-00000002"), vectors[5:], np.zeros(5), np.full(5, 9), ["x"] * 5)
+        os.makedirs(tmp_path / "seg-00000003.tmp")
+
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        assert sorted(name for name in os.listdir(tmp_path) if name.startswith("seg-")) == ["seg-00000001"]
+        reopened.upsert("doc-2", [f"b:{i}" for i in range(5)], vectors[5:])
+        assert reopened.flush() is not None
+        assert reopened.search(vectors[7], k=1)[0].chunk_id == "b:2"
+        assert reopened.search(vectors[1], k=1)[0].chunk_id == "a:1"
+
+    def test_failed_build_returns_rows_to_memtable(self, tmp_path, monkeypatch):
+        """세그먼트 생성이 실패하면 행이 memtable로 돌아가 검색되고 다음 플러시에 기록되는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=5)
+        vectors = random_vectors(15)
+        build = Segment.build
+
+        def failing_build(*args, **kwargs):
+            raise OSError("디스크 가득 참")
+
+        monkeypatch.setattr(Segment, "build", failing_build)
+        collection.upsert("doc-1", [f"a:{i}" for i in range(5)], vectors[:5])
+        collection.upsert("doc-2", [f"b:{i}" for i in range(5)], vectors[5:10])
+        stats = collection.stats()
+        assert stats["segments"] == 0 and stats["memtable_rows"] == 10
+        assert collection.search(vectors[2], k=1)[0].chunk_id == "a:2"
+
+        monkeypatch.setattr(Segment, "build", build)
+        collection.upsert("doc-3", [f"c:{i}" for i in range(5)], vectors[10:])
+        assert collection.stats()["memtable_rows"] == 0
+        reopened = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        assert reopened.stats()["segment_rows"] == 15
+        assert [reopened.search(vectors[i], k=1)[0].chunk_id for i in (2, 7, 12)] == ["a:2", "b:2", "c:2"]
+
+    def test_merge_drops_stale_rows(self, tmp_path):
+        """병합이 세그먼트 수를 줄이고 오래된 행을 제거하는지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=1000)
+        for version in range(4):
+            collection.upsert("doc-1", [f"v{version}:{i}" for i in range(10)], random_vectors(10, seed=version))
+            collection.flush()
+        assert collection.stats()["segments"] == 4
+
+        collection.merge(max_segments=1)
+        stats = collection.stats()
+        assert stats["segments"] == 1
+        assert stats["segment_rows"] == 10
+        assert len(list(tmp_path.glob("seg-*"))) == 1
+
+    def test_ivf_recall_against_brute_force(self, tmp_path):
+        """IVF 검색 재현율이 전수 검색 대비 충분한지 테스트"""
+        collection = VectorCollection(str(tmp_path), DIM, memtable_rows=100000)
+        vectors = random_vectors(4096)
+        collection.upsert("doc-1", [str(i) for i in range(4096)], vectors)
+        segment = collection.flush()
+        assert len(segment.centroids) > 1
+
+        queries = random_vectors(20, seed=7)
+        recall = []
+        for query in queries:
+            exact = set(np.argsort(-(vectors @ query))[:10].astype(str))
+            found = {hit.chunk_id for hit in collection.search(query, k=10, nprobe=16)}
+            recall.append(len(exact & found) / 10)
+        assert np.mean(recall) >= 0.8
+
+
+class TestLocalVectorIndex:
+    """로컬 벡터 색인 테스트 클래스"""
+
+    async def test_tenants_are_isolated(self, tmp_path):
+        """테넌트 간 결과가 섞이지 않는지 테스트"""
+        index = LocalVectorIndex(str(tmp_path), dim=DIM, memtable_rows=1000)
+        vectors = random_vectors(4)
+        await index.upsert("tenant/a", "doc-1", ["a:0", "a:1"], vectors[:2])
+        await index.upsert("tenant-b", "doc-1", ["b:0", "b:1"], vectors[2:])
+
+        hits = await index.search("tenant/a", vectors[2], k=10)
+        assert {hit.chunk_id for hit in hits} == {"a:0", "a:1"}
+        await index.stop()
+        assert (tmp_path / "tenant%2Fa" / "manifest.json").exists()
+
+    async def test_filter_by_doc_ids(self, tmp_path):
+        """문서 ID 필터가 적용되는지 테스트"""
+        index = LocalVectorIndex(str(tmp_path), dim=DIM, memtable_rows=1000)
+        vectors = random_vectors(6)
+        for d in range(3):
+            await index.upsert("t", f"doc-{d}", [f"{d}:0", f"{d}:1"], vectors[2 * d:2 * d + 2])
+
+        hits = await index.search("t", vectors[0], k=10, vector_filter=VectorFilter(frozenset({"doc-2", "missing"})))
+        assert {hit.doc_id for hit in hits} == {"doc-2"}
+        assert await index.search("t", vectors[0], k=10, vector_filter=VectorFilter(frozenset())) == []
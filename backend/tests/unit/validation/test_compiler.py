@@ -0,0 +1,122 @@
+"""
+검증 규칙 컴파일러 테스트
+
+규칙 방식별 판정, 정규화 열 공유, 비용/실패율 기반 평가 순서와 short-circuit 검증
+"""
+
+import pytest
+
+from app.domains.validation.compiler import (
+    PASS_NUMBER,
+    PASS_TEXT,
+    STATUS_FAILED,
+    STATUS_REVIEW,
+    STATUS_VALIDATED,
+    ColumnBatch,
+    RuleCompileError,
+    RuleSpec,
+    compile_rules,
+    parse_date,
+)
+from app.domains.validation.models import CompareOperator, FieldType, ValidationType
+
+
+def spec(rule_id: str, validation_type: ValidationType, field_type: FieldType = FieldType.TEXT, **kwargs) -> RuleSpec:
+    """테스트용 규칙 스냅샷을 만듭니다."""
+    return RuleSpec(rule_id, rule_id, field_type, validation_type, **kwargs)
+
+
+class TestRuleCompiler:
+    """규칙 컴파일러 테스트 클래스"""
+
+    def test_each_rule_type(self):
+        """정규식/형식/임계값/유사도/필드 간 비교 규칙을 배치로 판정하는지 테스트"""
+        plan = compile_rules([
+            spec("email", ValidationType.FORMAT, FieldType.EMAIL),
+            spec("phone", ValidationType.FORMAT, FieldType.PHONE),
+            spec("code", ValidationType.REGEX, field_name="code", regex=r"^CTR-\d{4}-\d{3}$"),
+            spec("amount", ValidationType.THRESHOLD, field_name="amount", threshold=1000),
+            spec("name", ValidationType.SIMILARITY, field_name="name", threshold=0.8),
+            spec("period", ValidationType.CROSS_FIELD, FieldType.DATE, field_name="start", compare_field="end",
+                 operator=CompareOperator.LE),
+            spec("party", ValidationType.CROSS_FIELD, field_name="payer", compare_field="payee",
+                 operator=CompareOperator.NE),
+        ])
+        valid = {
+            "email": "kim@example.com", "phone": "010-1234-5678", "code": "CTR-2024-001",
+            "amount": "1,500원", "name": "홍 길동", "start": "2024.01.15", "end": "2024년 2월 1일",
+            "payer": "주식회사 갑", "payee": "을",
+        }
+        rows = [
+            valid,
+            {**valid, "email": "kim@"},
+            {**valid, "phone": "02-12"},
+            {**valid, "code": "ctr-24"},
+            {**valid, "amount": "900"},
+            {**valid, "name": "김철수"},
+            {**valid, "start": "2024-03-01"},
+            {**valid, "payee": "주식회사  갑"},
+            {},
+        ]
+        expected = [{"name": "홍길동"}] * len(rows)
+
+        outcomes = plan.evaluate(rows, expected, short_circuit=False)
+
+        assert [o.status for o in outcomes] == [STATUS_VALIDATED] + [STATUS_FAILED] * 8
+        assert [[e["ruleId"] for e in o.errors] for o in outcomes[1:8]] == [
+            ["email"], ["phone"], ["code"], ["amount"], ["name"], ["period"], ["party"],
+        ]
+        # 값이 없는 필드는 검사하지 않지만 기대값이 있는 유사도 규칙은 실패
+        assert [e["ruleId"] for e in outcomes[8].errors] == ["name"]
+
+    def test_invalid_rules_fail_to_compile(self):
+        """필수 값이 없거나 정규식이 잘못된 규칙은 컴파일 오류가 나는지 테스트"""
+        with pytest.raises(RuleCompileError):
+            compile_rules([spec("r", ValidationType.REGEX, regex="([")])
+        with pytest.raises(RuleCompileError):
+            compile_rules([spec("t", ValidationType.THRESHOLD)])
+        with pytest.raises(RuleCompileError):
+            compile_rules([spec("c", ValidationType.CROSS_FIELD, compare_field="end")])
+
+    def test_human_review_flags_without_failing(self):
+        """휴먼검토 규칙은 실패 대신 검토 대상으로 표시하는지 테스트"""
+        plan = compile_rules([
+            spec("review", ValidationType.HUMAN_REVIEW, field_name="memo", human_review_required=True),
+            spec("off", ValidationType.HUMAN_REVIEW, human_review_required=False),
+        ])
+
+        outcomes = plan.evaluate([{"memo": "특약 있음"}, {"memo": " "}])
+
+        assert outcomes[0].status == STATUS_REVIEW
+        assert outcomes[0].review_rules == ["review"]
+        assert outcomes[1].status == STATUS_VALIDATED
+
+    def test_normalization_columns_are_shared(self):
+        """같은 필드의 정규화 열은 한 번만 계산해 재사용하는지 테스트"""
+        batch = ColumnBatch([{"amount": {"value": "１,２００"}}, {"amount": None}])
+
+        numbers = batch.column("amount", PASS_NUMBER)
+        assert batch.column("amount", PASS_NUMBER) is numbers
+        assert numbers[0] == 1200.0
+        assert batch.column("amount", PASS_TEXT) == ["1,200", None]
+        assert batch.missing("amount").tolist() == [False, True]
+        assert parse_date("20240230") is None
+        assert parse_date("2024. 1. 5") == "2024-01-05"
+
+    def test_short_circuit_orders_by_cost_and_failure_rate(self):
+        """자주 실패하는 저비용 규칙을 먼저 평가하고 실패한 문서는 이후 규칙에서 제외하는지 테스트"""
+        plan = compile_rules([
+            spec("name", ValidationType.SIMILARITY, field_name="name"),
+            spec("amount", ValidationType.THRESHOLD, field_name="amount", threshold=100),
+        ])
+        assert [rule.spec.rule_id for rule in plan.rules] == ["amount", "name"]
+
+        rows = [{"amount": "10", "name": "가"}] * 50
+        outcomes = plan.evaluate(rows, [{"name": "나"}] * 50)
+
+        assert all([e["ruleId"] for e in o.errors] == ["amount"] for o in outcomes)
+        stats = {rule["ruleId"]: rule for rule in plan.stats()["rules"]}
+        assert stats["amount"]["failureRate"] > 0.8
+        # 유사도 규칙은 한 번도 평가되지 않아 사전값 그대로
+        assert stats["name"]["failureRate"] == 0.1
+        assert plan.stats()["documents"] == 50
@@ -0,0 +1,157 @@
+"""
+유사 중복 색인 테스트
+
+MinHash 유사도 추정, 재OCR 사본 탐지, 재처리 시 자기 제외와 서명 교체, 세그먼트 플러시/병합 영속성,
+매니페스트 기록 전 종료 후 재시작과 플러시 실패 복구, 테넌트 격리 검증
+"""
+
+import os
+
+import numpy as np
+
+from app.domains.validation.dedup import DedupCollection, DedupSegment, MinHasher, NearDuplicateIndex
+
+CONTRACT = (
+    "제1조 (목적) 본 계약은 주식회사 갑과 주식회사 을 사이의 소프트웨어 유지보수 용역 제공에 관한 "
+    "제반 사항을 정함을 목적으로 한다. 제2조 (계약기간) 계약기간은 2024년 1월 1일부터 2024년 12월 "
+    "31일까지로 하며, 만료 1개월 전까지 서면 통지가 없으면 동일 조건으로 1년간 자동 연장된다. "
+    "제3조 (대금) 월 용역 대금은 금 오백만원(부가세 별도)으로 하고 익월 10일까지 지급한다."
+)
+# 재스캔/재OCR로 글자 몇 개가 달라진 사본
+RESCANNED = CONTRACT.replace("갑과", "갑괴").replace("10일", "1O일")
+INVOICE = (
+    "거래명세서 공급자 주식회사 병 등록번호 123-45-67890 품목 사무용 의자 수량 12 단가 85,000 "
+    "공급가액 1,020,000 세액 102,000 합계 1,122,000 인수자 서명란 비고 납품일 2024년 3월 4일"
+)
+
+
+def make_index(tmp_path, **kwargs) -> NearDuplicateIndex:
+    """테스트용 색인을 만듭니다."""
+    return NearDuplicateIndex(str(tmp_path), num_perm=128, bands=16, shingle_size=5, threshold=0.8, **kwargs)
+
+
+class TestNearDuplicateIndex:
+    """유사 중복 색인 테스트 클래스"""
+
+    def test_signature_estimates_jaccard(self):
+        """같은 본문은 서명이 같고 무관한 본문은 유사도가 낮은지 테스트"""
+        hasher = MinHasher(128, 5)
+
+        same = hasher.signature(CONTRACT)
+        assert same.dtype == np.uint32 and same.shape == (128,)
+        assert np.array_equal(same, hasher.signature(CONTRACT))
+        assert (same == hasher.signature(RESCANNED)).mean() > 0.8
+        assert (same == hasher.signature(INVOICE)).mean() < 0.1
+        assert hasher.signature("   ") is None
+
+    def test_finds_rescanned_copy(self, tmp_path):
+        """재OCR 사본은 중복으로, 무관한 문서는 새 문서로 판정하는지 테스트"""
+        index = make_index(tmp_path)
+
+        assert index.check_and_add("t1", "contract", CONTRACT) is None
+        match = index.check_and_add("t1", "rescan", RESCANNED)
+        assert match is not None and match.doc_id == "contract"
+        assert 0.8 <= match.similarity < 1.0
+        assert index.check_and_add("t1", "invoice", INVOICE) is None
+
+    def test_reprocessing_excludes_itself(self, tmp_path):
+        """같은 문서를 다시 처리하면 자기 자신은 중복으로 보지 않는지 테스트"""
+        index = make_index(tmp_path)
+        index.check_and_add("t1", "contract", CONTRACT)
+
+        assert index.check_and_add("t1", "contract", CONTRACT) is None
+        assert index.collection("t1").doc_count == 1
+
+    def test_readded_document_replaces_its_signature(self, tmp_path):
+        """본문이 바뀐 문서를 다시 추가하면 이전 본문으로는 더 이상 찾지 못하는지 테스트 (버퍼/세그먼트 모두)"""
+        index = make_index(tmp_path)
+        collection = index.collection("t1")
+        index.check_and_add("t1", "doc", CONTRACT)
+        index.check_and_add("t1", "doc", INVOICE)
+        assert index.check_and_add("t1", "copy", CONTRACT) is None
+        assert index.check_and_add("t1", "invoice-copy", INVOICE).doc_id == "doc"
+
+        collection.flush()
+        index.check_and_add("t1", "copy", INVOICE)
+        collection.flush()
+        assert collection.merge(max_segments=1) is not None
+        assert collection.doc_count == 3
+        signature = index.hasher.signature(CONTRACT)
+        assert [m.doc_id for m in collection.query(signature, 0.8, k=5)] == []
+        assert {m.doc_id for m in collection.query(index.hasher.signature(INVOICE), 0.8, k=5)} == {
+            "doc", "invoice-copy", "copy"
+        }
+        assert len(collection.segments[0]) == 3
+
+    def test_tenants_are_isolated(self, tmp_path):
+        """다른 테넌트의 문서와는 비교하지 않는지 테스트"""
+        index = make_index(tmp_path)
+        index.check_and_add("t1", "contract", CONTRACT)
+
+        assert index.check_and_add("t2", "copy", CONTRACT) is None
+        assert index.check_and_add("t1", "copy", CONTRACT).doc_id == "contract"
+
+    def test_segments_persist_and_merge(self, tmp_path):
+        """플러시/병합한 세그먼트가 다시 열어도 조회되는지 테스트"""
+        rng = np.random.default_rng(0)
+        signatures = rng.integers(0, 1 << 32, size=(30, 64), dtype=np.uint64).astype(np.uint32)
+        collection = DedupCollection(str(tmp_path), num_perm=64, bands=16, memtable_docs=10)
+        for i, signature in enumerate(signatures):
+            collection.add(f"doc-{i}", signature)
+        assert len(collection.segments) == 3
+
+        merged = collection.merge(max_segments=2)
+        assert merged is not None and len(merged) == 30
+        collection.add("pending", signatures[0] ^ np.uint32(1))
+        collection.flush()
+
+        reopened = DedupCollection(str(tmp_path), num_perm=64, bands=16)
+        assert reopened.doc_count == 31 and len(reopened.segments) == 2
+        assert [m.doc_id for m in reopened.query(signatures[7], 0.9)] == ["doc-7"]
+        near = signatures[7].copy()
+        near[:4] += 1
+        assert reopened.query(near, 0.9)[0].doc_id == "doc-7"
+        assert reopened.query(rng.integers(0, 1 << 32, 64, dtype=np.uint64).astype(np.uint32), 0.5) == []
+
+    def test_restart_after_crash_before_manifest_save(self, tmp_path):
+        """세그먼트 기록 후 매니페스트 저장 전에 종료되어도 다시 열어 플러시할 수 있는지 테스트"""
+        rng = np.random.default_rng(1)
+        signatures = rng.integers(0, 1 << 32, size=(6, 64), dtype=np.uint64).astype(np.uint32)
+        collection = DedupCollection(str(tmp_path), num_perm=64, bands=16, memtable_docs=100)
+        for i in range(3):
+            collection.add(f"doc-{i}", signatures[i])
+        collection.flush()
+        # 다음 세그먼트를 기록한 뒤 매니페스트를 저장하지 못하고 종료된 상태
+        DedupSegment.build(str(tmp_path / "seg-000002"), signatures[3:5], np.arange(3, 5), 16)
+        os.makedirs(tmp_path / "seg-000003.tmp")
+
+        reopened = DedupCollection(str(tmp_path), num_perm=64, bands=16, memtable_docs=100)
+        assert sorted(os.listdir(tmp_path)) == ["docs.json", "manifest.json", "seg-000001"]
+        assert reopened.doc_count == 3
+        reopened.add("doc-5", signatures[5])
+        assert reopened.flush() is not None
+        assert [m.doc_id for m in reopened.query(signatures[5], 0.9)] == ["doc-5"]
+        assert reopened.query(signatures[3], 0.9) == []
+
+    def test_failed_flush_keeps_buffer(self, tmp_path, monkeypatch):
+        """세그먼트 기록이 실패해도 쓰기는 성공하고 버퍼가 남아 조회되며 다음 플러시에 기록되는지 테스트"""
+        rng = np.random.default_rng(2)
+        signatures = rng.integers(0, 1 << 32, size=(4, 64), dtype=np.uint64).astype(np.uint32)
+        collection = DedupCollection(str(tmp_path), num_perm=64, bands=16, memtable_docs=2)
+        build = DedupSegment.build
+
+        def failing_build(*args, **kwargs):
+            raise OSError("디스크 가득 참")
+
+        monkeypatch.setattr(DedupSegment, "build", failing_build)
+        for i in range(3):
+            collection.add(f"doc-{i}", signatures[i])
+        assert collection.stats()["memtable_docs"] == 3 and collection.segments == []
+        assert [m.doc_id for m in collection.query(signatures[1], 0.9)] == ["doc-1"]
+
+        monkeypatch.setattr(DedupSegment, "build", build)
+        collection.add("doc-3", signatures[3])
+        assert collection.stats()["memtable_docs"] == 0
+        reopened = DedupCollection(str(tmp_path), num_perm=64, bands=16)
+        assert reopened.doc_count == 4
+        assert [m.doc_id for m in reopened.query(signatures[2], 0.9)] == ["doc-2"]
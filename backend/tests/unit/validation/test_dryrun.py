@@ -0,0 +1,83 @@
+"""
+검증 규칙 시험 실행 테스트
+
+최근 문서 표본 보관, 프로세스 풀 청크 평가와 누적 통계, 연결 종료 시 취소 검증
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domains.validation.compiler import RuleSpec
+from app.domains.validation.dryrun import DryRunner, SampleDocument, SampleStore
+from app.domains.validation.models import FieldType, ValidationType
+
+SPECS = [
+    RuleSpec("email", "이메일", FieldType.EMAIL, ValidationType.FORMAT),
+    RuleSpec("amount", "금액", FieldType.NUMBER, ValidationType.THRESHOLD, field_name="amount", threshold=100),
+]
+
+
+def documents(count: int) -> list:
+    """세 건 중 한 건은 이메일이, 앞의 100건은 금액이 실패하는 표본을 만듭니다."""
+    return [
+        SampleDocument(f"doc-{i}", {"email": "bad" if i % 3 == 0 else "kim@example.com", "amount": str(i)}, None)
+        for i in range(count)
+    ]
+
+
+async def collect(runner: DryRunner, docs: list, **kwargs) -> list:
+    """시험 실행 이벤트를 모두 모읍니다."""
+    return [event async for event in runner.run(SPECS, docs, **kwargs)]
+
+
+class TestDryRun:
+    """검증 규칙 시험 실행 테스트 클래스"""
+
+    def test_sample_store_keeps_recent_documents(self):
+        """테넌트별 최근 N건만 최신순으로 보관하고 재처리 문서는 교체하는지 테스트"""
+        store = SampleStore(max_docs=3)
+        store.record("t1", [{"doc_id": f"d{i}", "extracted_fields": {"n": i}} for i in range(4)])
+        store.record("t1", [{"doc_id": "d2", "extracted_fields": {"n": 20}}])
+
+        assert [(d.doc_id, d.fields["n"]) for d in store.recent("t1", 10)] == [("d2", 20), ("d3", 3), ("d1", 1)]
+        assert store.recent("t1", 1)[0].doc_id == "d2"
+        assert store.size("t2") == 0
+
+    async def test_process_pool_streams_progress(self):
+        """프로세스 풀에서 청크를 평가하며 누적 통계를 내보내는지 테스트"""
+        runner = DryRunner(workers=2, chunk_docs=50)
+        try:
+            events = await collect(runner, documents(300))
+        finally:
+            await runner.stop()
+
+        names = [name for name, _ in events]
+        assert names[-1] == "done" and set(names[:-1]) == {"progress"}
+        evaluated = [data["evaluated"] for _, data in events]
+        assert evaluated == sorted(evaluated) and evaluated[-1] == 300
+        final = events[-1][1]
+        assert {rule["ruleId"]: rule["failures"] for rule in final["rules"]} == {"email": 100, "amount": 100}
+        assert final["failed"] == 166 and final["validated"] == 134
+        assert len(final["failedDocs"]) == 20
+
+    async def test_disconnect_cancels_pending_chunks(self):
+        """연결이 끊기면 남은 청크를 취소하고 스트림을 끝내는지 테스트"""
+        runner = DryRunner(workers=1, chunk_docs=10, executor=ThreadPoolExecutor(max_workers=1))
+        checks = []
+
+        async def is_disconnected() -> bool:
+            checks.append(True)
+            return len(checks) >= 2
+
+        events = await collect(runner, documents(200), is_disconnected=is_disconnected)
+        await runner.stop()
+
+        assert [name for name, _ in events] == ["progress"]
+        assert runner.cancelled_chunks >= 15
+
+    async def test_empty_sample(self):
+        """표본이 없으면 바로 done을 보내는지 테스트"""
+        runner = DryRunner(workers=1, executor=ThreadPoolExecutor(max_workers=1))
+
+        events = await collect(runner, [])
+
+        assert events[0][0] == "done" and events[0][1]["evaluated"] == 0 and events[0][1]["passRate"] is None
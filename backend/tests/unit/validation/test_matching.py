@@ -0,0 +1,110 @@
+"""
+필드 매처 테스트
+
+벡터화 편집 거리/Jaro-Winkler 커널, 한국어 이름/날짜/숫자 정규화, 후보 가지치기,
+유사도 규칙의 후보 구간 대조 검증
+"""
+
+import random
+
+import pytest
+
+from app.domains.validation.compiler import STATUS_FAILED, STATUS_VALIDATED, RuleSpec, compile_rules
+from app.domains.validation.matching import (
+    KIND_DATE,
+    KIND_NAME,
+    KIND_NUMBER,
+    KIND_TEXT,
+    FieldMatcher,
+    canonical_number,
+    jaro_winkler_batch,
+    levenshtein_batch,
+    normalize_date,
+    normalize_name,
+    similarity_upper_bound,
+)
+from app.domains.validation.models import FieldType, ValidationType
+
+
+def reference_levenshtein(a: str, b: str) -> int:
+    """비교 기준 편집 거리 (완전 DP)."""
+    table = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            table[i][j] = min(table[i - 1][j] + 1, table[i][j - 1] + 1, table[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+    return table[-1][-1]
+
+
+def random_strings(rng: random.Random, count: int, longest: int) -> list:
+    """작은 알파벳의 무작위 문자열 목록을 만듭니다 (일치/전치가 자주 생기도록)."""
+    return ["".join(rng.choice("ab가나다") for _ in range(rng.randint(0, longest))) for _ in range(count)]
+
+
+class TestFieldMatcher:
+    """필드 매처 테스트 클래스"""
+
+    def test_levenshtein_kernel_matches_reference(self):
+        """비트 병렬 편집 거리가 DP 결과와 같은지 테스트 (64자 초과 쌍 포함)"""
+        rng = random.Random(0)
+        left, right = random_strings(rng, 300, 90), random_strings(rng, 300, 90)
+
+        distances = levenshtein_batch(left, right)
+
+        assert distances.tolist() == [reference_levenshtein(a, b) for a, b in zip(left, right)]
+        assert levenshtein_batch(["kitten", "", "abc"], ["sitting", "abc", ""]).tolist() == [3, 3, 3]
+
+    def test_jaro_winkler_kernel(self):
+        """Jaro-Winkler 고전 예시 값과 상한 가지치기가 성립하는지 테스트"""
+        scores = jaro_winkler_batch(["martha", "dwayne", "dixon", "", "abc"], ["marhta", "duane", "dicksonx", "", "xyz"])
+
+        assert scores.round(4).tolist() == [0.9611, 0.84, 0.8133, 1.0, 0.0]
+        rng = random.Random(1)
+        left, right = random_strings(rng, 500, 12), random_strings(rng, 500, 12)
+        assert (similarity_upper_bound(left, right, KIND_NAME) >= jaro_winkler_batch(left, right) - 1e-9).all()
+
+    def test_korean_normalizers(self):
+        """이름/날짜/숫자 정규화 테스트"""
+        assert normalize_name("홍 길동 님") == "홍길동"
+        assert normalize_name("㈜ 한빛") == normalize_name("주식회사 한빛") == "한빛"
+        assert normalize_date("24.1.5") == normalize_date("2024년 1월 5일 (금)") == "2024-01-05"
+        assert normalize_date("2024.02.30") is None
+        assert canonical_number("1억 2천만원") == canonical_number("120,000,000") == 120_000_000
+        assert canonical_number("금 오백만원정") == 5_000_000
+        assert canonical_number("12만 3,456") == 123_456
+        assert canonical_number("미정") != canonical_number("미정")  # NaN
+
+    def test_match_batch_picks_best_candidate(self):
+        """기대값마다 가장 잘 맞는 후보를 찾고 먼 후보는 커널 전에 걸러내는지 테스트"""
+        matcher = FieldMatcher()
+        noise = ["계약서", "주식회사 갑", "제1조 목적", "서울특별시 강남구"]
+
+        names = matcher.match_batch(KIND_NAME, ["김서윤", None, "박도윤"], [noise + ["김셔윤"], ["x"], []])
+        assert names[0].value == "김셔윤" and names[0].index == 4 and names[0].score >= 0.8
+        assert names[1] is None
+        assert names[2].value is None and names[2].score == 0.0
+        assert matcher.pairs_pruned >= len(noise)
+
+        dates = matcher.match_batch(KIND_DATE, ["2024.01.05"], [["2024-01-06", "24. 1. 5"]])
+        amounts = matcher.match_batch(KIND_NUMBER, ["1억 2천만원"], [["12,000,000", "120,000,000원"]])
+        texts = matcher.match_batch(KIND_TEXT, ["CTR-2024-001"], [["ctr 2024 00l"]], threshold=0.9)
+        assert (dates[0].index, amounts[0].index) == (1, 1)
+        assert texts[0].score == 0.9
+        with pytest.raises(ValueError):
+            matcher.match_batch("address", ["a"], [["a"]])
+
+    def test_similarity_rule_uses_candidate_spans(self):
+        """유사도 규칙이 추출 값뿐 아니라 후보 구간에서도 기대값을 찾는지 테스트"""
+        plan = compile_rules([
+            RuleSpec("name", "name", FieldType.TEXT, ValidationType.SIMILARITY, field_name="name"),
+            RuleSpec("amount", "amount", FieldType.NUMBER, ValidationType.SIMILARITY, field_name="amount"),
+        ])
+        rows = [
+            {"name": {"value": "계약서", "candidates": ["홍길동 님"]}, "amount": "금 일백만원정"},
+            {"name": "홍길둥", "amount": "1,000,000"},
+            {"name": {"value": "계약서", "candidates": ["갑"]}, "amount": "1,000,000"},
+        ]
+        expected = [{"name": "홍길동", "amount": "100만원"}] * 3
+
+        outcomes = plan.evaluate(rows, expected, short_circuit=False)
+
+        assert [o.status for o in outcomes] == [STATUS_VALIDATED, STATUS_VALIDATED, STATUS_FAILED]